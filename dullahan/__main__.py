@@ -1,2 +1,3 @@
+import sys
 from . import exec
-exec() 
+sys.exit(exec())
@@ -0,0 +1,617 @@
+from __future__ import annotations
+import argparse
+import collections
+import os
+import pathlib
+import queue
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+import typing
+import logging
+
+from . import IMPORTED_AT
+from . import basic_player
+from . import mpder as mpd
+from PySide2 import QtCore
+
+if typing.TYPE_CHECKING:
+    import sqlite3
+
+#mpris_server, sqlite3, hashlib, the tray (QtGui/QtWidgets), the search dialog and the icon resources are only imported once something needs them
+
+#TODO: add config file support for stuff
+#TODO: if paused when switching songs, stay paused
+
+SQL_GENERATE_BASE = """
+CREATE TABLE IF NOT EXISTS medialibrary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title STRING,
+    artist STRING,
+    album STRING,
+    plays INTEGER DEFAULT 0,
+    finishes INTEGER DEFAULT 0,
+    first_play INTEGER DEFAULT -1 NOT NULL,
+    last_play INTEGER DEFAULT -1 NOT NULL
+);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    hash STRING PRIMARY KEY NOT NULL,
+    base INTEGER NOT NULL
+);
+"""
+
+SQL_INDEX_MEDIA = """
+ALTER TABLE medialibrary ADD COLUMN tag_key STRING;
+UPDATE medialibrary SET tag_key = tag_key(title, artist, album);
+CREATE TEMP TABLE media_keep AS SELECT
+    tag_key,
+    min(id) AS id,
+    sum(plays) AS plays,
+    sum(finishes) AS finishes,
+    coalesce(min(nullif(first_play, -1)), -1) AS first_play,
+    max(last_play) AS last_play
+    FROM medialibrary GROUP BY tag_key;
+UPDATE file_hashes SET base = (
+    SELECT media_keep.id FROM medialibrary JOIN media_keep ON media_keep.tag_key = medialibrary.tag_key WHERE medialibrary.id = file_hashes.base
+) WHERE base IN (SELECT id FROM medialibrary);
+DELETE FROM medialibrary WHERE id NOT IN (SELECT id FROM media_keep);
+UPDATE medialibrary SET
+    plays = (SELECT plays FROM media_keep WHERE media_keep.id = medialibrary.id),
+    finishes = (SELECT finishes FROM media_keep WHERE media_keep.id = medialibrary.id),
+    first_play = (SELECT first_play FROM media_keep WHERE media_keep.id = medialibrary.id),
+    last_play = (SELECT last_play FROM media_keep WHERE media_keep.id = medialibrary.id);
+DROP TABLE media_keep;
+CREATE UNIQUE INDEX IF NOT EXISTS medialibrary_tag_key ON medialibrary(tag_key);
+CREATE INDEX IF NOT EXISTS file_hashes_base ON file_hashes(base);
+"""
+
+SQL_PLAY_EVENTS = """
+CREATE TABLE IF NOT EXISTS play_events (
+    id INTEGER PRIMARY KEY,
+    track INTEGER NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER NOT NULL,
+    elapsed INTEGER DEFAULT 0 NOT NULL,
+    skipped INTEGER DEFAULT 0 NOT NULL
+);
+CREATE INDEX IF NOT EXISTS play_events_start ON play_events(start_time);
+CREATE TABLE IF NOT EXISTS daily_plays (
+    day STRING NOT NULL,
+    track INTEGER NOT NULL,
+    plays INTEGER DEFAULT 0 NOT NULL,
+    finishes INTEGER DEFAULT 0 NOT NULL,
+    elapsed INTEGER DEFAULT 0 NOT NULL,
+    PRIMARY KEY (day, track)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats_state (
+    key STRING PRIMARY KEY NOT NULL,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats_state(key, value) VALUES ('compacted_event', 0);
+"""
+
+SQL_CONTENT_HASHES = """
+CREATE TABLE IF NOT EXISTS content_hashes (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    path STRING NOT NULL,
+    hash STRING NOT NULL,
+    PRIMARY KEY (device, inode)
+);
+CREATE INDEX IF NOT EXISTS content_hashes_path ON content_hashes(path);
+CREATE INDEX IF NOT EXISTS content_hashes_hash ON content_hashes(hash);
+"""
+
+SQL_LIBRARY = """
+CREATE TABLE IF NOT EXISTS library (
+    path STRING PRIMARY KEY NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    title STRING,
+    artist STRING,
+    album STRING,
+    genre STRING,
+    duration REAL DEFAULT 0 NOT NULL
+);
+"""
+
+#index + 1 is the schema version (PRAGMA user_version) the script migrates to
+SQL_MIGRATIONS = [
+    SQL_GENERATE_BASE,
+    SQL_INDEX_MEDIA,
+    SQL_PLAY_EVENTS,
+    SQL_CONTENT_HASHES,
+    SQL_LIBRARY,
+]
+
+SQL_FIND_HASH = "SELECT base FROM file_hashes WHERE hash = ?"
+SQL_BASE_CLAIMED = "SELECT 1 FROM file_hashes WHERE base = ? AND hash LIKE 'b2:%' LIMIT 1"
+SQL_FIND_MEDIA = "SELECT id FROM medialibrary WHERE tag_key = ?"
+SQL_INSERT_MEDIA = "INSERT OR IGNORE INTO medialibrary(title, artist, album, tag_key) VALUES (?, ?, ?, ?)"
+SQL_INSERT_HASH = "INSERT OR REPLACE INTO file_hashes(hash, base) VALUES (?, ?)"
+
+SQL_INSERT_EVENT = "INSERT INTO play_events(track, start_time, end_time, elapsed, skipped) VALUES (?, ?, ?, ?, ?)"
+SQL_GET_WATERMARK = "SELECT value FROM stats_state WHERE key = 'compacted_event'"
+SQL_SET_WATERMARK = "UPDATE stats_state SET value = ? WHERE key = 'compacted_event'"
+SQL_LAST_EVENT = "SELECT coalesce(max(id), 0) FROM play_events"
+
+SQL_COMPACT_COUNTERS = """
+INSERT INTO medialibrary(id, plays, finishes, first_play, last_play)
+    SELECT track, count(*), sum(NOT skipped), min(start_time), max(start_time)
+    FROM play_events WHERE id > ? AND id <= ? GROUP BY track
+ON CONFLICT(id) DO UPDATE SET
+    plays = plays + excluded.plays,
+    finishes = finishes + excluded.finishes,
+    first_play = CASE WHEN first_play = -1 THEN excluded.first_play ELSE first_play END,
+    last_play = MAX(last_play, excluded.last_play)
+"""
+
+SQL_COMPACT_DAILY = """
+INSERT INTO daily_plays(day, track, plays, finishes, elapsed)
+    SELECT date(start_time / 1000, 'unixepoch', 'localtime'), track, count(*), sum(NOT skipped), sum(elapsed)
+    FROM play_events WHERE id > ? AND id <= ? GROUP BY 1, 2
+ON CONFLICT(day, track) DO UPDATE SET
+    plays = plays + excluded.plays,
+    finishes = finishes + excluded.finishes,
+    elapsed = elapsed + excluded.elapsed
+"""
+
+SQL_PRUNE_EVENTS = "DELETE FROM play_events WHERE id <= ? AND start_time < ?"
+
+SQL_PLAY_STATS = """
+WITH stats AS (
+    SELECT medialibrary.id AS id,
+        medialibrary.plays + coalesce(recent.plays, 0) AS plays,
+        max(medialibrary.last_play, coalesce(recent.last_play, -1)) AS last_play
+    FROM medialibrary LEFT JOIN (
+        SELECT track, count(*) AS plays, max(start_time) AS last_play FROM play_events
+        WHERE id > (SELECT value FROM stats_state WHERE key = 'compacted_event') GROUP BY track
+    ) AS recent ON recent.track = medialibrary.id
+)
+SELECT content_hashes.path, stats.plays, stats.last_play FROM content_hashes
+    JOIN file_hashes ON file_hashes.hash = content_hashes.hash
+    JOIN stats ON stats.id = file_hashes.base
+UNION ALL
+SELECT file_hashes.hash, stats.plays, stats.last_play FROM file_hashes
+    JOIN stats ON stats.id = file_hashes.base
+    WHERE file_hashes.hash NOT LIKE 'b2:%'
+"""
+
+StatsEvent = collections.namedtuple('StatsEvent', ['path', 'hash', 'title', 'artist', 'album', 'start', 'end', 'elapsed', 'skipped'])
+
+def media_tag_key(title: typing.Optional[str], artist: typing.Optional[str], album: typing.Optional[str]) -> str:
+    return "\x1f".join((v or '').strip().casefold() for v in (title, artist, album))
+
+def migrate_db(db: sqlite3.Connection) -> None:
+    db.create_function('tag_key', 3, media_tag_key, deterministic=True)
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    for target, script in enumerate(SQL_MIGRATIONS[version:], version + 1):
+        db.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {target};\nCOMMIT;")
+
+def resolve_data(filename: str | os.PathLike) -> pathlib.Path:
+    if sys.platform == "linux":
+        cfg_dir = pathlib.Path("~/.local/share/dullahan").expanduser().resolve()
+        cfg_dir.mkdir(parents=True, exist_ok=True)
+        return pathlib.Path(cfg_dir, filename)
+    else:
+        raise NotImplementedError("OS data folder unknown")
+
+def resolve_config(filename: str | os.PathLike) -> pathlib.Path:
+    if sys.platform == "linux":
+        cfg_dir = pathlib.Path("~/.config/dullahan").expanduser().resolve()
+        cfg_dir.mkdir(parents=True, exist_ok=True)
+        return pathlib.Path(cfg_dir, filename)
+    else:
+        raise NotImplementedError("OS config folder unknown")
+
+class StatsWriter(QtCore.QObject):
+    '''
+    Write-behind writer for play statistics. Finished plays are appended to play_events in batches,
+    and a periodic compaction folds them into the medialibrary counters and daily_plays rollups
+    '''
+    FLUSH_INTERVAL = 2.0
+    FLUSH_EVENTS = 256
+    COMPACT_INTERVAL = 300.0
+    EVENT_RETENTION_DAYS = 90
+    
+    def __init__(self, db_path: str | os.PathLike) -> None:
+        super().__init__(None)
+        self.db_path = db_path
+        self.queue: queue.Queue[StatsEvent | str] = queue.Queue()
+    
+    def put(self, event: StatsEvent) -> None:
+        self.queue.put(event)
+    
+    def stop(self) -> None:
+        self.queue.put('QUIT')
+    
+    def run(self):
+        import sqlite3
+        from . import identity
+        db = sqlite3.connect(self.db_path)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        self.identity = identity.TrackIdentity(db)
+        pending: list[StatsEvent] = []
+        deadline = None
+        next_compact = time.monotonic() + self.COMPACT_INTERVAL
+        running = True
+        while running:
+            wake = next_compact if deadline is None else min(deadline, next_compact)
+            try:
+                item = self.queue.get(True, max(0.0, wake - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item == 'QUIT':
+                running = False
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.FLUSH_INTERVAL
+            if pending and (not running or len(pending) >= self.FLUSH_EVENTS or time.monotonic() >= deadline):
+                self.flush(db, pending)
+                pending = []
+                deadline = None
+            if not running or time.monotonic() >= next_compact:
+                self.compact(db)
+                next_compact = time.monotonic() + self.COMPACT_INTERVAL
+        db.close()
+    
+    def flush(self, db: sqlite3.Connection, events: list[StatsEvent]) -> None:
+        with db:
+            db.executemany(SQL_INSERT_EVENT, [
+                (self.get_media_id(db, e), e.start, e.end, e.elapsed, int(e.skipped)) for e in events
+            ])
+    
+    def compact(self, db: sqlite3.Connection) -> None:
+        #everything past the watermark is folded into the counters/rollups, but raw events are kept for the retention period
+        with db:
+            watermark = db.execute(SQL_GET_WATERMARK).fetchone()[0]
+            last_event = db.execute(SQL_LAST_EVENT).fetchone()[0]
+            if last_event > watermark:
+                db.execute(SQL_COMPACT_COUNTERS, (watermark, last_event))
+                db.execute(SQL_COMPACT_DAILY, (watermark, last_event))
+                db.execute(SQL_SET_WATERMARK, (last_event,))
+            cutoff = int((time.time() - self.EVENT_RETENTION_DAYS * 86400) * 1000)
+            db.execute(SQL_PRUNE_EVENTS, (last_event, cutoff))
+    
+    def get_media_id(self, db: sqlite3.Connection, event: StatsEvent) -> int:
+        #tracks are identified by their audio content; the old md5-of-filename key is only
+        #adopted for a track if no other content hash has claimed that library entry yet
+        #every lookup is an index hit and the sql strings are constants, so sqlite3's statement cache reuses them
+        try:
+            content_hash = self.identity.identify(event.path)
+        except OSError:
+            content_hash = None
+        if content_hash:
+            media_id = db.execute(SQL_FIND_HASH, (content_hash,)).fetchone()
+            if media_id:
+                return media_id[0]
+        media_id = db.execute(SQL_FIND_HASH, (event.hash,)).fetchone()
+        if media_id and not (content_hash and db.execute(SQL_BASE_CLAIMED, (media_id[0],)).fetchone()):
+            media_id = media_id[0]
+        else:
+            tag_key = media_tag_key(event.title, event.artist, event.album)
+            cur = db.execute(SQL_INSERT_MEDIA, (event.title, event.artist, event.album, tag_key))
+            media_id = cur.lastrowid if cur.rowcount else db.execute(SQL_FIND_MEDIA, (tag_key,)).fetchone()[0]
+        db.execute(SQL_INSERT_HASH, (content_hash or event.hash, media_id))
+        return media_id
+
+class Meta(QtCore.QObject):
+    SKIP_GRACE_MS = 10000 #plays that end further than this from the track length count as skips
+    
+    def __init__(self, config, player: basic_player.BasicPlayer) -> None:
+        super().__init__(None)
+        self.config = config
+        self.player = player
+        import sqlite3
+        self.db = sqlite3.connect(resolve_data("data.db"))
+        migrate_db(self.db)
+        self.cursor = self.db.cursor()
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        
+        #stats are written from their own thread so track changes never wait on an fsync
+        self.writer_thread = QtCore.QThread()
+        self.writer = StatsWriter(resolve_data("data.db"))
+        self.writer.moveToThread(self.writer_thread)
+        self.writer_thread.started.connect(self.writer.run)
+        self.writer_thread.start()
+        
+        #the play currently in progress, written out as one event once it ends
+        self.current_play: typing.Optional[dict[str, typing.Any]] = None
+        self.exited = False
+        
+        self.player.media_meta_ready.connect(lambda: self.add_media_play())
+        self.player.finished.connect(lambda: self.exit())
+        self.player.media_finished.connect(lambda: self.add_media_finish())
+        self.player.media_paused.connect(lambda: self.on_media_paused(True))
+        self.player.media_played.connect(lambda: self.on_media_paused(False))
+    
+    def exit(self) -> None:
+        if self.exited:
+            return #finished and the shutdown after a failed startup can both get here
+        self.exited = True
+        self.add_media_finish()
+        self.writer.stop()
+        self.writer_thread.quit()
+        self.writer_thread.wait()
+        self.db.commit()
+        self.cursor.close()
+        self.db.close()
+    
+    def on_media_paused(self, paused: bool):
+        if self.current_play is None:
+            return
+        now = int(time.time()*1000)
+        if paused and self.current_play['paused_at'] is None:
+            self.current_play['paused_at'] = now
+        elif not paused and self.current_play['paused_at'] is not None:
+            self.current_play['paused'] += now - self.current_play['paused_at']
+            self.current_play['paused_at'] = None
+    
+    def add_media_finish(self):
+        if self.current_play is None:
+            return
+        play = self.current_play
+        self.current_play = None
+        end = int(time.time()*1000)
+        if play['paused_at'] is not None:
+            play['paused'] += end - play['paused_at']
+        elapsed = max(0, end - play['start'] - play['paused'])
+        self.writer.put(StatsEvent(
+            play['path'], play['hash'], play['title'], play['artist'], play['album'],
+            play['start'], end, elapsed,
+            play['length'] > 0 and elapsed < play['length'] - self.SKIP_GRACE_MS,
+        ))
+    
+    def add_media_play(self):
+        self.add_media_finish()
+        uri = self.player.get_current_uri()
+        if not uri:
+            return
+        self.current_play = {
+            'path': uri.replace('file://', '', 1),
+            'hash': self.media_hash(pathlib.Path(uri)),
+            'title': self.player.get_current_title(),
+            'artist': self.player.get_current_artist(),
+            'album': self.player.get_current_album(),
+            'length': int(self.player.get_current_length()),
+            'start': int(time.time()*1000),
+            'paused': 0,
+            'paused_at': None,
+        }
+        
+    @staticmethod
+    def media_hash(file: str | os.PathLike) -> str:
+        import hashlib
+        return hashlib.md5(pathlib.Path(file).name.encode("utf8")).hexdigest()
+    
+    def media_keys(self, file: str) -> tuple[str, str]:
+        #keys get_play_stats may use for a queue entry: its indexed path, then the legacy filename hash
+        return str(self.player.get_file_path(file)), self.media_hash(file)
+    
+    def get_play_stats(self) -> dict[str, tuple[int, int]]:
+        #(plays, last_play) for every indexed path and legacy file hash, read in one go for the song table.
+        #events newer than the last compaction are added on top of the counters
+        return {h: (plays, last_play) for h, plays, last_play in self.cursor.execute(SQL_PLAY_STATS)}
+
+class StartupTimeline(object):
+    '''Monotonic timestamps of each startup stage, relative to when dullahan was imported'''
+    def __init__(self, origin: float) -> None:
+        self.origin = origin
+        self.marks: list[tuple[float, str, str]] = []
+        self.lock = threading.Lock()
+    
+    def mark(self, stage: str) -> None:
+        with self.lock:
+            self.marks.append((time.monotonic() - self.origin, threading.current_thread().name, stage))
+    
+    def dump(self, file=sys.stderr) -> None:
+        with self.lock:
+            for offset, thread, stage in sorted(self.marks):
+                print(f"{offset*1000:9.1f} ms  {thread:<16} {stage}", file=file)
+
+class Startup(QtCore.QObject):
+    '''Runs the independent startup stages (mpd, sqlite, dbus) on their own threads while the main thread builds the tray'''
+    #in --headless mode there is no tray, the main thread only sets up stats and the control socket
+    #the mpd and dbus stages run on the threads that own the player and mpris objects, so their signals come from the right thread
+    failed = QtCore.Signal(object)
+    
+    def __init__(self, config, player: basic_player.BasicPlayer, player_thread: QtCore.QThread, mpris, mpris_thread: QtCore.QThread, timeline: StartupTimeline) -> None:
+        super().__init__(None)
+        self.config = config
+        self.player = player
+        self.player_thread = player_thread
+        self.mpris = mpris
+        self.mpris_thread = mpris_thread
+        self.timeline = timeline
+        self.db_ready = threading.Event()
+        self.receivers_ready = threading.Event() #playback only starts once stats and the tray listen for it
+        self.pending = {'mpd', 'dbus'}
+        self.watcher = None
+        self.watcher_thread: typing.Optional[QtCore.QThread] = None
+        self.failed.connect(self.on_failed)
+    
+    def launch(self) -> None:
+        #direct connections, started is emitted from inside the new thread
+        self.player_thread.started.connect(self.run_mpd, QtCore.Qt.DirectConnection)
+        self.mpris_thread.started.connect(self.run_dbus, QtCore.Qt.DirectConnection)
+        self.player_thread.start()
+        self.mpris_thread.start()
+        threading.Thread(target=self.run_db, name="startup-db", daemon=True).start() #sqlite only, no qt objects involved
+    
+    def run_mpd(self) -> None:
+        threading.current_thread().name = "player"
+        try:
+            try:
+                self.player.prepare()
+                self.timeline.mark("mpd connected")
+                self.receivers_ready.wait()
+                self.player.start()
+                self.timeline.mark("first audio")
+                if self.config.watch:
+                    self.start_watcher()
+            except Exception as e:
+                self.failed.emit(e)
+                self.receivers_ready.wait() #the thread's event loop comes next, same as in run_dbus
+                return
+            finally:
+                self.finish('mpd')
+            self.player.event_loop()
+        finally:
+            self.player.thread_exited = True #quit() waits on this even if the loop never ran
+    
+    def run_db(self) -> None:
+        #migrations run here so Meta's own connection opens onto an up to date schema
+        import sqlite3
+        db = sqlite3.connect(resolve_data("data.db"))
+        try:
+            migrate_db(db)
+            db.execute("PRAGMA journal_mode=WAL")
+        finally:
+            db.close()
+            self.timeline.mark("database migrated")
+            self.db_ready.set()
+    
+    def run_dbus(self) -> None:
+        threading.current_thread().name = "mpris"
+        try:
+            self.mpris.initialize()
+            self.timeline.mark("mpris published")
+        except Exception as e:
+            self.failed.emit(e)
+        finally:
+            self.finish('dbus')
+        #once this returns the thread enters its event loop, which qt refuses to run before the application exists
+        self.receivers_ready.wait()
+    
+    def start_watcher(self) -> None:
+        from . import watcher
+        self.watcher_thread = QtCore.QThread()
+        self.watcher = watcher.LibraryWatcher(self.player.roots, resolve_data("data.db"))
+        self.watcher.moveToThread(self.watcher_thread)
+        self.watcher_thread.started.connect(self.watcher.run)
+        self.watcher.changed.connect(self.player.refresh_paths, QtCore.Qt.DirectConnection)
+        self.watcher_thread.start()
+    
+    def stop_watcher(self) -> None:
+        if self.watcher_thread is not None:
+            self.watcher.quit()
+            self.watcher_thread.quit()
+            self.watcher_thread.wait()
+    
+    def finish(self, stage: str) -> None:
+        with self.timeline.lock:
+            self.pending.discard(stage)
+            done = not self.pending
+        if done and self.config.startup_timeline:
+            self.timeline.dump()
+    
+    @QtCore.Slot(object)
+    def on_failed(self, error: Exception) -> None:
+        logging.critical("startup failed", exc_info=error)
+        QtCore.QCoreApplication.exit(1)
+
+def _except_hook(exc_type, exc_value, exc_traceback):
+    logging.critical(f"{exc_type} {exc_value} {exc_traceback}", exc_info=True)
+    sys.exit(1)
+
+def exec(conf: typing.Optional[argparse.Namespace] = None, listener: typing.Optional[socket.socket] = None):
+    pathlib.Path("~/.config/dullahan/").expanduser().mkdir(parents=True, exist_ok=True)
+    #logging.basicConfig(filename=str(pathlib.Path("~/.config/dullahan/error.log").expanduser()), filemode='a+')
+    #logging.getLogger().addHandler(logging.StreamHandler(sys.stderr))
+    
+    #sys.excepthook = _except_hook
+    #threading.excepthook = _except_hook
+    if len(sys.argv) > 1 and sys.argv[1] == "stats":
+        from . import stats
+        return stats.main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "index":
+        from . import identity
+        return identity.main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "scan":
+        from . import scanner
+        return scanner.main(sys.argv[2:])
+    if conf is None:
+        from . import build_parser
+        conf = build_parser().parse_args()
+    timeline = StartupTimeline(IMPORTED_AT)
+    timeline.mark("arguments parsed")
+    
+    #setup threads
+    player_thread = QtCore.QThread()
+    mpris_thread = QtCore.QThread() #dbus property updates (and the art they may extract) stay off the gui thread
+    #create class instances, nothing here talks to mpd, sqlite or dbus yet
+    player = mpd.MPDPlayer(conf)
+    from .mpris import Mpris
+    mpris = Mpris(player)
+    #move to threads
+    player.moveToThread(player_thread)
+    mpris.moveToThread(mpris_thread)
+    startup = Startup(conf, player, player_thread, mpris, mpris_thread, timeline)
+    startup.launch()
+    
+    if conf.headless:
+        app = QtCore.QCoreApplication(sys.argv)
+        app.setApplicationName("dullahan")
+    else:
+        from PySide2 import QtWidgets
+        from .tray import Tray
+        app = QtWidgets.QApplication(sys.argv)
+        app.setQuitOnLastWindowClosed(False)
+        app.setApplicationName("dullahan")
+        tray = Tray(conf, player)
+        timeline.mark("tray shown")
+    startup.db_ready.wait()
+    meta = Meta(conf, player)
+    if not conf.headless:
+        tray.meta = meta
+    timeline.mark("stats ready")
+    from . import control
+    server = control.ControlServer(player) #its state cache has to be listening before playback starts
+    startup.receivers_ready.set()
+    if listener is not None:
+        server.listen(listener)
+    
+    def exit_():
+        #finished may come from the control socket's command thread, so quitting is queued onto the main thread
+        QtCore.QMetaObject.invokeMethod(app, "quit", QtCore.Qt.QueuedConnection)
+    
+    player.finished.connect(exit_)
+    if conf.headless:
+        def quit_():
+            if player.running:
+                player.quit() #saves the session, then finished calls exit_
+            else:
+                exit_()
+        #handlers only go in once exit_ is hooked up, they defer to the event loop instead of running mid-startup
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: QtCore.QTimer.singleShot(0, quit_))
+        #qt's event loop doesn't return to python on its own, the timer lets the handlers run
+        signal_timer = QtCore.QTimer()
+        signal_timer.timeout.connect(lambda: None)
+        signal_timer.start(500)
+    #app.aboutToQuit.connect(exit_)
+    #start app
+    status = app.exec_()
+    #reached through exit_ and Startup.on_failed alike, every thread has to be wound down before qt is torn down
+    if player.running and not player.thread_exited:
+        player.quit() #something else failed, the player itself still saves its session
+    else:
+        player.disconnect_clients()
+    meta.exit()
+    startup.stop_watcher()
+    server.close()
+    for thread in (player_thread, mpris_thread):
+        thread.quit()
+        thread.wait()
+    return status
+
+
+if __name__ == "__main__":
+    exec()
\ No newline at end of file
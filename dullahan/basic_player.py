@@ -1,8 +1,11 @@
+from __future__ import annotations
 from abc import abstractmethod
 import argparse
 import collections
+import functools
 import os
 import pathlib
+import sys
 import typing
 
 import mutagen
@@ -10,7 +13,10 @@ import mutagen._file
 import mutagen.mp4
 import mutagen.mp3
 import mutagen.id3
-from PySide2 import QtCore, QtGui
+from PySide2 import QtCore
+
+if typing.TYPE_CHECKING:
+    from PySide2 import QtGui
 
 Capabilities = collections.namedtuple('Capabilities', ['loop', 'shuffle', 'crossfade'])
 
@@ -34,15 +40,25 @@ class FileMetadata(object):
         self.title = ''
         self.album = ''
         self.artist = ''
-        self.art = ''
         self.raw_art = b''
         self.art_filetype = ''
-        self.placeholder_art = QtGui.QImage(256, 256, QtGui.QImage.Format_Indexed8)
-        self.placeholder_art.fill(QtGui.qRgb(50,50,50))
         if autoparse:
             self.parse()
     
+    #images are only decoded when a gui asks for them, so a headless player never loads QtGui
+    @functools.cached_property
+    def placeholder_art(self) -> QtGui.QImage:
+        from PySide2 import QtGui
+        image = QtGui.QImage(256, 256, QtGui.QImage.Format_Indexed8)
+        image.fill(QtGui.qRgb(50,50,50))
+        return image
+    
+    @functools.cached_property
+    def art(self) -> QtGui.QImage:
+        return self._data_to_qimage(self.raw_art) if self.raw_art else self.placeholder_art
+    
     def _data_to_qimage(self, data: str | bytes) -> QtGui.QImage:
+        from PySide2 import QtGui
         return QtGui.QImage.fromData(QtCore.QByteArray.fromRawData(data))
     
     def parse(self):
@@ -52,7 +68,6 @@ class FileMetadata(object):
             self.album = tags['\xa9alb'][0] or self.file.parent
             self.artist = ", ".join(tags['\xa9ART']) or self.file.parent
             self.raw_art: bytes = tags['covr'][0] if 'covr' in tags else b''
-            self.art = self._data_to_qimage(tags['covr'][0]) if 'covr' in tags else self.placeholder_art
             self.art_filetype = MP4CONV[tags['covr'][0].imageformat]
             
         elif isinstance(self.base, mutagen.mp3.MP3):
@@ -61,12 +76,41 @@ class FileMetadata(object):
             self.album = tags['TALB'].text[0]
             self.artist = ", ".join(tags['TPE1'].text)
             self.raw_art: bytes = tags['APIC:'].data
-            self.art = self._data_to_qimage(self.raw_art)
             self.art_filetype = MP3CONV[tags['APIC:'].mime]
             
         else:
             raise RuntimeError(f"unknown file type {type(self.base).__name__}")
 
+class TrackRecord(object):
+    '''Compact per-track record for queue-wide metadata, with artist/album/genre strings interned'''
+    __slots__ = ('file', 'title', 'artist', 'album', 'genre', 'duration', 'plays', 'last_play')
+    
+    def __init__(self, file: str, title: str = '', artist: str = '', album: str = '', genre: str = '', duration: float = 0.0) -> None:
+        self.file = file
+        self.title = title
+        self.artist = sys.intern(artist)
+        self.album = sys.intern(album)
+        self.genre = sys.intern(genre)
+        self.duration = duration
+        self.plays = 0
+        self.last_play = -1
+    
+    @staticmethod
+    def _tag(tags: dict, key: str) -> str:
+        v = tags.get(key, '')
+        return ", ".join(v) if isinstance(v, list) else str(v)
+    
+    @classmethod
+    def from_tags(cls, tags: dict[str, typing.Any]) -> 'TrackRecord':
+        return cls(
+            cls._tag(tags, 'file'),
+            cls._tag(tags, 'title'),
+            cls._tag(tags, 'artist'),
+            cls._tag(tags, 'album'),
+            cls._tag(tags, 'genre'),
+            float(tags.get('duration', 0) or 0),
+        )
+
 class BasicPlayer(QtCore.QObject):
     #signals
     media_changed = QtCore.Signal()
@@ -82,6 +126,7 @@ class BasicPlayer(QtCore.QObject):
     media_meta_ready = QtCore.Signal()
     media_finished = QtCore.Signal()
     queue_loaded = QtCore.Signal()
+    files_changed = QtCore.Signal(object) #{queue file: fresh TrackRecord, or None if it's gone}
     
     media_quitafter_enabled = QtCore.Signal()
     media_quitafter_disabled = QtCore.Signal()
@@ -95,12 +140,16 @@ class BasicPlayer(QtCore.QObject):
         self.config = config
     # setup
     @QtCore.Slot()
+    def prepare(self) -> None: pass #blocking backend connection, may run off the main thread
+    @QtCore.Slot()
     def start(self) -> None: pass
     @QtCore.Slot()
     def event_loop(self) -> None: pass
+    @QtCore.Slot(object, object)
+    def refresh_paths(self, dirs: list[str], files: dict[str, typing.Optional[TrackRecord]]) -> None: pass #local directories/files changed on disk, with their tags if the library has them
     # info
     @abstractmethod
-    def get_all_metadata(self) -> list[FileMetadata]: pass
+    def get_all_metadata(self) -> typing.Iterable[TrackRecord]: pass
     @abstractmethod
     def get_capabilities(self) -> Capabilities: pass
     @abstractmethod
@@ -108,6 +157,10 @@ class BasicPlayer(QtCore.QObject):
     @abstractmethod
     def get_file_metadata(self, path: str | os.PathLike) -> FileMetadata: pass
     @abstractmethod
+    def get_file_art(self, file: str) -> tuple[bytes, str]: pass #raw picture data and its filetype, empty if the file has none
+    @abstractmethod
+    def get_file_path(self, file: str) -> pathlib.Path: pass #local path of a queue entry
+    @abstractmethod
     def get_queue(self) -> list[pathlib.Path]: pass
     @abstractmethod
     @QtCore.Slot(None, result=bool)
@@ -145,6 +198,15 @@ class BasicPlayer(QtCore.QObject):
     def get_paused(self) -> bool: pass
     # set/control
     @abstractmethod
+    @QtCore.Slot(str)
+    def load_source(self, path: str) -> None: pass #replace the queue with a new file or directory
+    @abstractmethod
+    @QtCore.Slot(str)
+    def enqueue(self, path: str) -> None: pass #queue a file or directory to play next
+    @abstractmethod
+    @QtCore.Slot(str)
+    def play_file(self, path: str) -> None: pass
+    @abstractmethod
     @QtCore.Slot(int)
     def set_current_by_index(self, index: int) -> None: pass
     @abstractmethod
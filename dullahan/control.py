@@ -0,0 +1,215 @@
+import logging
+import queue
+import socket
+import threading
+import time
+import typing
+from PySide2 import QtCore
+from . import basic_player
+from . import instance
+
+#control commands -> the BasicPlayer slot they call, with the request's args passed straight through
+COMMANDS = {
+    'toggle': 'set_playing',
+    'replace': 'load_source',
+    'enqueue': 'enqueue',
+    'play': 'play_file',
+    'next': 'next',
+    'previous': 'previous',
+    'seek': 'seek',
+    'set_playing': 'set_playing',
+    'set_stopped': 'set_stopped',
+    'set_shuffle': 'set_shuffle',
+    'set_loop': 'set_loop',
+    'set_crossfade': 'set_crossfade',
+    'set_current_by_file': 'set_current_by_file',
+    'set_current_by_index': 'set_current_by_index',
+    'queue_by_file': 'queue_by_file',
+    'queue_by_index': 'queue_by_index',
+    'quit_after_current': 'quit_after_current',
+    'quit': 'quit',
+}
+
+class StateCache(QtCore.QObject):
+    '''Player state kept up to date from the player's signals, so queries never have to reach the backend'''
+    def __init__(self, player: basic_player.BasicPlayer) -> None:
+        super().__init__(None)
+        self.player = player
+        self.lock = threading.Lock()
+        self.subscribers: list[queue.Queue] = []
+        self.anchor = time.monotonic() #when 'position' was last read from the player
+        self.state: dict[str, typing.Any] = {
+            'state': 'loading',
+            'title': '',
+            'artist': '',
+            'album': '',
+            'uri': '',
+            'length': 0,
+            'position': 0,
+            'shuffle': False,
+            'loop': False,
+            'crossfade': False,
+        }
+        player.media_changed.connect(self.on_track_changed)
+        player.media_meta_ready.connect(self.on_track_changed)
+        for signal in (player.media_played, player.media_paused, player.media_stopped):
+            signal.connect(self.on_playback_changed)
+        player.media_shuffled.connect(lambda: self.publish(shuffle=True))
+        player.media_unshuffled.connect(lambda: self.publish(shuffle=False))
+        player.media_looped.connect(lambda: self.publish(loop=True))
+        player.media_unlooped.connect(lambda: self.publish(loop=False))
+        player.media_crossfade.connect(lambda: self.publish(crossfade=True))
+        player.media_uncrossfade.connect(lambda: self.publish(crossfade=False))
+
+    @QtCore.Slot()
+    def on_track_changed(self) -> None:
+        self.publish(
+            title=self.player.get_current_title(),
+            artist=self.player.get_current_artist(),
+            album=self.player.get_current_album(),
+            uri=self.player.get_current_uri(),
+            length=int(self.player.get_current_length()),
+            position=int(self.player.get_current_position()),
+            state=self.player.get_current_state(),
+        )
+
+    @QtCore.Slot()
+    def on_playback_changed(self) -> None:
+        self.publish(state=self.player.get_current_state(), position=int(self.player.get_current_position()))
+
+    def publish(self, **changes: typing.Any) -> None:
+        with self.lock:
+            if 'position' in changes:
+                self.anchor = time.monotonic()
+            changed = {k: v for k, v in changes.items() if self.state.get(k) != v}
+            if not changed:
+                return
+            self.state = {**self.state, **changed} #replaced, never mutated, so readers can take it without the lock
+            for subscriber in self.subscribers:
+                subscriber.put(changed)
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        with self.lock:
+            state, anchor = self.state, self.anchor
+        if state['state'] == 'playing':
+            position = state['position'] + int((time.monotonic() - anchor) * 1000)
+            state = {**state, 'position': min(position, state['length']) if state['length'] else position}
+        return state
+
+    def subscribe(self) -> typing.Generator[dict[str, typing.Any], None, None]:
+        events: queue.Queue = queue.Queue()
+        with self.lock:
+            self.subscribers.append(events)
+        try:
+            yield {'event': 'state', 'state': self.snapshot()} #taken after subscribing, so no change slips in between
+            while True:
+                changed = events.get()
+                if changed is None:
+                    return
+                yield {'event': 'changed', 'changes': changed}
+        finally:
+            with self.lock:
+                self.subscribers.remove(events)
+
+    def close(self) -> None:
+        with self.lock:
+            for subscriber in self.subscribers:
+                subscriber.put(None)
+
+class CommandRunner(QtCore.QObject):
+    '''Runs control commands in order on its own thread, so a slow one (a replace rebuilding the queue) holds up neither the gui nor the client'''
+    received = QtCore.Signal(object)
+
+    def __init__(self, player: basic_player.BasicPlayer) -> None:
+        super().__init__(None)
+        self.player = player
+        self.thread = QtCore.QThread()
+        self.moveToThread(self.thread)
+        self.received.connect(self.run)
+        self.thread.start()
+
+    @QtCore.Slot(object)
+    def run(self, commands: list[tuple[str, list]]) -> None:
+        for name, args in commands:
+            try:
+                getattr(self.player, name)(*args)
+            except Exception:
+                logging.exception(f"control command {name} failed")
+
+    def quit(self) -> None:
+        self.thread.quit()
+        self.thread.wait()
+
+class ControlServer(QtCore.QObject):
+    '''Line-delimited json control api on the instance socket.
+
+    A line holds one request or a json array of them (answered with an array, commands run in one pass):
+    {"command": "next"}, {"command": "seek", "args": [30000]}, {"query": "state"}, {"query": "title"}, {"subscribe": true}
+    Commands are answered once they are accepted, they run afterwards in the order they arrived.
+    '''
+    def __init__(self, player: basic_player.BasicPlayer) -> None:
+        super().__init__(None)
+        self.player = player
+        self.cache = StateCache(player)
+        self.runner = CommandRunner(player)
+        self.listener: typing.Optional[socket.socket] = None
+
+    def listen(self, listener: socket.socket) -> None:
+        self.listener = listener
+        threading.Thread(target=instance.serve, args=(listener, self.handle), name="dullahan-control", daemon=True).start()
+
+    def close(self) -> None:
+        self.cache.close()
+        if self.listener is not None:
+            instance.release(self.listener)
+            self.listener = None
+        self.runner.quit()
+
+    def handle(self, request: typing.Any) -> typing.Any:
+        #runs on the connection's thread, commands are validated here and handed to the runner
+        if isinstance(request, list):
+            commands = []
+            replies = []
+            for r in request:
+                if isinstance(r, dict) and 'command' in r:
+                    command, reply = self.parse_command(r)
+                    if command is not None:
+                        commands.append(command)
+                    replies.append(reply)
+                else:
+                    replies.append(self.answer(r, stream=False))
+            if commands:
+                self.runner.received.emit(commands)
+            return replies
+        if isinstance(request, dict) and 'command' in request:
+            command, reply = self.parse_command(request)
+            if command is not None:
+                self.runner.received.emit([command])
+            return reply
+        return self.answer(request)
+
+    def answer(self, request: typing.Any, stream: bool = True) -> dict[str, typing.Any]:
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': "requests are json objects"}
+        if request.get('subscribe'):
+            if not stream:
+                return {'ok': False, 'error': "subscribe can't be part of a batch"}
+            return {'ok': True, instance.STREAM: self.cache.subscribe()}
+        query = request.get('query')
+        state = self.cache.snapshot()
+        if query == 'state':
+            return {'ok': True, 'state': state}
+        if isinstance(query, str) and query in state:
+            return {'ok': True, query: state[query]}
+        return {'ok': False, 'error': f"unknown request {request!r}"}
+
+    def parse_command(self, request: dict[str, typing.Any]) -> tuple[typing.Optional[tuple[str, list]], dict[str, typing.Any]]:
+        '''(the player slot and its args, None if the request is bad), and the reply for it'''
+        command = request.get('command')
+        name = COMMANDS.get(command) if isinstance(command, str) else None
+        if name is None:
+            return None, {'ok': False, 'error': f"unknown command {command!r}"}
+        args = request.get('args', [request['path']] if 'path' in request else [])
+        if not isinstance(args, list):
+            return None, {'ok': False, 'error': "args must be a list"}
+        return (name, args), {'ok': True}
@@ -0,0 +1,144 @@
+import hashlib
+import mmap
+import os
+import pathlib
+import sqlite3
+import typing
+
+CHUNK_SIZE = 1 << 20
+HASH_PREFIX = 'b2:' #keeps content hashes apart from the old md5-of-filename keys in file_hashes
+
+SQL_FIND_CONTENT = "SELECT size, mtime, hash, path FROM content_hashes WHERE device = ? AND inode = ?"
+SQL_MOVE_CONTENT = "UPDATE content_hashes SET path = ? WHERE device = ? AND inode = ?"
+SQL_STORE_CONTENT = """
+INSERT INTO content_hashes(device, inode, size, mtime, path, hash) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(device, inode) DO UPDATE SET
+    size = excluded.size,
+    mtime = excluded.mtime,
+    path = excluded.path,
+    hash = excluded.hash
+"""
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+def audio_payload(data: bytes | mmap.mmap) -> tuple[int, int]:
+    '''Byte range of the audio payload, skipping ID3v2/FLAC metadata/MP4 atoms at the front and APE/ID3v1 tags at the end'''
+    start, end = 0, len(data)
+    if end >= 10 and data[:3] == b'ID3':
+        start = 10 + _syncsafe(data[6:10]) + (10 if data[5] & 0x10 else 0)
+    if data[start:start+4] == b'fLaC':
+        pos = start + 4
+        while pos + 4 <= end:
+            header = data[pos]
+            pos += 4 + int.from_bytes(data[pos+1:pos+4], 'big')
+            if header & 0x80: #last metadata block
+                break
+        start = pos
+    elif data[start+4:start+8] == b'ftyp':
+        #tags live in moov/udta, so only the media data atom identifies the track
+        pos = start
+        while pos + 8 <= end:
+            size, header = int.from_bytes(data[pos:pos+4], 'big'), 8
+            if size == 1:
+                size, header = int.from_bytes(data[pos+8:pos+16], 'big'), 16
+            elif size == 0:
+                size = end - pos
+            if data[pos+4:pos+8] == b'mdat':
+                return pos + header, min(pos + size, end)
+            if size < header:
+                break
+            pos += size
+    if end - start >= 128 and data[end-128:end-125] == b'TAG':
+        end -= 128
+    if end - start >= 32 and data[end-32:end-24] == b'APETAGEX':
+        tag_size = int.from_bytes(data[end-20:end-16], 'little')
+        flags = int.from_bytes(data[end-12:end-8], 'little')
+        end -= tag_size + (32 if flags & 0x80000000 else 0)
+    return min(start, end), max(start, end)
+
+def audio_hash(path: str | os.PathLike) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return HASH_PREFIX + h.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = audio_payload(mm)
+            with memoryview(mm) as view:
+                for offset in range(start, end, CHUNK_SIZE):
+                    h.update(view[offset:min(offset + CHUNK_SIZE, end)])
+    return HASH_PREFIX + h.hexdigest()
+
+class TrackIdentity(object):
+    '''Content-based track ids, cached per (device, inode) and only recomputed when size or mtime change'''
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self.db = db
+
+    def lookup(self, path: str | os.PathLike, st: typing.Optional[os.stat_result] = None) -> typing.Optional[str]:
+        st = st or os.stat(path)
+        row = self.db.execute(SQL_FIND_CONTENT, (st.st_dev, st.st_ino)).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            if row[3] != str(path):
+                #renamed or moved, play stats are joined on the path so it has to follow the file
+                self.db.execute(SQL_MOVE_CONTENT, (str(path), st.st_dev, st.st_ino))
+            return row[2]
+        return None
+
+    def identify(self, path: str | os.PathLike) -> str:
+        st = os.stat(path)
+        cached = self.lookup(path, st)
+        if cached:
+            return cached
+        content_hash = audio_hash(path)
+        self.db.execute(SQL_STORE_CONTENT, (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, str(path), content_hash))
+        return content_hash
+
+    def index(self, paths: typing.Iterable[str | os.PathLike], workers: typing.Optional[int] = None) -> dict[str, str]:
+        '''Identify many files at once, hashing the uncached ones across a process pool'''
+        found: dict[str, str] = {}
+        todo: list[tuple[str, os.stat_result]] = []
+        for path in paths:
+            path = str(path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            cached = self.lookup(path, st)
+            if cached:
+                found[path] = cached
+            else:
+                todo.append((path, st))
+        rows = []
+        if todo:
+            import concurrent.futures
+            workers = workers or os.cpu_count() or 1
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                hashes = pool.map(audio_hash, [p for p, _ in todo], chunksize=max(1, len(todo) // (workers * 8)))
+                for (path, st), content_hash in zip(todo, hashes):
+                    found[path] = content_hash
+                    rows.append((st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, path, content_hash))
+        with self.db: #also commits the path updates of renamed files
+            self.db.executemany(SQL_STORE_CONTENT, rows)
+        return found
+
+def main(argv: typing.Optional[list[str]] = None) -> None:
+    import argparse
+    from . import resolve_data, migrate_db, scanner
+    parser = argparse.ArgumentParser("dullahan index")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("paths", nargs='+')
+    conf = parser.parse_args(argv)
+
+    files = []
+    for p in (pathlib.Path(p).resolve() for p in conf.paths):
+        if p.is_dir():
+            files.extend(f for f, _, _ in scanner.walk(p))
+        else:
+            files.append(p)
+    db = sqlite3.connect(resolve_data("data.db"))
+    migrate_db(db)
+    try:
+        found = TrackIdentity(db).index(files, conf.jobs)
+    finally:
+        db.close()
+    print(f"Indexed {len(found)} files")
@@ -0,0 +1,116 @@
+import contextlib
+import errno
+import json
+import os
+import socket
+import stat
+import threading
+import typing
+
+#kept free of qt so a second `dullahan` invocation can hand its request over and exit straight away
+
+STREAM = '_stream' #reply key holding an iterator of further events to write to the connection
+
+def socket_path() -> str:
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime:
+        #anyone can create this name in /tmp first, so only use it if it is really ours and private
+        runtime = os.path.join('/tmp', f"dullahan-{os.getuid()}")
+        try:
+            os.mkdir(runtime, 0o700)
+        except FileExistsError:
+            pass
+        st = os.lstat(runtime)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(f"{runtime} is not a private directory owned by this user, refusing to put the instance socket there")
+    return os.path.join(runtime, "dullahan.sock")
+
+def request_from_args(conf) -> typing.Optional[dict[str, str]]:
+    '''The request a running instance should carry out for these command line arguments, if any'''
+    if conf.toggle:
+        return {'command': 'toggle'}
+    if conf.play:
+        return {'command': 'play', 'path': os.path.abspath(conf.play)}
+    if conf.enqueue:
+        return {'command': 'enqueue', 'path': os.path.abspath(conf.enqueue)}
+    if conf.file:
+        return {'command': 'replace', 'path': os.path.abspath(conf.file)}
+    return None
+
+def forward(request: dict[str, typing.Any], path: typing.Optional[str] = None, timeout: float = 5.0) -> typing.Optional[dict[str, typing.Any]]:
+    '''Send one request to the running instance and return its reply, None if nothing is listening'''
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            s.connect(path or socket_path())
+            s.sendall(json.dumps(request).encode('utf8') + b'\n')
+            with s.makefile('rb') as f:
+                reply = f.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    except TimeoutError:
+        return {'ok': False, 'error': "timed out waiting for a reply"}
+    except OSError as e:
+        return {'ok': False, 'error': str(e)}
+    return json.loads(reply) if reply else {'ok': False, 'error': "no reply"}
+
+def claim(path: typing.Optional[str] = None) -> typing.Optional[socket.socket]:
+    '''Bind the instance socket, or None if another instance is already listening on it'''
+    path = path or socket_path()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+    except OSError as e:
+        if e.errno != errno.EADDRINUSE:
+            listener.close()
+            raise
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+                listener.close()
+                return None
+            except ConnectionRefusedError:
+                pass #left behind by an instance that didn't exit cleanly
+        os.unlink(path)
+        listener.bind(path)
+    listener.listen(8)
+    return listener
+
+def release(listener: socket.socket) -> None:
+    path = listener.getsockname()
+    listener.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def serve(listener: socket.socket, handle: typing.Callable[[typing.Any], typing.Any]) -> None:
+    '''Accept connections until the listener is closed, answering each json line with handle()'''
+    while True:
+        try:
+            conn, _ = listener.accept()
+        except OSError:
+            return
+        threading.Thread(target=_serve_connection, args=(conn, handle), name="dullahan-client", daemon=True).start()
+
+def _send(conn: socket.socket, message: typing.Any) -> None:
+    conn.sendall(json.dumps(message).encode('utf8') + b'\n')
+
+def _serve_connection(conn: socket.socket, handle: typing.Callable[[typing.Any], typing.Any]) -> None:
+    with conn, conn.makefile('rb') as lines:
+        for line in lines:
+            try:
+                reply = handle(json.loads(line))
+            except ValueError as e:
+                reply = {'ok': False, 'error': f"bad request: {e}"}
+            stream = reply.pop(STREAM, None) if isinstance(reply, dict) else None
+            try:
+                _send(conn, reply)
+                if stream is not None:
+                    #the connection belongs to the stream from here on
+                    with contextlib.closing(stream):
+                        for event in stream:
+                            _send(conn, event)
+                    return
+            except OSError:
+                return
@@ -1,14 +1,21 @@
 import argparse
+import json
 import os
 import pathlib
 import random
+import threading
 import time
 import typing
-from PySide2 import QtCore, QtGui
+from PySide2 import QtCore
 from . import basic_player
+from . import scanner
 import mpd
 import uuid
 import queue
+from mutagen._file import File
+from mutagen.flac import FLAC
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4
 
 class MPDMetadata(basic_player.FileMetadata):
     def __init__(self, mpdata: dict[str, typing.Any], art_data: typing.Optional[bytes] = None, art_filetype: typing.Optional[str] = None) -> None:
@@ -18,7 +25,6 @@ class MPDMetadata(basic_player.FileMetadata):
         self.album = mpdata['album']
         self.artist = mpdata['artist']
         self.raw_art = art_data if art_data else b''
-        self.art = self._data_to_qimage(self.raw_art) if self.raw_art else None
         self.art_filetype = self.findtype(self.raw_art[:20]) if self.raw_art and not art_filetype else (art_filetype if art_filetype else None)
     
     def findtype(self, first20: bytes):
@@ -45,12 +51,15 @@ class ThreadSafeMPD(QtCore.QObject):
         self.thread.started.connect(self.request_thread)
     
     def disconnect(self):
-        self.wrapper('disconnect')
+        if not self.thread.isRunning():
+            return #never connected, or already shut down
+        try:
+            self.wrapper('disconnect')
+        except Exception:
+            pass #nothing left to hang up, or no way to reach mpd at all
         self.queue.put('QUIT')
-        while not self.thread_has_quit:
-            pass
         self.thread.quit()
-        return
+        self.thread.wait()
     
     def connect(self, *ignored, **ignored_) -> None:
         self.thread.start()
@@ -69,32 +78,37 @@ class ThreadSafeMPD(QtCore.QObject):
             request_id: str = item['id']
             args: list[typing.Any] = item['args']
             kwargs: dict[typing.Any, typing.Any] = item['kwargs']
+            #every failure, reconnecting included, goes back to the caller instead of killing this thread
             try:
-                getattr(self.client, 'ping')() #override the dumb type error
-            except mpd.ConnectionError:
                 try:
-                    self.client.disconnect()
-                except BrokenPipeError:
+                    getattr(self.client, 'ping')() #override the dumb type error
+                except mpd.ConnectionError:
                     try:
                         self.client.disconnect()
+                    except BrokenPipeError:
+                        try:
+                            self.client.disconnect()
+                        except:
+                            pass
                     except:
                         pass
-                except:
-                    pass
-                self.client.connect(*self.location)
-            
-            try:
-                res = getattr(self.client, cmd)(*args, **kwargs)
+                    self.client.connect(*self.location)
+                handler = self.run_command_list if cmd == 'command_list' else getattr(self.client, cmd)
+                res = handler(*args, **kwargs)
             except mpd.ConnectionError as e:
-                if e.args[0] != "Already connected":
-                    raise e
-                else:
-                    res = None
+                res = None if e.args and e.args[0] == "Already connected" else e
             except Exception as e:
                 res = e
             self.responses[request_id] = res
         self.thread_has_quit = True
     
+    def run_command_list(self, commands: list[tuple]) -> list[typing.Any]:
+        #runs on the request thread, so the whole list goes out in one round trip
+        self.client.command_list_ok_begin()
+        for cmd, *args in commands:
+            getattr(self.client, cmd)(*args)
+        return self.client.command_list_end()
+    
     def wrapper(self, cmd, *args, **kwargs) -> typing.Any:
         req_id = str(uuid.uuid4())
         self.queue.put({
@@ -110,20 +124,28 @@ class ThreadSafeMPD(QtCore.QObject):
             raise res
         return res
     
-    def update(self) -> None: self.wrapper('update')
+    def update(self, uri: typing.Optional[str] = None) -> int: return self.wrapper('update', uri) if uri else self.wrapper('update')
+    def stats(self) -> dict[str, typing.Any]: return self.wrapper('stats')
     def clear(self) -> None: self.wrapper('clear')
     def consume(self, state: bool) -> None: self.wrapper('clear', int(state))
     def random(self, state: bool) -> None: self.wrapper('random', int(state))
     def repeat(self, state: bool) -> None: self.wrapper('repeat', int(state))
     def crossfade(self, duration: int) -> None: self.wrapper('crossfade', duration)
     def add(self, uri: str) -> None: self.wrapper('add', uri)
+    def addid(self, uri: str) -> int: return int(self.wrapper('addid', uri))
+    def command_list(self, commands: list[tuple]) -> list[typing.Any]: return self.wrapper('command_list', commands)
+    def lsinfo(self, uri: str = '') -> list[dict[str, typing.Any]]: return self.wrapper('lsinfo', uri)
+    def listall(self, uri: str = '') -> list[dict[str, str]]: return self.wrapper('listall', uri)
     def playid(self, songid: int) -> None: self.wrapper('playid', songid)
-    def playlistinfo(self) -> list[dict[str, typing.Any]]: return self.wrapper('playlistinfo')
+    def playlistid(self, songid: int) -> list[dict[str, typing.Any]]: return self.wrapper('playlistid', songid)
+    def playlistinfo(self, songrange: typing.Optional[str] = None) -> list[dict[str, typing.Any]]:
+        return self.wrapper('playlistinfo', songrange) if songrange else self.wrapper('playlistinfo')
     def currentsong(self) -> dict[str, typing.Any]: return self.wrapper('currentsong')
     def status(self) -> dict[str, typing.Any]: return self.wrapper('status')
     def play(self, pos: int) -> None: self.wrapper('play', pos)
     def find(self, tag: str, needle: str) -> list[dict[str, typing.Any]]: return self.wrapper('find', tag, needle) 
     def playlistfind(self, tag: str, needle: str) -> list[dict[str, typing.Any]]: return self.wrapper('playlistfind', tag, needle) 
+    def playlistsearch(self, *args: str) -> list[dict[str, typing.Any]]: return self.wrapper('playlistsearch', *args)
     def next(self) -> None: self.wrapper('next')
     def previous(self) -> None: self.wrapper('previous')
     def seekcur(self, pos: float | str) -> None: self.wrapper('seekcur', str(pos))
@@ -137,18 +159,21 @@ class ThreadSafeMPD(QtCore.QObject):
 
 
 class MPDPlayer(basic_player.BasicPlayer):
+    FILL_BATCH = 1000
+    
     def __init__(self, config: argparse.Namespace) -> None:
         super().__init__(config)
         self.capabilities = basic_player.Capabilities(loop=True, shuffle=True, crossfade=True)
         self.client = ThreadSafeMPD(config.host, config.port)
         self.event_client = ThreadSafeMPD(config.host, config.port)
+        self.watch_client: typing.Optional[ThreadSafeMPD] = None #the watcher's own connection, so its rescans don't hold up the command client
         self.client.client.timeout = 5
-        self.client.connect()
-        self.event_client.connect()
-        self.client.update()
-        self.roots = [pathlib.Path(m['storage']) for m in self.client.listmounts()]
+        self.roots: list[pathlib.Path] = []
 
         self.current_id = -1
+        self.current_song: dict[str, typing.Any] = {} #currentsong of the playing track, replaced whenever it changes so getters need no round trip
+        self.position_anchor = (0.0, time.monotonic(), False) #(elapsed, when it was read, playing), positions are extrapolated from it
+        self.queue_complete = False #only a fully built queue is worth snapshotting
 
         self.thread_stopped = self.thread_exited = self.running = False
         self.internal_state = 'stop'
@@ -161,6 +186,16 @@ class MPDPlayer(basic_player.BasicPlayer):
 
         self.request_quit.connect(self.quit)
 
+    @QtCore.Slot()
+    def prepare(self) -> None:
+        self.client.connect()
+        self.event_client.connect()
+        if getattr(self.config, 'watch', False):
+            self.watch_client = ThreadSafeMPD(self.config.host, self.config.port)
+            self.watch_client.connect()
+        self.roots = [pathlib.Path(m['storage']) for m in self.client.listmounts()]
+        self.update_source()
+
     def relative_to_root(self, file: pathlib.Path) -> pathlib.Path | None:
         for root in self.roots:
             try:
@@ -169,30 +204,215 @@ class MPDPlayer(basic_player.BasicPlayer):
                 continue
         return None
 
+    def update_source(self) -> None:
+        #only ask mpd to rescan the requested source, and only if something in it changed since mpd's last update
+        source = pathlib.Path(self.config.file).expanduser().absolute()
+        relative = self.relative_to_root(source)
+        if relative is None or not source.exists():
+            return #start() reports these properly
+        db_update = float(self.client.stats().get('db_update', 0))
+        if not scanner.modified_since(source, db_update):
+            return
+        self.client.update('' if relative == pathlib.Path('.') else str(relative))
+        while 'updating_db' in self.client.status():
+            self.client.idle('update')
+
+    @QtCore.Slot(object, object)
+    def refresh_paths(self, dirs: list[str], files: dict[str, typing.Optional[basic_player.TrackRecord]]) -> None:
+        #called straight from the watcher thread, the player thread's event loop is busy idling
+        client = self.watch_client or self.client
+        relative_dirs = [self.relative_to_root(pathlib.Path(d)) for d in dirs]
+        for relative in relative_dirs:
+            if relative is not None:
+                client.update('' if relative == pathlib.Path('.') else str(relative))
+        if any(r is not None for r in relative_dirs):
+            while 'updating_db' in client.status():
+                client.idle('update')
+
+        changed: dict[str, typing.Optional[basic_player.TrackRecord]] = {}
+        for file, record in files.items():
+            relative = self.relative_to_root(pathlib.Path(file))
+            if relative is None:
+                continue
+            for song in client.playlistfind('file', str(relative)):
+                for cached in pathlib.Path("/tmp/dullahan/").glob(f"{song['id']}.*"):
+                    cached.unlink(missing_ok=True)
+            if record is not None:
+                record.file = str(relative) #the watcher already read the tags into the library, no need to ask mpd
+            else:
+                found = client.find('file', str(relative))
+                record = basic_player.TrackRecord.from_tags(found[0]) if found else None
+            changed[str(relative)] = record
+        if changed:
+            self.files_changed.emit(changed)
+
     @QtCore.Slot()
     def start(self) -> None:
-        self.client.clear()
-
         source = pathlib.Path(self.config.file)
         if not source.exists():
             raise FileNotFoundError(f"Cannot load file {source}")
         elif not self.relative_to_root(source):
             raise ValueError(f"File {source} is not inside of a MPD music directory")
         
-        if source.is_dir() and source in self.roots:
-            self.client.add('') #not sure if this works for mounted roots
-        elif source.is_dir():
-            self.client.add(str(self.relative_to_root(source)))
+        if self.restore_session(source):
+            return
+        relative = '' if source in self.roots else str(self.relative_to_root(source)) #not sure if '' works for mounted roots
+        if source.is_dir() and self.reconcile_queue(relative):
+            return
+        self.client.clear()
+        if source.is_dir() and getattr(self.config, 'fast_start', False):
+            first = self.pick_first(relative)
+            if first is not None:
+                self.begin_playback(self.client.addid(first))
+                threading.Thread(target=self.fill_queue, args=(relative, first), daemon=True).start()
+                return
+        
+        if source.is_dir():
+            self.client.add(relative)
         else:
             self.client.add(str(source))
         
+        self.queue_complete = True
         self.queue_loaded.emit()
-        self.current_id = random.choice(self.client.playlistinfo())['id']
-        self.client.playid(self.current_id)
-        self.media_changed.emit()
-        self.media_played.emit()
+        self.begin_playback(random.choice(self.client.playlistinfo())['id'])
+    
+    def begin_playback(self, song_id: int, elapsed: float = 0.0, setup: typing.Sequence[tuple] = ()) -> None:
+        self.current_id = song_id
+        *_, song = self.client.command_list([*setup, ('seekid', song_id, elapsed) if elapsed else ('playid', song_id), ('currentsong',)])
+        self.position_anchor = (elapsed, time.monotonic(), True)
+        self.announce_playback(song)
+    
+    def announce_playback(self, song: dict[str, typing.Any]) -> None:
+        self.current_song = song
         self.current_state = 'play'
+        self.local_status = {**self.local_status, 'state': 'play'} #the idle loop won't report a state it thinks it already announced
         self.running = True
+        self.media_changed.emit()
+        self.media_meta_ready.emit() #the idle loop only announces the songs after this one, so the stats would never see the first
+        self.media_played.emit()
+    
+    def reconcile_queue(self, relative: str) -> bool:
+        #bring whatever is already queued in line with the source, when that takes fewer edits than clear + add
+        queue = self.client.playlistinfo()
+        if not queue:
+            return False
+        desired = [e['file'] for e in self.client.listall(relative) if 'file' in e]
+        wanted = set(desired)
+        kept: dict[str, int] = {}
+        deletes = []
+        for song in queue:
+            if song['file'] in wanted and song['file'] not in kept:
+                kept[song['file']] = int(song['id'])
+            else:
+                deletes.append(int(song['id']))
+        adds = [f for f in desired if f not in kept]
+        if not kept or len(deletes) + len(adds) > len(desired):
+            return False #more edits than tracks in the source, clear + add is cheaper
+        commands = [('deleteid', song_id) for song_id in deletes] + [('add', f) for f in adds]
+        for i in range(0, len(commands), self.FILL_BATCH):
+            self.client.command_list(commands[i:i+self.FILL_BATCH])
+        
+        self.queue_complete = True
+        self.queue_loaded.emit()
+        status, song = self.client.command_list([('status',), ('currentsong',)])
+        current = int(status['songid']) if 'songid' in status else None
+        if current in kept.values() and status['state'] == 'play':
+            self.current_id = current
+            self.anchor_position(status)
+            self.announce_playback(song) #already playing something from the source, leave it be
+        elif current in kept.values():
+            self.begin_playback(current, float(status.get('elapsed', 0)))
+        else:
+            self.begin_playback(random.choice(list(kept.values())))
+        return True
+    
+    def anchor_position(self, status: dict[str, typing.Any]) -> None:
+        self.position_anchor = (float(status.get('elapsed', 0)), time.monotonic(), status.get('state') == 'play')
+    
+    def pick_first(self, relative: str, attempts: int = 8) -> typing.Optional[str]:
+        #random walk down the directory listing, so picking the first track costs the same for any source size
+        for _ in range(attempts):
+            uri = relative
+            while True:
+                entries = [e for e in self.client.lsinfo(uri) if 'file' in e or 'directory' in e]
+                if not entries:
+                    break
+                entry = random.choice(entries)
+                if 'file' in entry:
+                    return entry['file']
+                uri = entry['directory']
+        return None
+    
+    def fill_queue(self, relative: str, playing: str) -> None:
+        #adds the rest of the source behind the already playing track, one command list per batch
+        files = [e['file'] for e in self.client.listall(relative) if 'file' in e and e['file'] != playing]
+        for i in range(0, len(files), self.FILL_BATCH):
+            self.client.command_list([('add', f) for f in files[i:i+self.FILL_BATCH]])
+        self.queue_complete = True
+        self.queue_loaded.emit()
+    
+    def session_path(self) -> pathlib.Path:
+        from . import resolve_data
+        return resolve_data("session.json")
+    
+    def save_session(self) -> None:
+        if not self.queue_complete:
+            return
+        status = self.client.status()
+        if 'songid' not in status:
+            return
+        session = {
+            'source': str(pathlib.Path(self.config.file).absolute()),
+            'version': int(status['playlist']), #mpd bumps this on any queue change, so it stands in for the id list
+            'length': int(status['playlistlength']),
+            'songid': int(status['songid']),
+            'file': self.client.currentsong().get('file'),
+            'elapsed': float(status.get('elapsed', 0)),
+            'random': int(status['random']),
+            'repeat': int(status['repeat']),
+            'xfade': int(status.get('xfade', 0)),
+            'prio': {str(song_id): prio for song_id, prio in self.queued_priorities().items()},
+        }
+        path = self.session_path()
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(session, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    
+    def queued_priorities(self) -> dict[int, int]:
+        #mpd resets a song's priority once it starts playing, so ask it instead of remembering what was bumped
+        try:
+            songs = self.client.playlistsearch('(prio >= 1)')
+        except mpd.CommandError:
+            songs = self.client.playlistinfo() #no filter expressions before mpd 0.21
+        return {int(song['id']): int(song['prio']) for song in songs if int(song.get('prio', 0))}
+    
+    def restore_session(self, source: pathlib.Path) -> bool:
+        #resume the queue we left behind if nothing touched it since, in a single command list
+        try:
+            session = json.loads(self.session_path().read_text())
+        except (OSError, ValueError):
+            return False
+        if session.get('source') != str(source.absolute()):
+            return False
+        status = self.client.status()
+        if int(status['playlist']) != session['version'] or int(status['playlistlength']) != session['length']:
+            return False
+        try:
+            current = self.client.playlistid(session['songid'])
+        except mpd.CommandError:
+            return False
+        if not current or current[0].get('file') != session['file']:
+            return False
+        
+        setup = [('random', session['random']), ('repeat', session['repeat']), ('crossfade', session['xfade'])]
+        setup += [('prioid', prio, int(song_id)) for song_id, prio in session['prio'].items()]
+        self.queue_complete = True
+        self.queue_loaded.emit()
+        self.begin_playback(session['songid'], session['elapsed'], setup)
+        return True
     
     @QtCore.Slot()
     def event_loop(self) -> None:
@@ -205,8 +425,9 @@ class MPDPlayer(basic_player.BasicPlayer):
                 continue
             for event in resp:
                 self.local_status = self.event_client.status()
+                self.anchor_position(self.local_status)
                 if event == 'player':
-                    cs = self.event_client.currentsong()
+                    cs = self.current_song = self.event_client.currentsong()
                     if self.current_id != int(cs['id']):
                         if self.quitafter_enabled:
                             self.request_quit.emit()
@@ -239,10 +460,9 @@ class MPDPlayer(basic_player.BasicPlayer):
     
     def get_capabilities(self) -> basic_player.Capabilities: return self.capabilities
     def get_current_metadata(self) -> MPDMetadata:
-        cs = self.client.currentsong()
-        return self.get_file_metadata(cs['file'])
+        return self.get_file_metadata(self.current_song)
     def get_current_metadata_raw(self) -> dict[str, any]:
-        return self.client.currentsong()
+        return self.current_song
     def get_file_metadata(self, input: str | os.PathLike | dict, noart=False) -> MPDMetadata:
         if isinstance(input, (str, os.PathLike)):
             cs = self.client.find('file', str(input))[0]
@@ -253,61 +473,83 @@ class MPDPlayer(basic_player.BasicPlayer):
             if pic_data:
                 return MPDMetadata(cs, open(pic_data, 'rb').read(), pic_data.split('.')[-1])
         return MPDMetadata(cs, None, None)
+    def get_file_path(self, file: str) -> pathlib.Path:
+        return pathlib.Path(self.roots[0], file)
     def get_queue(self) -> typing.Generator[pathlib.Path, None, None]:
         for f in self.get_all_metadata():
             try:
                 yield pathlib.Path(self.roots[0], f.file)
             except mpd.ConnectionError:
                 pass
-    def get_all_metadata(self) -> typing.Generator[MPDMetadata, None, None]:
-        for i, f in enumerate(self.client.playlistinfo()):
-            yield MPDMetadata(f, None, None)
+    def get_all_metadata(self, first_page: int = 250, max_page: int = 8000) -> typing.Generator[basic_player.TrackRecord, None, None]:
+        #fetch the queue in growing windows so the first rows arrive without waiting on the whole playlist
+        start, size = 0, first_page
+        while True:
+            try:
+                page = self.client.playlistinfo(f"{start}:{start+size}")
+            except mpd.CommandError:
+                break
+            for f in page:
+                yield basic_player.TrackRecord.from_tags(f)
+            if len(page) < size:
+                break
+            start += size
+            size = min(size * 2, max_page)
     @QtCore.Slot(None, result=bool)
     def get_shuffle(self) -> bool: return self.local_status['random'] == '1'
     @QtCore.Slot(None, result=float)
     def get_current_length(self) -> float:
-        return float(self.local_status.get('duration', 0))*1000
+        return float(self.current_song.get('duration', self.local_status.get('duration', 0)))*1000
     @QtCore.Slot(None, result=int)
     def get_playlist_size(self) -> int:
         return self.local_status.get('playlistlength', 0)
     @QtCore.Slot(None, result=float)
     def get_current_position(self) -> float:
-        return float(self.client.status()['elapsed'])*1000
+        elapsed, anchor, playing = self.position_anchor
+        if playing:
+            elapsed += time.monotonic() - anchor
+            length = self.get_current_length()/1000
+            if length:
+                elapsed = min(elapsed, length)
+        return elapsed*1000
     @QtCore.Slot(None, result=str)
     def get_current_uri(self, filename: typing.Optional[str] = None) -> str:
-        return "file://"+str(pathlib.Path(self.roots[0], filename if filename else self.client.currentsong()['file']))
+        file = filename or self.current_song.get('file')
+        if not file or not self.roots:
+            return '' #dbus can ask before mpd is even connected
+        return "file://"+str(pathlib.Path(self.roots[0], file))
+    def get_file_art(self, file: str) -> tuple[bytes, str]:
+        try:
+            dat = File(str(pathlib.Path(self.roots[0], file)))
+            if not dat:
+                raise NotImplementedError
+            if isinstance(dat, MP4):
+                pic_bin = bytes(dat.tags['covr'][0])
+                pic_tp = {13: 'jpg', 14: 'png'}[dat.tags['covr'][0].imageformat]
+            elif isinstance(dat, MP3):
+                pic_bin = dat.tags['APIC:'].data
+                pic_tp = dat.tags['APIC:'].mime.split('/')[-1]
+            elif isinstance(dat, FLAC):
+                pic_bin = dat.pictures[0].data
+                pic_tp = dat.pictures[0].mime.split('/')[-1]
+            else:
+                raise NotImplementedError
+        except NotImplementedError:
+            pic = self.client.readpicture(file)
+            pic_bin = pic.get('binary', b'')
+            pic_tp = pic.get('type', '')
+        return pic_bin, pic_tp.split('/')[-1]
     @QtCore.Slot(None, result=str)
     def get_current_art(self) -> str:
-        cs = self.client.currentsong()
+        cs = self.current_song
+        if 'id' not in cs:
+            return '' #nothing playing yet
         find_f = list(pathlib.Path(f"/tmp/dullahan/").glob(f"{cs['id']}.*"))
         if len(find_f) > 0 and find_f[0].exists():
             return str(find_f[0])
         else:
-            try:
-                from mutagen._file import File
-                from mutagen.mp4 import MP4
-                from mutagen.mp3 import MP3
-                from mutagen.flac import FLAC
-                
-                dat = File(str(pathlib.Path(self.roots[0], cs['file'])))
-                if not dat:
-                    raise NotImplementedError
-                if isinstance(dat, MP4):
-                    pic_bin = bytes(dat.tags['covr'][0])
-                    pic_tp = {13: 'jpg', 14: 'png'}[dat.tags['covr'][0].imageformat]
-                elif isinstance(dat, MP3):
-                    pic_bin = dat.tags['APIC:'].data
-                    pic_tp = dat.tags['APIC:'].mime.split('/')[-1]
-                elif isinstance(dat, FLAC):
-                    pic_bin = dat.pictures[0].data
-                    pic_tp = dat.pictures[0].mime.split('/')[-1]
-                else:
-                    raise NotImplementedError
-            except (ImportError, NotImplementedError):
-                pic = self.client.readpicture(cs['file'])
-                pic_bin = pic['binary']
-                pic_tp = pic['type']
-            meta = MPDMetadata(cs, pic_bin, pic_tp.split('/')[-1])
+            pic_bin, pic_tp = self.get_file_art(cs['file'])
+            meta = MPDMetadata(cs, pic_bin, pic_tp)
             #f = pathlib.Path("/tmp/dullahan-tmp-art")
             f = pathlib.Path(f"/tmp/dullahan/{cs['id']}.{meta.art_filetype}")
             f.parent.mkdir(parents=True, exist_ok=True, mode=0o755)
@@ -327,13 +569,13 @@ class MPDPlayer(basic_player.BasicPlayer):
         else: return 'error'
     @QtCore.Slot(None, result=str)
     def get_current_title(self) -> str:
-        return self.client.currentsong()['title']
+        return self.current_song.get('title', '')
     @QtCore.Slot(None, result=str)
     def get_current_artist(self) -> str:
-        return self.client.currentsong()['artist']
+        return self.current_song.get('artist', '')
     @QtCore.Slot(None, result=str)
     def get_current_album(self) -> str:
-        return self.client.currentsong()['album']
+        return self.current_song.get('album', '')
     @QtCore.Slot(None, result=bool)
     def get_paused(self) -> bool:
         return self.local_status['state'] == 'pause'
@@ -347,6 +589,38 @@ class MPDPlayer(basic_player.BasicPlayer):
             relfile = relfile.relative_to(self.roots[0])
         song_id = self.client.playlistfind('file', str(relfile))[0]['pos']
         self.client.play(song_id)
+    def source_uri(self, path: str | os.PathLike) -> str:
+        relative = self.relative_to_root(pathlib.Path(path).absolute())
+        if relative is None:
+            raise ValueError(f"File {path} is not inside of a MPD music directory")
+        return '' if relative == pathlib.Path('.') else str(relative)
+    @QtCore.Slot(str)
+    def load_source(self, path: str) -> None:
+        self.config.file = path
+        self.queue_complete = False
+        self.start() #reconciles against what's queued, so the overlap with the old source stays put
+    @QtCore.Slot(str)
+    def enqueue(self, path: str) -> None:
+        uri = self.source_uri(path)
+        if pathlib.Path(path).is_dir():
+            #same as a single file, every track in it gets queued (unless it already is) and bumped to play next
+            queued = {e['file']: int(e['id']) for e in self.client.playlistinfo()}
+            files = [e['file'] for e in self.client.listall(uri) if 'file' in e]
+            new = [f for f in files if f not in queued]
+            for i in range(0, len(new), self.FILL_BATCH):
+                batch = new[i:i+self.FILL_BATCH]
+                queued.update(zip(batch, map(int, self.client.command_list([('addid', f) for f in batch]))))
+            song_ids = [queued[f] for f in files]
+        else:
+            found = self.client.playlistfind('file', uri)
+            song_ids = [int(found[0]['id']) if found else self.client.addid(uri)]
+        for i in range(0, len(song_ids), self.FILL_BATCH):
+            self.client.command_list([('prioid', 1, song_id) for song_id in song_ids[i:i+self.FILL_BATCH]])
+    @QtCore.Slot(str)
+    def play_file(self, path: str) -> None:
+        uri = self.source_uri(path)
+        found = self.client.playlistfind('file', uri)
+        self.client.playid(int(found[0]['id']) if found else self.client.addid(uri))
     @QtCore.Slot(int)
     def queue_by_index(self, index: int) -> None:
         self.client.prio(1, index)
@@ -362,7 +636,9 @@ class MPDPlayer(basic_player.BasicPlayer):
     @QtCore.Slot()
     def previous(self) -> None: self.client.previous()
     @QtCore.Slot(int)
-    def seek(self, progress: int) -> None: self.client.seekcur(progress/1000)
+    def seek(self, progress: int) -> None:
+        self.client.seekcur(progress/1000)
+        self.position_anchor = (progress/1000, time.monotonic(), self.position_anchor[2]) #the idle loop re-anchors from status once mpd reports the seek
     @QtCore.Slot(bool)
     def set_shuffle(self, state: bool) -> None: self.client.random(state)
     @QtCore.Slot(bool)
@@ -388,14 +664,18 @@ class MPDPlayer(basic_player.BasicPlayer):
     @QtCore.Slot()
     def quit(self) -> None:
         self.thread_stopped = True
+        self.save_session()
         self.client.stop()
         self.event_client.stop()
-        self.client.clear()
-        self.client.disconnect()
-        self.event_client.disconnect()
-        while not self.thread_exited:
-            pass
+        self.disconnect_clients()
+        #the idle loop only exits if it is running, and never while quit() is called from inside it
+        while not self.thread_exited and self.thread().isRunning() and QtCore.QThread.currentThread() != self.thread():
+            time.sleep(0.01)
         self.finished.emit()
+    def disconnect_clients(self) -> None:
+        for client in (self.client, self.event_client, self.watch_client):
+            if client is not None:
+                client.disconnect()
     @QtCore.Slot()
     def quit_after_current(self) -> None:
         self.quitafter_enabled = True
@@ -0,0 +1,155 @@
+import typing
+from urllib.parse import quote
+
+import mpris_server
+import mpris_server.events
+from . import basic_player
+from PySide2 import QtCore
+
+class Mpris(QtCore.QObject):
+    class MprisAnnouncer(mpris_server.adapters.MprisAdapter):
+        def __init__(self, d_player: basic_player.BasicPlayer, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.d_player = d_player
+            self.track: typing.Optional[mpris_server.base.Track] = None
+            
+        def can_quit(self) -> bool: return True
+        def can_raise(self) -> bool: return False
+        def can_fullscreen(self) -> bool: return False
+        def has_tracklist(self) -> bool: return False
+        def get_uri_schemes(self) -> list[str]: return super().get_uri_schemes()
+        def get_mime_types(self) -> list[str]: return super().get_mime_types()
+        def quit(self): self.d_player.quit()
+        def get_desktop_entry(self) -> mpris_server.base.Paths: return super().get_desktop_entry() #TODO: me
+        def get_current_track(self) -> mpris_server.base.Track:
+            #built once per track, Metadata reads in between are served from memory
+            uri = self.d_player.get_current_uri()
+            if not uri:
+                return mpris_server.base.Track() #published before the first track plays, the defaults mean no track
+            if self.track is None:
+                self.track = mpris_server.base.Track(
+                    name = self.d_player.get_current_title(),
+                    artists=(mpris_server.base.Artist(name = self.d_player.get_current_artist()),),
+                    album=mpris_server.base.Album(
+                        name = self.d_player.get_current_album(),
+                        art_url=self.d_player.get_current_art()
+                    ),
+                    track_id = "/org/mpris/MediaPlayer2/CurrentTrack",
+                    uri = quote(uri, safe="/:"),
+                    length = self.d_player.get_current_length() * 1000,
+                )
+            return self.track
+        def get_current_position(self) -> int: return int(self.d_player.get_current_position() * 1000)
+        def next(self): return self.d_player.next()
+        def previous(self): return self.d_player.previous()
+        def pause(self): return self.d_player.set_playing(False)
+        def resume(self): return self.d_player.set_playing(True)
+        def stop(self): return self.d_player.set_stopped(True)
+        def play(self): return self.d_player.set_playing(True)
+        def get_playstate(self) -> mpris_server.base.PlayState:
+            state = self.d_player.get_current_state()
+            if state == "playing":
+                return mpris_server.base.PlayState.PLAYING
+            elif state == "paused":
+                return mpris_server.base.PlayState.PAUSED
+            else:
+                return mpris_server.base.PlayState.STOPPED
+        def seek(self, time: mpris_server.base.Microseconds, track_id: typing.Optional[mpris_server.base.DbusObj] = None): return self.d_player.seek(int(time/1000))
+        def open_uri(self, uri: str): return super().open_uri(uri) #TODO: this?
+        def is_repeating(self) -> bool: return True
+        def is_playlist(self) -> bool: return False
+        def set_repeating(self, val: bool): pass
+        def set_loop_status(self, val: str): pass
+        def get_rate(self) -> mpris_server.base.RateDecimal: return super().get_rate()
+        def set_rate(self, val: mpris_server.base.RateDecimal): pass
+        def set_minimum_rate(self, val: mpris_server.base.RateDecimal): pass
+        def set_maximum_rate(self, val: mpris_server.base.RateDecimal): pass
+        def get_minimum_rate(self) -> mpris_server.base.RateDecimal: return super().get_minimum_rate()
+        def get_maximum_rate(self) -> mpris_server.base.RateDecimal:return super().get_maximum_rate()
+        def get_shuffle(self) -> bool: return self.d_player.get_shuffle()
+        def set_shuffle(self, val: bool): return self.d_player.set_shuffle(val)
+        def get_art_url(self, track: int) -> str:
+            art = self.d_player.get_current_art()
+            return "file://"+art if art else ''
+        def get_volume(self) -> mpris_server.base.VolumeDecimal: return super().get_volume()
+        def set_volume(self, val: mpris_server.base.VolumeDecimal): pass
+        def is_mute(self) -> bool: return False
+        def set_mute(self, val: bool): pass
+        def can_go_next(self) -> bool: return True
+        def can_go_previous(self) -> bool: return True
+        def can_play(self) -> bool: return True
+        def can_pause(self) -> bool: return True
+        def can_seek(self) -> bool: return True
+        def can_control(self) -> bool: return True
+        def get_stream_title(self) -> str: return self.d_player.get_current_title()
+        def get_previous_track(self) -> mpris_server.base.Track: return super().get_previous_track() #TODO
+        def get_next_track(self) -> mpris_server.base.Track: return super().get_next_track() #TODO
+        #TODO: the playlist section
+        #TODO: tracks part
+
+    class MprisUpdater(mpris_server.events.EventAdapter):
+        def on_title(self):
+            return super().on_title()
+        def on_playpause(self):
+            return super().on_playpause()
+        def on_options(self):
+            return super().on_options()
+        def on_ended(self):
+            return super().on_ended()
+            
+    def __init__(self, player: basic_player.BasicPlayer):
+        super().__init__(None)
+        self.player = player
+        #property changes requested during one event loop pass go out together in a single PropertiesChanged
+        self.pending: set[str] = set()
+        self.published: dict[str, typing.Any] = {}
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(0)
+        self.flush_timer.timeout.connect(self.flush)
+    
+    def initialize(self):
+        self.adapter = self.MprisAnnouncer(self.player)
+        self.mpris = mpris_server.server.Server("dullahan", adapter=self.adapter)
+        self.updater = self.MprisUpdater(root=self.mpris.root, player=self.mpris.player)
+        
+        #bound slots rather than lambdas, so they are queued onto this object's own thread
+        self.player.media_changed.connect(self.on_track_changed)
+        self.player.media_meta_ready.connect(self.on_track_changed)
+        self.player.media_stopped.connect(self.on_track_changed)
+        self.player.media_paused.connect(self.on_playback_changed)
+        self.player.media_played.connect(self.on_playback_changed)
+        self.player.media_shuffled.connect(self.on_options_changed)
+        self.player.media_unshuffled.connect(self.on_options_changed)
+        
+        self.mpris.publish()
+    
+    @QtCore.Slot()
+    def on_track_changed(self):
+        self.adapter.track = None
+        self.schedule('Metadata', 'PlaybackStatus')
+    
+    @QtCore.Slot()
+    def on_playback_changed(self):
+        self.schedule('PlaybackStatus')
+    
+    @QtCore.Slot()
+    def on_options_changed(self):
+        self.schedule('Shuffle')
+    
+    def schedule(self, *properties: str):
+        self.pending.update(properties)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    @QtCore.Slot()
+    def flush(self):
+        pending, self.pending = self.pending, set()
+        changed = []
+        for name in sorted(pending):
+            value = getattr(self.mpris.player, name)
+            if name not in self.published or self.published[name] != value:
+                self.published[name] = value
+                changed.append(name)
+        if changed:
+            self.updater.emit_player_changes(changed)
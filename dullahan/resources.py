@@ -1,8200 +1,12 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.8)
-#
-# WARNING! All changes made in this file will be lost!
-
+import pathlib
 from PySide2 import QtCore
 
-qt_resource_data = b"\
-\x00\x00\x14\xd4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x14\x61\x49\x44\
-\x41\x54\x78\x9c\xed\x9d\x7b\x74\x14\x55\x9e\xc7\xbf\xb7\x5f\x90\
-\x0e\x49\x20\x08\x29\x22\xe1\x21\x60\x60\x10\x99\x98\x20\x11\x13\
-\x14\x61\x10\x5c\x81\x52\x14\x59\x47\x5e\xe3\x31\x35\xce\x99\x1d\
-\x58\xe7\xec\x20\xce\xb8\xe2\x7a\x66\x8c\x8e\x73\x56\x46\x77\x67\
-\x5a\xd7\x91\xd5\xd1\xe1\xc0\xb8\x14\x30\x67\xdc\x73\x58\x41\x06\
-\x02\x9a\x04\x24\x21\x20\x18\xd4\x34\x90\x50\x79\x75\x92\x4e\xbf\
-\xbb\xd3\xbf\xfd\x23\x8f\x09\x90\x47\x57\x77\x3d\x3a\xd0\x9f\x73\
-\xee\x81\x74\xd7\xbd\xbf\x5f\xdd\xfb\xed\x5f\xdd\x5b\x75\xef\x2d\
-\x56\xb4\x22\x03\xd7\x13\xbf\xf9\xe3\xf9\xb1\x1f\x7f\xfc\xf1\xdd\
-\x3e\x9f\x2f\xdf\x6a\xb5\xce\x48\x4b\x4b\x9b\x94\x96\x96\x36\xc6\
-\x62\xb1\x58\x8d\x46\xa3\x39\x25\x25\xc5\x62\xb1\x58\x58\x52\x52\
-\x12\x4b\x4e\x4e\x66\x00\xe0\x76\xbb\xc9\xeb\xf5\x52\x20\x10\xa0\
-\xf6\xf6\xf6\x40\x47\x47\x47\x30\x10\x08\x78\xda\xda\xda\x1a\xda\
-\xda\xda\xec\x5e\xaf\xf7\xcc\xb0\x61\xc3\x3e\x5f\xba\x74\xe9\x91\
-\x9f\x3e\x31\xb5\x51\xef\x73\x54\x12\x36\x94\x05\x60\x13\xa5\x71\
-\x95\x95\x95\x0f\x78\x3c\x9e\x15\xe9\xe9\xe9\xb9\x59\x59\x59\x19\
-\x49\x49\x49\xc6\x48\xf3\x13\x11\x00\x80\x31\x16\xb1\x4d\x8f\xc7\
-\xd3\x71\xe9\xd2\xa5\x7a\x87\xc3\x51\x9e\x94\x94\xb4\x67\xf6\xec\
-\xd9\x7f\x15\x78\x4e\x92\xef\x7d\x7c\x30\xa4\x04\x60\x13\xa5\xd1\
-\x2e\x97\x6b\x65\x43\x43\xc3\xea\xb4\xb4\xb4\xdc\xd1\xa3\x47\xa7\
-\xc6\x52\x5e\x34\x02\xe8\x8b\xa6\xa6\x26\xa7\xd3\xe9\x3c\xce\x71\
-\xdc\x87\x56\xab\x75\xb7\xc0\x73\xcd\x31\x15\xa8\x21\x71\x2f\x00\
-\x9b\x28\xdd\xe4\xf1\x78\x96\x37\x37\x37\xff\x30\x33\x33\x33\xd7\
-\x68\x34\x1a\x94\x2a\x5b\x29\x01\xf4\x26\x1c\x0e\x93\xc3\xe1\xf8\
-\x32\x25\x25\xe5\x9d\x61\xc3\x86\xed\x10\x78\xae\x4e\xb1\xc2\x55\
-\x20\x2e\x05\x60\x13\xa5\xe1\x00\xbe\xef\x76\xbb\x7f\x64\xb5\x5a\
-\x73\x98\x92\x2d\xd4\x0b\x35\x04\x70\x55\xf9\xe4\x76\xbb\x4f\x8e\
-\x18\x31\xe2\x4d\x00\x1f\x0a\x3c\xe7\x53\xc5\x50\x0c\xc4\x95\x00\
-\x6c\xa2\x34\x0e\x80\x10\x0c\x06\x37\x99\xcd\xe6\x34\xb5\xed\xa9\
-\x2d\x80\xde\x04\x83\x41\xb7\xd9\x6c\x7e\x07\xc0\x6f\x04\x9e\xbb\
-\xa0\xba\xc1\x08\x89\x0b\x01\xd8\x44\x69\x1e\x80\x4d\x44\xf4\x30\
-\x63\x2c\xe2\x4e\x5c\xac\x68\x29\x80\x5e\x36\x3b\x18\x63\x1f\x01\
-\x78\x5d\xe0\xb9\x63\x9a\x19\xee\x07\x5d\x05\x60\x13\xa5\x59\x00\
-\x9e\x07\xf0\xa8\x1e\xf6\xf5\x10\xc0\x55\xfc\x1f\x80\x2d\x02\xcf\
-\x95\xeb\xe5\x80\x2e\x02\xb0\x89\x52\x16\x80\xd7\xd0\xd9\xf0\xba\
-\xd5\x7e\x1c\x08\x00\x00\x08\xc0\x0e\x00\x3f\x13\x78\xee\x92\xd6\
-\xc6\x35\x15\x80\x4d\x94\x2c\x00\x7e\x06\x60\x0b\x00\xab\x66\x86\
-\xfb\x21\x4e\x04\xd0\x8d\x1b\xc0\xaf\x00\xbc\x26\xf0\x5c\x40\x2b\
-\xa3\x8a\x0d\xa9\x06\xc3\x26\x4a\xdf\x05\xf0\x19\x80\x97\x10\x07\
-\x8d\x1f\x87\x24\x03\xf8\x25\x80\xe3\x36\x51\xba\x53\x2b\xa3\xaa\
-\x47\x00\x9b\x28\x99\x01\xfc\x1b\x80\x7f\x01\xa0\x59\x07\x2f\x12\
-\xe2\x2c\x02\xf4\x26\x04\xe0\x15\x00\x5b\x05\x9e\x0b\xa9\x69\x48\
-\xd5\x08\x60\x13\xa5\x09\x00\x0e\x02\x78\x16\x71\xd6\xf8\x71\x8e\
-\x09\xc0\xcf\x01\x94\xd8\x44\x69\x8a\x9a\x86\x54\x13\x80\x4d\x94\
-\x96\x00\xa8\x00\x70\xb7\x5a\x36\x6e\x00\xee\x04\x50\x66\x13\xa5\
-\xc5\x6a\x19\x50\x45\x00\x36\x51\x2a\x02\xb0\x0f\xc0\x48\x35\xca\
-\xbf\xc1\x18\x05\xe0\xaf\x36\x51\xda\xac\x46\xe1\x8a\xf6\x01\x6c\
-\xa2\x64\x04\xf0\x26\x80\x1f\x2a\x56\xa8\x8a\xc4\x71\x1f\xa0\x3f\
-\xde\x05\x50\xa4\x64\xbf\x40\xb1\x08\x60\x13\xa5\x61\xe8\x1c\xcf\
-\x0e\x89\xc6\x1f\xa2\x6c\x00\xf0\x67\x9b\x28\x25\x29\x55\xa0\x22\
-\x02\xb0\x89\x92\x15\xc0\x5f\x00\x3c\xa2\x44\x79\x09\x06\x64\x05\
-\x80\xff\xb5\x89\x52\xb2\x12\x85\xc5\x2c\x80\xae\xc6\xdf\x0b\x60\
-\x51\xec\xee\x24\x88\x90\xf9\xe8\xec\x17\xc4\x2c\x82\x98\x04\xd0\
-\x35\xc6\xff\x1f\x00\x0b\x63\x75\x24\x81\x6c\xe6\x03\xd8\x69\x13\
-\x25\x53\x2c\x85\x44\x2d\x00\x9b\x28\x31\x00\x6f\x01\xb8\x3f\x16\
-\x07\x12\xc4\xc4\x03\x00\xb6\x77\xb5\x45\x54\xc4\x12\x01\x5e\x02\
-\xb0\x3e\x86\xfc\x09\x94\xe1\xfb\x00\xb6\x46\x9b\x39\x2a\x01\xd8\
-\x44\xe9\x61\x00\xcf\x45\x6b\x34\x81\xe2\x3c\x6f\x13\xa5\x55\xd1\
-\x64\x94\x2d\x00\x9b\x28\xdd\x0e\xe0\x3d\xe8\xf8\x18\x37\xc1\x35\
-\x30\x00\xef\xd8\x44\x69\xa6\xdc\x8c\xb2\x04\xd0\xd5\xe3\xdf\x81\
-\xce\x27\x57\x09\xe2\x8b\x11\xe8\xec\x14\xca\x7a\xd2\x2a\x37\x02\
-\xbc\x0e\x60\x86\xcc\x3c\x09\xb4\xe3\x3b\xe8\x9c\x68\x13\x31\x11\
-\x0b\xc0\x26\x4a\x0f\x02\x78\x4a\xae\x47\x09\x34\xe7\x69\x9b\x28\
-\x2d\x8d\xf4\xe0\x88\x04\x60\x13\xa5\x54\x00\xff\x19\xb5\x4b\x09\
-\xb4\xe6\xf7\x36\x51\x4a\x89\xe4\xc0\x48\x23\xc0\x2b\x00\xb2\xa2\
-\xf7\x27\x81\xc6\x4c\x40\xe7\xec\xa2\x41\x19\x54\x00\x5d\x53\xb9\
-\x8a\x62\xf5\x28\x81\xe6\xfc\xa8\x6b\xc4\x36\x20\x91\x44\x80\xd7\
-\x23\x3c\x2e\x41\x7c\x61\x44\x67\xdb\x0d\xc8\x80\x0d\x6b\x13\xa5\
-\x87\x00\xdc\xa3\x94\x47\x09\x34\x67\x81\x4d\x94\x96\x0d\x74\x40\
-\xbf\x02\xe8\xba\xbf\xfc\x82\xe2\x2e\x25\xd0\x9a\x17\x07\x7a\x56\
-\x30\x50\x04\x78\x14\xc0\x6c\xe5\xfd\x49\xa0\x31\x39\xe8\x9c\x43\
-\xd0\x27\x03\x09\xe0\xe7\xca\xfb\x92\x40\x27\x7e\xd1\xdf\x17\x7d\
-\x0a\xc0\x26\x4a\x8b\x00\x0c\xda\x83\x4c\x30\x64\xc8\xb5\x89\x52\
-\x9f\x7d\xb9\xfe\x22\xc0\xc6\x48\x4b\x6e\x69\x69\x41\x30\x18\x8c\
-\xca\xab\x04\xd1\x13\x0c\x06\xd1\xd2\xd2\x22\x27\xcb\x3f\xf7\xf5\
-\xe1\x35\x02\xb0\x89\xd2\x24\x22\xfa\x87\x48\x4b\xdd\xbd\x7b\x37\
-\x56\xae\x5c\x09\xbf\xdf\x2f\xc7\x99\x04\x31\xe0\xf3\xf9\xb0\x72\
-\xe5\x4a\xec\xde\xbd\x5b\x4e\xb6\x65\x5d\x0b\x75\xae\xa0\xaf\x08\
-\xb0\x5e\xce\x8e\x1c\x47\x8e\x1c\xc1\xbe\x7d\xfb\xb0\x64\xc9\x12\
-\xb4\xb7\xb7\xcb\x71\x28\x41\x14\x78\x3c\x1e\x2c\x5f\xbe\x1c\xfb\
-\xf6\xed\x43\x49\x49\x89\x9c\xac\x06\x00\x6b\xfb\xfa\xb0\x07\x9b\
-\x28\xb1\x40\x20\xf0\x03\x39\xa5\x76\x3b\xf1\xe9\xa7\x9f\x62\xe1\
-\xc2\x85\x70\x38\x1c\x72\xb2\x27\x90\x41\x5b\x5b\x1b\x16\x2f\x5e\
-\x8c\xfd\xfb\xf7\x03\x80\x5c\x01\x20\x18\x0c\x16\x5d\x3d\x24\xbc\
-\x3a\x02\x14\x5a\x2c\x96\x88\xef\xf9\x37\x36\x36\xa2\xba\xba\xba\
-\xe7\xef\xb2\xb2\x32\xdc\x7f\xff\xfd\x68\x6e\x1e\x32\x9b\x64\x0d\
-\x19\x9a\x9a\x9a\x70\xdf\x7d\xf7\x5d\xd1\xe8\x5f\x7d\xf5\x15\x1a\
-\x1b\x23\xdf\xb6\xd0\x6c\x36\x67\x01\xb8\xab\xf7\x67\x57\x08\xa0\
-\xa3\xa3\x43\xd6\xb4\xa2\x92\x92\x92\x9e\xd5\x35\xdd\x94\x97\x97\
-\xa3\xb0\xb0\x10\x17\x2e\xc4\xcd\x36\x38\x43\x1e\xbb\xdd\x8e\xc2\
-\xc2\x42\x9c\x38\x71\xe2\x8a\xcf\x89\x08\x47\x8f\x1e\x95\x55\x56\
-\x28\x14\xba\x62\x37\x96\x1e\x01\xd8\x44\x89\xf9\xfd\xfe\xc7\xe4\
-\x14\xd6\x5f\x08\xfa\xf2\xcb\x2f\x91\x9f\x9f\x8f\x93\x27\x4f\xca\
-\x72\x2e\xc1\xb5\x9c\x3e\x7d\x1a\x05\x05\x05\x38\x7b\xf6\x6c\x9f\
-\xdf\xcb\xbd\x0c\x04\x02\x81\x7f\xec\x7d\x19\xe8\x1d\x01\x72\xac\
-\x56\xeb\x4d\x72\x0a\x1b\x48\x7d\x97\x2f\x5f\xc6\x82\x05\x0b\xf0\
-\xb7\xbf\xfd\x4d\x96\x83\x09\xfe\xce\xa1\x43\x87\x50\x50\x50\x80\
-\x4b\x97\xfa\xdf\x39\x46\xae\x00\xac\x56\x6b\x06\x80\x59\xdd\x7f\
-\xf7\x08\xc0\xe7\xf3\x3d\x20\xa7\x20\xbf\xdf\x8f\xe3\xc7\x8f\x0f\
-\x78\x4c\x6b\x6b\x2b\x16\x2f\x5e\x8c\x9d\x3b\x77\xca\x72\x32\x01\
-\x20\x8a\x22\x96\x2e\x5d\x8a\xd6\xd6\xd6\x01\x8f\x3b\x7e\xfc\x38\
-\x7c\x3e\x79\xdb\x0f\xfa\xfd\xfe\x9e\xb5\x1c\x3d\x02\x68\x6b\x6b\
-\x5b\x29\xa7\x90\xb2\xb2\xb2\x88\xc6\xfe\x7e\xbf\x1f\x8f\x3f\xfe\
-\x38\xde\x78\xe3\x0d\x59\x4e\xde\xc8\xfc\xf6\xb7\xbf\xc5\x23\x8f\
-\x3c\x02\xaf\xd7\x3b\xe8\xb1\x7e\xbf\x1f\xe5\xe5\xf2\x36\x19\x6b\
-\x69\x69\xf9\x7b\x3f\xa0\x68\x45\x06\x88\x68\x58\x20\x10\x08\x91\
-\x0c\x8a\x8b\x8b\x09\x9d\x3b\x5c\x45\x9c\x8a\x8a\x8a\x28\x10\x08\
-\xc8\x31\xa3\x2a\xe1\x70\x98\xc2\xe1\xb0\xde\x6e\xf4\xe0\xf7\xfb\
-\xe9\xa9\xa7\x9e\x92\x5d\xaf\xc5\xc5\xc5\x72\xed\x04\x88\xc8\x5c\
-\xb4\x22\xa3\x27\x02\x7c\xd7\x6c\x36\xcb\xda\xc2\xe5\xc8\x91\x23\
-\xb2\x54\x07\x00\x6f\xbd\xf5\x16\x16\x2c\x58\x80\x86\x86\x06\xd9\
-\x79\xaf\x77\x9a\x9b\x9b\xb1\x64\xc9\x12\xbc\xfd\xf6\xdb\xb2\xf3\
-\xca\xed\x07\x58\x2c\x16\x33\xba\xfa\x01\x06\x00\xb0\xdb\xed\xb2\
-\xb6\x20\x21\x22\x1c\x3b\x16\xdd\x26\x97\x25\x25\x25\xc8\xcb\xcb\
-\xbb\x66\x48\x73\x23\x73\xea\xd4\x29\xcc\x99\x33\x07\x07\x0f\x1e\
-\x8c\x2a\x7f\x5f\xc3\xf1\xc1\xb8\x70\xe1\xc2\x62\xa0\x4b\x00\x1e\
-\x8f\x47\x96\x00\xce\x9e\x3d\x1b\xd3\xcd\x9e\x8b\x17\x2f\xe2\xde\
-\x7b\xef\xc5\xde\xbd\x7b\xa3\x2e\xe3\x7a\x41\x14\x45\xcc\x9b\x37\
-\x0f\xdf\x7e\xfb\x6d\xd4\x65\x38\x1c\x8e\x7e\x87\x89\xfd\xd1\xdd\
-\xe6\x06\x00\x48\x49\x49\x91\xb5\xd8\x23\x9a\xf0\x7f\x35\xed\xed\
-\xed\xe0\x79\x1e\x9b\x36\x6d\x42\x20\xa0\xd9\xbe\x88\x71\x43\x28\
-\x14\xc2\x8b\x2f\xbe\x88\x95\x2b\x57\xc2\xe5\x72\xc5\x5c\x5e\x14\
-\xc3\xc1\xef\x00\x00\x88\xc8\x14\x08\x04\x3a\xe4\x74\x22\xd6\xad\
-\x5b\x27\xbb\xa3\x32\x50\xca\xcb\xcb\xa3\xea\xea\x6a\x59\x1d\x19\
-\x25\xd0\xab\x13\x58\x53\x53\x43\xf3\xe6\xcd\x53\xb4\x0e\xd7\xaf\
-\x5f\x2f\xcb\x07\xaf\xd7\xdb\x41\x44\x06\xb4\xb7\xb7\xcf\x90\x7b\
-\x02\x53\xa7\x4e\x55\xd4\x79\x00\x94\x92\x92\x42\xef\xbf\xff\xbe\
-\x5c\x57\x62\x42\x0f\x01\xec\xda\xb5\x8b\x46\x8e\x1c\xa9\x78\xfd\
-\x4d\x9b\x36\x4d\xb6\x2f\x3e\x9f\x6f\x0a\x0e\x1d\x3a\x54\x24\x27\
-\x53\x7d\x7d\x3d\x31\xc6\x14\x3f\x81\xee\xb4\x61\xc3\x06\x72\xb9\
-\x5c\xb2\x4f\x26\x1a\xb4\x14\x40\x7b\x7b\x3b\xad\x5f\xbf\x5e\xb5\
-\x7a\x63\x8c\x51\x7d\x7d\xbd\x2c\x9f\x4a\x4a\x4a\xd6\x18\x9c\x4e\
-\x67\x0e\x64\x10\x4d\x8f\x53\x0e\xef\xbe\xfb\x2e\x72\x73\x73\x65\
-\x5f\xd3\xe2\x99\x23\x47\x8e\x20\x37\x37\x17\xdb\xb7\x6f\x57\xcd\
-\x06\x11\xc9\xae\x33\x87\xc3\x91\x67\xb0\x58\x2c\x53\xe5\x64\x52\
-\xa2\x03\x38\x18\xe7\xce\x9d\x43\x61\x61\x21\x04\x41\x80\xd3\xe9\
-\x54\xdd\x9e\x5a\xb8\xdd\x6e\x3c\xfb\xec\xb3\xb8\xe7\x9e\x7b\xf0\
-\xd5\x57\x5f\xa9\x6e\x2f\x8a\xfb\x01\x53\x71\xf8\xf0\xe1\x33\x72\
-\xc2\x46\x7e\x7e\xbe\x6a\x61\xac\xaf\x94\x95\x95\x45\x3b\x77\xee\
-\x94\x15\xda\x22\x45\xad\x4b\x40\x38\x1c\xa6\x1d\x3b\x76\xd0\xf8\
-\xf1\xe3\x35\xad\xab\xfc\xfc\x7c\x59\x7e\x1e\x3e\x7c\xf8\x14\xca\
-\xca\xca\xa4\x48\x33\x78\x3c\x1e\xb2\x58\x2c\x9a\x9e\x54\x77\x9a\
-\x3b\x77\x2e\x7d\xf6\xd9\x67\xb2\x1b\x63\x20\xd4\x10\xc0\x89\x13\
-\x27\x68\xfe\xfc\xf9\xba\xd4\x91\xd9\x6c\x26\xb7\xdb\x1d\xb1\xaf\
-\xa5\xa5\xa5\xb5\xa8\xaa\xaa\x72\x46\x9a\xa1\xaa\xaa\x4a\x97\x13\
-\xeb\x4e\x46\xa3\x91\xd6\xad\x5b\x47\xe7\xcf\x9f\x8f\xaa\x71\xae\
-\x46\x49\x01\x54\x57\x57\xd3\x9a\x35\x6b\xc8\x60\x30\xe8\x5a\x47\
-\x55\x55\x55\x11\xfb\x5c\x59\x59\xd9\x8a\x9a\x9a\x1a\xbf\x9c\x13\
-\xdd\xb2\x65\x8b\xae\x27\xd8\xad\xf4\x27\x9f\x7c\x92\xbe\xf9\xe6\
-\x1b\xd9\x0d\xd5\x1b\x25\x04\x70\xfe\xfc\x79\xda\xb0\x61\x03\x99\
-\x4c\x26\xdd\xeb\x65\xcb\x96\x2d\xb2\x7c\xff\xe6\x9b\x6f\x7c\x68\
-\x6c\x6c\x94\x75\x13\x28\x1c\x0e\xd3\xaa\x55\xab\x74\x3f\xd9\xee\
-\x88\xf0\xd0\x43\x0f\xd1\xc1\x83\x07\x65\x9d\x78\xef\x73\x89\x56\
-\x00\x07\x0e\x1c\x20\x9e\xe7\x75\xff\xc5\x77\xa7\xd5\xab\x57\xcb\
-\x3e\x97\xfa\xfa\xfa\x10\x5a\x5b\x5b\x65\xd7\x80\xd7\xeb\x55\xfc\
-\x4e\x56\xac\x69\xd6\xac\x59\xf4\xea\xab\xaf\x92\xdd\x6e\x8f\xf8\
-\x3c\xe4\x0a\xa0\xa6\xa6\x86\x5e\x79\xe5\x15\xba\xed\xb6\xdb\x74\
-\x3f\xdf\xde\xa9\xa0\xa0\x80\xbc\x5e\xaf\xdc\x66\x24\x87\xc3\x11\
-\x86\x9c\x4e\xc3\x55\x99\x29\x27\x27\x47\xf7\x93\xbf\x3a\x31\xc6\
-\xa8\xa0\xa0\x80\x8a\x8b\x8b\xa9\xac\xac\x8c\x42\xa1\xfe\xa7\x39\
-\x0c\x26\x80\x50\x28\x44\xa5\xa5\xa5\xf4\xf2\xcb\x2f\xd3\xdd\x77\
-\xdf\xad\xea\x0d\xb0\x68\x53\x6e\x6e\x2e\xb5\xb4\xb4\x44\xd5\x86\
-\x2e\x97\x2b\xcc\x02\x81\x00\x99\xcd\x66\x44\x43\x53\x53\x13\x16\
-\x2c\x58\x80\xaa\xaa\xaa\xa8\xf2\x6b\xc1\xa8\x51\xa3\x70\xd7\x5d\
-\x77\x61\xe6\xcc\x99\x98\x3e\x7d\x3a\xa6\x4f\x9f\x8e\x31\x63\xc6\
-\x20\x35\x35\x15\xa9\xa9\x9d\xef\x9e\x76\x3a\x9d\x70\x3a\x9d\x68\
-\x68\x68\xc0\xd9\xb3\x67\x71\xf6\xec\x59\x9c\x3e\x7d\x1a\xc7\x8e\
-\x1d\x1b\x74\x4a\x96\x9e\xdc\x7e\xfb\xed\x38\x70\xe0\x00\x46\x8f\
-\x1e\x1d\x55\xfe\x60\x30\x08\xf8\x7c\xbe\xa8\xd4\xd3\x4d\x7d\x7d\
-\x3d\xcd\x98\x31\x43\xf7\x5f\xc2\x8d\x96\x6e\xbd\xf5\x56\xba\x7c\
-\xf9\x72\x4c\x6d\xe7\xf5\x7a\x09\x0e\x87\x23\xe6\x71\x50\x6d\x6d\
-\x2d\xcd\x9a\x35\x4b\xf7\x4a\xb9\x51\xd2\xec\xd9\xb3\x63\x6e\x7c\
-\xa2\xae\x3e\x40\x6d\x6d\xad\xac\x51\x40\x7f\xb4\xb4\xb4\x50\x41\
-\x41\x81\xee\x95\x73\xbd\xa7\xfc\xfc\x7c\x6a\x6a\x6a\x52\xa2\xc9\
-\xe8\xd2\xa5\x4b\x1d\x38\x7f\xfe\x7c\x50\x91\xd2\x88\xc8\xe7\xf3\
-\xd1\xc3\x0f\x3f\xac\x7b\x25\x5d\xaf\xe9\xc1\x07\x1f\x24\x8f\xc7\
-\xa3\x54\x73\x51\x75\x75\x75\x00\xa7\x4f\x9f\x96\x3f\x7e\x18\x80\
-\x60\x30\x48\x4f\x3e\xf9\xa4\xee\x95\x75\xbd\xa5\xa2\xa2\x22\x0a\
-\x06\x15\xfb\xad\x12\x11\x51\x55\x55\x95\x1b\x27\x4f\x9e\x6c\x55\
-\xb4\xd4\x2e\x6c\x36\x9b\x6e\xcf\x0d\xae\xa7\x64\x32\x99\x64\x4f\
-\xfb\x8e\x94\x2f\xbe\xf8\xc2\x81\xd2\xd2\xd2\x88\x1f\x06\xc9\xe5\
-\xd0\xa1\x43\x34\x76\xec\x58\xdd\x2b\x71\xa8\xa6\x8c\x8c\x0c\x3a\
-\x7c\xf8\xb0\x5a\xcd\x43\xa5\xa5\xa5\xb5\x06\x97\xcb\xd5\x04\x95\
-\x98\x3f\x7f\x3e\xca\xcb\xcb\x31\x67\xce\x1c\xb5\x4c\x5c\xb7\xdc\
-\x79\xe7\x9d\x28\x2f\x2f\x47\x41\x41\x81\x6a\x36\x5c\x2e\x57\xa3\
-\xc1\xe9\x74\xda\x55\xb3\x00\x20\x2b\x2b\x0b\x47\x8f\x1e\xc5\xd6\
-\xad\x5b\x61\x34\x26\x5e\x1f\x3c\x18\x46\xa3\x11\x9b\x37\x6f\xc6\
-\xe1\xc3\x87\x31\x7e\xfc\x78\x55\x6d\x39\x9d\xce\x6f\x0d\x1e\x8f\
-\x47\xde\x84\xf2\x28\x30\x99\x4c\x78\xe1\x85\x17\x50\x52\x52\x82\
-\x69\xd3\xa6\xa9\x6d\x6e\xc8\x32\x79\xf2\x64\x1c\x3c\x78\x10\xc5\
-\xc5\xc5\xb0\x58\x2c\xaa\xdb\xf3\x7a\xbd\x5f\x1a\xac\x56\x6b\x74\
-\x4b\x7c\xa2\x60\xee\xdc\xb9\x38\x79\xf2\x24\x36\x6e\xdc\x38\x94\
-\x5e\xd7\xaa\x09\x6b\xd7\xae\x45\x65\x65\x25\x0a\x0b\x0b\x35\xb3\
-\x99\x9e\x9e\x7e\x14\x6e\xb7\x3b\x53\xb5\x5e\xc6\x00\xec\xdf\xbf\
-\x3f\x71\x0b\x19\xa0\x99\x33\x67\xd2\x27\x9f\x7c\xa2\x47\x13\x10\
-\x11\x65\x80\x88\x58\xd7\x22\x01\xcd\x09\x06\x83\xb4\x6d\xdb\x36\
-\x4a\x4d\x4d\xd5\xbd\x21\xb4\x4e\xc9\xc9\xc9\xb4\x75\xeb\x56\xf2\
-\xfb\x65\xcd\xc7\x51\x0c\xaf\xd7\x1b\x22\x22\x86\xa2\x15\x19\xa8\
-\xa9\xa9\x91\x37\xa1\x5c\x61\xea\xea\xea\x68\xcd\x9a\x35\x71\xf9\
-\xb8\x55\xe9\xc4\x18\xa3\x75\xeb\xd6\x29\x72\x2f\x3f\x16\x6a\x6a\
-\x6a\x2e\xf7\x2c\x0f\x6f\x6e\x6e\xfe\x02\x3a\x32\x6e\xdc\x38\xbc\
-\xf7\xde\x7b\xf8\xfc\xf3\xcf\xb1\x6c\xd9\xb2\xeb\xb2\x7f\xc0\x18\
-\xc3\xf2\xe5\xcb\x51\x5a\x5a\x8a\xed\xdb\xb7\x83\xe3\x38\x5d\xfd\
-\x69\x69\x69\x39\x0e\x74\x2d\x0e\xb5\x5a\xad\x7f\xd1\xd5\x9b\x2e\
-\xe6\xcc\x99\x83\xbd\x7b\xf7\xa2\xa2\xa2\x02\x6b\xd7\xae\x85\xc1\
-\x30\xf4\xdf\x53\xc1\x18\xc3\xb2\x65\xcb\x50\x5a\x5a\x8a\x3d\x7b\
-\xf6\x20\x2f\x2f\x4f\x6f\x97\x00\x00\x29\x29\x29\x7b\x00\xf4\xec\
-\x10\x72\x8b\xae\xf1\xa8\x1f\x2a\x2b\x2b\x69\xd5\xaa\x55\x71\x33\
-\xef\x4e\x4e\x32\x18\x0c\xf4\xd8\x63\x8f\x51\x65\x65\xa5\xde\xd5\
-\xd8\x1f\x13\x8b\x56\x64\x74\x0a\xa0\x68\x45\x06\xda\xda\xda\xb4\
-\x59\x90\x17\x05\xb5\xb5\xb5\x54\x5c\x5c\x4c\x93\x26\x4d\xd2\xbd\
-\x61\x07\x4b\x99\x99\x99\xb4\x79\xf3\xe6\x98\x67\x2c\xab\x49\x6b\
-\x6b\x6b\x7b\x77\xbb\xf7\xc4\x58\xa7\xd3\x59\x11\x51\xec\xd0\x81\
-\xcc\xcc\x4c\x6c\xde\xbc\x19\x5f\x7f\xfd\x35\xf6\xef\xdf\x8f\x47\
-\x1f\x7d\x14\x26\x53\x4c\x6f\x4d\x57\x14\x83\xc1\x80\x45\x8b\x16\
-\x61\xe7\xce\x9d\xb0\xdb\xed\x28\x2e\x2e\xc6\xe4\xc9\x93\xf5\x76\
-\xab\x5f\x9c\x4e\x67\xcf\xf6\x6e\x3d\xb5\x38\x66\xcc\x98\x5d\x00\
-\xe6\xe9\xe2\x51\x84\x74\x57\xf4\xa2\x45\x8b\x50\x5b\x5b\x8b\xe5\
-\xcb\x97\xeb\xbe\xd5\xcc\x1d\x77\xdc\x81\xbd\x7b\xf7\xe2\xe6\x9b\
-\x6f\xd6\xd5\x0f\x39\xdc\x74\xd3\x4d\x1f\x75\xff\xbf\x27\x02\x0c\
-\x1b\x36\x6c\x17\x91\x8a\xcb\x7e\x15\xe6\xe6\x9b\x6f\x56\xf5\x41\
-\x49\xa4\x14\x16\x16\x0e\xa9\xc6\x27\x22\x4a\x4a\x4a\xfa\x73\xf7\
-\xdf\x3d\x02\x10\x78\xae\xb6\xb9\xb9\xf9\x9c\x3e\x6e\x45\x47\x76\
-\x76\xb6\xde\x2e\xc4\x85\x0f\x72\x70\x38\x1c\x55\x02\xcf\x5d\xee\
-\xfe\xfb\x8a\x71\xd6\xc8\x91\x23\xff\xa0\xbd\x4b\xd1\x33\x7d\xfa\
-\x74\xbd\x5d\x88\x0b\x1f\xe4\x90\x9a\x9a\xfa\x6e\xef\xbf\xaf\x10\
-\x80\xc9\x64\xda\x35\x84\xae\x02\x71\x51\xf9\xf1\xe0\x43\xa4\x10\
-\x11\xcc\x66\xf3\x47\xbd\x3f\xbb\x42\x00\x02\xcf\xd5\xf8\xfd\xfe\
-\x53\xda\xba\x15\x3d\x99\x99\x99\x48\x4b\x4b\xd3\xcd\x7e\x5a\x5a\
-\x1a\xc6\x8d\x1b\xa7\x9b\x7d\xb9\xf8\x7c\xbe\x0a\x81\xe7\xae\xd8\
-\xc7\xff\x9a\x5b\x6d\xc3\x87\x0f\x7f\x53\x3b\x97\x62\x47\xcf\x6b\
-\xf0\x50\xfa\xf5\x03\x40\x52\x52\xd2\x35\x1b\x36\xf7\x75\xaf\xf5\
-\xfd\x60\x30\x38\x64\xf6\x65\xd1\xb3\x11\x86\x92\x00\x82\xc1\x60\
-\x2b\x80\x0f\xaf\xfe\xfc\x1a\x01\x08\x3c\xe7\x35\x9b\xcd\xff\xa1\
-\x89\x57\x0a\xa0\x67\x04\x18\x4a\x23\x00\xb3\xd9\xfc\x86\xc0\x73\
-\xd7\x6c\x3f\xde\xdf\xd3\x96\x37\xc3\xe1\x70\x87\xca\x3e\x29\x42\
-\x22\x02\x0c\x0e\x11\x85\x00\xd8\xfa\xfa\xae\x4f\x01\x08\x3c\x57\
-\x67\x30\x18\x76\xa9\xea\x95\x42\x24\x04\x30\x38\x8c\xb1\x0f\x05\
-\x9e\xab\xed\xeb\xbb\x81\x9e\xb7\xbe\x4c\x44\x61\x95\x7c\x52\x8c\
-\xa9\x53\xa7\xea\xf2\x5c\xc0\x64\x32\x61\xca\x94\x29\x9a\xdb\x95\
-\x0b\x11\x75\x00\x78\xb5\xbf\xef\xfb\x15\x80\xc0\x73\x95\x8c\xb1\
-\xed\x6a\x38\xa5\x24\x16\x8b\x05\xb7\xdc\x72\x8b\xe6\x76\xa7\x4c\
-\x99\xa2\xc9\xcc\xdd\x58\x61\x8c\xbd\x2d\xf0\xdc\xe9\xfe\xbe\x1f\
-\x6c\xc6\xc5\x73\xe1\x70\xd8\xad\xb0\x4f\x8a\xa3\x47\x28\x1e\x0a\
-\xe1\x9f\x88\xdc\x00\x5e\x1c\xe8\x98\x01\x05\x20\xf0\x5c\xbd\xc1\
-\x60\xf8\xb5\xa2\x5e\xa9\x40\x42\x00\x7d\xc3\x18\x7b\x59\xe0\x39\
-\x69\xa0\x63\x22\x99\x73\xf5\x2a\x11\xf5\xff\xde\xb2\x38\x40\x8f\
-\xe1\xd8\x10\x18\x02\xd6\x02\xf8\xf7\xc1\x0e\x1a\x54\x00\x02\xcf\
-\x79\x19\x63\x3f\x56\xc4\x25\x95\x48\x44\x80\x3e\xd9\x28\xf0\x9c\
-\x67\xb0\x83\x22\x9a\x75\x29\xf0\xdc\x1e\x00\xff\x1d\xb3\x4b\x2a\
-\xa1\x47\x63\xc4\x79\x04\xf8\x2f\x81\xe7\x3e\x1a\xfc\xb0\x08\x05\
-\xd0\xc5\x4f\x88\x48\xd5\x85\xa4\xd1\x92\x9e\x9e\x8e\xb1\x63\xc7\
-\x6a\x66\x2f\x23\x23\x03\xe9\xe9\xe9\x9a\xd9\x93\xc9\xb7\x00\x9e\
-\x89\xf4\xe0\x88\x05\x20\xf0\x9c\x93\x31\xf6\x04\x80\xb8\xbc\x43\
-\xa8\x65\x14\x88\xe3\xf0\x1f\x06\xb0\x41\xe0\xb9\xf6\x48\x33\xc8\
-\x9a\x78\x2f\xf0\xdc\x11\x00\xaf\xc9\xf5\x4a\x0b\xb4\x6c\x94\x38\
-\x0e\xff\x2f\x0b\x3c\x77\x48\x4e\x86\x68\x56\x5e\x3c\x07\x60\x4f\
-\x14\xf9\x54\x45\xcb\x46\x89\xd3\x08\xf0\x57\x00\x2f\xc8\xcd\x24\
-\x5b\x00\x02\xcf\x85\x01\x3c\x01\x20\xae\xa6\x91\xdf\xe0\x97\x80\
-\x93\x00\x1e\x13\x78\x4e\xf6\xe5\x39\xaa\xb5\x57\x02\xcf\xb9\x00\
-\x3c\x40\x44\x75\xd1\xe4\x57\x83\x1b\x55\x00\x44\x24\x01\x58\xde\
-\xd5\x26\xb2\x89\x7a\xf1\x9d\xc0\x73\x75\x8c\x31\x1e\x40\x5c\xdc\
-\x2a\x9e\x34\x69\x12\x86\x0f\x1f\xae\xba\x9d\xe1\xc3\x87\x63\xe2\
-\xc4\x89\xaa\xdb\x89\x04\x22\x72\x33\xc6\x96\x09\x3c\x77\x31\xda\
-\x32\x62\x5a\x7d\x29\xf0\x5c\x19\x80\xfb\x89\x28\xe2\x5e\xa7\x5a\
-\x18\x0c\x06\xdc\x7a\xeb\xad\xaa\xdb\xc9\xce\xce\x8e\x8b\x45\xab\
-\x5d\x8d\xff\xa0\xc0\x73\xf2\xde\x1d\x7f\x15\x31\x9f\x89\xc0\x73\
-\x25\x8c\xb1\x05\xe1\x70\x58\xf7\x6d\xb5\xb5\x08\xcd\xf1\x10\xfe\
-\xc3\xe1\xb0\x93\x31\xb6\x48\xe0\xb9\x4f\x63\x2d\x4b\x11\x29\x0b\
-\x3c\x77\xdc\x60\x30\x2c\x24\x22\x87\x12\xe5\x45\xcb\x8d\x20\x00\
-\x22\x6a\x35\x18\x0c\xdf\x13\x78\xee\x33\x25\xca\x53\x2c\x96\x09\
-\x3c\x77\x82\x31\xb6\x88\x88\x2e\x0f\x7e\xb4\x3a\x68\x31\x14\xd4\
-\xe2\x32\xd3\x1f\x44\x54\xcb\x18\xbb\x47\xe0\xb9\x52\xa5\xca\x54\
-\xf4\x62\x26\xf0\xdc\x17\x8c\xb1\x3c\x22\xfa\x5c\xc9\x72\x23\x45\
-\x8b\x5f\xe7\x8c\x19\xb2\x5e\xb4\xae\x18\x44\xf4\x19\x63\x6c\x8e\
-\xc0\x73\x95\x4a\x96\xab\x78\x6f\xa6\x6b\x74\x70\x4f\x38\x1c\x7e\
-\x77\xf0\xa3\x95\x25\x3b\x3b\x5b\xd5\xed\x65\x18\x63\x7a\xed\x73\
-\xf8\x01\x63\xec\xbe\xde\x6b\xfa\x94\x82\x15\xad\xc8\x50\xba\xcc\
-\x1e\x6c\xa2\xb4\x89\x88\x5e\x63\x8c\x69\xb6\x45\xe8\xc4\x89\x13\
-\x71\xe1\xc2\x85\xc1\x0f\x8c\x82\x09\x13\x26\xc0\x6e\xd7\xee\x79\
-\x18\x11\x85\x18\x63\xcf\x08\x3c\x77\xcd\x82\x0e\xa5\x50\x75\x3c\
-\x23\xf0\xdc\xeb\x8c\xb1\x3b\x02\x81\x40\xbf\x73\xd2\x94\x46\xcd\
-\xcb\x80\x96\xe1\x3f\x18\x0c\x9e\x63\x8c\xdd\xa5\x66\xe3\x03\x2a\
-\x0b\x00\xe8\x9c\x5c\x6a\xb1\x58\x72\x42\xa1\xd0\x4b\xe1\x70\x58\
-\xf5\x95\xa7\x6a\x0a\x40\x8b\x3e\x46\x38\x1c\xa6\x50\x28\xf4\x6b\
-\xb3\xd9\x3c\x3b\xd6\x31\x7e\x24\x68\x32\x9f\x5a\xe0\xb9\x20\x80\
-\x7f\xb5\x89\xd2\xc7\x1e\x8f\x67\x87\xd5\x6a\x9d\xa0\x96\x2d\x35\
-\x47\x02\x6a\x8f\x00\x3c\x1e\x8f\xdd\x6a\xb5\xae\x7e\xfa\xe1\x4c\
-\x45\x86\x78\x91\xa0\xe9\x2d\x2d\x81\xe7\x8e\x59\xad\xd6\xa9\xc1\
-\x60\xf0\x69\xaf\xd7\x1b\xd5\xbd\xeb\xc1\x18\x8a\x97\x00\x9f\xcf\
-\xe7\x0d\x85\x42\xcf\x59\xad\xd6\x6c\xa5\xc6\xf7\x91\xa2\x6a\x27\
-\x70\x20\x6c\xa2\x34\xaa\xb1\xb1\xf1\xa5\x51\xa3\x46\xfd\xd0\x64\
-\x32\x29\xd6\x49\xac\xab\xab\x53\x6d\xcb\x96\xba\xba\x3a\x45\x97\
-\x83\x87\x42\x21\x6a\x6b\x6b\xfb\xd3\xe8\xd1\xa3\x37\x09\x3c\xd7\
-\xa8\x58\xc1\x32\xd0\x4d\x00\xdd\xd8\x44\x69\x9a\xdd\x6e\xff\xfd\
-\xf8\xf1\xe3\x17\x18\x8d\x46\x45\xc6\x70\x69\x69\x69\x70\x3a\x95\
-\x5d\xe0\x9c\x9a\x9a\x8a\xb6\xb6\x36\x45\xca\xea\xe8\xe8\xa0\xda\
-\xda\xda\x4f\x26\x4c\x98\xf0\xb4\xc0\x73\xe7\x15\x29\x34\x4a\x74\
-\x7f\xaa\x21\xf0\x5c\xf5\xaf\x36\xce\x5d\x68\x34\x1a\x27\x57\x55\
-\x55\x7d\xe0\x76\xbb\x83\xb1\x96\xa9\xc6\x65\x40\x89\xf0\xef\xf5\
-\x7a\x3b\x4e\x9d\x3a\xb5\xc7\x68\x34\x4e\xfe\xe5\x4f\xee\xfc\x9e\
-\xde\x8d\x0f\xc4\x81\x00\xba\x11\x78\xce\xfe\xc6\x2f\x16\x3d\x91\
-\x9c\x9c\x3c\xb6\xa2\xa2\xe2\xcd\xc6\xc6\xc6\x6b\x96\x32\x47\x8a\
-\x1a\x02\x88\xa5\x73\xd9\xd0\xd0\xe0\x29\x2d\x2d\xfd\x5d\x52\x52\
-\xd2\xe8\x37\x9f\xff\x1e\x2f\xf0\x5c\xdc\x4c\xae\x8d\x9f\xdd\x16\
-\xbb\x10\x78\xae\x15\xc0\x3f\xd9\x44\x69\xe3\x81\x03\x07\x56\x00\
-\xf8\x69\x4e\x4e\xce\x5d\xa3\x46\x8d\x8a\x58\xac\x6a\x8c\x04\xe4\
-\x8a\xaa\xbd\xbd\x9d\x2a\x2a\x2a\xce\x10\xd1\xb6\xc2\xc2\xc2\x3f\
-\x3c\x5f\x74\x7b\xc7\x3b\x8a\x7b\x15\x3b\x71\x27\x80\x6e\xba\xa6\
-\x9e\xed\x06\xb0\xdb\xf5\x83\xb7\x52\x3c\x1e\xcf\x96\x49\x93\x26\
-\x3d\x7e\xdb\x6d\xb7\x4d\x18\x31\x62\xc4\x80\x7d\x05\xbd\x22\x80\
-\xcb\xe5\xa2\xaa\xaa\x2a\xbb\xdd\x6e\xff\x20\x23\x23\xa3\xf8\x4f\
-\xaf\xaf\x76\x01\xc0\x1f\x7f\xa3\xb8\x3b\x8a\xa1\x7b\x27\x50\x2e\
-\x2d\x96\xf9\x49\xd9\xd9\xd9\xeb\x27\x4f\x9e\xbc\x7a\xf6\xec\xd9\
-\x79\x39\x39\x39\xd6\xab\x27\x68\x9c\x39\x73\x06\x33\x67\xce\x54\
-\xd4\xee\x99\x33\x67\xfa\xec\x07\x7c\xfd\xf5\xd7\xbe\x8a\x8a\x8a\
-\x0a\x49\x92\xfe\xec\xf1\x78\x7e\x57\x7d\xe4\xb5\xb8\x98\x21\x15\
-\x29\x43\x4e\x00\x57\x93\x95\xf7\xe3\x19\x69\x69\x69\x8f\xa7\xa7\
-\xa7\x2f\x1c\x3f\x7e\x7c\x76\x76\x76\xf6\xc8\xf4\xf4\x74\x43\x72\
-\x72\x32\x42\xa1\x90\x22\x36\x4c\x26\x13\xdc\x6e\x37\x1c\x0e\x47\
-\xf8\xdc\xb9\x73\x2d\x17\x2f\x5e\x3c\xd7\xd2\xd2\x72\xc0\xe5\x72\
-\x7d\x50\xf3\xf9\x36\xd5\x5f\xba\xa5\x26\x43\x5e\x00\x7d\x91\x71\
-\x7b\xd1\x9c\x6d\xdb\xb6\x8d\x71\x3a\x9d\x13\x00\x4c\x02\x90\x05\
-\x20\x03\xc0\x4d\x00\x46\x03\x48\xee\x3a\x74\x64\xd7\xbf\xdd\xb3\
-\x99\x5c\x00\x9a\xbb\x52\x3d\x80\x8b\x00\xbe\x4d\x4d\x4d\xbd\xf0\
-\xcc\x33\xcf\x34\xd6\x7d\xf1\x3b\xd5\x6f\xcd\x6a\xcd\xff\x03\x95\
-\xb5\x5c\x14\x8a\xac\xb7\xcb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x01\xe7\x83\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x49\x6e\x6b\x73\x63\x61\x70\x65\
-\x20\x28\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x29\x20\x2d\x2d\x3e\x0a\
-\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x32\x38\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
-\x31\x32\x38\x22\x0a\x20\x20\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\
-\x22\x30\x20\x30\x20\x33\x33\x2e\x38\x36\x36\x36\x36\x37\x20\x33\
-\x33\x2e\x38\x36\x36\x36\x36\x37\x22\x0a\x20\x20\x20\x76\x65\x72\
-\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x73\x76\x67\x35\x22\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\
-\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\
-\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x65\x72\x73\
-\x69\x6f\x6e\x3d\x22\x31\x2e\x32\x2e\x31\x20\x28\x39\x63\x36\x64\
-\x34\x31\x65\x34\x31\x30\x2c\x20\x32\x30\x32\x32\x2d\x30\x37\x2d\
-\x31\x34\x2c\x20\x63\x75\x73\x74\x6f\x6d\x29\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\
-\x3d\x22\x64\x75\x6c\x6c\x61\x68\x61\x6e\x2e\x73\x76\x67\x22\x0a\
-\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x65\x78\x70\x6f\
-\x72\x74\x2d\x66\x69\x6c\x65\x6e\x61\x6d\x65\x3d\x22\x64\x75\x6c\
-\x6c\x61\x68\x61\x6e\x2e\x70\x6e\x67\x22\x0a\x20\x20\x20\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x3a\x65\x78\x70\x6f\x72\x74\x2d\x78\x64\
-\x70\x69\x3d\x22\x39\x36\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x65\x78\x70\x6f\x72\x74\x2d\x79\x64\x70\x69\x3d\
-\x22\x39\x36\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\
-\x6e\x61\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x73\
-\x6f\x64\x69\x70\x6f\x64\x69\x2e\x73\x6f\x75\x72\x63\x65\x66\x6f\
-\x72\x67\x65\x2e\x6e\x65\x74\x2f\x44\x54\x44\x2f\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x2d\x30\x2e\x64\x74\x64\x22\x0a\x20\x20\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\
-\x39\x39\x2f\x78\x6c\x69\x6e\x6b\x22\x0a\x20\x20\x20\x78\x6d\x6c\
-\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\
-\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\
-\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x3c\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x0a\x20\x20\
-\x20\x20\x20\x69\x64\x3d\x22\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\
-\x37\x22\x0a\x20\x20\x20\x20\x20\x70\x61\x67\x65\x63\x6f\x6c\x6f\
-\x72\x3d\x22\x23\x36\x36\x34\x66\x31\x37\x22\x0a\x20\x20\x20\x20\
-\x20\x62\x6f\x72\x64\x65\x72\x63\x6f\x6c\x6f\x72\x3d\x22\x23\x30\
-\x30\x30\x30\x30\x30\x22\x0a\x20\x20\x20\x20\x20\x62\x6f\x72\x64\
-\x65\x72\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x32\x35\x22\
-\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x73\
-\x68\x6f\x77\x70\x61\x67\x65\x73\x68\x61\x64\x6f\x77\x3d\x22\x74\
-\x72\x75\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x70\x61\x67\x65\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\
-\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x3a\x70\x61\x67\x65\x63\x68\x65\x63\x6b\x65\x72\x62\x6f\x61\x72\
-\x64\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x64\x65\x73\x6b\x63\x6f\x6c\x6f\
-\x72\x3d\x22\x23\x36\x64\x36\x64\x36\x64\x22\x0a\x20\x20\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x64\x6f\x63\x75\x6d\x65\
-\x6e\x74\x2d\x75\x6e\x69\x74\x73\x3d\x22\x70\x78\x22\x0a\x20\x20\
-\x20\x20\x20\x73\x68\x6f\x77\x67\x72\x69\x64\x3d\x22\x66\x61\x6c\
-\x73\x65\x22\x0a\x20\x20\x20\x20\x20\x73\x68\x6f\x77\x67\x75\x69\
-\x64\x65\x73\x3d\x22\x74\x72\x75\x65\x22\x0a\x20\x20\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x7a\x6f\x6f\x6d\x3d\x22\x34\
-\x2e\x37\x31\x32\x32\x30\x33\x38\x22\x0a\x20\x20\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x78\x3d\x22\x35\x30\x2e\x34\
-\x30\x31\x30\x34\x36\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x63\x79\x3d\x22\x35\x38\x2e\x35\x37\x31\x33\
-\x32\x31\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x32\x38\x34\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x31\x30\x33\x31\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x78\x3d\
-\x22\x36\x33\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x79\x3d\x22\x35\x22\
-\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\
-\x69\x6e\x64\x6f\x77\x2d\x6d\x61\x78\x69\x6d\x69\x7a\x65\x64\x3d\
-\x22\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x63\x75\x72\x72\x65\x6e\x74\x2d\x6c\x61\x79\x65\x72\x3d\
-\x22\x6c\x61\x79\x65\x72\x32\x22\x3e\x3c\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x67\x72\x69\x64\x0a\x20\x20\x20\x20\x20\x20\x20\x74\
-\x79\x70\x65\x3d\x22\x78\x79\x67\x72\x69\x64\x22\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x69\x64\x3d\x22\x67\x72\x69\x64\x31\x32\x38\x37\
-\x22\x20\x2f\x3e\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\
-\x69\x64\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x70\x6f\x73\x69\x74\
-\x69\x6f\x6e\x3d\x22\x31\x36\x2e\x39\x33\x32\x36\x38\x35\x2c\x33\
-\x30\x2e\x36\x32\x30\x34\x35\x32\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x31\x2c\
-\x30\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x67\x75\
-\x69\x64\x65\x31\x32\x38\x39\x22\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x6c\x6f\x63\x6b\x65\x64\x3d\
-\x22\x66\x61\x6c\x73\x65\x22\x20\x2f\x3e\x3c\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x31\x31\x2e\x33\x32\
-\x33\x31\x34\x32\x2c\x31\x36\x2e\x39\x33\x34\x32\x35\x36\x22\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\
-\x6f\x6e\x3d\x22\x30\x2c\x2d\x31\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x69\x64\x3d\x22\x67\x75\x69\x64\x65\x31\x36\x36\x35\x22\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x6c\x6f\x63\x6b\x65\x64\x3d\x22\x66\x61\x6c\x73\x65\x22\x20\x2f\
-\x3e\x3c\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\
-\x64\x76\x69\x65\x77\x3e\x3c\x64\x65\x66\x73\x0a\x20\x20\x20\x20\
-\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x32\x22\x3e\x3c\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x70\x61\x74\x68\x2d\x65\x66\x66\x65\x63\
-\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x65\x66\x66\x65\x63\x74\x3d\
-\x22\x6d\x69\x72\x72\x6f\x72\x5f\x73\x79\x6d\x6d\x65\x74\x72\x79\
-\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x73\x74\x61\x72\x74\x5f\x70\
-\x6f\x69\x6e\x74\x3d\x22\x31\x34\x2e\x39\x36\x32\x37\x30\x32\x2c\
-\x2d\x32\x2e\x37\x30\x39\x35\x39\x30\x37\x22\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x65\x6e\x64\x5f\x70\x6f\x69\x6e\x74\x3d\x22\x31\x34\
-\x2e\x39\x36\x33\x36\x32\x34\x2c\x33\x31\x2e\x31\x35\x37\x30\x37\
-\x36\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x63\x65\x6e\x74\x65\x72\
-\x5f\x70\x6f\x69\x6e\x74\x3d\x22\x31\x34\x2e\x39\x36\x33\x36\x32\
-\x34\x2c\x31\x34\x2e\x32\x32\x33\x37\x34\x33\x22\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\x2d\x65\x66\x66\
-\x65\x63\x74\x31\x32\x39\x31\x22\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x69\x73\x5f\x76\x69\x73\x69\x62\x6c\x65\x3d\x22\x74\x72\x75\x65\
-\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x6c\x70\x65\x76\x65\x72\x73\
-\x69\x6f\x6e\x3d\x22\x31\x2e\x32\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x6c\x70\x65\x73\x61\x74\x65\x6c\x6c\x69\x74\x65\x73\x3d\x22\
-\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x6d\x6f\x64\x65\x3d\x22\x76\
-\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x64\x69\x73\x63\x61\x72\x64\x5f\x6f\x72\x69\x67\x5f\x70\x61\x74\
-\x68\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x66\x75\x73\x65\x5f\x70\x61\x74\x68\x73\x3d\x22\x66\x61\x6c\
-\x73\x65\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x6f\x70\x6f\x73\x69\
-\x74\x65\x5f\x66\x75\x73\x65\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x73\x70\x6c\x69\x74\x5f\x69\x74\x65\
-\x6d\x73\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x73\x70\x6c\x69\x74\x5f\x6f\x70\x65\x6e\x3d\x22\x66\x61\
-\x6c\x73\x65\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x6b\
-\x5f\x73\x74\x79\x6c\x65\x73\x3d\x22\x66\x61\x6c\x73\x65\x22\x20\
-\x2f\x3e\x3c\x2f\x64\x65\x66\x73\x3e\x3c\x67\x0a\x20\x20\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x6c\x61\x62\x65\x6c\x3d\
-\x22\x4c\x61\x79\x65\x72\x20\x31\x22\x0a\x20\x20\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x67\x72\x6f\x75\x70\x6d\x6f\x64\
-\x65\x3d\x22\x6c\x61\x79\x65\x72\x22\x0a\x20\x20\x20\x20\x20\x69\
-\x64\x3d\x22\x6c\x61\x79\x65\x72\x31\x22\x0a\x20\x20\x20\x20\x20\
-\x73\x74\x79\x6c\x65\x3d\x22\x64\x69\x73\x70\x6c\x61\x79\x3a\x6e\
-\x6f\x6e\x65\x22\x3e\x3c\x69\x6d\x61\x67\x65\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x32\x2e\x39\x39\x39\
-\x33\x38\x36\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x38\x32\x2e\x34\x34\x33\x34\x38\x39\x22\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x70\x72\x65\x73\x65\x72\x76\x65\x41\x73\
-\x70\x65\x63\x74\x52\x61\x74\x69\x6f\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\
-\x65\x66\x3d\x22\x64\x61\x74\x61\x3a\x69\x6d\x61\x67\x65\x2f\x70\
-\x6e\x67\x3b\x62\x61\x73\x65\x36\x34\x2c\x69\x56\x42\x4f\x52\x77\
-\x30\x4b\x47\x67\x6f\x41\x41\x41\x41\x4e\x53\x55\x68\x45\x55\x67\
-\x41\x41\x41\x4f\x45\x41\x41\x41\x46\x65\x43\x41\x59\x41\x41\x41\
-\x42\x7a\x57\x48\x68\x75\x41\x41\x41\x41\x42\x48\x4e\x43\x53\x56\
-\x51\x49\x43\x41\x67\x49\x66\x41\x68\x6b\x69\x41\x41\x41\x49\x41\
-\x42\x4a\x52\x45\x46\x55\x20\x65\x4a\x79\x30\x76\x56\x65\x50\x4a\
-\x55\x6c\x32\x4a\x76\x69\x5a\x63\x4c\x38\x36\x62\x6b\x53\x6b\x72\
-\x4f\x72\x71\x5a\x6b\x39\x50\x63\x77\x67\x4d\x73\x56\x68\x67\x4d\
-\x4c\x39\x67\x48\x78\x66\x59\x66\x7a\x33\x41\x76\x75\x77\x4c\x68\
-\x7a\x4d\x45\x39\x6d\x47\x35\x62\x46\x5a\x6c\x56\x61\x72\x49\x55\
-\x44\x65\x75\x20\x63\x44\x65\x78\x44\x38\x65\x4f\x4b\x58\x65\x2f\
-\x45\x64\x6e\x6b\x57\x69\x45\x72\x49\x6c\x79\x59\x6d\x7a\x68\x61\
-\x6d\x66\x6a\x66\x2f\x76\x66\x2f\x77\x79\x4d\x30\x49\x51\x54\x4f\
-\x4e\x65\x38\x39\x76\x4b\x66\x48\x70\x5a\x51\x51\x51\x73\x53\x2f\
-\x2b\x57\x66\x65\x6a\x78\x41\x43\x7a\x72\x6e\x52\x76\x74\x50\x7a\
-\x20\x48\x75\x66\x61\x57\x4c\x2f\x35\x57\x50\x7a\x45\x36\x33\x37\
-\x71\x52\x74\x57\x45\x47\x34\x34\x2f\x2f\x39\x73\x35\x6d\x33\x33\
-\x4c\x41\x38\x4b\x56\x39\x79\x32\x50\x54\x59\x61\x66\x69\x73\x62\
-\x70\x5a\x62\x45\x4f\x48\x74\x53\x50\x63\x36\x62\x6f\x7a\x33\x73\
-\x58\x76\x75\x4f\x71\x4d\x59\x69\x34\x66\x6c\x4a\x4b\x20\x53\x45\
-\x6c\x39\x30\x65\x39\x70\x37\x5a\x56\x6f\x34\x6a\x66\x47\x39\x73\
-\x39\x37\x4f\x35\x68\x54\x2f\x74\x4f\x42\x35\x2b\x6d\x4b\x66\x39\
-\x5a\x61\x57\x47\x75\x7a\x50\x61\x65\x66\x6f\x75\x72\x4c\x57\x54\
-\x38\x4f\x4e\x34\x4b\x2f\x59\x61\x73\x62\x72\x6e\x77\x73\x6a\x48\
-\x2b\x79\x65\x56\x48\x4d\x6a\x62\x2f\x4c\x20\x31\x2f\x4b\x2f\x70\
-\x5a\x51\x46\x6a\x41\x6f\x68\x34\x45\x57\x35\x72\x30\x36\x57\x36\
-\x79\x78\x74\x36\x72\x66\x38\x78\x2f\x74\x46\x7a\x33\x74\x52\x7a\
-\x6a\x73\x4f\x7a\x77\x37\x68\x65\x78\x72\x57\x41\x59\x58\x79\x6e\
-\x6f\x57\x41\x6e\x6e\x6f\x34\x62\x33\x57\x6e\x4e\x54\x4b\x63\x61\
-\x31\x4f\x49\x6e\x61\x34\x4c\x20\x50\x49\x65\x49\x4c\x2b\x6e\x76\
-\x4a\x57\x32\x55\x59\x45\x78\x63\x35\x37\x2f\x7a\x44\x51\x32\x2f\
-\x46\x50\x65\x6c\x6c\x46\x6c\x50\x34\x39\x2f\x6a\x32\x32\x4f\x41\
-\x59\x6b\x77\x4a\x46\x41\x55\x41\x65\x56\x38\x41\x34\x50\x6a\x63\
-\x48\x59\x52\x51\x5a\x2b\x64\x62\x74\x37\x78\x76\x56\x45\x43\x64\
-\x6a\x78\x46\x49\x20\x78\x49\x47\x4a\x52\x55\x33\x31\x65\x50\x34\
-\x76\x4a\x58\x72\x66\x32\x32\x72\x6b\x34\x7a\x61\x32\x5a\x30\x4e\
-\x43\x42\x6a\x6a\x76\x4a\x75\x46\x56\x2b\x6e\x53\x74\x33\x75\x64\
-\x69\x36\x34\x53\x41\x6e\x34\x44\x52\x6c\x2b\x42\x47\x73\x62\x2f\
-\x56\x48\x49\x54\x53\x4a\x52\x4b\x2b\x70\x44\x32\x48\x42\x44\x58\
-\x41\x20\x52\x47\x72\x6c\x35\x66\x42\x5a\x79\x5a\x4f\x66\x37\x76\
-\x4d\x38\x45\x76\x75\x49\x45\x2f\x58\x69\x54\x79\x30\x38\x41\x31\
-\x39\x61\x2b\x43\x45\x46\x6d\x2b\x4b\x2b\x39\x48\x73\x41\x4f\x6d\
-\x47\x4c\x65\x61\x56\x58\x69\x47\x73\x77\x30\x6e\x6c\x50\x32\x79\
-\x65\x51\x31\x6f\x4f\x75\x45\x31\x41\x72\x70\x65\x4a\x59\x20\x57\
-\x47\x70\x34\x62\x6b\x32\x47\x59\x2b\x50\x33\x6e\x6e\x31\x6c\x38\
-\x4b\x34\x55\x51\x79\x51\x71\x75\x55\x33\x67\x6d\x43\x35\x63\x7a\
-\x77\x43\x4c\x31\x6c\x49\x57\x77\x4f\x61\x5a\x30\x2f\x6d\x70\x76\
-\x57\x4d\x34\x63\x43\x50\x33\x58\x74\x61\x47\x65\x35\x69\x75\x44\
-\x58\x35\x48\x69\x56\x7a\x53\x4a\x54\x67\x55\x20\x51\x67\x44\x43\
-\x6a\x2b\x36\x33\x45\x41\x72\x65\x4f\x34\x6a\x41\x53\x66\x4f\x5a\
-\x54\x4d\x46\x48\x33\x55\x6f\x63\x43\x4f\x4f\x70\x34\x46\x49\x41\
-\x4c\x30\x50\x43\x66\x46\x4a\x6a\x41\x36\x6b\x48\x4d\x30\x59\x64\
-\x61\x67\x41\x68\x4b\x69\x77\x41\x31\x4f\x4c\x4b\x2b\x45\x54\x47\
-\x4b\x4f\x31\x4c\x75\x57\x4a\x4f\x20\x2b\x66\x4f\x4e\x41\x77\x67\
-\x35\x63\x72\x46\x6d\x2b\x4f\x36\x51\x65\x44\x43\x53\x43\x43\x48\
-\x67\x58\x64\x6c\x33\x47\x70\x63\x59\x57\x52\x4d\x48\x6f\x42\x54\
-\x68\x6d\x5a\x4d\x34\x35\x79\x61\x4a\x41\x37\x30\x2f\x4c\x6e\x4a\
-\x2b\x6a\x32\x51\x77\x39\x6d\x78\x2b\x4a\x58\x48\x31\x6e\x44\x4f\
-\x6d\x73\x54\x6e\x6e\x20\x43\x6e\x48\x55\x65\x77\x38\x2f\x77\x4b\
-\x58\x76\x6b\x56\x54\x6b\x73\x77\x41\x39\x74\x53\x2b\x31\x78\x48\
-\x44\x75\x32\x62\x7a\x76\x4d\x58\x46\x32\x62\x45\x33\x54\x50\x31\
-\x6d\x49\x34\x66\x55\x59\x58\x73\x4b\x55\x6d\x46\x68\x4e\x76\x66\
-\x73\x73\x45\x74\x59\x41\x4e\x6a\x57\x35\x2b\x76\x65\x63\x38\x34\
-\x32\x39\x20\x2b\x35\x49\x4a\x50\x4e\x63\x59\x43\x59\x42\x53\x72\
-\x4b\x7a\x48\x55\x69\x36\x69\x6a\x2f\x2b\x45\x41\x45\x52\x46\x6b\
-\x66\x50\x35\x31\x72\x70\x49\x67\x57\x52\x65\x68\x64\x2b\x54\x6f\
-\x4f\x49\x42\x49\x69\x7a\x4d\x42\x66\x68\x54\x41\x4f\x42\x74\x4e\
-\x71\x59\x4d\x67\x41\x5a\x72\x6b\x63\x54\x7a\x4d\x58\x45\x30\x20\
-\x58\x37\x4a\x61\x35\x7a\x6d\x2f\x6e\x6d\x4a\x30\x66\x58\x69\x58\
-\x76\x41\x65\x63\x38\x35\x42\x53\x42\x4f\x4c\x41\x68\x45\x51\x6c\
-\x42\x4d\x7a\x45\x56\x2b\x62\x61\x6b\x44\x35\x66\x55\x6b\x54\x6c\
-\x43\x57\x77\x54\x53\x4f\x74\x4b\x6a\x64\x64\x37\x69\x72\x69\x4e\
-\x53\x7a\x48\x6e\x69\x45\x2b\x4e\x69\x41\x58\x43\x20\x6a\x55\x68\
-\x4b\x59\x77\x79\x6b\x33\x75\x64\x63\x4c\x47\x65\x70\x61\x78\x53\
-\x4f\x34\x32\x7a\x71\x74\x5a\x65\x44\x70\x36\x5a\x45\x61\x76\x30\
-\x53\x31\x6a\x72\x46\x68\x66\x49\x4a\x66\x38\x2b\x37\x2b\x54\x30\
-\x68\x76\x34\x2b\x62\x6e\x62\x76\x2b\x55\x6b\x70\x61\x62\x43\x41\
-\x71\x5a\x4b\x32\x52\x39\x35\x6e\x76\x20\x35\x76\x6f\x54\x69\x57\
-\x76\x50\x55\x47\x62\x68\x49\x2f\x63\x46\x41\x46\x64\x78\x61\x4a\
-\x4c\x34\x45\x69\x44\x55\x77\x4d\x5a\x2f\x6a\x74\x2b\x62\x58\x6b\
-\x73\x2f\x49\x52\x36\x4f\x69\x58\x43\x4d\x64\x4d\x77\x5a\x75\x57\
-\x39\x48\x4d\x75\x6b\x6f\x6f\x55\x72\x6a\x48\x2b\x71\x4d\x4a\x51\
-\x4c\x55\x33\x78\x30\x62\x20\x36\x7a\x67\x79\x6a\x73\x48\x61\x41\
-\x4f\x6c\x51\x49\x64\x79\x49\x4c\x6c\x63\x67\x4c\x49\x5a\x72\x6c\
-\x38\x38\x72\x47\x68\x61\x48\x77\x79\x7a\x58\x6f\x4a\x70\x58\x56\
-\x46\x76\x4f\x63\x50\x4c\x49\x43\x63\x38\x68\x79\x64\x6a\x41\x36\
-\x34\x2f\x48\x36\x7a\x35\x74\x32\x4e\x6a\x48\x4a\x38\x58\x5a\x45\
-\x56\x31\x78\x20\x71\x75\x58\x63\x4c\x6e\x4b\x61\x6b\x62\x37\x50\
-\x7a\x57\x48\x77\x72\x4e\x41\x45\x50\x4d\x49\x69\x35\x78\x62\x43\
-\x35\x58\x70\x6e\x76\x76\x6b\x35\x55\x76\x6f\x6f\x4a\x73\x62\x31\
-\x63\x44\x6c\x68\x79\x4e\x63\x6f\x62\x4c\x53\x6f\x69\x51\x41\x4b\
-\x41\x49\x37\x4c\x4d\x6b\x4b\x35\x47\x51\x6d\x4c\x74\x52\x55\x75\
-\x20\x58\x71\x66\x75\x31\x65\x42\x39\x48\x6d\x73\x31\x38\x65\x4a\
-\x36\x76\x53\x34\x31\x38\x73\x52\x6e\x66\x4c\x41\x59\x4f\x75\x70\
-\x42\x79\x4b\x47\x4f\x64\x68\x36\x6d\x53\x69\x50\x53\x63\x31\x74\
-\x33\x54\x68\x31\x35\x69\x59\x51\x6c\x67\x6d\x54\x69\x68\x43\x76\
-\x32\x4d\x63\x45\x66\x37\x51\x6e\x6b\x45\x4d\x6d\x70\x20\x72\x79\
-\x44\x78\x5a\x47\x70\x54\x51\x66\x68\x35\x50\x6c\x47\x51\x71\x64\
-\x5a\x78\x52\x4a\x4c\x4b\x78\x2b\x34\x78\x67\x59\x52\x54\x43\x46\
-\x4e\x54\x77\x48\x49\x68\x7a\x6e\x4f\x4e\x73\x57\x76\x50\x62\x31\
-\x69\x74\x33\x4c\x37\x38\x47\x32\x4d\x36\x77\x7a\x6c\x4f\x45\x47\
-\x58\x2f\x2b\x4a\x31\x68\x50\x7a\x6b\x53\x20\x78\x6a\x56\x78\x6e\
-\x72\x67\x62\x39\x79\x50\x46\x59\x4a\x31\x71\x55\x66\x59\x63\x68\
-\x57\x64\x4f\x4f\x4c\x30\x57\x31\x66\x50\x56\x2f\x65\x63\x34\x2b\
-\x33\x4f\x74\x58\x75\x39\x61\x4e\x47\x4d\x71\x45\x57\x6d\x6e\x6d\
-\x4f\x37\x7a\x72\x2f\x6e\x2b\x32\x48\x6a\x47\x69\x4f\x63\x59\x67\
-\x5a\x69\x53\x48\x73\x61\x6b\x20\x76\x56\x71\x45\x72\x51\x6e\x36\
-\x4f\x52\x67\x62\x71\x67\x2f\x66\x50\x33\x37\x75\x52\x30\x6f\x35\
-\x6a\x6f\x52\x54\x73\x6d\x76\x2b\x34\x6e\x42\x77\x4c\x6c\x49\x42\
-\x6f\x70\x6a\x6a\x37\x44\x67\x48\x78\x6a\x46\x71\x65\x34\x35\x39\
-\x31\x2f\x66\x50\x69\x63\x41\x35\x41\x49\x32\x31\x2f\x44\x71\x4e\
-\x49\x33\x43\x5a\x20\x51\x50\x47\x53\x32\x4d\x63\x75\x42\x59\x61\
-\x2f\x4d\x48\x34\x76\x53\x5a\x2b\x55\x6f\x74\x68\x45\x37\x72\x73\
-\x6d\x47\x45\x4b\x4f\x6a\x31\x64\x6e\x31\x6c\x48\x6d\x6d\x4a\x37\
-\x2f\x53\x37\x4a\x62\x31\x6e\x6b\x32\x54\x2b\x63\x4b\x31\x63\x4e\
-\x37\x44\x37\x44\x56\x4e\x6a\x7a\x72\x67\x37\x39\x79\x69\x6d\x6a\
-\x57\x20\x51\x44\x53\x32\x76\x6b\x71\x70\x36\x44\x38\x6b\x44\x69\
-\x69\x68\x46\x4f\x32\x66\x73\x66\x30\x6f\x6f\x65\x50\x35\x52\x31\
-\x32\x79\x36\x68\x73\x2b\x69\x4c\x78\x61\x44\x76\x61\x4b\x78\x55\
-\x51\x65\x5a\x39\x32\x6d\x59\x4b\x42\x65\x33\x33\x78\x63\x45\x68\
-\x4c\x65\x2b\x63\x4a\x61\x4b\x6f\x56\x4d\x34\x71\x6f\x50\x20\x42\
-\x42\x42\x70\x37\x55\x6f\x43\x79\x75\x73\x59\x31\x68\x55\x32\x37\
-\x68\x65\x33\x4d\x54\x39\x6c\x50\x76\x39\x69\x6e\x41\x47\x67\x76\
-\x50\x66\x6e\x44\x54\x4e\x54\x67\x44\x2b\x47\x4f\x41\x50\x41\x2b\
-\x77\x36\x71\x56\x32\x2f\x63\x4f\x65\x54\x4a\x6e\x78\x38\x62\x47\
-\x2f\x2b\x73\x78\x2f\x6b\x63\x39\x35\x79\x69\x20\x6d\x47\x4d\x74\
-\x6a\x56\x4f\x43\x2f\x48\x51\x76\x4d\x46\x7a\x56\x55\x6e\x41\x6c\
-\x70\x74\x53\x63\x73\x72\x34\x2b\x78\x74\x6e\x7a\x35\x33\x4e\x45\
-\x4b\x38\x63\x2b\x7a\x68\x6c\x71\x78\x42\x6a\x6a\x67\x50\x56\x34\
-\x68\x52\x41\x51\x4d\x75\x6c\x4a\x41\x4b\x43\x31\x6a\x67\x69\x61\
-\x72\x77\x33\x33\x6b\x2b\x75\x56\x20\x2b\x66\x66\x59\x67\x44\x4f\
-\x32\x33\x77\x79\x6b\x39\x48\x4e\x30\x57\x57\x4d\x37\x42\x79\x76\
-\x50\x37\x58\x39\x39\x76\x78\x7a\x6a\x65\x51\x36\x66\x49\x2f\x4f\
-\x55\x68\x4d\x61\x4d\x35\x68\x78\x33\x42\x53\x70\x78\x39\x4e\x79\
-\x67\x78\x7a\x6f\x36\x7a\x32\x6c\x63\x2f\x6b\x63\x32\x67\x2f\x4d\
-\x44\x79\x72\x2f\x31\x20\x6b\x6e\x74\x6a\x51\x48\x54\x75\x66\x74\
-\x31\x38\x6f\x48\x68\x4a\x71\x68\x4c\x35\x4d\x41\x76\x64\x6b\x50\
-\x6f\x4c\x31\x44\x41\x75\x2f\x50\x51\x34\x70\x39\x62\x77\x33\x4c\
-\x78\x79\x66\x2b\x49\x59\x45\x72\x4c\x6f\x47\x34\x46\x64\x56\x6e\
-\x31\x58\x75\x6e\x6d\x4f\x2f\x47\x4f\x69\x6d\x4a\x43\x35\x71\x67\
-\x46\x34\x20\x4e\x78\x53\x58\x2b\x5a\x31\x63\x41\x6b\x71\x52\x55\
-\x4b\x55\x56\x2f\x4a\x77\x55\x6b\x6a\x76\x32\x76\x51\x75\x63\x59\
-\x30\x71\x4e\x43\x61\x4c\x32\x4d\x79\x70\x6a\x4e\x76\x61\x58\x50\
-\x48\x6e\x2b\x6e\x51\x4b\x32\x47\x58\x79\x6e\x75\x67\x33\x72\x37\
-\x4a\x51\x72\x31\x6f\x69\x6b\x45\x66\x4a\x48\x31\x67\x51\x70\x20\
-\x62\x2f\x78\x74\x4a\x79\x5a\x30\x77\x6e\x50\x79\x39\x74\x51\x7a\
-\x65\x63\x66\x35\x2f\x53\x47\x6c\x47\x4f\x6f\x73\x59\x38\x6a\x2f\
-\x6b\x6b\x56\x39\x71\x61\x37\x77\x50\x66\x66\x7a\x4d\x59\x2f\x4e\
-\x61\x62\x67\x57\x43\x72\x35\x77\x50\x30\x79\x4d\x62\x57\x49\x36\
-\x67\x2b\x38\x7a\x6f\x32\x41\x78\x71\x6a\x43\x54\x20\x41\x79\x6b\
-\x63\x6a\x42\x58\x37\x38\x79\x36\x57\x65\x73\x37\x44\x50\x54\x70\
-\x50\x30\x57\x73\x70\x70\x59\x37\x38\x63\x57\x48\x75\x48\x48\x54\
-\x41\x55\x53\x73\x35\x64\x78\x78\x62\x77\x32\x54\x49\x4b\x4d\x66\
-\x2b\x76\x57\x32\x4b\x43\x37\x33\x30\x33\x62\x46\x35\x31\x75\x30\
-\x35\x54\x73\x59\x74\x6c\x78\x44\x79\x20\x35\x38\x63\x6b\x79\x72\
-\x7a\x76\x67\x54\x67\x36\x4a\x6d\x72\x79\x77\x2b\x4d\x62\x58\x4d\
-\x76\x38\x63\x68\x53\x77\x45\x79\x57\x76\x42\x31\x6f\x2b\x2f\x37\
-\x30\x55\x37\x62\x6c\x33\x6e\x68\x4d\x7a\x58\x52\x78\x58\x4d\x48\
-\x4c\x45\x52\x30\x74\x78\x4b\x4c\x37\x6e\x2b\x42\x6d\x4a\x63\x7a\
-\x36\x76\x51\x52\x41\x43\x20\x69\x31\x39\x54\x78\x6d\x42\x2f\x66\
-\x67\x37\x5a\x58\x36\x45\x66\x35\x70\x4b\x4b\x68\x78\x76\x48\x50\
-\x55\x57\x63\x4a\x6b\x57\x2f\x37\x48\x63\x50\x52\x35\x78\x2b\x45\
-\x49\x53\x51\x31\x49\x79\x63\x6f\x7a\x70\x72\x52\x34\x6c\x57\x7a\
-\x6a\x6e\x72\x65\x38\x51\x74\x32\x4c\x49\x73\x49\x39\x4c\x57\x34\
-\x34\x31\x6a\x20\x65\x69\x47\x43\x2f\x62\x58\x49\x6d\x48\x2f\x76\
-\x33\x2b\x74\x5a\x4a\x39\x4e\x38\x76\x50\x65\x51\x62\x6f\x67\x58\
-\x4c\x47\x46\x70\x61\x36\x63\x6a\x56\x75\x71\x4e\x47\x77\x66\x32\
-\x4d\x31\x51\x54\x77\x77\x32\x6f\x32\x30\x75\x75\x54\x33\x47\x6c\
-\x65\x70\x78\x54\x66\x62\x78\x6b\x63\x37\x35\x48\x64\x45\x78\x4e\
-\x20\x41\x72\x43\x6a\x2f\x59\x38\x42\x66\x50\x6a\x53\x32\x65\x39\
-\x4f\x66\x58\x2b\x73\x72\x35\x63\x38\x63\x32\x37\x74\x63\x6a\x46\
-\x37\x62\x4e\x78\x43\x6a\x42\x67\x57\x52\x50\x6b\x64\x4e\x74\x72\
-\x55\x2f\x52\x61\x69\x70\x35\x38\x32\x56\x76\x44\x58\x70\x5a\x51\
-\x46\x49\x73\x59\x31\x7a\x57\x30\x35\x49\x38\x52\x30\x20\x53\x67\
-\x31\x35\x53\x54\x74\x48\x6e\x46\x2f\x79\x7a\x6e\x50\x76\x54\x6a\
-\x31\x62\x37\x39\x4f\x4c\x6b\x48\x44\x73\x58\x2b\x71\x6f\x2f\x74\
-\x43\x55\x6f\x57\x4b\x63\x51\x2f\x37\x2f\x31\x63\x59\x41\x39\x71\
-\x2b\x6c\x6b\x6e\x6c\x6a\x62\x70\x2f\x6d\x7a\x7a\x6f\x59\x72\x31\
-\x64\x75\x54\x51\x4d\x47\x4d\x5a\x4b\x2b\x20\x47\x73\x65\x5a\x4a\
-\x5a\x6b\x53\x69\x34\x75\x78\x69\x48\x78\x64\x53\x62\x77\x38\x71\
-\x79\x4f\x4a\x45\x74\x43\x6a\x44\x76\x7a\x4d\x32\x69\x52\x78\x75\
-\x50\x79\x2b\x46\x41\x6f\x51\x67\x67\x4b\x6c\x34\x78\x69\x53\x72\
-\x67\x6d\x55\x67\x64\x58\x35\x32\x49\x51\x51\x73\x4d\x37\x42\x79\
-\x36\x42\x62\x43\x34\x6e\x73\x20\x74\x52\x41\x63\x63\x4a\x35\x51\
-\x76\x34\x53\x49\x50\x55\x2b\x49\x7a\x72\x52\x6f\x48\x48\x67\x35\
-\x37\x49\x79\x70\x57\x45\x34\x53\x58\x71\x67\x51\x45\x65\x58\x35\
-\x32\x31\x35\x41\x77\x7a\x6f\x34\x63\x57\x61\x54\x4d\x59\x32\x4d\
-\x39\x4d\x47\x58\x55\x34\x65\x58\x55\x75\x72\x36\x32\x61\x6e\x46\
-\x39\x6e\x37\x6f\x20\x4c\x70\x6e\x36\x31\x6b\x75\x41\x72\x42\x61\
-\x2f\x36\x50\x30\x63\x69\x55\x67\x45\x72\x64\x65\x6c\x35\x69\x7a\
-\x6e\x67\x47\x4f\x61\x34\x77\x36\x52\x34\x58\x76\x31\x6e\x66\x7a\
-\x5a\x4b\x66\x45\x54\x58\x73\x4c\x44\x6b\x70\x4e\x5a\x65\x41\x72\
-\x37\x71\x39\x4b\x7a\x7a\x76\x56\x66\x68\x34\x48\x6c\x58\x49\x2b\
-\x2f\x20\x78\x37\x6f\x69\x58\x35\x75\x53\x69\x67\x72\x52\x6c\x5a\
-\x6d\x65\x53\x50\x31\x4d\x5a\x6d\x67\x49\x44\x7a\x45\x5a\x39\x70\
-\x61\x79\x57\x74\x4c\x38\x2b\x51\x6d\x48\x55\x6f\x30\x34\x33\x7a\
-\x79\x47\x37\x6f\x58\x76\x61\x57\x4f\x36\x6f\x41\x64\x4b\x58\x56\
-\x6b\x6f\x61\x47\x64\x4e\x6d\x50\x79\x51\x63\x30\x67\x68\x20\x79\
-\x42\x63\x46\x77\x4d\x6c\x78\x4a\x46\x52\x4b\x52\x34\x70\x4b\x4b\
-\x67\x4e\x4e\x57\x73\x71\x70\x2f\x44\x5a\x66\x62\x63\x7a\x34\x42\
-\x48\x4a\x78\x71\x4a\x35\x55\x2f\x73\x77\x55\x55\x4e\x63\x62\x58\
-\x2b\x75\x69\x33\x43\x52\x37\x6e\x61\x4f\x4e\x49\x6b\x55\x42\x4f\
-\x70\x76\x53\x68\x49\x51\x50\x58\x45\x61\x41\x20\x67\x4b\x44\x51\
-\x48\x63\x66\x48\x35\x38\x4d\x37\x74\x64\x35\x56\x50\x4f\x50\x34\
-\x6e\x5a\x63\x68\x62\x62\x6f\x52\x48\x50\x4e\x65\x68\x6c\x63\x35\
-\x76\x43\x70\x7a\x32\x48\x74\x41\x5a\x57\x6c\x4f\x43\x51\x6b\x55\
-\x55\x58\x67\x48\x43\x43\x2f\x69\x48\x43\x45\x79\x48\x54\x6e\x6f\
-\x4e\x4d\x37\x58\x36\x78\x7a\x4d\x20\x38\x77\x49\x42\x5a\x73\x49\
-\x63\x4a\x63\x33\x46\x65\x31\x65\x45\x69\x75\x55\x41\x56\x79\x42\
-\x70\x34\x49\x37\x43\x43\x30\x68\x51\x76\x69\x54\x6e\x4c\x34\x72\
-\x67\x4b\x77\x55\x41\x6f\x55\x67\x76\x35\x2b\x74\x30\x4d\x59\x6d\
-\x70\x68\x49\x79\x53\x68\x35\x38\x69\x57\x49\x41\x42\x2f\x45\x43\
-\x34\x53\x49\x53\x38\x20\x6f\x33\x45\x71\x48\x53\x4b\x6d\x72\x4b\
-\x46\x6e\x68\x59\x64\x53\x46\x43\x39\x72\x6a\x49\x58\x6e\x2b\x51\
-\x65\x68\x77\x63\x57\x73\x43\x68\x58\x6d\x59\x77\x62\x4d\x77\x6a\
-\x6b\x48\x36\x53\x6c\x33\x30\x4e\x6d\x51\x71\x65\x4c\x6a\x6c\x70\
-\x44\x30\x45\x48\x70\x78\x50\x75\x69\x45\x51\x74\x52\x68\x7a\x47\
-\x6b\x53\x20\x63\x54\x49\x2b\x4a\x66\x4c\x6d\x53\x43\x54\x6c\x65\
-\x65\x43\x5a\x6f\x6f\x4a\x70\x55\x36\x64\x46\x68\x48\x2b\x4c\x2b\
-\x50\x6a\x76\x49\x58\x70\x4f\x36\x5a\x6b\x31\x74\x78\x70\x37\x74\
-\x75\x5a\x77\x4c\x78\x6e\x6a\x58\x36\x4f\x6a\x66\x45\x39\x4c\x65\
-\x6c\x61\x4b\x2f\x70\x45\x42\x6a\x39\x79\x45\x75\x46\x56\x7a\x20\
-\x4f\x59\x34\x49\x69\x6d\x4f\x74\x70\x43\x54\x57\x37\x63\x5a\x79\
-\x2b\x34\x70\x2b\x6d\x49\x69\x48\x32\x4f\x46\x63\x54\x79\x51\x47\
-\x51\x4e\x39\x6c\x2b\x4a\x52\x53\x49\x52\x45\x71\x46\x5a\x2f\x72\
-\x65\x34\x64\x47\x74\x35\x6a\x4e\x5a\x70\x6a\x4e\x5a\x6d\x6a\x62\
-\x46\x6d\x30\x37\x68\x31\x49\x4b\x53\x71\x6c\x6f\x20\x78\x54\x58\
-\x47\x77\x4a\x67\x4f\x66\x64\x2f\x6a\x65\x44\x7a\x69\x64\x44\x71\
-\x68\x4e\x79\x64\x30\x4a\x34\x50\x65\x64\x4e\x42\x53\x51\x57\x73\
-\x4e\x59\x77\x7a\x36\x76\x6f\x66\x57\x4f\x6b\x73\x7a\x73\x30\x68\
-\x71\x52\x79\x4a\x77\x4c\x34\x57\x78\x73\x58\x32\x4f\x33\x46\x34\
-\x49\x61\x47\x4f\x48\x35\x76\x58\x38\x20\x59\x35\x47\x43\x79\x54\
-\x4b\x6f\x6c\x2b\x2f\x78\x34\x74\x58\x49\x4f\x59\x5a\x51\x34\x7a\
-\x4b\x35\x34\x7a\x6b\x52\x76\x50\x70\x68\x46\x4d\x32\x2f\x70\x5a\
-\x30\x54\x5a\x63\x4d\x76\x6b\x32\x4a\x72\x67\x52\x54\x50\x66\x47\
-\x50\x36\x62\x78\x58\x36\x6d\x62\x62\x2b\x2f\x64\x76\x61\x39\x2b\
-\x58\x6c\x4a\x65\x75\x73\x20\x48\x33\x30\x37\x57\x56\x32\x70\x4b\
-\x55\x5a\x4f\x4c\x30\x4f\x53\x42\x49\x2b\x62\x77\x39\x68\x79\x65\
-\x41\x6a\x61\x6a\x68\x43\x41\x43\x4a\x45\x2f\x41\x32\x74\x34\x41\
-\x45\x41\x6b\x6f\x34\x31\x7a\x44\x67\x34\x4f\x51\x67\x6b\x6f\x71\
-\x65\x4e\x7a\x7a\x6a\x6c\x6f\x7a\x56\x55\x45\x42\x4b\x7a\x74\x59\
-\x65\x47\x68\x20\x74\x63\x5a\x79\x75\x63\x53\x73\x58\x65\x44\x71\
-\x34\x67\x70\x61\x74\x78\x46\x70\x63\x6a\x30\x58\x51\x47\x58\x73\
-\x53\x64\x66\x36\x76\x6f\x65\x31\x50\x52\x34\x66\x6e\x37\x44\x62\
-\x50\x65\x42\x34\x50\x4b\x4c\x72\x6a\x77\x43\x41\x74\x6d\x30\x42\
-\x41\x49\x66\x44\x45\x2b\x62\x7a\x4f\x51\x41\x56\x4f\x54\x4e\x6e\
-\x20\x78\x76\x4d\x53\x32\x5a\x48\x74\x45\x79\x49\x46\x44\x39\x5a\
-\x53\x45\x6b\x73\x61\x2b\x57\x76\x52\x4d\x46\x50\x71\x65\x57\x4e\
-\x69\x5a\x4e\x6b\x5a\x50\x38\x4e\x49\x6d\x45\x63\x47\x35\x41\x75\
-\x65\x44\x32\x7a\x73\x2b\x6c\x51\x37\x61\x31\x7a\x49\x32\x6c\x38\
-\x44\x78\x49\x57\x73\x50\x6f\x4a\x30\x59\x33\x72\x5a\x20\x56\x42\
-\x38\x76\x61\x55\x6c\x63\x50\x38\x2f\x70\x78\x71\x36\x4e\x68\x54\
-\x33\x56\x37\x35\x77\x7a\x54\x76\x78\x37\x45\x37\x54\x73\x4c\x2f\
-\x70\x2f\x78\x68\x6e\x35\x6e\x78\x43\x5a\x33\x7a\x43\x44\x6d\x33\
-\x45\x64\x6d\x69\x79\x73\x57\x68\x50\x79\x57\x65\x74\x67\x6a\x41\
-\x6e\x58\x47\x78\x4a\x52\x6e\x55\x54\x54\x20\x4e\x4e\x68\x65\x58\
-\x47\x46\x31\x73\x63\x46\x71\x74\x59\x72\x50\x43\x31\x66\x6d\x2f\
-\x74\x57\x74\x61\x5a\x72\x42\x75\x6e\x76\x76\x77\x76\x68\x6d\x57\
-\x43\x78\x57\x65\x50\x58\x71\x46\x51\x36\x48\x41\x32\x35\x76\x62\
-\x33\x42\x2f\x39\x77\x31\x64\x78\x38\x67\x34\x42\x79\x58\x6a\x54\
-\x6e\x50\x30\x37\x37\x30\x2b\x20\x75\x4a\x2b\x4c\x6f\x32\x50\x4b\
-\x63\x68\x49\x35\x4a\x54\x79\x53\x71\x4d\x45\x2f\x38\x34\x6b\x58\
-\x49\x6b\x72\x57\x61\x6b\x37\x4a\x7a\x30\x34\x43\x6c\x73\x67\x64\
-\x76\x43\x4d\x41\x39\x49\x4b\x73\x69\x39\x47\x2b\x6d\x63\x4e\x4f\
-\x36\x49\x62\x38\x33\x6e\x44\x44\x70\x67\x45\x63\x6d\x48\x62\x51\
-\x38\x75\x39\x70\x20\x4c\x47\x77\x74\x35\x63\x59\x53\x77\x44\x4e\
-\x47\x45\x65\x48\x50\x73\x75\x47\x6f\x6e\x33\x33\x6e\x76\x57\x46\
-\x37\x47\x55\x63\x74\x39\x78\x42\x52\x54\x38\x74\x31\x2f\x51\x4c\
-\x4a\x51\x6b\x59\x2b\x63\x64\x43\x6b\x56\x77\x6f\x6b\x77\x31\x72\
-\x2b\x76\x4e\x59\x61\x55\x6d\x6f\x59\x35\x2b\x41\x68\x63\x66\x33\
-\x36\x20\x46\x56\x61\x72\x44\x54\x61\x62\x44\x5a\x71\x6d\x69\x62\
-\x56\x76\x49\x49\x4b\x34\x6d\x51\x58\x55\x4f\x31\x38\x53\x65\x74\
-\x49\x35\x36\x33\x55\x4e\x4f\x72\x79\x51\x46\x49\x4a\x6e\x4c\x5a\
-\x70\x5a\x67\x36\x59\x68\x6b\x58\x61\x78\x57\x4f\x44\x54\x35\x39\
-\x39\x77\x65\x4e\x70\x68\x4e\x6d\x38\x44\x51\x5a\x43\x51\x20\x57\
-\x63\x55\x41\x41\x50\x44\x43\x51\x55\x70\x52\x66\x44\x4e\x66\x6f\
-\x31\x69\x37\x4a\x39\x79\x57\x76\x6b\x54\x45\x75\x49\x37\x4f\x51\
-\x64\x63\x41\x6d\x32\x64\x34\x6c\x38\x70\x30\x78\x6c\x49\x4c\x73\
-\x54\x52\x78\x6a\x33\x4e\x69\x33\x37\x2b\x48\x6e\x6a\x66\x57\x6e\
-\x68\x50\x72\x78\x72\x68\x62\x33\x70\x37\x6a\x20\x70\x4a\x4d\x63\
-\x4b\x2f\x76\x75\x6d\x44\x6a\x36\x6b\x72\x56\x34\x53\x58\x75\x4f\
-\x43\x34\x2b\x4c\x2b\x50\x2f\x2b\x2b\x75\x52\x59\x76\x2f\x6b\x34\
-\x63\x6a\x55\x6c\x46\x7a\x4d\x6a\x49\x63\x2f\x57\x5a\x45\x7a\x6b\
-\x64\x77\x34\x77\x78\x67\x4b\x77\x57\x4d\x78\x58\x65\x48\x4e\x39\
-\x68\x59\x75\x4c\x43\x79\x6a\x56\x20\x52\x44\x33\x57\x47\x67\x63\
-\x68\x4a\x4a\x51\x55\x73\x42\x37\x6f\x4f\x67\x4d\x6c\x5a\x4b\x47\
-\x7a\x31\x52\x4a\x5a\x62\x54\x53\x68\x63\x51\x48\x73\x53\x68\x4e\
-\x43\x77\x54\x6e\x41\x39\x51\x35\x61\x4e\x33\x6a\x39\x2b\x69\x32\
-\x61\x70\x73\x48\x48\x33\x7a\x35\x67\x74\x33\x75\x67\x65\x51\x6d\
-\x50\x4d\x61\x76\x71\x20\x46\x45\x79\x56\x38\x7a\x77\x50\x47\x30\
-\x49\x49\x36\x47\x53\x65\x6e\x73\x36\x45\x72\x35\x45\x77\x66\x30\
-\x61\x52\x68\x67\x6f\x76\x68\x6a\x70\x6a\x75\x63\x69\x75\x70\x41\
-\x43\x52\x4e\x51\x2b\x44\x39\x4d\x34\x43\x55\x63\x33\x4a\x73\x6d\
-\x79\x4e\x4b\x55\x51\x76\x32\x58\x2b\x52\x64\x6c\x42\x59\x38\x73\
-\x59\x34\x20\x64\x56\x78\x51\x4a\x4f\x41\x71\x52\x35\x76\x65\x7a\
-\x51\x6c\x58\x76\x75\x6e\x31\x47\x4e\x4c\x6d\x75\x4e\x6a\x52\x53\
-\x34\x6e\x55\x32\x62\x6d\x4e\x58\x42\x76\x71\x36\x47\x45\x38\x6d\
-\x61\x47\x78\x62\x6d\x4d\x69\x34\x7a\x6d\x57\x53\x76\x56\x59\x63\
-\x71\x37\x76\x34\x55\x4b\x47\x43\x52\x4f\x73\x65\x4d\x66\x62\x20\
-\x59\x6c\x30\x4d\x35\x51\x6c\x44\x4b\x6f\x33\x74\x78\x53\x55\x75\
-\x4c\x79\x2b\x78\x57\x6d\x30\x41\x41\x48\x33\x66\x67\x36\x33\x41\
-\x58\x6b\x6f\x34\x37\x34\x4d\x46\x4e\x75\x6d\x69\x51\x6b\x6e\x6b\
-\x76\x6c\x63\x48\x54\x35\x5a\x50\x2f\x6f\x61\x7a\x78\x5a\x35\x49\
-\x73\x4f\x70\x45\x2b\x71\x4f\x31\x48\x6c\x49\x43\x20\x6f\x6d\x31\
-\x67\x54\x41\x63\x46\x67\x65\x33\x32\x43\x73\x59\x59\x48\x4c\x73\
-\x54\x76\x44\x56\x5a\x52\x6f\x75\x49\x36\x77\x66\x6e\x6f\x38\x57\
-\x30\x58\x4e\x38\x61\x62\x6b\x49\x77\x68\x38\x6a\x79\x50\x41\x56\
-\x5a\x52\x61\x55\x6e\x34\x68\x54\x46\x30\x54\x6f\x56\x70\x39\x37\
-\x51\x50\x4c\x6d\x45\x52\x51\x67\x70\x20\x4a\x62\x77\x73\x52\x5a\
-\x43\x58\x41\x45\x6d\x70\x54\x30\x35\x2f\x38\x33\x73\x70\x2b\x72\
-\x6c\x76\x76\x66\x53\x64\x6d\x71\x4e\x50\x49\x53\x47\x76\x56\x30\
-\x31\x63\x6e\x75\x75\x37\x65\x67\x4c\x41\x2b\x57\x64\x65\x4d\x76\
-\x37\x6e\x70\x49\x43\x58\x50\x76\x38\x39\x6a\x64\x64\x43\x79\x53\
-\x61\x4b\x35\x4c\x57\x46\x20\x45\x79\x69\x54\x67\x2b\x6d\x6e\x67\
-\x76\x63\x6b\x34\x6e\x6e\x76\x6f\x5a\x54\x47\x5a\x72\x50\x46\x78\
-\x63\x55\x46\x5a\x72\x4e\x5a\x37\x41\x64\x65\x51\x4b\x76\x55\x74\
-\x78\x66\x70\x6d\x7a\x51\x48\x6d\x6b\x66\x58\x64\x59\x4f\x35\x52\
-\x59\x54\x4c\x2f\x49\x79\x78\x6e\x79\x71\x72\x52\x45\x71\x4e\x76\
-\x72\x64\x6f\x20\x6d\x67\x5a\x4e\x4d\x34\x4d\x7a\x48\x5a\x71\x6d\
-\x77\x57\x61\x7a\x78\x57\x61\x7a\x77\x65\x50\x39\x51\x33\x41\x6a\
-\x6a\x61\x74\x61\x55\x73\x6f\x6f\x63\x71\x59\x35\x6c\x75\x50\x4a\
-\x57\x34\x34\x72\x54\x68\x41\x4f\x61\x79\x69\x4a\x42\x47\x62\x68\
-\x5a\x58\x67\x49\x34\x6e\x45\x51\x51\x73\x42\x34\x42\x32\x56\x46\
-\x20\x4c\x4d\x73\x67\x48\x4f\x73\x44\x48\x74\x5a\x62\x6f\x69\x77\
-\x42\x77\x38\x47\x59\x58\x74\x55\x6c\x6e\x56\x71\x6f\x4a\x4d\x36\
-\x57\x75\x69\x4e\x7a\x33\x6a\x47\x64\x4d\x70\x2f\x73\x63\x2b\x41\
-\x30\x78\x52\x56\x71\x63\x61\x6e\x6f\x55\x35\x54\x47\x68\x6e\x4a\
-\x31\x79\x72\x35\x72\x4d\x61\x78\x75\x61\x51\x30\x6f\x20\x36\x4c\
-\x51\x32\x62\x76\x6a\x42\x74\x65\x45\x34\x38\x72\x35\x71\x4c\x69\
-\x73\x6c\x67\x6a\x51\x68\x52\x2b\x63\x53\x41\x53\x46\x52\x75\x7a\
-\x67\x58\x49\x63\x53\x67\x4a\x43\x42\x62\x55\x71\x49\x7a\x33\x49\
-\x2b\x4c\x64\x49\x4c\x2f\x46\x6f\x42\x78\x42\x41\x4e\x4b\x61\x37\
-\x43\x68\x54\x30\x6b\x46\x61\x32\x31\x57\x20\x48\x6b\x4a\x42\x53\
-\x52\x6c\x63\x42\x51\x35\x61\x74\x56\x69\x76\x56\x37\x68\x2b\x2f\
-\x53\x37\x74\x62\x57\x47\x76\x45\x4c\x41\x32\x4b\x7a\x41\x6c\x54\
-\x4f\x53\x71\x7a\x74\x71\x69\x4c\x49\x69\x31\x46\x71\x72\x52\x59\
-\x55\x39\x4c\x4e\x53\x70\x66\x51\x37\x5a\x74\x4a\x41\x4f\x4f\x68\
-\x4d\x6c\x73\x49\x6e\x31\x76\x20\x53\x4f\x68\x30\x44\x73\x76\x6c\
-\x45\x70\x65\x58\x6c\x39\x6a\x76\x6e\x75\x43\x63\x69\x66\x4d\x48\
-\x45\x68\x47\x51\x67\x69\x53\x4c\x66\x50\x31\x7a\x6d\x43\x6c\x67\
-\x6f\x36\x71\x31\x45\x32\x46\x52\x5a\x76\x6d\x45\x39\x57\x62\x58\
-\x45\x79\x67\x32\x74\x48\x6f\x6e\x46\x30\x4d\x6a\x59\x42\x65\x41\
-\x4d\x76\x51\x76\x20\x70\x6f\x45\x4f\x4c\x62\x4b\x35\x4c\x44\x31\
-\x46\x74\x61\x66\x30\x72\x75\x39\x70\x55\x38\x42\x66\x63\x38\x4f\
-\x70\x37\x33\x36\x76\x6e\x6c\x74\x7a\x43\x58\x6f\x58\x6f\x32\x74\
-\x39\x6a\x6c\x75\x4e\x63\x65\x71\x70\x63\x63\x53\x35\x52\x43\x53\
-\x73\x77\x39\x61\x6d\x75\x65\x4e\x7a\x78\x4d\x45\x48\x68\x47\x69\
-\x61\x20\x42\x73\x59\x59\x6e\x45\x34\x6e\x74\x47\x30\x4c\x4b\x53\
-\x57\x4a\x6b\x69\x44\x4c\x4a\x77\x42\x34\x4a\x33\x41\x36\x6e\x65\
-\x43\x63\x77\x2f\x62\x69\x43\x70\x65\x58\x6c\x32\x6a\x62\x4f\x52\
-\x78\x55\x2f\x45\x36\x65\x65\x63\x45\x59\x6d\x51\x6f\x53\x6d\x34\
-\x4b\x41\x4d\x78\x47\x31\x6c\x67\x68\x41\x64\x7a\x7a\x68\x20\x31\
-\x4a\x64\x63\x55\x53\x6d\x46\x30\x2b\x6b\x55\x78\x79\x79\x6c\x68\
-\x42\x49\x79\x2b\x67\x2b\x46\x45\x4a\x67\x76\x4e\x70\x42\x53\x34\
-\x6e\x67\x38\x6f\x6d\x30\x31\x4a\x41\x53\x4d\x6f\x55\x54\x6c\x35\
-\x58\x4b\x5a\x46\x56\x6f\x65\x72\x72\x45\x49\x59\x4a\x72\x66\x6e\
-\x35\x61\x49\x70\x75\x46\x56\x31\x78\x32\x6e\x20\x4c\x77\x54\x37\
-\x44\x75\x74\x63\x71\x4d\x57\x42\x6b\x75\x55\x50\x2f\x49\x58\x68\
-\x47\x5a\x65\x4a\x72\x6d\x4e\x63\x49\x31\x47\x6c\x61\x5a\x33\x77\
-\x48\x43\x49\x4f\x59\x7a\x4e\x48\x36\x70\x74\x57\x43\x44\x37\x47\
-\x61\x57\x6f\x45\x48\x48\x44\x77\x30\x52\x47\x51\x6a\x6a\x4f\x38\
-\x4e\x76\x7a\x39\x4f\x52\x46\x37\x20\x53\x67\x79\x65\x61\x73\x4e\
-\x6e\x4b\x77\x4c\x70\x41\x4f\x4b\x30\x7a\x45\x48\x44\x6a\x51\x6e\
-\x43\x6d\x76\x49\x49\x79\x33\x48\x57\x31\x50\x33\x63\x75\x48\x6c\
-\x2f\x6a\x54\x46\x77\x6c\x74\x77\x44\x6a\x45\x54\x47\x57\x4d\x78\
-\x6d\x43\x31\x78\x66\x58\x32\x4f\x78\x57\x4d\x42\x4c\x41\x61\x6b\
-\x55\x62\x4f\x66\x41\x20\x4e\x54\x6c\x6a\x62\x64\x4f\x38\x37\x35\
-\x43\x35\x4c\x37\x79\x48\x4e\x53\x5a\x61\x52\x37\x76\x75\x46\x4a\
-\x48\x61\x57\x67\x74\x6a\x44\x43\x77\x49\x4d\x5a\x56\x53\x30\x47\
-\x31\x54\x75\x44\x34\x69\x33\x50\x71\x45\x6b\x41\x49\x53\x58\x37\
-\x37\x65\x6f\x57\x6b\x61\x74\x45\x30\x44\x72\x53\x55\x75\x31\x6b\
-\x73\x6f\x20\x52\x59\x67\x36\x6e\x38\x38\x6a\x33\x44\x70\x72\x4a\
-\x39\x65\x41\x34\x6c\x56\x38\x32\x47\x77\x35\x51\x45\x67\x50\x41\
-\x49\x4c\x73\x44\x36\x34\x4f\x74\x78\x4d\x42\x43\x56\x39\x45\x64\
-\x54\x50\x71\x4d\x31\x54\x32\x68\x7a\x4a\x34\x7a\x49\x4f\x54\x5a\
-\x61\x72\x4b\x6d\x42\x55\x4e\x61\x61\x6a\x6c\x2b\x4b\x5a\x45\x20\
-\x30\x41\x70\x41\x7a\x72\x55\x70\x42\x42\x78\x37\x50\x30\x66\x41\
-\x5a\x35\x46\x77\x35\x4c\x50\x6e\x78\x64\x48\x78\x35\x38\x5a\x2b\
-\x48\x2b\x4f\x49\x35\x2b\x61\x61\x55\x2b\x4c\x36\x4f\x30\x49\x6d\
-\x35\x42\x49\x69\x49\x65\x56\x59\x59\x7a\x47\x7a\x2f\x76\x62\x55\
-\x4e\x77\x46\x41\x43\x6a\x4b\x67\x63\x49\x53\x4b\x20\x4d\x53\x51\
-\x32\x4b\x71\x58\x51\x64\x56\x31\x45\x38\x6c\x65\x76\x58\x75\x48\
-\x71\x36\x67\x72\x65\x2b\x32\x6a\x32\x4a\x32\x75\x6e\x67\x6e\x4d\
-\x47\x31\x72\x4c\x49\x54\x75\x50\x6f\x2b\x35\x34\x51\x71\x7a\x39\
-\x46\x35\x2f\x72\x70\x64\x45\x4c\x66\x39\x78\x53\x4e\x59\x79\x32\
-\x73\x64\x31\x42\x43\x77\x6e\x70\x48\x20\x66\x73\x54\x31\x42\x74\
-\x35\x37\x74\x49\x73\x35\x49\x62\x71\x6f\x34\x6a\x52\x42\x33\x49\
-\x73\x52\x53\x77\x6f\x46\x53\x49\x57\x2b\x37\x39\x47\x66\x4f\x6e\
-\x7a\x39\x2b\x68\x6d\x66\x66\x75\x76\x77\x2b\x39\x2f\x2f\x68\x50\
-\x56\x36\x43\x57\x50\x37\x4f\x4b\x59\x45\x38\x32\x6d\x74\x61\x4c\
-\x31\x71\x47\x44\x33\x50\x20\x52\x45\x53\x6c\x51\x48\x6b\x38\x55\
-\x39\x34\x69\x37\x2b\x51\x63\x4a\x65\x53\x57\x63\x38\x4f\x36\x54\
-\x6d\x55\x4f\x59\x4c\x6c\x34\x6d\x6c\x35\x2f\x75\x66\x68\x48\x6a\
-\x30\x73\x51\x39\x36\x77\x34\x45\x59\x74\x62\x5a\x2f\x79\x4a\x59\
-\x32\x4c\x31\x46\x50\x4b\x4e\x7a\x62\x4e\x34\x4e\x37\x65\x4f\x56\
-\x54\x42\x4c\x20\x51\x46\x39\x61\x59\x48\x30\x39\x7a\x7a\x48\x39\
-\x4d\x2f\x39\x57\x47\x73\x43\x6f\x4f\x4a\x73\x59\x48\x41\x39\x6b\
-\x33\x43\x6f\x72\x52\x42\x70\x6a\x73\x5a\x35\x78\x48\x61\x73\x4a\
-\x49\x54\x66\x39\x45\x66\x41\x55\x66\x51\x72\x2b\x70\x67\x44\x54\
-\x56\x59\x37\x39\x6c\x4a\x4a\x69\x4a\x66\x75\x2b\x78\x33\x4b\x35\
-\x20\x78\x75\x76\x58\x72\x7a\x46\x62\x4c\x4e\x45\x48\x66\x64\x46\
-\x42\x77\x42\x74\x43\x6e\x4e\x4f\x70\x68\x77\x68\x79\x33\x65\x6c\
-\x30\x77\x4f\x46\x77\x77\x4f\x6c\x30\x69\x70\x4c\x55\x34\x57\x6b\
-\x66\x64\x55\x73\x4f\x68\x5a\x4e\x53\x59\x74\x36\x30\x30\x4c\x4d\
-\x57\x43\x67\x4b\x72\x43\x78\x49\x70\x70\x56\x59\x77\x20\x70\x67\
-\x65\x55\x6a\x4e\x78\x52\x4b\x49\x49\x31\x46\x62\x4a\x4e\x67\x6e\
-\x32\x55\x2f\x67\x6b\x42\x61\x33\x72\x4d\x47\x6f\x31\x47\x53\x66\
-\x7a\x77\x34\x33\x76\x38\x38\x70\x64\x2f\x4a\x62\x46\x56\x53\x6a\
-\x7a\x74\x6a\x6c\x48\x48\x54\x66\x56\x6a\x79\x76\x55\x65\x57\x4a\
-\x63\x5a\x53\x53\x74\x59\x69\x4e\x4a\x43\x20\x39\x6a\x77\x62\x64\
-\x43\x61\x52\x73\x42\x59\x58\x7a\x31\x48\x50\x73\x57\x75\x52\x69\
-\x32\x57\x4b\x62\x2b\x45\x33\x47\x73\x6c\x2b\x79\x4e\x2b\x62\x6b\
-\x71\x32\x6a\x76\x6f\x70\x78\x77\x44\x38\x33\x6e\x2b\x65\x34\x7a\
-\x74\x69\x39\x2f\x48\x76\x46\x2f\x66\x43\x61\x71\x30\x70\x51\x35\
-\x32\x4e\x2f\x4b\x66\x45\x36\x20\x4e\x35\x36\x63\x6b\x68\x66\x6a\
-\x79\x58\x53\x6a\x30\x45\x50\x78\x49\x2f\x61\x56\x55\x58\x41\x68\
-\x45\x4c\x49\x6d\x58\x6d\x34\x68\x48\x5a\x4d\x63\x53\x4f\x66\x6e\
-\x38\x66\x6b\x51\x66\x5a\x4b\x6b\x6f\x64\x50\x70\x42\x41\x47\x46\
-\x79\x38\x74\x4c\x58\x46\x2b\x2f\x4c\x6b\x52\x61\x61\x79\x31\x6d\
-\x73\x78\x6d\x45\x20\x55\x48\x68\x38\x66\x41\x54\x67\x73\x44\x38\
-\x38\x34\x65\x6e\x70\x4b\x55\x62\x4b\x57\x4f\x4e\x67\x75\x67\x35\
-\x64\x52\x7a\x47\x64\x41\x4f\x6d\x57\x73\x39\x6b\x4d\x6a\x56\x52\
-\x52\x56\x4a\x7a\x4e\x5a\x70\x6a\x50\x35\x33\x6a\x33\x37\x68\x31\
-\x75\x62\x32\x39\x78\x76\x33\x73\x4d\x41\x65\x45\x43\x78\x37\x36\
-\x44\x20\x31\x68\x72\x57\x63\x77\x77\x72\x4a\x32\x6d\x58\x31\x6d\
-\x77\x79\x31\x72\x67\x59\x43\x72\x66\x64\x62\x76\x48\x35\x38\x30\
-\x64\x49\x38\x51\x62\x33\x39\x2f\x63\x70\x30\x44\x78\x36\x41\x59\
-\x5a\x4d\x6f\x52\x54\x5a\x52\x56\x79\x66\x63\x31\x4b\x58\x45\x42\
-\x52\x71\x62\x67\x46\x6f\x76\x6c\x78\x76\x53\x58\x79\x4a\x20\x2f\
-\x59\x69\x75\x46\x44\x58\x50\x62\x56\x6f\x75\x72\x6b\x71\x41\x52\
-\x4e\x4b\x52\x2b\x69\x54\x6e\x2b\x71\x6c\x62\x69\x6f\x34\x58\x78\
-\x59\x2b\x7a\x37\x34\x7a\x6f\x66\x50\x56\x59\x38\x39\x2b\x6e\x4f\
-\x4b\x4c\x33\x50\x75\x72\x45\x73\x65\x39\x49\x38\x57\x69\x44\x30\
-\x37\x50\x6a\x49\x6d\x53\x2b\x63\x57\x4e\x49\x20\x50\x73\x57\x46\
-\x78\x35\x43\x31\x6c\x41\x69\x53\x39\x5a\x57\x41\x6a\x43\x2b\x48\
-\x2b\x69\x30\x67\x58\x32\x7a\x4a\x52\x52\x57\x69\x36\x43\x64\x4a\
-\x52\x4d\x30\x50\x52\x79\x6e\x32\x6a\x79\x57\x4b\x41\x41\x64\x4f\
-\x70\x50\x55\x76\x78\x2b\x4a\x69\x31\x54\x6f\x70\x4a\x52\x62\x7a\
-\x4a\x56\x36\x2f\x66\x67\x31\x48\x20\x5a\x65\x59\x69\x6c\x31\x53\
-\x71\x77\x64\x50\x54\x41\x66\x76\x39\x45\x63\x34\x5a\x50\x44\x7a\
-\x65\x77\x6e\x73\x62\x52\x63\x37\x2b\x65\x49\x4a\x7a\x51\x4b\x4d\
-\x30\x35\x6d\x30\x4c\x48\x66\x78\x35\x4f\x67\x52\x70\x4c\x2b\x63\
-\x4c\x72\x46\x59\x72\x72\x46\x59\x72\x74\x47\x32\x4c\x31\x36\x39\
-\x66\x51\x32\x71\x46\x20\x32\x39\x76\x37\x71\x43\x39\x4b\x72\x2b\
-\x43\x73\x68\x78\x4d\x2b\x5a\x71\x6e\x59\x67\x49\x52\x53\x61\x67\
-\x67\x68\x49\x62\x32\x67\x6e\x45\x63\x4a\x57\x4e\x74\x44\x4b\x59\
-\x47\x2b\x74\x37\x69\x38\x76\x4d\x41\x76\x76\x7a\x7a\x67\x36\x39\
-\x65\x76\x32\x4f\x31\x32\x63\x63\x31\x45\x4e\x6c\x38\x68\x52\x4b\
-\x71\x79\x20\x35\x38\x62\x7a\x63\x53\x4e\x59\x79\x4d\x72\x34\x6c\
-\x51\x41\x6e\x39\x71\x32\x6c\x47\x49\x66\x6d\x6d\x75\x70\x47\x47\
-\x66\x67\x46\x65\x6c\x6a\x65\x70\x6c\x77\x4d\x35\x37\x35\x54\x54\
-\x45\x5a\x55\x6b\x38\x6a\x65\x67\x33\x41\x44\x47\x62\x74\x2b\x62\
-\x2b\x72\x65\x71\x4e\x35\x33\x42\x67\x6c\x64\x64\x59\x33\x57\x20\
-\x63\x71\x54\x6b\x59\x4e\x57\x47\x46\x61\x6a\x50\x49\x2f\x37\x4c\
-\x4a\x59\x35\x67\x4c\x71\x2f\x43\x35\x67\x59\x36\x68\x38\x2b\x4a\
-\x52\x47\x35\x34\x47\x66\x33\x4d\x6f\x4e\x56\x37\x58\x2b\x68\x47\
-\x48\x6c\x42\x43\x77\x41\x5a\x70\x6f\x4f\x73\x4d\x42\x42\x53\x75\
-\x4c\x6c\x39\x68\x75\x37\x32\x43\x45\x34\x41\x50\x20\x68\x68\x4d\
-\x6d\x46\x6f\x66\x44\x45\x2f\x61\x37\x48\x59\x36\x48\x44\x74\x62\
-\x31\x4d\x4f\x61\x45\x6b\x7a\x6b\x46\x58\x56\x4b\x68\x30\x52\x70\
-\x4b\x4e\x57\x54\x46\x68\x45\x54\x62\x7a\x6a\x46\x76\x5a\x31\x69\
-\x76\x4c\x33\x42\x35\x65\x59\x6c\x58\x56\x39\x65\x34\x75\x72\x72\
-\x43\x61\x72\x34\x43\x46\x47\x43\x39\x20\x77\x59\x66\x66\x66\x73\
-\x58\x44\x77\x30\x50\x77\x2b\x66\x57\x41\x45\x32\x69\x55\x77\x71\
-\x6e\x72\x59\x67\x79\x72\x38\x46\x54\x4d\x55\x6b\x6f\x69\x46\x6c\
-\x59\x6f\x77\x44\x70\x49\x4a\x77\x49\x43\x39\x70\x42\x53\x6f\x32\
-\x31\x6d\x65\x50\x2f\x2b\x50\x66\x37\x79\x6c\x37\x39\x41\x43\x70\
-\x39\x6c\x2f\x46\x63\x71\x20\x55\x59\x52\x56\x46\x75\x64\x4c\x59\
-\x73\x78\x56\x46\x7a\x68\x66\x4d\x2b\x5a\x74\x78\x6b\x4a\x63\x34\
-\x53\x6b\x6e\x6f\x66\x6d\x55\x6d\x73\x48\x6d\x78\x2b\x77\x47\x36\
-\x74\x6a\x70\x70\x42\x63\x34\x6b\x52\x44\x4c\x5a\x34\x4d\x6a\x69\
-\x35\x4d\x71\x2f\x46\x43\x38\x69\x54\x4b\x59\x6b\x76\x6b\x37\x4c\
-\x4f\x4e\x54\x20\x78\x45\x4e\x34\x6c\x76\x32\x51\x53\x42\x71\x4a\
-\x6a\x2b\x49\x73\x73\x2f\x72\x53\x2f\x79\x67\x63\x69\x78\x72\x42\
-\x53\x68\x76\x56\x47\x4d\x35\x4e\x55\x2f\x46\x5a\x37\x7a\x30\x55\
-\x49\x37\x77\x76\x6e\x63\x67\x69\x63\x47\x33\x50\x43\x78\x79\x53\
-\x64\x7a\x6d\x33\x4c\x66\x44\x43\x2b\x45\x36\x4d\x68\x73\x2f\x38\
-\x20\x50\x7a\x54\x4f\x30\x6c\x2f\x6b\x66\x56\x4c\x6d\x77\x34\x76\
-\x78\x57\x53\x6b\x6c\x46\x55\x72\x69\x62\x5a\x73\x77\x57\x6b\x6b\
-\x70\x6f\x35\x39\x4a\x43\x42\x48\x71\x5a\x79\x4b\x49\x6c\x57\x52\
-\x6b\x36\x44\x70\x79\x4d\x69\x75\x6c\x41\x6b\x41\x68\x69\x65\x77\
-\x49\x69\x77\x6b\x66\x73\x74\x69\x44\x6e\x31\x63\x49\x20\x43\x42\
-\x4f\x56\x48\x50\x71\x75\x6f\x44\x33\x6e\x57\x45\x63\x62\x34\x30\
-\x2f\x44\x76\x73\x61\x35\x45\x48\x64\x77\x7a\x6c\x43\x56\x61\x61\
-\x46\x77\x4d\x69\x64\x63\x58\x4b\x79\x78\x32\x56\x36\x6a\x4d\x77\
-\x5a\x53\x4b\x2f\x53\x47\x58\x42\x69\x6e\x34\x77\x45\x50\x44\x77\
-\x38\x34\x37\x4a\x37\x67\x6a\x49\x55\x78\x20\x46\x73\x62\x30\x4f\
-\x4a\x37\x32\x6b\x45\x70\x68\x33\x73\x34\x68\x68\x41\x71\x68\x73\
-\x68\x49\x4b\x47\x6f\x76\x46\x41\x70\x76\x46\x42\x75\x39\x65\x76\
-\x38\x48\x37\x39\x7a\x2f\x69\x37\x65\x73\x33\x75\x46\x68\x74\x59\
-\x4b\x30\x6c\x59\x31\x43\x72\x63\x58\x2b\x38\x78\x39\x65\x76\x6e\
-\x38\x48\x4a\x31\x67\x78\x6a\x20\x7a\x6c\x6b\x30\x53\x73\x49\x35\
-\x57\x6c\x2f\x68\x69\x53\x6b\x35\x54\x37\x6d\x45\x41\x69\x35\x6b\
-\x52\x46\x48\x4f\x58\x36\x4e\x61\x65\x41\x65\x63\x6e\x49\x46\x71\
-\x35\x6e\x6a\x39\x37\x6a\x30\x2b\x2f\x66\x6f\x42\x53\x67\x74\x49\
-\x72\x57\x43\x74\x67\x56\x41\x41\x50\x43\x46\x6c\x49\x78\x76\x30\
-\x74\x6f\x38\x42\x20\x37\x4f\x43\x59\x31\x4c\x69\x42\x41\x6f\x43\
-\x6b\x6f\x43\x67\x70\x6b\x55\x4d\x31\x77\x78\x57\x66\x43\x4b\x56\
-\x7a\x4e\x62\x77\x41\x72\x70\x66\x71\x57\x69\x4a\x4d\x33\x69\x76\
-\x6b\x56\x44\x66\x6e\x59\x44\x56\x51\x46\x65\x38\x2f\x6b\x79\x56\
-\x51\x32\x7a\x47\x47\x55\x52\x6d\x6c\x61\x4a\x63\x33\x46\x73\x38\
-\x4b\x20\x58\x51\x62\x4a\x6d\x73\x68\x36\x61\x6a\x37\x65\x66\x4d\
-\x78\x6a\x34\x78\x37\x32\x56\x63\x2b\x78\x35\x50\x78\x35\x58\x70\
-\x30\x51\x41\x69\x6f\x72\x45\x4d\x73\x36\x45\x48\x74\x70\x61\x73\
-\x52\x6a\x61\x32\x50\x58\x64\x5a\x41\x68\x59\x4e\x6c\x61\x39\x72\
-\x33\x36\x6b\x48\x54\x71\x63\x54\x7a\x75\x6f\x62\x55\x4f\x20\x79\
-\x43\x63\x78\x6d\x38\x30\x47\x38\x36\x4a\x78\x70\x57\x2f\x7a\x75\
-\x6b\x76\x6b\x52\x72\x4a\x73\x58\x71\x67\x4e\x5a\x39\x78\x79\x46\
-\x63\x4b\x68\x56\x57\x33\x67\x5a\x41\x37\x72\x39\x51\x56\x57\x6d\
-\x77\x74\x34\x4c\x77\x42\x4a\x59\x39\x56\x61\x34\x2f\x37\x2b\x48\
-\x72\x76\x48\x42\x2f\x54\x48\x45\x37\x77\x6a\x20\x66\x36\x49\x33\
-\x4e\x50\x2b\x32\x62\x63\x6c\x76\x46\x7a\x49\x6d\x42\x43\x68\x6a\
-\x59\x72\x32\x34\x77\x4f\x58\x46\x46\x76\x2f\x68\x62\x2f\x36\x45\
-\x48\x39\x2b\x39\x78\x39\x56\x36\x47\x38\x51\x2f\x67\x55\x61\x31\
-\x55\x45\x4c\x6a\x59\x49\x37\x34\x64\x6e\x4f\x44\x34\x2f\x45\x49\
-\x47\x77\x67\x6b\x56\x37\x57\x50\x20\x65\x38\x61\x48\x77\x43\x4c\
-\x42\x74\x70\x4f\x43\x79\x74\x36\x37\x7a\x4b\x4c\x76\x41\x43\x2b\
-\x4a\x73\x30\x6b\x70\x4d\x4a\x38\x74\x63\x48\x46\x31\x69\x64\x33\
-\x44\x58\x56\x78\x48\x35\x79\x79\x30\x31\x68\x42\x51\x36\x45\x34\
-\x39\x32\x72\x59\x4e\x68\x70\x73\x45\x39\x77\x57\x4d\x78\x2f\x4b\
-\x59\x36\x65\x38\x43\x20\x31\x73\x4a\x39\x7a\x65\x58\x36\x34\x72\
-\x76\x52\x32\x6a\x63\x75\x30\x67\x32\x41\x4e\x66\x7a\x7a\x49\x6d\
-\x51\x55\x69\x35\x4c\x64\x35\x6f\x32\x51\x46\x59\x45\x4b\x42\x36\
-\x37\x6c\x53\x31\x6c\x62\x51\x71\x51\x48\x52\x44\x4b\x70\x35\x2b\
-\x36\x50\x55\x72\x51\x4e\x6e\x46\x57\x55\x33\x38\x7a\x76\x46\x33\
-\x6f\x4f\x20\x58\x2b\x57\x38\x75\x63\x6a\x4b\x2b\x44\x31\x65\x30\
-\x46\x49\x4d\x72\x6e\x39\x79\x53\x38\x37\x6c\x63\x6c\x31\x79\x76\
-\x56\x63\x70\x42\x54\x68\x42\x4a\x6e\x64\x76\x79\x70\x4e\x32\x51\
-\x36\x47\x6b\x48\x46\x45\x42\x6f\x4f\x39\x4d\x44\x49\x4b\x67\x38\
-\x43\x32\x67\x37\x79\x32\x6b\x56\x74\x42\x4e\x41\x79\x55\x62\x20\
-\x7a\x42\x53\x77\x32\x2b\x33\x67\x77\x4e\x6e\x78\x70\x4e\x64\x6f\
-\x37\x61\x4f\x54\x50\x50\x65\x6a\x6b\x6f\x35\x4f\x31\x4e\x69\x69\
-\x41\x68\x69\x67\x67\x49\x4d\x59\x46\x7a\x6c\x41\x77\x72\x4c\x43\
-\x58\x42\x36\x79\x74\x56\x36\x76\x4d\x5a\x2f\x50\x30\x66\x63\x57\
-\x51\x6c\x46\x30\x54\x48\x2f\x71\x73\x64\x38\x39\x20\x77\x58\x62\
-\x6b\x59\x6a\x44\x39\x43\x59\x66\x44\x41\x59\x74\x32\x51\x62\x6c\
-\x36\x4b\x76\x67\x56\x76\x51\x6b\x47\x6c\x77\x57\x57\x38\x77\x55\
-\x75\x56\x68\x65\x34\x75\x72\x72\x43\x75\x33\x66\x76\x4b\x49\x4e\
-\x43\x55\x79\x43\x33\x4d\x7a\x37\x6f\x69\x42\x72\x43\x43\x6e\x7a\
-\x36\x2b\x41\x57\x6e\x55\x7a\x2f\x59\x20\x39\x78\x53\x6d\x46\x74\
-\x62\x56\x70\x39\x2b\x39\x42\x33\x79\x49\x72\x47\x45\x33\x72\x2f\
-\x58\x73\x42\x2f\x53\x51\x55\x71\x46\x74\x57\x31\x78\x65\x58\x71\
-\x49\x2f\x48\x64\x44\x33\x78\x79\x43\x4e\x43\x4d\x42\x4c\x69\x6c\
-\x49\x53\x67\x46\x43\x55\x58\x5a\x46\x4c\x4f\x2b\x6d\x6e\x48\x31\
-\x6d\x37\x6f\x62\x45\x47\x20\x47\x43\x6c\x35\x4f\x50\x58\x43\x32\
-\x44\x31\x43\x42\x72\x62\x78\x6c\x4e\x66\x48\x64\x4c\x68\x61\x35\
-\x35\x4f\x67\x30\x43\x51\x55\x35\x7a\x63\x6b\x4d\x54\x59\x69\x35\
-\x6b\x68\x35\x38\x59\x69\x55\x61\x55\x61\x44\x4d\x65\x62\x39\x6a\
-\x63\x31\x6c\x61\x47\x45\x63\x42\x38\x79\x70\x4f\x5a\x7a\x54\x59\
-\x2f\x6c\x36\x20\x6a\x4f\x71\x41\x69\x67\x69\x58\x38\x75\x55\x55\
-\x2b\x74\x34\x43\x4b\x49\x2b\x6f\x42\x68\x43\x54\x56\x4b\x57\x55\
-\x61\x4e\x73\x57\x48\x48\x41\x38\x57\x38\x77\x68\x51\x4a\x62\x46\
-\x75\x37\x73\x48\x74\x47\x32\x4c\x78\x57\x49\x42\x42\x43\x75\x6c\
-\x74\x52\x61\x37\x33\x51\x37\x72\x39\x54\x70\x62\x4f\x31\x75\x45\
-\x20\x4a\x6b\x35\x78\x2f\x54\x44\x36\x77\x54\x72\x56\x37\x39\x42\
-\x37\x39\x4e\x4e\x61\x34\x72\x36\x4c\x35\x54\x78\x47\x7a\x6c\x6a\
-\x72\x6f\x45\x49\x53\x75\x48\x4d\x4f\x58\x64\x66\x42\x42\x44\x2b\
-\x66\x6b\x69\x43\x72\x35\x6d\x77\x65\x64\x47\x31\x36\x52\x6a\x63\
-\x4e\x6c\x73\x73\x6c\x46\x6f\x74\x6c\x4d\x66\x66\x46\x20\x59\x67\
-\x48\x76\x50\x55\x36\x6d\x78\x33\x49\x32\x68\x38\x6a\x63\x44\x37\
-\x76\x64\x44\x72\x76\x39\x45\x37\x77\x55\x55\x45\x4c\x42\x4f\x48\
-\x76\x32\x75\x4d\x73\x6f\x58\x68\x4e\x51\x78\x50\x32\x68\x4e\x54\
-\x44\x77\x6e\x67\x34\x47\x42\x52\x79\x61\x56\x6d\x4d\x32\x6d\x2b\
-\x48\x79\x38\x68\x49\x33\x4e\x31\x2f\x67\x20\x67\x79\x2b\x79\x37\
-\x32\x79\x55\x4e\x6f\x77\x78\x30\x4b\x71\x4f\x6a\x53\x31\x31\x2f\
-\x66\x45\x31\x4c\x74\x73\x41\x43\x53\x76\x6a\x54\x56\x51\x6b\x32\
-\x58\x70\x57\x46\x6f\x56\x69\x30\x56\x42\x52\x50\x47\x6e\x59\x48\
-\x53\x47\x6f\x37\x49\x56\x77\x4a\x41\x4a\x46\x61\x5a\x68\x31\x6d\
-\x62\x69\x52\x55\x56\x41\x50\x20\x6f\x6d\x4f\x79\x51\x74\x59\x49\
-\x4f\x42\x58\x6e\x61\x56\x6d\x33\x79\x64\x36\x4c\x34\x78\x66\x35\
-\x50\x4d\x70\x35\x52\x6e\x6f\x65\x46\x47\x2b\x4b\x66\x43\x6b\x58\
-\x37\x61\x79\x59\x7a\x4f\x75\x6c\x55\x6c\x51\x49\x36\x35\x79\x31\
-\x71\x45\x70\x69\x6c\x45\x66\x58\x64\x62\x44\x57\x52\x32\x52\x7a\
-\x7a\x67\x78\x71\x20\x73\x48\x44\x6d\x67\x65\x30\x4e\x30\x42\x73\
-\x53\x35\x78\x35\x33\x57\x4d\x78\x58\x61\x4a\x6f\x47\x6e\x7a\x35\
-\x2f\x68\x66\x63\x43\x71\x39\x55\x4b\x79\x2b\x57\x53\x34\x69\x5a\
-\x56\x53\x33\x71\x36\x6c\x46\x44\x61\x6f\x7a\x64\x48\x64\x4a\x31\
-\x42\x32\x2b\x72\x30\x2f\x55\x43\x59\x76\x65\x53\x31\x48\x51\x4a\
-\x49\x20\x4c\x74\x35\x48\x53\x53\x44\x6f\x2f\x79\x6e\x47\x6c\x66\
-\x4d\x79\x53\x56\x72\x77\x49\x63\x70\x6c\x76\x56\x68\x41\x43\x49\
-\x45\x75\x68\x4b\x76\x31\x66\x51\x4a\x43\x31\x75\x47\x73\x74\x57\
-\x68\x30\x67\x36\x5a\x70\x59\x71\x69\x59\x30\x41\x4c\x7a\x2b\x52\
-\x79\x72\x39\x55\x56\x77\x58\x63\x67\x51\x45\x64\x4e\x52\x20\x74\
-\x6e\x76\x58\x59\x58\x57\x78\x67\x41\x70\x45\x53\x45\x70\x41\x61\
-\x59\x33\x4f\x39\x50\x6a\x30\x36\x56\x4d\x6d\x54\x66\x68\x6f\x71\
-\x58\x52\x41\x31\x48\x31\x6a\x78\x53\x41\x43\x6b\x41\x48\x38\x2b\
-\x43\x43\x4a\x57\x57\x74\x70\x62\x53\x42\x68\x72\x59\x63\x77\x67\
-\x46\x49\x43\x36\x2f\x55\x61\x78\x2b\x4d\x65\x20\x75\x39\x31\x6a\
-\x50\x41\x76\x54\x65\x34\x2b\x6d\x6f\x56\x49\x59\x4f\x66\x46\x50\
-\x59\x6d\x61\x53\x45\x4e\x4f\x6e\x53\x38\x4e\x6d\x76\x75\x34\x36\
-\x41\x63\x77\x30\x74\x2b\x41\x50\x30\x2b\x5a\x6c\x4e\x38\x2b\x45\
-\x69\x49\x31\x78\x69\x5a\x70\x4c\x43\x69\x45\x67\x76\x53\x41\x72\
-\x32\x6f\x68\x4f\x78\x34\x4f\x74\x20\x7a\x38\x71\x72\x71\x55\x77\
-\x30\x43\x6b\x31\x79\x77\x2f\x46\x35\x35\x65\x4d\x59\x34\x39\x37\
-\x63\x66\x7a\x32\x33\x51\x68\x78\x46\x69\x73\x42\x67\x41\x77\x39\
-\x7a\x74\x62\x77\x65\x35\x37\x79\x64\x59\x62\x56\x61\x6f\x65\x73\
-\x4d\x48\x68\x34\x65\x36\x4e\x70\x38\x47\x66\x70\x79\x6b\x46\x4a\
-\x48\x4d\x53\x65\x66\x20\x64\x39\x75\x32\x65\x50\x2f\x2b\x50\x58\
-\x61\x50\x65\x39\x7a\x64\x33\x57\x47\x35\x58\x47\x4d\x32\x6d\x34\
-\x58\x59\x54\x49\x6d\x6d\x30\x58\x44\x4f\x51\x4f\x73\x57\x7a\x70\
-\x6b\x49\x34\x4e\x33\x70\x46\x42\x4a\x6b\x55\x7a\x4b\x78\x39\x79\
-\x6e\x30\x36\x68\x78\x39\x79\x63\x58\x39\x35\x39\x61\x55\x34\x7a\
-\x50\x70\x20\x57\x6d\x4a\x44\x70\x39\x4d\x4a\x55\x67\x4c\x4f\x57\
-\x41\x72\x57\x43\x6d\x4a\x35\x4a\x46\x69\x43\x39\x45\x55\x39\x49\
-\x77\x50\x4d\x62\x44\x59\x44\x36\x39\x52\x4b\x4b\x56\x6a\x76\x73\
-\x54\x38\x65\x63\x48\x50\x37\x44\x64\x76\x31\x4a\x6b\x67\x44\x36\
-\x62\x76\x57\x57\x6a\x7a\x73\x48\x73\x6b\x5a\x37\x79\x6c\x55\x20\
-\x7a\x41\x48\x78\x4f\x4f\x71\x59\x65\x46\x37\x74\x59\x64\x7a\x54\
-\x4b\x4c\x59\x43\x72\x4e\x50\x35\x77\x45\x41\x53\x30\x56\x64\x51\
-\x6b\x4c\x69\x34\x75\x41\x77\x45\x34\x56\x53\x63\x76\x52\x47\x7a\
-\x2b\x79\x73\x59\x6d\x35\x4b\x77\x70\x6a\x68\x6c\x77\x51\x6d\x4c\
-\x46\x36\x4e\x2f\x4b\x4e\x30\x44\x41\x46\x55\x63\x20\x66\x75\x6a\
-\x4a\x4f\x75\x6b\x39\x59\x75\x54\x46\x31\x4f\x5a\x6d\x33\x49\x37\
-\x37\x39\x53\x45\x44\x67\x4f\x50\x35\x49\x75\x55\x51\x49\x69\x34\
-\x6d\x6a\x36\x64\x47\x52\x42\x66\x45\x69\x75\x45\x4a\x71\x61\x46\
-\x37\x59\x71\x6d\x42\x43\x34\x76\x52\x43\x41\x5a\x47\x41\x43\x46\
-\x38\x6f\x61\x66\x56\x6c\x4b\x70\x73\x20\x56\x62\x36\x6b\x79\x35\
-\x45\x54\x67\x43\x4f\x33\x53\x61\x4f\x70\x43\x74\x31\x32\x75\x77\
-\x33\x57\x77\x53\x4f\x2b\x66\x50\x6d\x43\x30\x2b\x6d\x45\x78\x57\
-\x4b\x42\x39\x65\x6f\x43\x58\x64\x64\x42\x4e\x52\x6f\x55\x69\x53\
-\x2f\x51\x39\x36\x63\x59\x2b\x44\x79\x62\x7a\x54\x42\x66\x55\x4b\
-\x32\x54\x33\x33\x37\x39\x20\x68\x4c\x61\x64\x34\x2f\x72\x36\x4e\
-\x59\x37\x48\x49\x77\x55\x62\x7a\x78\x66\x30\x66\x51\x44\x47\x41\
-\x38\x70\x54\x4a\x49\x72\x30\x56\x42\x5a\x43\x43\x6b\x75\x36\x31\
-\x32\x4a\x42\x6c\x6c\x49\x65\x49\x2f\x2f\x7a\x6c\x54\x68\x66\x72\
-\x55\x32\x53\x46\x65\x71\x67\x2b\x31\x72\x65\x6f\x2f\x76\x47\x4f\
-\x38\x41\x61\x20\x4f\x42\x75\x73\x76\x71\x61\x48\x55\x4b\x6e\x79\
-\x47\x66\x6b\x4a\x4c\x51\x41\x46\x48\x51\x78\x45\x37\x43\x44\x50\
-\x69\x30\x4e\x4a\x33\x5a\x43\x2b\x35\x2b\x6a\x61\x62\x72\x63\x4c\
-\x78\x5a\x34\x41\x6f\x53\x56\x67\x75\x63\x53\x2b\x67\x58\x4f\x57\
-\x52\x48\x70\x6a\x41\x43\x2b\x68\x56\x41\x4f\x67\x68\x2f\x57\x68\
-\x20\x53\x70\x34\x48\x76\x43\x41\x4c\x74\x58\x44\x6c\x54\x45\x55\
-\x49\x57\x76\x42\x42\x2f\x34\x39\x35\x72\x5a\x4b\x71\x6f\x37\x6c\
-\x6f\x6a\x61\x61\x61\x4d\x78\x63\x58\x6c\x33\x68\x34\x75\x41\x74\
-\x77\x6d\x4f\x66\x4f\x6c\x68\x78\x75\x79\x4c\x52\x4b\x35\x2f\x34\
-\x59\x4e\x78\x7a\x45\x6a\x74\x59\x76\x31\x58\x2f\x58\x20\x47\x31\
-\x43\x66\x4f\x31\x38\x50\x70\x44\x36\x56\x70\x33\x6a\x62\x44\x7a\
-\x50\x35\x36\x33\x37\x47\x4f\x47\x6b\x43\x43\x4a\x79\x4e\x68\x52\
-\x79\x62\x65\x50\x30\x7a\x66\x79\x35\x66\x6e\x42\x67\x70\x4d\x61\
-\x45\x4c\x38\x62\x74\x53\x71\x69\x6a\x4f\x6b\x4b\x4f\x59\x45\x47\
-\x69\x31\x57\x6d\x47\x78\x57\x4d\x42\x61\x20\x69\x38\x2b\x66\x50\
-\x2b\x4e\x70\x74\x77\x74\x35\x61\x70\x76\x6f\x6d\x47\x36\x61\x42\
-\x6c\x34\x41\x70\x31\x4d\x58\x4b\x33\x79\x74\x31\x78\x66\x51\x6d\
-\x72\x49\x51\x39\x76\x73\x39\x70\x4a\x52\x59\x72\x56\x5a\x77\x6a\
-\x72\x68\x4c\x30\x7a\x51\x41\x67\x44\x37\x45\x61\x41\x70\x42\x65\
-\x58\x66\x65\x65\x7a\x4c\x67\x20\x47\x45\x4c\x69\x35\x58\x4b\x4a\
-\x2b\x2f\x74\x37\x69\x6a\x72\x52\x47\x6b\x71\x6c\x42\x4e\x73\x38\
-\x64\x69\x70\x66\x76\x37\x47\x31\x6e\x74\x4a\x35\x75\x56\x6c\x72\
-\x6f\x54\x55\x52\x69\x37\x37\x76\x34\x57\x77\x77\x6d\x6f\x54\x33\
-\x65\x74\x4d\x46\x47\x47\x43\x52\x48\x5a\x41\x7a\x44\x65\x38\x46\
-\x32\x72\x59\x74\x20\x4f\x41\x73\x54\x77\x73\x34\x59\x61\x41\x48\
-\x4d\x6d\x7a\x6e\x75\x37\x2b\x39\x78\x37\x44\x76\x4d\x33\x52\x7a\
-\x43\x43\x6d\x68\x42\x51\x64\x6d\x63\x72\x52\x46\x74\x41\x31\x4a\
-\x41\x43\x77\x30\x76\x58\x44\x54\x65\x73\x4a\x70\x43\x59\x36\x37\
-\x55\x44\x41\x38\x49\x79\x48\x69\x57\x42\x75\x39\x68\x33\x62\x77\
-\x55\x20\x38\x45\x35\x69\x73\x39\x36\x69\x37\x33\x73\x38\x50\x6a\
-\x35\x43\x4b\x54\x6e\x41\x69\x52\x70\x57\x61\x72\x6a\x68\x62\x2b\
-\x52\x6e\x69\x34\x78\x79\x51\x67\x4c\x41\x77\x44\x75\x43\x44\x42\
-\x32\x64\x37\x51\x69\x31\x45\x2b\x74\x54\x67\x4f\x41\x68\x68\x59\
-\x37\x48\x58\x6b\x66\x78\x6b\x4d\x58\x4e\x54\x43\x64\x4c\x20\x67\
-\x4a\x74\x78\x30\x77\x70\x2f\x34\x75\x49\x46\x54\x75\x5a\x6c\x69\
-\x5a\x68\x78\x38\x6e\x78\x6d\x76\x45\x72\x33\x78\x70\x70\x31\x71\
-\x5a\x41\x56\x4d\x4b\x79\x44\x79\x64\x73\x30\x44\x43\x6f\x6f\x64\
-\x64\x45\x30\x33\x53\x54\x32\x57\x6d\x74\x68\x50\x42\x6c\x61\x68\
-\x42\x50\x59\x4c\x44\x66\x59\x62\x72\x64\x6f\x20\x32\x78\x61\x37\
-\x33\x51\x36\x66\x50\x6e\x33\x42\x34\x2b\x4d\x6a\x6d\x71\x62\x42\
-\x59\x72\x36\x4b\x4d\x5a\x55\x69\x78\x4c\x77\x65\x6a\x30\x65\x59\
-\x30\x50\x39\x79\x75\x55\x4c\x54\x36\x4c\x41\x2b\x47\x76\x4e\x35\
-\x51\x37\x56\x57\x6a\x43\x48\x45\x56\x34\x52\x41\x78\x71\x55\x31\
-\x72\x44\x6d\x33\x74\x62\x59\x6f\x20\x46\x62\x68\x65\x72\x2f\x48\
-\x77\x65\x42\x65\x42\x56\x51\x67\x52\x52\x55\x49\x62\x75\x4d\x68\
-\x55\x4a\x59\x51\x6b\x33\x71\x64\x77\x72\x48\x4c\x66\x71\x55\x6e\
-\x64\x34\x6e\x51\x36\x59\x52\x35\x31\x48\x68\x6d\x44\x72\x50\x4d\
-\x31\x7a\x35\x47\x36\x36\x7a\x70\x63\x58\x62\x32\x4b\x43\x43\x69\
-\x45\x49\x46\x39\x61\x20\x42\x71\x68\x4b\x4b\x54\x68\x76\x30\x50\
-\x63\x6e\x33\x4e\x2f\x66\x34\x75\x70\x69\x53\x39\x66\x43\x48\x4a\
-\x6e\x51\x50\x64\x30\x66\x79\x43\x44\x55\x4a\x54\x38\x68\x5a\x32\
-\x39\x34\x37\x38\x6e\x4c\x36\x7a\x6e\x73\x4d\x43\x4f\x79\x77\x53\
-\x41\x45\x55\x65\x61\x73\x6c\x74\x58\x5a\x42\x4a\x79\x6a\x4b\x6d\
-\x39\x74\x20\x32\x32\x4b\x7a\x32\x65\x42\x30\x4f\x67\x56\x69\x79\
-\x4f\x55\x51\x58\x51\x6e\x50\x6d\x43\x5a\x71\x64\x61\x53\x59\x39\
-\x35\x36\x71\x78\x35\x30\x44\x34\x44\x45\x4f\x6b\x32\x50\x38\x4f\
-\x53\x71\x5a\x54\x34\x6f\x70\x54\x33\x33\x2f\x6e\x4e\x67\x33\x4e\
-\x68\x48\x65\x55\x42\x59\x44\x38\x75\x2b\x50\x36\x57\x37\x35\x20\
-\x65\x4d\x66\x31\x41\x6b\x65\x57\x50\x4b\x56\x69\x56\x53\x37\x57\
-\x35\x55\x68\x48\x6b\x39\x48\x33\x6c\x67\x63\x50\x63\x2b\x36\x63\
-\x63\x77\x36\x7a\x35\x51\x4c\x62\x37\x52\x59\x58\x71\x77\x73\x6f\
-\x70\x62\x44\x66\x37\x33\x46\x7a\x63\x78\x4e\x6a\x49\x52\x66\x42\
-\x59\x4d\x46\x63\x6e\x2f\x38\x78\x31\x64\x31\x73\x20\x71\x4a\x53\
-\x44\x55\x67\x71\x4c\x78\x51\x4a\x61\x6b\x34\x36\x31\x32\x2b\x32\
-\x69\x41\x33\x35\x73\x48\x63\x62\x6d\x50\x64\x62\x57\x36\x7a\x58\
-\x32\x2b\x7a\x32\x4d\x55\x56\x67\x73\x5a\x6a\x43\x47\x52\x45\x32\
-\x6c\x4e\x4f\x58\x4e\x63\x55\x5a\x42\x46\x6c\x52\x66\x72\x31\x33\
-\x39\x6e\x59\x4c\x71\x42\x2b\x43\x4b\x20\x50\x6b\x38\x6b\x71\x79\
-\x69\x41\x6d\x44\x54\x4d\x37\x7a\x67\x42\x74\x45\x6f\x6e\x50\x54\
-\x6f\x4b\x68\x4d\x52\x31\x36\x6f\x67\x66\x36\x78\x30\x65\x64\x6f\
-\x39\x78\x2f\x5a\x6e\x4c\x4f\x75\x75\x70\x36\x74\x72\x54\x48\x5a\
-\x7a\x50\x38\x6f\x39\x78\x41\x41\x41\x67\x41\x45\x6c\x45\x51\x56\
-\x54\x7a\x61\x4a\x56\x47\x20\x37\x79\x77\x47\x42\x78\x52\x35\x4a\
-\x72\x72\x6c\x65\x52\x66\x52\x34\x44\x64\x78\x6f\x6c\x61\x43\x45\
-\x59\x41\x79\x50\x52\x77\x61\x50\x63\x50\x46\x35\x68\x49\x50\x75\
-\x49\x4d\x78\x58\x64\x41\x4a\x5a\x51\x48\x6e\x64\x57\x70\x66\x76\
-\x6d\x36\x31\x58\x51\x4e\x68\x33\x6a\x72\x50\x43\x4f\x62\x42\x35\
-\x71\x30\x75\x20\x4e\x78\x35\x31\x72\x63\x44\x71\x78\x30\x42\x67\
-\x54\x4b\x6d\x50\x61\x59\x4f\x56\x4f\x45\x63\x33\x55\x7a\x68\x50\
-\x74\x68\x51\x30\x4b\x57\x61\x57\x72\x44\x54\x4c\x70\x49\x2f\x53\
-\x62\x41\x57\x5a\x6d\x79\x76\x2f\x59\x67\x7a\x48\x38\x35\x5a\x30\
-\x51\x6a\x6d\x43\x31\x4a\x35\x50\x79\x6e\x55\x77\x68\x71\x6d\x31\
-\x20\x79\x6e\x78\x73\x51\x4e\x76\x4d\x67\x2b\x47\x42\x74\x4d\x2f\
-\x44\x34\x51\x54\x76\x50\x64\x62\x72\x69\x78\x68\x45\x72\x4c\x56\
-\x47\x31\x33\x58\x34\x2b\x76\x56\x72\x4e\x4c\x71\x30\x62\x52\x73\
-\x4e\x4b\x45\x71\x52\x2b\x5a\x77\x4e\x47\x4c\x50\x5a\x44\x4f\x32\
-\x63\x54\x50\x54\x47\x47\x46\x78\x66\x58\x36\x4e\x74\x20\x57\x78\
-\x77\x4f\x42\x39\x7a\x66\x33\x38\x64\x45\x31\x4f\x56\x79\x47\x63\
-\x73\x33\x69\x47\x72\x64\x2f\x41\x68\x68\x79\x5a\x59\x33\x52\x65\
-\x45\x49\x48\x56\x30\x48\x66\x64\x39\x6a\x50\x70\x39\x44\x43\x41\
-\x4a\x47\x72\x52\x70\x41\x5a\x6c\x4c\x42\x43\x46\x45\x62\x33\x63\
-\x73\x63\x53\x4a\x79\x44\x43\x50\x4d\x67\x20\x54\x6d\x38\x4c\x30\
-\x55\x35\x34\x42\x31\x30\x6c\x41\x65\x68\x5a\x6d\x32\x71\x45\x43\
-\x67\x43\x4d\x2f\x43\x4b\x4c\x6d\x73\x71\x2b\x2b\x2f\x44\x77\x67\
-\x4e\x50\x70\x68\x46\x6e\x54\x70\x6a\x41\x30\x43\x56\x78\x65\x58\
-\x75\x4b\x33\x62\x35\x39\x67\x6a\x49\x66\x57\x44\x74\x5a\x34\x4f\
-\x4b\x63\x43\x73\x51\x79\x49\x20\x77\x44\x56\x44\x69\x79\x70\x2b\
-\x61\x58\x34\x4b\x4b\x66\x59\x32\x52\x6d\x34\x46\x43\x51\x42\x65\
-\x77\x67\x54\x70\x77\x58\x68\x41\x4b\x34\x48\x6c\x5a\x6f\x33\x65\
-\x39\x58\x68\x34\x37\x4f\x6c\x73\x77\x56\x68\x4e\x75\x31\x52\x50\
-\x67\x4f\x51\x79\x47\x6c\x4e\x39\x6d\x41\x45\x4a\x5a\x31\x39\x75\
-\x48\x63\x30\x48\x20\x66\x71\x36\x56\x49\x74\x33\x59\x4a\x6d\x62\
-\x39\x77\x55\x46\x4b\x42\x51\x68\x79\x5a\x62\x7a\x6b\x2f\x62\x4e\
-\x55\x4b\x37\x75\x57\x69\x38\x74\x30\x62\x66\x67\x4f\x67\x48\x6a\
-\x63\x73\x35\x51\x73\x6d\x69\x57\x66\x70\x4c\x55\x57\x7a\x70\x72\
-\x49\x34\x66\x71\x2b\x78\x33\x62\x4c\x56\x63\x41\x49\x69\x50\x62\
-\x37\x20\x50\x54\x35\x2f\x2f\x6f\x7a\x64\x62\x67\x63\x68\x52\x4f\
-\x52\x63\x54\x4c\x6d\x64\x63\x38\x46\x53\x4b\x4c\x46\x65\x72\x32\
-\x4f\x56\x5a\x2f\x61\x42\x72\x56\x59\x72\x65\x4f\x2b\x78\x32\x2b\
-\x33\x77\x38\x50\x41\x41\x33\x6a\x7a\x6e\x48\x4a\x6e\x77\x42\x35\
-\x77\x6f\x62\x4f\x43\x49\x6c\x4a\x4c\x76\x41\x62\x4a\x31\x20\x6d\
-\x62\x55\x4c\x43\x48\x46\x45\x33\x78\x73\x41\x78\x30\x42\x6b\x79\
-\x4c\x72\x6e\x62\x41\x70\x68\x71\x2f\x65\x77\x39\x73\x2b\x4f\x37\
-\x59\x50\x33\x4c\x4c\x59\x78\x35\x62\x66\x52\x62\x65\x48\x68\x49\
-\x46\x77\x4b\x48\x4f\x42\x78\x73\x61\x55\x7a\x75\x6f\x6b\x45\x45\
-\x55\x6b\x5a\x78\x46\x4b\x45\x76\x7a\x30\x41\x20\x68\x4a\x43\x38\
-\x75\x38\x63\x48\x72\x4e\x66\x72\x42\x4c\x78\x43\x59\x4c\x75\x35\
-\x51\x4b\x73\x62\x30\x69\x45\x31\x63\x55\x4c\x6c\x51\x2b\x42\x32\
-\x6b\x46\x70\x69\x34\x64\x4f\x4d\x47\x30\x39\x4a\x52\x7a\x6c\x38\
-\x52\x4c\x75\x41\x4d\x58\x48\x38\x78\x70\x43\x31\x65\x72\x6c\x63\
-\x6b\x77\x76\x6c\x74\x49\x64\x53\x20\x77\x37\x4d\x5a\x63\x39\x45\
-\x37\x4a\x2b\x6a\x35\x47\x71\x62\x6e\x41\x43\x30\x79\x61\x2b\x63\
-\x67\x47\x44\x71\x70\x41\x70\x4f\x44\x4a\x64\x59\x35\x49\x72\x5a\
-\x57\x6d\x31\x59\x50\x67\x48\x2b\x58\x48\x4f\x51\x34\x6b\x59\x67\
-\x31\x41\x41\x34\x76\x41\x37\x55\x4d\x49\x67\x77\x44\x42\x63\x76\
-\x39\x4c\x50\x5a\x45\x20\x52\x41\x7a\x66\x79\x6f\x38\x6b\x41\x45\
-\x58\x56\x41\x30\x44\x62\x74\x49\x57\x54\x58\x49\x59\x4b\x30\x45\
-\x52\x56\x50\x59\x35\x48\x34\x6b\x53\x62\x7a\x51\x59\x58\x46\x78\
-\x66\x52\x4c\x4d\x31\x69\x35\x2b\x37\x68\x6b\x55\x71\x77\x4e\x32\
-\x31\x49\x4e\x6e\x55\x52\x65\x45\x2f\x42\x54\x63\x41\x69\x71\x54\
-\x45\x47\x20\x53\x6d\x6c\x73\x74\x35\x65\x68\x73\x6a\x4f\x5a\x38\
-\x4f\x2f\x76\x37\x33\x45\x34\x45\x63\x4b\x78\x49\x37\x72\x57\x2b\
-\x65\x4a\x36\x78\x77\x55\x4f\x2b\x6c\x59\x38\x47\x36\x47\x73\x67\
-\x4a\x44\x4c\x46\x53\x59\x44\x70\x4f\x50\x78\x51\x41\x37\x2b\x31\
-\x52\x4b\x41\x67\x2b\x4a\x51\x71\x6b\x78\x66\x38\x69\x46\x65\x20\
-\x31\x44\x6d\x48\x51\x71\x6e\x6e\x33\x77\x71\x56\x68\x49\x69\x52\
-\x63\x4d\x52\x39\x71\x47\x78\x68\x32\x67\x38\x58\x75\x46\x4b\x2b\
-\x68\x30\x6f\x70\x4f\x44\x41\x54\x54\x46\x78\x51\x42\x67\x54\x6b\
-\x75\x65\x64\x69\x38\x76\x33\x39\x4c\x58\x37\x36\x34\x58\x33\x38\
-\x76\x6c\x49\x4b\x79\x2b\x55\x53\x38\x2f\x6b\x63\x20\x68\x37\x36\
-\x44\x41\x4b\x4b\x4f\x61\x78\x79\x64\x49\x63\x45\x63\x79\x54\x6c\
-\x48\x32\x52\x39\x53\x42\x74\x39\x31\x35\x70\x36\x4b\x68\x2f\x7a\
-\x77\x4c\x4d\x4f\x78\x45\x43\x36\x4a\x72\x4a\x52\x38\x4c\x41\x42\
-\x42\x68\x4c\x6c\x74\x57\x36\x78\x57\x71\x31\x43\x59\x6d\x41\x78\
-\x6b\x4f\x71\x75\x76\x6b\x38\x4e\x73\x20\x4c\x59\x4c\x57\x54\x45\
-\x31\x4b\x41\x56\x31\x48\x2b\x64\x65\x62\x58\x59\x73\x6c\x59\x78\
-\x73\x78\x39\x6e\x66\x2b\x72\x76\x63\x2b\x47\x6d\x72\x79\x76\x6f\
-\x51\x63\x49\x75\x2b\x51\x38\x74\x64\x36\x69\x61\x39\x66\x47\x50\
-\x31\x65\x6d\x76\x51\x77\x41\x34\x44\x65\x6f\x78\x2f\x4d\x70\x58\
-\x4a\x5a\x33\x68\x67\x44\x20\x30\x35\x50\x65\x78\x6f\x56\x6e\x32\
-\x59\x39\x31\x4f\x42\x79\x69\x7a\x74\x65\x45\x4b\x49\x38\x59\x6a\
-\x42\x34\x51\x37\x58\x67\x38\x51\x6a\x55\x36\x4f\x48\x71\x50\x6b\
-\x65\x76\x4e\x35\x33\x4f\x30\x37\x59\x79\x69\x2b\x41\x50\x69\x33\
-\x33\x32\x37\x44\x61\x46\x6e\x50\x70\x5a\x66\x5a\x38\x44\x6a\x2b\
-\x69\x6e\x6e\x20\x64\x4f\x63\x55\x69\x73\x56\x4f\x64\x57\x6f\x75\
-\x57\x77\x74\x61\x2f\x35\x53\x54\x78\x31\x78\x57\x4b\x51\x55\x74\
-\x79\x33\x30\x35\x78\x79\x48\x47\x31\x35\x69\x6f\x47\x34\x38\x31\
-\x56\x75\x2b\x4c\x7a\x35\x63\x57\x78\x78\x79\x78\x76\x50\x64\x51\
-\x4d\x69\x41\x78\x47\x34\x49\x79\x53\x53\x67\x2b\x6f\x78\x53\x65\
-\x20\x6e\x70\x35\x49\x4d\x6d\x6b\x51\x70\x52\x42\x65\x2f\x38\x65\
-\x6e\x48\x52\x6b\x34\x68\x49\x53\x54\x56\x50\x61\x77\x74\x68\x30\
-\x77\x74\x38\x35\x62\x38\x69\x4d\x43\x65\x56\x31\x52\x4e\x75\x54\
-\x51\x75\x71\x6c\x6f\x75\x64\x62\x68\x38\x42\x67\x68\x4a\x42\x61\
-\x4c\x46\x51\x44\x67\x2f\x76\x59\x6d\x45\x72\x6b\x6f\x20\x4b\x6d\
-\x66\x77\x6d\x68\x75\x2b\x36\x6e\x6e\x52\x57\x6d\x5a\x49\x6d\x44\
-\x75\x57\x61\x77\x70\x4d\x6d\x30\x73\x31\x4d\x6f\x76\x4d\x34\x47\
-\x41\x75\x4c\x54\x64\x74\x52\x45\x2f\x78\x50\x6c\x49\x2b\x72\x75\
-\x32\x57\x49\x77\x58\x48\x48\x78\x4a\x46\x48\x64\x2f\x34\x43\x43\
-\x69\x5a\x6a\x75\x67\x6c\x34\x6b\x6d\x78\x20\x2f\x48\x37\x63\x37\
-\x4f\x6a\x67\x5a\x49\x4e\x41\x52\x54\x51\x43\x41\x56\x41\x5a\x77\
-\x46\x50\x35\x42\x41\x75\x74\x57\x6d\x77\x32\x57\x36\x7a\x58\x61\
-\x38\x78\x6d\x63\x78\x68\x6a\x38\x50\x69\x34\x49\x38\x36\x33\x32\
-\x34\x56\x51\x73\x57\x57\x77\x58\x50\x6f\x59\x45\x63\x4c\x36\x33\
-\x6d\x4b\x78\x67\x50\x55\x6b\x20\x68\x6c\x35\x65\x58\x6d\x4b\x78\
-\x57\x4d\x54\x71\x30\x61\x65\x2b\x68\x2f\x63\x65\x78\x2b\x4d\x52\
-\x2b\x39\x30\x4f\x7a\x74\x69\x49\x66\x49\x53\x59\x78\x41\x58\x35\
-\x37\x41\x2f\x4f\x44\x76\x43\x5a\x68\x4d\x41\x63\x33\x6e\x74\x66\
-\x56\x48\x68\x47\x4a\x75\x4c\x6c\x4f\x71\x54\x57\x47\x74\x62\x52\
-\x64\x79\x47\x42\x20\x33\x68\x71\x59\x30\x78\x47\x7a\x32\x51\x78\
-\x57\x4a\x6f\x36\x54\x55\x2b\x30\x49\x53\x49\x62\x39\x5a\x31\x4d\
-\x53\x53\x68\x44\x44\x6e\x49\x39\x41\x79\x76\x66\x48\x69\x4c\x74\
-\x55\x64\x4a\x34\x68\x5a\x63\x2b\x6b\x51\x41\x74\x47\x50\x76\x35\
-\x5a\x42\x31\x39\x30\x58\x59\x66\x39\x66\x6f\x2f\x46\x66\x41\x34\
-\x6f\x20\x44\x51\x6c\x41\x61\x59\x47\x4c\x39\x51\x59\x33\x74\x39\
-\x39\x69\x4c\x4b\x69\x55\x41\x73\x4a\x6b\x41\x43\x39\x4c\x50\x54\
-\x64\x48\x42\x43\x6b\x6c\x66\x4f\x57\x57\x79\x4d\x65\x64\x69\x35\
-\x69\x4f\x52\x57\x79\x50\x45\x4b\x56\x45\x6e\x4c\x67\x2f\x48\x58\
-\x41\x38\x48\x73\x6c\x77\x6b\x35\x58\x63\x48\x32\x4e\x75\x20\x2b\
-\x64\x71\x6d\x37\x33\x6a\x53\x43\x5a\x2b\x54\x6c\x56\x6c\x32\x48\
-\x57\x76\x43\x44\x79\x54\x49\x59\x69\x4e\x71\x37\x70\x6a\x66\x64\
-\x31\x34\x4d\x58\x42\x35\x6a\x7a\x30\x38\x31\x37\x33\x31\x78\x33\
-\x48\x58\x35\x50\x76\x32\x55\x4d\x69\x31\x2b\x51\x6b\x51\x5a\x43\
-\x78\x73\x5a\x37\x39\x47\x66\x6a\x74\x46\x6f\x20\x38\x65\x37\x74\
-\x57\x36\x7a\x58\x46\x78\x45\x78\x37\x2b\x37\x75\x49\x76\x4c\x4e\
-\x5a\x6a\x4e\x73\x74\x39\x73\x59\x56\x69\x57\x6c\x77\x4e\x50\x54\
-\x50\x6f\x71\x63\x62\x48\x30\x7a\x78\x6d\x43\x78\x57\x75\x4c\x36\
-\x2b\x6a\x71\x4b\x4b\x63\x77\x70\x6e\x43\x46\x66\x30\x39\x50\x54\
-\x45\x35\x78\x7a\x55\x45\x4a\x41\x20\x46\x76\x47\x6b\x78\x45\x31\
-\x63\x37\x36\x41\x61\x44\x65\x64\x73\x67\x59\x54\x31\x2f\x6b\x52\
-\x35\x77\x61\x4f\x34\x4c\x75\x4b\x79\x69\x42\x42\x65\x46\x55\x34\
-\x6d\x73\x68\x62\x7a\x52\x59\x76\x4c\x37\x54\x57\x6b\x51\x71\x68\
-\x67\x6e\x61\x4a\x38\x53\x42\x7a\x6d\x79\x42\x71\x79\x45\x67\x73\
-\x52\x73\x68\x4d\x71\x20\x41\x4f\x59\x52\x30\x50\x74\x2b\x73\x4f\
-\x39\x6a\x48\x4c\x79\x32\x77\x74\x5a\x63\x6d\x41\x54\x45\x69\x6a\
-\x4d\x48\x30\x66\x68\x77\x4f\x41\x79\x59\x78\x58\x4b\x35\x4a\x4f\
-\x44\x76\x55\x71\x71\x63\x6b\x52\x4c\x52\x64\x54\x41\x79\x72\x72\
-\x4d\x63\x6e\x79\x78\x2f\x49\x55\x78\x50\x77\x54\x6f\x54\x44\x71\
-\x6c\x78\x20\x4d\x4d\x61\x48\x59\x42\x55\x46\x49\x63\x69\x71\x66\
-\x6e\x58\x31\x43\x6a\x63\x33\x58\x32\x42\x4d\x4f\x68\x34\x69\x48\
-\x36\x4f\x55\x56\x4a\x64\x55\x65\x6c\x4b\x42\x4b\x42\x74\x4b\x5a\
-\x4d\x78\x4d\x51\x45\x4e\x34\x53\x43\x58\x43\x4a\x67\x4c\x4f\x6c\
-\x67\x4f\x4f\x4c\x4a\x78\x31\x6b\x47\x4c\x41\x41\x64\x5a\x35\x20\
-\x6f\x6b\x4b\x51\x50\x79\x73\x43\x52\x70\x36\x61\x51\x31\x48\x2b\
-\x50\x70\x77\x42\x41\x41\x41\x32\x4b\x4f\x34\x35\x42\x63\x7a\x66\
-\x46\x55\x49\x4d\x56\x42\x49\x6e\x66\x4b\x53\x67\x38\x4b\x54\x44\
-\x63\x64\x49\x6c\x4c\x7a\x6f\x6c\x6b\x56\x49\x51\x4e\x47\x79\x59\
-\x76\x4a\x49\x55\x43\x65\x46\x44\x66\x4b\x42\x7a\x20\x4f\x4a\x32\
-\x4f\x63\x49\x37\x30\x76\x56\x64\x76\x53\x4f\x52\x73\x6d\x67\x62\
-\x4f\x65\x6a\x7a\x63\x33\x75\x48\x75\x37\x67\x37\x37\x2f\x52\x35\
-\x4b\x4b\x61\x79\x58\x46\x47\x4c\x6d\x72\x59\x58\x74\x65\x33\x52\
-\x42\x6a\x43\x58\x64\x43\x69\x46\x4b\x51\x32\x49\x64\x44\x69\x77\
-\x52\x67\x68\x4a\x46\x65\x30\x76\x58\x20\x6e\x66\x63\x34\x48\x49\
-\x35\x34\x65\x6e\x71\x4b\x6f\x68\x58\x70\x72\x67\x36\x57\x46\x78\
-\x2b\x49\x56\x6c\x6f\x41\x73\x4c\x32\x42\x56\x49\x41\x4e\x43\x4b\
-\x71\x31\x42\x67\x53\x69\x47\x34\x57\x52\x77\x54\x6e\x71\x6f\x38\
-\x34\x30\x55\x55\x72\x42\x39\x4f\x6e\x5a\x2b\x58\x79\x42\x71\x2f\
-\x55\x4b\x38\x33\x6b\x4c\x20\x4b\x58\x55\x55\x46\x58\x33\x32\x2f\
-\x52\x77\x68\x75\x51\x43\x54\x43\x33\x71\x50\x39\x35\x36\x43\x70\
-\x4a\x46\x63\x4f\x61\x71\x5a\x77\x55\x50\x43\x43\x59\x66\x4f\x47\
-\x6b\x43\x51\x6d\x6d\x45\x64\x69\x53\x79\x65\x78\x55\x33\x64\x6f\
-\x4f\x38\x4e\x74\x73\x73\x56\x6f\x48\x53\x51\x52\x41\x53\x67\x64\
-\x4c\x43\x4b\x20\x55\x74\x32\x58\x6e\x43\x73\x37\x41\x51\x72\x75\
-\x46\x77\x4a\x43\x4b\x33\x7a\x38\x38\x68\x6c\x76\x33\x37\x37\x48\
-\x41\x67\x72\x77\x4a\x48\x36\x75\x31\x2b\x75\x6f\x43\x37\x49\x31\
-\x55\x69\x6b\x56\x49\x70\x6e\x49\x4f\x4d\x54\x6c\x45\x73\x6b\x54\
-\x55\x4d\x59\x6c\x4f\x35\x65\x4c\x7a\x34\x70\x43\x4b\x42\x4e\x70\
-\x20\x67\x78\x52\x55\x2f\x73\x49\x48\x47\x4a\x59\x65\x34\x5a\x2b\
-\x45\x63\x4d\x43\x73\x58\x65\x44\x36\x38\x68\x57\x2b\x33\x74\x79\
-\x69\x36\x30\x77\x6f\x49\x74\x79\x67\x74\x78\x5a\x53\x4e\x58\x43\
-\x77\x4e\x41\x66\x48\x34\x59\x4d\x69\x35\x52\x64\x36\x44\x7a\x67\
-\x33\x31\x41\x6c\x6c\x64\x63\x72\x4f\x39\x33\x43\x6d\x20\x75\x4b\
-\x45\x5a\x49\x41\x41\x31\x39\x51\x35\x63\x45\x43\x44\x45\x6c\x69\
-\x57\x58\x48\x64\x58\x66\x4a\x72\x34\x6a\x68\x49\x44\x74\x2b\x69\
-\x41\x47\x42\x53\x73\x6b\x53\x46\x64\x51\x45\x4d\x6e\x41\x6f\x55\
-\x49\x64\x54\x43\x6d\x67\x56\x59\x75\x6e\x30\x78\x37\x57\x65\x71\
-\x7a\x58\x61\x37\x78\x37\x2b\x78\x37\x65\x20\x2b\x79\x68\x4b\x33\
-\x48\x7a\x39\x68\x74\x76\x62\x57\x35\x6a\x67\x47\x6c\x69\x76\x31\
-\x39\x46\x4e\x77\x41\x48\x46\x79\x2b\x55\x53\x6d\x34\x73\x56\x75\
-\x71\x37\x44\x36\x58\x54\x43\x61\x72\x58\x43\x5a\x72\x4f\x4a\x59\
-\x6d\x58\x30\x6d\x51\x6b\x36\x44\x70\x6f\x74\x70\x45\x39\x50\x54\
-\x31\x46\x30\x41\x59\x4a\x4f\x20\x77\x75\x4a\x53\x70\x59\x64\x7a\
-\x76\x72\x5a\x7a\x4b\x62\x75\x37\x37\x2f\x74\x6f\x63\x47\x4b\x67\
-\x59\x35\x30\x32\x36\x6a\x41\x42\x67\x50\x75\x2b\x78\x2b\x46\x77\
-\x77\x4b\x78\x64\x59\x4c\x6c\x63\x59\x72\x31\x65\x78\x77\x67\x64\
-\x35\x78\x4a\x69\x30\x66\x63\x41\x6b\x52\x56\x34\x6b\x6b\x49\x43\
-\x43\x6b\x48\x76\x20\x6b\x73\x48\x67\x51\x47\x4e\x57\x4c\x70\x57\
-\x78\x74\x39\x62\x43\x42\x4b\x6b\x41\x51\x50\x4c\x68\x4f\x53\x70\
-\x6a\x57\x48\x4e\x4f\x52\x70\x5a\x61\x31\x4d\x79\x66\x55\x30\x49\
-\x4d\x37\x41\x65\x39\x4e\x57\x69\x31\x78\x6a\x47\x55\x4f\x5a\x79\
-\x33\x4d\x38\x79\x55\x68\x6e\x47\x55\x4d\x4c\x78\x59\x4c\x4e\x44\
-\x33\x20\x70\x32\x68\x56\x5a\x6a\x64\x48\x44\x6b\x76\x4a\x52\x79\
-\x68\x47\x76\x7a\x30\x6c\x4f\x74\x61\x4a\x41\x78\x77\x43\x53\x4f\
-\x38\x49\x48\x4f\x30\x52\x71\x39\x55\x47\x48\x68\x4b\x66\x50\x6e\
-\x30\x43\x47\x69\x4b\x53\x72\x48\x35\x77\x51\x4c\x35\x51\x4b\x63\
-\x43\x53\x31\x4c\x76\x77\x74\x2f\x44\x51\x65\x56\x41\x74\x20\x41\
-\x41\x6a\x46\x43\x45\x72\x31\x4f\x64\x68\x69\x65\x6b\x35\x5a\x4c\
-\x30\x51\x4c\x4d\x57\x37\x59\x69\x63\x67\x6e\x69\x45\x76\x46\x6d\
-\x6a\x45\x69\x42\x45\x46\x58\x43\x75\x30\x55\x45\x6f\x70\x59\x57\
-\x49\x6b\x6d\x30\x57\x67\x4a\x47\x39\x77\x4d\x73\x36\x61\x46\x39\
-\x31\x51\x75\x72\x77\x65\x43\x66\x38\x66\x42\x20\x47\x64\x4c\x7a\
-\x6e\x48\x4e\x34\x4f\x6a\x35\x68\x76\x62\x33\x41\x6d\x7a\x66\x76\
-\x30\x4c\x59\x74\x75\x6c\x4d\x50\x4a\x51\x52\x75\x76\x6e\x7a\x42\
-\x6c\x79\x39\x66\x41\x48\x43\x71\x44\x58\x45\x34\x6a\x70\x44\x77\
-\x31\x6d\x45\x2b\x6e\x32\x4f\x37\x33\x5a\x4a\x35\x2b\x6e\x44\x43\
-\x65\x72\x33\x47\x6d\x37\x66\x72\x20\x41\x71\x6e\x34\x5a\x78\x34\
-\x6c\x63\x6a\x77\x53\x42\x32\x52\x78\x4b\x75\x6f\x38\x41\x4c\x77\
-\x74\x43\x5a\x36\x6b\x42\x53\x44\x71\x47\x39\x78\x58\x41\x47\x4a\
-\x67\x64\x39\x52\x68\x51\x34\x70\x51\x38\x70\x75\x52\x74\x73\x31\
-\x6c\x41\x65\x66\x7a\x4f\x66\x6b\x66\x6d\x7a\x6d\x46\x72\x54\x57\
-\x61\x44\x42\x59\x32\x20\x63\x46\x70\x46\x46\x63\x56\x73\x6c\x33\
-\x4c\x78\x30\x71\x6f\x69\x5a\x6b\x33\x45\x50\x51\x6e\x69\x71\x41\
-\x71\x4f\x61\x78\x75\x4d\x46\x33\x42\x4a\x48\x38\x34\x35\x38\x52\
-\x69\x34\x31\x4d\x52\x56\x5a\x42\x79\x77\x46\x68\x56\x7a\x75\x49\
-\x6f\x49\x4c\x77\x79\x2b\x33\x64\x39\x68\x73\x31\x70\x44\x68\x48\
-\x52\x30\x20\x6a\x6d\x54\x5a\x37\x58\x62\x51\x6d\x67\x69\x67\x51\
-\x4e\x6c\x48\x48\x69\x72\x47\x61\x6b\x6f\x63\x52\x79\x57\x65\x54\
-\x68\x72\x41\x4d\x73\x61\x55\x37\x36\x46\x55\x47\x71\x66\x4f\x59\
-\x4c\x56\x61\x59\x62\x76\x64\x34\x73\x75\x33\x47\x31\x78\x66\x58\
-\x36\x50\x72\x6a\x73\x45\x4b\x50\x42\x34\x45\x49\x5a\x45\x69\x20\
-\x68\x58\x51\x75\x6f\x34\x39\x39\x4a\x44\x39\x73\x67\x7a\x73\x59\
-\x61\x37\x45\x50\x44\x50\x58\x4b\x33\x4b\x72\x70\x66\x63\x55\x5a\
-\x6b\x79\x38\x6a\x62\x74\x36\x6f\x66\x70\x72\x70\x4f\x50\x6e\x50\
-\x6e\x46\x4a\x78\x7a\x55\x73\x32\x45\x4e\x6a\x4d\x63\x6d\x66\x36\
-\x49\x31\x61\x72\x46\x64\x37\x39\x2b\x41\x50\x6d\x20\x38\x7a\x6d\
-\x4d\x49\x78\x66\x43\x70\x31\x38\x2f\x34\x76\x48\x78\x45\x52\x49\
-\x43\x38\x38\x57\x63\x78\x46\x6e\x6e\x34\x4c\x77\x68\x42\x37\x63\
-\x35\x59\x62\x76\x64\x59\x72\x56\x59\x52\x6c\x2f\x65\x5a\x6b\x50\
-\x68\x61\x54\x6d\x6c\x7a\x61\x4e\x47\x63\x71\x52\x69\x38\x5a\x4d\
-\x64\x39\x53\x77\x79\x73\x64\x69\x55\x20\x78\x79\x76\x6d\x55\x6b\
-\x51\x75\x2b\x4f\x66\x41\x7a\x58\x4f\x45\x53\x43\x46\x6f\x48\x50\
-\x37\x56\x39\x7a\x32\x55\x6c\x4e\x68\x75\x74\x31\x67\x73\x46\x6d\
-\x54\x39\x44\x48\x47\x6c\x4f\x58\x63\x57\x51\x73\x41\x45\x56\x30\
-\x68\x79\x56\x76\x4d\x59\x65\x44\x38\x53\x51\x54\x48\x47\x68\x4b\
-\x50\x41\x73\x73\x7a\x38\x20\x38\x42\x69\x37\x56\x50\x4a\x34\x30\
-\x62\x46\x39\x34\x6e\x6e\x55\x78\x70\x2b\x61\x57\x30\x61\x41\x7a\
-\x64\x37\x6a\x72\x41\x70\x49\x67\x64\x76\x62\x57\x2f\x7a\x75\x2f\
-\x51\x2b\x77\x51\x65\x65\x54\x6b\x46\x67\x74\x69\x47\x44\x6d\x77\
-\x66\x79\x78\x6e\x38\x6f\x59\x77\x35\x77\x77\x68\x37\x48\x76\x61\
-\x66\x6b\x65\x20\x35\x62\x2f\x33\x66\x59\x2b\x4c\x69\x77\x73\x59\
-\x37\x33\x42\x2f\x66\x34\x2f\x74\x6c\x6d\x4b\x45\x38\x78\x70\x4f\
-\x59\x78\x78\x58\x53\x6b\x6d\x47\x6d\x58\x78\x51\x65\x57\x78\x6c\
-\x77\x76\x36\x6b\x2b\x4e\x65\x63\x6b\x61\x74\x5a\x31\x5a\x6a\x4f\
-\x50\x39\x50\x31\x75\x4c\x76\x68\x42\x79\x75\x76\x2f\x47\x32\x36\
-\x20\x7a\x4e\x57\x38\x56\x4e\x55\x58\x52\x7a\x4f\x6b\x42\x51\x36\
-\x36\x5a\x6d\x59\x56\x6b\x6b\x72\x42\x42\x6e\x32\x6c\x44\x32\x65\
-\x51\x6d\x39\x37\x68\x37\x51\x2f\x76\x59\x36\x77\x69\x63\x36\x5a\
-\x50\x48\x7a\x2f\x6a\x36\x39\x65\x76\x32\x43\x79\x57\x57\x43\x39\
-\x58\x6b\x46\x36\x69\x64\x78\x62\x43\x41\x61\x61\x33\x20\x38\x4a\
-\x35\x43\x7a\x74\x36\x39\x66\x59\x33\x64\x62\x6f\x66\x6a\x38\x59\
-\x6a\x31\x65\x6f\x33\x74\x31\x5a\x62\x47\x36\x52\x79\x6b\x55\x6a\
-\x67\x65\x39\x36\x4f\x55\x6a\x68\x46\x74\x39\x33\x67\x66\x51\x39\
-\x7a\x49\x78\x79\x69\x41\x55\x46\x32\x4d\x63\x6b\x47\x43\x43\x34\
-\x47\x4a\x44\x30\x6f\x6b\x6a\x75\x34\x4d\x20\x73\x4b\x68\x4a\x69\
-\x2b\x46\x69\x6c\x53\x38\x71\x4d\x61\x69\x55\x69\x73\x69\x58\x37\
-\x54\x6f\x36\x51\x32\x46\x33\x4d\x74\x53\x2b\x73\x66\x44\x46\x71\
-\x55\x56\x43\x68\x54\x4e\x48\x73\x6a\x49\x51\x59\x52\x4a\x70\x58\
-\x33\x4f\x4f\x57\x42\x48\x58\x30\x2f\x34\x41\x31\x78\x73\x49\x53\
-\x59\x57\x54\x76\x48\x50\x42\x20\x68\x55\x44\x69\x6e\x77\x70\x49\
-\x70\x34\x57\x45\x46\x31\x6d\x49\x48\x47\x52\x79\x54\x32\x51\x49\
-\x36\x4d\x4d\x2f\x46\x6b\x6d\x6a\x39\x54\x66\x63\x33\x2b\x39\x33\
-\x65\x48\x70\x36\x78\x4b\x4a\x70\x41\x53\x6b\x68\x50\x55\x49\x55\
-\x45\x42\x76\x69\x4e\x4b\x52\x33\x63\x49\x37\x44\x44\x64\x6c\x33\
-\x78\x2b\x36\x71\x20\x6b\x67\x41\x67\x34\x35\x51\x4d\x6e\x57\x4f\
-\x47\x53\x64\x37\x7a\x4d\x70\x2b\x57\x67\x74\x59\x58\x69\x77\x57\
-\x4d\x4a\x30\x66\x2b\x39\x66\x55\x31\x44\x6f\x63\x44\x44\x67\x66\
-\x4b\x6c\x6e\x46\x67\x76\x32\x6d\x41\x59\x59\x67\x59\x4e\x4d\x2f\
-\x2f\x64\x4f\x37\x48\x79\x43\x6c\x37\x7a\x6e\x35\x7a\x55\x32\x33\
-\x2b\x20\x4c\x49\x6c\x42\x4a\x61\x56\x7a\x47\x51\x55\x66\x34\x34\
-\x67\x31\x70\x59\x7a\x58\x73\x30\x6b\x58\x46\x44\x57\x37\x4e\x74\
-\x61\x59\x6d\x30\x67\x70\x71\x65\x68\x72\x31\x2b\x48\x55\x64\x35\
-\x6a\x4e\x5a\x74\x68\x73\x4e\x6e\x6a\x39\x39\x6e\x33\x6b\x51\x6f\
-\x66\x44\x41\x52\x38\x2f\x45\x75\x64\x62\x7a\x68\x5a\x34\x20\x38\
-\x2b\x6f\x56\x70\x50\x57\x77\x78\x71\x4a\x33\x4e\x68\x70\x4c\x72\
-\x72\x65\x58\x61\x4e\x73\x57\x2b\x39\x4d\x52\x78\x68\x6a\x38\x34\
-\x51\x39\x2f\x67\x4e\x59\x61\x4e\x7a\x63\x33\x36\x47\x30\x66\x76\
-\x38\x6c\x6d\x61\x51\x34\x4a\x38\x7a\x36\x5a\x36\x51\x2b\x48\x41\
-\x38\x57\x50\x68\x74\x51\x6b\x49\x63\x53\x41\x20\x47\x2b\x55\x68\
-\x54\x55\x7a\x6b\x38\x6b\x30\x48\x6b\x6e\x34\x5a\x6a\x78\x6e\x4c\
-\x6a\x43\x49\x41\x6f\x44\x54\x56\x39\x32\x54\x6e\x50\x2b\x75\x46\
-\x33\x44\x38\x5a\x59\x48\x77\x73\x4f\x57\x68\x52\x36\x6b\x6e\x52\
-\x77\x56\x79\x6c\x2b\x75\x53\x56\x70\x77\x6b\x75\x53\x71\x75\x33\
-\x5a\x33\x39\x71\x6c\x73\x31\x52\x20\x41\x32\x38\x74\x57\x74\x59\
-\x78\x71\x72\x58\x34\x57\x65\x38\x7a\x33\x2b\x73\x64\x31\x53\x72\
-\x74\x6a\x49\x46\x71\x4a\x47\x37\x75\x62\x72\x48\x64\x58\x48\x4b\
-\x64\x4a\x72\x53\x36\x51\x61\x4d\x30\x46\x5a\x65\x53\x4d\x68\x72\
-\x37\x53\x71\x49\x39\x38\x55\x2b\x6d\x59\x78\x72\x59\x62\x33\x69\
-\x75\x31\x58\x69\x68\x20\x74\x61\x61\x41\x37\x76\x6b\x73\x36\x73\
-\x49\x2f\x2f\x66\x51\x54\x66\x76\x37\x35\x5a\x78\x77\x4f\x42\x37\
-\x54\x7a\x4a\x68\x44\x42\x55\x74\x58\x4b\x78\x36\x61\x56\x79\x76\
-\x30\x69\x67\x42\x41\x71\x42\x62\x64\x6d\x6f\x56\x66\x35\x49\x68\
-\x65\x47\x47\x2f\x59\x54\x42\x69\x43\x52\x76\x74\x6f\x73\x70\x69\
-\x4a\x78\x20\x64\x6a\x6d\x58\x35\x41\x70\x48\x62\x49\x59\x51\x45\
-\x44\x34\x63\x6c\x78\x61\x34\x6f\x78\x53\x6c\x73\x37\x4e\x75\x6e\
-\x54\x58\x42\x44\x2b\x62\x51\x48\x51\x36\x51\x55\x75\x50\x31\x71\
-\x37\x63\x55\x57\x74\x59\x32\x73\x4e\x61\x6a\x36\x77\x79\x2b\x66\
-\x50\x79\x56\x2f\x45\x79\x4c\x42\x62\x62\x72\x43\x7a\x6a\x6a\x20\
-\x34\x53\x33\x51\x6e\x30\x78\x63\x7a\x50\x57\x47\x4d\x68\x32\x73\
-\x64\x31\x67\x73\x46\x76\x6a\x7a\x6e\x2f\x38\x4d\x50\x64\x50\x34\
-\x38\x4f\x46\x44\x4c\x41\x51\x4c\x43\x4c\x67\x41\x73\x42\x54\x6a\
-\x57\x57\x5a\x66\x6d\x4c\x37\x48\x38\x58\x6a\x45\x34\x58\x43\x41\
-\x43\x59\x6a\x4a\x67\x4d\x46\x6d\x66\x4d\x6d\x48\x20\x70\x48\x69\
-\x77\x69\x44\x45\x61\x67\x77\x74\x51\x4e\x62\x4f\x6d\x61\x65\x43\
-\x6c\x67\x44\x46\x64\x44\x43\x68\x66\x4c\x70\x64\x6b\x6e\x6d\x2f\
-\x6e\x41\x38\x4c\x47\x79\x45\x30\x36\x63\x56\x55\x57\x68\x4b\x76\
-\x53\x42\x51\x76\x6f\x63\x45\x32\x72\x45\x6f\x6f\x32\x2f\x4f\x32\
-\x43\x70\x43\x51\x6f\x38\x4d\x4a\x61\x20\x47\x38\x50\x71\x56\x43\
-\x5a\x6d\x63\x6c\x33\x50\x57\x74\x52\x6a\x77\x30\x77\x6a\x4e\x57\
-\x54\x77\x46\x75\x63\x45\x49\x7a\x30\x72\x77\x52\x58\x72\x65\x44\
-\x7a\x52\x5a\x68\x48\x57\x37\x2b\x48\x68\x41\x64\x62\x31\x6b\x41\
-\x45\x4c\x74\x61\x62\x34\x57\x4a\x79\x4f\x30\x51\x34\x51\x76\x79\
-\x2f\x5a\x37\x53\x45\x4c\x20\x42\x42\x69\x44\x4a\x53\x48\x45\x4b\
-\x43\x63\x38\x4a\x37\x49\x36\x6b\x47\x67\x76\x6a\x59\x4f\x54\x78\
-\x41\x32\x64\x63\x2f\x6a\x78\x70\x39\x2f\x68\x77\x34\x63\x50\x73\
-\x4c\x32\x44\x61\x6a\x56\x30\x6f\x38\x49\x63\x47\x46\x36\x53\x5a\
-\x42\x6a\x46\x30\x62\x52\x6f\x70\x66\x4f\x65\x49\x77\x39\x71\x47\
-\x54\x69\x4b\x20\x72\x56\x47\x38\x48\x42\x39\x6f\x55\x6f\x71\x48\
-\x45\x36\x62\x33\x68\x37\x46\x31\x59\x36\x31\x65\x43\x42\x36\x76\
-\x55\x67\x71\x39\x4e\x52\x41\x65\x32\x47\x77\x76\x63\x48\x58\x35\
-\x43\x6f\x76\x46\x41\x6b\x2f\x48\x41\x2b\x35\x75\x62\x6e\x46\x7a\
-\x63\x77\x4e\x59\x4f\x6f\x56\x31\x73\x31\x72\x54\x6d\x45\x49\x5a\
-\x20\x79\x65\x35\x77\x78\x4c\x79\x68\x47\x69\x30\x79\x57\x4f\x37\
-\x65\x76\x6e\x32\x4c\x33\x2f\x2f\x2b\x39\x2f\x41\x43\x2b\x50\x4c\
-\x6c\x43\x2f\x37\x6c\x35\x33\x2b\x4a\x41\x4d\x73\x57\x56\x67\x41\
-\x77\x68\x74\x4a\x62\x6a\x4f\x6e\x69\x32\x6c\x68\x72\x63\x51\x77\
-\x63\x6b\x4a\x45\x6c\x63\x6a\x79\x58\x78\x4d\x74\x63\x20\x33\x42\
-\x78\x72\x2b\x54\x32\x75\x75\x4e\x59\x48\x73\x61\x71\x77\x64\x48\
-\x70\x66\x37\x41\x38\x54\x79\x78\x54\x72\x61\x4b\x4b\x4c\x67\x46\
-\x74\x75\x4d\x43\x72\x45\x73\x45\x69\x70\x68\x2f\x73\x33\x4e\x69\
-\x35\x6a\x44\x4c\x72\x6a\x4d\x56\x4c\x58\x50\x44\x75\x42\x34\x53\
-\x6d\x50\x47\x65\x58\x72\x48\x4f\x33\x69\x20\x4d\x44\x54\x55\x6a\
-\x4f\x31\x35\x4a\x47\x37\x47\x6f\x4e\x55\x4e\x72\x48\x66\x6f\x54\
-\x49\x2f\x65\x47\x4f\x69\x6d\x67\x51\x78\x39\x35\x31\x6e\x75\x50\
-\x4a\x36\x69\x2f\x34\x72\x37\x35\x48\x4f\x71\x31\x37\x36\x2b\x6e\
-\x74\x73\x6e\x63\x6e\x57\x42\x64\x57\x31\x57\x63\x78\x70\x4e\x55\
-\x6c\x48\x54\x4e\x46\x42\x53\x20\x34\x2f\x33\x37\x39\x2f\x6a\x38\
-\x38\x56\x50\x4d\x66\x63\x7a\x37\x59\x73\x6c\x43\x69\x4b\x7a\x51\
-\x55\x78\x70\x59\x4b\x54\x37\x55\x6f\x6d\x6b\x39\x59\x46\x74\x78\
-\x53\x78\x56\x4b\x31\x39\x48\x66\x6e\x45\x48\x64\x34\x4e\x67\x6e\
-\x4d\x7a\x5a\x52\x4e\x67\x2b\x74\x56\x59\x78\x30\x79\x4f\x55\x41\
-\x37\x33\x33\x4d\x20\x74\x6f\x38\x36\x30\x79\x43\x71\x67\x7a\x5a\
-\x34\x39\x33\x54\x41\x39\x5a\x76\x58\x75\x46\x69\x74\x4d\x56\x73\
-\x75\x41\x45\x6a\x38\x2b\x75\x6b\x7a\x37\x72\x2f\x64\x77\x6a\x6d\
-\x50\x57\x64\x75\x69\x6d\x57\x6d\x71\x47\x30\x4c\x70\x59\x7a\x67\
-\x65\x6a\x32\x69\x30\x78\x76\x73\x33\x62\x32\x50\x66\x72\x31\x36\
-\x39\x20\x77\x74\x2f\x38\x7a\x64\x39\x67\x75\x56\x37\x67\x35\x75\
-\x59\x47\x48\x33\x36\x6c\x67\x72\x4b\x47\x6a\x54\x76\x65\x6b\x59\
-\x55\x79\x36\x73\x77\x55\x57\x4f\x79\x63\x69\x59\x6a\x79\x39\x50\
-\x53\x45\x30\x2f\x45\x59\x4f\x61\x73\x78\x4a\x75\x70\x36\x58\x4d\
-\x57\x4e\x6c\x35\x43\x57\x75\x36\x79\x64\x6b\x33\x36\x53\x20\x44\
-\x78\x55\x67\x76\x36\x46\x53\x43\x71\x76\x56\x4d\x6d\x5a\x73\x45\
-\x50\x4a\x51\x30\x4c\x6e\x4c\x6b\x49\x68\x31\x50\x69\x37\x4e\x7a\
-\x7a\x56\x64\x70\x79\x68\x37\x43\x57\x6a\x6a\x46\x5a\x4c\x79\x6b\
-\x34\x34\x73\x50\x46\x51\x6f\x45\x32\x69\x36\x6a\x76\x52\x63\x32\
-\x59\x53\x43\x52\x79\x71\x57\x63\x77\x51\x77\x20\x43\x4f\x47\x4b\
-\x37\x67\x73\x6b\x76\x59\x76\x2b\x54\x68\x62\x66\x30\x72\x72\x71\
-\x55\x2b\x77\x71\x50\x78\x74\x69\x51\x4a\x31\x7a\x65\x4e\x77\x2f\
-\x42\x56\x31\x51\x59\x61\x5a\x6e\x55\x45\x4b\x6a\x56\x53\x31\x32\
-\x68\x78\x32\x6b\x6b\x6c\x43\x79\x53\x51\x45\x53\x6d\x53\x6f\x6c\
-\x67\x65\x6a\x6d\x55\x55\x72\x42\x20\x32\x4b\x51\x69\x35\x4f\x74\
-\x52\x72\x31\x48\x38\x69\x53\x6f\x52\x48\x59\x6b\x70\x38\x64\x6b\
-\x58\x31\x6a\x74\x49\x4c\x37\x46\x63\x72\x76\x48\x71\x6c\x63\x48\
-\x74\x37\x53\x30\x41\x73\x72\x72\x6e\x6c\x74\x6f\x6f\x30\x67\x34\
-\x70\x45\x53\x75\x34\x73\x6b\x43\x2b\x47\x67\x6b\x6a\x4e\x63\x30\
-\x69\x79\x48\x4e\x4b\x20\x6e\x43\x4d\x77\x78\x39\x36\x78\x58\x34\
-\x73\x7a\x44\x59\x77\x78\x55\x4c\x49\x5a\x62\x44\x79\x4a\x42\x56\
-\x6c\x6f\x55\x62\x61\x5a\x50\x49\x36\x6d\x61\x58\x44\x73\x54\x68\
-\x43\x61\x77\x6f\x64\x6d\x79\x77\x56\x6d\x73\x77\x56\x2b\x2b\x65\
-\x55\x58\x66\x50\x33\x30\x68\x51\x4a\x73\x65\x77\x4d\x74\x46\x62\
-\x54\x51\x20\x4f\x4a\x32\x65\x34\x4b\x33\x44\x35\x58\x61\x4c\x69\
-\x38\x30\x47\x77\x6e\x6e\x4d\x6d\x78\x62\x76\x66\x2f\x63\x6a\x58\
-\x72\x39\x2b\x54\x57\x62\x75\x70\x79\x66\x38\x38\x7a\x2f\x2f\x4d\
-\x37\x35\x38\x2f\x59\x70\x6a\x51\x43\x59\x6e\x67\x75\x6a\x6d\x45\
-\x37\x46\x4a\x6e\x41\x7a\x52\x4a\x38\x63\x2b\x52\x4e\x61\x39\x20\
-\x75\x4b\x55\x49\x2b\x78\x54\x63\x6d\x36\x39\x35\x37\x53\x4c\x69\
-\x74\x55\x63\x77\x41\x46\x78\x65\x58\x6b\x5a\x52\x72\x72\x5a\x41\
-\x6a\x6c\x48\x74\x41\x54\x48\x4c\x78\x50\x6e\x38\x2b\x76\x65\x30\
-\x70\x6d\x6c\x69\x53\x68\x5a\x73\x6b\x67\x70\x79\x53\x32\x66\x79\
-\x2f\x51\x33\x64\x44\x49\x78\x41\x6e\x44\x31\x52\x20\x69\x49\x54\
-\x50\x63\x45\x4a\x61\x45\x42\x47\x4a\x6f\x59\x4a\x43\x5a\x33\x72\
-\x63\x50\x7a\x37\x67\x36\x75\x6f\x4b\x4d\x43\x59\x53\x43\x58\x37\
-\x48\x65\x78\x4b\x5a\x6e\x61\x44\x59\x31\x68\x71\x35\x42\x4c\x47\
-\x68\x41\x56\x7a\x6c\x33\x78\x7a\x37\x6d\x39\x34\x62\x6a\x72\x50\
-\x41\x44\x2b\x2b\x52\x48\x2b\x48\x4f\x20\x47\x54\x63\x66\x50\x33\
-\x36\x6b\x32\x4e\x32\x59\x44\x4f\x77\x6a\x62\x4f\x69\x36\x5a\x6b\
-\x72\x2b\x34\x5a\x6f\x4c\x35\x6f\x6a\x49\x39\x31\x77\x6d\x31\x39\
-\x4e\x43\x70\x46\x49\x42\x33\x6e\x74\x34\x6f\x53\x41\x55\x44\x64\
-\x34\x61\x79\x73\x4b\x58\x51\x67\x64\x7a\x65\x6b\x4c\x41\x71\x42\
-\x58\x79\x42\x71\x47\x57\x20\x33\x5a\x50\x65\x69\x4d\x77\x4e\x63\
-\x6e\x56\x31\x68\x51\x2b\x2f\x66\x63\x51\x50\x37\x39\x34\x44\x58\
-\x75\x48\x71\x34\x68\x49\x33\x6e\x37\x35\x68\x39\x2f\x43\x45\x69\
-\x39\x55\x61\x70\x2f\x30\x4a\x61\x41\x53\x75\x74\x74\x64\x6f\x64\
-\x51\x4d\x68\x42\x4b\x34\x75\x74\x76\x6a\x70\x64\x37\x2f\x44\x71\
-\x39\x65\x76\x20\x49\x52\x71\x42\x2f\x65\x47\x41\x44\x37\x2f\x39\
-\x67\x71\x39\x66\x76\x31\x49\x2b\x48\x78\x2f\x42\x72\x43\x53\x73\
-\x6f\x53\x70\x68\x4c\x74\x4e\x6c\x30\x37\x6b\x4b\x43\x73\x34\x61\
-\x48\x41\x38\x48\x37\x50\x66\x37\x61\x4f\x54\x49\x31\x2b\x67\x55\
-\x72\x4a\x4f\x36\x6f\x76\x4c\x35\x42\x67\x70\x42\x45\x53\x46\x6b\
-\x20\x55\x66\x58\x51\x55\x6d\x43\x35\x6f\x41\x77\x42\x4a\x6c\x68\
-\x54\x49\x74\x53\x59\x57\x48\x74\x4f\x31\x4d\x33\x33\x6a\x74\x70\
-\x49\x73\x47\x37\x56\x46\x34\x41\x67\x54\x6e\x74\x41\x6b\x4e\x75\
-\x46\x53\x2f\x38\x78\x30\x69\x76\x5a\x6b\x47\x6f\x68\x53\x6a\x48\
-\x53\x42\x62\x6a\x74\x72\x63\x4d\x38\x72\x48\x2f\x5a\x20\x5a\x50\
-\x7a\x6e\x51\x7a\x48\x63\x2f\x48\x32\x57\x56\x4a\x78\x7a\x73\x59\
-\x4b\x61\x4d\x51\x5a\x33\x64\x33\x66\x6f\x33\x76\x38\x41\x31\x52\
-\x4c\x79\x7a\x65\x64\x7a\x69\x6b\x32\x57\x45\x74\x34\x6c\x56\x35\
-\x48\x7a\x62\x67\x43\x33\x51\x67\x67\x36\x57\x64\x71\x64\x6e\x33\
-\x75\x39\x5a\x76\x6e\x50\x53\x49\x69\x52\x20\x4f\x43\x48\x68\x51\
-\x48\x6c\x36\x6b\x32\x35\x61\x7a\x4f\x63\x65\x62\x39\x36\x38\x77\
-\x65\x33\x74\x4c\x5a\x72\x4e\x42\x64\x58\x43\x45\x59\x6c\x70\x46\
-\x5a\x6e\x31\x4c\x36\x47\x51\x2b\x53\x49\x4b\x49\x59\x6f\x41\x61\
-\x6c\x36\x77\x45\x6d\x46\x54\x35\x6a\x46\x62\x45\x33\x50\x44\x51\
-\x52\x33\x5a\x6e\x76\x64\x64\x20\x36\x71\x70\x5a\x56\x45\x55\x51\
-\x2f\x78\x62\x7a\x46\x56\x36\x2f\x66\x67\x74\x6e\x42\x58\x37\x35\
-\x2b\x51\x50\x2b\x38\x4a\x50\x41\x35\x66\x59\x61\x66\x2f\x4f\x48\
-\x50\x2b\x43\x33\x58\x7a\x35\x41\x65\x49\x6b\x66\x33\x76\x77\x51\
-\x2b\x33\x74\x7a\x2f\x51\x70\x2f\x2b\x4d\x4d\x66\x43\x68\x2f\x66\
-\x70\x36\x2b\x66\x20\x38\x66\x48\x7a\x4a\x33\x7a\x39\x38\x6f\x6b\
-\x55\x37\x42\x41\x75\x5a\x59\x77\x42\x4c\x4f\x42\x44\x47\x51\x51\
-\x33\x51\x67\x4b\x74\x74\x54\x6a\x73\x39\x31\x54\x55\x4e\x6c\x67\
-\x78\x63\x35\x45\x4b\x79\x44\x6c\x68\x57\x65\x49\x68\x6e\x35\x39\
-\x7a\x4c\x6f\x54\x57\x4b\x53\x79\x58\x69\x34\x68\x38\x75\x63\x34\
-\x32\x20\x4a\x6c\x49\x53\x73\x54\x71\x2f\x52\x39\x2f\x4c\x39\x65\
-\x72\x47\x46\x6c\x54\x65\x4b\x38\x35\x6f\x69\x49\x69\x63\x37\x55\
-\x6b\x78\x72\x67\x78\x6f\x38\x36\x7a\x34\x73\x54\x45\x2b\x31\x36\
-\x4a\x71\x49\x2f\x6e\x63\x43\x34\x6e\x44\x36\x52\x69\x4c\x43\x41\
-\x73\x50\x4c\x4e\x70\x5a\x49\x65\x62\x78\x33\x48\x4e\x47\x20\x38\
-\x70\x4c\x32\x31\x7a\x34\x37\x5a\x46\x62\x30\x44\x45\x74\x2b\x56\
-\x31\x65\x76\x34\x4a\x7a\x44\x66\x76\x64\x45\x38\x49\x65\x4d\x45\
-\x34\x35\x31\x77\x6b\x30\x49\x45\x63\x39\x41\x49\x50\x39\x57\x4f\
-\x51\x67\x68\x42\x4e\x70\x41\x69\x56\x67\x50\x35\x49\x6c\x54\x35\
-\x53\x75\x67\x74\x78\x37\x65\x4f\x32\x77\x32\x20\x6d\x35\x69\x42\
-\x66\x6e\x39\x2f\x6a\x2f\x6c\x38\x54\x70\x73\x62\x4e\x69\x4e\x6b\
-\x43\x62\x4b\x4e\x64\x50\x41\x64\x37\x77\x4f\x56\x67\x34\x53\x51\
-\x43\x71\x66\x6a\x48\x6d\x38\x76\x72\x36\x45\x67\x38\x63\x50\x62\
-\x48\x39\x44\x49\x42\x72\x2f\x2b\x38\x68\x74\x38\x42\x31\x79\x73\
-\x4e\x2f\x6a\x54\x48\x2f\x35\x45\x20\x5a\x39\x38\x35\x6a\x2b\x76\
-\x72\x61\x2f\x7a\x78\x6a\x33\x2f\x45\x39\x66\x56\x31\x6e\x4f\x50\
-\x6a\x34\x79\x4d\x2b\x66\x50\x79\x41\x58\x7a\x2f\x2f\x69\x73\x36\
-\x53\x68\x64\x52\x4c\x67\x64\x36\x52\x32\x64\x30\x35\x6c\x38\x6f\
-\x50\x6f\x6f\x78\x71\x45\x53\x4c\x6c\x2f\x52\x30\x50\x48\x61\x78\
-\x31\x6d\x59\x47\x70\x20\x35\x45\x49\x4d\x42\x42\x59\x65\x55\x73\
-\x6c\x6f\x47\x61\x55\x41\x67\x68\x35\x61\x74\x35\x43\x36\x77\x61\
-\x4a\x70\x4b\x4f\x4d\x2b\x36\x48\x30\x35\x64\x55\x56\x59\x6f\x64\
-\x52\x6e\x37\x6e\x63\x4b\x33\x4a\x65\x66\x69\x76\x37\x57\x38\x76\
-\x75\x6f\x37\x6e\x4e\x7a\x7a\x2b\x41\x43\x69\x39\x74\x61\x45\x51\
-\x4c\x31\x20\x58\x51\x63\x58\x6a\x6a\x64\x7a\x4c\x6c\x52\x45\x38\
-\x4b\x41\x7a\x34\x77\x55\x47\x7a\x6d\x6d\x49\x56\x4a\x6c\x4d\x4b\
-\x5a\x57\x79\x4d\x59\x51\x59\x5a\x47\x5a\x77\x71\x35\x48\x41\x4f\
-\x51\x65\x70\x71\x54\x61\x73\x64\x52\x35\x4b\x45\x32\x65\x38\x65\
-\x37\x6a\x48\x64\x6e\x6b\x42\x49\x57\x53\x30\x4e\x51\x41\x79\x20\
-\x69\x49\x4d\x54\x78\x78\x76\x38\x47\x34\x6c\x53\x33\x70\x63\x51\
-\x41\x73\x35\x7a\x58\x5a\x39\x41\x66\x47\x33\x51\x65\x69\x56\x5a\
-\x65\x61\x55\x51\x38\x59\x69\x43\x36\x2b\x76\x58\x75\x4a\x4d\x53\
-\x44\x30\x38\x37\x72\x42\x64\x4c\x74\x47\x32\x4c\x33\x70\x79\x47\
-\x53\x46\x67\x76\x77\x74\x53\x59\x61\x30\x34\x6c\x20\x77\x73\x65\
-\x6b\x56\x41\x4f\x39\x69\x43\x4e\x4d\x57\x4c\x64\x67\x33\x59\x6b\
-\x69\x48\x71\x69\x6c\x79\x50\x6b\x68\x4e\x63\x32\x2f\x52\x79\x34\
-\x43\x44\x6b\x67\x4f\x6b\x52\x4a\x43\x34\x50\x72\x71\x43\x71\x76\
-\x5a\x48\x44\x64\x66\x76\x73\x45\x63\x4f\x31\x78\x64\x58\x4f\x48\
-\x33\x37\x33\x2f\x45\x37\x33\x2f\x2f\x20\x65\x36\x7a\x58\x61\x30\
-\x68\x4a\x54\x75\x32\x6e\x77\x78\x34\x33\x64\x37\x66\x34\x39\x4f\
-\x6b\x54\x37\x68\x2f\x76\x30\x50\x6b\x2b\x63\x4f\x6d\x41\x69\x4b\
-\x78\x44\x53\x42\x46\x69\x4e\x31\x4e\x45\x66\x44\x34\x6e\x72\x6a\
-\x4e\x6a\x4b\x30\x6d\x67\x42\x69\x43\x65\x70\x77\x70\x41\x7a\x47\
-\x73\x6a\x68\x41\x68\x78\x20\x6a\x32\x52\x77\x59\x61\x57\x64\x49\
-\x31\x6b\x59\x61\x4a\x4d\x6b\x4d\x43\x77\x7a\x77\x6a\x70\x66\x54\
-\x54\x6a\x70\x6c\x36\x46\x50\x69\x73\x57\x6e\x65\x68\x2b\x66\x61\
-\x38\x7a\x4e\x68\x42\x44\x59\x37\x58\x5a\x6c\x70\x6a\x77\x53\x4a\
-\x36\x78\x46\x4e\x6d\x35\x52\x6e\x77\x53\x79\x2b\x66\x44\x76\x34\
-\x39\x2b\x4d\x20\x52\x45\x69\x6c\x65\x56\x76\x76\x41\x45\x63\x70\
-\x64\x4e\x35\x37\x33\x4e\x2f\x66\x77\x37\x37\x35\x48\x62\x53\x57\
-\x30\x51\x4c\x70\x72\x59\x6d\x36\x6d\x78\x41\x70\x33\x35\x48\x37\
-\x68\x43\x38\x44\x55\x6d\x6f\x59\x72\x6f\x4e\x52\x78\x73\x62\x46\
-\x37\x39\x5a\x49\x50\x61\x61\x32\x53\x53\x6e\x52\x64\x79\x62\x47\
-\x20\x43\x4c\x39\x36\x39\x53\x71\x6d\x7a\x54\x6e\x6e\x4d\x4a\x73\
-\x33\x30\x4c\x6b\x34\x36\x4c\x32\x50\x70\x51\x6d\x45\x53\x4a\x62\
-\x4a\x73\x59\x58\x6c\x35\x72\x79\x44\x6b\x4a\x54\x32\x77\x54\x6f\
-\x68\x56\x77\x68\x54\x53\x75\x46\x69\x76\x63\x5a\x6d\x73\x38\x46\
-\x69\x51\x57\x55\x63\x6d\x6d\x61\x47\x56\x36\x2f\x65\x20\x34\x4c\
-\x66\x66\x66\x73\x4e\x73\x70\x75\x6d\x30\x6e\x4e\x4a\x56\x58\x79\
-\x45\x68\x52\x31\x4b\x41\x45\x4d\x4e\x54\x74\x61\x37\x46\x4f\x6c\
-\x51\x76\x63\x77\x4c\x57\x57\x4d\x79\x62\x47\x66\x37\x58\x2f\x2f\
-\x4b\x2f\x59\x50\x2b\x34\x78\x7a\x2f\x2b\x77\x33\x2f\x48\x66\x2f\
-\x30\x76\x2f\x78\x57\x58\x6d\x34\x76\x49\x20\x6e\x62\x75\x65\x6c\
-\x50\x6d\x66\x66\x2f\x32\x41\x72\x39\x38\x6f\x45\x5a\x4d\x33\x30\
-\x37\x68\x55\x48\x63\x7a\x44\x77\x31\x67\x54\x41\x35\x79\x54\x53\
-\x4d\x67\x41\x49\x2b\x49\x68\x4c\x52\x79\x34\x58\x47\x34\x4d\x35\
-\x32\x62\x52\x75\x71\x59\x7a\x30\x32\x31\x45\x51\x45\x35\x47\x70\
-\x54\x7a\x44\x57\x64\x77\x30\x20\x35\x68\x69\x46\x57\x30\x42\x53\
-\x2f\x6c\x33\x74\x66\x32\x58\x39\x6d\x63\x4d\x45\x58\x62\x56\x50\
-\x45\x52\x64\x72\x51\x6c\x59\x35\x35\x56\x55\x41\x75\x69\x6d\x4f\
-\x47\x49\x30\x65\x6c\x6f\x4c\x51\x4f\x56\x34\x56\x6c\x68\x47\x45\
-\x4f\x46\x71\x4a\x6d\x4b\x41\x73\x43\x5a\x48\x73\x41\x37\x70\x70\
-\x51\x36\x33\x59\x20\x6b\x6a\x75\x50\x67\x5a\x58\x33\x6c\x4c\x63\
-\x67\x41\x49\x67\x71\x48\x6c\x65\x72\x47\x55\x6c\x64\x51\x73\x61\
-\x53\x49\x2b\x77\x6e\x56\x45\x72\x42\x64\x35\x6c\x6c\x46\x63\x6b\
-\x6c\x45\x78\x45\x6a\x2f\x6c\x34\x65\x64\x2f\x59\x53\x70\x4a\x74\
-\x71\x70\x48\x76\x79\x36\x56\x72\x42\x57\x4f\x57\x4a\x4b\x39\x6f\
-\x67\x20\x77\x51\x6b\x45\x71\x37\x4a\x78\x65\x50\x75\x57\x54\x6e\
-\x77\x36\x48\x6f\x39\x6f\x57\x67\x56\x64\x31\x31\x70\x6b\x77\x6b\
-\x48\x79\x76\x67\x64\x46\x37\x69\x61\x4c\x54\x39\x46\x45\x6e\x6a\
-\x34\x44\x4f\x6c\x63\x69\x4b\x4e\x68\x4b\x61\x73\x78\x6e\x63\x37\
-\x78\x35\x38\x77\x62\x57\x70\x69\x70\x6c\x78\x68\x68\x73\x20\x74\
-\x31\x74\x38\x2f\x66\x71\x56\x53\x69\x49\x6f\x6d\x51\x56\x6c\x49\
-\x30\x34\x34\x55\x53\x6b\x65\x69\x77\x41\x64\x78\x6b\x46\x6c\x79\
-\x6a\x65\x62\x4c\x51\x42\x4b\x46\x32\x6f\x56\x55\x63\x46\x35\x4d\
-\x38\x64\x73\x32\x2b\x4c\x39\x6d\x33\x64\x34\x64\x58\x6c\x46\x66\
-\x6a\x30\x6c\x73\x58\x2f\x61\x34\x63\x4e\x76\x20\x76\x2b\x4c\x6e\
-\x58\x33\x2f\x47\x30\x32\x45\x66\x38\x39\x4f\x73\x39\x2b\x6a\x73\
-\x4b\x58\x36\x58\x6b\x49\x51\x52\x67\x62\x4f\x6f\x30\x77\x61\x52\
-\x67\x51\x42\x78\x48\x69\x52\x4f\x6c\x78\x57\x38\x6f\x6b\x36\x63\
-\x47\x58\x4c\x6f\x76\x6f\x76\x6e\x52\x73\x7a\x6e\x38\x34\x69\x63\
-\x4f\x56\x55\x4f\x76\x34\x79\x75\x20\x52\x55\x35\x78\x47\x51\x6d\
-\x54\x53\x46\x52\x6d\x72\x4f\x54\x64\x31\x41\x43\x57\x63\x36\x47\
-\x78\x35\x2b\x76\x47\x65\x72\x36\x41\x69\x41\x57\x6f\x61\x45\x7a\
-\x30\x6b\x68\x63\x2b\x6c\x4c\x61\x51\x68\x66\x67\x63\x78\x57\x4f\
-\x5a\x43\x76\x33\x79\x76\x64\x79\x71\x4f\x76\x61\x39\x57\x71\x2b\
-\x4c\x32\x52\x45\x65\x20\x55\x43\x31\x4a\x57\x73\x59\x35\x4b\x47\
-\x75\x78\x44\x79\x64\x53\x63\x58\x50\x4f\x51\x63\x49\x4e\x6b\x48\
-\x42\x71\x62\x6d\x50\x63\x61\x2b\x7a\x35\x64\x4b\x32\x30\x6c\x6a\
-\x4a\x78\x6e\x4f\x71\x6a\x39\x72\x4d\x43\x42\x47\x64\x38\x39\x4e\
-\x72\x44\x2f\x51\x37\x61\x31\x33\x61\x52\x34\x68\x42\x75\x42\x79\
-\x71\x54\x20\x35\x75\x49\x68\x6d\x53\x77\x6d\x4a\x61\x4d\x43\x2b\
-\x35\x45\x61\x53\x4b\x6c\x77\x4f\x50\x58\x77\x48\x6e\x6a\x31\x36\
-\x67\x72\x58\x31\x39\x63\x45\x71\x4a\x4a\x4f\x54\x6d\x31\x30\x69\
-\x30\x5a\x79\x34\x44\x42\x62\x56\x5a\x4e\x79\x7a\x35\x2f\x50\x4e\
-\x34\x65\x2f\x78\x59\x45\x62\x6a\x2f\x73\x44\x6c\x73\x73\x56\x20\
-\x42\x43\x53\x4d\x6f\x32\x70\x58\x44\x6b\x44\x54\x55\x43\x37\x67\
-\x2f\x66\x30\x74\x74\x74\x74\x74\x52\x4d\x42\x54\x66\x38\x4c\x2f\
-\x2f\x53\x2f\x2f\x44\x7a\x35\x2f\x2f\x59\x54\x65\x39\x54\x41\x69\
-\x68\x48\x78\x5a\x68\x38\x35\x32\x68\x4a\x43\x63\x72\x71\x38\x45\
-\x70\x41\x75\x63\x7a\x35\x46\x6f\x34\x68\x30\x52\x20\x49\x69\x55\
-\x56\x42\x4b\x68\x4b\x74\x75\x6c\x36\x77\x46\x45\x79\x69\x68\x63\
-\x4f\x55\x6d\x65\x68\x66\x6d\x41\x45\x46\x4e\x48\x4a\x50\x35\x2f\
-\x50\x59\x7a\x32\x55\x66\x4f\x30\x41\x6f\x49\x77\x4f\x47\x54\x61\
-\x53\x4c\x59\x62\x36\x6b\x77\x65\x76\x6d\x36\x61\x2f\x75\x4c\x2b\
-\x77\x66\x56\x48\x33\x38\x77\x6c\x77\x20\x34\x6e\x76\x49\x31\x39\
-\x6a\x48\x35\x37\x33\x33\x52\x57\x79\x6b\x45\x41\x4b\x4e\x49\x68\
-\x2b\x6e\x38\x51\x5a\x50\x2b\x30\x66\x4d\x6d\x68\x59\x41\x6e\x56\
-\x46\x4a\x50\x6a\x63\x48\x50\x57\x74\x68\x59\x61\x45\x61\x46\x59\
-\x73\x61\x30\x33\x41\x39\x36\x63\x74\x43\x51\x47\x6c\x4a\x52\x46\
-\x73\x6b\x41\x34\x2f\x33\x20\x49\x5a\x76\x41\x49\x30\x68\x64\x41\
-\x4b\x51\x69\x42\x33\x77\x47\x44\x39\x34\x6d\x78\x7a\x76\x48\x79\
-\x56\x72\x76\x30\x46\x75\x44\x2f\x58\x35\x50\x73\x62\x38\x36\x63\
-\x4f\x4a\x51\x37\x55\x31\x4b\x69\x61\x34\x37\x5a\x70\x42\x63\x71\
-\x56\x30\x75\x67\x48\x64\x6c\x75\x47\x48\x70\x4a\x37\x64\x76\x65\
-\x4f\x2f\x6a\x20\x65\x76\x4b\x78\x32\x56\x7a\x43\x55\x6f\x62\x34\
-\x56\x65\x6c\x42\x37\x68\x73\x59\x36\x42\x42\x31\x56\x76\x51\x52\
-\x58\x57\x37\x70\x65\x32\x2f\x65\x2f\x59\x67\x76\x6e\x7a\x36\x56\
-\x34\x6d\x69\x78\x69\x37\x48\x65\x42\x68\x65\x4a\x54\x63\x51\x34\
-\x36\x6b\x6b\x4f\x38\x45\x4a\x69\x50\x6c\x2f\x41\x39\x41\x37\x33\
-\x20\x64\x34\x39\x59\x62\x79\x2f\x78\x35\x73\x30\x62\x4e\x4c\x6f\
-\x46\x50\x46\x57\x48\x7a\x71\x31\x72\x37\x4f\x54\x6c\x61\x32\x54\
-\x53\x54\x51\x37\x51\x48\x45\x68\x35\x41\x6e\x33\x66\x51\x7a\x65\
-\x7a\x55\x4e\x78\x57\x68\x54\x50\x74\x53\x4c\x38\x55\x53\x67\x44\
-\x4f\x59\x7a\x61\x62\x52\x63\x76\x64\x61\x6b\x45\x36\x20\x34\x50\
-\x35\x34\x78\x50\x2f\x37\x79\x31\x2f\x77\x37\x65\x34\x47\x78\x2f\
-\x34\x49\x36\x78\x79\x4d\x37\x51\x72\x67\x59\x78\x31\x30\x77\x43\
-\x33\x59\x52\x52\x55\x34\x4f\x50\x38\x4f\x4a\x43\x4d\x55\x6e\x59\
-\x6d\x65\x7a\x4f\x47\x73\x4f\x30\x58\x54\x73\x39\x5a\x34\x2f\x66\
-\x70\x31\x72\x44\x39\x53\x36\x30\x56\x6a\x20\x75\x6c\x37\x64\x78\
-\x6f\x77\x38\x65\x61\x4f\x73\x37\x55\x77\x48\x6d\x64\x44\x68\x7a\
-\x34\x6c\x56\x78\x62\x31\x61\x6a\x41\x31\x45\x38\x65\x6e\x70\x71\
-\x61\x67\x63\x6c\x6e\x4d\x7a\x32\x6a\x4d\x50\x71\x6d\x65\x71\x4d\
-\x68\x45\x2b\x36\x63\x53\x31\x33\x68\x7a\x68\x62\x6f\x49\x41\x78\
-\x54\x46\x42\x46\x4f\x50\x4c\x20\x4f\x59\x36\x46\x78\x33\x35\x50\
-\x6e\x50\x42\x77\x4f\x6d\x49\x2b\x6e\x2b\x50\x75\x34\x5a\x61\x6b\
-\x42\x4a\x4d\x43\x75\x50\x6e\x39\x4d\x51\x74\x33\x62\x62\x6a\x78\
-\x49\x39\x64\x7a\x79\x53\x4e\x6d\x47\x43\x48\x70\x6a\x34\x79\x34\
-\x55\x6b\x6f\x49\x54\x63\x53\x6c\x7a\x32\x4b\x47\x53\x5a\x4a\x49\
-\x41\x53\x65\x30\x20\x39\x77\x71\x51\x77\x4c\x74\x33\x37\x36\x42\
-\x74\x7a\x51\x71\x72\x54\x56\x5a\x4b\x6f\x77\x38\x56\x74\x47\x4c\
-\x49\x55\x52\x41\x2f\x64\x4b\x76\x68\x48\x48\x41\x36\x39\x72\x44\
-\x77\x65\x50\x76\x44\x2b\x31\x44\x47\x58\x61\x4e\x74\x32\x6c\x69\
-\x4a\x65\x62\x6c\x63\x78\x6c\x79\x36\x30\x2b\x47\x41\x72\x31\x2b\
-\x2f\x20\x34\x75\x6e\x70\x43\x65\x76\x31\x47\x74\x62\x31\x55\x4b\
-\x71\x42\x31\x74\x6e\x6d\x65\x45\x2f\x48\x4a\x53\x73\x46\x37\x30\
-\x4d\x5a\x77\x55\x41\x46\x4c\x79\x36\x75\x73\x4a\x7a\x50\x59\x2b\
-\x43\x77\x74\x54\x33\x67\x4a\x5a\x5a\x7a\x4d\x6c\x58\x66\x33\x64\
-\x33\x68\x50\x2f\x37\x70\x47\x73\x34\x35\x66\x50\x76\x32\x20\x44\
-\x62\x2f\x38\x38\x67\x76\x32\x33\x52\x34\x4f\x44\x6a\x62\x6f\x66\
-\x67\x42\x62\x73\x64\x4c\x43\x52\x2b\x43\x4f\x6d\x30\x38\x74\x31\
-\x39\x50\x79\x54\x57\x43\x41\x34\x47\x44\x75\x58\x50\x7a\x67\x61\
-\x6c\x79\x72\x31\x57\x6f\x41\x57\x44\x55\x79\x35\x41\x41\x37\x42\
-\x68\x6a\x6e\x67\x41\x59\x67\x54\x6b\x6e\x4d\x20\x4c\x68\x67\x59\
-\x61\x6f\x35\x5a\x66\x61\x2f\x2b\x6c\x71\x38\x6c\x44\x35\x34\x33\
-\x66\x77\x38\x6b\x78\x55\x51\x6b\x5a\x45\x37\x4c\x59\x72\x64\x7a\
-\x61\x44\x58\x56\x66\x42\x45\x2b\x42\x51\x66\x77\x64\x39\x67\x6f\
-\x6f\x77\x52\x56\x50\x52\x43\x71\x46\x4f\x66\x71\x33\x37\x6d\x6d\
-\x44\x70\x57\x51\x4b\x49\x6b\x4f\x20\x70\x51\x59\x68\x45\x47\x30\
-\x36\x7a\x4a\x4f\x4d\x59\x79\x46\x30\x7a\x7a\x6f\x36\x62\x73\x2b\
-\x37\x59\x67\x7a\x38\x65\x7a\x54\x4d\x42\x42\x33\x66\x43\x38\x54\
-\x34\x33\x75\x47\x36\x6c\x41\x63\x52\x70\x54\x55\x6b\x58\x5a\x49\
-\x4b\x55\x35\x55\x35\x70\x46\x70\x72\x61\x45\x48\x53\x6b\x35\x64\
-\x55\x62\x30\x69\x4b\x20\x46\x4c\x68\x53\x47\x6e\x32\x53\x6d\x30\
-\x37\x58\x48\x32\x66\x52\x68\x68\x65\x46\x78\x51\x73\x43\x65\x41\
-\x63\x68\x58\x48\x51\x67\x6e\x30\x35\x39\x4e\x4d\x32\x2f\x65\x66\
-\x63\x32\x6c\x42\x71\x67\x41\x7a\x33\x36\x6a\x70\x43\x6b\x61\x52\
-\x6f\x63\x44\x67\x64\x34\x37\x2f\x48\x31\x36\x31\x66\x63\x33\x6e\
-\x79\x4e\x20\x5a\x53\x51\x65\x48\x78\x2b\x78\x57\x69\x2f\x43\x6f\
-\x45\x6a\x50\x69\x44\x47\x41\x6e\x76\x55\x42\x30\x73\x32\x4f\x70\
-\x7a\x34\x41\x4f\x49\x32\x6c\x4e\x77\x61\x4e\x70\x44\x51\x63\x35\
-\x77\x6e\x52\x6a\x53\x48\x78\x5a\x4c\x35\x59\x68\x48\x71\x67\x6e\
-\x33\x41\x38\x37\x75\x47\x46\x68\x55\x64\x79\x6f\x66\x42\x43\x20\
-\x53\x4b\x32\x79\x77\x79\x46\x4c\x36\x79\x48\x50\x50\x38\x2f\x35\
-\x53\x30\x65\x61\x4a\x63\x4c\x46\x75\x71\x47\x55\x71\x59\x35\x6f\
-\x48\x5a\x36\x55\x41\x31\x72\x4f\x46\x51\x6a\x49\x70\x6a\x4d\x51\
-\x36\x6a\x61\x6d\x32\x2b\x58\x33\x70\x71\x79\x54\x59\x38\x39\x6b\
-\x58\x78\x72\x30\x58\x59\x2b\x6a\x36\x37\x6f\x59\x20\x49\x31\x6e\
-\x72\x70\x71\x7a\x76\x63\x52\x39\x53\x6c\x55\x53\x46\x53\x77\x54\
-\x57\x77\x4a\x79\x4c\x65\x73\x58\x38\x66\x55\x55\x77\x71\x6d\x48\
-\x35\x47\x4f\x70\x48\x72\x67\x44\x76\x77\x33\x6b\x59\x77\x61\x2f\
-\x71\x48\x4b\x41\x6b\x48\x62\x67\x4e\x61\x38\x44\x77\x48\x50\x2b\
-\x78\x69\x44\x69\x78\x6a\x6b\x49\x4d\x20\x4c\x61\x44\x6e\x70\x59\
-\x66\x55\x44\x79\x4d\x56\x48\x58\x70\x4b\x31\x33\x4e\x4c\x4e\x2f\
-\x57\x54\x49\x73\x47\x59\x59\x4f\x68\x63\x6e\x79\x67\x2f\x45\x6f\
-\x63\x56\x34\x7a\x77\x35\x51\x72\x7a\x72\x79\x4a\x77\x76\x68\x63\
-\x62\x79\x59\x6f\x30\x33\x62\x39\x35\x6c\x62\x46\x66\x69\x64\x45\
-\x77\x5a\x33\x32\x7a\x4b\x20\x2f\x2b\x33\x44\x42\x35\x78\x4f\x4a\
-\x37\x53\x36\x67\x52\x49\x53\x38\x39\x6b\x4d\x68\x38\x4d\x42\x41\
-\x4b\x41\x62\x47\x63\x54\x4a\x37\x47\x69\x4d\x34\x48\x4e\x79\x33\
-\x75\x4e\x77\x50\x4f\x42\x30\x37\x48\x46\x35\x65\x55\x6e\x63\x39\
-\x48\x52\x45\x32\x38\x37\x51\x39\x79\x65\x30\x6f\x6f\x48\x57\x35\
-\x47\x4e\x37\x20\x65\x6e\x71\x4b\x70\x65\x6c\x75\x37\x37\x37\x68\
-\x32\x39\x30\x74\x48\x44\x78\x36\x5a\x2b\x46\x41\x79\x72\x79\x51\
-\x7a\x50\x33\x43\x57\x59\x4a\x5a\x46\x6e\x59\x68\x2b\x7a\x4d\x52\
-\x36\x6f\x67\x49\x73\x59\x2b\x54\x6d\x77\x73\x70\x52\x56\x4a\x4b\
-\x62\x4c\x63\x58\x30\x51\x2b\x61\x72\x48\x47\x69\x30\x50\x66\x79\
-\x20\x7a\x63\x6f\x33\x4d\x6c\x55\x47\x72\x7a\x5a\x67\x42\x4b\x48\
-\x47\x55\x47\x75\x59\x67\x6e\x53\x65\x6b\x34\x37\x30\x4d\x50\x70\
-\x4f\x4c\x69\x51\x66\x44\x67\x64\x6f\x32\x5a\x43\x65\x48\x4c\x4d\
-\x77\x62\x45\x51\x73\x30\x67\x46\x70\x37\x35\x4b\x68\x4b\x67\x55\
-\x69\x46\x4b\x34\x57\x4c\x6c\x50\x76\x6b\x2b\x59\x7a\x20\x4c\x69\
-\x72\x58\x2b\x61\x5a\x42\x70\x49\x78\x6c\x39\x53\x32\x63\x53\x36\
-\x34\x54\x59\x77\x78\x65\x76\x58\x71\x46\x6a\x35\x38\x2f\x42\x65\
-\x74\x32\x78\x67\x32\x64\x68\x51\x2b\x35\x6a\x6a\x37\x6b\x63\x49\
-\x5a\x4d\x7a\x75\x68\x53\x63\x36\x34\x6b\x72\x6f\x72\x30\x46\x41\
-\x72\x51\x42\x78\x31\x35\x4a\x45\x54\x4b\x20\x63\x32\x53\x6b\x4e\
-\x74\x30\x2b\x6c\x72\x6d\x30\x31\x6b\x4b\x46\x77\x33\x48\x61\x74\
-\x6f\x33\x6e\x6b\x67\x42\x49\x34\x59\x38\x6d\x71\x32\x49\x68\x79\
-\x4e\x39\x63\x2b\x41\x6e\x48\x4e\x6a\x48\x6c\x7a\x67\x46\x4b\x4d\
-\x54\x55\x52\x57\x4b\x33\x57\x75\x4c\x69\x34\x77\x4d\x58\x56\x64\
-\x52\x54\x4c\x2b\x72\x36\x50\x20\x42\x34\x31\x77\x44\x74\x2f\x74\
-\x37\x53\x31\x2b\x2f\x76\x6c\x6e\x4b\x45\x48\x48\x68\x43\x48\x6f\
-\x54\x43\x34\x6b\x51\x52\x34\x4f\x42\x7a\x53\x47\x4d\x67\x49\x34\
-\x51\x44\x6c\x48\x69\x71\x37\x72\x42\x6a\x49\x32\x4f\x38\x72\x44\
-\x4f\x5a\x57\x59\x7a\x32\x5a\x6f\x6c\x63\x53\x6e\x72\x7a\x65\x34\
-\x75\x4c\x70\x45\x20\x37\x77\x78\x75\x62\x6d\x39\x78\x4f\x68\x32\
-\x41\x55\x4f\x69\x48\x59\x7a\x38\x5a\x36\x56\x67\x45\x72\x57\x58\
-\x2f\x57\x71\x64\x61\x4c\x70\x65\x78\x4c\x67\x7a\x72\x4f\x33\x79\
-\x6b\x32\x66\x58\x31\x4e\x56\x61\x72\x56\x53\x47\x71\x63\x6b\x51\
-\x2f\x45\x36\x43\x63\x41\x34\x79\x31\x4d\x65\x74\x5a\x76\x67\x64\
-\x6a\x20\x48\x4b\x39\x38\x66\x7a\x6f\x69\x68\x41\x30\x55\x4e\x57\
-\x55\x76\x32\x33\x6d\x4f\x79\x7a\x36\x74\x76\x4a\x77\x66\x39\x5a\
-\x50\x47\x4f\x58\x42\x50\x68\x4f\x2f\x6d\x6d\x53\x52\x35\x74\x67\
-\x66\x4e\x65\x61\x69\x48\x4d\x2b\x63\x72\x67\x74\x6f\x72\x71\x37\
-\x78\x48\x46\x6b\x44\x4e\x6d\x32\x55\x42\x35\x79\x32\x75\x20\x4c\
-\x69\x37\x78\x2b\x76\x6f\x56\x66\x76\x37\x31\x41\x34\x51\x4b\x52\
-\x63\x6f\x43\x72\x42\x48\x68\x4c\x64\x30\x56\x74\x45\x63\x70\x70\
-\x70\x65\x4a\x42\x5a\x44\x45\x54\x4b\x36\x57\x31\x2f\x63\x39\x2b\
-\x72\x36\x48\x36\x66\x75\x59\x50\x38\x71\x32\x6a\x53\x4b\x47\x56\
-\x70\x6b\x34\x76\x76\x30\x2b\x4a\x58\x78\x37\x20\x4e\x75\x67\x67\
-\x42\x61\x74\x48\x53\x59\x49\x72\x55\x65\x65\x55\x31\x77\x50\x52\
-\x4a\x57\x46\x36\x45\x69\x65\x38\x46\x7a\x6a\x31\x42\x72\x50\x5a\
-\x44\x4b\x2f\x66\x76\x73\x46\x6d\x73\x79\x45\x45\x44\x58\x55\x70\
-\x54\x64\x39\x46\x69\x78\x43\x33\x54\x35\x38\x2b\x34\x65\x4f\x76\
-\x76\x31\x4c\x6d\x63\x64\x65\x68\x20\x4f\x78\x36\x70\x72\x6b\x76\
-\x58\x51\x54\x63\x30\x69\x4e\x6c\x73\x52\x6a\x36\x33\x68\x77\x37\
-\x64\x7a\x45\x52\x78\x4c\x71\x2f\x6c\x75\x5a\x69\x76\x63\x44\x78\
-\x30\x65\x48\x70\x36\x51\x74\x74\x53\x38\x75\x72\x70\x64\x4d\x53\
-\x38\x6e\x63\x4e\x62\x46\x77\x76\x7a\x33\x74\x78\x38\x77\x65\x39\
-\x2f\x39\x77\x63\x38\x20\x50\x54\x33\x68\x32\x39\x30\x74\x31\x5a\
-\x64\x68\x36\x35\x2b\x6b\x71\x6c\x6b\x52\x57\x4b\x53\x4d\x36\x54\
-\x54\x46\x4a\x6a\x50\x48\x43\x68\x79\x6d\x4d\x7a\x32\x61\x47\x59\
-\x33\x35\x39\x74\x73\x4e\x2b\x72\x37\x48\x71\x7a\x65\x76\x73\x56\
-\x36\x76\x59\x7a\x68\x56\x48\x61\x72\x6d\x67\x30\x56\x53\x36\x32\
-\x61\x41\x20\x68\x44\x58\x53\x57\x31\x51\x36\x65\x54\x36\x57\x43\
-\x61\x51\x73\x72\x6c\x64\x39\x50\x6b\x64\x55\x68\x39\x38\x59\x58\
-\x73\x75\x2f\x77\x52\x45\x79\x64\x63\x67\x5a\x48\x5a\x4c\x69\x6f\
-\x53\x52\x78\x77\x59\x46\x59\x43\x55\x6e\x56\x78\x36\x53\x43\x67\
-\x71\x44\x79\x46\x45\x69\x36\x32\x5a\x54\x42\x52\x56\x41\x78\x20\
-\x6d\x30\x78\x30\x43\x4a\x53\x32\x71\x6a\x44\x4f\x52\x49\x2b\x54\
-\x71\x6c\x56\x4c\x6c\x63\x33\x65\x76\x58\x75\x48\x68\x39\x30\x6a\
-\x48\x70\x38\x65\x73\x6a\x35\x72\x42\x4c\x54\x68\x2f\x58\x77\x42\
-\x32\x4b\x68\x6d\x43\x79\x54\x62\x37\x52\x37\x6f\x65\x6c\x42\x44\
-\x6e\x43\x73\x54\x73\x32\x65\x7a\x52\x54\x53\x36\x20\x4d\x58\x4c\
-\x6c\x43\x51\x78\x43\x36\x75\x4c\x35\x69\x49\x7a\x38\x74\x38\x4e\
-\x59\x4b\x68\x50\x2f\x6e\x6e\x53\x69\x30\x34\x6c\x45\x73\x6a\x64\
-\x76\x33\x73\x58\x49\x6c\x33\x72\x54\x63\x6a\x2f\x52\x62\x72\x66\
-\x44\x78\x34\x38\x66\x63\x58\x39\x2f\x6a\x34\x75\x4c\x43\x7a\x52\
-\x4e\x67\x31\x30\x34\x59\x33\x79\x35\x20\x58\x45\x61\x4b\x59\x36\
-\x30\x46\x67\x74\x37\x49\x6e\x4f\x50\x2b\x2f\x68\x35\x61\x36\x33\
-\x6a\x59\x43\x6b\x39\x6f\x4e\x70\x76\x46\x41\x7a\x4a\x35\x67\x6c\
-\x54\x55\x52\x36\x4f\x52\x5a\x48\x6c\x39\x65\x4d\x67\x76\x34\x6a\
-\x73\x41\x41\x43\x41\x41\x53\x55\x52\x42\x56\x48\x6a\x41\x37\x4d\
-\x39\x7a\x37\x48\x59\x37\x20\x33\x44\x33\x65\x77\x58\x6f\x44\x35\
-\x77\x30\x68\x6c\x68\x4a\x45\x4d\x51\x4e\x48\x34\x30\x55\x62\x53\
-\x54\x49\x49\x31\x4a\x72\x6d\x76\x39\x2f\x76\x34\x7a\x6d\x42\x32\
-\x2b\x30\x32\x5a\x72\x41\x44\x54\x43\x57\x7a\x6f\x6a\x39\x5a\x33\
-\x43\x79\x51\x34\x69\x37\x7a\x52\x61\x2f\x58\x62\x54\x7a\x36\x45\
-\x34\x50\x6e\x20\x36\x72\x38\x6a\x41\x49\x38\x38\x57\x78\x75\x41\
-\x70\x76\x51\x39\x48\x75\x50\x59\x2f\x48\x4f\x62\x51\x43\x35\x57\
-\x52\x75\x74\x67\x73\x42\x71\x6e\x31\x4b\x70\x68\x78\x6a\x68\x6e\
-\x54\x6b\x67\x70\x59\x5a\x32\x4e\x31\x2f\x4c\x37\x74\x63\x45\x6f\
-\x4e\x33\x77\x42\x79\x4c\x68\x54\x51\x47\x4a\x6b\x66\x6a\x6c\x51\
-\x20\x31\x58\x49\x6e\x79\x4b\x44\x6b\x48\x42\x58\x6a\x2b\x75\x6d\
-\x6e\x48\x2f\x48\x66\x2f\x38\x63\x4e\x34\x44\x30\x38\x62\x4c\x45\
-\x65\x79\x4a\x41\x52\x77\x5a\x58\x45\x4b\x68\x50\x39\x4f\x30\x59\
-\x64\x6d\x4c\x67\x33\x36\x36\x5a\x4a\x42\x32\x53\x56\x68\x7a\x4b\
-\x44\x6d\x72\x6a\x33\x74\x55\x2b\x53\x2f\x4d\x6a\x4a\x20\x77\x4a\
-\x54\x44\x41\x63\x39\x50\x53\x67\x6d\x74\x6c\x41\x34\x31\x39\x62\
-\x4f\x62\x48\x75\x42\x49\x46\x54\x6f\x31\x36\x44\x56\x65\x76\x58\
-\x71\x46\x57\x54\x75\x6e\x44\x34\x55\x36\x2f\x66\x41\x6b\x44\x72\
-\x48\x49\x4b\x41\x53\x64\x6f\x50\x50\x70\x30\x79\x66\x30\x70\x78\
-\x4f\x32\x6d\x77\x33\x67\x50\x4f\x41\x38\x20\x46\x67\x73\x79\x77\
-\x4c\x42\x4a\x75\x5a\x33\x70\x73\x44\x6b\x70\x47\x6b\x4a\x4b\x69\
-\x66\x6d\x38\x44\x55\x65\x45\x6c\x57\x6b\x37\x54\x54\x50\x44\x77\
-\x77\x4d\x64\x46\x7a\x61\x62\x7a\x61\x41\x45\x5a\x61\x74\x44\x65\
-\x43\x77\x58\x61\x39\x7a\x64\x33\x63\x57\x46\x2b\x58\x5a\x2f\x46\
-\x37\x69\x64\x43\x49\x70\x36\x20\x4b\x4d\x41\x71\x71\x66\x77\x68\
-\x69\x5a\x30\x68\x45\x31\x79\x4a\x59\x76\x45\x59\x4f\x42\x37\x33\
-\x65\x7a\x77\x39\x50\x57\x47\x78\x57\x47\x42\x7a\x53\x63\x67\x6e\
-\x70\x61\x51\x36\x4b\x6a\x35\x6c\x6a\x6b\x67\x32\x53\x67\x43\x52\
-\x32\x6a\x4d\x56\x70\x2b\x4a\x45\x34\x59\x41\x54\x33\x76\x4a\x63\
-\x7a\x42\x52\x30\x20\x58\x50\x69\x30\x55\x61\x51\x55\x38\x51\x70\
-\x6b\x5a\x41\x4f\x43\x44\x4e\x51\x2b\x30\x77\x30\x5a\x53\x52\x69\
-\x6f\x61\x35\x47\x33\x46\x6c\x39\x7a\x43\x59\x5a\x72\x78\x50\x43\
-\x65\x33\x74\x2f\x66\x42\x30\x6b\x6f\x69\x64\x74\x30\x55\x41\x37\
-\x42\x53\x46\x35\x31\x4f\x30\x63\x6d\x56\x68\x6e\x34\x7a\x41\x59\
-\x32\x20\x32\x45\x54\x52\x48\x5a\x62\x6d\x41\x42\x2b\x44\x44\x57\
-\x68\x2b\x77\x64\x4f\x61\x4a\x51\x75\x54\x64\x64\x57\x54\x7a\x31\
-\x5a\x72\x71\x74\x58\x61\x39\x35\x67\x76\x4e\x6a\x45\x6b\x73\x65\
-\x39\x50\x73\x4f\x47\x6f\x62\x66\x59\x6c\x6e\x73\x77\x4a\x4e\x72\
-\x67\x6f\x2b\x44\x78\x43\x37\x32\x30\x73\x42\x33\x6b\x34\x20\x48\
-\x4e\x41\x66\x4f\x66\x44\x43\x78\x4c\x45\x54\x70\x79\x5a\x4c\x72\
-\x44\x55\x68\x76\x46\x4b\x79\x79\x4b\x71\x6a\x6a\x59\x42\x38\x68\
-\x4f\x51\x69\x67\x36\x64\x43\x7a\x6e\x7a\x30\x65\x77\x34\x6a\x78\
-\x54\x38\x66\x43\x43\x64\x2f\x53\x33\x68\x6f\x5a\x38\x6b\x4d\x7a\
-\x62\x46\x74\x48\x41\x53\x72\x4e\x52\x32\x32\x20\x2b\x4f\x4f\x50\
-\x50\x35\x48\x56\x55\x2b\x71\x69\x74\x46\x30\x75\x45\x72\x43\x65\
-\x64\x48\x4e\x7a\x67\x32\x2f\x66\x76\x6b\x46\x4b\x50\x6c\x32\x57\
-\x43\x76\x31\x51\x70\x49\x57\x50\x79\x48\x55\x34\x48\x4e\x43\x62\
-\x6f\x47\x64\x41\x78\x74\x71\x52\x62\x64\x75\x69\x62\x58\x58\x55\
-\x4d\x52\x67\x35\x57\x4d\x2b\x61\x20\x7a\x57\x62\x59\x37\x2f\x63\
-\x52\x4b\x48\x53\x6a\x6f\x5a\x33\x45\x59\x6a\x37\x48\x70\x30\x2b\
-\x66\x73\x4e\x31\x75\x63\x54\x49\x39\x62\x6d\x36\x2f\x45\x76\x66\
-\x4c\x33\x43\x39\x78\x33\x4f\x7a\x2b\x43\x71\x55\x53\x38\x68\x6f\
-\x6a\x41\x50\x44\x30\x39\x42\x51\x50\x39\x6d\x51\x66\x58\x32\x37\
-\x52\x7a\x41\x48\x61\x20\x4f\x51\x64\x55\x6d\x65\x76\x35\x39\x31\
-\x37\x61\x7a\x6c\x6e\x68\x70\x6c\x70\x4f\x4e\x49\x69\x6a\x6c\x6f\
-\x67\x77\x69\x62\x79\x44\x61\x34\x6b\x37\x6b\x63\x69\x4f\x79\x4d\
-\x48\x75\x37\x2b\x38\x4c\x51\x4f\x4c\x33\x70\x4a\x52\x78\x2f\x66\
-\x4b\x7a\x35\x48\x4e\x6b\x7a\x50\x58\x42\x4d\x52\x31\x38\x61\x6c\
-\x78\x31\x20\x59\x36\x52\x48\x36\x49\x63\x35\x31\x47\x4b\x78\x6f\
-\x48\x78\x43\x4a\x58\x44\x71\x71\x59\x4c\x36\x33\x65\x4d\x39\x37\
-\x68\x35\x75\x63\x58\x50\x7a\x42\x59\x66\x44\x45\x35\x51\x45\x6a\
-\x50\x4d\x51\x45\x68\x43\x57\x47\x4d\x44\x6a\x34\x33\x30\x34\x72\
-\x35\x48\x36\x61\x57\x51\x44\x4c\x6a\x75\x53\x2f\x78\x4e\x49\x20\
-\x51\x65\x66\x30\x62\x33\x68\x63\x77\x44\x6b\x4a\x59\x32\x78\x4f\
-\x55\x2f\x75\x72\x2b\x52\x51\x69\x5a\x73\x39\x4b\x30\x57\x45\x58\
-\x32\x2b\x32\x57\x4c\x48\x36\x71\x43\x53\x58\x76\x66\x41\x7a\x41\
-\x35\x6b\x30\x37\x6e\x55\x35\x51\x57\x75\x4a\x34\x4f\x4f\x4c\x7a\
-\x35\x38\x2b\x55\x48\x64\x47\x30\x6d\x4d\x39\x61\x20\x4f\x47\x4f\
-\x70\x47\x42\x41\x6f\x46\x41\x78\x49\x4a\x51\x6e\x62\x6c\x6e\x79\
-\x49\x66\x57\x65\x78\x32\x61\x37\x51\x4e\x45\x30\x38\x4f\x68\x6d\
-\x4b\x64\x44\x58\x6e\x4b\x48\x71\x51\x49\x68\x4d\x51\x58\x51\x41\
-\x50\x64\x2f\x64\x45\x65\x59\x4b\x34\x32\x4c\x59\x74\x35\x76\x4d\
-\x35\x76\x6e\x32\x37\x77\x39\x2f\x2f\x20\x2f\x64\x2f\x48\x2b\x70\
-\x35\x65\x67\x4d\x71\x4e\x53\x2f\x4b\x6b\x6d\x63\x77\x77\x51\x30\
-\x37\x56\x34\x48\x67\x50\x4d\x61\x4c\x37\x77\x50\x6d\x55\x55\x6e\
-\x6a\x39\x2b\x6a\x56\x6d\x73\x31\x6b\x73\x56\x5a\x41\x44\x47\x4d\
-\x76\x30\x41\x58\x34\x4c\x68\x32\x32\x39\x32\x47\x4f\x4c\x58\x6d\
-\x2f\x63\x6d\x4b\x6a\x35\x20\x31\x37\x51\x38\x39\x72\x50\x34\x67\
-\x69\x4c\x45\x71\x6d\x4e\x50\x73\x79\x38\x57\x76\x6c\x41\x58\x31\
-\x41\x51\x6c\x47\x2b\x77\x65\x39\x39\x42\x43\x51\x37\x6a\x4d\x51\
-\x6d\x6d\x70\x37\x6f\x38\x4e\x4c\x68\x38\x4b\x6f\x75\x66\x71\x30\
-\x6f\x78\x63\x45\x73\x63\x6a\x57\x61\x72\x35\x69\x44\x50\x2b\x34\
-\x6b\x76\x46\x20\x5a\x4f\x34\x76\x44\x33\x37\x49\x43\x57\x43\x6a\
-\x64\x44\x77\x52\x2b\x65\x66\x62\x32\x33\x43\x79\x31\x54\x37\x45\
-\x4c\x5a\x4f\x78\x35\x58\x41\x34\x34\x4e\x43\x64\x73\x44\x2f\x75\
-\x51\x38\x57\x38\x66\x54\x4c\x71\x68\x46\x57\x4b\x68\x62\x54\x69\
-\x34\x74\x6d\x59\x6c\x35\x67\x48\x57\x54\x41\x6e\x7a\x45\x56\x4a\
-\x20\x37\x34\x6d\x74\x69\x63\x41\x42\x63\x38\x6e\x6c\x4a\x59\x32\
-\x4a\x6b\x38\x35\x46\x77\x64\x56\x71\x67\x38\x76\x4c\x79\x31\x68\
-\x61\x33\x46\x6b\x66\x2f\x59\x52\x35\x66\x55\x6e\x2b\x76\x57\x31\
-\x62\x33\x48\x7a\x37\x69\x71\x39\x66\x76\x31\x4a\x51\x39\x57\x49\
-\x42\x36\x51\x4e\x79\x69\x6a\x4a\x71\x77\x76\x73\x55\x20\x41\x32\
-\x68\x44\x4b\x73\x78\x69\x73\x63\x42\x73\x4d\x53\x2f\x30\x4b\x54\
-\x35\x6b\x68\x53\x65\x62\x35\x37\x47\x31\x62\x52\x73\x4a\x51\x64\
-\x76\x4f\x34\x42\x79\x77\x58\x6c\x33\x45\x78\x56\x79\x73\x56\x2f\
-\x6a\x35\x77\x79\x39\x51\x6a\x61\x61\x44\x56\x30\x69\x36\x6f\x58\
-\x35\x6b\x5a\x76\x6b\x4b\x36\x56\x58\x6b\x20\x37\x6a\x6a\x67\x65\
-\x43\x4a\x58\x79\x63\x55\x46\x48\x66\x7a\x4a\x2b\x69\x72\x50\x75\
-\x77\x36\x71\x35\x67\x56\x4d\x35\x64\x61\x6e\x45\x66\x47\x35\x54\
-\x52\x6a\x37\x75\x39\x61\x54\x70\x74\x71\x55\x52\x58\x54\x30\x47\
-\x78\x4d\x55\x32\x57\x64\x2b\x75\x54\x7a\x4d\x36\x6e\x41\x34\x34\
-\x48\x51\x36\x59\x54\x45\x72\x20\x38\x2f\x54\x71\x4f\x62\x4c\x62\
-\x71\x6a\x59\x63\x39\x58\x32\x50\x32\x57\x77\x32\x4f\x71\x36\x38\
-\x72\x2b\x66\x6d\x36\x4c\x4b\x51\x74\x54\x79\x71\x71\x75\x73\x36\
-\x66\x50\x6e\x79\x42\x66\x2f\x36\x39\x48\x4f\x73\x67\x69\x41\x6c\
-\x77\x56\x70\x6e\x54\x74\x6a\x76\x39\x39\x67\x39\x50\x65\x49\x78\
-\x6e\x50\x6c\x68\x20\x73\x6b\x41\x4e\x47\x73\x54\x34\x39\x33\x69\
-\x76\x75\x52\x4a\x45\x6b\x6f\x4c\x4b\x41\x49\x42\x61\x78\x2f\x38\
-\x65\x61\x61\x69\x2b\x72\x70\x56\x71\x63\x48\x47\x78\x77\x73\x58\
-\x46\x42\x52\x62\x7a\x5a\x64\x54\x31\x36\x50\x42\x49\x46\x66\x78\
-\x6a\x50\x59\x52\x49\x5a\x6d\x65\x41\x54\x73\x6e\x35\x2b\x50\x45\
-\x6a\x20\x48\x75\x35\x75\x30\x54\x51\x4b\x72\x5a\x49\x51\x77\x54\
-\x31\x68\x6a\x63\x48\x52\x47\x4d\x7a\x6e\x38\x33\x42\x77\x69\x6f\
-\x54\x77\x36\x53\x7a\x7a\x70\x6d\x6d\x77\x32\x71\x79\x78\x57\x71\
-\x31\x69\x66\x78\x61\x2b\x34\x43\x78\x70\x77\x44\x4a\x77\x55\x75\
-\x4a\x71\x69\x38\x55\x53\x68\x38\x4d\x52\x6d\x2b\x55\x61\x20\x55\
-\x67\x68\x63\x62\x72\x63\x34\x48\x66\x74\x6f\x76\x58\x74\x34\x65\
-\x43\x42\x78\x4e\x6f\x6a\x4f\x53\x69\x6c\x30\x74\x6f\x2b\x31\x62\
-\x4b\x67\x36\x6e\x4d\x46\x2b\x54\x36\x66\x70\x4e\x49\x33\x43\x78\
-\x57\x59\x62\x61\x31\x63\x53\x77\x70\x50\x59\x61\x70\x32\x6a\x65\
-\x70\x70\x43\x30\x4f\x47\x56\x41\x4b\x49\x58\x20\x31\x72\x4e\x4a\
-\x75\x74\x79\x49\x63\x57\x36\x44\x77\x54\x50\x6e\x4e\x71\x33\x65\
-\x33\x47\x6d\x64\x55\x53\x52\x72\x62\x74\x42\x46\x4a\x4d\x61\x69\
-\x59\x6a\x77\x34\x5a\x36\x43\x34\x49\x36\x69\x57\x6a\x77\x77\x78\
-\x69\x63\x36\x6d\x79\x4b\x6a\x37\x33\x54\x31\x30\x5a\x6e\x41\x59\
-\x4d\x79\x72\x6b\x6f\x6d\x67\x6b\x20\x48\x46\x4b\x67\x37\x77\x31\
-\x78\x42\x71\x30\x47\x36\x2b\x47\x44\x48\x6b\x67\x36\x4d\x65\x43\
-\x64\x42\x57\x46\x45\x57\x66\x41\x72\x45\x6d\x4b\x5a\x75\x47\x4a\
-\x75\x35\x47\x4b\x44\x6d\x58\x43\x68\x6e\x49\x71\x53\x4f\x48\x56\
-\x48\x37\x48\x59\x37\x33\x44\x37\x51\x47\x53\x4c\x4f\x55\x64\x30\
-\x58\x70\x55\x4e\x46\x20\x4f\x43\x46\x67\x72\x41\x2b\x4a\x42\x69\
-\x78\x2b\x68\x33\x4d\x70\x42\x56\x73\x32\x36\x54\x52\x67\x78\x64\
-\x6b\x38\x57\x52\x36\x74\x39\x38\x6d\x76\x79\x33\x4e\x79\x59\x65\
-\x33\x6a\x56\x61\x34\x63\x36\x45\x4e\x65\x59\x37\x58\x4e\x6a\x6d\
-\x32\x65\x50\x67\x58\x6d\x36\x7a\x2f\x2b\x38\x59\x2b\x45\x2f\x61\
-\x49\x38\x20\x4a\x38\x43\x35\x56\x42\x61\x50\x4c\x47\x46\x64\x58\
-\x49\x68\x76\x33\x37\x37\x68\x32\x37\x64\x76\x4d\x4c\x62\x48\x76\
-\x4e\x45\x78\x5a\x4d\x64\x37\x48\x35\x56\x69\x52\x6b\x42\x65\x54\
-\x47\x74\x70\x51\x62\x69\x55\x66\x44\x4e\x72\x6f\x79\x2b\x52\x4c\
-\x46\x33\x44\x6a\x47\x78\x75\x75\x55\x37\x47\x54\x6e\x6c\x6a\x20\
-\x44\x46\x61\x62\x4e\x62\x62\x62\x4c\x65\x35\x75\x36\x52\x52\x58\
-\x4e\x69\x31\x33\x78\x6c\x42\x41\x72\x2f\x44\x78\x46\x46\x63\x68\
-\x51\x6a\x6e\x36\x33\x57\x4d\x6f\x45\x37\x38\x6b\x59\x39\x4f\x73\
-\x50\x42\x4d\x2b\x78\x6a\x34\x4b\x46\x4c\x70\x70\x70\x4d\x49\x54\
-\x66\x72\x2b\x58\x55\x72\x33\x61\x69\x6e\x6a\x75\x20\x2b\x58\x4e\
-\x69\x62\x58\x71\x6f\x37\x4c\x66\x6d\x65\x47\x4f\x63\x4d\x54\x64\
-\x41\x77\x41\x76\x77\x6c\x46\x67\x33\x4a\x67\x6e\x68\x56\x46\x6a\
-\x42\x6f\x36\x34\x6b\x6b\x69\x45\x72\x4a\x76\x5a\x6d\x33\x32\x63\
-\x75\x57\x46\x74\x4e\x34\x7a\x66\x72\x74\x59\x68\x39\x44\x7a\x4e\
-\x70\x38\x75\x2f\x6c\x53\x31\x41\x59\x20\x55\x4a\x54\x41\x2f\x72\
-\x54\x48\x34\x39\x30\x39\x48\x76\x65\x37\x36\x4d\x2f\x6a\x32\x4f\
-\x52\x32\x70\x71\x50\x31\x45\x77\x43\x45\x54\x44\x61\x48\x33\x49\
-\x71\x74\x4d\x76\x46\x54\x53\x6a\x4c\x36\x6c\x64\x77\x37\x47\x4c\
-\x43\x71\x63\x62\x78\x45\x2b\x71\x79\x4a\x4c\x71\x74\x46\x33\x4c\
-\x39\x75\x6d\x31\x6b\x41\x20\x63\x69\x34\x34\x6c\x42\x61\x45\x48\
-\x79\x49\x4f\x5a\x6e\x45\x34\x48\x50\x44\x6c\x79\x78\x63\x79\x58\
-\x4c\x53\x61\x4c\x46\x38\x64\x62\x52\x5a\x54\x48\x55\x4b\x34\x73\
-\x6a\x51\x36\x55\x36\x58\x56\x61\x6f\x58\x31\x5a\x67\x73\x56\x4b\
-\x70\x47\x52\x69\x4d\x71\x31\x61\x75\x71\x52\x4a\x7a\x30\x6b\x56\
-\x2f\x42\x31\x20\x71\x37\x42\x65\x72\x2b\x6b\x55\x33\x43\x75\x4e\
-\x2b\x57\x79\x4a\x68\x34\x63\x50\x65\x50\x76\x32\x48\x55\x35\x64\
-\x58\x2b\x54\x56\x47\x55\x38\x68\x56\x63\x66\x54\x49\x53\x5a\x52\
-\x63\x6c\x78\x6e\x30\x31\x42\x67\x41\x4c\x67\x65\x53\x58\x67\x48\
-\x6b\x71\x4a\x30\x75\x4c\x4a\x34\x48\x6c\x44\x4f\x39\x77\x45\x55\
-\x20\x30\x52\x34\x76\x34\x56\x78\x54\x34\x74\x78\x66\x32\x38\x61\
-\x4d\x49\x55\x54\x4d\x66\x45\x4a\x4d\x70\x4c\x39\x72\x43\x61\x50\
-\x6b\x55\x4f\x6c\x33\x4b\x54\x53\x65\x39\x6b\x39\x46\x70\x45\x76\
-\x73\x32\x33\x73\x49\x63\x46\x41\x30\x4d\x4a\x76\x4e\x49\x33\x65\
-\x49\x4b\x42\x62\x55\x6b\x59\x45\x6f\x4b\x6b\x73\x67\x20\x48\x42\
-\x4b\x4e\x56\x46\x47\x38\x48\x70\x2b\x31\x46\x6b\x4c\x79\x4f\x45\
-\x4b\x64\x6d\x61\x36\x50\x4c\x71\x31\x54\x66\x38\x4c\x70\x63\x45\
-\x7a\x46\x6c\x61\x57\x48\x56\x50\x53\x54\x6a\x33\x6d\x4c\x31\x6e\
-\x59\x6e\x34\x6e\x6b\x63\x51\x67\x67\x6f\x54\x64\x4b\x65\x56\x71\
-\x6b\x61\x2b\x4e\x67\x36\x70\x33\x71\x6f\x20\x78\x64\x31\x73\x51\
-\x57\x56\x78\x79\x51\x76\x36\x4a\x2b\x49\x61\x68\x33\x2b\x65\x66\
-\x6b\x5a\x70\x41\x4d\x67\x50\x43\x62\x58\x46\x78\x4e\x6b\x78\x36\
-\x52\x78\x67\x44\x46\x6b\x2b\x62\x32\x35\x75\x49\x44\x79\x64\x5a\
-\x71\x51\x45\x63\x44\x6f\x63\x49\x59\x51\x66\x4b\x72\x64\x68\x45\
-\x59\x2f\x48\x59\x2b\x79\x50\x20\x2f\x58\x36\x35\x62\x45\x2f\x63\
-\x4d\x36\x53\x65\x68\x48\x53\x64\x70\x4d\x50\x51\x44\x77\x65\x67\
-\x6b\x56\x78\x59\x56\x71\x4a\x52\x47\x6c\x63\x58\x6c\x49\x38\x6f\
-\x41\x31\x49\x38\x50\x6a\x33\x69\x62\x2f\x2f\x7a\x33\x2b\x48\x32\
-\x2f\x67\x37\x47\x4f\x30\x69\x74\x63\x4f\x67\x6f\x58\x76\x58\x2b\
-\x2f\x68\x75\x6b\x20\x53\x71\x65\x36\x4e\x72\x6f\x4e\x33\x30\x68\
-\x39\x53\x69\x6c\x68\x66\x61\x6f\x44\x6b\x30\x64\x35\x73\x45\x68\
-\x62\x70\x6d\x2b\x6c\x6b\x33\x2f\x4f\x63\x62\x57\x36\x6e\x65\x4e\
-\x4d\x4c\x39\x47\x50\x78\x76\x71\x54\x48\x70\x50\x6e\x51\x34\x34\
-\x39\x58\x7a\x2b\x54\x49\x79\x48\x50\x6d\x2f\x65\x4e\x62\x51\x56\
-\x54\x20\x68\x4b\x4f\x5a\x6b\x5a\x57\x61\x52\x58\x58\x6d\x69\x6e\
-\x33\x66\x59\x37\x6c\x63\x46\x6b\x51\x6e\x6e\x6d\x50\x70\x4d\x75\
-\x34\x48\x58\x2f\x68\x70\x32\x54\x69\x59\x66\x38\x73\x35\x4f\x6a\
-\x37\x50\x67\x56\x30\x4d\x67\x44\x4d\x57\x44\x77\x38\x50\x65\x48\
-\x78\x38\x68\x44\x46\x39\x50\x4a\x64\x43\x4e\x52\x72\x4f\x20\x39\
-\x76\x47\x37\x7a\x42\x52\x4b\x70\x4a\x66\x46\x6e\x6b\x6f\x46\x4b\
-\x4b\x31\x6a\x75\x63\x5a\x6f\x4b\x52\x61\x55\x77\x6a\x56\x59\x73\
-\x7a\x50\x71\x78\x4c\x6b\x31\x48\x30\x4e\x75\x62\x74\x70\x79\x4c\
-\x4a\x35\x4c\x35\x39\x67\x35\x46\x30\x79\x53\x33\x75\x48\x75\x32\
-\x79\x32\x2b\x66\x76\x31\x43\x49\x6c\x7a\x62\x20\x55\x67\x36\x64\
-\x73\x35\x54\x33\x37\x4d\x49\x47\x75\x41\x53\x34\x76\x54\x6e\x46\
-\x44\x5a\x57\x53\x79\x6a\x55\x30\x54\x59\x50\x5a\x66\x49\x36\x6d\
-\x62\x59\x50\x7a\x6b\x7a\x67\x75\x79\x64\x78\x4d\x4c\x54\x77\x6f\
-\x36\x34\x70\x5a\x76\x6b\x69\x6c\x44\x53\x51\x46\x35\x6d\x71\x68\
-\x49\x62\x32\x45\x6c\x41\x71\x2f\x20\x65\x2f\x38\x37\x33\x4e\x7a\
-\x63\x34\x4c\x2f\x39\x6e\x2f\x38\x4e\x6d\x38\x30\x47\x55\x6c\x4e\
-\x75\x6e\x78\x41\x65\x75\x36\x64\x48\x33\x44\x36\x51\x30\x33\x2b\
-\x32\x57\x47\x49\x32\x61\x31\x4c\x56\x73\x75\x6a\x4b\x38\x30\x6c\
-\x58\x79\x6b\x54\x52\x75\x4f\x41\x68\x58\x31\x44\x6d\x34\x56\x58\
-\x65\x42\x39\x30\x68\x20\x6c\x61\x30\x54\x53\x68\x63\x69\x6c\x71\
-\x6a\x63\x49\x67\x6d\x34\x68\x6f\x76\x50\x39\x32\x71\x6a\x52\x76\
-\x31\x4f\x2f\x56\x37\x52\x48\x79\x6d\x42\x5a\x43\x41\x43\x53\x46\
-\x66\x4e\x4d\x67\x6b\x69\x45\x45\x62\x7a\x5a\x48\x69\x51\x6b\x76\
-\x69\x49\x34\x77\x6b\x75\x35\x71\x54\x6a\x45\x57\x34\x36\x43\x36\
-\x76\x79\x20\x33\x6b\x4e\x71\x44\x51\x48\x41\x65\x41\x73\x4c\x68\
-\x36\x61\x68\x50\x45\x59\x70\x46\x5a\x33\x46\x46\x35\x36\x33\x58\
-\x51\x2f\x70\x67\x56\x5a\x4a\x47\x6b\x78\x63\x4f\x2f\x42\x4a\x65\
-\x46\x45\x4d\x42\x51\x44\x68\x65\x49\x31\x59\x39\x30\x6f\x31\x50\
-\x58\x6d\x57\x45\x67\x4a\x77\x67\x4f\x30\x74\x48\x62\x44\x7a\x20\
-\x38\x45\x69\x53\x6a\x65\x44\x4d\x43\x6f\x4a\x46\x59\x69\x53\x42\
-\x30\x33\x68\x41\x51\x49\x55\x7a\x4b\x52\x30\x67\x41\x6b\x45\x4e\
-\x59\x71\x58\x57\x47\x6a\x4b\x6f\x55\x76\x43\x65\x73\x6e\x47\x79\
-\x64\x61\x5a\x49\x71\x37\x43\x47\x48\x4e\x38\x62\x4f\x44\x30\x52\
-\x58\x6f\x4a\x4e\x46\x58\x52\x47\x4a\x30\x4b\x5a\x20\x6b\x2f\x42\
-\x50\x65\x42\x6d\x53\x45\x42\x43\x4a\x50\x4d\x4d\x36\x53\x35\x36\
-\x30\x6a\x2b\x46\x38\x77\x73\x4a\x45\x48\x66\x54\x41\x33\x63\x4d\
-\x39\x6e\x62\x30\x51\x6a\x43\x6e\x7a\x64\x70\x62\x69\x51\x36\x31\
-\x4e\x75\x70\x4e\x50\x46\x74\x43\x38\x63\x54\x39\x43\x69\x4f\x44\
-\x2f\x61\x36\x4e\x6f\x41\x53\x51\x6b\x20\x48\x61\x4d\x6e\x50\x45\
-\x6e\x42\x56\x6c\x50\x72\x73\x46\x35\x76\x59\x45\x38\x64\x47\x74\
-\x31\x41\x51\x75\x44\x33\x50\x2f\x32\x45\x76\x2f\x7a\x6c\x4c\x2f\
-\x6a\x38\x35\x51\x76\x75\x6e\x2b\x37\x52\x2f\x56\x38\x64\x64\x6f\
-\x63\x39\x64\x6b\x39\x50\x61\x4e\x73\x32\x52\x75\x70\x41\x69\x69\
-\x43\x4b\x70\x46\x51\x57\x20\x57\x51\x46\x59\x44\x65\x51\x35\x38\
-\x41\x37\x48\x39\x64\x65\x4c\x6b\x47\x50\x74\x4f\x66\x46\x31\x36\
-\x70\x33\x34\x75\x36\x64\x6b\x57\x46\x75\x39\x4e\x79\x57\x75\x4d\
-\x68\x63\x43\x51\x75\x35\x68\x38\x42\x2f\x77\x4e\x51\x36\x71\x72\
-\x36\x6c\x39\x58\x68\x76\x48\x57\x6b\x75\x45\x54\x38\x70\x42\x2f\
-\x36\x77\x50\x20\x31\x6e\x31\x34\x37\x78\x6e\x76\x61\x5a\x78\x5a\
-\x76\x79\x79\x5a\x6a\x50\x72\x66\x6e\x45\x64\x76\x44\x51\x36\x48\
-\x49\x78\x34\x65\x48\x74\x41\x64\x6a\x6e\x46\x65\x31\x6c\x70\x41\
-\x44\x54\x6c\x54\x4c\x64\x47\x78\x37\x69\x61\x6c\x68\x4a\x62\x4a\
-\x39\x6b\x46\x53\x68\x4b\x68\x47\x68\x49\x67\x63\x31\x41\x64\x78\
-\x20\x58\x79\x34\x32\x50\x53\x55\x56\x66\x41\x39\x63\x31\x4c\x71\
-\x6b\x64\x6f\x59\x57\x77\x51\x5a\x4f\x65\x4f\x71\x4f\x75\x4c\x6d\
-\x35\x77\x65\x50\x64\x66\x56\x7a\x6b\x70\x69\x48\x41\x5a\x77\x64\
-\x6e\x50\x72\x6d\x34\x56\x6a\x45\x63\x4b\x57\x66\x72\x45\x72\x50\
-\x35\x48\x47\x30\x37\x68\x77\x37\x52\x35\x54\x59\x34\x20\x51\x52\
-\x47\x73\x73\x49\x77\x63\x48\x6e\x78\x79\x45\x46\x6d\x58\x79\x46\
-\x67\x6b\x49\x61\x44\x51\x74\x6a\x4f\x63\x6e\x76\x5a\x59\x74\x44\
-\x4d\x49\x44\x2f\x7a\x34\x75\x78\x38\x68\x6c\x63\x4c\x6a\x62\x6f\
-\x63\x33\x62\x39\x35\x51\x58\x6c\x67\x77\x2b\x72\x51\x68\x54\x51\
-\x6f\x68\x51\x69\x4e\x79\x2b\x71\x44\x38\x20\x43\x2b\x45\x47\x69\
-\x2f\x64\x53\x6f\x30\x70\x39\x58\x51\x67\x78\x69\x50\x77\x63\x65\
-\x32\x65\x4b\x69\x34\x33\x39\x58\x62\x2f\x33\x6e\x49\x6a\x4b\x56\
-\x75\x57\x52\x66\x4e\x58\x79\x66\x52\x59\x44\x6b\x52\x43\x51\x39\
-\x57\x44\x65\x4f\x32\x73\x74\x64\x72\x76\x64\x59\x41\x35\x4d\x79\
-\x59\x46\x6b\x70\x47\x4a\x78\x20\x4d\x35\x2b\x66\x39\x78\x52\x77\
-\x54\x37\x35\x56\x44\x76\x4c\x6d\x65\x33\x78\x73\x51\x70\x68\x33\
-\x2b\x4f\x6b\x63\x30\x44\x53\x6b\x72\x37\x45\x68\x6a\x33\x52\x31\
-\x55\x6e\x50\x34\x52\x4b\x7a\x6a\x38\x56\x67\x45\x38\x51\x74\x4a\
-\x30\x53\x74\x35\x6f\x61\x30\x78\x69\x53\x4c\x36\x47\x49\x57\x47\
-\x56\x67\x32\x61\x20\x4c\x45\x47\x41\x56\x33\x43\x38\x70\x62\x49\
-\x74\x59\x2f\x31\x48\x75\x41\x6e\x33\x34\x2f\x4a\x37\x68\x75\x46\
-\x67\x36\x4a\x71\x41\x6f\x58\x78\x66\x4e\x63\x76\x4f\x66\x64\x2f\
-\x6a\x2f\x76\x34\x65\x4e\x39\x2b\x2b\x77\x6a\x6d\x48\x57\x54\x43\
-\x32\x78\x47\x72\x5a\x58\x54\x2b\x49\x69\x71\x38\x70\x62\x5a\x78\
-\x57\x20\x6f\x4a\x71\x7a\x32\x61\x79\x49\x46\x51\x56\x51\x5a\x4a\
-\x69\x7a\x4b\x45\x46\x69\x4b\x5a\x32\x71\x42\x4a\x41\x70\x57\x53\
-\x6c\x46\x42\x58\x4f\x39\x52\x4e\x73\x30\x61\x45\x54\x51\x42\x36\
-\x2b\x75\x73\x4e\x6c\x73\x38\x49\x2f\x2f\x2b\x49\x2b\x59\x4c\x78\
-\x64\x6f\x35\x7a\x4d\x71\x59\x33\x45\x36\x51\x66\x50\x35\x20\x44\
-\x41\x4c\x77\x6e\x47\x67\x72\x52\x51\x45\x73\x66\x45\x52\x59\x62\
-\x68\x6b\x37\x31\x36\x62\x6b\x2f\x7a\x46\x44\x53\x39\x79\x31\x36\
-\x72\x6e\x6e\x2b\x68\x39\x37\x37\x68\x7a\x79\x66\x51\x2f\x6e\x66\
-\x41\x36\x52\x65\x53\x39\x6c\x69\x47\x78\x69\x71\x2b\x69\x59\x5a\
-\x4d\x43\x52\x55\x56\x78\x55\x79\x54\x67\x62\x20\x39\x6f\x77\x61\
-\x47\x2b\x64\x57\x71\x39\x57\x6f\x57\x44\x30\x32\x31\x35\x53\x6c\
-\x51\x2f\x44\x45\x66\x75\x48\x39\x6a\x69\x4b\x58\x75\x71\x36\x4c\
-\x30\x6c\x68\x4b\x4b\x70\x38\x36\x7a\x47\x5a\x38\x72\x58\x4c\x48\
-\x65\x30\x34\x77\x43\x44\x37\x47\x31\x2b\x53\x6c\x62\x59\x43\x67\
-\x45\x77\x37\x49\x63\x2f\x59\x44\x20\x44\x64\x44\x5a\x44\x4a\x38\
-\x2b\x66\x38\x52\x75\x74\x34\x75\x52\x4b\x37\x59\x33\x52\x52\x77\
-\x65\x41\x78\x79\x4c\x49\x79\x79\x53\x43\x70\x2b\x46\x2b\x6d\x51\
-\x4c\x70\x4e\x73\x47\x69\x39\x55\x79\x68\x70\x6a\x78\x2b\x58\x6f\
-\x71\x45\x77\x57\x5a\x32\x77\x47\x67\x73\x2b\x74\x30\x45\x42\x56\
-\x41\x55\x66\x70\x4b\x20\x53\x43\x67\x76\x6f\x62\x32\x43\x62\x42\
-\x70\x63\x58\x6c\x37\x69\x54\x33\x2f\x36\x45\x2f\x37\x68\x48\x2f\
-\x34\x42\x78\x2b\x36\x45\x56\x32\x2f\x66\x6f\x4f\x73\x36\x4f\x6d\
-\x4d\x69\x36\x35\x66\x48\x6f\x64\x75\x6d\x4f\x4c\x6f\x4c\x79\x48\
-\x56\x43\x46\x6c\x4f\x65\x4f\x35\x42\x6d\x44\x49\x41\x54\x50\x52\
-\x38\x41\x20\x36\x35\x6c\x4e\x47\x4f\x30\x39\x57\x39\x66\x36\x32\
-\x6e\x4e\x63\x6b\x77\x77\x46\x35\x62\x30\x49\x36\x50\x6d\x6a\x48\
-\x76\x42\x42\x34\x73\x67\x6a\x5a\x77\x44\x41\x43\x77\x63\x48\x43\
-\x79\x30\x56\x54\x74\x30\x42\x45\x49\x35\x38\x5a\x30\x70\x54\x30\
-\x4c\x55\x55\x4b\x59\x63\x50\x67\x4c\x45\x64\x74\x75\x73\x74\x20\
-\x6a\x4f\x76\x44\x39\x31\x4c\x77\x50\x71\x39\x31\x58\x74\x51\x35\
-\x7a\x59\x4f\x74\x67\x79\x57\x64\x38\x6a\x43\x52\x43\x41\x67\x70\
-\x63\x44\x6f\x64\x38\x50\x44\x77\x45\x4e\x31\x51\x6a\x4a\x68\x53\
-\x53\x59\x72\x76\x44\x50\x59\x48\x70\x5a\x4e\x71\x77\x2f\x32\x56\
-\x6d\x65\x76\x38\x55\x30\x59\x6b\x48\x46\x4e\x42\x20\x65\x47\x37\
-\x50\x37\x64\x65\x55\x67\x57\x57\x71\x70\x54\x32\x74\x42\x58\x42\
-\x75\x53\x59\x62\x53\x44\x77\x38\x50\x2b\x50\x58\x58\x58\x33\x45\
-\x38\x48\x62\x42\x63\x4c\x67\x75\x48\x50\x49\x75\x66\x41\x49\x70\
-\x79\x45\x4c\x55\x6f\x36\x6a\x4e\x45\x35\x45\x57\x62\x7a\x2b\x66\
-\x78\x77\x45\x6f\x68\x79\x75\x4f\x7a\x20\x63\x71\x75\x6a\x38\x4f\
-\x54\x41\x5a\x50\x32\x50\x4f\x57\x30\x44\x4f\x6d\x42\x45\x4f\x56\
-\x4a\x77\x4c\x79\x2b\x32\x2b\x50\x4f\x66\x2f\x69\x4f\x2b\x66\x72\
-\x76\x42\x7a\x65\x30\x33\x58\x4c\x31\x2b\x68\x61\x37\x76\x59\x7a\
-\x46\x64\x44\x70\x47\x43\x49\x44\x30\x7a\x54\x37\x72\x6c\x4d\x52\
-\x52\x57\x4d\x6e\x43\x4a\x20\x68\x76\x4f\x4c\x57\x51\x63\x2f\x31\
-\x77\x75\x4e\x46\x79\x4a\x68\x38\x63\x35\x49\x58\x33\x56\x37\x4b\
-\x53\x63\x63\x34\x38\x59\x35\x45\x4a\x36\x37\x6c\x2f\x39\x30\x7a\
-\x75\x46\x34\x50\x41\x36\x34\x42\x64\x2f\x4c\x43\x64\x78\x38\x50\
-\x6f\x2b\x2b\x59\x52\x75\x65\x34\x39\x53\x7a\x50\x4f\x58\x70\x33\
-\x44\x77\x69\x20\x49\x6b\x67\x52\x59\x65\x37\x78\x38\x54\x46\x79\
-\x50\x36\x56\x55\x44\x42\x6e\x4d\x75\x55\x68\x65\x53\x69\x53\x76\
-\x65\x6c\x43\x50\x6b\x78\x74\x7a\x38\x47\x6a\x6c\x7a\x61\x55\x69\
-\x4b\x57\x4f\x41\x64\x37\x35\x4d\x59\x37\x72\x65\x63\x30\x53\x55\
-\x6e\x38\x6d\x54\x78\x49\x75\x35\x69\x72\x4b\x2f\x2f\x44\x33\x39\
-\x20\x34\x65\x64\x2f\x68\x64\x59\x61\x71\x2f\x6d\x43\x45\x4d\x32\
-\x54\x76\x74\x43\x48\x79\x57\x6d\x5a\x51\x73\x33\x69\x68\x30\x51\
-\x4b\x49\x32\x49\x72\x56\x69\x37\x57\x7a\x4f\x64\x7a\x4c\x45\x4f\
-\x79\x61\x34\x7a\x69\x6c\x34\x6e\x6a\x43\x42\x45\x73\x6e\x77\x47\
-\x49\x6c\x52\x42\x55\x5a\x55\x73\x71\x43\x43\x57\x4a\x20\x41\x30\
-\x4b\x6a\x6c\x51\x71\x7a\x74\x73\x46\x6d\x75\x63\x4c\x66\x2f\x64\
-\x33\x66\x51\x51\x69\x42\x66\x2f\x71\x6e\x66\x38\x4a\x6d\x75\x77\
-\x57\x45\x67\x74\x41\x53\x51\x69\x59\x6a\x6b\x44\x66\x42\x32\x52\
-\x78\x53\x58\x4b\x62\x45\x4d\x32\x71\x6b\x65\x2b\x62\x72\x56\x57\
-\x2f\x65\x31\x4b\x49\x56\x43\x7a\x79\x78\x20\x4d\x63\x50\x76\x44\
-\x65\x2f\x58\x68\x6f\x75\x78\x39\x38\x64\x61\x44\x6d\x67\x63\x67\
-\x51\x4a\x4f\x75\x58\x48\x44\x76\x73\x67\x6f\x51\x69\x77\x6f\x66\
-\x54\x75\x64\x6d\x79\x47\x6c\x52\x42\x64\x45\x55\x5a\x5a\x36\x36\
-\x6a\x45\x79\x6f\x6e\x46\x70\x45\x70\x66\x64\x39\x39\x37\x44\x39\
-\x51\x62\x6d\x31\x4d\x58\x41\x20\x2f\x5a\x71\x62\x79\x78\x45\x75\
-\x35\x62\x32\x48\x6b\x75\x52\x48\x76\x72\x75\x37\x69\x2f\x6f\x6f\
-\x48\x2f\x58\x4e\x66\x6c\x31\x43\x50\x49\x75\x32\x54\x59\x35\x33\
-\x59\x31\x67\x31\x51\x6a\x5a\x4f\x67\x4f\x30\x4a\x2b\x51\x36\x4a\
-\x4b\x6c\x4e\x37\x66\x45\x2b\x6e\x6b\x47\x31\x6f\x75\x42\x6c\x46\
-\x53\x49\x36\x55\x20\x79\x5a\x43\x4e\x2f\x30\x32\x70\x48\x4e\x78\
-\x30\x7a\x4b\x73\x54\x36\x64\x78\x31\x33\x68\x6a\x69\x68\x41\x6e\
-\x35\x63\x6d\x34\x48\x6c\x4c\x47\x47\x54\x46\x6d\x30\x31\x72\x47\
-\x38\x58\x31\x35\x66\x77\x79\x47\x4a\x6f\x46\x70\x54\x79\x58\x53\
-\x75\x44\x55\x4b\x37\x6c\x4b\x49\x56\x70\x4a\x54\x51\x51\x6b\x4e\
-\x4c\x20\x68\x66\x56\x71\x6a\x66\x2f\x30\x35\x37\x39\x46\x32\x7a\
-\x54\x34\x48\x2f\x2f\x7a\x66\x79\x61\x4b\x70\x69\x53\x45\x39\x7a\
-\x43\x6d\x69\x39\x39\x58\x69\x70\x44\x59\x42\x59\x71\x63\x41\x78\
-\x55\x51\x54\x4d\x50\x50\x63\x4c\x36\x78\x68\x58\x35\x4f\x72\x79\
-\x6e\x75\x54\x59\x69\x51\x55\x78\x79\x70\x31\x6c\x46\x71\x20\x42\
-\x4b\x34\x33\x38\x54\x6b\x45\x6e\x52\x78\x7a\x68\x56\x6a\x38\x6b\
-\x7a\x6c\x61\x48\x7a\x4c\x47\x32\x59\x71\x64\x52\x38\x4c\x6b\x56\
-\x74\x42\x34\x4e\x44\x56\x4c\x52\x41\x48\x71\x6f\x68\x6f\x53\x53\
-\x6e\x7a\x55\x6b\x6b\x64\x4e\x63\x50\x6a\x66\x74\x32\x2b\x33\x32\
-\x4f\x30\x6f\x30\x6f\x56\x4c\x68\x4f\x54\x68\x20\x6a\x62\x6b\x36\
-\x77\x58\x6f\x68\x31\x78\x50\x69\x35\x38\x34\x52\x7a\x33\x70\x4e\
-\x63\x75\x76\x77\x6c\x45\x37\x34\x6b\x76\x59\x39\x65\x75\x4e\x7a\
-\x4c\x54\x72\x72\x47\x66\x6b\x69\x49\x4c\x6a\x6b\x51\x4b\x2f\x46\
-\x7a\x5a\x6f\x54\x63\x72\x71\x4a\x31\x68\x72\x72\x69\x30\x33\x51\
-\x78\x53\x7a\x61\x64\x67\x62\x6a\x20\x48\x42\x77\x79\x4a\x47\x45\
-\x4b\x49\x52\x55\x6c\x52\x49\x62\x4d\x64\x4e\x30\x47\x30\x51\x4d\
-\x4b\x38\x39\x6b\x4d\x44\x53\x51\x32\x69\x79\x58\x2b\x30\x33\x2f\
-\x34\x57\x36\x77\x57\x4b\x33\x7a\x38\x2f\x42\x76\x2b\x39\x63\x4d\
-\x76\x32\x46\x78\x74\x49\x52\x71\x4e\x6f\x2b\x6b\x68\x74\x59\x72\
-\x6c\x44\x77\x53\x46\x20\x73\x38\x50\x37\x37\x47\x7a\x41\x4c\x47\
-\x77\x71\x4f\x6b\x4d\x47\x64\x70\x51\x45\x34\x41\x57\x48\x79\x52\
-\x46\x33\x67\x70\x6f\x4a\x51\x65\x66\x72\x46\x55\x44\x6d\x78\x72\
-\x6c\x62\x33\x75\x72\x37\x74\x5a\x35\x53\x6a\x32\x39\x4d\x46\x34\
-\x7a\x58\x31\x5a\x44\x7a\x46\x73\x53\x52\x41\x61\x2b\x61\x4c\x7a\
-\x2f\x4c\x20\x78\x50\x62\x68\x38\x52\x45\x79\x63\x4a\x38\x63\x36\
-\x65\x6f\x78\x4c\x6c\x65\x72\x49\x76\x39\x50\x51\x38\x62\x6a\x41\
-\x42\x61\x4c\x42\x63\x56\x71\x42\x68\x55\x68\x70\x69\x45\x68\x49\
-\x54\x78\x7a\x71\x65\x50\x78\x69\x50\x31\x2b\x6a\x36\x34\x2f\x70\
-\x70\x4e\x32\x6b\x54\x4a\x74\x57\x49\x6f\x43\x55\x72\x32\x61\x20\
-\x66\x45\x2b\x59\x75\x4c\x49\x49\x44\x54\x42\x54\x34\x4e\x4f\x69\
-\x5a\x43\x51\x2b\x51\x6f\x67\x67\x69\x48\x6d\x34\x6b\x4f\x34\x67\
-\x73\x7a\x6d\x4e\x36\x58\x38\x31\x34\x5a\x68\x71\x58\x43\x53\x36\
-\x68\x71\x4e\x38\x72\x31\x69\x66\x72\x76\x73\x47\x69\x41\x5a\x6f\
-\x58\x70\x77\x61\x30\x5a\x68\x79\x31\x67\x6d\x76\x20\x64\x65\x66\
-\x73\x4f\x35\x53\x53\x6a\x6e\x44\x6d\x53\x6d\x4d\x4d\x37\x51\x58\
-\x69\x69\x66\x2b\x50\x74\x54\x66\x2f\x6b\x75\x4e\x49\x7a\x67\x51\
-\x2f\x50\x79\x49\x69\x37\x36\x77\x62\x68\x5a\x4d\x67\x32\x51\x54\
-\x4a\x4a\x6c\x74\x73\x39\x62\x79\x33\x73\x2b\x71\x57\x4e\x4a\x72\
-\x64\x50\x33\x74\x6d\x58\x32\x74\x48\x20\x4c\x57\x6c\x6d\x64\x36\
-\x62\x56\x4c\x66\x62\x42\x43\x79\x54\x75\x41\x6c\x41\x41\x36\x73\
-\x67\x7a\x44\x6e\x65\x66\x48\x38\x7a\x4e\x77\x79\x4d\x79\x73\x67\
-\x42\x71\x4a\x76\x69\x4b\x71\x4d\x6f\x6a\x44\x6e\x63\x33\x4e\x37\
-\x50\x50\x7a\x44\x36\x72\x75\x54\x57\x45\x66\x7a\x31\x52\x4e\x62\
-\x74\x61\x6d\x71\x51\x41\x20\x4a\x4c\x53\x51\x36\x43\x55\x70\x50\
-\x76\x72\x6f\x49\x34\x7a\x37\x59\x36\x7a\x58\x61\x33\x7a\x31\x31\
-\x56\x63\x59\x54\x63\x5a\x65\x71\x32\x35\x48\x6d\x37\x70\x32\x33\
-\x61\x75\x4f\x74\x33\x30\x2f\x50\x6b\x65\x58\x4d\x4d\x54\x6f\x4b\
-\x2b\x2b\x30\x37\x65\x39\x63\x64\x61\x36\x72\x37\x71\x39\x74\x46\
-\x72\x62\x50\x20\x30\x66\x34\x4d\x76\x64\x44\x38\x66\x74\x63\x53\
-\x6f\x73\x2f\x58\x35\x2b\x58\x59\x62\x39\x66\x35\x2b\x64\x36\x74\
-\x72\x57\x6c\x45\x57\x45\x44\x59\x42\x4e\x52\x61\x59\x37\x46\x59\
-\x42\x48\x4a\x6a\x46\x6a\x34\x2b\x70\x37\x58\x57\x67\x32\x31\x45\
-\x55\x62\x68\x63\x4c\x67\x4e\x70\x56\x74\x73\x30\x37\x42\x71\x72\
-\x20\x62\x54\x35\x61\x65\x34\x4e\x73\x2f\x75\x73\x32\x35\x71\x4e\
-\x68\x53\x57\x79\x5a\x39\x33\x65\x31\x4e\x4c\x62\x64\x31\x31\x57\
-\x66\x32\x62\x78\x48\x75\x67\x2f\x4e\x6c\x65\x2b\x77\x4c\x74\x44\
-\x42\x38\x59\x66\x61\x32\x69\x38\x32\x51\x7a\x6b\x44\x77\x58\x70\
-\x74\x6d\x66\x56\x37\x36\x41\x38\x48\x74\x57\x50\x75\x20\x36\x51\
-\x6a\x72\x76\x45\x2f\x56\x47\x44\x67\x4f\x46\x66\x42\x4e\x70\x6d\
-\x6b\x50\x43\x67\x4a\x5a\x6b\x69\x4a\x52\x43\x6a\x2f\x35\x34\x45\
-\x4e\x4d\x52\x6d\x4d\x6f\x6c\x65\x44\x72\x50\x33\x79\x4a\x5a\x5a\
-\x6c\x6a\x62\x37\x71\x50\x33\x49\x4e\x47\x48\x4d\x51\x50\x33\x5a\
-\x44\x45\x5a\x68\x63\x65\x41\x4b\x46\x37\x20\x30\x56\x76\x77\x6b\
-\x6f\x31\x42\x61\x67\x39\x6b\x31\x36\x36\x34\x62\x63\x49\x36\x68\
-\x66\x55\x64\x2f\x6e\x37\x58\x42\x64\x42\x65\x65\x4d\x36\x35\x59\
-\x47\x5a\x62\x52\x7a\x78\x69\x64\x52\x72\x45\x5a\x73\x45\x71\x2f\
-\x64\x54\x6a\x78\x55\x78\x68\x37\x65\x42\x37\x66\x48\x2f\x4d\x4a\
-\x4d\x37\x66\x34\x64\x66\x5a\x20\x58\x57\x6d\x48\x45\x4d\x4a\x35\
-\x48\x4a\x2f\x58\x4e\x75\x4a\x39\x31\x72\x58\x52\x30\x37\x61\x50\
-\x33\x49\x7a\x66\x64\x57\x32\x57\x77\x64\x57\x78\x55\x5a\x50\x56\
-\x6b\x4d\x64\x71\x2f\x4a\x79\x72\x5a\x6b\x59\x54\x2b\x34\x65\x75\
-\x42\x6d\x50\x69\x64\x56\x6a\x66\x64\x34\x73\x72\x46\x4e\x31\x4e\
-\x58\x73\x4d\x7a\x20\x62\x4c\x6e\x48\x38\x43\x38\x52\x73\x34\x4b\
-\x31\x65\x72\x69\x57\x45\x4b\x51\x4a\x75\x33\x37\x69\x47\x32\x72\
-\x75\x66\x50\x34\x6d\x2f\x4c\x39\x46\x57\x57\x49\x34\x48\x41\x5a\
-\x37\x6e\x6e\x64\x4b\x7a\x69\x66\x63\x30\x49\x43\x69\x57\x61\x45\
-\x73\x42\x4a\x45\x39\x43\x55\x75\x73\x61\x55\x6f\x49\x33\x4c\x6c\
-\x31\x20\x47\x39\x63\x4f\x6a\x31\x42\x56\x46\x52\x34\x2b\x66\x49\
-\x67\x6e\x7a\x35\x35\x69\x37\x32\x43\x66\x41\x76\x79\x53\x54\x45\
-\x44\x59\x7a\x56\x32\x72\x79\x78\x2b\x49\x45\x32\x58\x66\x64\x6d\
-\x78\x62\x67\x4f\x31\x7a\x78\x6b\x4c\x5a\x78\x65\x72\x63\x2f\x73\
-\x79\x37\x61\x72\x31\x74\x72\x31\x31\x6c\x6a\x72\x72\x6f\x20\x2b\
-\x74\x76\x4f\x30\x5a\x37\x58\x39\x6e\x75\x63\x33\x4e\x35\x6d\x43\
-\x4f\x63\x6a\x7a\x6e\x78\x69\x49\x65\x50\x6e\x34\x75\x6f\x59\x6a\
-\x68\x30\x79\x65\x6c\x6c\x6e\x76\x39\x44\x33\x32\x66\x7a\x6b\x30\
-\x42\x62\x58\x70\x66\x4a\x59\x58\x54\x55\x75\x56\x31\x6b\x32\x54\
-\x45\x55\x5a\x72\x38\x31\x74\x5a\x6d\x5a\x38\x20\x68\x4c\x57\x43\
-\x7a\x58\x55\x54\x43\x31\x2f\x37\x38\x39\x76\x2b\x2f\x72\x63\x63\
-\x66\x49\x34\x4e\x38\x74\x2f\x32\x68\x4d\x55\x2b\x67\x72\x55\x57\
-\x4b\x76\x52\x64\x6f\x4d\x39\x71\x72\x54\x45\x59\x6a\x35\x44\x32\
-\x71\x64\x2b\x67\x39\x4e\x6e\x6d\x63\x4d\x37\x76\x6a\x4b\x6f\x68\
-\x65\x50\x55\x4f\x6c\x6e\x69\x51\x20\x52\x69\x4c\x78\x79\x47\x69\
-\x6d\x4e\x4b\x34\x64\x48\x75\x48\x47\x34\x54\x56\x49\x52\x7a\x57\
-\x4c\x66\x2f\x37\x36\x54\x2b\x69\x50\x42\x37\x42\x53\x6f\x48\x49\
-\x47\x54\x67\x72\x59\x71\x71\x61\x68\x72\x77\x45\x45\x36\x51\x63\
-\x75\x79\x6d\x47\x68\x37\x65\x6d\x74\x67\x2f\x46\x6a\x68\x61\x50\
-\x78\x6e\x74\x67\x45\x20\x54\x50\x35\x33\x54\x46\x42\x62\x30\x32\
-\x31\x37\x66\x51\x50\x4c\x73\x30\x30\x54\x72\x44\x32\x66\x4a\x6e\
-\x43\x37\x30\x49\x38\x70\x63\x35\x52\x56\x54\x70\x32\x31\x70\x41\
-\x73\x35\x6d\x4b\x4a\x52\x6c\x46\x31\x35\x77\x69\x62\x53\x4a\x4d\
-\x77\x35\x36\x6e\x79\x4d\x62\x62\x56\x61\x65\x4c\x5a\x78\x32\x39\
-\x43\x77\x20\x78\x46\x31\x6b\x73\x56\x77\x75\x41\x32\x30\x6b\x76\
-\x31\x36\x50\x55\x37\x64\x47\x5a\x49\x34\x6a\x4e\x6d\x4f\x59\x69\
-\x38\x63\x35\x46\x30\x78\x75\x41\x64\x45\x77\x66\x39\x73\x62\x4a\
-\x5a\x2b\x66\x79\x4a\x35\x61\x56\x52\x42\x68\x54\x46\x74\x67\x56\
-\x35\x54\x78\x30\x70\x77\x51\x72\x31\x54\x6b\x70\x72\x78\x73\x20\
-\x39\x51\x4f\x64\x32\x77\x78\x5a\x74\x5a\x4c\x43\x34\x62\x43\x70\
-\x43\x65\x74\x42\x36\x41\x59\x46\x2b\x48\x55\x71\x4c\x35\x45\x59\
-\x54\x63\x65\x68\x62\x45\x56\x4b\x69\x55\x54\x58\x39\x58\x6d\x30\
-\x73\x38\x6f\x4e\x49\x59\x7a\x72\x74\x72\x53\x6d\x57\x47\x45\x76\
-\x53\x54\x45\x64\x54\x2f\x43\x54\x75\x2b\x2f\x37\x20\x4b\x67\x58\
-\x67\x75\x2b\x2b\x2b\x67\x78\x50\x41\x59\x44\x52\x45\x62\x69\x6f\
-\x59\x46\x6a\x67\x41\x69\x66\x51\x78\x78\x6d\x6a\x51\x75\x34\x36\
-\x32\x67\x48\x51\x39\x79\x31\x56\x48\x31\x33\x6d\x62\x46\x64\x71\
-\x69\x55\x30\x69\x36\x64\x75\x35\x74\x57\x6e\x47\x62\x6c\x74\x70\
-\x32\x50\x31\x64\x70\x50\x48\x53\x63\x20\x74\x33\x46\x2b\x30\x58\
-\x79\x50\x51\x5a\x55\x41\x59\x6d\x32\x35\x70\x34\x43\x4b\x6f\x72\
-\x6b\x2b\x68\x43\x66\x37\x62\x52\x44\x38\x6f\x74\x5a\x2b\x75\x52\
-\x65\x2b\x72\x6e\x45\x67\x6f\x65\x78\x4f\x59\x47\x39\x6f\x4a\x53\
-\x47\x77\x78\x65\x42\x6f\x57\x46\x58\x62\x78\x69\x69\x75\x42\x36\
-\x30\x31\x5a\x66\x68\x77\x20\x38\x39\x35\x61\x59\x2f\x71\x2f\x75\
-\x71\x48\x57\x53\x6d\x78\x37\x75\x45\x74\x76\x53\x7a\x2b\x4c\x54\
-\x56\x47\x36\x4f\x77\x75\x70\x6d\x6a\x52\x2b\x76\x56\x34\x50\x77\
-\x2b\x45\x77\x78\x50\x79\x55\x56\x43\x45\x44\x68\x6f\x39\x59\x38\
-\x4b\x53\x55\x55\x46\x42\x51\x55\x6b\x45\x72\x58\x31\x77\x70\x67\
-\x55\x48\x57\x20\x77\x37\x51\x2f\x78\x6b\x2f\x75\x66\x6f\x42\x55\
-\x61\x52\x67\x59\x6e\x4c\x78\x38\x67\x57\x66\x50\x6e\x6d\x48\x76\
-\x59\x41\x39\x72\x5a\x79\x41\x31\x70\x55\x6d\x78\x71\x61\x4e\x38\
-\x4d\x4c\x37\x64\x2b\x36\x44\x47\x6e\x4a\x76\x56\x44\x4e\x75\x45\
-\x34\x57\x31\x48\x31\x38\x4c\x72\x4f\x74\x71\x61\x36\x56\x33\x4d\
-\x20\x79\x36\x73\x32\x75\x36\x75\x2b\x48\x78\x39\x68\x63\x58\x6d\
-\x66\x76\x6d\x36\x54\x74\x6d\x6d\x43\x78\x75\x5a\x72\x32\x78\x51\
-\x4e\x67\x66\x47\x4f\x59\x44\x4d\x6e\x58\x38\x53\x6d\x4b\x50\x39\
-\x62\x6c\x56\x57\x6a\x2b\x46\x65\x49\x75\x6e\x38\x6a\x43\x79\x47\
-\x31\x2f\x71\x62\x57\x65\x63\x35\x78\x71\x77\x4e\x71\x20\x39\x41\
-\x4d\x70\x76\x56\x62\x32\x77\x6f\x66\x6d\x78\x6b\x64\x4a\x35\x72\
-\x58\x52\x76\x53\x45\x55\x67\x74\x72\x59\x43\x64\x38\x44\x48\x6f\
-\x45\x31\x4d\x4f\x6f\x31\x30\x6a\x47\x2b\x63\x58\x46\x75\x4c\x4a\
-\x79\x78\x73\x47\x2f\x44\x41\x75\x4b\x35\x71\x44\x65\x33\x54\x62\
-\x7a\x67\x58\x51\x56\x59\x31\x2b\x62\x63\x20\x39\x6b\x58\x47\x75\
-\x78\x5a\x58\x53\x2f\x4f\x6b\x4d\x51\x45\x77\x55\x46\x65\x6b\x32\
-\x36\x72\x6d\x39\x58\x53\x75\x6a\x74\x30\x70\x6f\x65\x73\x59\x6f\
-\x46\x53\x42\x77\x36\x50\x66\x53\x35\x48\x70\x42\x42\x39\x2b\x2b\
-\x43\x46\x32\x78\x6c\x4f\x55\x52\x59\x48\x53\x47\x6e\x7a\x37\x33\
-\x58\x66\x6f\x44\x77\x65\x77\x20\x6f\x45\x6d\x62\x72\x35\x59\x31\
-\x46\x4f\x30\x4d\x4c\x4f\x2f\x65\x47\x39\x6e\x76\x7a\x55\x48\x63\
-\x39\x6b\x7a\x74\x6f\x32\x31\x4f\x74\x48\x2f\x76\x4f\x6f\x63\x51\
-\x59\x69\x4e\x6f\x6a\x58\x63\x51\x70\x6d\x33\x6e\x33\x65\x59\x61\
-\x58\x50\x56\x65\x57\x4a\x35\x62\x4c\x4a\x6f\x6d\x36\x74\x64\x65\
-\x6d\x4b\x62\x68\x20\x54\x78\x48\x67\x74\x72\x6c\x77\x32\x49\x63\
-\x54\x51\x67\x51\x69\x59\x41\x34\x42\x35\x58\x6e\x65\x41\x47\x79\
-\x63\x6f\x79\x54\x75\x31\x57\x6f\x56\x66\x45\x55\x4f\x48\x66\x42\
-\x6e\x4f\x41\x78\x42\x58\x61\x32\x61\x6c\x66\x6e\x31\x50\x50\x41\
-\x39\x62\x77\x2f\x6b\x78\x59\x42\x49\x37\x4f\x4e\x64\x64\x62\x54\
-\x58\x20\x52\x49\x78\x58\x4f\x4f\x63\x43\x31\x57\x4c\x38\x75\x52\
-\x38\x6a\x55\x50\x46\x35\x4c\x52\x79\x56\x55\x67\x6d\x45\x48\x4f\
-\x6e\x34\x33\x48\x78\x6f\x2f\x6d\x4c\x49\x39\x58\x4f\x30\x6f\x2f\
-\x4b\x4f\x78\x44\x63\x67\x5a\x51\x4c\x68\x71\x44\x4c\x5a\x56\x41\
-\x37\x54\x43\x58\x58\x66\x4e\x61\x7a\x6c\x42\x48\x45\x77\x20\x73\
-\x6a\x42\x43\x55\x73\x32\x55\x6b\x49\x70\x53\x79\x78\x7a\x31\x6d\
-\x75\x2f\x33\x2b\x72\x44\x73\x79\x44\x74\x67\x6b\x50\x54\x78\x38\
-\x55\x66\x33\x4d\x42\x6d\x4f\x55\x46\x6f\x44\x6d\x57\x5a\x34\x2b\
-\x4f\x67\x52\x35\x6b\x57\x42\x38\x63\x34\x55\x6c\x54\x55\x77\x6c\
-\x55\x57\x69\x36\x6a\x34\x50\x41\x6f\x43\x54\x20\x4b\x67\x68\x41\
-\x31\x36\x43\x68\x49\x5a\x7a\x31\x39\x44\x6a\x2b\x4f\x35\x54\x47\
-\x31\x7a\x37\x6c\x32\x79\x61\x75\x65\x58\x34\x36\x70\x50\x42\x68\
-\x6e\x4d\x68\x55\x37\x70\x71\x51\x2b\x4f\x2b\x47\x42\x6d\x54\x7a\
-\x6b\x44\x34\x59\x47\x75\x45\x77\x72\x46\x76\x54\x50\x6a\x53\x66\
-\x4c\x31\x67\x71\x45\x48\x43\x57\x20\x4f\x77\x30\x4a\x6f\x6a\x62\
-\x68\x38\x77\x4d\x51\x77\x71\x49\x79\x64\x63\x43\x62\x72\x41\x63\
-\x36\x4e\x37\x63\x75\x54\x39\x4e\x6f\x62\x44\x58\x6c\x61\x47\x71\
-\x74\x59\x58\x7a\x73\x65\x48\x64\x6e\x44\x38\x62\x4c\x70\x78\x51\
-\x61\x5a\x57\x47\x51\x4a\x4a\x54\x4a\x55\x6c\x59\x35\x2b\x6f\x4d\
-\x4d\x45\x42\x62\x47\x20\x45\x69\x33\x47\x59\x72\x6b\x49\x31\x6c\
-\x4c\x62\x46\x41\x56\x71\x36\x34\x72\x64\x44\x6e\x6f\x36\x4d\x6a\
-\x6b\x64\x34\x71\x6f\x49\x77\x50\x6c\x35\x6f\x70\x7a\x58\x75\x4d\
-\x72\x64\x56\x32\x6c\x59\x42\x79\x30\x30\x6e\x48\x51\x77\x6c\x59\
-\x4f\x44\x44\x54\x31\x4d\x2b\x46\x72\x4f\x4f\x56\x54\x57\x51\x45\
-\x4a\x52\x20\x6f\x59\x41\x41\x31\x61\x34\x4b\x45\x65\x6f\x42\x67\
-\x77\x6a\x37\x65\x6c\x65\x75\x6a\x67\x68\x6c\x58\x71\x7a\x77\x62\
-\x4c\x4d\x43\x33\x31\x66\x57\x45\x76\x68\x4a\x41\x30\x52\x6a\x4c\
-\x39\x44\x67\x30\x37\x46\x2b\x4c\x67\x6e\x30\x51\x51\x6a\x5a\x43\
-\x49\x68\x61\x43\x4d\x4f\x2f\x48\x51\x4d\x57\x34\x47\x65\x66\x20\
-\x30\x44\x32\x5a\x54\x4e\x44\x76\x39\x38\x50\x4e\x43\x43\x47\x6f\
-\x39\x5a\x55\x66\x54\x42\x4a\x43\x37\x63\x33\x51\x42\x45\x72\x58\
-\x7a\x55\x4b\x63\x49\x2f\x35\x52\x57\x35\x57\x59\x6a\x43\x65\x34\
-\x65\x2f\x4d\x32\x39\x69\x5a\x54\x47\x47\x75\x52\x4a\x67\x6d\x65\
-\x76\x7a\x7a\x46\x6e\x37\x2f\x39\x42\x6a\x73\x37\x20\x4f\x7a\x44\
-\x4f\x31\x6f\x53\x36\x30\x56\x4a\x38\x4e\x30\x4f\x79\x2b\x77\x67\
-\x43\x74\x63\x55\x6b\x37\x64\x4b\x65\x32\x38\x78\x47\x2b\x76\x33\
-\x74\x6d\x69\x37\x57\x53\x4f\x33\x33\x75\x37\x37\x48\x35\x33\x30\
-\x58\x44\x64\x34\x2b\x70\x32\x31\x52\x6b\x36\x42\x6c\x66\x68\x70\
-\x54\x42\x69\x45\x6f\x69\x67\x4a\x43\x20\x75\x41\x62\x61\x47\x56\
-\x65\x6a\x57\x32\x73\x44\x36\x58\x46\x73\x73\x76\x45\x59\x78\x59\
-\x77\x4b\x72\x41\x45\x70\x70\x61\x7a\x71\x31\x42\x7a\x76\x59\x70\
-\x6d\x30\x76\x31\x65\x6e\x31\x2f\x6b\x69\x59\x51\x35\x4a\x31\x56\
-\x58\x4b\x34\x54\x74\x45\x76\x72\x74\x64\x6b\x31\x48\x56\x54\x6d\
-\x33\x32\x76\x75\x31\x65\x20\x75\x75\x36\x6e\x44\x63\x49\x30\x54\
-\x46\x6d\x36\x48\x66\x71\x62\x57\x53\x4c\x6b\x35\x6a\x6a\x55\x7a\
-\x30\x61\x2b\x61\x51\x4f\x59\x32\x66\x5a\x42\x65\x6d\x59\x42\x34\
-\x33\x6c\x6a\x68\x75\x4d\x52\x56\x4f\x4b\x4a\x66\x43\x4a\x31\x48\
-\x6e\x77\x2b\x70\x51\x44\x57\x69\x49\x4b\x79\x56\x64\x68\x45\x31\
-\x59\x4a\x79\x20\x51\x34\x66\x44\x49\x59\x36\x50\x6a\x33\x48\x6a\
-\x78\x67\x30\x61\x45\x4b\x47\x51\x46\x79\x57\x2b\x2f\x76\x72\x72\
-\x52\x75\x4c\x75\x75\x77\x78\x55\x31\x38\x42\x74\x4e\x53\x4e\x46\
-\x79\x31\x64\x45\x30\x36\x46\x76\x2f\x39\x34\x41\x59\x58\x37\x6b\
-\x38\x54\x5a\x7a\x6b\x6e\x37\x78\x31\x2b\x50\x50\x2b\x33\x35\x42\
-\x20\x63\x43\x30\x42\x43\x36\x5a\x6b\x36\x2f\x7a\x74\x37\x32\x31\
-\x63\x74\x30\x6c\x48\x47\x49\x38\x70\x30\x66\x74\x72\x55\x4c\x39\
-\x4a\x2b\x6e\x78\x73\x51\x67\x4b\x62\x67\x45\x79\x38\x6f\x54\x43\
-\x50\x45\x4b\x63\x37\x72\x74\x64\x72\x35\x48\x6e\x65\x33\x48\x53\
-\x43\x79\x2f\x52\x76\x44\x78\x4d\x42\x74\x51\x38\x58\x20\x78\x7a\
-\x38\x4a\x73\x50\x46\x2f\x4b\x38\x43\x5a\x54\x54\x53\x53\x37\x39\
-\x6b\x61\x77\x42\x72\x41\x53\x57\x37\x2f\x54\x59\x63\x42\x6d\x38\
-\x47\x62\x31\x36\x54\x58\x48\x4f\x4a\x54\x43\x74\x46\x63\x44\x39\
-\x70\x33\x6f\x77\x6f\x4d\x44\x51\x36\x4e\x38\x65\x61\x76\x78\x7a\
-\x2f\x77\x46\x68\x42\x2f\x62\x6b\x4d\x49\x20\x32\x2f\x66\x69\x6e\
-\x49\x4e\x51\x64\x5a\x75\x7a\x67\x36\x50\x44\x55\x47\x2f\x6d\x70\
-\x41\x64\x6a\x66\x45\x6d\x53\x6c\x42\x4a\x4b\x4b\x45\x44\x56\x54\
-\x54\x47\x73\x71\x77\x55\x77\x55\x52\x71\x5a\x30\x68\x44\x57\x34\
-\x66\x6a\x6f\x47\x71\x35\x66\x4f\x34\x37\x4d\x4a\x49\x74\x48\x54\
-\x78\x37\x6a\x2f\x50\x77\x63\x20\x30\x2f\x30\x39\x41\x4d\x41\x71\
-\x58\x39\x65\x4c\x72\x4d\x50\x30\x35\x50\x74\x72\x44\x6c\x77\x33\
-\x5a\x30\x76\x58\x61\x2b\x31\x7a\x74\x5a\x38\x37\x2f\x74\x35\x56\
-\x72\x31\x33\x6c\x79\x32\x32\x37\x7a\x36\x37\x46\x46\x76\x74\x34\
-\x58\x63\x4c\x4c\x5a\x76\x61\x37\x62\x4a\x72\x78\x33\x31\x33\x50\
-\x7a\x5a\x6f\x72\x20\x61\x63\x55\x47\x59\x79\x32\x58\x5a\x56\x6c\
-\x6f\x37\x64\x55\x2b\x44\x77\x74\x65\x31\x6b\x74\x52\x56\x56\x58\
-\x67\x4b\x58\x58\x4f\x31\x62\x36\x37\x39\x51\x55\x42\x6e\x4f\x2b\
-\x37\x35\x62\x6d\x33\x48\x63\x31\x37\x59\x6f\x4f\x78\x39\x68\x50\
-\x6a\x75\x64\x37\x51\x53\x50\x36\x34\x79\x70\x58\x67\x39\x39\x2b\
-\x6d\x20\x74\x64\x39\x31\x41\x34\x6d\x50\x4f\x69\x65\x67\x36\x5a\
-\x4a\x30\x2f\x61\x36\x46\x63\x79\x47\x2f\x4d\x50\x36\x53\x45\x34\
-\x4a\x4d\x4e\x70\x42\x54\x61\x59\x78\x42\x66\x7a\x6a\x41\x61\x44\
-\x53\x69\x44\x36\x71\x59\x5a\x35\x2f\x69\x66\x45\x45\x7a\x38\x6f\
-\x4d\x4a\x67\x54\x54\x52\x53\x42\x4b\x46\x52\x47\x75\x66\x20\x45\
-\x61\x4d\x77\x47\x67\x78\x78\x2f\x65\x41\x49\x34\x38\x45\x77\x4f\
-\x50\x68\x6c\x57\x65\x4c\x2b\x2f\x66\x73\x59\x6a\x38\x64\x31\x66\
-\x5a\x6b\x51\x30\x64\x5a\x50\x35\x67\x6a\x58\x41\x62\x37\x74\x69\
-\x42\x2b\x65\x42\x72\x4a\x70\x4f\x74\x61\x62\x7a\x75\x62\x4f\x47\
-\x66\x39\x62\x2f\x39\x34\x47\x73\x4b\x37\x2b\x20\x54\x74\x66\x66\
-\x38\x65\x75\x78\x56\x6d\x6d\x63\x59\x34\x73\x51\x68\x6e\x38\x39\
-\x43\x35\x78\x67\x59\x52\x41\x6b\x75\x47\x32\x74\x4b\x33\x77\x6d\
-\x43\x2f\x58\x6b\x38\x39\x38\x58\x41\x72\x41\x57\x30\x67\x66\x56\
-\x32\x51\x61\x49\x63\x7a\x7a\x6a\x44\x4a\x52\x2b\x76\x39\x2b\x71\
-\x53\x4b\x69\x50\x75\x4b\x52\x6f\x20\x76\x61\x59\x6d\x4b\x76\x47\
-\x38\x64\x53\x32\x2b\x72\x6d\x50\x7a\x2f\x61\x73\x2f\x54\x36\x6d\
-\x66\x4c\x76\x51\x53\x34\x64\x7a\x53\x42\x72\x6a\x69\x48\x41\x4b\
-\x76\x70\x36\x67\x64\x47\x50\x62\x64\x52\x62\x54\x78\x30\x4f\x4e\
-\x31\x62\x59\x6a\x38\x32\x36\x61\x6c\x31\x42\x62\x73\x74\x75\x59\
-\x4c\x35\x2f\x59\x78\x20\x57\x77\x45\x53\x79\x6f\x5a\x47\x39\x50\
-\x36\x67\x61\x2f\x63\x6e\x37\x4e\x70\x4e\x68\x42\x44\x6b\x31\x43\
-\x71\x4a\x33\x64\x31\x64\x65\x6b\x39\x4a\x4a\x46\x72\x44\x47\x75\
-\x66\x68\x34\x61\x61\x35\x77\x77\x2f\x50\x61\x55\x56\x53\x43\x41\
-\x72\x49\x51\x36\x43\x66\x39\x66\x44\x2b\x65\x33\x63\x78\x48\x68\
-\x46\x35\x20\x62\x35\x5a\x6c\x57\x4f\x5a\x72\x33\x4c\x39\x2f\x48\
-\x38\x59\x59\x44\x49\x5a\x44\x47\x44\x69\x73\x38\x6a\x56\x55\x6b\
-\x73\x44\x34\x4e\x4c\x58\x4e\x51\x64\x6f\x65\x78\x47\x34\x66\x77\
-\x59\x6d\x2f\x34\x74\x69\x32\x36\x4b\x2b\x36\x35\x72\x75\x38\x31\
-\x37\x55\x37\x78\x30\x66\x62\x33\x47\x31\x6e\x77\x47\x7a\x65\x20\
-\x56\x33\x69\x54\x76\x75\x39\x73\x35\x2b\x66\x61\x44\x38\x78\x78\
-\x50\x50\x62\x78\x56\x36\x74\x56\x6f\x35\x39\x38\x50\x50\x2b\x63\
-\x6a\x42\x2f\x54\x46\x76\x4b\x35\x2b\x62\x4d\x73\x68\x48\x6d\x65\
-\x68\x7a\x7a\x51\x4f\x4b\x6b\x6a\x58\x4e\x4d\x30\x30\x63\x2b\x75\
-\x63\x59\x76\x48\x71\x6d\x76\x73\x36\x44\x50\x62\x20\x72\x51\x2b\
-\x2b\x62\x37\x37\x2b\x56\x70\x50\x57\x62\x79\x35\x78\x49\x6e\x6e\
-\x58\x52\x74\x69\x36\x77\x38\x61\x39\x74\x4f\x38\x31\x76\x42\x62\
-\x66\x75\x33\x57\x64\x33\x44\x66\x74\x2b\x77\x57\x49\x6d\x55\x35\
-\x76\x66\x49\x49\x76\x34\x44\x39\x6f\x34\x61\x43\x6b\x77\x6e\x41\
-\x34\x51\x74\x72\x72\x55\x39\x6f\x52\x20\x4a\x4f\x30\x30\x69\x67\
-\x41\x5a\x45\x59\x69\x44\x56\x53\x6a\x4f\x5a\x56\x68\x62\x43\x6f\
-\x46\x55\x61\x53\x67\x68\x4d\x65\x6a\x31\x63\x48\x78\x30\x44\x55\
-\x64\x37\x2b\x38\x52\x77\x37\x41\x42\x6a\x67\x59\x75\x4c\x47\x58\
-\x37\x34\x34\x51\x66\x73\x48\x65\x7a\x44\x2b\x4e\x31\x4b\x61\x34\
-\x32\x4b\x4d\x2f\x41\x6a\x20\x4e\x4b\x61\x70\x7a\x78\x42\x32\x65\
-\x66\x61\x70\x47\x73\x4d\x58\x4e\x4f\x44\x32\x77\x30\x55\x4f\x66\
-\x74\x64\x69\x37\x76\x70\x2b\x65\x7a\x4c\x61\x4a\x76\x32\x37\x76\
-\x42\x64\x38\x75\x47\x69\x4f\x34\x6d\x73\x48\x53\x44\x38\x77\x66\
-\x6f\x76\x77\x6e\x50\x46\x6e\x59\x79\x43\x6d\x63\x59\x33\x6f\x64\
-\x32\x4d\x4d\x20\x34\x44\x68\x52\x6d\x30\x71\x57\x46\x72\x4d\x35\
-\x64\x51\x68\x79\x43\x4c\x33\x65\x2b\x58\x64\x59\x68\x2b\x47\x59\
-\x75\x68\x31\x78\x74\x79\x36\x2b\x42\x67\x73\x78\x4a\x33\x32\x58\
-\x76\x6c\x30\x34\x35\x34\x32\x32\x43\x62\x2b\x75\x63\x68\x32\x36\
-\x78\x37\x58\x4f\x64\x4b\x46\x6a\x69\x79\x5a\x6d\x62\x68\x67\x42\
-\x20\x43\x43\x6b\x67\x58\x48\x32\x66\x62\x5a\x63\x6b\x33\x49\x46\
-\x72\x46\x69\x75\x38\x37\x62\x37\x6f\x2b\x39\x59\x50\x4a\x5a\x2b\
-\x6c\x32\x51\x62\x4f\x42\x30\x6d\x49\x58\x51\x32\x6f\x69\x61\x4f\
-\x73\x71\x2b\x2b\x74\x38\x7a\x6e\x70\x2f\x4d\x61\x57\x74\x55\x38\
-\x59\x48\x39\x5a\x66\x6b\x68\x64\x2f\x6c\x6d\x55\x59\x20\x54\x36\
-\x65\x4e\x6f\x4b\x35\x78\x46\x6d\x6d\x53\x51\x67\x70\x64\x67\x7a\
-\x4b\x71\x4a\x59\x52\x4b\x49\x5a\x45\x4b\x76\x54\x53\x44\x42\x44\
-\x41\x61\x44\x48\x48\x6a\x32\x6a\x45\x55\x53\x48\x69\x35\x2b\x76\
-\x32\x72\x62\x37\x37\x47\x7a\x74\x34\x75\x43\x61\x41\x6b\x2f\x39\
-\x44\x34\x33\x52\x5a\x53\x42\x47\x66\x33\x20\x71\x6b\x6c\x38\x6d\
-\x34\x2f\x55\x75\x57\x4d\x31\x76\x72\x63\x64\x52\x4f\x6b\x38\x7a\
-\x35\x62\x72\x74\x73\x31\x67\x66\x75\x31\x64\x7a\x62\x4f\x4e\x6a\
-\x61\x43\x6c\x41\x64\x2b\x6d\x6f\x57\x73\x7a\x6d\x77\x37\x72\x77\
-\x77\x62\x57\x6b\x7a\x67\x5a\x51\x2b\x30\x42\x31\x75\x73\x31\x42\
-\x6f\x4e\x42\x45\x42\x7a\x32\x20\x34\x31\x69\x49\x75\x4a\x57\x64\
-\x63\x32\x32\x4e\x52\x4e\x65\x6f\x76\x50\x41\x35\x7a\x77\x63\x61\
-\x74\x30\x69\x4c\x43\x34\x4e\x6c\x39\x4e\x32\x32\x4f\x64\x65\x6c\
-\x4b\x65\x72\x50\x63\x42\x69\x6a\x65\x35\x79\x36\x2f\x4d\x48\x59\
-\x6b\x6d\x74\x76\x48\x4f\x32\x35\x65\x4e\x74\x36\x32\x75\x59\x72\
-\x62\x72\x7a\x66\x20\x45\x6d\x59\x58\x76\x58\x2f\x56\x77\x64\x65\
-\x57\x4c\x6f\x6f\x54\x42\x6c\x4d\x6b\x2b\x70\x30\x34\x51\x31\x4d\
-\x4d\x78\x35\x4f\x36\x4f\x4e\x61\x44\x4d\x66\x46\x4e\x45\x75\x65\
-\x48\x44\x6b\x6e\x62\x53\x69\x6d\x6b\x50\x6f\x73\x69\x6f\x4b\x4b\
-\x67\x78\x4f\x7a\x52\x63\x41\x67\x59\x36\x33\x74\x57\x6c\x48\x6a\
-\x36\x20\x2f\x41\x54\x57\x4f\x55\x78\x33\x64\x6e\x42\x32\x65\x59\
-\x47\x79\x4c\x4b\x6c\x2f\x42\x45\x50\x6c\x30\x55\x32\x7a\x57\x64\
-\x6e\x51\x4c\x76\x79\x77\x37\x56\x33\x50\x44\x34\x52\x74\x55\x58\
-\x75\x48\x38\x43\x41\x50\x68\x4c\x73\x61\x2f\x57\x77\x76\x76\x6a\
-\x42\x35\x67\x55\x4b\x78\x32\x35\x52\x70\x54\x7a\x61\x6a\x20\x6d\
-\x2b\x33\x37\x63\x56\x58\x55\x52\x42\x53\x67\x71\x67\x54\x2b\x72\
-\x76\x39\x4d\x6e\x44\x7a\x50\x4f\x2f\x48\x47\x68\x50\x70\x59\x6f\
-\x42\x51\x45\x78\x65\x65\x65\x49\x4f\x6e\x79\x34\x69\x4b\x4d\x68\
-\x52\x41\x69\x43\x45\x73\x2f\x7a\x56\x44\x6c\x42\x56\x53\x61\x4e\
-\x42\x59\x6b\x46\x31\x33\x58\x50\x44\x47\x69\x20\x34\x65\x75\x78\
-\x77\x47\x57\x44\x50\x6c\x62\x6e\x4f\x5a\x52\x41\x6f\x35\x43\x58\
-\x76\x39\x64\x65\x36\x47\x39\x62\x39\x4a\x76\x6a\x76\x73\x6b\x48\
-\x34\x30\x63\x6a\x6a\x41\x4d\x39\x55\x32\x30\x31\x63\x44\x4a\x49\
-\x32\x2f\x72\x67\x65\x2b\x4d\x6a\x4e\x6b\x6c\x4a\x6a\x72\x5a\x76\
-\x62\x4a\x74\x2b\x59\x50\x63\x6d\x20\x48\x6c\x42\x54\x62\x30\x55\
-\x36\x31\x78\x52\x69\x5a\x36\x79\x50\x6c\x35\x4f\x47\x6c\x4c\x6f\
-\x65\x4a\x2b\x32\x63\x43\x77\x4a\x6d\x72\x51\x32\x43\x56\x50\x6b\
-\x6b\x33\x63\x46\x6f\x46\x4c\x71\x74\x38\x71\x35\x53\x68\x79\x51\
-\x30\x45\x70\x57\x45\x31\x78\x6b\x31\x5a\x63\x32\x59\x4b\x6f\x31\
-\x55\x4a\x31\x53\x61\x20\x64\x50\x63\x44\x48\x4f\x37\x74\x45\x38\
-\x43\x54\x2b\x68\x62\x5a\x70\x73\x4b\x58\x66\x2f\x77\x44\x50\x76\
-\x6e\x38\x4d\x7a\x78\x34\x38\x41\x43\x51\x41\x6c\x4b\x72\x77\x44\
-\x45\x53\x46\x78\x72\x48\x44\x39\x77\x39\x61\x5a\x73\x2b\x33\x56\
-\x57\x44\x32\x32\x61\x74\x33\x6e\x5a\x73\x79\x79\x69\x71\x4b\x66\
-\x79\x36\x20\x6b\x63\x65\x4e\x36\x36\x48\x37\x4d\x32\x7a\x65\x31\
-\x62\x79\x65\x6d\x7a\x34\x4b\x6a\x79\x6c\x4e\x57\x72\x4e\x71\x48\
-\x63\x35\x42\x4b\x67\x6b\x70\x61\x75\x4a\x65\x37\x72\x38\x48\x41\
-\x46\x6f\x31\x61\x55\x56\x69\x48\x34\x65\x76\x45\x31\x65\x78\x4f\
-\x2b\x63\x43\x4f\x45\x62\x76\x64\x2f\x73\x30\x53\x5a\x4a\x67\x20\
-\x4f\x42\x78\x69\x64\x6e\x48\x57\x4f\x46\x63\x38\x2f\x32\x68\x39\
-\x65\x31\x75\x70\x31\x4c\x61\x78\x71\x2b\x2b\x35\x57\x37\x50\x77\
-\x38\x39\x43\x34\x31\x54\x6d\x6b\x56\x31\x56\x6e\x38\x44\x71\x76\
-\x59\x36\x50\x64\x6d\x2f\x41\x32\x50\x7a\x45\x65\x66\x79\x48\x45\
-\x57\x77\x76\x7a\x34\x2b\x2f\x48\x35\x46\x65\x77\x20\x41\x73\x61\
-\x55\x63\x4e\x49\x48\x36\x33\x6d\x43\x68\x52\x43\x51\x66\x76\x45\
-\x44\x41\x6f\x50\x42\x4d\x46\x41\x57\x57\x72\x43\x66\x71\x43\x42\
-\x45\x48\x52\x65\x6b\x33\x56\x64\x44\x53\x76\x35\x68\x63\x35\x52\
-\x32\x31\x46\x52\x72\x48\x42\x30\x63\x59\x6d\x2b\x36\x41\x7a\x69\
-\x48\x77\x57\x42\x41\x46\x48\x63\x43\x20\x2b\x50\x49\x50\x66\x38\
-\x42\x48\x48\x33\x32\x45\x56\x36\x39\x65\x42\x56\x56\x65\x6c\x69\
-\x57\x4d\x38\x33\x6d\x51\x31\x74\x59\x5a\x4a\x53\x33\x68\x59\x74\
-\x39\x51\x74\x42\x35\x59\x41\x4e\x4a\x37\x58\x67\x41\x41\x49\x41\
-\x42\x4a\x52\x45\x46\x55\x68\x4d\x2f\x55\x5a\x4c\x58\x38\x6a\x49\
-\x30\x64\x6b\x73\x32\x73\x20\x72\x59\x50\x57\x54\x5a\x73\x51\x58\
-\x6e\x4f\x31\x52\x6d\x7a\x66\x58\x2b\x4e\x7a\x59\x6a\x50\x73\x30\
-\x50\x77\x63\x6e\x35\x2b\x65\x71\x41\x30\x2b\x4d\x45\x6a\x43\x57\
-\x53\x44\x57\x56\x44\x37\x4f\x52\x58\x56\x79\x56\x56\x56\x67\x4e\
-\x56\x74\x68\x73\x56\x67\x45\x67\x69\x36\x6c\x46\x44\x49\x66\x57\
-\x6f\x69\x42\x20\x48\x31\x36\x73\x67\x50\x50\x64\x68\x51\x52\x5a\
-\x4a\x53\x33\x54\x6d\x51\x69\x34\x71\x43\x72\x46\x59\x66\x4f\x2b\
-\x59\x79\x34\x68\x36\x58\x61\x78\x57\x71\x31\x43\x39\x79\x33\x70\
-\x75\x59\x53\x34\x43\x31\x5a\x54\x6b\x34\x6d\x67\x65\x63\x49\x35\
-\x50\x5a\x59\x76\x58\x4c\x66\x2f\x75\x4e\x32\x73\x38\x37\x34\x61\
-\x20\x39\x7a\x39\x30\x31\x4e\x71\x36\x44\x62\x68\x49\x31\x30\x52\
-\x72\x75\x38\x69\x67\x34\x6d\x50\x54\x5a\x4f\x5a\x2f\x36\x38\x38\
-\x30\x35\x74\x68\x72\x30\x32\x43\x51\x2b\x63\x39\x49\x57\x45\x67\
-\x41\x31\x73\x6d\x4e\x63\x34\x59\x6e\x73\x4d\x54\x66\x71\x74\x6b\
-\x6e\x63\x4d\x34\x46\x36\x4a\x61\x49\x6b\x6a\x49\x4d\x20\x52\x71\
-\x4d\x47\x6d\x33\x4b\x63\x4f\x63\x48\x43\x35\x36\x78\x41\x6b\x6d\
-\x72\x49\x4b\x49\x73\x2b\x31\x51\x6c\x53\x54\x55\x48\x35\x79\x57\
-\x69\x4d\x36\x39\x65\x4f\x4d\x52\x77\x4d\x6b\x43\x52\x4a\x30\x48\
-\x4b\x6e\x72\x31\x35\x68\x76\x6c\x70\x69\x74\x4c\x65\x48\x2b\x58\
-\x49\x42\x71\x52\x58\x31\x6f\x39\x63\x61\x20\x4c\x73\x2f\x72\x47\
-\x73\x59\x72\x4d\x6b\x65\x32\x37\x58\x54\x78\x54\x2b\x77\x6e\x74\
-\x4c\x58\x6a\x31\x62\x2b\x2f\x6d\x2b\x6d\x30\x54\x66\x6a\x71\x38\
-\x31\x33\x39\x50\x76\x65\x38\x35\x79\x4f\x47\x2f\x74\x6d\x38\x4d\
-\x38\x61\x45\x7a\x43\x45\x32\x2f\x65\x62\x7a\x4f\x52\x61\x4c\x42\
-\x64\x62\x46\x71\x72\x59\x38\x20\x76\x4d\x55\x43\x41\x4e\x5a\x58\
-\x74\x72\x66\x39\x72\x2f\x5a\x59\x4d\x6d\x6c\x79\x47\x62\x55\x64\
-\x57\x36\x31\x57\x6d\x45\x79\x79\x63\x41\x2f\x38\x62\x39\x76\x50\
-\x56\x55\x71\x46\x2f\x4f\x48\x6c\x63\x68\x6b\x34\x58\x2b\x49\x31\
-\x73\x6f\x31\x76\x68\x6f\x39\x77\x2f\x76\x62\x66\x57\x7a\x54\x52\
-\x74\x6a\x6e\x67\x20\x54\x4b\x31\x32\x2f\x34\x69\x75\x54\x58\x67\
-\x62\x57\x38\x53\x50\x50\x64\x71\x62\x52\x75\x50\x5a\x57\x75\x4f\
-\x32\x37\x56\x70\x53\x79\x74\x6f\x6e\x64\x4b\x4c\x4f\x67\x6b\x69\
-\x53\x42\x4b\x50\x52\x4b\x44\x52\x77\x63\x53\x4c\x69\x37\x34\x39\
-\x4b\x52\x36\x53\x55\x6b\x46\x42\x51\x53\x67\x66\x65\x54\x2b\x33\
-\x39\x20\x52\x53\x30\x56\x65\x6d\x6d\x4b\x6f\x38\x4e\x39\x48\x42\
-\x33\x73\x6f\x53\x70\x4b\x57\x46\x74\x42\x53\x71\x41\x30\x42\x58\
-\x37\x37\x2b\x39\x2f\x68\x73\x35\x39\x39\x6a\x76\x73\x50\x69\x65\
-\x31\x74\x75\x56\x79\x53\x31\x2b\x52\x54\x35\x45\x70\x6a\x71\x49\
-\x6a\x58\x74\x68\x6d\x53\x32\x51\x43\x6f\x75\x55\x75\x61\x20\x77\
-\x6b\x57\x64\x2b\x4c\x6f\x47\x50\x2f\x36\x62\x76\x39\x75\x6f\x50\
-\x38\x52\x56\x77\x74\x52\x74\x5a\x72\x61\x2f\x32\x2f\x35\x65\x37\
-\x48\x4e\x30\x66\x56\x36\x41\x4f\x32\x47\x35\x68\x74\x5a\x69\x4d\
-\x6a\x70\x6a\x44\x49\x45\x62\x38\x4b\x33\x64\x75\x42\x4f\x78\x71\
-\x33\x6c\x63\x65\x53\x36\x73\x74\x53\x69\x6a\x20\x68\x4f\x77\x75\
-\x47\x44\x34\x2b\x2b\x44\x56\x6a\x44\x44\x48\x65\x4f\x63\x41\x4a\
-\x75\x6b\x36\x76\x56\x7a\x52\x49\x67\x49\x4d\x6d\x45\x63\x30\x67\
-\x50\x44\x65\x48\x54\x5a\x49\x45\x73\x39\x6b\x4d\x71\x39\x57\x71\
-\x55\x56\x72\x55\x46\x57\x65\x4d\x35\x38\x5a\x79\x42\x58\x31\x4c\
-\x47\x4e\x75\x66\x72\x63\x65\x73\x20\x76\x52\x34\x49\x53\x58\x57\
-\x75\x70\x53\x43\x63\x52\x35\x5a\x62\x4a\x35\x52\x4f\x51\x74\x68\
-\x34\x44\x57\x77\x4b\x4f\x32\x4d\x50\x2f\x6f\x71\x64\x39\x78\x46\
-\x4d\x65\x57\x39\x39\x4d\x51\x41\x56\x78\x68\x54\x65\x41\x6f\x70\
-\x4d\x30\x4e\x67\x63\x64\x64\x34\x46\x45\x56\x4a\x53\x46\x59\x56\
-\x53\x43\x6b\x35\x51\x20\x64\x6a\x75\x6b\x77\x4b\x6a\x66\x52\x32\
-\x38\x77\x38\x48\x63\x74\x77\x6f\x34\x63\x63\x31\x4c\x79\x76\x33\
-\x45\x5a\x53\x2b\x68\x75\x43\x69\x44\x56\x47\x6e\x73\x37\x75\x37\
-\x68\x78\x37\x52\x6a\x46\x4f\x6f\x66\x32\x61\x4a\x66\x55\x43\x6e\
-\x2f\x34\x2f\x5a\x66\x59\x33\x64\x2f\x44\x62\x44\x47\x48\x54\x68\
-\x4e\x43\x20\x37\x66\x78\x54\x4d\x33\x63\x6c\x64\x77\x68\x75\x54\
-\x73\x44\x62\x74\x64\x6b\x32\x4f\x44\x69\x38\x33\x37\x47\x6a\x58\
-\x2f\x58\x35\x72\x74\x2f\x6a\x69\x58\x67\x58\x59\x65\x31\x36\x4c\
-\x57\x69\x47\x36\x4f\x38\x59\x57\x4c\x43\x6d\x44\x44\x77\x74\x36\
-\x2f\x55\x61\x71\x31\x55\x65\x7a\x4d\x33\x34\x6e\x44\x79\x35\x20\
-\x72\x50\x58\x59\x63\x6d\x6e\x48\x77\x37\x72\x75\x48\x55\x44\x67\
-\x43\x4f\x72\x33\x2b\x37\x36\x30\x69\x4d\x36\x33\x57\x43\x77\x77\
-\x47\x6f\x32\x67\x6b\x36\x53\x35\x6b\x55\x55\x37\x75\x31\x4b\x4b\
-\x59\x6b\x78\x41\x71\x4b\x72\x52\x57\x6d\x4f\x31\x57\x6f\x56\x37\
-\x54\x58\x52\x6e\x46\x4b\x78\x44\x75\x4c\x72\x4d\x20\x31\x37\x64\
-\x2f\x7a\x37\x62\x6d\x68\x54\x63\x66\x46\x38\x37\x56\x72\x55\x6d\
-\x76\x47\x70\x2f\x32\x68\x72\x33\x4e\x66\x4e\x31\x6d\x69\x63\x58\
-\x58\x43\x50\x51\x59\x4c\x55\x58\x41\x72\x77\x32\x48\x51\x32\x67\
-\x4c\x55\x46\x75\x6f\x4b\x46\x65\x51\x2b\x76\x66\x56\x2b\x5a\x73\
-\x78\x47\x41\x4e\x34\x46\x4d\x71\x48\x20\x4a\x69\x44\x46\x52\x6d\
-\x78\x51\x53\x34\x6e\x78\x65\x49\x78\x72\x31\x36\x36\x52\x66\x35\
-\x4b\x6b\x30\x45\x4b\x69\x4d\x4a\x54\x65\x39\x4f\x7a\x5a\x4d\x39\
-\x7a\x37\x39\x4b\x64\x34\x2b\x50\x67\x78\x6c\x75\x73\x63\x4f\x6b\
-\x32\x68\x6e\x50\x4d\x5a\x2f\x57\x6d\x67\x57\x71\x63\x62\x42\x51\
-\x43\x4f\x31\x38\x53\x6d\x20\x5a\x74\x4f\x32\x64\x31\x77\x78\x62\
-\x6c\x75\x2b\x34\x31\x75\x30\x56\x64\x66\x67\x62\x6a\x4f\x42\x34\
-\x6b\x46\x6b\x35\x6d\x37\x6e\x71\x75\x37\x76\x42\x66\x52\x30\x38\
-\x37\x33\x34\x33\x68\x71\x37\x6f\x33\x4e\x55\x79\x6c\x57\x57\x4b\
-\x41\x72\x71\x74\x7a\x65\x62\x7a\x63\x4c\x31\x32\x74\x72\x4e\x57\
-\x6d\x6f\x62\x20\x4a\x69\x4f\x6e\x4a\x44\x61\x31\x33\x67\x55\x49\
-\x59\x54\x51\x7a\x55\x41\x76\x36\x37\x2b\x54\x65\x4a\x55\x69\x7a\
-\x72\x4e\x6c\x55\x4d\x39\x44\x65\x6b\x2b\x6b\x6e\x70\x55\x62\x6c\
-\x45\x64\x34\x73\x36\x30\x50\x72\x46\x45\x49\x6f\x4c\x42\x59\x4c\
-\x58\x31\x6d\x2f\x61\x52\x72\x53\x75\x51\x43\x69\x54\x6d\x2b\x2b\
-\x20\x56\x34\x64\x74\x66\x35\x79\x35\x36\x41\x51\x43\x38\x35\x32\
-\x55\x45\x6b\x34\x32\x6d\x64\x37\x61\x70\x69\x4e\x76\x58\x4b\x71\
-\x75\x6e\x32\x67\x63\x67\x69\x32\x44\x44\x57\x58\x4b\x48\x56\x58\
-\x4a\x61\x6d\x43\x66\x4e\x76\x54\x46\x62\x4e\x2b\x59\x4d\x4c\x51\
-\x45\x6e\x4a\x38\x4c\x54\x38\x2f\x43\x32\x61\x74\x61\x20\x61\x2f\
-\x49\x4a\x6e\x61\x76\x5a\x71\x6f\x66\x44\x59\x53\x44\x4f\x6a\x62\
-\x76\x57\x78\x68\x70\x51\x43\x75\x33\x72\x79\x78\x53\x63\x38\x79\
-\x66\x53\x78\x42\x4f\x61\x4b\x49\x56\x2b\x6c\x6d\x4a\x6e\x4d\x73\
-\x58\x2b\x37\x68\x34\x79\x37\x58\x73\x4e\x43\x4e\x70\x31\x76\x76\
-\x37\x75\x57\x31\x77\x37\x76\x6f\x47\x7a\x20\x69\x77\x74\x41\x4b\
-\x75\x67\x30\x44\x64\x58\x64\x53\x71\x6d\x51\x2f\x67\x51\x70\x6f\
-\x34\x7a\x2b\x4a\x72\x67\x51\x66\x6d\x4c\x51\x52\x74\x54\x2f\x4d\
-\x76\x39\x4d\x6c\x2b\x2b\x78\x54\x66\x44\x69\x38\x38\x66\x2f\x64\
-\x6e\x32\x48\x4a\x76\x56\x71\x4c\x58\x6d\x56\x68\x6d\x78\x72\x51\
-\x67\x41\x68\x41\x58\x71\x31\x20\x58\x50\x70\x43\x32\x35\x72\x36\
-\x6a\x32\x6c\x43\x75\x47\x64\x44\x30\x30\x52\x73\x35\x63\x69\x32\
-\x72\x72\x4e\x4e\x75\x38\x54\x66\x53\x5a\x49\x45\x36\x2f\x57\x61\
-\x47\x4e\x4f\x6a\x78\x62\x74\x61\x72\x54\x44\x7a\x72\x52\x46\x69\
-\x72\x63\x42\x79\x6c\x53\x51\x4a\x45\x70\x6b\x45\x51\x6d\x41\x47\
-\x5a\x30\x59\x65\x20\x53\x35\x6a\x50\x35\x37\x44\x56\x64\x6f\x49\
-\x6b\x68\x36\x75\x46\x72\x48\x75\x65\x79\x50\x79\x6b\x54\x5a\x43\
-\x61\x44\x67\x57\x54\x30\x62\x65\x6e\x62\x67\x74\x68\x50\x42\x5a\
-\x68\x2f\x4b\x33\x50\x2b\x70\x46\x58\x74\x30\x46\x6f\x75\x7a\x56\
-\x64\x64\x2f\x4f\x32\x2b\x36\x62\x4e\x75\x41\x55\x49\x2b\x6f\x32\
-\x67\x20\x4b\x4e\x66\x51\x55\x6d\x73\x59\x61\x32\x46\x42\x41\x64\
-\x70\x2b\x66\x77\x44\x70\x57\x62\x64\x35\x42\x35\x61\x43\x4d\x67\
-\x49\x6b\x43\x42\x6d\x6c\x56\x44\x58\x4b\x46\x30\x32\x53\x42\x4b\
-\x5a\x79\x53\x4a\x51\x48\x45\x6f\x54\x45\x64\x44\x7a\x47\x7a\x65\
-\x73\x33\x6b\x45\x54\x2b\x6b\x4a\x51\x53\x6c\x2f\x4d\x5a\x20\x54\
-\x6c\x2b\x39\x77\x53\x65\x66\x66\x6f\x61\x76\x37\x6e\x2b\x4c\x76\
-\x4b\x77\x49\x46\x68\x65\x43\x71\x6a\x52\x61\x4e\x72\x4f\x57\x4d\
-\x68\x52\x39\x68\x6f\x4e\x52\x50\x61\x65\x6f\x76\x34\x58\x77\x53\
-\x47\x6e\x6f\x53\x2b\x63\x38\x71\x6b\x66\x2f\x43\x56\x6d\x48\x43\
-\x4d\x4c\x67\x78\x4c\x75\x76\x51\x65\x67\x70\x20\x79\x4e\x2f\x31\
-\x66\x34\x54\x37\x64\x71\x43\x64\x6a\x73\x61\x45\x45\x35\x4b\x39\
-\x33\x65\x38\x73\x30\x59\x2f\x59\x4b\x41\x77\x68\x41\x47\x6d\x62\
-\x35\x6e\x46\x7a\x49\x75\x71\x63\x51\x6d\x4f\x6f\x34\x57\x56\x73\
-\x77\x6c\x48\x6e\x32\x4d\x78\x6e\x72\x46\x54\x65\x64\x43\x6f\x6a\
-\x73\x49\x50\x7a\x50\x45\x55\x44\x20\x66\x49\x6d\x6d\x50\x54\x4b\
-\x37\x75\x30\x32\x2f\x4d\x4a\x78\x2b\x73\x61\x5a\x70\x36\x6f\x74\
-\x36\x4b\x51\x4e\x4b\x65\x54\x35\x54\x36\x66\x31\x4d\x70\x52\x53\
-\x55\x31\x6e\x41\x77\x59\x52\x65\x76\x69\x6a\x55\x73\x53\x70\x51\
-\x46\x56\x63\x2f\x33\x65\x6a\x33\x6f\x4c\x49\x4f\x55\x41\x72\x30\
-\x30\x51\x7a\x4c\x56\x20\x75\x4c\x79\x38\x70\x46\x62\x56\x77\x6a\
-\x59\x6f\x38\x6e\x6d\x4f\x68\x57\x73\x42\x4d\x65\x46\x57\x50\x59\
-\x72\x72\x33\x32\x74\x35\x5a\x47\x43\x4e\x4a\x43\x46\x44\x36\x68\
-\x35\x58\x6e\x69\x67\x6f\x57\x47\x48\x68\x58\x41\x55\x6e\x62\x62\
-\x31\x42\x2b\x7a\x4d\x4b\x4b\x61\x43\x68\x41\x51\x50\x59\x4e\x46\
-\x6f\x4c\x20\x71\x42\x4f\x76\x42\x61\x4f\x71\x7a\x43\x50\x72\x4c\
-\x64\x75\x67\x45\x43\x52\x5a\x48\x37\x54\x78\x52\x35\x55\x71\x72\
-\x46\x6d\x6a\x78\x6b\x4e\x55\x51\x73\x55\x38\x71\x6a\x56\x67\x70\
-\x5a\x52\x43\x6d\x52\x63\x45\x7a\x42\x6a\x66\x79\x48\x4d\x34\x48\
-\x44\x62\x49\x6b\x37\x53\x55\x47\x78\x79\x66\x6e\x43\x76\x4b\x20\
-\x63\x52\x6c\x71\x58\x53\x61\x39\x32\x61\x6b\x78\x36\x4b\x55\x34\
-\x4f\x6a\x68\x45\x6c\x76\x68\x55\x4e\x67\x65\x69\x4d\x48\x41\x4f\
-\x2f\x2f\x4c\x37\x4c\x33\x48\x7a\x35\x6d\x30\x38\x65\x2f\x45\x63\
-\x7a\x76\x6f\x46\x59\x48\x30\x2f\x55\x6a\x62\x4e\x47\x69\x61\x6e\
-\x49\x7a\x4d\x54\x44\x75\x31\x4e\x79\x43\x76\x35\x20\x30\x42\x6f\
-\x73\x46\x4d\x50\x79\x52\x4c\x34\x46\x56\x4c\x4e\x77\x35\x4c\x68\
-\x37\x6a\x53\x6f\x64\x67\x51\x36\x79\x66\x5a\x32\x57\x53\x63\x4e\
-\x41\x69\x7a\x47\x47\x75\x67\x4a\x37\x49\x59\x33\x76\x75\x37\x31\
-\x6f\x6a\x44\x47\x77\x46\x56\x6b\x61\x55\x6c\x4d\x49\x69\x41\x47\
-\x57\x35\x58\x49\x4f\x35\x36\x6a\x39\x20\x48\x46\x63\x73\x41\x41\
-\x67\x4d\x30\x34\x6d\x57\x47\x30\x49\x55\x4f\x2f\x6e\x78\x76\x63\
-\x58\x76\x38\x2b\x74\x64\x65\x33\x58\x62\x6c\x32\x33\x34\x66\x4b\
-\x31\x7a\x70\x64\x35\x53\x4b\x55\x76\x66\x41\x56\x63\x31\x57\x34\
-\x67\x72\x52\x5a\x74\x43\x55\x62\x6a\x47\x64\x7a\x69\x56\x63\x54\
-\x71\x64\x2b\x6b\x4c\x66\x20\x47\x51\x41\x45\x6a\x56\x6d\x57\x4f\
-\x64\x57\x56\x74\x6c\x4a\x69\x57\x4b\x43\x6b\x6b\x41\x31\x47\x74\
-\x75\x5a\x52\x6d\x38\x54\x38\x48\x41\x6f\x4b\x64\x5a\x70\x58\x78\
-\x38\x62\x44\x6c\x4a\x69\x74\x79\x42\x37\x37\x34\x6c\x30\x48\x6e\
-\x7a\x74\x6d\x6b\x41\x76\x70\x65\x63\x36\x69\x73\x71\x58\x66\x4b\
-\x47\x4f\x45\x20\x6d\x7a\x56\x2b\x76\x59\x6c\x33\x7a\x51\x32\x66\
-\x66\x37\x31\x65\x51\x37\x4d\x5a\x4f\x42\x67\x4d\x51\x67\x4d\x58\
-\x41\x42\x42\x4b\x77\x54\x67\x48\x4b\x55\x56\x4c\x43\x4a\x76\x6f\
-\x71\x50\x4b\x78\x47\x51\x37\x4d\x37\x2b\x37\x75\x34\x6e\x44\x2f\
-\x41\x45\x6d\x69\x53\x66\x72\x4c\x43\x6d\x6d\x2f\x68\x2b\x2b\x2b\
-\x20\x2b\x35\x37\x61\x5a\x6f\x31\x47\x65\x50\x37\x71\x6c\x4e\x4b\
-\x65\x51\x45\x4c\x47\x71\x55\x2b\x38\x43\x4c\x6f\x47\x49\x2f\x69\
-\x45\x76\x6a\x42\x59\x4f\x6b\x62\x58\x2f\x47\x44\x5a\x4e\x69\x68\
-\x44\x57\x73\x76\x35\x31\x32\x4e\x71\x51\x72\x34\x4f\x38\x62\x48\
-\x51\x4a\x5a\x32\x33\x38\x64\x6d\x68\x5a\x37\x4f\x4f\x20\x46\x33\
-\x79\x39\x30\x50\x31\x35\x4a\x4d\x57\x67\x59\x76\x4f\x51\x55\x54\
-\x6e\x65\x6b\x5a\x31\x7a\x4d\x47\x55\x56\x6b\x4f\x55\x38\x7a\x37\
-\x45\x34\x50\x32\x38\x45\x30\x77\x4d\x39\x69\x4a\x52\x68\x51\x54\
-\x4c\x71\x79\x61\x39\x52\x4d\x6b\x57\x31\x59\x56\x4a\x31\x6d\x58\
-\x69\x62\x59\x31\x63\x33\x34\x59\x79\x50\x20\x38\x44\x30\x58\x61\
-\x30\x30\x58\x72\x74\x63\x59\x53\x5a\x38\x72\x53\x6d\x78\x37\x47\
-\x6e\x41\x53\x53\x74\x66\x2b\x4a\x42\x2f\x38\x6d\x61\x71\x71\x30\
-\x4f\x38\x4e\x51\x77\x4c\x41\x59\x44\x43\x41\x56\x4d\x42\x73\x4e\
-\x73\x4e\x79\x75\x55\x53\x61\x70\x67\x45\x49\x43\x6e\x36\x72\x62\
-\x77\x79\x6a\x58\x46\x33\x4c\x20\x32\x4e\x68\x6f\x2b\x4c\x36\x76\
-\x65\x46\x59\x68\x52\x4d\x50\x4b\x6b\x56\x4c\x43\x4f\x4e\x4d\x63\
-\x70\x31\x42\x66\x36\x56\x74\x76\x57\x39\x58\x49\x42\x6e\x4c\x4f\
-\x49\x37\x71\x69\x37\x72\x47\x70\x66\x50\x39\x45\x61\x79\x31\x4b\
-\x55\x37\x65\x4a\x55\x4e\x37\x56\x63\x68\x48\x6e\x72\x59\x4f\x43\
-\x45\x49\x43\x53\x20\x4e\x4b\x36\x31\x72\x30\x33\x76\x61\x38\x68\
-\x6f\x76\x43\x58\x79\x73\x69\x42\x30\x64\x44\x77\x65\x45\x32\x46\
-\x54\x32\x4e\x31\x55\x71\x43\x46\x73\x43\x31\x39\x62\x45\x4a\x56\
-\x53\x55\x4b\x43\x53\x70\x57\x47\x76\x6a\x36\x4f\x44\x51\x30\x2f\
-\x73\x51\x79\x70\x63\x53\x6f\x6e\x46\x59\x6f\x48\x37\x33\x33\x2b\
-\x50\x20\x44\x7a\x2f\x36\x43\x63\x37\x50\x7a\x38\x6d\x4a\x6a\x68\
-\x35\x6f\x6d\x30\x38\x56\x6d\x35\x46\x64\x50\x6c\x62\x58\x64\x38\
-\x4b\x45\x78\x4f\x65\x49\x2f\x4d\x66\x4e\x7a\x30\x66\x61\x45\x31\
-\x35\x59\x49\x31\x6e\x72\x38\x67\x63\x62\x6b\x39\x34\x2b\x58\x33\
-\x52\x4e\x46\x6c\x37\x75\x72\x38\x34\x2b\x45\x39\x4f\x2b\x20\x4f\
-\x2b\x63\x67\x64\x58\x66\x44\x31\x62\x49\x73\x77\x38\x51\x33\x4e\
-\x46\x56\x30\x37\x53\x36\x4e\x31\x76\x5a\x39\x33\x77\x58\x59\x43\
-\x41\x73\x32\x30\x76\x71\x73\x48\x64\x67\x50\x35\x59\x4e\x37\x56\
-\x6d\x52\x5a\x68\x6a\x53\x72\x4e\x77\x6c\x32\x59\x51\x4b\x62\x74\
-\x77\x63\x69\x32\x4d\x7a\x6c\x70\x49\x2f\x4c\x20\x79\x30\x74\x66\
-\x76\x71\x59\x61\x77\x68\x34\x32\x50\x64\x52\x5a\x52\x44\x47\x6c\
-\x2f\x72\x61\x6a\x76\x54\x62\x59\x2f\x41\x37\x5a\x4d\x37\x59\x37\
-\x6f\x54\x7a\x57\x63\x6f\x47\x53\x5a\x63\x76\x59\x74\x4d\x45\x75\
-\x50\x70\x69\x54\x70\x38\x76\x58\x5a\x76\x53\x56\x61\x7a\x4b\x7a\
-\x33\x69\x43\x30\x48\x51\x52\x71\x20\x53\x32\x65\x35\x6e\x45\x50\
-\x72\x4e\x45\x56\x2f\x4f\x49\x52\x4f\x55\x35\x54\x65\x4c\x42\x57\
-\x42\x71\x6a\x42\x6d\x30\x4e\x37\x55\x68\x45\x70\x49\x61\x43\x6d\
-\x51\x4b\x49\x56\x55\x61\x65\x7a\x76\x37\x57\x46\x6e\x4d\x67\x55\
-\x4d\x4e\x51\x71\x52\x53\x73\x45\x70\x69\x66\x74\x66\x33\x79\x66\
-\x45\x4e\x55\x74\x78\x20\x2f\x76\x67\x63\x65\x55\x36\x4c\x45\x57\
-\x59\x54\x77\x48\x41\x43\x47\x34\x75\x2b\x73\x51\x43\x64\x39\x5a\
-\x43\x56\x7a\x32\x5a\x33\x41\x4d\x63\x47\x45\x53\x64\x68\x74\x37\
-\x2f\x4c\x74\x6a\x35\x50\x41\x6f\x68\x75\x7a\x7a\x45\x74\x52\x79\
-\x54\x62\x51\x52\x4d\x43\x73\x4a\x59\x30\x56\x74\x7a\x59\x75\x7a\
-\x30\x70\x20\x31\x74\x6f\x36\x42\x39\x51\x76\x35\x75\x56\x38\x45\
-\x56\x4c\x49\x47\x44\x58\x75\x39\x58\x71\x4e\x65\x32\x4b\x2f\x79\
-\x4c\x5a\x61\x69\x50\x50\x75\x6d\x57\x55\x5a\x31\x75\x75\x31\x76\
-\x79\x72\x35\x53\x43\x51\x50\x77\x76\x4f\x4c\x76\x73\x58\x6d\x62\
-\x68\x7a\x74\x65\x4b\x68\x48\x55\x7a\x32\x77\x36\x76\x7a\x76\x20\
-\x37\x66\x45\x4f\x69\x43\x7a\x7a\x75\x6c\x6f\x44\x59\x79\x30\x4b\
-\x56\x38\x4c\x36\x4c\x6b\x31\x73\x46\x73\x5a\x6c\x55\x61\x76\x31\
-\x41\x75\x74\x38\x69\x66\x46\x34\x37\x4c\x73\x73\x31\x59\x6e\x2b\
-\x48\x45\x39\x6b\x50\x31\x50\x36\x73\x49\x69\x70\x44\x49\x43\x71\
-\x45\x57\x4f\x38\x61\x74\x4e\x74\x50\x67\x2f\x50\x20\x63\x32\x53\
-\x56\x53\x4f\x6c\x39\x7a\x75\x33\x35\x77\x62\x7a\x4a\x42\x50\x5a\
-\x77\x76\x77\x6d\x7a\x70\x65\x55\x6b\x68\x32\x62\x38\x4b\x4d\x59\
-\x6f\x76\x54\x2b\x48\x30\x4c\x54\x2b\x6b\x79\x51\x4a\x50\x31\x70\
-\x54\x34\x6b\x51\x63\x61\x32\x55\x5a\x34\x74\x78\x62\x4b\x53\x58\
-\x73\x69\x77\x6f\x36\x52\x6b\x4f\x46\x20\x45\x41\x30\x34\x6d\x6b\
-\x2f\x51\x46\x73\x52\x59\x47\x47\x45\x64\x65\x72\x30\x55\x67\x33\
-\x34\x66\x52\x77\x66\x37\x36\x43\x58\x6b\x31\x30\x69\x66\x75\x66\
-\x44\x36\x39\x57\x75\x38\x4f\x48\x32\x4a\x6e\x33\x37\x2b\x46\x33\
-\x68\x36\x38\x68\x79\x6c\x68\x34\x61\x44\x50\x32\x57\x71\x52\x6e\
-\x6c\x4a\x2b\x4f\x48\x58\x20\x4f\x71\x6f\x62\x2b\x48\x55\x61\x58\
-\x4e\x50\x51\x51\x49\x30\x4a\x41\x54\x59\x6d\x4d\x58\x62\x51\x74\
-\x30\x31\x6d\x66\x49\x53\x64\x7a\x33\x72\x7a\x52\x44\x54\x4e\x74\
-\x39\x43\x35\x31\x69\x63\x63\x4d\x4d\x67\x43\x53\x78\x59\x46\x39\
-\x32\x39\x6f\x2b\x49\x75\x52\x5a\x68\x4f\x69\x69\x52\x7a\x79\x44\
-\x71\x71\x31\x20\x78\x6e\x67\x38\x62\x6d\x69\x69\x2b\x48\x76\x63\
-\x30\x47\x51\x44\x34\x72\x39\x43\x55\x32\x38\x37\x59\x6f\x45\x6a\
-\x45\x36\x30\x32\x69\x32\x76\x42\x73\x6f\x32\x31\x59\x4b\x31\x46\
-\x6b\x64\x66\x64\x64\x5a\x6d\x42\x4f\x7a\x36\x6e\x74\x52\x61\x7a\
-\x32\x53\x78\x51\x36\x43\x75\x6c\x6b\x4b\x59\x70\x4a\x70\x4e\x4a\
-\x20\x79\x4c\x4c\x4a\x38\x7a\x77\x6b\x67\x66\x42\x35\x34\x36\x79\
-\x62\x64\x37\x56\x38\x34\x74\x63\x43\x79\x43\x4b\x78\x76\x52\x75\
-\x32\x50\x2b\x49\x61\x77\x2b\x5a\x35\x43\x51\x56\x32\x55\x53\x79\
-\x52\x77\x78\x6f\x63\x75\x6b\x6d\x53\x42\x47\x6d\x66\x4f\x48\x69\
-\x30\x6b\x41\x30\x35\x34\x51\x52\x7a\x4c\x6b\x69\x49\x20\x59\x2b\
-\x7a\x47\x6d\x4e\x41\x30\x64\x7a\x79\x65\x51\x67\x2b\x47\x66\x52\
-\x2f\x54\x61\x6a\x72\x63\x6b\x4e\x4c\x48\x41\x44\x57\x70\x58\x43\
-\x70\x41\x49\x72\x34\x59\x7a\x78\x4f\x54\x53\x49\x56\x55\x53\x67\
-\x7a\x36\x47\x61\x34\x64\x48\x6d\x41\x79\x48\x4a\x47\x6b\x65\x39\
-\x52\x75\x74\x56\x72\x68\x2b\x78\x38\x65\x20\x59\x6e\x64\x6e\x48\
-\x78\x59\x43\x35\x78\x63\x58\x59\x59\x43\x4e\x31\x78\x79\x45\x4e\
-\x72\x45\x57\x73\x37\x55\x5a\x42\x79\x59\x74\x61\x67\x6f\x6e\x44\
-\x35\x4c\x7a\x47\x6f\x72\x6a\x63\x59\x37\x4e\x79\x4b\x68\x4b\x6f\
-\x62\x30\x67\x6e\x66\x4e\x56\x66\x49\x35\x79\x4b\x49\x55\x67\x31\
-\x4c\x64\x68\x30\x72\x48\x51\x20\x2b\x78\x2f\x70\x69\x58\x71\x4d\
-\x6f\x34\x6c\x53\x6f\x6b\x59\x55\x71\x37\x4b\x45\x56\x67\x72\x4c\
-\x32\x58\x78\x44\x2b\x4c\x68\x35\x36\x56\x55\x2b\x6e\x48\x4d\x75\
-\x6f\x4a\x76\x74\x42\x63\x66\x50\x32\x30\x76\x53\x6b\x43\x47\x6a\
-\x6c\x41\x71\x73\x61\x6b\x4a\x36\x30\x45\x49\x31\x6e\x2b\x39\x64\
-\x44\x79\x48\x71\x20\x63\x65\x43\x44\x68\x4d\x67\x31\x68\x4a\x44\
-\x6f\x32\x79\x51\x34\x6c\x35\x59\x46\x30\x54\x6c\x69\x35\x75\x59\
-\x30\x52\x4f\x64\x63\x51\x35\x6a\x69\x42\x58\x6c\x35\x65\x59\x6d\
-\x79\x4c\x4c\x47\x7a\x73\x77\x4e\x4f\x72\x32\x50\x4c\x34\x4d\x33\
-\x5a\x57\x64\x69\x45\x41\x79\x57\x4b\x74\x52\x37\x35\x46\x68\x75\
-\x74\x20\x37\x44\x5a\x38\x51\x31\x2f\x48\x46\x2b\x45\x69\x59\x54\
-\x7a\x71\x63\x62\x31\x36\x4c\x4a\x70\x56\x46\x52\x37\x35\x64\x62\
-\x56\x66\x61\x76\x79\x61\x54\x5a\x49\x45\x66\x64\x2f\x30\x69\x46\
-\x77\x75\x69\x59\x72\x52\x5a\x79\x46\x71\x66\x65\x74\x71\x58\x31\
-\x78\x72\x48\x56\x6b\x62\x44\x68\x49\x53\x53\x68\x4c\x33\x20\x4c\
-\x6e\x45\x78\x4a\x64\x43\x4d\x51\x43\x6c\x5a\x4f\x35\x2b\x38\x69\
-\x4b\x79\x31\x50\x6e\x31\x71\x73\x32\x5a\x4c\x53\x67\x6d\x70\x42\
-\x48\x71\x39\x46\x4d\x50\x2b\x41\x4d\x65\x48\x52\x33\x52\x53\x5a\
-\x77\x41\x51\x4c\x2b\x58\x35\x2b\x54\x6d\x65\x50\x33\x2b\x4f\x66\
-\x2f\x2f\x4c\x76\x38\x49\x50\x6a\x78\x36\x6a\x20\x4d\x42\x58\x4b\
-\x79\x6f\x53\x6b\x35\x50\x56\x36\x58\x63\x63\x2b\x74\x32\x6d\x73\
-\x4c\x67\x46\x73\x2f\x4e\x32\x73\x63\x75\x6a\x61\x2b\x37\x74\x73\
-\x39\x6f\x33\x44\x64\x52\x63\x47\x4d\x2f\x30\x47\x55\x39\x6f\x4a\
-\x51\x54\x76\x5a\x63\x72\x6e\x45\x62\x44\x62\x44\x59\x72\x45\x49\
-\x6b\x36\x63\x31\x46\x53\x2f\x48\x20\x4f\x32\x64\x38\x66\x64\x35\
-\x67\x34\x76\x74\x71\x61\x77\x44\x57\x4b\x73\x48\x66\x6a\x69\x70\
-\x63\x6d\x50\x73\x54\x69\x4d\x78\x67\x31\x4f\x5a\x57\x57\x78\x44\
-\x35\x76\x4f\x30\x78\x69\x4e\x2f\x6e\x37\x37\x54\x42\x6d\x66\x6f\
-\x37\x64\x58\x6c\x53\x44\x46\x41\x46\x64\x46\x77\x6f\x47\x46\x73\
-\x53\x79\x75\x65\x72\x20\x38\x64\x73\x39\x44\x72\x4d\x73\x51\x31\
-\x56\x56\x65\x50\x50\x6d\x44\x59\x62\x44\x59\x61\x44\x4e\x36\x50\
-\x56\x36\x32\x4e\x2f\x66\x78\x32\x77\x32\x77\x33\x71\x39\x44\x70\
-\x61\x59\x45\x43\x49\x43\x6a\x4e\x72\x54\x31\x4e\x35\x59\x6d\x38\
-\x2f\x6a\x66\x48\x68\x6d\x6d\x36\x58\x54\x4e\x51\x5a\x74\x49\x59\
-\x7a\x39\x20\x4f\x67\x69\x42\x58\x70\x5a\x68\x4d\x42\x67\x30\x71\
-\x6f\x6e\x43\x4f\x41\x6d\x35\x63\x55\x38\x38\x50\x77\x41\x61\x33\
-\x61\x4b\x56\x55\x71\x52\x63\x62\x4b\x31\x73\x70\x50\x52\x70\x61\
-\x31\x72\x72\x41\x4e\x30\x4b\x4a\x51\x4e\x4e\x57\x36\x4e\x42\x69\
-\x50\x53\x70\x61\x34\x49\x36\x36\x79\x61\x53\x69\x4a\x75\x30\x20\
-\x56\x44\x69\x36\x64\x6f\x42\x65\x50\x30\x56\x56\x35\x4f\x67\x6c\
-\x50\x62\x6a\x4b\x77\x52\x69\x48\x66\x2f\x33\x79\x6a\x2f\x6a\x30\
-\x38\x35\x39\x68\x76\x6c\x78\x68\x74\x6c\x79\x45\x49\x6c\x34\x72\
-\x4b\x4d\x46\x59\x43\x46\x48\x48\x65\x46\x41\x76\x30\x72\x5a\x35\
-\x79\x75\x2f\x46\x66\x38\x66\x63\x6b\x68\x79\x53\x20\x69\x42\x63\
-\x50\x38\x39\x77\x77\x49\x78\x67\x6b\x45\x64\x64\x79\x73\x4a\x51\
-\x48\x6d\x54\x74\x59\x68\x44\x72\x44\x36\x46\x2f\x6e\x36\x68\x69\
-\x56\x67\x45\x42\x65\x46\x4a\x6a\x4e\x43\x47\x52\x68\x34\x65\x51\
-\x46\x46\x38\x59\x4a\x7a\x55\x54\x68\x75\x45\x6c\x70\x59\x37\x48\
-\x77\x39\x68\x32\x39\x78\x52\x4d\x73\x20\x68\x4d\x44\x78\x38\x54\
-\x45\x57\x69\x77\x57\x79\x4c\x4d\x50\x35\x2b\x58\x6c\x67\x51\x4b\
-\x73\x46\x68\x52\x63\x64\x51\x44\x34\x5a\x6e\x36\x57\x70\x54\x62\
-\x65\x5a\x70\x47\x30\x41\x70\x33\x36\x64\x77\x67\x34\x49\x64\x59\
-\x51\x67\x35\x6e\x56\x54\x6f\x37\x66\x30\x2b\x62\x6f\x76\x5a\x55\
-\x69\x31\x73\x39\x52\x35\x20\x69\x59\x45\x62\x42\x70\x2f\x34\x70\
-\x79\x78\x4c\x4c\x42\x59\x4c\x41\x41\x68\x55\x69\x6f\x50\x42\x43\
-\x45\x6f\x6c\x75\x4c\x77\x6b\x31\x4a\x68\x39\x53\x2b\x6b\x41\x6d\
-\x4c\x71\x30\x4c\x67\x69\x4b\x46\x39\x54\x59\x69\x71\x44\x37\x71\
-\x53\x30\x50\x4e\x74\x50\x62\x6d\x78\x4a\x5a\x4d\x6a\x34\x31\x6b\
-\x4c\x73\x36\x20\x32\x35\x59\x2f\x48\x6f\x55\x6a\x42\x73\x4d\x68\
-\x52\x71\x4e\x52\x53\x36\x76\x36\x75\x66\x58\x6e\x37\x38\x71\x49\
-\x69\x6f\x39\x34\x62\x41\x43\x36\x54\x62\x2b\x31\x68\x65\x38\x31\
-\x45\x76\x75\x32\x54\x52\x69\x56\x30\x74\x54\x4f\x63\x70\x7a\x53\
-\x4e\x68\x36\x50\x73\x62\x2b\x7a\x69\x36\x6f\x6f\x61\x61\x63\x51\
-\x20\x52\x4e\x72\x30\x7a\x54\x66\x66\x49\x45\x31\x54\x54\x4b\x64\
-\x54\x50\x44\x6c\x35\x68\x71\x49\x6f\x55\x4a\x6e\x4b\x43\x32\x42\
-\x74\x39\x31\x74\x54\x37\x77\x71\x78\x41\x4d\x59\x54\x33\x76\x34\
-\x4a\x52\x7a\x42\x44\x4e\x31\x46\x4b\x36\x7a\x2f\x4c\x63\x55\x39\
-\x6e\x43\x41\x5a\x50\x6f\x6c\x78\x49\x57\x78\x6b\x49\x20\x36\x34\
-\x45\x57\x4d\x41\x6a\x56\x70\x43\x2f\x51\x4b\x73\x47\x62\x4e\x32\
-\x2f\x77\x2b\x76\x56\x72\x71\x76\x4c\x77\x35\x32\x44\x57\x61\x51\
-\x35\x39\x42\x4f\x63\x37\x30\x73\x58\x62\x74\x45\x2f\x37\x58\x76\
-\x6c\x2b\x65\x4e\x4e\x4c\x30\x78\x53\x44\x77\x51\x44\x4c\x35\x52\
-\x4b\x38\x32\x4f\x50\x50\x31\x2f\x2b\x53\x20\x6d\x58\x6a\x56\x73\
-\x63\x31\x4d\x6a\x66\x33\x41\x2b\x4f\x2f\x34\x66\x55\x37\x6d\x70\
-\x33\x48\x5a\x52\x41\x68\x72\x33\x36\x31\x35\x62\x6d\x73\x74\x69\
-\x71\x49\x49\x37\x62\x57\x44\x48\x2b\x57\x52\x55\x74\x37\x45\x52\
-\x71\x4d\x52\x70\x43\x4d\x6c\x73\x4c\x65\x33\x68\x31\x36\x76\x68\
-\x37\x4f\x7a\x73\x33\x42\x64\x20\x36\x68\x52\x64\x2b\x36\x4b\x6b\
-\x4c\x4f\x72\x4e\x74\x68\x30\x69\x32\x54\x78\x71\x6b\x75\x43\x32\
-\x4d\x50\x41\x38\x78\x53\x77\x41\x31\x4c\x4b\x4e\x36\x69\x6b\x5a\
-\x7a\x65\x31\x79\x49\x37\x71\x65\x65\x5a\x76\x73\x78\x42\x73\x68\
-\x58\x35\x2f\x4e\x56\x78\x35\x4c\x48\x61\x51\x38\x52\x50\x6f\x70\
-\x4b\x34\x5a\x73\x20\x62\x61\x6f\x45\x56\x75\x78\x34\x43\x75\x45\
-\x52\x55\x56\x6f\x73\x77\x31\x34\x66\x37\x39\x32\x2b\x41\x79\x45\
-\x49\x79\x58\x4f\x56\x67\x64\x51\x43\x69\x38\x55\x43\x4a\x38\x39\
-\x65\x34\x4d\x4f\x50\x66\x67\x49\x6e\x67\x4e\x66\x6e\x5a\x79\x68\
-\x4e\x68\x62\x77\x73\x41\x35\x54\x74\x4b\x68\x4d\x79\x38\x71\x6e\
-\x32\x20\x62\x37\x50\x55\x68\x48\x66\x63\x32\x45\x65\x44\x7a\x36\
-\x4a\x6e\x4c\x57\x68\x64\x4d\x2b\x73\x69\x31\x4b\x55\x78\x30\x6c\
-\x63\x5a\x72\x78\x55\x70\x38\x63\x43\x55\x64\x62\x49\x7a\x45\x52\
-\x45\x5a\x71\x72\x30\x54\x4e\x53\x52\x4f\x4b\x43\x59\x6c\x54\x6a\
-\x39\x39\x2b\x68\x54\x7a\x2b\x52\x79\x72\x31\x64\x4c\x37\x20\x42\
-\x54\x30\x6f\x70\x65\x75\x64\x57\x4c\x56\x4b\x56\x64\x72\x6d\x55\
-\x58\x75\x78\x69\x36\x59\x67\x74\x58\x31\x47\x59\x77\x79\x46\x69\
-\x36\x42\x51\x46\x73\x5a\x72\x63\x51\x30\x62\x43\x62\x64\x7a\x4c\
-\x72\x43\x74\x62\x64\x72\x66\x62\x61\x69\x39\x54\x6a\x44\x6f\x4f\
-\x6b\x53\x6b\x4d\x65\x49\x64\x6e\x35\x4c\x48\x20\x4b\x31\x69\x72\
-\x50\x49\x70\x70\x49\x43\x70\x48\x75\x45\x42\x41\x4c\x62\x33\x39\
-\x35\x4f\x4a\x37\x4d\x34\x43\x68\x79\x68\x42\x62\x56\x68\x43\x57\
-\x4e\x6b\x49\x6c\x46\x62\x46\x6f\x57\x39\x70\x34\x79\x33\x57\x4a\
-\x75\x56\x76\x57\x6d\x6b\x5a\x70\x6a\x45\x59\x54\x53\x4b\x6c\x78\
-\x66\x6e\x36\x4f\x50\x46\x38\x33\x20\x4e\x30\x77\x57\x78\x72\x44\
-\x59\x36\x52\x6f\x62\x7a\x39\x75\x52\x54\x6d\x67\x74\x49\x43\x57\
-\x62\x71\x52\x77\x7a\x46\x59\x51\x30\x53\x77\x6c\x72\x44\x50\x4b\
-\x69\x77\x6e\x67\x38\x78\x73\x37\x4f\x54\x6b\x67\x53\x53\x4a\x49\
-\x55\x56\x56\x57\x30\x78\x73\x73\x4c\x6a\x2b\x4f\x30\x51\x35\x38\
-\x42\x45\x37\x30\x66\x20\x4b\x34\x73\x75\x58\x35\x38\x30\x4f\x72\
-\x6c\x53\x46\x72\x6f\x70\x68\x4a\x76\x53\x33\x73\x7a\x38\x43\x49\
-\x67\x6f\x4b\x50\x50\x68\x34\x48\x41\x50\x30\x2b\x6b\x55\x77\x68\
-\x6b\x61\x59\x45\x6c\x61\x38\x4f\x54\x6b\x42\x46\x70\x72\x33\x4c\
-\x78\x35\x45\x2f\x63\x66\x50\x53\x44\x41\x77\x6b\x39\x63\x51\x50\
-\x75\x63\x20\x51\x31\x6d\x56\x67\x47\x43\x42\x32\x7a\x53\x4e\x61\
-\x41\x44\x62\x71\x46\x58\x7a\x55\x45\x4c\x57\x61\x79\x44\x4b\x47\
-\x51\x30\x55\x63\x32\x7a\x44\x65\x2f\x74\x62\x53\x65\x4b\x39\x34\
-\x58\x4f\x70\x4e\x45\x55\x76\x31\x55\x6a\x37\x70\x4e\x6e\x4f\x7a\
-\x73\x35\x77\x2f\x2f\x36\x33\x4f\x44\x73\x37\x38\x77\x7a\x56\x20\
-\x49\x71\x43\x63\x74\x43\x68\x71\x6e\x34\x43\x4b\x6e\x56\x74\x55\
-\x44\x6a\x38\x6d\x61\x68\x42\x4e\x4b\x76\x39\x72\x6a\x4d\x48\x75\
-\x37\x69\x34\x57\x69\x38\x56\x47\x33\x37\x2b\x6d\x73\x50\x2f\x49\
-\x43\x32\x32\x39\x64\x74\x4d\x66\x5a\x4b\x30\x44\x31\x47\x67\x67\
-\x51\x65\x36\x65\x37\x4e\x6d\x32\x76\x74\x2f\x79\x20\x68\x2b\x4b\
-\x57\x61\x73\x37\x56\x44\x57\x64\x71\x34\x4b\x61\x4f\x6b\x61\x35\
-\x39\x76\x38\x4c\x78\x65\x4f\x77\x58\x4a\x62\x47\x7a\x61\x36\x31\
-\x78\x63\x58\x48\x57\x4b\x49\x75\x4b\x46\x7a\x64\x72\x4e\x2f\x71\
-\x39\x2b\x39\x6e\x61\x51\x6d\x42\x74\x2f\x57\x78\x74\x72\x64\x58\
-\x76\x39\x33\x46\x77\x64\x42\x69\x30\x20\x4e\x6f\x65\x55\x79\x4d\
-\x2f\x74\x39\x76\x6e\x69\x61\x33\x52\x64\x64\x39\x76\x66\x77\x61\
-\x58\x67\x2b\x4c\x53\x31\x6d\x30\x49\x59\x2f\x77\x43\x41\x56\x69\
-\x6b\x68\x6f\x35\x48\x54\x4c\x4b\x7a\x44\x65\x44\x44\x45\x74\x63\
-\x4d\x6a\x6c\x47\x57\x4a\x30\x61\x41\x48\x57\x39\x48\x73\x72\x4e\
-\x63\x35\x48\x6a\x78\x34\x20\x67\x41\x38\x2f\x2b\x68\x6a\x7a\x31\
-\x52\x4c\x50\x58\x37\x77\x41\x4a\x4b\x58\x35\x51\x41\x6f\x76\x68\
-\x4b\x5a\x47\x49\x51\x50\x36\x79\x62\x33\x74\x6d\x6a\x74\x4a\x65\
-\x49\x6a\x57\x77\x79\x67\x49\x4f\x4e\x6e\x6b\x6c\x5a\x48\x52\x77\
-\x37\x47\x50\x53\x34\x4f\x71\x6f\x61\x52\x41\x35\x58\x32\x4b\x66\
-\x72\x39\x66\x20\x74\x2f\x61\x47\x78\x65\x76\x58\x72\x2f\x48\x39\
-\x74\x39\x2f\x68\x78\x59\x73\x54\x72\x49\x6f\x38\x41\x43\x42\x43\
-\x41\x4c\x30\x65\x35\x58\x42\x4b\x72\x51\x44\x76\x67\x31\x6c\x48\
-\x50\x6a\x4b\x45\x43\x4e\x5a\x67\x75\x4e\x39\x6f\x51\x32\x68\x4d\
-\x52\x6c\x4e\x4a\x68\x70\x67\x63\x58\x49\x77\x34\x6b\x6d\x44\x76\
-\x20\x37\x65\x33\x68\x75\x32\x2b\x2f\x44\x2f\x50\x41\x56\x42\x2b\
-\x4e\x42\x63\x43\x2f\x76\x34\x57\x6e\x77\x32\x30\x78\x56\x34\x50\
-\x51\x2b\x78\x34\x54\x51\x72\x70\x51\x2f\x38\x59\x4c\x6c\x63\x75\
-\x63\x6a\x43\x6c\x70\x52\x4b\x57\x45\x73\x34\x59\x2b\x49\x31\x53\
-\x63\x30\x39\x41\x34\x62\x79\x7a\x51\x31\x74\x70\x41\x20\x6a\x64\
-\x2f\x72\x39\x5a\x43\x6d\x54\x62\x4a\x68\x46\x6c\x49\x4f\x6c\x63\
-\x45\x36\x49\x67\x62\x62\x33\x59\x57\x55\x45\x73\x76\x46\x41\x74\
-\x61\x50\x43\x35\x6d\x48\x66\x76\x31\x59\x42\x79\x30\x6b\x54\x49\
-\x67\x52\x74\x2b\x42\x52\x4e\x41\x56\x52\x51\x42\x4a\x71\x61\x53\
-\x6d\x57\x71\x7a\x30\x41\x31\x68\x73\x4f\x20\x4d\x4e\x6d\x5a\x55\
-\x6d\x46\x7a\x57\x59\x4b\x6a\x4c\x4b\x55\x31\x53\x50\x73\x39\x75\
-\x49\x72\x54\x4a\x6e\x6c\x64\x73\x55\x59\x46\x49\x61\x4a\x2b\x4d\
-\x2b\x41\x34\x73\x6e\x33\x4c\x70\x71\x42\x38\x6a\x4a\x63\x4c\x47\
-\x67\x52\x77\x74\x52\x44\x47\x69\x77\x4d\x67\x54\x53\x2b\x39\x66\
-\x62\x32\x7a\x73\x30\x4f\x6c\x20\x2b\x64\x36\x38\x54\x42\x4b\x4e\
-\x4b\x69\x2f\x77\x77\x77\x38\x2f\x6f\x4e\x2f\x76\x34\x2f\x6a\x34\
-\x6d\x4c\x52\x67\x6b\x63\x4e\x4b\x47\x6d\x7a\x75\x37\x30\x35\x35\
-\x6d\x35\x53\x67\x58\x5a\x67\x71\x2b\x47\x2b\x38\x59\x37\x55\x31\
-\x49\x67\x73\x61\x37\x34\x43\x73\x6f\x53\x57\x61\x53\x64\x2f\x4e\
-\x4b\x61\x44\x65\x20\x42\x46\x4a\x52\x57\x43\x56\x4c\x4d\x30\x79\
-\x6e\x55\x2b\x7a\x75\x37\x73\x4a\x61\x69\x2b\x66\x50\x6e\x2b\x4f\
-\x62\x48\x33\x37\x41\x79\x63\x6c\x54\x7a\x38\x46\x5a\x68\x6b\x77\
-\x57\x41\x6e\x4f\x6f\x61\x6a\x79\x41\x4b\x4b\x33\x72\x41\x35\x73\
-\x45\x51\x6f\x33\x37\x37\x66\x43\x31\x34\x73\x55\x5a\x4e\x46\x44\
-\x30\x20\x48\x6d\x65\x57\x31\x48\x35\x59\x4c\x59\x54\x74\x37\x7a\
-\x65\x30\x37\x78\x56\x48\x46\x7a\x6a\x54\x33\x73\x33\x6a\x38\x38\
-\x53\x6d\x48\x77\x73\x2f\x2b\x58\x52\x55\x4b\x57\x50\x73\x4a\x73\
-\x4c\x62\x64\x62\x31\x67\x74\x6b\x56\x61\x6a\x45\x41\x62\x47\x30\
-\x49\x55\x72\x48\x47\x35\x4d\x39\x52\x34\x50\x41\x37\x61\x20\x53\
-\x41\x69\x42\x76\x62\x30\x39\x70\x45\x6d\x43\x78\x57\x49\x52\x51\
-\x69\x45\x45\x47\x6b\x55\x43\x4a\x72\x66\x37\x76\x44\x46\x34\x77\
-\x2b\x50\x4c\x54\x50\x47\x39\x72\x49\x66\x4a\x37\x67\x35\x47\x6f\
-\x78\x46\x57\x2b\x54\x72\x79\x51\x79\x6c\x54\x53\x53\x73\x64\x43\
-\x71\x71\x62\x59\x31\x66\x2f\x48\x68\x4a\x4f\x20\x72\x74\x34\x48\
-\x6d\x2f\x65\x45\x47\x68\x57\x6c\x63\x62\x62\x51\x43\x70\x54\x76\
-\x79\x4f\x56\x4b\x45\x69\x49\x67\x68\x73\x7a\x63\x46\x55\x71\x61\
-\x2f\x49\x34\x30\x47\x41\x78\x77\x65\x48\x41\x51\x6e\x47\x31\x6e\
-\x53\x6c\x53\x56\x78\x58\x79\x2b\x78\x4a\x4d\x6e\x54\x2f\x44\x46\
-\x58\x2f\x34\x63\x79\x2b\x55\x53\x20\x5a\x32\x64\x6e\x63\x41\x34\
-\x6f\x53\x30\x72\x52\x6b\x56\x6f\x46\x37\x68\x6a\x4a\x76\x74\x30\
-\x47\x41\x4d\x4d\x41\x51\x43\x54\x38\x6b\x64\x6e\x44\x2f\x65\x70\
-\x38\x53\x6f\x4f\x50\x5a\x64\x57\x66\x6b\x31\x35\x72\x63\x32\x6e\
-\x56\x65\x44\x7a\x47\x5a\x44\x52\x47\x6c\x76\x55\x78\x6d\x38\x33\
-\x77\x37\x64\x66\x66\x20\x34\x65\x6e\x54\x70\x7a\x67\x2f\x50\x38\
-\x65\x36\x57\x41\x47\x53\x64\x69\x55\x6f\x69\x63\x70\x5a\x4b\x43\
-\x6b\x78\x48\x41\x36\x43\x35\x6f\x4d\x58\x46\x4f\x63\x63\x4b\x6d\
-\x65\x44\x4f\x53\x59\x6c\x74\x51\x51\x58\x45\x62\x72\x62\x57\x4d\
-\x77\x74\x39\x49\x7a\x50\x55\x57\x74\x76\x31\x6d\x52\x52\x41\x6a\
-\x57\x41\x20\x6e\x64\x31\x39\x72\x50\x4d\x53\x65\x77\x66\x37\x65\
-\x50\x62\x73\x57\x55\x4d\x49\x36\x7a\x50\x46\x50\x78\x74\x54\x33\
-\x66\x70\x54\x68\x73\x2b\x52\x72\x39\x77\x4d\x36\x62\x41\x67\x73\
-\x4c\x55\x54\x41\x7a\x44\x6b\x41\x79\x64\x65\x43\x78\x73\x6b\x69\
-\x66\x4c\x2b\x48\x6d\x55\x62\x30\x62\x57\x75\x4c\x6f\x6f\x46\x20\
-\x61\x6b\x6f\x4f\x79\x69\x32\x74\x66\x53\x77\x68\x42\x4f\x44\x58\
-\x45\x49\x65\x30\x4a\x70\x4d\x4a\x39\x62\x39\x77\x45\x73\x4a\x52\
-\x41\x72\x67\x51\x6f\x6b\x61\x6b\x6e\x62\x64\x34\x77\x6c\x68\x76\
-\x33\x34\x53\x43\x61\x79\x4c\x72\x6a\x4a\x35\x42\x6a\x79\x79\x67\
-\x55\x58\x2b\x49\x67\x36\x4f\x6a\x51\x50\x30\x49\x20\x31\x46\x61\
-\x54\x6c\x42\x4b\x46\x70\x34\x61\x4d\x4e\x30\x6d\x61\x4e\x36\x37\
-\x65\x49\x42\x75\x44\x71\x30\x30\x34\x2f\x73\x77\x46\x41\x47\x32\
-\x4e\x4b\x4b\x79\x4a\x7a\x46\x44\x4b\x6c\x48\x4a\x43\x6b\x52\x43\
-\x53\x34\x2b\x36\x35\x46\x4c\x59\x30\x52\x39\x47\x53\x77\x42\x67\
-\x46\x36\x6c\x73\x2b\x38\x51\x36\x73\x20\x38\x44\x73\x4e\x55\x79\
-\x4e\x38\x2f\x64\x32\x33\x32\x44\x30\x36\x51\x47\x38\x34\x77\x4e\
-\x4d\x58\x4c\x33\x45\x35\x6e\x38\x45\x41\x79\x49\x75\x63\x7a\x75\
-\x64\x72\x75\x4e\x68\x33\x61\x79\x4e\x62\x37\x52\x30\x74\x44\x74\
-\x53\x32\x67\x37\x5a\x4d\x52\x43\x53\x69\x77\x44\x4b\x68\x6c\x67\
-\x4d\x4d\x65\x6e\x32\x4d\x20\x52\x69\x50\x30\x65\x6a\x30\x73\x35\
-\x77\x73\x38\x66\x66\x6f\x55\x44\x78\x38\x2b\x78\x4f\x76\x58\x72\
-\x77\x4e\x62\x74\x42\x38\x71\x38\x69\x31\x51\x73\x38\x56\x70\x72\
-\x53\x42\x31\x6e\x62\x51\x51\x62\x48\x6a\x70\x51\x52\x38\x5a\x2b\
-\x53\x62\x4f\x64\x63\x68\x42\x72\x4f\x33\x59\x4e\x49\x75\x31\x4e\
-\x64\x63\x69\x20\x65\x6d\x53\x7a\x42\x65\x54\x73\x37\x4f\x79\x67\
-\x4b\x41\x70\x63\x75\x33\x59\x4e\x72\x31\x36\x39\x61\x76\x68\x6f\
-\x37\x65\x4e\x74\x57\x72\x42\x78\x56\x31\x64\x6f\x37\x41\x33\x77\
-\x4b\x46\x71\x38\x53\x6c\x45\x6e\x4c\x74\x37\x59\x4e\x6e\x32\x69\
-\x37\x64\x51\x5a\x66\x4f\x2b\x63\x72\x45\x36\x5a\x57\x53\x4a\x43\
-\x20\x54\x68\x4d\x6f\x6d\x55\x55\x6b\x55\x54\x49\x55\x41\x33\x4f\
-\x4b\x58\x32\x56\x4d\x49\x2b\x2b\x30\x58\x4f\x64\x51\x43\x70\x42\
-\x53\x65\x7a\x4e\x35\x45\x79\x47\x32\x30\x62\x2b\x68\x36\x73\x45\
-\x53\x6f\x39\x78\x30\x4f\x73\x56\x77\x4f\x4d\x51\x67\x36\x78\x50\
-\x35\x32\x4a\x37\x47\x79\x35\x63\x76\x73\x56\x34\x76\x20\x6f\x54\
-\x33\x39\x59\x2b\x6b\x54\x51\x52\x69\x67\x34\x56\x62\x64\x51\x52\
-\x43\x64\x64\x77\x63\x69\x41\x57\x2f\x48\x71\x37\x75\x4f\x2b\x44\
-\x33\x76\x65\x42\x45\x36\x54\x41\x67\x6f\x5a\x63\x41\x49\x4b\x45\
-\x6a\x6e\x4f\x79\x73\x4a\x44\x65\x45\x45\x4f\x63\x7a\x47\x77\x6d\
-\x6b\x48\x70\x54\x57\x30\x55\x72\x68\x37\x20\x35\x7a\x30\x49\x52\
-\x38\x4c\x4a\x6e\x73\x48\x72\x73\x31\x64\x34\x2b\x65\x59\x31\x66\
-\x76\x57\x72\x58\x32\x47\x52\x46\x33\x68\x31\x39\x67\x61\x6c\x73\
-\x7a\x44\x65\x4e\x36\x71\x4c\x4f\x79\x30\x45\x36\x68\x41\x43\x38\
-\x32\x79\x45\x79\x62\x63\x31\x48\x36\x51\x41\x77\x4a\x55\x73\x41\
-\x62\x30\x46\x56\x78\x30\x6f\x20\x33\x39\x31\x70\x67\x4f\x6c\x30\
-\x53\x6e\x43\x33\x48\x35\x44\x56\x61\x6f\x56\x6e\x54\x78\x2f\x6a\
-\x79\x5a\x4d\x6e\x4f\x48\x33\x31\x43\x6b\x57\x35\x44\x67\x74\x42\
-\x2b\x73\x70\x77\x77\x38\x46\x78\x71\x64\x42\x4c\x55\x71\x69\x55\
-\x54\x45\x41\x4c\x52\x6b\x39\x4a\x61\x79\x45\x6f\x6b\x67\x67\x4e\
-\x46\x4d\x4b\x6a\x20\x78\x39\x5a\x72\x4d\x73\x71\x46\x41\x41\x53\
-\x68\x6d\x46\x49\x54\x65\x75\x73\x41\x42\x61\x37\x55\x73\x41\x69\
-\x56\x48\x61\x35\x6d\x6b\x5a\x4e\x61\x77\x52\x6a\x6e\x6d\x63\x79\
-\x42\x6e\x63\x6b\x55\x5a\x32\x64\x6e\x56\x49\x2b\x6e\x4e\x45\x70\
-\x54\x49\x63\x6e\x53\x77\x50\x50\x6a\x48\x50\x6c\x74\x69\x57\x6f\
-\x57\x20\x72\x62\x59\x58\x59\x43\x77\x4d\x6a\x51\x58\x67\x61\x73\
-\x43\x4e\x39\x6b\x58\x44\x4b\x34\x53\x65\x78\x63\x65\x44\x70\x65\
-\x38\x2f\x37\x36\x78\x44\x50\x30\x75\x51\x72\x30\x73\x49\x6e\x55\
-\x42\x6e\x4b\x64\x5a\x6c\x51\x55\x4a\x51\x56\x64\x43\x74\x31\x6c\
-\x2b\x4f\x47\x51\x66\x38\x2f\x36\x79\x68\x53\x67\x51\x68\x20\x6e\
-\x61\x2b\x61\x73\x59\x41\x43\x4b\x6c\x65\x68\x58\x4f\x58\x49\x4c\
-\x49\x55\x78\x68\x42\x53\x77\x72\x69\x4c\x69\x35\x31\x55\x46\x43\
-\x78\x49\x2b\x35\x79\x51\x67\x46\x4e\x4b\x73\x6a\x2b\x45\x49\x57\
-\x47\x4c\x68\x35\x35\x4e\x69\x69\x4e\x4a\x62\x54\x49\x5a\x33\x61\
-\x65\x45\x49\x6a\x42\x4f\x41\x4c\x51\x32\x63\x20\x6a\x36\x47\x6d\
-\x61\x51\x39\x37\x65\x33\x73\x59\x6a\x38\x66\x30\x65\x56\x2b\x35\
-\x63\x2f\x50\x61\x4d\x63\x35\x50\x7a\x79\x43\x7a\x41\x51\x70\x54\
-\x77\x47\x72\x41\x77\x6b\x42\x71\x43\x65\x4d\x6f\x30\x5a\x77\x30\
-\x48\x49\x65\x75\x51\x4e\x79\x38\x6e\x47\x52\x53\x64\x5a\x4e\x47\
-\x79\x51\x6a\x4c\x45\x45\x4c\x41\x20\x79\x6e\x70\x63\x67\x70\x76\
-\x68\x35\x30\x55\x44\x50\x6f\x6e\x58\x4f\x54\x6a\x70\x39\x78\x56\
-\x4c\x4f\x5a\x6c\x43\x45\x48\x4d\x61\x56\x30\x70\x49\x49\x58\x43\
-\x34\x66\x34\x42\x65\x6b\x6f\x62\x65\x45\x6c\x49\x49\x46\x41\x58\
-\x46\x42\x54\x2f\x35\x35\x42\x4d\x34\x49\x54\x47\x62\x7a\x2f\x48\
-\x6d\x34\x68\x79\x56\x20\x4e\x61\x68\x73\x45\x32\x53\x78\x78\x73\
-\x47\x36\x4b\x69\x54\x49\x70\x6d\x6d\x4b\x39\x58\x6f\x64\x73\x6d\
-\x69\x55\x31\x6e\x41\x56\x77\x65\x4d\x63\x44\x72\x47\x57\x42\x46\
-\x64\x4b\x69\x56\x52\x54\x6a\x47\x34\x38\x6e\x6d\x4c\x59\x48\x32\
-\x41\x38\x48\x6c\x4e\x39\x33\x75\x55\x46\x6e\x72\x31\x34\x6a\x73\
-\x65\x50\x20\x48\x2b\x50\x6c\x79\x35\x64\x59\x72\x75\x59\x6b\x43\
-\x49\x49\x6d\x53\x2f\x6a\x65\x41\x4b\x55\x68\x53\x6b\x57\x6c\x46\
-\x4a\x4a\x65\x43\x71\x32\x54\x47\x76\x57\x56\x5a\x4d\x34\x36\x5a\
-\x37\x30\x35\x45\x57\x65\x49\x65\x50\x4f\x50\x35\x31\x6f\x49\x76\
-\x79\x45\x59\x76\x79\x73\x69\x31\x46\x37\x57\x36\x72\x47\x70\x20\
-\x36\x57\x72\x42\x55\x4a\x45\x47\x70\x52\x69\x63\x6b\x71\x72\x68\
-\x4b\x36\x56\x70\x69\x69\x52\x4a\x55\x4a\x6f\x71\x58\x4d\x38\x34\
-\x36\x33\x75\x48\x4f\x67\x4a\x2b\x72\x41\x75\x4a\x46\x66\x2f\x57\
-\x6f\x38\x75\x58\x6a\x67\x2f\x32\x58\x5a\x68\x32\x4a\x4f\x32\x54\
-\x7a\x32\x71\x4e\x72\x37\x5a\x42\x43\x34\x6e\x73\x20\x2b\x44\x36\
-\x39\x32\x55\x53\x35\x72\x53\x39\x57\x58\x69\x37\x6e\x71\x4b\x6f\
-\x43\x57\x64\x5a\x48\x6d\x71\x59\x68\x39\x73\x66\x56\x47\x47\x6e\
-\x61\x43\x39\x5a\x4c\x72\x39\x65\x44\x45\x68\x4b\x7a\x47\x55\x67\
-\x37\x51\x77\x55\x66\x6a\x6c\x32\x6d\x64\x5a\x34\x48\x63\x49\x6e\
-\x69\x6a\x4d\x42\x77\x4f\x41\x79\x4a\x20\x35\x4a\x78\x67\x41\x46\
-\x41\x32\x6c\x4a\x59\x4a\x52\x6f\x4d\x78\x4c\x6d\x62\x6e\x68\x45\
-\x4b\x4c\x4a\x72\x65\x75\x69\x35\x57\x41\x6b\x77\x53\x6f\x43\x41\
-\x45\x72\x72\x4e\x65\x49\x39\x42\x36\x50\x51\x35\x65\x2f\x7a\x71\
-\x35\x47\x2b\x7a\x41\x43\x45\x4d\x5a\x43\x4f\x2b\x6c\x41\x68\x62\
-\x4e\x30\x4b\x73\x72\x5a\x20\x6b\x34\x42\x48\x62\x32\x4a\x71\x43\
-\x36\x55\x55\x44\x67\x34\x4f\x43\x44\x69\x41\x41\x4b\x79\x46\x4b\
-\x53\x78\x4f\x6e\x70\x7a\x41\x46\x52\x62\x58\x44\x34\x38\x77\x57\
-\x36\x33\x78\x2f\x4f\x51\x45\x56\x57\x56\x51\x6c\x58\x55\x73\x30\
-\x48\x69\x56\x54\x66\x6d\x67\x45\x74\x62\x33\x69\x63\x74\x58\x42\
-\x56\x4b\x56\x20\x51\x6d\x68\x50\x4e\x47\x55\x41\x4c\x52\x4d\x6f\
-\x51\x63\x49\x6f\x72\x45\x41\x2f\x37\x57\x4d\x34\x47\x45\x54\x2b\
-\x58\x52\x59\x6d\x36\x75\x6e\x54\x78\x2f\x6a\x68\x34\x51\x4d\x38\
-\x2f\x4f\x45\x42\x55\x53\x66\x36\x4e\x44\x75\x70\x71\x4b\x36\x72\
-\x71\x67\x70\x59\x59\x30\x69\x62\x65\x2f\x4d\x6f\x30\x61\x6f\x42\
-\x20\x75\x39\x4e\x41\x6f\x66\x62\x50\x42\x50\x75\x5a\x4b\x67\x42\
-\x43\x44\x4d\x2f\x62\x77\x4c\x54\x4d\x71\x43\x78\x37\x30\x41\x79\
-\x58\x57\x7a\x68\x68\x36\x77\x70\x74\x4c\x76\x6f\x51\x70\x43\x6c\
-\x35\x73\x2b\x54\x30\x71\x6a\x6f\x2b\x4b\x7a\x43\x64\x54\x73\x50\
-\x43\x31\x56\x6f\x6a\x54\x56\x4e\x71\x6a\x4f\x4d\x68\x20\x38\x78\
-\x41\x63\x6c\x37\x4c\x78\x50\x52\x73\x4a\x77\x6f\x38\x39\x51\x70\
-\x59\x4f\x61\x6e\x4f\x5a\x62\x70\x44\x48\x67\x4f\x35\x52\x61\x39\
-\x45\x49\x77\x4d\x39\x6e\x53\x2b\x49\x42\x34\x71\x51\x4c\x64\x4f\
-\x34\x33\x74\x58\x5a\x67\x59\x62\x66\x4f\x6f\x35\x51\x75\x6b\x45\
-\x53\x56\x36\x39\x79\x6a\x35\x6a\x33\x53\x20\x69\x6b\x44\x49\x72\
-\x6f\x6e\x42\x47\x4d\x41\x47\x4a\x6b\x41\x68\x42\x50\x56\x58\x56\
-\x44\x55\x74\x4a\x41\x4d\x65\x4d\x62\x43\x58\x5a\x52\x6e\x47\x34\
-\x7a\x48\x47\x34\x2f\x46\x47\x51\x51\x49\x7a\x47\x55\x79\x6e\x4f\
-\x37\x69\x63\x7a\x38\x6a\x4d\x46\x5a\x59\x34\x59\x4e\x67\x44\x59\
-\x4b\x7a\x45\x65\x61\x76\x49\x20\x52\x52\x55\x6a\x33\x69\x56\x31\
-\x76\x43\x6c\x47\x7a\x78\x79\x6a\x77\x39\x67\x79\x4e\x67\x41\x4e\
-\x73\x52\x62\x61\x54\x36\x63\x76\x2b\x62\x42\x2b\x51\x53\x6e\x52\
-\x51\x6b\x61\x46\x77\x48\x51\x38\x77\x58\x67\x77\x4a\x4e\x50\x4a\
-\x4f\x56\x68\x6a\x55\x52\x52\x72\x50\x48\x37\x38\x47\x48\x66\x76\
-\x33\x6b\x56\x56\x20\x57\x6c\x79\x65\x6e\x65\x50\x4e\x6d\x7a\x66\
-\x55\x61\x38\x4c\x57\x46\x52\x4f\x63\x70\x69\x56\x31\x6e\x58\x4a\
-\x55\x46\x51\x56\x53\x72\x57\x45\x72\x45\x36\x6a\x6a\x68\x43\x56\
-\x4b\x69\x6b\x47\x2f\x6a\x2b\x46\x77\x69\x4a\x30\x70\x77\x63\x64\
-\x4d\x2f\x46\x51\x56\x4a\x56\x36\x2f\x66\x6f\x32\x48\x44\x78\x2f\
-\x69\x20\x79\x5a\x4d\x6e\x65\x48\x50\x2b\x47\x73\x5a\x56\x67\x42\
-\x56\x51\x69\x59\x51\x7a\x46\x6b\x56\x56\x68\x67\x6d\x52\x55\x74\
-\x44\x31\x6e\x59\x4e\x57\x43\x6d\x6d\x76\x54\x72\x37\x6c\x5a\x7a\
-\x4f\x6f\x37\x66\x79\x51\x76\x68\x65\x70\x42\x74\x4a\x74\x56\x4f\
-\x67\x5a\x4e\x49\x66\x66\x39\x61\x57\x6a\x44\x63\x74\x4a\x20\x38\
-\x68\x47\x64\x73\x42\x43\x2b\x5a\x54\x4d\x38\x4c\x46\x37\x48\x7a\
-\x75\x6a\x38\x7a\x68\x46\x46\x68\x42\x4e\x31\x35\x59\x70\x7a\x44\
-\x6e\x74\x37\x65\x38\x6a\x7a\x50\x48\x52\x44\x79\x72\x49\x4d\x37\
-\x74\x49\x46\x49\x65\x53\x34\x4a\x63\x50\x6a\x52\x42\x72\x30\x76\
-\x33\x5a\x63\x70\x51\x6e\x6a\x7a\x5a\x66\x6a\x20\x68\x58\x6d\x65\
-\x4e\x32\x70\x50\x72\x39\x4c\x44\x32\x35\x44\x5a\x47\x44\x33\x6c\
-\x33\x30\x31\x52\x59\x6c\x35\x56\x49\x65\x56\x4e\x4b\x52\x4c\x36\
-\x35\x58\x4a\x4a\x52\x63\x46\x53\x45\x76\x6b\x55\x56\x4f\x67\x53\
-\x58\x56\x55\x56\x79\x69\x6f\x50\x31\x7a\x4c\x47\x51\x48\x73\x67\
-\x69\x58\x4e\x5a\x64\x33\x64\x33\x20\x41\x32\x4f\x45\x63\x31\x51\
-\x55\x77\x48\x34\x69\x61\x56\x74\x4c\x56\x52\x33\x50\x46\x59\x51\
-\x69\x61\x30\x62\x44\x5a\x39\x47\x49\x75\x6f\x4a\x43\x52\x74\x53\
-\x49\x42\x4c\x42\x35\x58\x4b\x44\x56\x34\x37\x37\x39\x33\x50\x57\
-\x2f\x33\x65\x50\x6a\x68\x4b\x41\x51\x42\x55\x43\x41\x41\x36\x4d\
-\x33\x31\x76\x74\x73\x20\x43\x76\x43\x37\x45\x42\x55\x6e\x48\x68\
-\x38\x66\x49\x30\x74\x53\x41\x69\x52\x38\x38\x50\x50\x6c\x79\x31\
-\x66\x6f\x39\x51\x62\x59\x33\x7a\x39\x45\x62\x67\x78\x4f\x33\x37\
-\x79\x42\x4e\x51\x36\x56\x72\x65\x43\x63\x67\x4e\x59\x70\x34\x43\
-\x79\x4d\x4b\x63\x6b\x50\x4d\x39\x36\x5a\x42\x36\x42\x6b\x41\x6c\
-\x64\x5a\x20\x43\x41\x74\x6f\x70\x54\x45\x59\x44\x44\x41\x65\x6a\
-\x6a\x41\x63\x44\x6a\x45\x63\x45\x59\x70\x6c\x53\x73\x72\x55\x50\
-\x33\x33\x78\x45\x6b\x2b\x66\x50\x73\x58\x4a\x79\x51\x6b\x75\x4c\
-\x69\x36\x77\x58\x71\x39\x52\x6d\x67\x49\x57\x42\x67\x61\x6b\x4d\
-\x51\x30\x6f\x61\x63\x44\x41\x41\x5a\x4b\x30\x56\x6d\x55\x73\x20\
-\x56\x4b\x4b\x52\x4a\x46\x6b\x44\x2b\x75\x63\x64\x79\x67\x72\x61\
-\x49\x49\x52\x53\x72\x63\x34\x2b\x63\x54\x79\x4c\x41\x56\x67\x42\
-\x2b\x4d\x77\x4c\x61\x69\x6e\x46\x6e\x78\x4d\x51\x73\x48\x43\x79\
-\x67\x6f\x41\x44\x73\x32\x34\x4c\x53\x77\x41\x43\x6f\x57\x48\x2b\
-\x76\x45\x37\x41\x65\x49\x30\x70\x6e\x49\x44\x77\x20\x46\x65\x55\
-\x77\x46\x72\x75\x37\x75\x37\x67\x38\x76\x38\x44\x2b\x37\x69\x34\
-\x41\x59\x44\x41\x59\x42\x48\x53\x61\x7a\x54\x51\x70\x61\x79\x54\
-\x31\x58\x59\x34\x75\x53\x43\x63\x79\x6c\x68\x73\x61\x74\x43\x74\
-\x30\x77\x71\x39\x4c\x71\x5a\x46\x6c\x43\x66\x4c\x46\x50\x48\x44\
-\x53\x56\x46\x58\x31\x31\x76\x73\x49\x20\x43\x35\x4a\x39\x71\x67\
-\x44\x6b\x31\x43\x54\x46\x53\x61\x49\x67\x4a\x46\x44\x5a\x43\x76\
-\x6c\x71\x41\x57\x4e\x4b\x39\x48\x6f\x44\x69\x74\x30\x56\x61\x78\
-\x52\x4b\x49\x45\x6c\x37\x48\x69\x55\x6d\x33\x69\x47\x56\x61\x45\
-\x78\x32\x70\x6e\x6a\x7a\x2b\x68\x52\x6c\x57\x59\x62\x37\x59\x61\
-\x49\x77\x35\x34\x6a\x74\x20\x66\x54\x51\x61\x4e\x56\x4c\x54\x42\
-\x4b\x6b\x37\x75\x72\x61\x31\x4b\x4d\x6f\x53\x55\x39\x2f\x2b\x66\
-\x56\x48\x4d\x77\x2f\x50\x53\x47\x6f\x6c\x38\x61\x67\x62\x63\x50\
-\x4b\x39\x55\x37\x4e\x73\x42\x32\x4e\x44\x41\x6a\x57\x66\x33\x5a\
-\x39\x67\x32\x50\x6a\x70\x30\x6d\x4a\x49\x43\x51\x6b\x6d\x66\x34\
-\x71\x55\x32\x20\x64\x71\x75\x64\x36\x52\x53\x48\x68\x37\x35\x71\
-\x6e\x74\x59\x5a\x4b\x6d\x50\x77\x2b\x4f\x6b\x54\x33\x50\x76\x6b\
-\x45\x30\x42\x72\x7a\x43\x38\x75\x38\x4f\x62\x73\x44\x4a\x55\x31\
-\x39\x41\x41\x4f\x64\x66\x47\x6d\x46\x4e\x43\x2b\x2f\x49\x62\x72\
-\x38\x70\x51\x51\x47\x41\x35\x47\x6d\x45\x77\x6d\x41\x5a\x70\x4f\
-\x20\x30\x78\x51\x4f\x46\x76\x50\x4c\x47\x55\x35\x66\x76\x43\x52\
-\x77\x35\x66\x51\x55\x72\x31\x36\x39\x51\x6c\x6e\x6d\x6f\x50\x62\
-\x4f\x46\x61\x72\x4b\x77\x6a\x67\x44\x70\x32\x30\x7a\x46\x31\x55\
-\x30\x2f\x62\x61\x30\x6c\x2f\x6e\x34\x6e\x39\x35\x41\x50\x4b\x32\
-\x67\x77\x52\x57\x49\x66\x43\x76\x4b\x5a\x51\x4b\x56\x20\x6f\x6e\
-\x41\x4e\x47\x47\x31\x45\x4e\x41\x6e\x4b\x6f\x35\x74\x55\x38\x45\
-\x6d\x7a\x51\x6e\x36\x64\x37\x2b\x4b\x42\x51\x43\x67\x72\x43\x49\
-\x49\x58\x46\x6a\x35\x7a\x68\x78\x61\x35\x68\x6d\x77\x55\x30\x41\
-\x6f\x68\x69\x47\x71\x79\x50\x38\x44\x5a\x36\x53\x73\x4d\x68\x30\
-\x4e\x49\x53\x61\x78\x6c\x58\x42\x72\x46\x20\x57\x53\x62\x78\x35\
-\x4d\x56\x48\x37\x49\x4f\x38\x36\x38\x45\x43\x47\x6e\x2b\x72\x53\
-\x33\x4f\x52\x38\x4a\x4d\x6d\x59\x57\x32\x59\x70\x66\x31\x51\x2f\
-\x64\x2f\x2b\x50\x4e\x2f\x66\x4a\x70\x4c\x61\x50\x4d\x69\x73\x71\
-\x39\x2f\x54\x48\x67\x53\x70\x69\x67\x4a\x72\x58\x2f\x44\x4e\x66\
-\x6e\x4b\x53\x39\x6a\x78\x61\x20\x36\x55\x4c\x69\x51\x70\x71\x6d\
-\x47\x49\x2f\x48\x65\x50\x50\x6d\x54\x65\x69\x6a\x59\x59\x78\x42\
-\x76\x39\x2f\x48\x64\x44\x6f\x4e\x50\x6d\x43\x4d\x39\x4c\x59\x31\
-\x63\x46\x36\x73\x6b\x53\x54\x37\x6d\x45\x36\x6e\x57\x4a\x2b\x75\
-\x47\x76\x64\x73\x56\x4f\x7a\x58\x73\x66\x55\x54\x62\x56\x71\x75\
-\x47\x33\x58\x65\x20\x39\x72\x78\x64\x37\x31\x76\x6e\x6f\x50\x74\
-\x4a\x6a\x78\x4b\x6e\x48\x62\x46\x55\x53\x53\x48\x68\x66\x4b\x31\
-\x54\x49\x68\x4d\x41\x45\x71\x50\x52\x42\x4e\x65\x76\x58\x30\x63\
-\x76\x53\x61\x48\x4a\x4b\x6f\x4e\x7a\x42\x71\x65\x6e\x70\x38\x69\
-\x47\x41\x34\x78\x32\x64\x35\x43\x58\x4a\x52\x34\x39\x65\x34\x6f\
-\x38\x20\x4c\x31\x47\x57\x76\x6c\x2b\x64\x63\x30\x67\x31\x5a\x66\
-\x2b\x37\x6b\x6c\x49\x7a\x55\x71\x33\x51\x36\x77\x32\x6f\x70\x4b\
-\x58\x58\x77\x33\x51\x36\x43\x62\x37\x5a\x65\x72\x33\x47\x30\x79\
-\x65\x45\x61\x70\x36\x63\x6e\x4f\x44\x79\x38\x68\x79\x72\x66\x42\
-\x31\x38\x45\x62\x49\x4d\x53\x70\x2f\x50\x4a\x36\x45\x53\x20\x59\
-\x6f\x43\x47\x68\x4d\x39\x67\x38\x62\x6d\x6b\x48\x75\x48\x6a\x4b\
-\x75\x65\x32\x38\x4a\x47\x4a\x49\x55\x69\x59\x52\x4c\x54\x4c\x73\
-\x59\x5a\x7a\x58\x71\x41\x73\x61\x54\x6f\x42\x77\x45\x6d\x4b\x36\
-\x52\x42\x4b\x4b\x51\x4b\x49\x49\x36\x77\x76\x41\x59\x4d\x42\x68\
-\x49\x49\x46\x4c\x56\x5a\x6e\x43\x41\x6d\x46\x20\x38\x33\x36\x31\
-\x49\x33\x2b\x51\x77\x78\x4e\x31\x79\x51\x30\x4a\x4e\x2b\x63\x73\
-\x53\x69\x6b\x70\x6b\x30\x66\x4b\x73\x49\x67\x53\x70\x57\x75\x4b\
-\x65\x30\x38\x62\x34\x68\x78\x49\x77\x4e\x38\x79\x79\x65\x31\x44\
-\x52\x46\x47\x56\x6b\x4d\x63\x61\x62\x62\x69\x31\x61\x4e\x72\x77\
-\x64\x30\x77\x35\x6d\x65\x67\x4d\x20\x70\x6c\x6f\x48\x63\x78\x2f\
-\x52\x75\x59\x42\x61\x51\x34\x51\x4b\x39\x78\x69\x30\x69\x58\x35\
-\x6e\x72\x31\x5a\x78\x62\x77\x78\x2f\x48\x36\x7a\x70\x4b\x31\x50\
-\x41\x4c\x51\x32\x4d\x36\x66\x76\x61\x51\x2b\x50\x42\x6a\x2f\x70\
-\x65\x6a\x51\x39\x66\x46\x45\x57\x42\x2b\x58\x77\x65\x4e\x71\x37\
-\x52\x61\x49\x52\x2b\x20\x66\x30\x68\x50\x45\x5a\x4c\x4d\x6d\x7a\
-\x57\x4f\x6b\x42\x52\x72\x35\x4e\x53\x34\x76\x62\x30\x39\x76\x44\
-\x35\x37\x42\x51\x4d\x54\x4f\x48\x67\x6c\x4a\x43\x72\x75\x61\x65\
-\x4c\x6a\x67\x66\x78\x63\x43\x72\x54\x65\x74\x6e\x58\x31\x36\x6f\
-\x6f\x64\x64\x33\x33\x47\x43\x67\x45\x39\x36\x55\x2b\x4a\x2f\x61\
-\x71\x71\x20\x2f\x4f\x51\x4b\x4b\x43\x65\x68\x48\x4b\x47\x66\x69\
-\x64\x49\x34\x32\x4e\x33\x44\x7a\x65\x73\x33\x47\x68\x79\x53\x56\
-\x56\x58\x68\x32\x62\x4d\x6e\x2b\x4f\x6b\x58\x58\x36\x41\x6f\x53\
-\x38\x7a\x6e\x63\x35\x79\x65\x6e\x74\x4c\x4e\x2b\x78\x78\x53\x63\
-\x6c\x34\x64\x4d\x71\x58\x52\x47\x2f\x59\x77\x6e\x59\x79\x49\x20\
-\x7a\x36\x62\x58\x44\x77\x57\x6b\x7a\x6a\x6d\x73\x69\x68\x57\x65\
-\x50\x33\x2b\x4a\x62\x37\x2f\x39\x47\x6b\x2b\x66\x6e\x6d\x43\x39\
-\x70\x70\x7a\x43\x79\x70\x5a\x2b\x30\x47\x6e\x48\x72\x47\x77\x5a\
-\x4b\x4e\x47\x45\x49\x4a\x68\x62\x4b\x52\x6b\x57\x45\x2b\x66\x39\
-\x78\x62\x33\x57\x4f\x53\x6b\x37\x7a\x6e\x73\x4e\x20\x41\x32\x43\
-\x64\x44\x38\x72\x7a\x38\x76\x45\x4c\x53\x4e\x52\x30\x46\x73\x53\
-\x6b\x70\x53\x4e\x4e\x52\x76\x36\x68\x56\x41\x49\x4b\x4f\x70\x44\
-\x68\x53\x69\x6a\x4b\x42\x50\x4c\x43\x44\x71\x5a\x61\x74\x4a\x59\
-\x51\x57\x73\x45\x4c\x57\x78\x44\x6f\x78\x59\x74\x64\x43\x4d\x42\
-\x59\x54\x4d\x65\x54\x67\x49\x71\x79\x20\x2b\x5a\x6b\x6c\x43\x5a\
-\x57\x4f\x65\x5a\x38\x77\x33\x6e\x58\x62\x4f\x2f\x43\x32\x6d\x42\
-\x39\x2b\x68\x48\x61\x38\x4b\x74\x34\x58\x74\x49\x6e\x58\x51\x4d\
-\x79\x42\x41\x68\x38\x68\x41\x41\x41\x67\x41\x45\x6c\x45\x51\x56\
-\x53\x55\x7a\x71\x47\x66\x2b\x50\x75\x4e\x38\x37\x54\x75\x4b\x77\
-\x42\x68\x58\x6a\x4e\x56\x20\x5a\x59\x45\x6b\x70\x57\x63\x6a\x30\
-\x69\x52\x43\x33\x44\x6d\x70\x6f\x56\x69\x74\x73\x56\x51\x4b\x57\
-\x71\x65\x65\x4d\x49\x70\x4a\x6f\x63\x6c\x43\x4b\x49\x73\x31\x64\
-\x6e\x5a\x32\x67\x6a\x44\x74\x2b\x6e\x51\x33\x74\x6a\x4c\x69\x62\
-\x43\x4d\x2b\x77\x6c\x70\x77\x31\x4f\x72\x62\x4f\x63\x72\x57\x53\
-\x56\x51\x4b\x20\x36\x51\x6d\x31\x6a\x4a\x2b\x33\x4c\x6a\x4d\x7a\
-\x31\x76\x61\x75\x39\x64\x71\x32\x75\x59\x68\x48\x74\x6e\x30\x75\
-\x2f\x63\x56\x50\x66\x34\x62\x31\x65\x6f\x33\x7a\x32\x53\x58\x4f\
-\x7a\x38\x2b\x78\x57\x43\x34\x42\x49\x47\x51\x4f\x39\x4a\x49\x4d\
-\x74\x32\x2f\x65\x44\x67\x39\x45\x7a\x71\x33\x44\x78\x63\x55\x5a\
-\x20\x6a\x6f\x2b\x50\x61\x53\x4c\x4b\x45\x6f\x38\x66\x50\x53\x4a\
-\x2b\x2f\x61\x6f\x4d\x63\x61\x78\x2b\x76\x34\x2f\x64\x33\x56\x32\
-\x4d\x52\x79\x50\x69\x47\x65\x48\x55\x4f\x45\x65\x78\x76\x50\x6c\
-\x38\x6a\x6d\x2f\x76\x66\x34\x4d\x6e\x7a\x35\x2f\x67\x78\x66\x4e\
-\x54\x46\x46\x55\x65\x67\x72\x44\x4d\x59\x69\x57\x6c\x20\x52\x6d\
-\x55\x49\x61\x4c\x47\x43\x4b\x6a\x71\x63\x70\x50\x67\x57\x63\x37\
-\x4d\x49\x36\x61\x6b\x6b\x2f\x41\x4b\x57\x55\x73\x42\x57\x76\x69\
-\x35\x4d\x43\x49\x39\x63\x73\x51\x72\x77\x4e\x72\x77\x67\x66\x38\
-\x78\x61\x41\x61\x6d\x49\x5a\x73\x4d\x4a\x43\x33\x42\x2b\x6f\x67\
-\x4f\x78\x53\x55\x73\x4e\x7a\x69\x6c\x49\x20\x64\x49\x62\x53\x56\
-\x45\x68\x54\x6f\x71\x78\x67\x43\x6f\x70\x2b\x76\x34\x2f\x46\x66\
-\x49\x33\x54\x31\x32\x39\x67\x6a\x59\x4a\x4d\x4e\x50\x6b\x2b\x4d\
-\x4a\x43\x71\x67\x72\x55\x6c\x6d\x47\x64\x42\x4b\x74\x4b\x75\x4d\
-\x6b\x79\x73\x67\x45\x77\x30\x6a\x6f\x2b\x76\x59\x7a\x35\x66\x45\
-\x4f\x74\x64\x52\x74\x5a\x4a\x20\x76\x30\x2b\x77\x50\x5a\x74\x59\
-\x41\x45\x49\x6f\x68\x32\x6b\x54\x57\x4d\x50\x48\x6b\x39\x33\x31\
-\x4e\x79\x38\x38\x44\x6f\x42\x4c\x4b\x61\x47\x56\x68\x68\x56\x55\
-\x4f\x57\x34\x5a\x38\x57\x74\x70\x78\x45\x30\x54\x75\x4b\x59\x32\
-\x71\x61\x6f\x71\x55\x44\x6a\x47\x79\x34\x77\x57\x59\x51\x31\x47\
-\x73\x53\x6e\x6e\x20\x6c\x78\x33\x64\x73\x31\x2b\x2b\x63\x54\x6b\
-\x53\x67\x30\x36\x6b\x63\x56\x78\x41\x4b\x56\x65\x4c\x47\x62\x54\
-\x57\x47\x41\x37\x37\x43\x42\x32\x4d\x2f\x66\x6d\x31\x31\x68\x43\
-\x57\x7a\x47\x51\x65\x49\x2f\x62\x6a\x72\x7a\x49\x56\x6e\x51\x4f\
-\x55\x4e\x37\x47\x4c\x6f\x73\x42\x34\x4f\x73\x5a\x30\x4f\x73\x58\
-\x35\x20\x35\x52\x6b\x68\x39\x46\x72\x44\x75\x69\x72\x6b\x33\x6e\
-\x49\x6f\x51\x72\x6f\x36\x31\x41\x59\x48\x43\x4a\x38\x46\x78\x75\
-\x65\x6b\x52\x2f\x62\x49\x73\x71\x67\x70\x4d\x32\x4d\x71\x54\x65\
-\x66\x50\x49\x66\x79\x39\x61\x43\x30\x54\x37\x45\x7a\x36\x4f\x4e\
-\x77\x2f\x77\x6d\x71\x39\x78\x6f\x73\x58\x4c\x2f\x44\x69\x20\x46\
-\x54\x6d\x37\x57\x6d\x72\x63\x75\x6e\x34\x44\x34\x39\x45\x49\x69\
-\x56\x51\x68\x61\x30\x55\x6f\x69\x66\x46\x30\x67\x73\x6d\x55\x47\
-\x4c\x68\x6e\x35\x78\x65\x59\x6e\x56\x2f\x41\x56\x51\x62\x6a\x77\
-\x52\x44\x54\x76\x56\x31\x4d\x70\x39\x4d\x47\x4a\x47\x79\x74\x52\
-\x62\x6c\x65\x34\x2f\x7a\x38\x48\x43\x63\x6e\x20\x4a\x33\x6a\x30\
-\x34\x43\x46\x65\x6e\x44\x35\x48\x62\x6e\x49\x55\x56\x51\x35\x54\
-\x55\x55\x79\x76\x4b\x69\x70\x55\x6e\x75\x68\x57\x53\x59\x57\x79\
-\x7a\x47\x45\x6a\x47\x36\x70\x79\x78\x6e\x4d\x39\x2b\x55\x6d\x55\
-\x64\x53\x50\x53\x42\x70\x65\x48\x36\x31\x35\x45\x44\x57\x33\x69\
-\x4a\x4a\x49\x30\x38\x30\x69\x61\x20\x51\x70\x49\x6f\x6c\x46\x55\
-\x42\x77\x45\x46\x6f\x54\x54\x77\x34\x31\x67\x42\x4b\x51\x38\x73\
-\x45\x78\x6c\x69\x6b\x53\x52\x38\x43\x45\x74\x50\x70\x42\x4c\x2f\
-\x36\x36\x37\x2f\x43\x35\x35\x39\x2f\x68\x76\x46\x34\x6a\x49\x76\
-\x4c\x46\x62\x37\x38\x31\x36\x39\x77\x2f\x34\x66\x48\x65\x50\x48\
-\x38\x46\x4f\x64\x76\x20\x33\x6d\x43\x39\x6e\x6b\x4d\x49\x41\x70\
-\x30\x53\x4c\x53\x47\x6b\x38\x61\x42\x42\x62\x53\x4c\x6c\x65\x52\
-\x34\x41\x68\x42\x66\x50\x54\x6e\x44\x74\x36\x44\x41\x38\x68\x35\
-\x51\x53\x34\x2b\x45\x49\x69\x39\x55\x53\x7a\x67\x68\x4d\x4a\x68\
-\x4d\x41\x43\x45\x6a\x66\x35\x65\x56\x6c\x57\x4c\x7a\x63\x74\x34\
-\x4b\x68\x20\x38\x6d\x42\x32\x75\x37\x71\x6d\x6b\x6e\x30\x34\x52\
-\x70\x72\x58\x52\x51\x47\x64\x71\x71\x33\x6a\x30\x33\x37\x4e\x2b\
-\x59\x55\x56\x43\x33\x39\x6c\x6d\x70\x53\x43\x73\x5a\x6b\x61\x68\
-\x7a\x34\x32\x47\x42\x42\x49\x53\x68\x72\x58\x38\x57\x39\x45\x38\
-\x31\x50\x37\x7a\x59\x46\x39\x50\x4d\x70\x46\x42\x51\x41\x56\x20\
-\x67\x53\x54\x76\x63\x73\x54\x6f\x4c\x49\x38\x62\x35\x36\x37\x75\
-\x37\x2b\x2f\x6a\x38\x76\x49\x63\x6d\x63\x35\x51\x4d\x6f\x57\x2f\
-\x42\x36\x75\x36\x7a\x67\x50\x55\x6f\x61\x59\x75\x48\x35\x6a\x6e\
-\x77\x41\x58\x70\x37\x44\x37\x30\x79\x5a\x4d\x54\x33\x4c\x78\x35\
-\x45\x30\x49\x4a\x70\x44\x72\x44\x78\x78\x39\x39\x20\x67\x72\x74\
-\x33\x50\x38\x43\x72\x56\x79\x2b\x78\x58\x71\x39\x78\x38\x2f\x67\
-\x36\x45\x6b\x6c\x4d\x77\x55\x71\x70\x4f\x6e\x6a\x75\x73\x78\x57\
-\x4b\x76\x49\x42\x5a\x72\x58\x47\x30\x74\x34\x66\x70\x2b\x2b\x38\
-\x6a\x37\x5a\x45\x44\x37\x51\x53\x77\x57\x4b\x39\x67\x72\x63\x47\
-\x6a\x4a\x34\x2f\x77\x2f\x66\x66\x66\x20\x34\x38\x57\x4c\x45\x31\
-\x78\x65\x58\x6f\x62\x67\x76\x42\x41\x43\x36\x33\x77\x4f\x71\x58\
-\x30\x78\x4c\x53\x78\x56\x57\x33\x68\x30\x73\x54\x41\x2b\x72\x68\
-\x67\x6d\x32\x66\x2f\x74\x36\x73\x48\x4d\x73\x69\x79\x51\x37\x4c\
-\x43\x4a\x51\x51\x38\x63\x5a\x62\x73\x44\x42\x49\x34\x49\x45\x63\
-\x77\x6a\x4f\x45\x70\x4f\x20\x79\x4a\x63\x72\x70\x4c\x30\x4d\x55\
-\x68\x4a\x6e\x43\x6d\x6b\x44\x32\x6c\x77\x34\x48\x6a\x34\x65\x6a\
-\x4a\x47\x76\x53\x30\x42\x49\x70\x4f\x6b\x41\x78\x38\x66\x48\x2b\
-\x4e\x75\x2f\x2f\x57\x76\x38\x78\x56\x39\x38\x44\x75\x74\x4b\x56\
-\x4a\x58\x42\x64\x4c\x4b\x4c\x39\x2b\x39\x2b\x69\x44\x53\x62\x34\
-\x74\x5a\x4e\x20\x49\x76\x61\x64\x58\x62\x7a\x42\x6b\x38\x66\x33\
-\x73\x56\x69\x65\x59\x33\x62\x35\x47\x71\x76\x31\x42\x54\x58\x4c\
-\x53\x52\x4e\x6b\x2f\x51\x47\x53\x4a\x4d\x50\x4f\x64\x43\x38\x55\
-\x43\x52\x4e\x48\x35\x78\x42\x61\x55\x6d\x4f\x64\x65\x62\x6d\x41\
-\x63\x34\x42\x57\x43\x51\x77\x73\x64\x62\x78\x53\x74\x63\x38\x34\
-\x20\x47\x6f\x31\x43\x34\x53\x74\x54\x36\x42\x56\x46\x51\x57\x30\
-\x46\x79\x71\x6f\x52\x4f\x35\x4e\x53\x42\x68\x72\x4c\x77\x72\x4d\
-\x43\x4a\x45\x6b\x43\x35\x7a\x76\x66\x73\x72\x43\x30\x46\x78\x71\
-\x35\x41\x35\x46\x4a\x4a\x6d\x72\x47\x42\x57\x4e\x4d\x63\x44\x75\
-\x6b\x32\x4f\x4c\x37\x2b\x50\x36\x42\x6d\x2b\x75\x59\x20\x6d\x4e\
-\x79\x74\x73\x56\x53\x5a\x30\x53\x46\x44\x62\x55\x46\x74\x68\x6a\
-\x63\x32\x72\x30\x66\x76\x4e\x53\x6b\x53\x6e\x51\x66\x63\x6e\x50\
-\x51\x6d\x72\x70\x43\x77\x50\x73\x6b\x45\x51\x73\x43\x34\x43\x72\
-\x50\x46\x44\x41\x63\x48\x2b\x39\x6a\x66\x33\x38\x65\x4c\x46\x79\
-\x2b\x77\x58\x43\x38\x49\x4f\x51\x35\x35\x20\x74\x73\x4c\x48\x30\
-\x75\x46\x72\x56\x35\x30\x50\x4d\x52\x6b\x59\x74\x71\x79\x69\x6b\
-\x42\x66\x2f\x48\x53\x66\x34\x69\x77\x69\x49\x61\x78\x2f\x36\x37\
-\x2f\x2f\x68\x37\x33\x48\x76\x33\x6a\x31\x38\x39\x74\x6c\x6e\x4f\
-\x44\x67\x34\x51\x47\x55\x4b\x61\x43\x56\x77\x2b\x39\x59\x74\x4b\
-\x4d\x58\x6d\x49\x77\x4b\x36\x20\x46\x48\x5a\x63\x6d\x67\x59\x49\
-\x41\x49\x65\x48\x68\x39\x6a\x5a\x32\x55\x46\x6c\x44\x66\x49\x38\
-\x52\x35\x37\x6e\x6d\x43\x38\x58\x65\x50\x72\x38\x4b\x58\x37\x37\
-\x75\x39\x2f\x6a\x38\x76\x4c\x63\x64\x31\x36\x69\x6d\x79\x70\x4d\
-\x41\x57\x76\x49\x6a\x4a\x54\x65\x4e\x7a\x53\x32\x43\x6f\x49\x70\
-\x70\x51\x79\x4e\x20\x51\x6f\x58\x69\x58\x62\x58\x75\x32\x79\x65\
-\x6c\x68\x4e\x42\x55\x46\x38\x68\x6f\x4c\x64\x43\x73\x50\x59\x7a\
-\x39\x50\x78\x4b\x36\x61\x47\x49\x69\x6d\x7a\x33\x4c\x4d\x73\x44\
-\x42\x78\x2b\x44\x6f\x62\x30\x72\x47\x46\x63\x69\x79\x41\x51\x51\
-\x30\x6c\x6b\x73\x44\x70\x54\x49\x63\x48\x42\x7a\x69\x33\x72\x31\
-\x37\x20\x75\x48\x76\x6e\x44\x6d\x37\x64\x75\x6b\x50\x46\x6f\x6b\
-\x70\x68\x4d\x68\x6c\x69\x4e\x69\x74\x77\x66\x6e\x35\x4a\x56\x51\
-\x4a\x4a\x44\x33\x41\x53\x57\x5a\x5a\x67\x75\x74\x50\x48\x38\x35\
-\x4e\x48\x4f\x48\x6e\x6d\x73\x4d\x35\x54\x54\x45\x59\x44\x54\x43\
-\x59\x54\x53\x4a\x33\x36\x52\x48\x59\x67\x58\x36\x2f\x78\x20\x36\
-\x73\x55\x72\x4b\x72\x50\x4b\x65\x75\x6a\x33\x2b\x7a\x67\x2f\x50\
-\x38\x65\x66\x2f\x2f\x67\x6e\x58\x4a\x35\x66\x77\x41\x6b\x67\x37\
-\x61\x58\x6f\x39\x58\x71\x59\x4c\x78\x63\x59\x44\x6f\x65\x68\x65\
-\x70\x30\x50\x42\x71\x48\x36\x2f\x54\x37\x4e\x6b\x52\x66\x43\x50\
-\x4d\x38\x44\x78\x58\x37\x63\x42\x6a\x73\x57\x20\x71\x73\x61\x69\
-\x37\x64\x43\x47\x6a\x58\x47\x4d\x2f\x4c\x35\x51\x59\x2b\x68\x71\
-\x6c\x44\x63\x32\x53\x32\x4e\x2f\x73\x75\x74\x63\x51\x6f\x68\x67\
-\x35\x6a\x6b\x47\x6d\x69\x4f\x74\x79\x35\x75\x6f\x45\x46\x45\x5a\
-\x58\x54\x68\x6e\x39\x2f\x6e\x65\x39\x6c\x72\x38\x6e\x4d\x35\x52\
-\x6c\x2b\x50\x35\x66\x45\x34\x62\x20\x65\x70\x72\x69\x38\x50\x41\
-\x51\x44\x78\x34\x73\x6b\x43\x67\x46\x71\x59\x43\x79\x45\x6a\x44\
-\x43\x4e\x7a\x72\x6a\x5a\x2f\x54\x50\x79\x63\x4a\x70\x49\x30\x71\
-\x33\x47\x41\x52\x73\x43\x75\x5a\x32\x4e\x46\x73\x4c\x35\x66\x44\
-\x56\x4e\x33\x2f\x43\x6b\x32\x65\x50\x38\x66\x46\x48\x39\x2f\x44\
-\x70\x70\x35\x39\x53\x20\x66\x6c\x31\x56\x51\x75\x6d\x55\x4a\x4e\
-\x68\x55\x63\x45\x36\x47\x66\x76\x59\x41\x37\x53\x78\x56\x58\x67\
-\x44\x57\x68\x52\x53\x6a\x6f\x69\x70\x78\x65\x6e\x71\x4b\x62\x37\
-\x2b\x2f\x6a\x34\x65\x50\x48\x75\x48\x6c\x6d\x35\x63\x77\x46\x73\
-\x68\x39\x37\x71\x61\x54\x58\x49\x56\x73\x41\x43\x45\x68\x4a\x4e\
-\x55\x66\x20\x68\x73\x45\x53\x78\x42\x73\x54\x4f\x2f\x75\x63\x6b\
-\x55\x42\x2b\x52\x64\x33\x35\x71\x55\x45\x68\x35\x78\x2f\x51\x67\
-\x53\x71\x2f\x36\x52\x6f\x65\x76\x45\x4c\x74\x43\x73\x62\x7a\x77\
-\x54\x34\x44\x77\x39\x32\x39\x58\x6f\x2f\x4d\x77\x36\x4b\x43\x55\
-\x42\x6f\x71\x53\x62\x48\x4f\x69\x52\x57\x75\x31\x78\x76\x68\x20\
-\x30\x35\x2f\x2b\x44\x42\x39\x38\x38\x41\x46\x30\x49\x74\x45\x66\
-\x44\x72\x47\x37\x64\x34\x42\x45\x41\x78\x41\x56\x38\x6e\x57\x4a\
-\x35\x58\x49\x4e\x35\x77\x79\x30\x6c\x6c\x44\x4b\x34\x65\x7a\x38\
-\x41\x67\x38\x66\x66\x59\x2b\x7a\x31\x79\x2f\x51\x37\x79\x6e\x73\
-\x37\x75\x34\x68\x7a\x51\x34\x62\x6b\x36\x41\x31\x20\x63\x61\x6b\
-\x6f\x4b\x66\x48\x56\x56\x31\x39\x68\x5a\x7a\x4a\x46\x6c\x76\x58\
-\x78\x38\x48\x74\x4b\x4e\x76\x2f\x69\x38\x79\x2b\x77\x57\x43\x77\
-\x77\x6e\x6b\x37\x77\x70\x7a\x2f\x2f\x47\x66\x50\x56\x45\x6f\x6f\
-\x75\x43\x6d\x73\x64\x65\x72\x30\x2b\x6a\x4b\x6d\x68\x2b\x62\x43\
-\x77\x70\x41\x51\x53\x44\x61\x6b\x56\x20\x6b\x69\x78\x46\x32\x73\
-\x73\x43\x6c\x62\x30\x78\x68\x68\x42\x6b\x62\x79\x49\x4b\x79\x38\
-\x4b\x6a\x36\x6f\x55\x64\x4c\x49\x69\x6d\x45\x4c\x46\x51\x78\x47\
-\x33\x59\x4f\x47\x51\x52\x4f\x67\x70\x33\x41\x42\x6e\x30\x58\x52\
-\x6e\x6d\x79\x44\x6b\x58\x73\x70\x65\x45\x6e\x33\x4f\x61\x6e\x36\
-\x59\x4c\x77\x63\x42\x48\x20\x6a\x47\x72\x79\x75\x5a\x6d\x4a\x6f\
-\x53\x31\x77\x73\x72\x55\x4a\x76\x4f\x32\x67\x4a\x41\x44\x61\x70\
-\x4c\x49\x73\x77\x38\x48\x65\x41\x5a\x34\x39\x65\x34\x62\x53\x31\
-\x45\x6e\x6c\x44\x73\x7a\x38\x42\x30\x4b\x6e\x62\x53\x30\x48\x41\
-\x73\x32\x4e\x68\x2b\x2f\x37\x4b\x6c\x51\x30\x76\x6a\x38\x48\x51\
-\x4a\x63\x6f\x20\x41\x41\x57\x73\x69\x69\x58\x2b\x38\x4b\x64\x2f\
-\x78\x59\x4e\x48\x33\x2b\x50\x54\x54\x7a\x37\x42\x76\x58\x76\x33\
-\x34\x46\x44\x62\x39\x34\x79\x45\x68\x52\x4e\x4c\x69\x64\x56\x36\
-\x69\x66\x56\x69\x69\x64\x50\x54\x55\x33\x7a\x2f\x38\x41\x45\x65\
-\x50\x33\x36\x4d\x32\x58\x79\x4f\x31\x58\x71\x42\x77\x6c\x52\x45\
-\x20\x46\x61\x63\x38\x42\x56\x37\x69\x34\x33\x73\x2b\x5a\x78\x41\
-\x41\x59\x44\x6f\x30\x46\x70\x70\x71\x32\x35\x72\x61\x66\x77\x72\
-\x64\x6e\x79\x4b\x6b\x6b\x4f\x71\x41\x49\x2b\x53\x74\x6c\x64\x6b\
-\x51\x32\x2b\x75\x62\x75\x37\x77\x4e\x56\x42\x56\x6c\x57\x55\x4a\
-\x49\x44\x61\x6b\x54\x4f\x4b\x46\x52\x6d\x51\x52\x47\x20\x53\x48\
-\x78\x77\x37\x32\x4e\x38\x38\x50\x34\x39\x6a\x45\x59\x6a\x4a\x47\
-\x6d\x4b\x4a\x4a\x56\x51\x53\x51\x59\x6f\x43\x51\x75\x44\x52\x43\
-\x61\x77\x6f\x73\x52\x69\x4e\x6f\x65\x44\x77\x58\x78\x78\x67\x52\
-\x39\x2b\x2b\x41\x45\x76\x58\x72\x7a\x41\x59\x4e\x44\x44\x37\x64\
-\x75\x33\x49\x4b\x53\x42\x51\x45\x55\x5a\x20\x4e\x64\x47\x43\x4a\
-\x74\x49\x73\x51\x43\x59\x70\x7a\x4c\x54\x41\x66\x44\x62\x44\x76\
-\x2f\x37\x4c\x37\x33\x44\x33\x37\x6c\x33\x38\x37\x4c\x50\x50\x6b\
-\x5a\x63\x46\x39\x6e\x64\x32\x73\x58\x39\x38\x68\x47\x2b\x2f\x2f\
-\x52\x61\x44\x77\x51\x43\x72\x46\x62\x58\x47\x6e\x6b\x77\x6d\x6e\
-\x51\x6e\x63\x54\x57\x33\x68\x20\x51\x70\x70\x5a\x76\x39\x39\x48\
-\x56\x56\x57\x59\x7a\x2b\x66\x55\x4c\x63\x6c\x58\x46\x62\x67\x6f\
-\x67\x36\x52\x39\x6e\x76\x61\x69\x61\x67\x41\x6e\x51\x4f\x41\x52\
-\x5a\x56\x5a\x75\x44\x6a\x4d\x30\x55\x45\x45\x2b\x54\x38\x65\x43\
-\x64\x46\x4c\x34\x78\x50\x65\x61\x55\x68\x48\x68\x2f\x48\x55\x32\
-\x45\x56\x74\x68\x20\x37\x58\x74\x70\x6e\x7a\x65\x75\x58\x65\x54\
-\x72\x32\x2b\x6a\x33\x6a\x54\x47\x53\x7a\x67\x4d\x39\x43\x76\x50\
-\x35\x48\x4a\x50\x4a\x42\x4d\x50\x68\x45\x41\x64\x37\x2b\x33\x6a\
-\x35\x36\x68\x53\x6c\x49\x30\x47\x30\x72\x74\x6e\x51\x78\x55\x6b\
-\x41\x70\x69\x59\x31\x62\x66\x6a\x4d\x57\x34\x37\x75\x39\x51\x63\
-\x41\x20\x44\x74\x6f\x71\x38\x69\x64\x4d\x56\x61\x47\x58\x5a\x54\
-\x69\x62\x6e\x65\x45\x33\x2f\x2f\x51\x50\x65\x50\x54\x6f\x41\x62\
-\x37\x34\x2f\x41\x76\x63\x75\x58\x4d\x48\x56\x56\x46\x58\x51\x53\
-\x51\x5a\x4a\x56\x79\x66\x76\x6e\x36\x4e\x52\x34\x38\x65\x34\x59\
-\x39\x2f\x2f\x67\x50\x65\x58\x4a\x77\x6a\x4c\x33\x7a\x33\x20\x57\
-\x4b\x57\x77\x4c\x73\x6e\x52\x68\x58\x53\x6f\x79\x6a\x4c\x41\x7a\
-\x59\x47\x67\x52\x39\x54\x6c\x4f\x54\x78\x35\x31\x74\x61\x43\x46\
-\x50\x71\x65\x4f\x77\x66\x34\x53\x67\x63\x57\x50\x76\x49\x2f\x65\
-\x4d\x64\x6b\x30\x68\x37\x46\x7a\x31\x50\x76\x6c\x50\x35\x5a\x46\
-\x62\x65\x2b\x71\x73\x47\x35\x32\x71\x7a\x79\x20\x45\x79\x47\x68\
-\x4b\x47\x46\x62\x4b\x4a\x52\x57\x6f\x44\x4c\x41\x34\x64\x45\x52\
-\x50\x72\x72\x33\x47\x66\x5a\x32\x6a\x36\x47\x55\x52\x70\x4c\x32\
-\x59\x59\x57\x44\x55\x42\x72\x37\x68\x30\x66\x68\x75\x73\x5a\x59\
-\x56\x4a\x58\x46\x69\x35\x63\x6e\x2b\x4f\x4d\x66\x2f\x34\x53\x6e\
-\x4a\x38\x38\x78\x48\x41\x35\x78\x20\x2b\x2f\x5a\x31\x56\x4b\x61\
-\x45\x64\x42\x35\x4d\x63\x42\x71\x51\x4e\x69\x53\x75\x53\x31\x2b\
-\x42\x6b\x69\x59\x61\x78\x58\x6f\x4a\x70\x52\x4b\x38\x64\x2b\x64\
-\x39\x2f\x4f\x56\x66\x66\x49\x47\x64\x36\x52\x54\x57\x56\x70\x35\
-\x43\x73\x49\x2f\x52\x6b\x44\x49\x36\x7a\x48\x71\x46\x4e\x45\x30\
-\x78\x6e\x38\x39\x52\x20\x6c\x71\x56\x50\x48\x36\x76\x50\x78\x32\
-\x4d\x63\x2f\x37\x41\x4c\x34\x5a\x77\x4c\x78\x46\x74\x4b\x4b\x63\
-\x79\x57\x43\x35\x52\x56\x52\x66\x63\x6e\x42\x4a\x69\x44\x4a\x56\
-\x36\x6b\x37\x55\x58\x4c\x6d\x6b\x6c\x45\x38\x35\x65\x6b\x43\x6b\
-\x6b\x5a\x4d\x63\x70\x5a\x54\x67\x46\x73\x4c\x54\x56\x2f\x6e\x33\
-\x48\x6a\x20\x6e\x74\x72\x31\x34\x49\x77\x69\x48\x37\x74\x46\x48\
-\x55\x62\x6f\x65\x63\x51\x7a\x31\x4c\x53\x47\x4c\x42\x59\x57\x51\
-\x70\x35\x57\x46\x61\x79\x67\x62\x63\x4c\x51\x42\x6d\x56\x69\x77\
-\x65\x41\x2b\x6b\x46\x70\x49\x58\x4c\x39\x2b\x48\x66\x50\x6c\x41\
-\x6f\x74\x56\x68\x55\x70\x51\x2f\x4a\x77\x33\x47\x4e\x69\x34\x20\
-\x6d\x46\x74\x41\x43\x6b\x6c\x70\x6a\x37\x59\x70\x61\x47\x35\x44\
-\x2b\x44\x65\x54\x75\x6e\x6b\x39\x36\x72\x78\x63\x49\x30\x74\x54\
-\x4f\x43\x75\x51\x6c\x7a\x6b\x53\x6c\x55\x42\x6d\x43\x6b\x39\x66\
-\x50\x73\x66\x72\x66\x33\x69\x44\x4f\x37\x64\x75\x34\x2b\x37\x64\
-\x44\x33\x44\x6a\x78\x67\x32\x73\x50\x58\x72\x36\x20\x34\x4d\x45\
-\x44\x76\x50\x52\x5a\x4c\x45\x61\x53\x75\x5a\x6b\x6f\x6a\x64\x77\
-\x4c\x48\x34\x55\x7a\x42\x4d\x71\x69\x4a\x50\x6a\x53\x78\x75\x59\
-\x4a\x6d\x5a\x5a\x74\x4a\x69\x32\x6d\x51\x6d\x2b\x62\x4d\x70\x7a\
-\x4d\x7a\x43\x59\x6f\x37\x2b\x37\x38\x67\x44\x45\x7a\x64\x41\x4f\
-\x75\x62\x38\x44\x74\x39\x53\x51\x30\x20\x4a\x67\x51\x4b\x6c\x53\
-\x57\x2f\x41\x45\x4b\x6a\x74\x41\x4c\x39\x2f\x68\x53\x33\x37\x6e\
-\x36\x49\x32\x37\x63\x2b\x51\x4b\x38\x2f\x68\x52\x51\x4a\x42\x72\
-\x30\x2b\x48\x4b\x6a\x47\x62\x54\x44\x55\x53\x46\x50\x36\x71\x59\
-\x6f\x31\x54\x46\x6e\x68\x39\x2f\x2f\x79\x4f\x2f\x7a\x6a\x50\x2f\
-\x39\x58\x70\x46\x6d\x47\x20\x47\x38\x65\x48\x70\x43\x57\x74\x52\
-\x61\x49\x45\x62\x45\x6b\x77\x75\x78\x49\x61\x79\x69\x39\x63\x78\
-\x62\x75\x38\x6c\x4b\x69\x4b\x46\x57\x78\x6c\x38\x4f\x6e\x48\x6e\
-\x2b\x44\x65\x54\x7a\x35\x41\x6c\x76\x51\x41\x33\x2f\x34\x35\x63\
-\x51\x6d\x4f\x6a\x6f\x35\x51\x6c\x53\x58\x53\x70\x41\x65\x64\x35\
-\x36\x69\x55\x20\x67\x72\x4d\x49\x64\x58\x65\x6a\x30\x54\x42\x6f\
-\x73\x6e\x6a\x73\x65\x42\x45\x7a\x70\x53\x56\x72\x2b\x35\x43\x4a\
-\x6f\x79\x51\x57\x6c\x7a\x4f\x73\x31\x30\x73\x43\x5a\x52\x53\x33\
-\x50\x77\x65\x35\x42\x5a\x46\x41\x78\x6d\x67\x6e\x49\x6a\x4d\x53\
-\x51\x44\x42\x4a\x54\x64\x58\x55\x38\x6b\x4c\x4b\x68\x6f\x2f\x65\
-\x20\x4a\x52\x44\x77\x6c\x54\x48\x4f\x31\x74\x65\x72\x55\x55\x55\
-\x46\x6c\x52\x43\x50\x61\x63\x57\x56\x36\x48\x37\x74\x30\x4f\x64\
-\x73\x38\x47\x6d\x76\x4d\x76\x71\x61\x59\x45\x37\x72\x38\x50\x30\
-\x4d\x41\x59\x52\x30\x74\x30\x52\x72\x37\x45\x31\x33\x4d\x52\x36\
-\x4f\x6b\x4a\x64\x72\x4f\x46\x76\x43\x51\x55\x42\x61\x20\x52\x34\
-\x43\x68\x73\x31\x42\x43\x45\x39\x4c\x6e\x7a\x58\x55\x70\x4b\x4b\
-\x46\x42\x52\x73\x2b\x38\x63\x64\x30\x4f\x41\x65\x58\x78\x31\x4d\
-\x72\x48\x65\x2b\x44\x37\x73\x56\x6d\x50\x45\x45\x72\x70\x59\x4b\
-\x73\x31\x2f\x76\x44\x64\x6e\x2f\x48\x64\x34\x2b\x38\x78\x48\x41\
-\x35\x52\x2b\x71\x41\x38\x6f\x32\x39\x4f\x20\x41\x47\x58\x68\x61\
-\x51\x7a\x4c\x79\x71\x65\x42\x30\x63\x43\x55\x6c\x71\x72\x56\x47\
-\x2f\x36\x45\x71\x77\x6d\x64\x65\x47\x63\x49\x4e\x34\x50\x36\x78\
-\x31\x6f\x54\x4a\x70\x71\x44\x31\x31\x70\x53\x76\x5a\x31\x31\x4c\
-\x71\x51\x4f\x4f\x66\x67\x64\x56\x74\x59\x39\x42\x44\x6a\x39\x54\
-\x44\x68\x66\x67\x65\x32\x4d\x20\x44\x2b\x71\x57\x30\x44\x72\x78\
-\x63\x44\x31\x4e\x67\x4a\x55\x53\x57\x6d\x66\x49\x44\x65\x43\x63\
-\x78\x75\x48\x78\x62\x66\x7a\x6b\x6f\x35\x39\x69\x4d\x6a\x30\x43\
-\x49\x4f\x41\x45\x4c\x54\x41\x49\x67\x30\x45\x43\x44\x48\x6f\x43\
-\x78\x30\x64\x54\x54\x4d\x59\x39\x46\x4f\x55\x53\x72\x30\x39\x66\
-\x34\x4a\x39\x2b\x20\x38\x38\x39\x34\x66\x6e\x4b\x43\x67\x37\x31\
-\x64\x4f\x41\x48\x76\x59\x7a\x70\x51\x37\x61\x43\x45\x79\x6f\x69\
-\x35\x6a\x51\x54\x51\x55\x71\x77\x55\x46\x4e\x64\x63\x7a\x43\x36\
-\x67\x6e\x4d\x44\x2f\x38\x59\x75\x2f\x78\x49\x33\x6a\x36\x78\x43\
-\x43\x36\x74\x59\x41\x41\x6b\x2f\x57\x5a\x59\x48\x78\x63\x49\x4b\
-\x58\x20\x70\x36\x66\x59\x32\x79\x47\x53\x58\x43\x30\x30\x4c\x4b\
-\x78\x50\x36\x4d\x35\x78\x2f\x6f\x59\x30\x59\x70\x59\x52\x30\x4d\
-\x4d\x46\x79\x6f\x41\x4e\x56\x6b\x61\x4e\x47\x46\x71\x34\x4b\x4f\
-\x4e\x44\x61\x34\x31\x78\x66\x34\x43\x71\x4b\x6c\x41\x56\x61\x38\
-\x72\x57\x53\x56\x4a\x6f\x70\x63\x4f\x38\x53\x43\x48\x67\x20\x72\
-\x50\x46\x43\x79\x76\x4e\x6c\x41\x47\x38\x69\x6c\x6c\x57\x46\x4e\
-\x4d\x74\x67\x4c\x44\x43\x66\x7a\x39\x46\x4c\x69\x5a\x37\x43\x56\
-\x61\x62\x6d\x53\x6f\x30\x57\x6f\x55\x4e\x74\x70\x54\x68\x48\x47\
-\x56\x58\x4c\x4d\x71\x2f\x58\x43\x44\x7a\x4c\x75\x41\x57\x79\x74\
-\x41\x66\x6e\x6d\x36\x4e\x79\x71\x77\x59\x70\x20\x46\x53\x58\x6b\
-\x77\x77\x61\x6e\x33\x7a\x6b\x48\x43\x77\x4f\x68\x45\x48\x77\x35\
-\x34\x66\x31\x6d\x43\x45\x4c\x71\x4a\x61\x56\x56\x42\x66\x6d\x54\
-\x50\x6f\x52\x6c\x4b\x48\x45\x59\x69\x39\x55\x53\x74\x71\x52\x7a\
-\x4f\x4f\x76\x77\x2f\x70\x32\x37\x6d\x43\x38\x58\x73\x43\x76\x41\
-\x4f\x4b\x4b\x35\x4d\x46\x55\x4f\x20\x5a\x30\x41\x4a\x49\x74\x5a\
-\x58\x48\x77\x6b\x58\x66\x4d\x51\x75\x44\x52\x69\x41\x4d\x4c\x76\
-\x4e\x54\x37\x52\x4e\x33\x6c\x45\x79\x34\x30\x67\x51\x71\x4b\x61\
-\x4f\x38\x6b\x6d\x58\x52\x59\x35\x6c\x6b\x53\x50\x50\x31\x79\x6a\
-\x7a\x75\x6b\x71\x65\x68\x6b\x4c\x55\x4c\x61\x6f\x37\x4b\x4f\x6a\
-\x66\x31\x55\x6d\x4e\x20\x6a\x31\x6f\x37\x79\x73\x59\x75\x48\x50\
-\x2f\x55\x70\x68\x50\x5a\x39\x52\x52\x57\x43\x44\x41\x4d\x41\x6f\
-\x54\x74\x42\x57\x4d\x77\x47\x71\x45\x73\x53\x35\x53\x56\x68\x64\
-\x59\x70\x53\x75\x4f\x51\x71\x41\x7a\x4c\x74\x63\x52\x6b\x5a\x78\
-\x2b\x33\x37\x33\x36\x49\x61\x38\x65\x33\x6f\x4a\x49\x42\x49\x44\
-\x54\x36\x20\x2f\x53\x47\x55\x42\x46\x49\x4a\x5a\x43\x6b\x77\x7a\
-\x42\x4c\x63\x66\x65\x38\x36\x4a\x74\x4d\x68\x31\x76\x6b\x63\x33\
-\x33\x7a\x7a\x44\x66\x37\x37\x66\x2f\x75\x76\x30\x44\x4c\x42\x33\
-\x76\x34\x2b\x6e\x41\x48\x79\x73\x71\x6a\x4e\x5a\x51\x55\x49\x52\
-\x31\x55\x6d\x6f\x79\x48\x31\x34\x64\x4e\x53\x49\x64\x55\x4a\x20\
-\x54\x46\x48\x69\x37\x4f\x77\x31\x37\x74\x35\x35\x44\x2f\x63\x2b\
-\x65\x42\x39\x37\x4f\x37\x76\x51\x50\x6f\x65\x53\x64\x31\x4e\x6e\
-\x64\x61\x42\x66\x72\x4b\x6f\x4b\x6d\x55\x34\x67\x68\x49\x4b\x45\
-\x35\x33\x73\x42\x31\x61\x4f\x56\x65\x59\x6e\x4c\x79\x30\x74\x49\
-\x6e\x36\x6f\x58\x4e\x71\x47\x6f\x51\x6f\x4e\x44\x20\x46\x57\x52\
-\x42\x2b\x49\x42\x39\x56\x5a\x47\x4c\x59\x55\x6c\x59\x45\x6c\x2b\
-\x31\x6b\x4f\x63\x6b\x45\x4f\x78\x33\x73\x32\x6c\x66\x46\x31\x74\
-\x37\x6c\x67\x47\x67\x34\x5a\x4d\x79\x72\x58\x31\x56\x6c\x47\x48\
-\x2b\x32\x70\x6f\x77\x31\x6b\x61\x47\x59\x58\x35\x4c\x42\x63\x31\
-\x57\x4e\x44\x55\x70\x56\x4a\x31\x63\x20\x41\x4b\x42\x4f\x75\x76\
-\x61\x43\x46\x31\x42\x49\x38\x65\x50\x69\x68\x4f\x32\x31\x5a\x41\
-\x56\x56\x32\x53\x6a\x6a\x73\x46\x77\x75\x4d\x52\x6f\x4d\x6b\x53\
-\x71\x79\x76\x47\x34\x66\x33\x38\x54\x33\x6a\x78\x34\x43\x6b\x46\
-\x51\x73\x49\x44\x52\x45\x77\x76\x46\x52\x51\x71\x61\x46\x62\x6a\
-\x59\x44\x44\x63\x58\x6a\x20\x33\x6f\x4c\x6a\x64\x6e\x46\x64\x49\
-\x53\x43\x2b\x42\x38\x31\x42\x37\x66\x69\x49\x34\x78\x74\x61\x4a\
-\x71\x45\x41\x73\x79\x68\x4b\x32\x4d\x70\x43\x4a\x34\x6f\x71\x6c\
-\x77\x32\x58\x50\x6d\x30\x36\x70\x55\x33\x7a\x73\x79\x32\x41\x32\
-\x7a\x35\x62\x6d\x31\x45\x68\x2b\x4e\x34\x42\x31\x76\x44\x66\x41\
-\x6a\x61\x41\x20\x4d\x6c\x53\x38\x51\x46\x6e\x32\x39\x52\x55\x34\
-\x34\x64\x6f\x69\x72\x33\x4b\x4b\x59\x79\x73\x4e\x70\x34\x68\x36\
-\x72\x7a\x41\x61\x74\x32\x39\x2f\x6a\x50\x66\x65\x76\x34\x66\x52\
-\x5a\x41\x78\x6a\x67\x55\x46\x2f\x67\x6a\x53\x6a\x72\x42\x30\x6c\
-\x42\x4a\x49\x45\x75\x48\x48\x39\x47\x67\x37\x33\x64\x39\x42\x4c\
-\x20\x46\x56\x62\x7a\x42\x66\x37\x78\x6e\x33\x36\x44\x68\x77\x38\
-\x66\x6f\x74\x63\x62\x65\x6a\x4e\x4a\x6f\x43\x68\x7a\x4a\x46\x6b\
-\x4b\x61\x79\x73\x59\x55\x35\x45\x6d\x56\x73\x42\x6b\x50\x49\x53\
-\x77\x44\x6c\x6d\x53\x49\x70\x47\x53\x53\x4b\x57\x71\x41\x6e\x2f\
-\x7a\x71\x37\x2f\x47\x30\x63\x45\x68\x2b\x6c\x6b\x43\x20\x62\x6a\
-\x61\x6a\x74\x45\x4b\x69\x43\x4c\x45\x31\x2f\x6c\x6c\x48\x6f\x78\
-\x47\x4b\x6f\x67\x6a\x6f\x62\x57\x33\x2b\x43\x45\x69\x68\x6f\x42\
-\x51\x46\x34\x66\x4f\x38\x44\x4c\x6d\x6c\x39\x44\x6e\x58\x57\x4d\
-\x53\x38\x53\x46\x7a\x6b\x72\x44\x6e\x6e\x6f\x4c\x57\x43\x41\x53\
-\x6a\x42\x50\x71\x55\x79\x6f\x4c\x77\x73\x20\x59\x4f\x46\x43\x4d\
-\x78\x73\x62\x52\x70\x4f\x44\x37\x7a\x49\x41\x4e\x4c\x77\x41\x45\
-\x36\x57\x68\x2b\x67\x4f\x63\x72\x63\x2b\x43\x2f\x39\x61\x49\x6b\
-\x2f\x45\x30\x65\x64\x39\x51\x65\x55\x47\x79\x6f\x49\x6f\x49\x35\
-\x39\x30\x54\x38\x44\x4e\x47\x59\x41\x77\x39\x73\x79\x61\x66\x7a\
-\x78\x45\x69\x79\x51\x31\x56\x20\x34\x6e\x55\x52\x6d\x33\x38\x4e\
-\x31\x38\x50\x76\x7a\x65\x7a\x54\x78\x75\x74\x4a\x4b\x57\x2f\x6d\
-\x43\x6f\x66\x7a\x32\x51\x57\x75\x37\x52\x31\x41\x4b\x45\x41\x4c\
-\x69\x63\x50\x39\x41\x37\x79\x35\x4f\x4d\x50\x4c\x31\x36\x38\x41\
-\x35\x2f\x75\x43\x65\x4f\x79\x44\x69\x59\x77\x70\x6c\x41\x59\x41\
-\x41\x6b\x70\x71\x20\x79\x4b\x79\x6d\x39\x75\x53\x73\x4a\x67\x42\
-\x77\x31\x6b\x52\x7a\x55\x4b\x2f\x6a\x6f\x69\x6a\x71\x55\x71\x61\
-\x32\x65\x50\x41\x48\x71\x66\x43\x78\x31\x6b\x77\x57\x6f\x4f\x70\
-\x34\x53\x2b\x53\x72\x73\x51\x78\x33\x61\x62\x74\x33\x30\x59\x41\
-\x78\x32\x68\x61\x6a\x59\x57\x33\x55\x71\x59\x30\x75\x4f\x63\x65\
-\x30\x20\x41\x31\x53\x55\x44\x4b\x36\x47\x35\x46\x33\x54\x6d\x33\
-\x39\x57\x45\x45\x42\x54\x56\x67\x5a\x5a\x62\x34\x44\x4b\x4a\x72\
-\x42\x4f\x34\x37\x4f\x66\x2f\x67\x4c\x58\x6a\x6a\x2b\x41\x54\x67\
-\x59\x51\x51\x71\x4c\x66\x56\x30\x68\x53\x42\x51\x57\x48\x4e\x4a\
-\x4d\x59\x39\x42\x4f\x38\x66\x2b\x63\x36\x78\x71\x4d\x2b\x20\x68\
-\x72\x30\x4d\x54\x78\x34\x2f\x78\x4b\x39\x2f\x2f\x57\x76\x6b\x65\
-\x59\x37\x52\x59\x45\x77\x78\x54\x6d\x45\x44\x69\x52\x57\x6e\x32\
-\x32\x55\x70\x2b\x57\x44\x43\x4f\x63\x42\x59\x5a\x46\x6b\x4b\x47\
-\x49\x74\x58\x70\x36\x65\x34\x64\x75\x30\x51\x76\x2f\x6a\x35\x4c\
-\x35\x45\x6b\x43\x51\x5a\x5a\x44\x31\x54\x35\x20\x48\x7a\x47\x44\
-\x47\x78\x2f\x38\x54\x6d\x67\x79\x68\x38\x4e\x68\x33\x57\x69\x54\
-\x66\x54\x46\x58\x50\x33\x39\x4d\x7a\x31\x68\x56\x46\x5a\x78\x6c\
-\x63\x39\x52\x46\x32\x73\x38\x76\x78\x74\x59\x69\x4a\x61\x31\x4e\
-\x76\x71\x49\x54\x41\x6b\x6f\x72\x61\x43\x56\x44\x4b\x43\x4f\x76\
-\x79\x73\x43\x2b\x37\x70\x77\x4c\x20\x4e\x5a\x2b\x79\x68\x56\x41\
-\x36\x52\x37\x57\x61\x6e\x50\x76\x4b\x51\x46\x44\x37\x49\x45\x41\
-\x73\x51\x6a\x69\x64\x67\x6f\x4d\x4e\x4a\x68\x74\x2f\x4c\x30\x5a\
-\x46\x47\x38\x6b\x47\x4c\x58\x4f\x76\x79\x38\x4a\x71\x2b\x2f\x31\
-\x76\x57\x33\x32\x56\x71\x79\x43\x74\x68\x4a\x4d\x4f\x38\x2f\x6b\
-\x38\x57\x43\x50\x4f\x20\x4f\x55\x79\x48\x49\x39\x77\x2b\x4a\x69\
-\x7a\x6b\x59\x6e\x46\x42\x53\x4c\x31\x31\x4d\x4d\x37\x43\x69\x54\
-\x70\x38\x77\x6d\x4e\x67\x6a\x45\x46\x6c\x79\x73\x5a\x36\x6a\x67\
-\x75\x78\x57\x51\x67\x35\x71\x59\x49\x62\x2b\x75\x69\x61\x48\x71\
-\x48\x35\x51\x47\x48\x68\x68\x34\x77\x4b\x42\x65\x63\x45\x43\x6b\
-\x4d\x49\x20\x48\x2b\x65\x42\x32\x75\x44\x50\x59\x65\x4f\x37\x37\
-\x33\x4c\x45\x35\x69\x57\x72\x38\x48\x61\x69\x39\x53\x62\x53\x78\
-\x49\x66\x30\x42\x4a\x34\x2b\x47\x56\x77\x41\x51\x70\x71\x77\x6d\
-\x77\x70\x51\x79\x70\x6c\x7a\x45\x75\x76\x53\x49\x75\x76\x76\x6f\
-\x44\x51\x4a\x70\x70\x4d\x6a\x66\x50\x7a\x78\x7a\x7a\x45\x65\x20\
-\x37\x53\x46\x4e\x42\x31\x42\x4a\x43\x71\x55\x45\x6b\x6c\x51\x69\
-\x31\x51\x4a\x61\x41\x37\x75\x37\x45\x39\x79\x34\x76\x6f\x39\x78\
-\x50\x30\x4f\x69\x48\x4c\x37\x38\x38\x72\x2f\x6a\x48\x2f\x2f\x68\
-\x4e\x78\x69\x4e\x4a\x6c\x54\x32\x73\x69\x34\x6f\x70\x6f\x6e\x4b\
-\x4c\x78\x71\x42\x4b\x6a\x65\x68\x43\x61\x53\x57\x20\x45\x72\x31\
-\x55\x41\x31\x61\x67\x7a\x46\x66\x49\x56\x32\x76\x38\x34\x75\x65\
-\x45\x4e\x6b\x75\x48\x75\x69\x51\x6f\x79\x38\x67\x35\x35\x36\x4a\
-\x54\x79\x31\x58\x38\x6f\x73\x35\x71\x63\x53\x35\x6b\x79\x55\x68\
-\x4b\x37\x51\x6b\x6a\x77\x43\x59\x66\x62\x31\x78\x55\x52\x6b\x59\
-\x39\x4a\x47\x4c\x41\x71\x68\x36\x2f\x20\x4a\x6a\x42\x51\x32\x5a\
-\x72\x6a\x4a\x33\x51\x66\x53\x6c\x50\x50\x53\x6c\x30\x45\x49\x43\
-\x62\x4f\x69\x75\x47\x4f\x53\x63\x6f\x48\x72\x45\x55\x30\x33\x34\
-\x50\x42\x41\x49\x76\x46\x59\x6d\x50\x44\x44\x48\x50\x5a\x6c\x51\
-\x49\x6d\x4e\x59\x53\x6b\x59\x6d\x37\x75\x74\x74\x55\x4f\x58\x57\
-\x30\x4b\x59\x65\x33\x6e\x20\x78\x70\x2f\x62\x61\x70\x51\x4b\x41\
-\x6c\x61\x59\x59\x77\x66\x77\x74\x43\x34\x67\x51\x54\x52\x51\x57\
-\x4b\x30\x57\x57\x4b\x32\x58\x53\x4c\x53\x43\x72\x57\x67\x75\x39\
-\x33\x5a\x32\x38\x4e\x36\x74\x32\x33\x6a\x34\x7a\x4f\x48\x38\x38\
-\x6f\x4a\x71\x48\x4b\x33\x42\x61\x72\x55\x49\x36\x59\x44\x78\x35\
-\x71\x46\x39\x20\x67\x6a\x6b\x73\x61\x55\x4a\x54\x6c\x6b\x48\x6f\
-\x75\x4f\x55\x34\x46\x78\x6c\x49\x53\x63\x4b\x76\x61\x35\x57\x4f\
-\x6a\x5a\x32\x47\x76\x2b\x43\x63\x43\x33\x5a\x34\x6f\x4e\x38\x4c\
-\x59\x37\x6b\x70\x75\x50\x2b\x57\x49\x35\x68\x61\x45\x66\x4c\x57\
-\x4e\x6b\x48\x62\x42\x30\x30\x71\x77\x39\x58\x4d\x59\x75\x61\x4c\
-\x20\x63\x49\x55\x45\x47\x61\x77\x4b\x45\x41\x70\x41\x43\x75\x73\
-\x79\x33\x4c\x6c\x7a\x44\x37\x64\x76\x66\x34\x52\x42\x66\x34\x64\
-\x49\x67\x52\x4d\x46\x70\x53\x32\x79\x54\x43\x46\x4e\x4a\x50\x6f\
-\x44\x68\x65\x50\x72\x68\x37\x68\x32\x74\x49\x4e\x55\x43\x78\x54\
-\x4c\x47\x66\x37\x78\x6e\x2f\x38\x62\x76\x76\x7a\x39\x20\x37\x37\
-\x47\x2f\x76\x77\x39\x72\x48\x64\x62\x72\x4a\x51\x61\x44\x43\x65\
-\x61\x4c\x42\x57\x54\x43\x44\x41\x49\x57\x57\x5a\x59\x67\x30\x52\
-\x70\x56\x55\x53\x42\x4c\x4e\x55\x78\x5a\x59\x54\x47\x62\x77\x56\
-\x59\x47\x76\x2f\x77\x2f\x2f\x77\x6f\x48\x42\x77\x65\x41\x73\x5a\
-\x41\x65\x55\x65\x54\x45\x41\x39\x59\x38\x20\x50\x4c\x35\x43\x43\
-\x4a\x52\x52\x34\x39\x41\x6b\x53\x59\x6a\x32\x67\x63\x66\x48\x73\
-\x73\x39\x46\x36\x42\x72\x76\x74\x6c\x70\x72\x32\x49\x71\x54\x4a\
-\x32\x7a\x49\x45\x57\x32\x4f\x59\x31\x4f\x54\x78\x48\x4c\x53\x30\
-\x4a\x54\x2b\x75\x6f\x79\x6f\x4d\x6a\x6f\x4e\x52\x66\x6d\x6f\x7a\
-\x6a\x6c\x59\x4b\x53\x43\x4a\x20\x57\x43\x64\x63\x49\x38\x75\x49\
-\x50\x61\x30\x6f\x79\x69\x76\x6e\x4f\x35\x69\x47\x73\x6b\x59\x4e\
-\x6d\x64\x79\x33\x73\x63\x35\x61\x39\x39\x55\x2b\x78\x37\x5a\x31\
-\x30\x72\x55\x4a\x64\x42\x32\x6b\x6e\x5a\x6c\x2f\x71\x4d\x4c\x46\
-\x62\x49\x62\x52\x6f\x46\x6b\x47\x64\x62\x43\x33\x44\x2b\x74\x70\
-\x4c\x79\x37\x6d\x20\x46\x35\x34\x51\x47\x43\x68\x4e\x52\x53\x56\
-\x5a\x30\x57\x62\x48\x75\x61\x68\x56\x6b\x66\x74\x78\x71\x46\x6e\
-\x63\x71\x56\x6c\x71\x73\x31\x61\x33\x74\x43\x55\x30\x4a\x50\x57\
-\x62\x34\x49\x45\x56\x34\x65\x46\x6f\x4d\x64\x75\x77\x73\x79\x70\
-\x49\x4c\x53\x42\x4c\x75\x72\x6e\x53\x6d\x73\x35\x4a\x37\x44\x49\
-\x50\x20\x43\x43\x44\x5a\x77\x67\x51\x64\x36\x43\x53\x61\x31\x48\
-\x37\x43\x33\x30\x74\x4e\x6e\x72\x51\x35\x77\x4c\x46\x70\x42\x6d\
-\x59\x35\x45\x5a\x52\x4e\x51\x66\x48\x41\x42\x4e\x61\x6d\x4d\x44\
-\x62\x46\x65\x48\x4b\x49\x75\x2b\x39\x2f\x69\x76\x32\x44\x36\x31\
-\x42\x71\x41\x43\x6b\x54\x61\x43\x32\x52\x5a\x41\x57\x47\x20\x77\
-\x77\x52\x5a\x6c\x6d\x42\x33\x4f\x73\x4c\x4e\x57\x39\x63\x78\x47\
-\x66\x56\x52\x46\x54\x6c\x73\x73\x63\x61\x44\x48\x2b\x37\x6a\x64\
-\x37\x2f\x39\x62\x65\x69\x74\x6c\x35\x63\x35\x74\x45\x6f\x78\x6d\
-\x35\x30\x68\x79\x58\x70\x6b\x36\x69\x71\x46\x52\x50\x72\x71\x65\
-\x6d\x50\x51\x7a\x78\x49\x49\x42\x2b\x53\x72\x20\x42\x5a\x51\x41\
-\x2f\x73\x50\x66\x2f\x53\x31\x56\x65\x47\x73\x42\x6c\x56\x49\x33\
-\x6f\x6c\x58\x68\x71\x79\x41\x73\x38\x66\x42\x77\x6a\x71\x58\x31\
-\x71\x43\x36\x62\x59\x36\x56\x64\x42\x33\x62\x71\x34\x43\x64\x56\
-\x6e\x6e\x4c\x43\x57\x65\x71\x47\x37\x4f\x6f\x34\x61\x32\x33\x61\
-\x31\x62\x30\x31\x6d\x71\x5a\x62\x20\x6d\x31\x36\x69\x71\x55\x33\
-\x6a\x78\x63\x66\x6f\x4a\x67\x45\x4f\x56\x4e\x46\x43\x78\x6a\x72\
-\x58\x46\x6e\x68\x57\x50\x46\x45\x4c\x6b\x67\x54\x51\x7a\x7a\x4c\
-\x41\x6d\x31\x33\x68\x6e\x47\x46\x65\x2f\x52\x78\x47\x36\x38\x4d\
-\x34\x59\x72\x61\x54\x55\x67\x50\x4f\x65\x71\x72\x43\x78\x4a\x2f\
-\x2f\x62\x61\x6c\x6e\x20\x41\x67\x67\x42\x2f\x32\x35\x71\x79\x4d\
-\x37\x76\x43\x65\x72\x51\x5a\x53\x78\x70\x59\x67\x74\x69\x56\x7a\
-\x75\x37\x65\x49\x50\x39\x67\x31\x32\x6b\x4b\x6f\x56\x78\x78\x4f\
-\x39\x64\x57\x59\x50\x42\x61\x49\x69\x64\x6e\x52\x33\x4d\x6c\x6a\
-\x4e\x49\x53\x52\x56\x43\x52\x56\x48\x41\x56\x68\x57\x6c\x47\x76\
-\x68\x2b\x20\x6e\x4c\x50\x5a\x4c\x4b\x51\x49\x63\x70\x56\x4e\x2b\
-\x2f\x35\x6a\x76\x31\x41\x36\x43\x63\x30\x56\x30\x7a\x53\x52\x31\
-\x59\x59\x36\x72\x33\x63\x70\x43\x57\x74\x56\x59\x38\x42\x70\x35\
-\x39\x6f\x55\x72\x72\x62\x35\x2b\x43\x36\x32\x65\x58\x79\x6a\x31\
-\x6c\x4a\x52\x62\x54\x74\x64\x4b\x54\x35\x33\x41\x41\x55\x41\x20\
-\x4d\x50\x65\x4c\x46\x5a\x78\x43\x70\x4f\x43\x63\x42\x70\x44\x43\
-\x6d\x68\x52\x4a\x4d\x73\x62\x64\x4f\x35\x2f\x69\x32\x75\x45\x64\
-\x43\x4b\x57\x52\x5a\x6a\x31\x49\x43\x53\x53\x70\x77\x32\x53\x53\
-\x59\x6d\x39\x33\x68\x46\x73\x33\x6a\x6f\x6c\x69\x7a\x31\x5a\x77\
-\x74\x67\x42\x73\x67\x5a\x66\x50\x58\x2b\x43\x2f\x20\x2f\x50\x33\
-\x2f\x69\x2b\x50\x6a\x59\x31\x53\x56\x51\x65\x46\x5a\x6d\x6f\x30\
-\x31\x6e\x69\x76\x48\x65\x48\x59\x32\x34\x78\x50\x61\x67\x56\x36\
-\x61\x77\x6c\x59\x6c\x33\x72\x77\x2b\x78\x64\x48\x42\x49\x58\x37\
-\x78\x37\x33\x36\x4f\x4c\x45\x6b\x44\x57\x31\x6b\x6c\x71\x44\x2f\
-\x44\x66\x4c\x36\x6b\x6e\x58\x4b\x39\x20\x77\x73\x37\x4f\x44\x6f\
-\x36\x50\x44\x6f\x4b\x67\x53\x53\x6c\x52\x2b\x62\x6f\x32\x70\x52\
-\x51\x47\x76\x6a\x38\x44\x6f\x59\x67\x38\x70\x67\x70\x43\x56\x4c\
-\x37\x65\x6b\x56\x36\x72\x71\x67\x71\x51\x58\x4f\x2f\x6e\x51\x6d\
-\x35\x70\x54\x4e\x36\x38\x71\x54\x33\x71\x76\x6f\x65\x73\x6a\x56\
-\x6d\x44\x47\x6d\x4f\x51\x20\x4a\x67\x6c\x79\x37\x37\x2f\x45\x46\
-\x52\x4c\x53\x31\x65\x55\x35\x66\x48\x33\x32\x34\x5a\x49\x6b\x43\
-\x55\x68\x72\x6d\x4d\x50\x57\x32\x67\x6a\x7a\x44\x67\x58\x72\x79\
-\x6e\x43\x66\x38\x62\x6e\x69\x74\x64\x48\x32\x39\x57\x7a\x72\x57\
-\x65\x4c\x6a\x4b\x69\x33\x59\x2b\x41\x37\x2f\x2b\x47\x63\x74\x72\
-\x4d\x50\x4a\x20\x71\x35\x65\x59\x37\x4f\x34\x67\x30\x36\x54\x52\
-\x4c\x78\x64\x7a\x7a\x4a\x63\x4c\x72\x49\x73\x56\x56\x6a\x6c\x70\
-\x4e\x79\x72\x39\x71\x67\x42\x48\x4a\x58\x6e\x72\x39\x54\x70\x55\
-\x71\x50\x52\x36\x50\x65\x7a\x73\x37\x45\x53\x62\x59\x5a\x31\x6c\
-\x78\x68\x74\x61\x2b\x35\x36\x31\x54\x72\x49\x61\x57\x70\x57\x4f\
-\x20\x64\x6d\x5a\x48\x41\x57\x79\x69\x41\x66\x64\x63\x69\x36\x62\
-\x30\x35\x70\x4e\x43\x36\x61\x48\x34\x71\x71\x70\x72\x32\x75\x49\
-\x42\x61\x6a\x7a\x30\x46\x66\x32\x4b\x6e\x58\x4f\x68\x69\x74\x6b\
-\x5a\x67\x36\x54\x58\x41\x35\x77\x4c\x76\x51\x58\x66\x61\x5a\x41\
-\x31\x6d\x56\x39\x70\x34\x75\x6b\x50\x4b\x67\x46\x6a\x20\x4e\x5a\
-\x7a\x4c\x30\x42\x2f\x73\x34\x4f\x6a\x57\x65\x33\x6a\x7a\x2b\x67\
-\x4b\x37\x30\x32\x4d\x34\x4a\x36\x41\x46\x49\x47\x57\x42\x76\x62\
-\x30\x64\x33\x4c\x69\x78\x6a\x36\x50\x44\x45\x51\x5a\x44\x44\x51\
-\x6d\x42\x56\x4e\x4c\x4f\x4b\x71\x6f\x4b\x71\x38\x55\x53\x66\x2f\
-\x2f\x72\x58\x32\x4d\x30\x6d\x71\x43\x71\x20\x43\x46\x41\x33\x56\
-\x55\x57\x45\x54\x6b\x72\x42\x57\x74\x72\x6c\x6e\x54\x48\x6f\x70\
-\x53\x6d\x45\x4e\x56\x42\x53\x77\x42\x6d\x4c\x56\x79\x39\x66\x34\
-\x74\x36\x39\x6e\x2b\x43\x6e\x6e\x33\x34\x63\x77\x4b\x61\x79\x71\
-\x6e\x41\x35\x6d\x2b\x48\x73\x34\x68\x4c\x4c\x78\x52\x72\x47\x57\
-\x46\x68\x72\x6f\x4a\x58\x41\x20\x75\x73\x67\x78\x47\x50\x5a\x77\
-\x6d\x4f\x33\x37\x54\x6b\x67\x45\x56\x72\x41\x70\x77\x7a\x30\x51\
-\x2b\x2f\x30\x2b\x31\x68\x64\x35\x4d\x42\x50\x6a\x44\x72\x6f\x42\
-\x55\x42\x42\x31\x71\x49\x4e\x54\x79\x6e\x6a\x4d\x53\x43\x43\x61\
-\x50\x69\x4c\x7a\x61\x67\x6f\x67\x4a\x42\x4f\x59\x71\x6f\x4b\x41\
-\x67\x68\x54\x55\x20\x53\x57\x6e\x51\x47\x32\x49\x32\x6d\x38\x45\
-\x71\x41\x36\x48\x71\x2f\x46\x41\x4a\x45\x63\x69\x51\x41\x77\x64\
-\x4f\x43\x35\x30\x4d\x77\x68\x35\x38\x4f\x70\x6f\x32\x45\x6c\x6a\
-\x6a\x34\x37\x74\x6b\x65\x6c\x70\x58\x57\x77\x42\x38\x4d\x4e\x30\
-\x69\x77\x41\x31\x62\x64\x66\x41\x74\x34\x7a\x58\x53\x64\x6d\x4e\
-\x6b\x20\x39\x4c\x76\x2f\x68\x65\x35\x54\x52\x75\x5a\x67\x57\x48\
-\x73\x43\x54\x69\x59\x77\x67\x6b\x7a\x53\x72\x2b\x39\x2f\x53\x34\
-\x4c\x75\x33\x7a\x63\x74\x49\x53\x72\x79\x48\x50\x50\x35\x48\x4d\
-\x76\x6c\x45\x6a\x70\x4a\x4b\x42\x4e\x70\x73\x68\x74\x71\x45\x47\
-\x4e\x67\x69\x6a\x65\x6d\x64\x69\x49\x4b\x5a\x77\x59\x42\x20\x44\
-\x72\x6f\x73\x36\x53\x48\x7a\x76\x45\x53\x53\x70\x48\x43\x69\x41\
-\x6c\x41\x43\x7a\x74\x65\x4e\x56\x54\x46\x37\x74\x41\x30\x6d\x30\
-\x62\x62\x64\x5a\x67\x50\x63\x75\x63\x49\x73\x5a\x33\x73\x38\x6e\
-\x72\x53\x75\x38\x37\x58\x66\x34\x30\x47\x30\x6f\x50\x67\x56\x64\
-\x41\x4c\x72\x4a\x49\x70\x63\x41\x4b\x36\x48\x20\x4a\x42\x6c\x69\
-\x5a\x2f\x63\x59\x74\x32\x36\x2b\x44\x79\x63\x55\x54\x6c\x39\x53\
-\x2b\x64\x52\x77\x6c\x47\x45\x36\x37\x65\x50\x34\x35\x68\x46\x75\
-\x33\x7a\x7a\x47\x63\x4a\x51\x52\x65\x47\x4d\x72\x69\x75\x31\x5a\
-\x57\x6f\x78\x56\x57\x65\x49\x2f\x2f\x36\x66\x2f\x68\x4d\x56\x69\
-\x51\x53\x42\x4d\x6e\x6b\x4f\x49\x20\x4f\x6d\x74\x44\x4f\x67\x63\
-\x6f\x38\x75\x55\x47\x75\x67\x63\x4e\x42\x32\x63\x4a\x49\x58\x7a\
-\x34\x38\x41\x66\x38\x38\x70\x65\x2f\x78\x50\x76\x76\x33\x53\x47\
-\x77\x51\x51\x6a\x4d\x5a\x30\x75\x63\x58\x5a\x7a\x6a\x38\x6e\x4b\
-\x4f\x35\x62\x71\x67\x61\x68\x4a\x49\x4b\x43\x6b\x39\x36\x78\x38\
-\x35\x38\x5a\x57\x6a\x20\x6c\x6c\x6e\x38\x74\x4a\x54\x42\x51\x6e\
-\x36\x57\x73\x54\x62\x34\x68\x63\x49\x70\x53\x47\x6d\x49\x39\x64\
-\x52\x78\x6b\x30\x34\x66\x6c\x78\x50\x31\x47\x4c\x45\x76\x46\x2b\
-\x2f\x41\x38\x56\x68\x79\x55\x4c\x39\x72\x58\x72\x69\x72\x6c\x5a\
-\x51\x53\x56\x56\x6c\x69\x4e\x42\x72\x52\x6f\x76\x4e\x61\x4d\x7a\
-\x5a\x64\x20\x34\x33\x6e\x76\x6d\x71\x75\x32\x42\x71\x5a\x66\x4b\
-\x4e\x54\x42\x49\x61\x7a\x41\x64\x4e\x35\x78\x6e\x70\x42\x49\x48\
-\x61\x30\x46\x6a\x72\x76\x78\x34\x75\x34\x45\x67\x52\x7a\x46\x45\
-\x59\x4d\x2f\x43\x34\x53\x45\x66\x52\x47\x78\x46\x54\x68\x6a\x55\
-\x46\x6b\x42\x70\x78\x51\x56\x48\x4a\x67\x71\x30\x4b\x4d\x55\x20\
-\x52\x51\x47\x74\x4e\x56\x61\x72\x46\x53\x34\x75\x4c\x6c\x44\x36\
-\x70\x49\x5a\x2b\x6d\x6d\x46\x38\x37\x52\x72\x64\x57\x36\x53\x49\
-\x4a\x75\x4d\x4a\x64\x6e\x5a\x32\x59\x49\x7a\x42\x32\x64\x6b\x5a\
-\x58\x72\x30\x36\x62\x63\x77\x48\x33\x37\x4f\x4e\x65\x6e\x72\x6f\
-\x39\x39\x2f\x2f\x42\x50\x65\x2f\x2f\x78\x61\x39\x20\x2f\x73\x69\
-\x6e\x4d\x45\x6b\x6b\x36\x51\x42\x56\x75\x53\x4b\x7a\x69\x38\x31\
-\x50\x54\x39\x65\x67\x74\x49\x42\x4f\x50\x50\x32\x63\x59\x6b\x71\
-\x2f\x54\x56\x38\x77\x44\x4c\x72\x6c\x43\x6f\x6c\x75\x6e\x31\x42\
-\x47\x41\x39\x35\x31\x6e\x76\x59\x52\x66\x31\x59\x41\x67\x45\x70\
-\x68\x4b\x38\x44\x4b\x44\x45\x4a\x6b\x20\x36\x50\x66\x32\x63\x4f\
-\x50\x6d\x2b\x39\x6a\x66\x4f\x30\x4b\x53\x5a\x44\x68\x35\x65\x51\
-\x4a\x72\x43\x77\x79\x48\x43\x76\x66\x75\x33\x63\x48\x78\x38\x53\
-\x48\x53\x66\x67\x49\x74\x42\x55\x78\x70\x55\x5a\x59\x56\x69\x74\
-\x55\x61\x2b\x58\x71\x4a\x5a\x38\x38\x65\x59\x37\x31\x61\x34\x4f\
-\x54\x70\x59\x7a\x78\x2f\x20\x2f\x67\x77\x33\x62\x74\x38\x4b\x46\
-\x50\x42\x43\x4b\x44\x67\x68\x51\x6f\x66\x68\x66\x74\x61\x44\x68\
-\x49\x4d\x30\x46\x56\x49\x70\x73\x62\x59\x46\x6e\x6a\x77\x2b\x77\
-\x66\x2f\x39\x48\x2f\x38\x76\x37\x4f\x2f\x76\x68\x30\x56\x7a\x64\
-\x6e\x47\x42\x38\x2f\x4e\x4c\x76\x44\x6b\x2f\x52\x31\x34\x53\x38\
-\x6d\x64\x39\x20\x6a\x71\x54\x7a\x76\x70\x43\x7a\x44\x72\x6b\x76\
-\x4c\x41\x31\x2b\x72\x76\x42\x67\x69\x39\x65\x41\x38\x77\x57\x56\
-\x4d\x49\x6c\x58\x73\x52\x39\x63\x6a\x30\x6b\x77\x32\x39\x46\x63\
-\x78\x43\x77\x73\x58\x49\x49\x6d\x5a\x59\x31\x32\x41\x6f\x41\x49\
-\x4d\x53\x5a\x52\x7a\x30\x66\x4c\x62\x79\x53\x69\x4c\x6f\x6b\x73\
-\x20\x53\x5a\x43\x76\x56\x6b\x68\x47\x49\x77\x69\x76\x57\x57\x31\
-\x72\x7a\x70\x6a\x42\x72\x62\x4c\x45\x38\x36\x6f\x38\x42\x57\x48\
-\x67\x62\x64\x48\x4e\x49\x75\x4c\x4b\x4f\x6b\x39\x38\x77\x47\x69\
-\x38\x4a\x4c\x53\x30\x4a\x59\x54\x6b\x4e\x6d\x2b\x36\x4e\x62\x78\
-\x6d\x67\x76\x5a\x30\x74\x43\x61\x62\x4c\x70\x4d\x4c\x20\x2f\x6e\
-\x47\x53\x61\x67\x39\x75\x31\x61\x32\x73\x69\x59\x56\x50\x2b\x50\
-\x43\x4f\x67\x45\x6f\x54\x47\x47\x4f\x77\x6e\x4d\x39\x51\x35\x42\
-\x58\x78\x6e\x77\x6f\x4b\x46\x30\x33\x48\x45\x2b\x4b\x73\x6c\x55\
-\x42\x65\x6c\x55\x69\x53\x42\x47\x6d\x57\x42\x56\x72\x46\x76\x46\
-\x6a\x68\x37\x4f\x77\x4d\x36\x2f\x55\x36\x20\x4e\x4c\x47\x78\x31\
-\x68\x4c\x76\x72\x54\x64\x6a\x75\x66\x61\x54\x32\x65\x48\x30\x70\
-\x35\x2f\x39\x48\x4d\x5a\x4a\x50\x50\x6a\x2b\x50\x72\x4a\x30\x6a\
-\x43\x4a\x66\x65\x47\x64\x58\x45\x33\x32\x4b\x4e\x61\x43\x36\x51\
-\x51\x6e\x72\x79\x6f\x59\x6d\x66\x4e\x76\x52\x39\x4e\x2b\x36\x50\
-\x78\x4d\x4c\x56\x66\x78\x76\x20\x2b\x2f\x33\x75\x76\x77\x57\x71\
-\x79\x67\x4a\x49\x34\x46\x79\x4b\x76\x64\x31\x6a\x33\x4c\x6a\x78\
-\x41\x66\x71\x39\x43\x61\x72\x4b\x77\x72\x6b\x31\x69\x6e\x49\x42\
-\x6f\x51\x71\x6b\x50\x59\x4e\x65\x58\x2b\x44\x30\x31\x51\x6c\x65\
-\x76\x58\x71\x46\x73\x37\x4d\x4c\x76\x48\x35\x31\x6a\x75\x56\x73\
-\x36\x64\x6d\x63\x20\x69\x58\x58\x63\x75\x52\x7a\x35\x63\x6f\x48\
-\x62\x64\x36\x35\x6a\x73\x56\x69\x51\x72\x79\x63\x6c\x69\x71\x6f\
-\x49\x65\x5a\x4b\x77\x44\x6c\x56\x52\x49\x6c\x4d\x53\x67\x7a\x54\
-\x46\x63\x72\x37\x41\x66\x44\x37\x48\x66\x2f\x77\x50\x66\x34\x64\
-\x72\x78\x30\x63\x45\x76\x4b\x78\x57\x57\x42\x63\x35\x54\x6b\x35\
-\x65\x20\x59\x4a\x57\x58\x4b\x43\x70\x44\x64\x48\x73\x51\x67\x44\
-\x46\x55\x76\x41\x7a\x34\x4f\x4b\x64\x41\x57\x52\x6f\x59\x61\x36\
-\x45\x6a\x7a\x68\x77\x68\x48\x57\x42\x4a\x43\x43\x38\x75\x4c\x6f\
-\x67\x66\x55\x79\x6d\x49\x64\x2b\x78\x37\x77\x4f\x2b\x7a\x46\x71\
-\x44\x73\x6a\x53\x71\x59\x64\x7a\x48\x71\x48\x63\x34\x56\x20\x2b\
-\x66\x78\x41\x62\x51\x34\x57\x52\x52\x47\x61\x77\x33\x42\x6f\x4a\
-\x51\x6a\x79\x46\x75\x41\x73\x52\x6e\x57\x35\x42\x52\x72\x37\x66\
-\x61\x45\x59\x75\x5a\x58\x55\x48\x32\x73\x4d\x66\x6f\x59\x59\x4b\
-\x65\x31\x36\x35\x76\x69\x38\x39\x66\x33\x55\x61\x30\x39\x4b\x47\
-\x63\x49\x77\x37\x4c\x74\x70\x51\x57\x61\x76\x20\x6c\x68\x53\x4f\
-\x67\x43\x5a\x68\x6e\x36\x2b\x57\x6d\x4a\x2f\x4f\x67\x77\x42\x4e\
-\x68\x68\x4d\x63\x48\x78\x30\x68\x54\x54\x55\x4a\x6b\x72\x2b\x6e\
-\x34\x58\x43\x45\x39\x36\x34\x64\x41\x45\x4c\x67\x34\x75\x49\x43\
-\x35\x2b\x66\x6e\x56\x4c\x64\x5a\x35\x51\x45\x6c\x4a\x61\x31\x4c\
-\x31\x79\x7a\x7a\x41\x6c\x56\x56\x20\x6f\x54\x4c\x2b\x58\x2f\x38\
-\x6a\x68\x49\x42\x4f\x73\x78\x47\x2b\x2b\x50\x6d\x2f\x68\x39\x59\
-\x39\x66\x50\x58\x56\x6e\x7a\x44\x6f\x54\x62\x44\x4f\x35\x78\x54\
-\x39\x46\x77\x72\x57\x72\x57\x6d\x78\x43\x41\x66\x72\x5a\x47\x41\
-\x79\x43\x77\x44\x4e\x31\x6d\x56\x51\x48\x37\x53\x37\x62\x2f\x2f\
-\x6b\x56\x57\x62\x74\x20\x56\x56\x71\x57\x59\x70\x51\x70\x73\x6d\
-\x79\x4d\x61\x30\x65\x33\x63\x48\x68\x77\x41\x31\x4b\x6d\x4d\x4c\
-\x61\x41\x30\x67\x4b\x56\x57\x57\x4e\x32\x2b\x52\x78\x6c\x63\x59\
-\x35\x2f\x2b\x73\x33\x2f\x67\x2f\x2f\x78\x2f\x2f\x38\x47\x61\x64\
-\x70\x48\x6d\x6f\x77\x67\x6b\x43\x4c\x52\x47\x62\x4c\x42\x45\x49\
-\x6e\x57\x20\x30\x4d\x70\x41\x4a\x77\x49\x50\x48\x33\x79\x44\x39\
-\x2b\x37\x65\x67\x6b\x6f\x54\x41\x42\x61\x51\x38\x41\x46\x59\x67\
-\x4f\x4b\x53\x5a\x42\x31\x6b\x53\x69\x4c\x52\x45\x75\x64\x76\x58\
-\x6b\x4e\x59\x68\x37\x2f\x37\x75\x37\x2f\x46\x7a\x73\x35\x4f\x6f\
-\x4b\x31\x66\x72\x4a\x5a\x34\x2f\x50\x53\x45\x71\x42\x4d\x67\x20\
-\x49\x43\x42\x68\x72\x4b\x4e\x65\x43\x35\x79\x34\x72\x70\x79\x76\
-\x54\x36\x75\x72\x53\x64\x72\x50\x4b\x4b\x56\x45\x72\x39\x66\x44\
-\x61\x72\x55\x4b\x2f\x54\x62\x43\x6a\x33\x4f\x41\x36\x2b\x35\x4a\
-\x45\x5a\x2b\x44\x7a\x30\x4f\x37\x4d\x76\x74\x57\x58\x68\x73\x4b\
-\x6a\x79\x52\x37\x59\x65\x78\x43\x6f\x31\x6c\x6a\x20\x57\x45\x74\
-\x39\x42\x43\x6c\x4e\x7a\x70\x2f\x50\x30\x54\x4f\x6f\x31\x6b\x70\
-\x67\x42\x6e\x48\x32\x54\x62\x6b\x49\x6d\x59\x55\x76\x33\x4c\x50\
-\x50\x38\x6f\x47\x51\x6e\x68\x37\x53\x4e\x30\x4e\x6c\x42\x6e\x41\
-\x6e\x6f\x57\x51\x53\x4e\x46\x77\x37\x4a\x4d\x59\x4c\x50\x6c\x57\
-\x4e\x44\x4d\x78\x77\x42\x4f\x51\x58\x20\x43\x45\x6e\x39\x55\x6c\
-\x4b\x7a\x57\x4d\x49\x31\x36\x76\x6c\x61\x4c\x70\x65\x41\x49\x30\
-\x54\x7a\x61\x50\x2b\x49\x45\x69\x68\x63\x62\x63\x35\x4b\x43\x55\
-\x77\x6d\x45\x31\x79\x2f\x63\x51\x31\x35\x57\x65\x4c\x42\x67\x77\
-\x64\x59\x72\x68\x64\x31\x34\x42\x31\x6b\x2b\x52\x6c\x44\x74\x4f\
-\x73\x53\x41\x72\x50\x4c\x20\x79\x36\x44\x78\x69\x4b\x65\x31\x6d\
-\x54\x6e\x6a\x6e\x49\x50\x57\x61\x67\x43\x34\x41\x70\x39\x38\x2f\
-\x44\x50\x30\x65\x30\x50\x38\x37\x72\x66\x2f\x48\x36\x52\x53\x53\
-\x48\x53\x43\x64\x62\x36\x41\x68\x69\x49\x36\x77\x51\x69\x46\x59\
-\x78\x56\x4f\x75\x77\x6f\x39\x62\x46\x74\x59\x74\x76\x6c\x34\x32\
-\x78\x5a\x4c\x20\x37\x46\x53\x2f\x7a\x64\x66\x6b\x77\x62\x56\x4f\
-\x59\x6d\x64\x76\x46\x34\x64\x48\x74\x36\x42\x56\x48\x32\x64\x6e\
-\x62\x35\x43\x76\x4b\x36\x79\x4c\x6e\x4a\x4b\x53\x54\x51\x35\x6a\
-\x6c\x37\x41\x75\x42\x34\x52\x45\x6c\x6b\x30\x67\x52\x59\x4a\x45\
-\x39\x36\x44\x56\x41\x4e\x59\x49\x6c\x41\x57\x52\x2b\x51\x67\x4a\
-\x20\x6e\x4a\x32\x2b\x51\x57\x2f\x51\x52\x35\x59\x6c\x6d\x4d\x2f\
-\x6e\x79\x50\x6f\x70\x75\x4d\x64\x56\x6c\x76\x55\x6f\x76\x63\x77\
-\x59\x44\x41\x64\x44\x32\x4d\x70\x67\x39\x75\x59\x63\x69\x5a\x62\
-\x34\x6d\x37\x2f\x35\x4b\x34\x77\x6d\x4f\x38\x53\x32\x4a\x67\x52\
-\x6d\x69\x7a\x6d\x65\x50\x58\x2b\x4a\x32\x57\x49\x4f\x20\x72\x5a\
-\x4b\x51\x46\x32\x6d\x4d\x71\x77\x57\x51\x4d\x79\x30\x73\x41\x43\
-\x57\x44\x5a\x72\x52\x43\x51\x6f\x56\x6b\x64\x6f\x44\x52\x79\x2f\
-\x6c\x38\x6a\x75\x6e\x2b\x58\x6a\x41\x54\x70\x5a\x54\x55\x55\x4d\
-\x52\x57\x44\x51\x33\x41\x76\x68\x4a\x54\x41\x7a\x4c\x71\x43\x56\
-\x43\x43\x67\x44\x45\x75\x56\x41\x79\x77\x20\x52\x6f\x7a\x6e\x71\
-\x77\x75\x4a\x5a\x42\x59\x37\x31\x6c\x43\x39\x58\x6f\x39\x34\x65\
-\x64\x49\x30\x31\x49\x74\x32\x7a\x53\x64\x68\x44\x58\x6e\x51\x69\
-\x46\x54\x34\x48\x56\x58\x50\x61\x46\x32\x6e\x32\x62\x6e\x36\x75\
-\x2b\x31\x31\x46\x4b\x65\x76\x38\x66\x4d\x5a\x61\x38\x4c\x6e\x6a\
-\x54\x45\x51\x4f\x76\x47\x41\x20\x7a\x65\x61\x61\x69\x6b\x4d\x77\
-\x37\x43\x61\x73\x56\x69\x73\x79\x43\x7a\x31\x74\x53\x33\x38\x34\
-\x77\x4c\x57\x6a\x36\x30\x67\x55\x4a\x59\x71\x6e\x4b\x6b\x45\x76\
-\x37\x57\x48\x48\x38\x35\x66\x32\x65\x73\x52\x34\x59\x43\x7a\x31\
-\x74\x6e\x78\x2b\x2b\x68\x78\x46\x52\x61\x42\x58\x76\x49\x45\x57\
-\x52\x59\x48\x46\x20\x59\x6f\x48\x56\x63\x75\x35\x44\x4e\x4b\x4b\
-\x35\x36\x59\x67\x6d\x39\x34\x77\x51\x34\x6e\x2b\x53\x39\x71\x62\
-\x4e\x6c\x68\x7a\x48\x6c\x65\x43\x4a\x4a\x5a\x65\x37\x76\x61\x55\
-\x4b\x49\x41\x41\x52\x6c\x41\x41\x75\x6f\x71\x52\x57\x55\x79\x53\
-\x31\x74\x44\x51\x66\x78\x73\x62\x61\x5a\x71\x78\x6e\x66\x76\x4e\
-\x30\x20\x66\x2b\x33\x70\x6b\x55\x59\x62\x4e\x5a\x72\x52\x52\x67\
-\x6f\x45\x69\x45\x4b\x68\x6c\x72\x66\x63\x4e\x54\x4e\x6a\x38\x66\
-\x37\x67\x34\x5a\x47\x52\x65\x65\x38\x44\x77\x46\x61\x61\x6c\x64\
-\x56\x62\x37\x72\x73\x33\x4d\x79\x4a\x38\x4f\x2b\x35\x2b\x48\x4e\
-\x5a\x57\x4b\x79\x68\x54\x49\x77\x54\x43\x64\x33\x37\x7a\x20\x59\
-\x7a\x52\x74\x68\x62\x2f\x35\x71\x7a\x39\x48\x31\x2b\x33\x52\x74\
-\x43\x33\x69\x30\x43\x58\x79\x4b\x49\x4a\x57\x53\x64\x74\x6f\x6a\
-\x57\x57\x7a\x78\x47\x37\x59\x5a\x57\x41\x46\x6d\x41\x70\x50\x54\
-\x69\x46\x38\x41\x37\x64\x56\x58\x76\x2f\x72\x58\x6b\x51\x42\x68\
-\x39\x30\x57\x75\x39\x30\x2f\x51\x71\x73\x61\x20\x37\x57\x49\x4e\
-\x70\x51\x79\x30\x73\x6d\x67\x58\x46\x53\x4a\x56\x75\x48\x38\x59\
-\x59\x4b\x33\x42\x4d\x43\x52\x47\x38\x4b\x72\x46\x30\x45\x66\x30\
-\x63\x55\x43\x7a\x58\x43\x43\x47\x41\x55\x6f\x37\x6e\x49\x61\x49\
-\x33\x65\x45\x42\x48\x33\x2f\x38\x62\x52\x79\x37\x41\x35\x71\x32\
-\x41\x6a\x43\x4f\x57\x51\x59\x78\x20\x78\x63\x47\x71\x57\x53\x44\
-\x34\x49\x51\x6d\x67\x77\x58\x2f\x38\x58\x2f\x34\x6a\x71\x73\x71\
-\x41\x77\x45\x58\x6b\x50\x67\x62\x38\x38\x72\x50\x50\x34\x58\x78\
-\x41\x31\x62\x54\x38\x75\x52\x68\x7a\x57\x6b\x59\x6c\x59\x45\x50\
-\x78\x6d\x70\x58\x77\x64\x54\x36\x41\x71\x6b\x41\x58\x41\x56\x69\
-\x72\x4d\x79\x47\x55\x20\x4d\x51\x59\x71\x2b\x4c\x4f\x44\x6d\x6d\
-\x73\x31\x67\x54\x4d\x51\x5a\x6f\x34\x69\x6c\x70\x55\x65\x4d\x47\
-\x4e\x2f\x70\x6b\x70\x57\x4d\x58\x55\x4e\x35\x6a\x68\x4e\x4b\x5a\
-\x35\x79\x62\x4b\x32\x46\x43\x77\x46\x31\x32\x36\x4a\x33\x48\x73\
-\x50\x67\x30\x43\x34\x58\x34\x39\x2f\x46\x45\x5a\x57\x45\x69\x74\
-\x41\x47\x20\x75\x61\x6c\x59\x57\x79\x34\x75\x7a\x2b\x47\x4d\x34\
-\x75\x49\x43\x6e\x34\x76\x2f\x2f\x65\x51\x63\x6e\x41\x4e\x49\x34\
-\x37\x50\x6d\x2b\x4a\x63\x49\x49\x49\x58\x67\x49\x31\x51\x72\x2b\
-\x65\x6a\x30\x7a\x4d\x6e\x4e\x48\x37\x74\x4b\x6b\x4b\x74\x57\x51\
-\x67\x69\x5a\x55\x57\x43\x7a\x34\x56\x37\x4e\x52\x63\x4e\x6c\x20\
-\x67\x5a\x57\x75\x63\x4c\x58\x65\x34\x4a\x31\x6e\x37\x32\x4b\x7a\
-\x32\x57\x44\x5a\x63\x4d\x32\x75\x69\x77\x46\x33\x64\x33\x64\x34\
-\x38\x66\x49\x4c\x50\x42\x37\x32\x33\x4c\x77\x51\x70\x56\x4e\x46\
-\x6f\x65\x74\x4f\x32\x47\x36\x33\x42\x64\x6e\x31\x43\x4d\x4a\x6b\
-\x35\x4c\x71\x34\x50\x37\x47\x47\x4d\x58\x72\x59\x20\x64\x6c\x46\
-\x6a\x47\x41\x69\x78\x58\x53\x4b\x71\x69\x50\x66\x66\x2f\x30\x33\
-\x38\x2b\x78\x38\x44\x50\x2f\x76\x62\x76\x30\x44\x66\x48\x37\x6d\
-\x71\x52\x42\x74\x51\x47\x44\x68\x34\x70\x63\x6a\x38\x47\x37\x4b\
-\x35\x54\x77\x68\x49\x64\x6c\x64\x6e\x67\x6a\x6b\x56\x6f\x72\x46\
-\x4a\x39\x4b\x6c\x72\x6a\x70\x69\x56\x20\x42\x38\x73\x41\x43\x4c\
-\x34\x44\x56\x49\x58\x65\x6e\x52\x41\x69\x4d\x30\x50\x7a\x65\x47\
-\x37\x75\x35\x4e\x63\x71\x63\x47\x6f\x68\x4b\x6d\x58\x39\x71\x77\
-\x30\x41\x41\x43\x41\x41\x53\x55\x52\x42\x56\x48\x6a\x58\x51\x39\
-\x45\x42\x6c\x56\x6e\x44\x32\x67\x70\x2b\x4f\x45\x44\x58\x48\x6a\
-\x46\x36\x37\x41\x36\x50\x20\x57\x4b\x37\x59\x42\x54\x57\x57\x53\
-\x57\x69\x48\x59\x57\x41\x4c\x4b\x4e\x59\x67\x77\x66\x74\x33\x72\
-\x31\x37\x42\x61\x49\x33\x2f\x34\x33\x2f\x39\x33\x31\x4b\x5a\x58\
-\x65\x71\x66\x55\x77\x71\x76\x33\x74\x7a\x42\x2b\x59\x44\x4f\x44\
-\x52\x6a\x63\x71\x4b\x32\x4a\x78\x73\x49\x47\x33\x6f\x43\x69\x59\
-\x30\x4b\x4e\x20\x4e\x4f\x33\x35\x6d\x56\x56\x4b\x50\x2b\x74\x55\
-\x30\x67\x62\x6b\x4b\x62\x37\x57\x4f\x77\x79\x7a\x39\x57\x53\x6b\
-\x73\x53\x77\x4f\x35\x73\x37\x76\x4d\x6e\x33\x41\x65\x55\x43\x54\
-\x4b\x65\x50\x37\x76\x6f\x66\x56\x69\x65\x75\x6d\x61\x50\x4d\x42\
-\x70\x74\x68\x50\x53\x65\x77\x6b\x4d\x2f\x76\x57\x36\x7a\x55\x65\
-\x20\x48\x78\x38\x54\x53\x5a\x59\x2b\x32\x36\x4e\x79\x72\x2b\x54\
-\x41\x5a\x66\x6f\x2f\x72\x65\x46\x54\x4d\x68\x39\x6c\x41\x33\x64\
-\x36\x6a\x6b\x74\x31\x6f\x70\x65\x38\x4c\x44\x37\x55\x78\x41\x43\
-\x5a\x50\x72\x66\x49\x4d\x72\x36\x76\x64\x79\x37\x48\x70\x4e\x4c\
-\x74\x73\x56\x67\x73\x65\x43\x53\x65\x34\x70\x72\x64\x20\x32\x74\
-\x52\x34\x35\x35\x31\x33\x38\x4f\x37\x7a\x64\x37\x42\x5a\x72\x57\
-\x46\x4d\x42\x51\x4f\x4f\x58\x64\x2b\x2b\x66\x59\x30\x58\x58\x37\
-\x37\x45\x37\x72\x44\x6e\x78\x67\x55\x51\x44\x74\x30\x70\x38\x2f\
-\x63\x4d\x70\x32\x4e\x32\x38\x59\x30\x78\x43\x4e\x47\x64\x39\x56\
-\x65\x57\x79\x72\x62\x38\x46\x30\x4b\x41\x20\x76\x56\x70\x58\x65\
-\x50\x75\x77\x68\x36\x30\x30\x74\x4b\x38\x51\x64\x49\x56\x6e\x37\
-\x33\x30\x48\x50\x2f\x6e\x54\x4a\x66\x37\x79\x7a\x2f\x38\x62\x51\
-\x72\x2b\x48\x69\x68\x36\x42\x41\x6d\x71\x6a\x51\x64\x35\x42\x67\
-\x62\x75\x6e\x36\x37\x72\x47\x73\x65\x76\x48\x76\x6a\x45\x31\x46\
-\x68\x4c\x6e\x58\x4e\x4a\x5a\x20\x37\x65\x49\x73\x33\x6c\x4d\x4d\
-\x71\x35\x76\x55\x51\x35\x65\x4c\x58\x6a\x50\x76\x4a\x66\x6a\x72\
-\x68\x4b\x36\x4f\x57\x70\x35\x67\x4b\x34\x4d\x49\x68\x52\x67\x48\
-\x31\x4c\x57\x42\x55\x67\x4f\x38\x59\x31\x64\x72\x41\x48\x6a\x36\
-\x72\x76\x65\x6f\x71\x67\x59\x41\x34\x66\x37\x75\x43\x79\x77\x57\
-\x61\x34\x44\x65\x20\x6f\x6d\x6b\x57\x44\x4c\x49\x4d\x4b\x67\x58\
-\x54\x41\x64\x66\x50\x33\x34\x4e\x57\x7a\x4d\x44\x73\x42\x77\x64\
-\x6a\x5a\x52\x52\x34\x6c\x5a\x69\x69\x67\x52\x64\x66\x66\x41\x35\
-\x2f\x36\x76\x47\x2f\x2f\x36\x66\x2f\x68\x4b\x72\x6d\x4f\x45\x46\
-\x72\x37\x69\x71\x34\x75\x37\x76\x44\x32\x37\x74\x37\x75\x45\x6a\
-\x77\x20\x67\x62\x68\x30\x54\x68\x52\x4e\x48\x67\x73\x70\x62\x70\
-\x57\x46\x55\x73\x68\x6f\x70\x53\x54\x44\x72\x62\x56\x51\x46\x48\
-\x6b\x34\x53\x59\x7a\x77\x30\x61\x4f\x71\x44\x49\x78\x56\x71\x4a\
-\x73\x52\x61\x73\x2b\x43\x6f\x55\x77\x69\x47\x6b\x61\x4b\x71\x51\
-\x42\x4a\x4a\x52\x47\x70\x39\x4c\x36\x4a\x6b\x73\x75\x77\x20\x4d\
-\x4c\x73\x59\x51\x41\x71\x6f\x45\x76\x64\x4d\x58\x64\x65\x54\x34\
-\x61\x65\x35\x4d\x4b\x42\x73\x58\x77\x6f\x6a\x55\x73\x37\x76\x7a\
-\x59\x58\x70\x2b\x2b\x30\x4f\x37\x37\x7a\x7a\x44\x6b\x36\x6e\x55\
-\x33\x49\x35\x47\x58\x43\x6f\x36\x7a\x62\x56\x47\x37\x4d\x69\x50\
-\x70\x32\x36\x74\x41\x71\x4d\x44\x78\x68\x54\x20\x35\x61\x34\x4a\
-\x66\x6f\x30\x42\x45\x4f\x47\x38\x52\x32\x4d\x57\x49\x41\x56\x32\
-\x30\x54\x58\x78\x6b\x42\x30\x35\x4f\x34\x4a\x71\x4a\x6f\x39\x64\
-\x4b\x63\x30\x75\x65\x52\x70\x44\x46\x31\x4f\x71\x78\x68\x69\x54\
-\x52\x75\x59\x64\x63\x31\x7a\x61\x4c\x6c\x63\x77\x64\x5a\x56\x7a\
-\x74\x30\x54\x63\x5a\x2f\x69\x64\x20\x39\x37\x2b\x44\x39\x39\x39\
-\x2f\x50\x30\x2f\x73\x56\x55\x72\x44\x75\x52\x36\x76\x48\x70\x6d\
-\x65\x73\x2b\x39\x50\x36\x4e\x32\x41\x49\x58\x6a\x30\x77\x34\x44\
-\x64\x38\x59\x42\x54\x7a\x34\x79\x42\x46\x43\x4b\x76\x74\x77\x46\
-\x69\x39\x49\x6c\x5a\x67\x49\x51\x6f\x6e\x63\x4e\x61\x34\x6a\x42\
-\x47\x52\x6f\x38\x44\x20\x53\x42\x77\x37\x46\x72\x61\x75\x59\x61\
-\x2b\x75\x57\x75\x77\x50\x6d\x73\x31\x69\x58\x63\x45\x50\x41\x55\
-\x45\x5a\x72\x4e\x62\x76\x34\x44\x2f\x38\x32\x66\x2b\x4d\x76\x2f\
-\x37\x7a\x2f\x34\x72\x6a\x37\x67\x30\x57\x7a\x52\x4c\x52\x6e\x32\
-\x42\x4d\x78\x54\x54\x30\x71\x66\x49\x66\x58\x58\x2f\x6d\x66\x31\
-\x2b\x71\x20\x64\x48\x6e\x71\x79\x67\x67\x71\x35\x76\x32\x43\x4d\
-\x38\x74\x35\x77\x56\x67\x53\x70\x61\x34\x30\x42\x63\x6a\x77\x55\
-\x61\x55\x53\x64\x34\x67\x43\x67\x41\x43\x72\x41\x61\x74\x6a\x73\
-\x6f\x51\x6e\x39\x4f\x42\x5a\x45\x36\x37\x66\x38\x53\x45\x6e\x46\
-\x75\x67\x50\x50\x76\x67\x41\x6c\x65\x55\x45\x73\x72\x68\x73\x20\
-\x54\x45\x44\x4d\x58\x51\x57\x6d\x62\x6e\x42\x33\x64\x77\x66\x79\
-\x41\x54\x2f\x38\x34\x51\x2f\x52\x74\x6f\x6c\x6f\x4f\x4e\x32\x6e\
-\x63\x77\x36\x50\x44\x7a\x73\x4f\x77\x49\x6e\x7a\x77\x49\x52\x70\
-\x66\x44\x4f\x50\x66\x56\x4d\x6d\x4c\x6d\x30\x53\x73\x6f\x74\x44\
-\x69\x6d\x42\x6d\x6c\x6b\x55\x4f\x7a\x6d\x4b\x78\x20\x77\x4f\x36\
-\x77\x6e\x37\x79\x66\x49\x6d\x37\x58\x47\x6a\x39\x6e\x35\x74\x34\
-\x57\x36\x7a\x64\x58\x69\x42\x77\x6e\x42\x72\x68\x45\x6f\x4a\x74\
-\x72\x49\x47\x50\x49\x58\x7a\x2f\x6c\x49\x6e\x4c\x64\x71\x38\x66\
-\x70\x64\x4a\x6f\x70\x34\x6d\x6b\x73\x57\x69\x61\x76\x79\x2b\x64\
-\x6e\x59\x4b\x2f\x63\x32\x50\x4f\x79\x20\x73\x2f\x49\x73\x38\x64\
-\x38\x58\x52\x79\x4b\x46\x43\x58\x4b\x66\x72\x4c\x78\x56\x61\x75\
-\x31\x69\x59\x71\x75\x72\x6d\x2b\x73\x78\x68\x6b\x36\x4b\x4b\x38\
-\x61\x59\x77\x43\x51\x4e\x61\x79\x6f\x38\x66\x2f\x34\x4f\x6d\x71\
-\x62\x4e\x35\x57\x61\x76\x33\x2f\x4c\x77\x6f\x65\x50\x78\x43\x47\
-\x68\x43\x31\x33\x58\x59\x20\x6e\x2f\x59\x34\x39\x52\x31\x36\x35\
-\x2b\x43\x43\x48\x2f\x64\x53\x31\x6a\x66\x76\x63\x34\x72\x2f\x43\
-\x30\x74\x58\x56\x68\x76\x4a\x47\x6b\x73\x71\x52\x79\x6b\x46\x65\
-\x37\x56\x75\x38\x64\x6f\x43\x70\x79\x45\x31\x6e\x52\x6f\x46\x61\
-\x6c\x63\x59\x54\x68\x32\x71\x35\x54\x58\x2b\x36\x45\x2f\x2b\x44\
-\x44\x2f\x37\x20\x36\x7a\x2f\x48\x36\x79\x38\x2b\x77\x2f\x57\x36\
-\x68\x66\x4e\x48\x6d\x4b\x72\x47\x36\x58\x52\x49\x33\x51\x63\x6d\
-\x61\x33\x41\x78\x73\x66\x4d\x75\x69\x4b\x2b\x36\x73\x76\x43\x6d\
-\x66\x33\x62\x6d\x63\x76\x34\x36\x73\x61\x49\x38\x56\x46\x6b\x35\
-\x55\x74\x64\x79\x4f\x48\x51\x2b\x7a\x50\x77\x2f\x33\x36\x39\x30\
-\x20\x6d\x44\x4f\x78\x4c\x6b\x30\x4f\x6a\x68\x77\x43\x72\x54\x55\
-\x2b\x2f\x2f\x78\x7a\x56\x46\x57\x46\x48\x33\x37\x2f\x2b\x33\x6c\
-\x51\x71\x66\x7a\x65\x55\x38\x53\x70\x36\x33\x43\x2f\x66\x57\x54\
-\x30\x54\x30\x69\x42\x64\x43\x46\x77\x73\x78\x6a\x35\x54\x4d\x6e\
-\x4d\x31\x71\x6f\x45\x77\x63\x71\x44\x50\x57\x72\x72\x20\x70\x32\
-\x73\x71\x35\x2b\x74\x62\x70\x6f\x72\x6d\x76\x36\x75\x4e\x68\x59\
-\x73\x75\x37\x35\x32\x5a\x75\x36\x58\x79\x74\x79\x72\x5a\x38\x6d\
-\x4b\x4e\x70\x65\x50\x6c\x65\x44\x7a\x69\x32\x62\x50\x62\x53\x61\
-\x32\x6f\x4d\x53\x59\x33\x74\x4a\x59\x46\x36\x69\x4a\x30\x4d\x59\
-\x4a\x64\x39\x4e\x6c\x39\x63\x6e\x77\x35\x20\x52\x58\x57\x31\x31\
-\x73\x55\x68\x76\x2f\x79\x4d\x51\x6d\x64\x66\x32\x53\x5a\x62\x76\
-\x74\x56\x71\x6c\x63\x47\x79\x62\x4e\x48\x6c\x62\x77\x68\x51\x57\
-\x71\x45\x62\x54\x6e\x68\x7a\x39\x77\x62\x4e\x6f\x6f\x46\x7a\x44\
-\x70\x2f\x39\x2f\x46\x2f\x77\x73\x4c\x31\x48\x6a\x42\x48\x37\x2f\
-\x5a\x59\x72\x68\x57\x4b\x45\x20\x4a\x35\x2f\x36\x4b\x74\x6e\x4b\
-\x69\x51\x56\x48\x6b\x53\x36\x61\x57\x37\x77\x51\x41\x69\x70\x70\
-\x7a\x38\x73\x74\x5a\x33\x77\x50\x5a\x56\x57\x59\x58\x53\x78\x61\
-\x4c\x4a\x63\x74\x75\x6a\x34\x41\x70\x48\x41\x34\x4f\x6d\x68\x59\
-\x74\x6e\x68\x44\x52\x46\x55\x74\x38\x41\x63\x2f\x2b\x69\x6c\x2b\
-\x46\x6a\x7a\x65\x20\x76\x48\x36\x42\x78\x62\x4c\x47\x4d\x4a\x7a\
-\x51\x4c\x6c\x59\x59\x65\x69\x59\x65\x4f\x70\x31\x4f\x45\x79\x30\
-\x76\x41\x57\x6c\x35\x6d\x43\x34\x64\x67\x6e\x49\x52\x4c\x79\x57\
-\x67\x35\x57\x39\x79\x34\x48\x38\x42\x37\x4c\x6b\x55\x64\x35\x5a\
-\x2f\x2b\x2b\x7a\x5a\x4d\x39\x79\x6c\x63\x57\x31\x54\x6a\x55\x72\
-\x4a\x20\x6e\x65\x35\x77\x64\x58\x55\x4c\x6d\x31\x78\x50\x4b\x52\
-\x46\x6a\x6c\x34\x70\x6a\x70\x37\x75\x37\x4f\x30\x51\x66\x38\x50\
-\x32\x50\x76\x77\x73\x41\x75\x62\x32\x49\x75\x46\x45\x52\x52\x49\
-\x54\x64\x37\x70\x44\x4b\x7a\x41\x78\x69\x63\x76\x64\x51\x57\x6e\
-\x62\x4d\x37\x6a\x2f\x66\x73\x6b\x79\x42\x6d\x6e\x6f\x42\x20\x35\
-\x54\x71\x55\x58\x73\x57\x55\x36\x6e\x31\x61\x6a\x56\x4c\x2b\x54\
-\x57\x6b\x64\x30\x73\x6f\x38\x75\x62\x35\x69\x78\x62\x78\x6e\x64\
-\x30\x70\x53\x43\x36\x56\x6c\x4b\x36\x2f\x78\x50\x70\x6c\x38\x2b\
-\x58\x41\x34\x35\x50\x49\x34\x45\x57\x5a\x42\x7a\x30\x57\x5a\x69\
-\x59\x73\x34\x2f\x76\x32\x6c\x57\x49\x38\x79\x20\x65\x69\x6a\x58\
-\x76\x42\x79\x74\x2f\x4a\x2f\x76\x6a\x56\x4d\x34\x63\x72\x39\x31\
-\x78\x59\x69\x76\x64\x4b\x6a\x34\x4f\x48\x36\x2b\x78\x4f\x62\x79\
-\x6e\x67\x45\x42\x53\x6c\x6d\x38\x65\x50\x55\x46\x58\x6e\x37\x35\
-\x4a\x5a\x7a\x76\x55\x78\x31\x6f\x44\x2b\x39\x39\x6e\x6d\x2b\x52\
-\x71\x34\x72\x53\x4f\x41\x57\x6c\x20\x2b\x47\x76\x78\x46\x71\x53\
-\x42\x31\x33\x73\x50\x43\x6d\x4e\x56\x6d\x51\x78\x52\x31\x52\x79\
-\x7a\x51\x4a\x44\x63\x45\x71\x30\x6c\x49\x74\x69\x71\x4d\x72\x69\
-\x35\x76\x63\x62\x6a\x74\x6f\x4f\x4f\x51\x46\x31\x56\x47\x42\x78\
-\x42\x77\x61\x4b\x71\x4e\x45\x41\x42\x71\x42\x62\x34\x38\x55\x2f\
-\x2b\x47\x48\x2f\x39\x20\x56\x2f\x38\x58\x76\x6e\x6a\x35\x53\x31\
-\x78\x74\x6c\x6f\x6a\x4b\x77\x31\x59\x4e\x6d\x68\x69\x35\x57\x7a\
-\x77\x46\x37\x66\x4d\x57\x6c\x4c\x6c\x32\x50\x78\x4e\x45\x30\x6b\
-\x6e\x4a\x4a\x54\x4e\x4f\x71\x58\x6c\x55\x43\x57\x48\x54\x65\x49\
-\x43\x6d\x59\x49\x39\x30\x55\x55\x52\x63\x45\x6e\x52\x46\x67\x49\
-\x62\x43\x20\x31\x58\x71\x44\x68\x37\x74\x37\x52\x42\x56\x34\x74\
-\x67\x43\x4a\x70\x55\x75\x75\x48\x77\x4b\x57\x4b\x32\x36\x75\x68\
-\x65\x4b\x35\x36\x64\x5a\x59\x61\x4c\x41\x62\x2b\x76\x72\x74\x57\
-\x78\x41\x52\x76\x76\x2f\x64\x37\x34\x47\x49\x34\x58\x32\x37\x75\
-\x63\x71\x44\x50\x46\x33\x71\x47\x37\x75\x2f\x76\x2b\x66\x37\x20\
-\x42\x36\x63\x69\x34\x69\x79\x68\x4c\x72\x57\x4f\x4d\x64\x31\x2f\
-\x68\x42\x52\x2f\x54\x33\x4e\x47\x63\x6b\x43\x68\x70\x6b\x70\x49\
-\x42\x45\x58\x47\x70\x75\x55\x31\x42\x57\x76\x56\x53\x46\x50\x72\
-\x4b\x49\x63\x38\x43\x2b\x50\x38\x66\x67\x6f\x68\x46\x75\x39\x41\
-\x45\x73\x78\x6c\x2f\x65\x61\x5a\x4d\x70\x52\x31\x20\x54\x6e\x71\
-\x7a\x71\x69\x79\x4d\x34\x65\x4b\x45\x31\x57\x6f\x46\x41\x71\x39\
-\x7a\x56\x52\x76\x45\x67\x30\x63\x67\x6d\x55\x6c\x5a\x4b\x6c\x73\
-\x75\x56\x32\x4f\x33\x54\x48\x4b\x63\x63\x36\x58\x4e\x76\x70\x48\
-\x52\x56\x58\x71\x2b\x79\x77\x71\x63\x41\x4e\x54\x4e\x43\x41\x37\
-\x70\x4e\x48\x37\x50\x78\x34\x44\x6f\x20\x61\x53\x4c\x34\x41\x4b\
-\x42\x70\x7a\x47\x6e\x36\x47\x4f\x48\x38\x45\x59\x45\x38\x54\x6f\
-\x63\x4f\x2f\x63\x43\x6a\x30\x59\x52\x48\x74\x61\x34\x74\x33\x4e\
-\x41\x58\x62\x76\x6b\x59\x7a\x79\x46\x79\x42\x63\x79\x78\x36\x2f\
-\x4b\x39\x73\x50\x44\x5a\x53\x53\x34\x33\x31\x34\x30\x57\x4b\x4b\
-\x6e\x57\x6e\x4a\x4b\x4b\x20\x78\x4b\x57\x4f\x64\x68\x67\x47\x72\
-\x46\x63\x62\x31\x50\x55\x39\x6a\x6f\x63\x44\x4b\x6d\x50\x68\x58\
-\x59\x54\x72\x6a\x34\x41\x69\x65\x42\x65\x78\x33\x78\x30\x51\x2f\
-\x41\x47\x2f\x2b\x64\x46\x48\x65\x50\x50\x32\x4a\x65\x34\x66\x48\
-\x33\x42\x37\x63\x38\x56\x44\x4f\x61\x30\x5a\x34\x79\x63\x61\x67\
-\x52\x67\x35\x20\x41\x4b\x4d\x6d\x2f\x75\x5a\x70\x69\x36\x63\x73\
-\x32\x39\x6b\x47\x30\x4e\x53\x36\x7a\x64\x2b\x6a\x72\x4f\x34\x52\
-\x39\x30\x69\x70\x73\x59\x48\x57\x65\x34\x66\x6e\x7a\x39\x2f\x4a\
-\x4c\x70\x35\x6f\x4e\x65\x46\x59\x76\x62\x2b\x2f\x68\x77\x38\x42\
-\x48\x33\x2f\x38\x63\x62\x47\x41\x6e\x50\x39\x43\x4a\x47\x6a\x4c\
-\x20\x57\x76\x4c\x55\x44\x54\x67\x63\x4f\x34\x37\x46\x4b\x4b\x47\
-\x41\x65\x6d\x71\x6c\x4c\x6a\x57\x7a\x6c\x6a\x2b\x4a\x36\x76\x78\
-\x6e\x76\x46\x61\x38\x65\x64\x4a\x68\x66\x37\x58\x65\x73\x4a\x5a\
-\x58\x47\x6a\x32\x46\x72\x37\x56\x59\x30\x2f\x63\x36\x64\x33\x39\
-\x4c\x2b\x6e\x71\x62\x70\x69\x62\x6e\x53\x67\x34\x37\x20\x64\x74\
-\x6a\x4d\x50\x52\x31\x35\x50\x33\x48\x39\x5a\x4a\x36\x44\x44\x4a\
-\x73\x56\x59\x47\x53\x79\x54\x33\x69\x36\x35\x6c\x6a\x65\x39\x36\
-\x76\x32\x56\x34\x43\x2f\x38\x74\x6e\x6d\x48\x6f\x46\x59\x58\x6c\
-\x45\x6b\x5a\x57\x46\x43\x4b\x52\x67\x2b\x73\x4d\x76\x6f\x65\x34\
-\x66\x54\x73\x55\x2b\x68\x53\x38\x33\x46\x20\x36\x38\x6c\x4c\x47\
-\x6f\x59\x42\x6c\x61\x43\x33\x69\x54\x68\x4c\x4c\x42\x6b\x52\x77\
-\x51\x55\x2b\x2f\x32\x4a\x31\x75\x64\x5a\x58\x35\x66\x75\x51\x7a\
-\x35\x36\x66\x5a\x2f\x47\x45\x38\x6e\x6c\x54\x70\x6f\x58\x76\x4f\
-\x38\x52\x49\x65\x48\x6a\x59\x34\x76\x37\x68\x69\x4e\x4f\x70\x7a\
-\x34\x7a\x53\x68\x2b\x4d\x6a\x20\x4b\x68\x4d\x52\x2f\x41\x6e\x37\
-\x33\x52\x74\x73\x4e\x68\x73\x63\x54\x34\x38\x34\x48\x76\x64\x59\
-\x4c\x6c\x73\x51\x65\x41\x54\x31\x36\x58\x54\x69\x43\x61\x70\x61\
-\x35\x77\x6b\x2f\x58\x2b\x56\x2b\x6c\x69\x37\x46\x31\x4c\x30\x51\
-\x63\x71\x47\x38\x32\x6d\x66\x43\x4f\x33\x39\x39\x75\x59\x45\x36\
-\x2f\x59\x31\x4a\x20\x41\x70\x69\x4c\x6e\x71\x45\x53\x4d\x5a\x5a\
-\x48\x69\x4a\x53\x4b\x31\x41\x4c\x61\x74\x6f\x5a\x7a\x66\x51\x49\
-\x2b\x71\x71\x54\x56\x44\x36\x6e\x56\x79\x4f\x45\x33\x50\x2f\x71\
-\x49\x33\x61\x75\x32\x53\x6f\x47\x31\x7a\x59\x73\x65\x30\x69\x5a\
-\x49\x4a\x37\x6b\x50\x41\x61\x46\x49\x4f\x6a\x4e\x73\x6c\x44\x76\
-\x70\x20\x7a\x67\x35\x59\x75\x52\x37\x54\x66\x2b\x50\x7a\x47\x4b\
-\x55\x51\x41\x47\x77\x32\x6d\x7a\x79\x71\x47\x6d\x43\x42\x36\x58\
-\x30\x52\x67\x78\x45\x6a\x6c\x70\x66\x63\x64\x61\x4b\x45\x32\x42\
-\x45\x75\x39\x72\x53\x49\x43\x31\x55\x5a\x69\x35\x42\x67\x65\x55\
-\x6e\x51\x7a\x2b\x39\x52\x2b\x68\x35\x4c\x59\x61\x72\x72\x20\x47\
-\x73\x37\x33\x63\x4c\x37\x50\x77\x49\x4d\x63\x39\x6c\x45\x70\x6a\
-\x2f\x65\x69\x4e\x54\x4d\x48\x6c\x47\x35\x35\x33\x6a\x2f\x43\x5a\
-\x49\x4c\x52\x33\x43\x4a\x72\x43\x4f\x4e\x65\x53\x74\x72\x7a\x4c\
-\x39\x4e\x72\x4e\x4d\x69\x50\x5a\x30\x51\x34\x58\x6d\x52\x4e\x79\
-\x6e\x49\x78\x71\x57\x43\x78\x6c\x75\x64\x78\x20\x45\x48\x67\x6d\
-\x6f\x74\x4b\x63\x57\x2f\x54\x65\x49\x63\x61\x41\x59\x36\x4c\x78\
-\x46\x49\x73\x6d\x43\x71\x61\x79\x46\x6f\x74\x45\x72\x46\x58\x2b\
-\x58\x6a\x6f\x75\x6f\x41\x43\x6c\x4e\x5a\x7a\x30\x64\x4b\x61\x34\
-\x4e\x67\x5a\x6d\x66\x72\x41\x70\x56\x72\x54\x61\x77\x50\x37\x7a\
-\x50\x33\x32\x43\x2f\x2f\x38\x66\x20\x2f\x77\x46\x76\x33\x7a\x78\
-\x69\x47\x44\x79\x36\x49\x51\x44\x45\x77\x7a\x65\x44\x36\x31\x47\
-\x5a\x69\x4e\x4e\x78\x69\x2f\x33\x32\x4c\x62\x62\x62\x4e\x2b\x6a\
-\x37\x41\x32\x36\x75\x4e\x31\x43\x4b\x75\x5a\x4e\x6a\x69\x67\x73\
-\x6b\x44\x31\x4d\x65\x41\x4c\x6e\x70\x63\x69\x4e\x4c\x41\x53\x6f\
-\x50\x79\x61\x57\x76\x20\x30\x78\x64\x50\x67\x67\x75\x38\x69\x64\
-\x4e\x45\x4e\x49\x72\x33\x4e\x38\x5a\x67\x31\x53\x37\x79\x41\x53\
-\x72\x7a\x54\x39\x70\x77\x76\x6b\x77\x49\x6c\x45\x52\x72\x31\x6e\
-\x57\x64\x78\x6e\x45\x50\x2b\x50\x44\x44\x44\x2f\x4d\x68\x45\x2b\
-\x31\x47\x31\x6d\x44\x52\x74\x68\x4f\x72\x66\x7a\x7a\x31\x50\x4d\
-\x57\x70\x20\x47\x78\x43\x68\x55\x35\x35\x53\x38\x6e\x4c\x35\x34\
-\x53\x38\x71\x6b\x77\x44\x41\x54\x6c\x78\x52\x64\x6b\x66\x6c\x4b\
-\x59\x30\x78\x49\x4f\x65\x77\x62\x42\x64\x34\x50\x4f\x36\x78\x57\
-\x6d\x35\x41\x49\x55\x34\x4f\x56\x37\x6d\x2b\x63\x34\x4e\x37\x74\
-\x72\x5a\x71\x71\x73\x53\x53\x48\x35\x75\x2f\x4c\x36\x74\x4b\x20\
-\x2b\x4a\x44\x61\x2f\x44\x75\x4f\x7a\x63\x64\x34\x6e\x35\x49\x77\
-\x43\x48\x49\x72\x39\x5a\x61\x6c\x75\x7a\x77\x57\x45\x63\x79\x5a\
-\x31\x6d\x57\x76\x78\x2f\x52\x54\x65\x53\x37\x4b\x61\x36\x70\x73\
-\x4a\x63\x56\x7a\x4f\x53\x34\x57\x77\x53\x2b\x39\x4d\x49\x6e\x5a\
-\x2b\x72\x34\x2f\x4b\x77\x2f\x30\x33\x6b\x48\x72\x20\x38\x5a\x35\
-\x64\x45\x6a\x6f\x4e\x42\x6e\x74\x6b\x44\x38\x6f\x79\x76\x50\x4b\
-\x7a\x70\x4a\x6c\x36\x66\x70\x2f\x79\x47\x75\x45\x4f\x6b\x76\x4d\
-\x34\x6c\x73\x41\x6c\x77\x43\x6b\x53\x37\x50\x2f\x39\x35\x33\x2f\
-\x44\x42\x61\x59\x75\x49\x48\x69\x43\x69\x68\x48\x4f\x6e\x35\x68\
-\x72\x55\x67\x33\x34\x38\x75\x55\x58\x20\x32\x47\x31\x66\x77\x2f\
-\x73\x65\x79\x30\x57\x46\x35\x57\x49\x44\x43\x6a\x30\x69\x2b\x66\
-\x7a\x6d\x4a\x54\x48\x76\x4e\x37\x31\x6b\x53\x77\x4a\x77\x74\x75\
-\x6c\x43\x30\x31\x66\x47\x4e\x45\x39\x5a\x44\x68\x64\x64\x71\x6c\
-\x43\x77\x47\x59\x30\x69\x49\x6c\x41\x67\x4e\x4b\x73\x32\x44\x34\
-\x79\x4a\x6f\x4f\x52\x6d\x20\x4f\x6f\x62\x35\x6a\x77\x64\x38\x35\
-\x7a\x76\x66\x34\x54\x79\x6c\x56\x70\x7a\x59\x31\x78\x70\x66\x66\
-\x76\x6b\x6c\x44\x6f\x63\x44\x76\x76\x65\x39\x48\x30\x78\x4b\x74\
-\x59\x53\x6c\x54\x47\x75\x4e\x35\x58\x4b\x5a\x4c\x55\x55\x6b\x35\
-\x43\x45\x34\x79\x68\x70\x51\x47\x75\x63\x4d\x62\x61\x45\x55\x7a\
-\x31\x51\x45\x20\x6b\x4e\x61\x54\x59\x58\x46\x42\x62\x32\x4f\x4d\
-\x6f\x41\x4a\x41\x47\x64\x32\x76\x38\x54\x6c\x6a\x47\x42\x50\x4d\
-\x6e\x37\x31\x38\x67\x57\x65\x33\x37\x36\x42\x74\x57\x78\x79\x37\
-\x41\x35\x4e\x59\x59\x64\x71\x70\x66\x63\x6c\x31\x6e\x4c\x71\x41\
-\x63\x37\x64\x79\x32\x6d\x6b\x68\x37\x71\x56\x59\x69\x2f\x4a\x41\
-\x20\x45\x78\x48\x58\x46\x43\x63\x33\x4b\x71\x63\x6c\x55\x72\x70\
-\x4b\x41\x44\x6f\x42\x74\x32\x53\x39\x6e\x48\x4e\x51\x61\x59\x4b\
-\x78\x33\x4b\x4d\x4d\x2b\x67\x46\x78\x6d\x69\x4a\x6d\x70\x67\x61\
-\x4f\x54\x52\x65\x4c\x4a\x74\x2b\x50\x43\x41\x4b\x50\x4b\x6c\x43\
-\x63\x62\x66\x55\x70\x7a\x69\x33\x41\x33\x42\x4b\x5a\x20\x46\x32\
-\x76\x65\x48\x55\x2f\x5a\x2b\x70\x55\x43\x6d\x6f\x76\x6b\x43\x51\
-\x68\x75\x52\x49\x64\x46\x63\x4c\x4d\x58\x5a\x66\x54\x45\x49\x34\
-\x44\x6d\x6b\x58\x31\x35\x56\x46\x76\x42\x42\x69\x2f\x6e\x74\x57\
-\x53\x4c\x74\x77\x55\x71\x4b\x6e\x73\x78\x43\x64\x46\x41\x73\x50\
-\x74\x6a\x42\x34\x53\x49\x45\x4c\x6e\x53\x20\x4f\x30\x59\x50\x70\
-\x54\x79\x36\x77\x79\x4e\x65\x76\x76\x77\x56\x49\x6a\x6e\x55\x46\
-\x62\x42\x61\x74\x54\x43\x61\x51\x4e\x34\x68\x61\x6f\x4b\x6c\x61\
-\x54\x4a\x2b\x73\x56\x67\x6b\x74\x79\x79\x35\x49\x47\x46\x71\x42\
-\x65\x66\x58\x4a\x59\x45\x74\x72\x55\x46\x35\x66\x56\x31\x4d\x65\
-\x50\x47\x31\x78\x45\x32\x71\x20\x6f\x36\x38\x4f\x52\x4d\x55\x6b\
-\x72\x45\x49\x6d\x4b\x77\x76\x45\x61\x42\x35\x62\x77\x4d\x50\x68\
-\x67\x49\x38\x2b\x2b\x6f\x69\x46\x4c\x39\x48\x72\x55\x30\x68\x56\
-\x4e\x45\x71\x68\x73\x65\x50\x66\x41\x56\x77\x4b\x4e\x59\x53\x41\
-\x53\x47\x50\x38\x56\x6a\x36\x4c\x56\x4c\x4a\x63\x6a\x4e\x6e\x6b\
-\x56\x72\x39\x69\x20\x6e\x5a\x52\x53\x75\x57\x30\x49\x53\x53\x44\
-\x50\x72\x4e\x50\x2f\x77\x43\x56\x2f\x4a\x39\x4f\x46\x35\x79\x35\
-\x78\x32\x51\x49\x6b\x33\x38\x74\x61\x43\x66\x49\x6e\x51\x69\x49\
-\x78\x64\x30\x59\x6f\x6b\x2b\x66\x41\x31\x53\x4e\x53\x4d\x78\x6b\
-\x78\x4c\x2f\x4d\x6d\x6f\x6c\x7a\x45\x6b\x41\x39\x70\x38\x54\x73\
-\x41\x20\x57\x59\x43\x6d\x79\x47\x71\x4b\x7a\x38\x48\x41\x54\x74\
-\x54\x49\x36\x4b\x35\x4c\x78\x45\x71\x43\x56\x6d\x70\x4d\x65\x77\
-\x35\x46\x43\x41\x4a\x46\x37\x6f\x59\x4a\x4c\x71\x32\x48\x34\x5a\
-\x72\x70\x77\x70\x31\x57\x53\x6a\x45\x52\x6c\x71\x7a\x56\x72\x4f\
-\x71\x48\x66\x79\x34\x35\x58\x4d\x34\x42\x6c\x6d\x7a\x78\x20\x6f\
-\x71\x7a\x6d\x35\x33\x70\x75\x57\x43\x77\x46\x42\x69\x73\x6f\x65\
-\x42\x6a\x6c\x34\x49\x59\x6a\x66\x76\x58\x35\x4a\x33\x68\x38\x76\
-\x4d\x4e\x79\x56\x61\x4e\x70\x46\x4b\x70\x55\x78\x68\x57\x43\x42\
-\x31\x54\x71\x6e\x6b\x36\x63\x2f\x41\x54\x75\x50\x42\x61\x58\x74\
-\x4f\x2b\x37\x68\x48\x71\x78\x36\x31\x4f\x6b\x20\x66\x4a\x36\x30\
-\x6c\x4f\x56\x4e\x52\x75\x4b\x75\x37\x6c\x54\x57\x58\x30\x78\x4f\
-\x6c\x37\x38\x66\x4b\x65\x62\x4b\x6a\x63\x73\x43\x53\x54\x4b\x5a\
-\x52\x36\x4f\x79\x44\x57\x72\x62\x70\x4f\x6f\x4d\x6e\x7a\x66\x42\
-\x4f\x59\x66\x6c\x5a\x70\x31\x64\x42\x65\x38\x39\x44\x73\x4d\x42\
-\x44\x77\x38\x50\x2b\x49\x33\x66\x20\x2b\x48\x44\x63\x42\x4b\x67\
-\x55\x61\x49\x2b\x75\x72\x43\x79\x30\x33\x4d\x4d\x78\x6a\x52\x30\
-\x4c\x49\x57\x53\x61\x39\x68\x67\x41\x30\x6a\x46\x50\x50\x34\x4c\
-\x55\x59\x69\x4b\x68\x69\x67\x72\x4a\x50\x66\x76\x6d\x5a\x45\x54\
-\x69\x48\x56\x53\x70\x6b\x33\x74\x75\x37\x66\x4a\x72\x47\x65\x56\
-\x2f\x73\x6d\x6c\x46\x20\x78\x4b\x44\x73\x37\x68\x51\x57\x38\x33\
-\x49\x64\x78\x32\x53\x38\x79\x2f\x6d\x2f\x37\x4b\x48\x6f\x45\x56\
-\x51\x41\x6b\x67\x55\x79\x46\x5a\x53\x32\x75\x65\x56\x4a\x55\x68\
-\x62\x5a\x50\x52\x4d\x42\x79\x31\x47\x47\x4a\x50\x43\x6e\x43\x71\
-\x41\x4d\x4c\x34\x67\x6f\x65\x78\x6c\x53\x62\x43\x37\x37\x49\x45\
-\x32\x78\x20\x50\x6f\x36\x35\x53\x4b\x34\x4e\x54\x65\x38\x72\x62\
-\x6d\x4b\x52\x71\x37\x33\x55\x62\x64\x49\x55\x37\x6d\x4c\x65\x4b\
-\x77\x70\x35\x7a\x36\x55\x44\x68\x4a\x53\x47\x74\x6d\x4d\x49\x59\
-\x46\x4a\x62\x32\x7a\x4b\x46\x4d\x79\x67\x45\x56\x7a\x37\x50\x52\
-\x34\x4a\x4b\x48\x45\x37\x38\x76\x4a\x6a\x4d\x72\x4a\x43\x4b\x20\
-\x49\x65\x73\x47\x6e\x74\x41\x54\x2b\x68\x50\x75\x37\x74\x2f\x67\
-\x69\x38\x39\x2b\x69\x63\x66\x74\x57\x36\x78\x57\x44\x64\x72\x71\
-\x46\x75\x32\x79\x35\x59\x34\x45\x7a\x37\x36\x79\x31\x55\x78\x52\
-\x77\x41\x64\x4d\x5a\x2b\x68\x62\x4b\x65\x45\x32\x47\x62\x49\x72\
-\x6d\x65\x34\x6d\x33\x39\x54\x58\x58\x62\x4a\x51\x20\x6c\x33\x4e\
-\x44\x35\x36\x38\x50\x64\x4e\x36\x6e\x57\x48\x36\x62\x4f\x56\x75\
-\x67\x45\x43\x48\x6c\x56\x34\x53\x6f\x34\x69\x53\x33\x42\x41\x41\
-\x76\x58\x37\x37\x45\x68\x78\x39\x2b\x6d\x46\x6a\x51\x4b\x70\x79\
-\x4f\x66\x55\x72\x67\x6a\x34\x67\x65\x45\x57\x58\x4c\x71\x70\x4a\
-\x46\x50\x5a\x31\x4f\x44\x4d\x67\x67\x20\x56\x55\x6d\x41\x69\x57\
-\x6c\x46\x2b\x62\x44\x4c\x4d\x73\x56\x47\x52\x79\x32\x6f\x51\x49\
-\x55\x2f\x64\x57\x6d\x4e\x35\x48\x42\x49\x4c\x31\x2b\x6c\x4f\x5a\
-\x61\x6c\x63\x4e\x6d\x36\x2f\x72\x72\x58\x2f\x44\x33\x6b\x63\x4d\
-\x6a\x50\x53\x6b\x45\x63\x79\x37\x31\x6f\x34\x69\x72\x4b\x2f\x39\
-\x5a\x61\x39\x4e\x30\x78\x20\x75\x35\x54\x6e\x79\x48\x69\x70\x55\
-\x71\x66\x58\x33\x4b\x75\x52\x4e\x65\x72\x36\x48\x72\x76\x64\x4c\
-\x6c\x75\x57\x2f\x50\x6d\x4a\x56\x63\x37\x48\x6b\x62\x35\x44\x53\
-\x76\x51\x41\x5a\x43\x45\x55\x6d\x73\x48\x79\x57\x65\x55\x35\x2b\
-\x47\x78\x45\x33\x69\x73\x39\x66\x72\x5a\x51\x49\x51\x4a\x46\x30\
-\x59\x62\x52\x20\x4f\x53\x7a\x51\x57\x6d\x50\x52\x4e\x47\x4f\x2b\
-\x6d\x43\x68\x58\x77\x44\x7a\x35\x44\x32\x4f\x2b\x57\x4f\x35\x58\
-\x31\x73\x37\x2b\x2f\x4a\x39\x2b\x68\x73\x57\x79\x77\x65\x37\x2b\
-\x44\x6d\x2f\x65\x76\x49\x49\x4b\x44\x70\x57\x4f\x38\x48\x32\x50\
-\x2f\x59\x35\x67\x37\x41\x31\x72\x52\x73\x4f\x4a\x55\x55\x30\x71\
-\x20\x56\x55\x4a\x49\x59\x54\x44\x6c\x76\x72\x4b\x71\x61\x56\x43\
-\x37\x41\x61\x66\x54\x4b\x56\x75\x4c\x45\x67\x67\x6f\x6c\x31\x2b\
-\x30\x37\x76\x7a\x59\x6c\x65\x35\x47\x47\x64\x38\x49\x68\x4b\x38\
-\x76\x43\x4b\x4d\x38\x5a\x42\x6e\x2f\x4b\x41\x43\x4c\x74\x6f\x58\
-\x47\x6c\x4a\x79\x4b\x74\x62\x7a\x4a\x65\x54\x34\x41\x20\x65\x50\
-\x50\x6d\x44\x75\x2b\x2b\x2b\x78\x36\x61\x5a\x70\x48\x7a\x54\x47\
-\x33\x4c\x5a\x55\x78\x56\x4e\x5a\x33\x38\x4b\x67\x73\x50\x73\x49\
-\x41\x64\x70\x59\x59\x77\x48\x56\x34\x75\x6e\x67\x74\x67\x4c\x68\
-\x63\x6b\x37\x61\x48\x79\x2f\x51\x6b\x72\x57\x49\x53\x30\x4c\x45\
-\x30\x42\x4b\x62\x6d\x6d\x63\x64\x73\x6f\x20\x68\x41\x44\x51\x4a\
-\x6d\x44\x6f\x4b\x51\x46\x6b\x37\x2b\x43\x72\x6c\x56\x35\x65\x78\
-\x39\x6e\x42\x6e\x2f\x39\x5a\x53\x51\x76\x52\x39\x33\x32\x75\x46\
-\x42\x4a\x65\x7a\x70\x68\x65\x45\x77\x4c\x48\x38\x77\x4d\x4d\x6a\
-\x4b\x37\x67\x66\x41\x52\x7a\x78\x34\x53\x38\x50\x2b\x6b\x44\x67\
-\x54\x77\x39\x63\x72\x51\x4b\x20\x5a\x32\x75\x51\x44\x75\x79\x63\
-\x6e\x6d\x50\x38\x50\x51\x4e\x70\x6b\x6d\x65\x4d\x53\x65\x69\x7a\
-\x39\x7a\x74\x7a\x2f\x30\x53\x41\x6f\x61\x64\x6c\x63\x4f\x78\x39\
-\x55\x61\x61\x52\x68\x4c\x59\x77\x36\x5a\x34\x43\x52\x52\x41\x78\
-\x43\x2f\x70\x71\x75\x63\x6c\x34\x67\x41\x68\x54\x69\x4b\x6c\x72\
-\x52\x56\x48\x4b\x20\x41\x77\x4c\x5a\x75\x30\x6d\x6a\x41\x6b\x52\
-\x5a\x45\x6e\x48\x37\x31\x66\x69\x4d\x36\x62\x6c\x6a\x68\x50\x33\
-\x79\x69\x35\x2f\x44\x75\x52\x34\x57\x42\x47\x73\x31\x6c\x43\x58\
-\x45\x34\x45\x41\x68\x59\x48\x76\x66\x6f\x57\x34\x73\x6c\x71\x73\
-\x56\x6a\x4b\x6b\x51\x66\x45\x7a\x45\x72\x7a\x62\x4e\x6c\x75\x4d\
-\x43\x20\x62\x41\x56\x4d\x59\x67\x55\x4a\x30\x41\x56\x6c\x2b\x72\
-\x71\x72\x50\x46\x42\x7a\x68\x50\x58\x4a\x6d\x43\x39\x76\x34\x33\
-\x6e\x75\x53\x78\x5a\x5a\x65\x42\x36\x74\x72\x64\x4f\x51\x55\x72\
-\x5a\x69\x72\x59\x7a\x30\x4a\x73\x4c\x68\x32\x45\x45\x70\x68\x63\
-\x31\x6d\x4d\x32\x35\x4b\x6a\x49\x6b\x42\x47\x78\x4f\x46\x20\x41\
-\x43\x53\x6d\x62\x49\x72\x51\x78\x73\x49\x48\x50\x70\x68\x4f\x71\
-\x6a\x49\x4b\x74\x2f\x4e\x53\x63\x70\x6c\x6d\x6c\x6e\x74\x45\x4e\
-\x2b\x64\x49\x38\x66\x6d\x61\x6c\x56\x70\x33\x4b\x59\x6a\x76\x31\
-\x36\x37\x73\x4e\x37\x75\x65\x41\x72\x33\x6b\x6e\x37\x69\x2f\x59\
-\x67\x30\x46\x65\x43\x6d\x56\x71\x4b\x79\x37\x20\x57\x4a\x6b\x4d\
-\x58\x42\x56\x49\x36\x6c\x64\x5a\x37\x6b\x76\x41\x6b\x6c\x68\x55\
-\x32\x51\x4d\x41\x59\x78\x32\x6d\x47\x67\x6d\x66\x57\x50\x69\x34\
-\x54\x45\x77\x68\x57\x55\x77\x39\x4e\x76\x44\x4b\x63\x77\x47\x59\
-\x73\x4c\x51\x70\x70\x56\x43\x5a\x73\x6f\x4b\x47\x75\x46\x42\x64\
-\x61\x78\x36\x75\x57\x74\x65\x34\x20\x76\x72\x35\x4a\x77\x42\x2f\
-\x48\x69\x75\x76\x56\x69\x71\x64\x4f\x65\x78\x37\x53\x36\x73\x49\
-\x41\x59\x52\x79\x4d\x57\x52\x43\x4c\x35\x38\x42\x55\x6f\x65\x4c\
-\x43\x4f\x6c\x6a\x66\x50\x36\x43\x75\x44\x4c\x74\x58\x7a\x73\x4d\
-\x77\x39\x67\x73\x46\x35\x6e\x37\x73\x44\x6e\x74\x55\x64\x51\x32\
-\x62\x45\x43\x47\x74\x20\x62\x5a\x70\x39\x44\x6b\x51\x36\x48\x78\
-\x4d\x73\x6d\x79\x53\x4a\x38\x61\x2b\x37\x35\x68\x71\x2f\x42\x44\
-\x66\x6d\x4b\x51\x34\x41\x65\x56\x71\x77\x6e\x76\x33\x39\x2b\x4a\
-\x41\x43\x59\x53\x73\x30\x39\x61\x49\x41\x4d\x68\x67\x67\x45\x53\
-\x45\x55\x74\x2b\x5a\x77\x4f\x4f\x44\x32\x39\x6a\x59\x6a\x73\x31\
-\x56\x6c\x20\x63\x31\x42\x66\x56\x57\x4d\x63\x49\x69\x42\x4c\x61\
-\x51\x6b\x46\x39\x75\x61\x44\x49\x67\x4a\x46\x5a\x77\x64\x70\x66\
-\x74\x6a\x6d\x62\x73\x6c\x46\x53\x31\x44\x38\x58\x75\x35\x42\x76\
-\x68\x64\x4b\x2f\x42\x44\x38\x35\x50\x32\x66\x63\x6d\x66\x6e\x37\
-\x7a\x30\x4b\x50\x77\x6f\x50\x49\x33\x6b\x53\x6a\x44\x57\x63\x20\
-\x75\x55\x32\x56\x4d\x55\x79\x49\x6c\x4e\x5a\x4a\x6c\x4e\x69\x34\
-\x54\x31\x7a\x38\x72\x67\x7a\x48\x54\x6f\x4b\x73\x6a\x6e\x53\x4c\
-\x38\x78\x75\x4c\x79\x4f\x45\x79\x69\x6c\x69\x76\x75\x46\x64\x47\
-\x52\x48\x73\x6f\x52\x54\x43\x6d\x79\x6e\x45\x6f\x54\x78\x46\x6a\
-\x77\x41\x59\x71\x5a\x73\x47\x33\x6c\x6e\x6c\x52\x20\x79\x33\x57\
-\x64\x72\x33\x45\x47\x6d\x64\x4a\x39\x4f\x63\x38\x56\x4d\x54\x71\
-\x31\x55\x47\x6c\x6a\x55\x54\x55\x31\x56\x71\x73\x31\x46\x6f\x73\
-\x46\x4b\x50\x41\x69\x57\x56\x76\x68\x35\x75\x59\x47\x33\x2f\x6e\
-\x32\x74\x2f\x48\x6c\x6c\x31\x2f\x69\x39\x65\x76\x58\x69\x4e\x34\
-\x6a\x45\x75\x63\x59\x6d\x66\x35\x55\x20\x5a\x52\x52\x59\x70\x62\
-\x4d\x51\x69\x59\x76\x4b\x78\x2b\x61\x43\x74\x49\x2b\x42\x65\x57\
-\x64\x69\x44\x4e\x43\x56\x4a\x63\x51\x77\x41\x43\x71\x41\x50\x53\
-\x2b\x4f\x59\x58\x53\x69\x64\x64\x6a\x75\x48\x74\x6a\x50\x6a\x77\
-\x55\x43\x56\x68\x77\x4d\x6d\x59\x59\x6b\x57\x73\x38\x59\x4d\x79\
-\x6c\x75\x76\x6e\x53\x67\x20\x79\x75\x39\x4e\x71\x53\x56\x6d\x76\
-\x33\x76\x4b\x35\x52\x72\x39\x37\x50\x4d\x35\x43\x2b\x77\x52\x4d\
-\x4c\x49\x70\x53\x4a\x63\x55\x4a\x63\x75\x41\x7a\x70\x4a\x6a\x4a\
-\x63\x61\x59\x2b\x56\x4a\x45\x67\x35\x65\x2f\x35\x2b\x6c\x47\x59\
-\x35\x78\x6b\x44\x62\x63\x49\x41\x59\x6b\x37\x78\x48\x6e\x45\x4f\
-\x46\x71\x2b\x20\x71\x43\x37\x63\x35\x34\x56\x2f\x61\x6a\x4c\x42\
-\x71\x6a\x67\x30\x78\x45\x6c\x31\x41\x56\x61\x6b\x73\x46\x31\x72\
-\x6e\x65\x50\x4d\x65\x62\x37\x71\x33\x33\x4a\x39\x6c\x57\x57\x53\
-\x39\x5a\x66\x4b\x44\x37\x47\x49\x35\x65\x51\x68\x6f\x7a\x69\x39\
-\x59\x43\x31\x7a\x30\x4a\x61\x41\x7a\x68\x54\x77\x4b\x45\x47\x61\
-\x20\x36\x65\x64\x4d\x6c\x5a\x58\x51\x70\x72\x42\x67\x33\x64\x34\
-\x2b\x78\x32\x4b\x78\x6d\x6c\x69\x30\x63\x6c\x70\x7a\x30\x7a\x52\
-\x35\x66\x4e\x34\x45\x38\x4d\x43\x35\x67\x68\x64\x68\x42\x63\x62\
-\x63\x6f\x64\x46\x56\x2f\x70\x75\x71\x71\x6e\x42\x31\x63\x34\x32\
-\x62\x6d\x35\x76\x4d\x42\x47\x42\x53\x66\x6c\x41\x38\x20\x67\x65\
-\x56\x79\x69\x66\x65\x2f\x39\x51\x46\x75\x31\x6a\x64\x63\x4e\x53\
-\x57\x56\x4f\x46\x42\x6e\x7a\x79\x76\x76\x4b\x2b\x56\x75\x72\x4f\
-\x54\x34\x48\x67\x66\x76\x63\x4f\x70\x50\x65\x48\x74\x2f\x42\x78\
-\x75\x49\x65\x42\x52\x77\x43\x67\x65\x55\x4e\x75\x6d\x50\x32\x48\
-\x55\x79\x53\x75\x50\x2b\x37\x57\x73\x30\x20\x54\x51\x4e\x6a\x61\
-\x30\x52\x46\x30\x4d\x6f\x67\x53\x4b\x30\x6c\x43\x4b\x54\x30\x43\
-\x4b\x67\x51\x59\x49\x33\x43\x61\x74\x6b\x79\x53\x35\x57\x74\x47\
-\x58\x42\x4b\x64\x4f\x6d\x78\x45\x44\x77\x2b\x53\x41\x46\x47\x67\
-\x55\x6c\x33\x69\x5a\x6a\x71\x59\x5a\x59\x6a\x6e\x4a\x36\x61\x5a\
-\x50\x71\x6e\x4a\x77\x59\x36\x20\x46\x56\x4b\x58\x66\x4a\x50\x4c\
-\x35\x54\x4c\x44\x78\x64\x62\x71\x58\x4d\x30\x69\x77\x66\x61\x78\
-\x4f\x37\x47\x32\x49\x34\x49\x32\x46\x6d\x45\x49\x58\x43\x38\x4c\
-\x63\x4b\x43\x65\x53\x4a\x31\x35\x70\x44\x52\x33\x65\x4a\x68\x6b\
-\x44\x59\x63\x51\x4d\x49\x54\x49\x6a\x62\x76\x4b\x63\x4f\x4d\x77\
-\x31\x46\x6d\x4e\x20\x5a\x68\x42\x58\x53\x76\x45\x30\x4a\x56\x30\
-\x6f\x6b\x42\x68\x31\x62\x6d\x6f\x46\x79\x69\x4a\x6e\x65\x51\x33\
-\x47\x49\x53\x7a\x69\x4d\x71\x57\x79\x4f\x6c\x49\x36\x4e\x51\x50\
-\x37\x79\x77\x71\x73\x69\x44\x63\x42\x35\x43\x45\x35\x67\x46\x53\
-\x63\x4a\x49\x38\x69\x54\x6c\x32\x6d\x76\x4d\x7a\x5a\x4d\x78\x6d\
-\x46\x20\x4a\x42\x64\x6c\x4f\x77\x65\x7a\x57\x48\x44\x5a\x6c\x67\
-\x45\x71\x6f\x2b\x46\x64\x44\x77\x6f\x52\x7a\x32\x35\x75\x45\x58\
-\x31\x41\x63\x41\x47\x31\x72\x52\x45\x31\x38\x2b\x70\x41\x72\x4b\
-\x39\x34\x46\x54\x41\x4a\x51\x52\x39\x52\x5a\x59\x55\x49\x46\x47\
-\x43\x5a\x6c\x4c\x6c\x70\x7a\x56\x4f\x53\x74\x4f\x62\x5a\x20\x44\
-\x58\x79\x77\x46\x62\x78\x53\x55\x4a\x46\x67\x7a\x54\x69\x4b\x51\
-\x4a\x6a\x61\x4a\x43\x66\x6f\x69\x35\x49\x2b\x41\x6a\x4a\x5a\x73\
-\x69\x68\x64\x48\x77\x4f\x61\x5a\x6f\x48\x6c\x63\x70\x6e\x44\x46\
-\x50\x34\x63\x72\x73\x41\x4a\x43\x4b\x68\x55\x68\x52\x67\x69\x6e\
-\x39\x75\x6f\x63\x4c\x33\x63\x51\x48\x33\x77\x20\x49\x61\x66\x6b\
-\x34\x45\x48\x6b\x77\x62\x32\x4d\x6f\x37\x49\x32\x43\x6b\x44\x4b\
-\x45\x49\x41\x41\x30\x6b\x42\x45\x52\x4e\x64\x33\x36\x49\x36\x6e\
-\x72\x4b\x52\x75\x6e\x6a\x2f\x6a\x2b\x59\x51\x52\x61\x56\x5a\x63\
-\x4f\x74\x44\x69\x75\x72\x45\x32\x5a\x4c\x64\x68\x2f\x37\x6a\x46\
-\x31\x62\x50\x6e\x33\x4a\x61\x70\x20\x78\x37\x61\x67\x79\x61\x62\
-\x48\x41\x4a\x56\x61\x67\x79\x51\x6d\x4b\x41\x55\x4b\x34\x49\x41\
-\x35\x4a\x6d\x48\x52\x55\x4a\x6b\x43\x4c\x32\x73\x50\x50\x52\x4c\
-\x41\x58\x6b\x4c\x75\x35\x6c\x39\x4c\x37\x6b\x62\x4b\x6f\x43\x70\
-\x64\x51\x31\x65\x59\x51\x4e\x30\x53\x33\x43\x73\x39\x56\x73\x62\
-\x45\x47\x4e\x48\x33\x20\x50\x52\x5a\x74\x49\x6b\x2b\x69\x4d\x56\
-\x38\x6e\x62\x6d\x56\x45\x61\x59\x33\x54\x50\x61\x64\x44\x45\x6b\
-\x48\x6f\x2b\x34\x45\x48\x56\x74\x4c\x34\x57\x6b\x48\x42\x79\x73\
-\x4d\x73\x2f\x35\x66\x78\x6e\x71\x51\x53\x59\x6e\x4a\x6c\x6c\x46\
-\x49\x35\x66\x75\x5a\x44\x57\x6d\x68\x78\x73\x42\x55\x33\x78\x75\
-\x53\x59\x20\x34\x69\x6e\x33\x39\x5a\x49\x77\x66\x5a\x50\x58\x66\
-\x64\x56\x56\x61\x6e\x62\x4a\x44\x30\x72\x61\x49\x47\x49\x73\x35\
-\x79\x4b\x45\x53\x66\x72\x6b\x4b\x55\x74\x4e\x55\x64\x77\x79\x72\
-\x73\x36\x53\x7a\x67\x6d\x6c\x4e\x4b\x42\x43\x4e\x70\x58\x6a\x2f\
-\x6d\x75\x51\x43\x70\x50\x7a\x49\x44\x68\x4e\x57\x58\x42\x65\x20\
-\x75\x70\x39\x35\x48\x51\x76\x72\x56\x48\x34\x76\x35\x2b\x76\x36\
-\x2b\x69\x61\x48\x49\x66\x49\x65\x6e\x44\x72\x51\x32\x51\x74\x77\
-\x78\x71\x48\x53\x2f\x46\x77\x55\x43\x50\x57\x79\x78\x6d\x71\x31\
-\x77\x54\x75\x33\x7a\x2f\x48\x71\x38\x54\x55\x6f\x44\x64\x68\x56\
-\x55\x61\x48\x50\x35\x57\x33\x6a\x32\x65\x76\x37\x20\x48\x76\x76\
-\x48\x50\x55\x37\x44\x43\x5a\x6f\x30\x32\x6c\x57\x4c\x39\x57\x6f\
-\x44\x59\x7a\x57\x73\x30\x72\x43\x59\x61\x55\x79\x2b\x70\x74\x42\
-\x79\x44\x41\x47\x37\x33\x51\x37\x4e\x61\x6f\x32\x32\x58\x55\x34\
-\x71\x45\x38\x6f\x44\x6b\x52\x32\x4b\x77\x74\x4b\x31\x69\x63\x4b\
-\x39\x72\x70\x76\x55\x73\x5a\x31\x79\x20\x55\x4c\x6b\x53\x49\x33\
-\x46\x78\x71\x69\x6c\x41\x51\x37\x50\x33\x79\x73\x46\x30\x63\x56\
-\x2f\x79\x6b\x44\x46\x79\x74\x54\x30\x41\x47\x4c\x41\x6d\x64\x4c\
-\x33\x50\x6e\x43\x5a\x5a\x4b\x57\x69\x62\x79\x36\x73\x6b\x72\x33\
-\x52\x7a\x33\x56\x79\x30\x4a\x48\x49\x48\x5a\x58\x47\x30\x78\x42\
-\x32\x63\x48\x36\x55\x4a\x20\x41\x44\x57\x36\x79\x44\x6b\x79\x7a\
-\x77\x4c\x30\x56\x63\x65\x64\x51\x6d\x53\x65\x6c\x79\x4b\x67\x4c\
-\x79\x39\x64\x57\x46\x66\x35\x37\x4c\x6d\x62\x4c\x39\x63\x55\x41\
-\x4c\x6a\x77\x57\x62\x50\x33\x46\x71\x42\x41\x66\x6a\x64\x52\x65\
-\x42\x49\x62\x4a\x68\x63\x2b\x70\x6d\x63\x79\x56\x59\x56\x41\x4e\
-\x4f\x62\x75\x20\x53\x4f\x65\x59\x6b\x4b\x4a\x43\x30\x37\x51\x58\
-\x53\x37\x6c\x49\x47\x45\x31\x70\x33\x68\x71\x55\x58\x70\x65\x4d\
-\x68\x67\x4b\x79\x79\x35\x5a\x4c\x33\x70\x53\x43\x72\x68\x49\x51\
-\x34\x39\x50\x41\x55\x2b\x4c\x63\x58\x4b\x53\x49\x4e\x4f\x36\x65\
-\x67\x52\x58\x42\x45\x64\x4b\x2f\x7a\x50\x42\x65\x68\x46\x42\x31\
-\x20\x58\x61\x4e\x4a\x4b\x59\x61\x71\x71\x53\x64\x65\x56\x31\x52\
-\x49\x42\x6f\x4c\x2f\x52\x6c\x72\x48\x45\x42\x4d\x47\x4d\x41\x79\
-\x34\x58\x6d\x2b\x77\x58\x43\x37\x78\x37\x76\x76\x76\x34\x64\x58\
-\x2b\x4e\x62\x78\x4c\x54\x62\x35\x61\x6f\x61\x37\x35\x72\x45\x58\
-\x76\x45\x62\x7a\x48\x2f\x65\x4e\x6a\x39\x6c\x36\x65\x20\x33\x7a\
-\x78\x48\x57\x37\x55\x38\x6a\x6f\x33\x53\x2b\x51\x38\x42\x46\x33\
-\x6a\x69\x70\x6c\x43\x77\x55\x67\x6f\x68\x52\x6f\x41\x43\x74\x74\
-\x73\x74\x55\x30\x56\x6f\x70\x48\x6c\x38\x49\x53\x2b\x6d\x35\x68\
-\x65\x44\x45\x67\x32\x34\x42\x50\x44\x66\x2f\x76\x61\x33\x6b\x39\
-\x38\x73\x35\x57\x53\x4d\x59\x6f\x6b\x71\x20\x45\x34\x42\x45\x4c\
-\x45\x6a\x57\x59\x68\x69\x52\x79\x63\x6d\x47\x6c\x67\x65\x6f\x4f\
-\x44\x79\x69\x44\x61\x31\x69\x48\x37\x38\x37\x63\x6e\x37\x70\x2b\
-\x65\x32\x7a\x76\x4a\x6d\x61\x43\x41\x59\x4b\x7a\x6e\x74\x30\x58\
-\x5a\x63\x46\x46\x42\x69\x46\x54\x65\x49\x79\x4f\x59\x2b\x6c\x56\
-\x69\x33\x7a\x5a\x4a\x47\x34\x20\x68\x55\x76\x71\x42\x2f\x4f\x39\
-\x71\x2b\x6e\x39\x35\x55\x4d\x39\x73\x32\x42\x7a\x72\x63\x30\x48\
-\x4d\x56\x6e\x6b\x35\x4a\x36\x56\x59\x41\x77\x41\x4e\x4c\x62\x4b\
-\x47\x31\x70\x71\x39\x2f\x6c\x2b\x6c\x5a\x2f\x35\x31\x4e\x66\x5a\
-\x4d\x70\x77\x66\x67\x49\x76\x76\x56\x79\x70\x57\x61\x79\x30\x47\
-\x71\x57\x51\x70\x20\x4a\x6a\x38\x4a\x4c\x36\x73\x30\x32\x46\x35\
-\x53\x42\x76\x4b\x5a\x56\x48\x68\x63\x35\x65\x2b\x6b\x71\x36\x50\
-\x73\x50\x32\x53\x6c\x46\x2f\x50\x65\x6b\x47\x61\x72\x59\x36\x32\
-\x46\x38\x32\x4e\x46\x79\x67\x54\x34\x6f\x4c\x47\x6f\x57\x75\x35\
-\x5a\x30\x50\x74\x53\x43\x49\x57\x69\x55\x6c\x34\x33\x58\x7a\x2b\
-\x5a\x20\x35\x39\x45\x6d\x7a\x4b\x4d\x66\x4f\x67\x51\x77\x6e\x66\
-\x35\x71\x74\x63\x52\x69\x73\x59\x41\x48\x65\x77\x59\x53\x4c\x37\
-\x76\x45\x50\x64\x4e\x31\x48\x65\x71\x36\x78\x74\x58\x56\x46\x5a\
-\x62\x74\x43\x69\x46\x47\x42\x4f\x39\x52\x36\x79\x71\x6a\x75\x38\
-\x2b\x75\x62\x32\x42\x7a\x54\x59\x6f\x63\x75\x76\x6b\x6d\x20\x46\
-\x41\x48\x6e\x38\x58\x68\x45\x32\x78\x36\x77\x32\x6c\x79\x4e\x6c\
-\x6f\x6b\x41\x70\x49\x64\x58\x43\x6e\x42\x70\x55\x47\x61\x4d\x45\
-\x59\x76\x46\x49\x6d\x2b\x32\x6c\x39\x4b\x68\x6a\x43\x53\x6c\x4a\
-\x43\x65\x58\x77\x61\x65\x59\x77\x47\x54\x58\x62\x4e\x79\x6f\x36\
-\x57\x45\x67\x7a\x41\x35\x61\x75\x6e\x38\x66\x20\x41\x7a\x51\x49\
-\x53\x4c\x4d\x47\x53\x45\x56\x30\x33\x54\x45\x4c\x54\x79\x6b\x41\
-\x49\x51\x59\x63\x6a\x38\x63\x38\x4d\x53\x66\x47\x43\x4a\x55\x33\
-\x33\x55\x77\x4f\x5a\x7a\x36\x45\x63\x66\x6f\x2b\x4d\x67\x4c\x72\
-\x33\x42\x4b\x65\x48\x2b\x43\x6e\x4c\x71\x4b\x78\x75\x32\x44\x79\
-\x4d\x79\x4b\x6b\x6f\x43\x4c\x2f\x20\x44\x45\x44\x4f\x46\x64\x62\
-\x47\x50\x76\x6e\x65\x63\x36\x47\x63\x43\x2f\x33\x30\x73\x37\x2b\
-\x42\x53\x36\x70\x5a\x43\x56\x66\x46\x34\x43\x42\x72\x4c\x62\x79\
-\x31\x36\x49\x59\x42\x71\x36\x71\x47\x31\x75\x78\x64\x79\x48\x34\
-\x7a\x63\x45\x50\x4a\x47\x43\x55\x76\x49\x6a\x55\x67\x52\x6f\x55\
-\x30\x65\x7a\x48\x42\x20\x39\x66\x4a\x2f\x34\x53\x34\x43\x76\x4a\
-\x2b\x56\x72\x6d\x48\x53\x7a\x48\x71\x4b\x6d\x71\x32\x61\x59\x69\
-\x61\x7a\x69\x41\x68\x6c\x4e\x48\x77\x33\x74\x69\x6f\x5a\x59\x37\
-\x68\x61\x71\x56\x42\x77\x56\x63\x4e\x6c\x68\x69\x4a\x30\x65\x51\
-\x38\x56\x73\x67\x41\x43\x48\x41\x61\x52\x56\x72\x6e\x6a\x58\x61\
-\x59\x54\x20\x5a\x38\x38\x74\x65\x53\x46\x64\x31\x79\x55\x55\x6d\
-\x4e\x2b\x6a\x37\x33\x74\x45\x7a\x79\x6d\x39\x72\x75\x74\x77\x50\
-\x42\x35\x42\x49\x57\x4b\x78\x57\x4f\x48\x6d\x36\x6a\x61\x37\x37\
-\x2b\x51\x4a\x57\x76\x4d\x73\x46\x30\x35\x31\x58\x4f\x48\x36\x69\
-\x75\x55\x6f\x54\x2b\x71\x39\x36\x4c\x2b\x54\x41\x41\x6f\x57\x20\
-\x6e\x68\x6a\x47\x5a\x6a\x37\x4f\x4a\x53\x77\x41\x62\x57\x77\x6d\
-\x75\x70\x47\x72\x4c\x41\x32\x71\x36\x33\x70\x45\x31\x4f\x4c\x49\
-\x41\x61\x4b\x31\x7a\x6b\x32\x4f\x77\x4b\x78\x71\x6f\x79\x67\x7a\
-\x65\x6a\x4b\x6d\x4b\x48\x35\x75\x72\x51\x7a\x34\x4b\x49\x64\x47\
-\x73\x69\x43\x64\x2b\x67\x36\x44\x64\x78\x6c\x4e\x20\x56\x41\x6c\
-\x38\x51\x69\x51\x4d\x70\x77\x37\x31\x38\x2b\x64\x6a\x62\x4b\x6c\
-\x55\x42\x6b\x33\x4b\x76\x42\x31\x55\x71\x70\x62\x48\x61\x4c\x57\
-\x56\x55\x6a\x6d\x4e\x4d\x62\x65\x45\x59\x73\x48\x4c\x64\x5a\x32\
-\x36\x6a\x33\x4e\x72\x4b\x4b\x38\x72\x45\x4d\x6e\x5a\x38\x2f\x4c\
-\x7a\x70\x61\x54\x34\x4d\x4c\x62\x6e\x20\x78\x4a\x6d\x72\x64\x63\
-\x6d\x36\x66\x74\x50\x72\x55\x69\x78\x35\x36\x54\x57\x69\x31\x4f\
-\x71\x36\x78\x76\x46\x34\x52\x41\x67\x6a\x4d\x69\x36\x75\x6d\x33\
-\x50\x44\x78\x49\x4c\x79\x33\x38\x33\x66\x2b\x2b\x6c\x37\x7a\x48\
-\x45\x5a\x78\x6a\x68\x55\x51\x43\x45\x57\x41\x71\x37\x39\x46\x4b\
-\x53\x30\x74\x49\x54\x79\x20\x74\x5a\x51\x58\x56\x6b\x30\x39\x71\
-\x5a\x43\x5a\x65\x79\x4e\x6c\x63\x66\x62\x6b\x7a\x4b\x58\x37\x5a\
-\x71\x56\x58\x59\x34\x67\x44\x54\x50\x6f\x2b\x67\x68\x43\x47\x41\
-\x51\x38\x50\x44\x2b\x69\x50\x4a\x32\x7a\x33\x50\x4f\x76\x45\x47\
-\x49\x4f\x72\x39\x59\x59\x42\x48\x73\x56\x43\x43\x77\x49\x33\x2b\
-\x6c\x61\x73\x20\x43\x4b\x34\x32\x6a\x4c\x79\x65\x6a\x6b\x65\x38\
-\x65\x76\x55\x4b\x78\x2b\x4d\x65\x6c\x69\x6a\x4d\x46\x6b\x41\x36\
-\x31\x74\x50\x41\x6a\x2b\x51\x61\x53\x61\x49\x36\x68\x49\x44\x39\
-\x66\x6f\x2f\x31\x65\x6f\x30\x36\x48\x57\x79\x6c\x4e\x59\x4c\x7a\
-\x75\x56\x46\x53\x6b\x70\x75\x56\x62\x55\x41\x45\x68\x4f\x4b\x41\
-\x20\x53\x55\x65\x32\x50\x43\x69\x50\x48\x53\x34\x4f\x54\x30\x67\
-\x75\x63\x4d\x71\x78\x35\x49\x56\x4c\x66\x7a\x49\x66\x78\x79\x55\
-\x44\x4f\x32\x42\x6b\x2f\x44\x4f\x67\x55\x31\x44\x73\x76\x63\x64\
-\x2b\x76\x30\x58\x64\x56\x68\x50\x33\x52\x6a\x35\x72\x67\x72\x36\
-\x57\x77\x58\x74\x36\x54\x59\x77\x52\x30\x4b\x4f\x37\x20\x6e\x4a\
-\x6e\x67\x46\x4e\x4d\x68\x75\x71\x49\x43\x49\x69\x75\x55\x68\x44\
-\x59\x4b\x74\x30\x6e\x65\x62\x49\x46\x61\x5a\x76\x44\x38\x65\x61\
-\x4c\x2b\x2f\x4f\x4c\x6e\x35\x2f\x74\x31\x7a\x73\x45\x30\x59\x37\
-\x4a\x38\x66\x6f\x41\x45\x36\x44\x6d\x72\x66\x4a\x45\x69\x67\x70\
-\x6e\x6c\x4c\x59\x57\x74\x42\x44\x48\x6b\x20\x65\x33\x48\x54\x78\
-\x44\x4a\x49\x30\x36\x70\x59\x6e\x37\x4b\x49\x6d\x30\x75\x36\x46\
-\x50\x72\x68\x42\x47\x4f\x6e\x6c\x6b\x33\x2b\x35\x38\x36\x50\x6d\
-\x44\x4a\x6e\x78\x41\x55\x66\x78\x4b\x58\x79\x6b\x59\x63\x7a\x5a\
-\x6b\x39\x44\x33\x50\x37\x4b\x31\x6c\x69\x75\x56\x77\x7a\x79\x4a\
-\x51\x59\x39\x4b\x55\x64\x54\x20\x69\x77\x57\x33\x4b\x49\x57\x41\
-\x53\x6d\x76\x59\x78\x4b\x5a\x57\x31\x33\x57\x32\x66\x4a\x50\x31\
-\x4b\x64\x42\x52\x51\x65\x66\x54\x43\x77\x41\x6f\x42\x45\x4a\x43\
-\x73\x58\x6d\x43\x6c\x55\x6e\x6a\x77\x76\x6d\x66\x77\x74\x33\x64\
-\x48\x59\x5a\x68\x79\x41\x4e\x69\x75\x75\x36\x49\x52\x62\x33\x41\
-\x7a\x57\x59\x63\x20\x68\x30\x61\x55\x4a\x6c\x59\x5a\x67\x38\x56\
-\x69\x68\x64\x57\x4b\x2f\x78\x45\x52\x48\x68\x34\x65\x38\x4d\x58\
-\x4c\x7a\x2f\x4f\x4d\x6b\x34\x41\x69\x4a\x68\x77\x33\x52\x6a\x46\
-\x33\x43\x68\x4b\x63\x48\x42\x56\x50\x43\x39\x49\x57\x74\x6d\x6f\
-\x41\x4b\x42\x78\x32\x75\x39\x7a\x4f\x59\x78\x58\x7a\x62\x6b\x59\
-\x31\x20\x56\x6a\x4d\x30\x54\x59\x4e\x59\x49\x52\x65\x38\x43\x67\
-\x54\x4f\x4f\x63\x61\x70\x30\x49\x39\x6f\x56\x39\x6e\x4b\x55\x37\
-\x67\x46\x73\x35\x2b\x58\x68\x77\x55\x59\x4b\x63\x70\x6c\x4d\x45\
-\x6d\x49\x50\x41\x65\x63\x61\x53\x62\x59\x37\x5a\x53\x57\x47\x32\
-\x73\x74\x6f\x37\x64\x4b\x77\x2b\x66\x6e\x5a\x59\x36\x58\x20\x53\
-\x35\x70\x66\x74\x44\x45\x58\x38\x49\x37\x49\x71\x4c\x5a\x6d\x51\
-\x6c\x2b\x58\x42\x65\x57\x43\x45\x49\x30\x57\x38\x72\x77\x32\x73\
-\x6e\x79\x4f\x70\x34\x51\x77\x7a\x6a\x79\x47\x47\x43\x4f\x71\x57\
-\x62\x48\x77\x70\x65\x76\x53\x65\x34\x6c\x46\x2f\x58\x55\x75\x57\
-\x54\x63\x52\x74\x6c\x4a\x78\x73\x52\x41\x36\x20\x57\x43\x75\x31\
-\x6f\x77\x62\x61\x6a\x4a\x53\x58\x6e\x45\x34\x53\x46\x2f\x37\x38\
-\x58\x70\x35\x53\x42\x76\x50\x37\x46\x34\x45\x55\x77\x59\x6f\x78\
-\x59\x72\x2f\x66\x70\x2f\x6d\x48\x79\x50\x45\x59\x39\x34\x63\x75\
-\x78\x32\x6c\x4c\x68\x64\x44\x4e\x6c\x63\x48\x34\x4f\x31\x46\x79\
-\x35\x35\x63\x69\x67\x45\x4a\x41\x20\x31\x4e\x77\x6b\x37\x6d\x4c\
-\x45\x2f\x64\x73\x58\x38\x4e\x35\x6a\x75\x56\x78\x69\x73\x39\x6c\
-\x67\x30\x54\x77\x72\x58\x47\x67\x48\x44\x59\x50\x6c\x71\x73\x58\
-\x74\x37\x53\x32\x6e\x79\x4f\x6f\x47\x75\x39\x30\x4f\x62\x39\x36\
-\x38\x77\x65\x50\x6a\x66\x55\x35\x4e\x61\x41\x30\x4d\x77\x53\x47\
-\x51\x67\x38\x32\x57\x20\x4b\x30\x74\x78\x6b\x56\x53\x4d\x76\x4f\
-\x6e\x74\x59\x73\x6c\x35\x6e\x52\x68\x68\x62\x51\x56\x6c\x44\x42\
-\x34\x65\x48\x76\x44\x38\x2b\x58\x50\x41\x52\x6f\x52\x45\x6f\x72\
-\x54\x66\x37\x33\x46\x7a\x65\x35\x57\x5a\x70\x6a\x4b\x41\x41\x4c\
-\x43\x47\x69\x77\x79\x39\x54\x7a\x58\x6b\x39\x45\x44\x47\x68\x48\
-\x4b\x56\x20\x6c\x52\x53\x54\x7a\x55\x6e\x56\x2f\x75\x49\x36\x61\
-\x70\x31\x6f\x79\x46\x4e\x6a\x70\x6e\x42\x39\x68\x75\x41\x51\x45\
-\x4c\x41\x2f\x48\x6e\x42\x31\x64\x63\x56\x73\x30\x4e\x46\x78\x72\
-\x6a\x49\x79\x31\x36\x6e\x4e\x7a\x47\x49\x52\x52\x4a\x72\x52\x77\
-\x4d\x4a\x36\x61\x62\x46\x38\x78\x73\x49\x59\x43\x32\x73\x71\x20\
-\x47\x47\x4d\x42\x55\x6a\x67\x64\x32\x53\x32\x53\x62\x76\x72\x35\
-\x6f\x64\x65\x55\x34\x6b\x69\x6f\x35\x41\x62\x54\x4a\x50\x67\x58\
-\x35\x69\x35\x65\x38\x37\x45\x74\x6a\x43\x33\x32\x43\x43\x35\x49\
-\x48\x78\x32\x53\x69\x2b\x57\x63\x77\x30\x4c\x65\x6f\x36\x69\x70\
-\x6c\x4f\x34\x4d\x57\x62\x66\x79\x45\x4a\x61\x48\x20\x4c\x31\x74\
-\x71\x73\x59\x68\x46\x4c\x46\x59\x4b\x75\x31\x77\x43\x58\x4a\x56\
-\x75\x6e\x77\x67\x69\x33\x77\x2b\x37\x35\x4d\x76\x6c\x41\x72\x62\
-\x53\x47\x4a\x78\x44\x49\x41\x2b\x74\x62\x4f\x4c\x54\x41\x5a\x71\
-\x6d\x77\x66\x5a\x78\x44\x36\x43\x6f\x34\x55\x53\x45\x31\x6d\x4f\
-\x6e\x76\x39\x79\x44\x6e\x4d\x64\x68\x20\x34\x50\x6b\x66\x59\x6d\
-\x32\x5a\x69\x4c\x6c\x68\x37\x77\x4d\x4b\x6d\x35\x74\x72\x56\x46\
-\x30\x48\x41\x36\x62\x2b\x32\x4f\x2b\x5a\x42\x6c\x4a\x4b\x36\x6f\
-\x53\x2b\x55\x4a\x34\x70\x7a\x4a\x52\x67\x42\x6e\x47\x69\x41\x44\
-\x73\x70\x62\x34\x32\x55\x72\x39\x57\x47\x50\x54\x46\x69\x39\x76\
-\x50\x74\x63\x51\x75\x72\x20\x44\x56\x59\x72\x64\x6a\x65\x72\x75\
-\x75\x62\x61\x31\x74\x52\x74\x30\x62\x59\x74\x46\x75\x73\x46\x31\
-\x75\x73\x72\x4c\x42\x59\x4e\x53\x4c\x47\x58\x39\x73\x74\x50\x50\
-\x2b\x46\x5a\x68\x6e\x30\x48\x49\x41\x49\x47\x63\x4a\x36\x52\x2b\
-\x57\x37\x6f\x63\x4f\x79\x50\x73\x48\x4b\x6a\x76\x46\x6b\x61\x4b\
-\x68\x45\x79\x20\x55\x4f\x41\x34\x71\x57\x70\x61\x54\x72\x6a\x6e\
-\x34\x7a\x6f\x75\x44\x4b\x4f\x50\x74\x77\x7a\x61\x6e\x45\x36\x5a\
-\x71\x36\x57\x71\x4b\x67\x7a\x39\x32\x4a\x57\x64\x48\x2f\x71\x43\
-\x52\x6e\x7a\x71\x65\x67\x6f\x34\x47\x4e\x32\x2f\x61\x57\x78\x52\
-\x75\x6c\x4b\x6b\x46\x47\x54\x47\x67\x64\x41\x59\x35\x4e\x2b\x6c\
-\x20\x2b\x78\x66\x35\x6d\x38\x64\x76\x34\x69\x4c\x4f\x4c\x5a\x4f\
-\x73\x45\x66\x76\x35\x6c\x4f\x6e\x38\x79\x70\x7a\x71\x70\x58\x75\
-\x66\x41\x77\x36\x58\x34\x70\x66\x53\x70\x63\x33\x66\x46\x79\x6b\
-\x4c\x63\x5a\x46\x5a\x38\x4d\x37\x62\x63\x65\x5a\x2f\x2f\x30\x32\
-\x76\x75\x58\x55\x6f\x31\x2f\x44\x72\x4c\x4c\x52\x63\x20\x37\x41\
-\x30\x51\x6c\x69\x74\x4f\x64\x48\x63\x44\x6b\x33\x36\x5a\x71\x6f\
-\x4b\x31\x4e\x57\x4a\x6b\x6e\x71\x4b\x36\x35\x6c\x4a\x42\x69\x65\
-\x6c\x30\x47\x71\x31\x51\x46\x69\x75\x55\x39\x7a\x56\x66\x4e\x35\
-\x6e\x2f\x72\x71\x75\x78\x6a\x61\x79\x71\x4b\x69\x42\x34\x52\x69\
-\x67\x39\x6a\x7a\x41\x54\x77\x69\x6b\x4a\x20\x6e\x62\x4a\x79\x55\
-\x65\x65\x66\x49\x52\x64\x37\x55\x75\x4c\x78\x59\x49\x7a\x35\x68\
-\x77\x45\x55\x67\x45\x58\x64\x34\x4f\x62\x71\x47\x75\x76\x31\x47\
-\x6d\x33\x4e\x78\x4d\x52\x74\x32\x36\x4a\x74\x57\x7a\x79\x2f\x75\
-\x6b\x56\x54\x31\x57\x67\x57\x58\x48\x58\x6c\x49\x6e\x66\x57\x76\
-\x48\x37\x7a\x43\x71\x39\x65\x20\x76\x55\x54\x76\x42\x6a\x6a\x48\
-\x35\x4e\x49\x68\x4d\x43\x70\x2f\x37\x44\x68\x5a\x37\x31\x49\x48\
-\x69\x42\x57\x4b\x50\x67\x42\x51\x30\x47\x77\x42\x41\x36\x43\x55\
-\x67\x54\x55\x56\x4b\x6c\x75\x7a\x39\x67\x65\x7a\x55\x79\x46\x70\
-\x51\x6e\x48\x31\x46\x71\x6e\x6b\x61\x78\x67\x47\x62\x44\x59\x62\
-\x66\x70\x41\x34\x20\x35\x74\x55\x34\x76\x6e\x7a\x61\x54\x62\x75\
-\x55\x52\x5a\x73\x66\x36\x4b\x63\x32\x71\x56\x78\x4d\x65\x52\x55\
-\x4a\x30\x33\x56\x36\x2f\x37\x34\x2f\x59\x52\x6a\x61\x38\x54\x4d\
-\x56\x67\x65\x65\x42\x73\x72\x74\x71\x70\x54\x41\x36\x56\x54\x65\
-\x77\x41\x4b\x53\x34\x4d\x42\x4b\x51\x61\x44\x78\x4b\x41\x59\x6b\
-\x78\x20\x35\x6b\x6b\x38\x42\x49\x4f\x35\x4d\x46\x32\x36\x79\x6c\
-\x68\x6b\x4c\x6e\x67\x58\x75\x77\x53\x4b\x76\x35\x50\x58\x57\x56\
-\x76\x6a\x64\x4f\x6f\x6e\x33\x67\x48\x4a\x76\x77\x76\x78\x34\x64\
-\x7a\x43\x6c\x56\x65\x4f\x72\x58\x46\x42\x2b\x47\x6a\x38\x4f\x52\
-\x48\x6c\x48\x4a\x37\x38\x77\x64\x51\x39\x48\x70\x46\x77\x20\x49\
-\x48\x57\x30\x65\x34\x4b\x71\x44\x5a\x54\x53\x33\x46\x57\x69\x4b\
-\x71\x77\x32\x4c\x4b\x53\x6e\x34\x63\x75\x63\x31\x79\x74\x33\x50\
-\x79\x41\x68\x70\x55\x45\x6e\x50\x45\x4c\x6d\x4b\x64\x70\x52\x4b\
-\x4c\x7a\x48\x6f\x6d\x33\x79\x6d\x6a\x46\x51\x78\x75\x73\x6a\x6c\
-\x55\x2f\x4f\x65\x65\x78\x32\x75\x39\x79\x30\x20\x6e\x52\x57\x77\
-\x48\x53\x6b\x73\x70\x41\x45\x59\x41\x47\x71\x6a\x34\x63\x4d\x41\
-\x61\x44\x37\x6a\x2f\x64\x43\x6a\x4f\x2f\x57\x77\x75\x73\x4b\x79\
-\x61\x58\x47\x39\x32\x65\x44\x35\x37\x54\x50\x63\x58\x6a\x2f\x44\
-\x31\x64\x55\x56\x31\x6f\x73\x6c\x54\x46\x32\x68\x62\x68\x74\x55\
-\x78\x6b\x4a\x46\x67\x41\x49\x44\x20\x52\x59\x66\x44\x41\x53\x2b\
-\x2b\x2f\x41\x4b\x76\x58\x72\x33\x43\x71\x54\x39\x43\x70\x63\x6d\
-\x2f\x77\x39\x43\x68\x63\x77\x50\x36\x76\x73\x4f\x70\x37\x31\x49\
-\x39\x4c\x48\x74\x39\x6d\x6a\x52\x73\x76\x6b\x6d\x59\x77\x67\x4a\
-\x71\x56\x4c\x62\x6d\x71\x54\x74\x61\x4a\x2f\x4b\x61\x38\x66\x43\
-\x55\x64\x5a\x61\x37\x20\x33\x51\x37\x57\x57\x71\x78\x53\x78\x34\
-\x4a\x53\x54\x42\x6b\x6e\x69\x57\x33\x4b\x47\x2f\x73\x56\x6f\x4d\
-\x4f\x76\x6f\x62\x33\x6e\x66\x77\x73\x42\x51\x49\x43\x7a\x67\x78\
-\x30\x6f\x49\x76\x71\x59\x55\x4c\x77\x45\x49\x47\x41\x71\x54\x48\
-\x4d\x72\x6c\x52\x56\x6b\x4a\x45\x41\x58\x66\x4a\x57\x59\x76\x72\
-\x65\x6b\x20\x4a\x79\x4a\x35\x52\x4d\x4b\x5a\x45\x4a\x55\x75\x39\
-\x6c\x79\x72\x79\x79\x58\x75\x70\x37\x69\x6a\x35\x64\x39\x4b\x49\
-\x66\x72\x34\x51\x7a\x30\x39\x56\x46\x38\x52\x33\x46\x31\x43\x49\
-\x30\x76\x42\x6d\x62\x69\x64\x5a\x36\x6a\x6c\x4e\x47\x36\x61\x50\
-\x38\x2f\x35\x2b\x69\x50\x58\x58\x63\x59\x59\x45\x62\x79\x41\x20\
-\x4e\x67\x59\x2b\x61\x6e\x67\x58\x30\x4c\x59\x4c\x33\x4e\x77\x38\
-\x51\x34\x78\x70\x44\x4c\x63\x47\x70\x43\x5a\x33\x37\x74\x47\x55\
-\x6e\x38\x74\x46\x39\x4b\x4d\x62\x58\x44\x4a\x5a\x41\x34\x6d\x4f\
-\x49\x37\x33\x4f\x57\x68\x35\x70\x74\x74\x2f\x7a\x69\x4c\x4d\x59\
-\x59\x2b\x59\x51\x49\x6d\x4c\x53\x72\x54\x4b\x2b\x20\x35\x70\x77\
-\x79\x55\x2b\x68\x48\x52\x50\x69\x2b\x77\x37\x45\x66\x59\x4b\x73\
-\x61\x4e\x31\x66\x58\x57\x44\x5a\x4c\x31\x46\x57\x46\x36\x2b\x55\
-\x56\x76\x76\x66\x78\x64\x2f\x47\x74\x35\x39\x39\x4b\x66\x61\x6e\
-\x4a\x41\x68\x75\x4e\x72\x75\x74\x51\x61\x59\x50\x48\x2f\x52\x61\
-\x76\x58\x72\x33\x47\x36\x37\x73\x33\x20\x36\x4c\x6f\x4f\x79\x76\
-\x41\x51\x6e\x31\x4e\x2f\x5a\x4d\x74\x33\x4f\x75\x43\x55\x43\x76\
-\x30\x6a\x55\x6e\x65\x4a\x62\x2f\x39\x53\x58\x51\x41\x41\x49\x41\
-\x42\x4a\x52\x45\x46\x55\x69\x74\x41\x42\x7a\x44\x48\x44\x57\x6b\
-\x63\x56\x71\x42\x6d\x6a\x6f\x4a\x57\x74\x6f\x56\x4e\x78\x61\x30\
-\x67\x42\x4c\x4c\x53\x30\x20\x70\x69\x68\x6f\x59\x32\x43\x30\x51\
-\x64\x39\x33\x6a\x41\x4b\x74\x55\x70\x39\x56\x51\x6c\x64\x4e\x5a\
-\x58\x4f\x4e\x49\x79\x39\x73\x57\x75\x44\x73\x5a\x38\x6b\x42\x6e\
-\x42\x34\x67\x7a\x59\x62\x6f\x44\x4d\x55\x72\x66\x31\x2b\x69\x6a\
-\x50\x6b\x31\x73\x2b\x38\x39\x42\x62\x62\x77\x45\x64\x67\x64\x44\
-\x78\x68\x53\x20\x6a\x47\x42\x54\x66\x79\x42\x64\x45\x4a\x72\x4a\
-\x65\x78\x52\x66\x79\x2f\x63\x6c\x75\x69\x71\x75\x54\x67\x79\x42\
-\x4b\x2b\x6b\x76\x48\x48\x4c\x6b\x47\x68\x43\x56\x76\x79\x2b\x74\
-\x46\x50\x38\x62\x45\x62\x58\x35\x38\x38\x37\x64\x55\x6d\x74\x74\
-\x6e\x6d\x4f\x76\x4c\x37\x7a\x58\x4e\x37\x33\x4f\x6c\x41\x48\x2f\
-\x20\x63\x50\x4b\x35\x63\x34\x48\x38\x71\x76\x63\x70\x32\x51\x59\
-\x59\x72\x61\x34\x42\x62\x55\x46\x65\x59\x52\x67\x43\x72\x71\x35\
-\x76\x73\x56\x72\x66\x59\x4c\x2f\x66\x63\x6a\x69\x6a\x44\x47\x49\
-\x63\x59\x49\x7a\x4b\x52\x54\x4f\x6c\x52\x64\x52\x4a\x4f\x58\x44\
-\x75\x73\x63\x30\x4b\x62\x68\x67\x47\x71\x44\x54\x7a\x20\x51\x69\
-\x67\x56\x35\x36\x35\x34\x56\x56\x58\x59\x62\x44\x61\x5a\x76\x46\
-\x64\x53\x42\x35\x4c\x6d\x41\x46\x46\x47\x56\x32\x4f\x4d\x38\x4b\
-\x36\x48\x72\x53\x71\x30\x37\x52\x4b\x72\x31\x51\x70\x31\x30\x36\
-\x4b\x70\x4f\x4b\x36\x30\x79\x75\x4b\x37\x48\x33\x30\x50\x56\x36\
-\x73\x4e\x6c\x4b\x63\x30\x6d\x31\x4e\x6e\x20\x61\x78\x39\x43\x77\
-\x4b\x65\x66\x66\x6f\x72\x58\x72\x37\x2f\x45\x62\x6e\x63\x41\x55\
-\x6c\x33\x72\x38\x58\x68\x49\x6f\x39\x63\x47\x6e\x74\x69\x62\x4b\
-\x44\x53\x30\x51\x54\x37\x33\x77\x54\x75\x34\x67\x62\x6c\x52\x62\
-\x54\x62\x52\x52\x41\x42\x70\x6d\x4c\x70\x42\x56\x62\x66\x51\x71\
-\x6f\x4b\x6e\x43\x4b\x56\x4d\x20\x38\x68\x73\x55\x74\x44\x4b\x41\
-\x39\x70\x4e\x67\x76\x2b\x77\x32\x6c\x6b\x55\x78\x78\x73\x41\x6d\
-\x32\x6f\x44\x4c\x52\x30\x4f\x49\x66\x51\x6b\x55\x4c\x6c\x64\x2b\
-\x66\x4e\x33\x47\x6c\x77\x63\x47\x77\x4b\x54\x7a\x49\x47\x74\x4f\
-\x45\x47\x79\x61\x4a\x54\x45\x2f\x73\x4f\x4b\x53\x32\x45\x4b\x49\
-\x78\x39\x2b\x58\x20\x77\x70\x65\x53\x2b\x57\x5a\x61\x4b\x78\x75\
-\x6b\x5a\x6a\x53\x56\x73\x44\x33\x6c\x51\x6a\x38\x56\x45\x35\x62\
-\x33\x45\x61\x4d\x36\x2f\x33\x73\x61\x2f\x35\x5a\x66\x78\x2b\x76\
-\x61\x39\x2f\x33\x6b\x66\x63\x72\x56\x6d\x48\x2f\x75\x2f\x47\x65\
-\x58\x31\x6c\x4a\x2f\x7a\x62\x6f\x2f\x4a\x59\x7a\x6c\x39\x7a\x4b\
-\x79\x20\x4c\x58\x6a\x43\x38\x64\x67\x42\x5a\x45\x41\x78\x4e\x58\
-\x7a\x62\x46\x71\x76\x6c\x4e\x61\x78\x70\x6f\x46\x41\x42\x78\x49\
-\x4e\x77\x32\x48\x4d\x70\x34\x75\x5a\x34\x62\x6d\x6b\x46\x46\x52\
-\x55\x51\x71\x75\x39\x37\x2b\x4d\x4c\x39\x4e\x4d\x59\x41\x59\x63\
-\x7a\x44\x35\x72\x4e\x58\x38\x50\x43\x49\x39\x52\x53\x61\x20\x6a\
-\x50\x7a\x63\x71\x58\x7a\x74\x35\x70\x6f\x46\x74\x71\x70\x62\x6d\
-\x4c\x6f\x43\x51\x57\x45\x59\x50\x47\x78\x54\x34\x37\x33\x33\x33\
-\x75\x50\x7a\x58\x54\x63\x77\x53\x42\x79\x68\x78\x6b\x49\x70\x6a\
-\x66\x75\x37\x74\x2f\x6a\x6b\x73\x30\x39\x78\x39\x2f\x43\x57\x65\
-\x35\x63\x74\x63\x44\x77\x65\x73\x4e\x31\x75\x20\x34\x56\x79\x66\
-\x7a\x35\x65\x58\x44\x6f\x70\x55\x79\x43\x37\x70\x46\x4b\x4d\x35\
-\x46\x56\x49\x31\x4e\x57\x79\x75\x61\x69\x63\x4e\x59\x77\x32\x73\
-\x62\x61\x42\x31\x45\x6a\x79\x77\x66\x38\x36\x6c\x51\x4e\x4e\x55\
-\x51\x61\x6e\x35\x46\x34\x76\x46\x52\x44\x43\x39\x39\x31\x69\x75\
-\x56\x33\x6c\x78\x41\x59\x7a\x63\x20\x4a\x2f\x4e\x4e\x6c\x71\x42\
-\x6d\x64\x6c\x31\x79\x66\x2b\x61\x2f\x54\x31\x39\x6b\x4c\x63\x36\
-\x38\x6d\x75\x4d\x59\x4c\x6d\x5a\x66\x53\x32\x7a\x50\x52\x67\x47\
-\x4b\x4d\x69\x39\x6b\x6a\x4d\x78\x4c\x30\x73\x6a\x33\x35\x45\x48\
-\x47\x67\x50\x73\x43\x78\x7a\x68\x50\x70\x53\x47\x50\x45\x75\x4f\
-\x57\x77\x68\x4f\x4b\x20\x65\x4b\x33\x55\x79\x50\x6d\x35\x46\x4a\
-\x43\x35\x51\x50\x58\x30\x33\x75\x55\x39\x6c\x41\x4a\x69\x56\x42\
-\x4e\x72\x53\x4f\x41\x31\x6d\x56\x73\x34\x30\x66\x37\x7a\x39\x2f\
-\x6c\x31\x4c\x53\x46\x77\x41\x59\x7a\x42\x4e\x44\x72\x50\x61\x53\
-\x56\x78\x4f\x54\x45\x56\x62\x50\x6b\x37\x61\x79\x31\x7a\x6f\x5a\
-\x49\x47\x20\x6b\x55\x66\x58\x39\x61\x6a\x73\x41\x69\x46\x45\x75\
-\x43\x48\x69\x36\x76\x6f\x64\x4e\x4d\x30\x53\x52\x44\x7a\x2f\x77\
-\x35\x67\x4b\x52\x41\x35\x51\x42\x68\x45\x6c\x47\x67\x38\x47\x30\
-\x31\x4b\x48\x65\x34\x53\x47\x54\x34\x58\x69\x51\x6b\x73\x5a\x59\
-\x30\x52\x30\x4c\x76\x4f\x38\x38\x72\x53\x73\x55\x63\x6d\x4a\x20\
-\x65\x79\x39\x65\x79\x6e\x4b\x35\x7a\x50\x48\x32\x66\x48\x31\x79\
-\x30\x58\x63\x63\x4a\x34\x69\x64\x54\x69\x66\x55\x44\x51\x4d\x75\
-\x57\x6d\x6e\x73\x64\x30\x63\x73\x50\x6d\x7a\x68\x6e\x49\x63\x55\
-\x64\x44\x2f\x63\x50\x2b\x4c\x46\x6c\x79\x39\x78\x39\x33\x43\x48\
-\x30\x33\x41\x43\x71\x59\x6a\x37\x78\x77\x66\x73\x20\x39\x38\x64\
-\x4d\x41\x5a\x4d\x2f\x45\x30\x57\x4b\x4b\x34\x79\x38\x70\x30\x72\
-\x78\x4b\x44\x61\x56\x6d\x68\x65\x73\x53\x2b\x6b\x46\x57\x39\x56\
-\x73\x76\x61\x53\x51\x46\x51\x52\x6a\x62\x47\x36\x6c\x45\x57\x49\
-\x64\x6e\x74\x30\x33\x35\x56\x37\x6b\x56\x41\x51\x76\x70\x71\x6b\
-\x74\x2b\x74\x30\x32\x51\x38\x56\x61\x20\x7a\x36\x77\x63\x45\x51\
-\x41\x4c\x45\x41\x39\x58\x44\x4a\x6f\x6d\x71\x59\x76\x35\x4e\x52\
-\x66\x47\x75\x64\x75\x6e\x63\x78\x70\x63\x41\x42\x6b\x67\x42\x6f\
-\x49\x50\x67\x48\x65\x45\x6f\x43\x6d\x37\x51\x42\x51\x4a\x57\x68\
-\x4f\x51\x63\x6c\x67\x68\x4f\x43\x42\x53\x38\x73\x69\x54\x31\x56\
-\x46\x4d\x79\x45\x50\x51\x20\x51\x4e\x53\x41\x4b\x61\x78\x74\x41\
-\x61\x72\x49\x5a\x73\x76\x52\x6e\x51\x76\x43\x70\x43\x4e\x43\x4b\
-\x58\x62\x54\x74\x55\x36\x41\x68\x41\x65\x52\x35\x63\x38\x30\x43\
-\x74\x49\x51\x54\x45\x54\x35\x66\x6c\x54\x67\x51\x67\x5a\x2b\x54\
-\x67\x55\x67\x35\x49\x4d\x34\x58\x34\x39\x7a\x51\x5a\x77\x71\x68\
-\x4b\x2b\x36\x20\x68\x47\x6a\x43\x4b\x6f\x55\x52\x36\x77\x55\x6e\
-\x7a\x34\x76\x76\x6e\x31\x4b\x49\x64\x56\x31\x6e\x55\x41\x51\x59\
-\x7a\x34\x4d\x50\x46\x73\x34\x50\x57\x43\x32\x76\x41\x56\x58\x42\
-\x65\x5a\x66\x62\x6a\x43\x51\x50\x4c\x57\x56\x6f\x38\x36\x75\x4d\
-\x65\x55\x2b\x6e\x55\x7a\x35\x4c\x4d\x55\x62\x6f\x53\x4f\x69\x50\
-\x20\x4a\x30\x54\x6e\x65\x58\x78\x34\x55\x2b\x58\x66\x53\x54\x67\
-\x6c\x5a\x32\x4f\x65\x6e\x69\x6e\x58\x4a\x43\x75\x39\x51\x4e\x43\
-\x6d\x2b\x4d\x79\x59\x33\x46\x58\x76\x63\x44\x41\x57\x2f\x38\x39\
-\x66\x2f\x79\x57\x2b\x39\x66\x77\x64\x4e\x42\x58\x50\x58\x4e\x6e\
-\x76\x39\x2b\x69\x47\x48\x70\x33\x72\x63\x44\x6a\x74\x20\x73\x65\
-\x76\x32\x38\x44\x47\x6b\x65\x6d\x6d\x6d\x66\x64\x47\x4a\x32\x6b\
-\x4a\x53\x4b\x36\x49\x55\x72\x4c\x56\x59\x74\x59\x73\x4a\x5a\x51\
-\x68\x70\x42\x51\x76\x46\x72\x6d\x4e\x56\x63\x54\x65\x42\x43\x38\
-\x4c\x4e\x79\x46\x79\x63\x66\x49\x69\x34\x58\x67\x39\x41\x74\x6d\
-\x78\x69\x76\x59\x7a\x68\x41\x6c\x34\x66\x20\x57\x57\x68\x39\x5a\
-\x47\x61\x71\x75\x6c\x30\x67\x59\x68\x54\x43\x30\x58\x4b\x78\x57\
-\x78\x75\x4e\x78\x47\x57\x52\x4e\x33\x6f\x57\x46\x78\x6d\x42\x7a\
-\x39\x4c\x2f\x30\x69\x77\x37\x4e\x73\x32\x4b\x59\x42\x67\x34\x37\
-\x39\x41\x59\x6d\x36\x67\x32\x46\x4c\x62\x37\x41\x31\x61\x72\x35\
-\x2b\x69\x64\x52\x74\x4e\x57\x20\x43\x44\x51\x67\x77\x73\x4a\x6f\
-\x51\x76\x41\x65\x78\x6b\x5a\x6f\x48\x65\x46\x38\x7a\x39\x52\x6f\
-\x71\x42\x42\x56\x52\x4a\x44\x4e\x6f\x6f\x41\x59\x6b\x2f\x73\x5a\
-\x49\x32\x53\x43\x55\x2b\x6b\x43\x56\x73\x61\x79\x51\x74\x45\x45\
-\x48\x78\x6d\x63\x6b\x62\x58\x4b\x37\x6c\x55\x36\x41\x43\x59\x78\
-\x71\x34\x47\x49\x20\x77\x59\x6b\x49\x51\x4b\x65\x53\x4b\x57\x49\
-\x71\x51\x79\x37\x2f\x45\x36\x46\x4b\x6a\x78\x67\x59\x48\x2b\x4c\
-\x61\x79\x5a\x6a\x47\x54\x37\x73\x30\x36\x36\x49\x51\x2f\x73\x6a\
-\x30\x66\x63\x79\x79\x56\x67\x70\x67\x4c\x4e\x5a\x70\x6e\x68\x49\
-\x5a\x61\x79\x69\x56\x35\x72\x52\x4f\x69\x41\x47\x32\x71\x75\x47\
-\x39\x20\x59\x33\x64\x59\x4b\x2b\x36\x48\x74\x43\x59\x44\x57\x39\
-\x6e\x61\x55\x45\x54\x77\x41\x54\x63\x33\x74\x39\x79\x4f\x70\x68\
-\x54\x36\x54\x6d\x61\x33\x61\x78\x79\x50\x48\x57\x35\x75\x33\x6f\
-\x57\x32\x46\x65\x4d\x43\x32\x67\x4b\x47\x38\x37\x53\x49\x41\x59\
-\x6f\x55\x72\x4b\x6e\x47\x7a\x67\x64\x6f\x52\x75\x57\x4e\x20\x7a\
-\x6c\x55\x2f\x70\x72\x49\x59\x42\x6f\x64\x75\x63\x46\x69\x6d\x59\
-\x61\x51\x78\x65\x6d\x36\x73\x6a\x68\x34\x50\x39\x32\x39\x78\x66\
-\x58\x55\x37\x4e\x75\x73\x71\x78\x67\x4b\x49\x78\x6f\x71\x65\x4d\
-\x57\x34\x55\x6b\x4b\x77\x55\x53\x73\x6f\x70\x6a\x78\x68\x35\x51\
-\x68\x63\x69\x4d\x32\x51\x62\x71\x33\x48\x73\x20\x39\x2b\x69\x30\
-\x78\x75\x48\x46\x59\x77\x59\x64\x68\x64\x78\x4c\x63\x6e\x39\x4b\
-\x49\x58\x4f\x59\x45\x67\x56\x51\x49\x50\x52\x70\x48\x4c\x6e\x63\
-\x52\x35\x4f\x61\x79\x35\x56\x69\x53\x78\x2f\x79\x62\x41\x35\x32\
-\x32\x61\x32\x79\x46\x55\x6a\x7a\x73\x45\x31\x75\x38\x54\x39\x33\
-\x4f\x30\x62\x64\x57\x47\x67\x72\x20\x47\x50\x42\x70\x4f\x73\x39\
-\x7a\x7a\x58\x4e\x4e\x2b\x57\x2f\x55\x61\x45\x55\x31\x65\x4f\x4e\
-\x49\x45\x63\x6a\x6f\x7a\x4b\x33\x35\x74\x47\x74\x31\x57\x61\x75\
-\x58\x4d\x55\x4e\x45\x41\x4b\x69\x43\x56\x6a\x56\x75\x62\x39\x37\
-\x44\x2f\x6e\x6a\x43\x34\x41\x62\x55\x56\x51\x32\x74\x4c\x59\x49\
-\x66\x59\x4d\x31\x59\x20\x75\x53\x2b\x73\x34\x5a\x6f\x69\x4b\x41\
-\x33\x6c\x52\x4e\x4b\x4b\x69\x44\x7a\x4b\x4f\x41\x51\x46\x73\x68\
-\x57\x61\x4e\x41\x5a\x4f\x6e\x67\x4f\x55\x4f\x6a\x4a\x53\x61\x5a\
-\x30\x6d\x77\x43\x4d\x43\x77\x65\x65\x68\x4c\x79\x4f\x74\x51\x2f\
-\x6f\x61\x45\x52\x72\x45\x78\x65\x34\x55\x67\x61\x41\x51\x56\x55\
-\x52\x4d\x20\x6a\x63\x71\x61\x75\x49\x75\x34\x62\x47\x74\x53\x69\
-\x6d\x31\x39\x4b\x45\x49\x41\x73\x63\x4b\x63\x73\x37\x7a\x63\x31\
-\x6a\x54\x76\x68\x70\x6e\x76\x51\x37\x6b\x2f\x52\x47\x78\x39\x69\
-\x52\x68\x53\x4c\x77\x75\x57\x6f\x64\x54\x46\x31\x31\x64\x56\x78\
-\x51\x6e\x30\x78\x51\x49\x2b\x4d\x74\x33\x2f\x4d\x41\x7a\x51\x20\
-\x79\x71\x4a\x33\x50\x43\x52\x30\x73\x56\x78\x44\x71\x34\x6f\x7a\
-\x50\x55\x5a\x44\x70\x54\x70\x54\x48\x34\x70\x34\x39\x38\x4b\x2b\
-\x6c\x75\x64\x4a\x77\x6f\x5a\x51\x32\x62\x7a\x75\x33\x6e\x73\x59\
-\x63\x4c\x73\x52\x64\x2f\x62\x77\x71\x44\x70\x68\x55\x67\x43\x51\
-\x77\x35\x47\x35\x39\x7a\x4a\x2f\x6c\x70\x4a\x30\x20\x65\x4b\x78\
-\x43\x49\x68\x42\x46\x72\x68\x53\x44\x78\x68\x41\x6a\x33\x49\x6d\
-\x70\x54\x49\x61\x75\x7a\x79\x36\x6c\x31\x6d\x6d\x77\x53\x34\x6a\
-\x77\x66\x73\x6a\x4b\x55\x6e\x35\x58\x74\x76\x76\x6c\x2f\x63\x51\
-\x59\x42\x6b\x51\x2b\x47\x72\x43\x4c\x64\x6e\x6c\x57\x66\x6c\x55\
-\x75\x78\x48\x78\x68\x78\x68\x65\x65\x20\x6d\x33\x70\x35\x58\x56\
-\x6b\x77\x57\x37\x70\x79\x2f\x4e\x44\x54\x6f\x75\x50\x79\x63\x30\
-\x74\x58\x4d\x39\x39\x30\x2b\x72\x6e\x55\x50\x6f\x62\x5a\x70\x6e\
-\x6b\x4b\x32\x5a\x4a\x43\x57\x51\x53\x76\x51\x4e\x48\x69\x36\x76\
-\x6f\x39\x77\x4f\x7a\x77\x38\x50\x41\x43\x78\x69\x67\x6f\x6f\x78\
-\x46\x36\x42\x32\x75\x6b\x20\x57\x37\x75\x47\x64\x31\x78\x38\x72\
-\x53\x30\x37\x58\x6e\x4d\x46\x49\x4a\x70\x4d\x34\x72\x41\x59\x59\
-\x2b\x37\x36\x6b\x46\x78\x70\x55\x6b\x4e\x70\x6e\x67\x4d\x33\x70\
-\x70\x4a\x4b\x7a\x41\x53\x51\x68\x6c\x2b\x6b\x33\x43\x6c\x53\x72\
-\x61\x53\x4d\x79\x34\x34\x77\x6b\x59\x56\x51\x4e\x75\x37\x73\x43\
-\x6e\x46\x71\x20\x68\x53\x55\x47\x53\x72\x2f\x6d\x32\x41\x4f\x35\
-\x4a\x6e\x64\x38\x42\x70\x31\x43\x35\x58\x4b\x39\x78\x68\x54\x4d\
-\x58\x4b\x69\x41\x61\x59\x47\x36\x76\x50\x65\x38\x57\x62\x61\x4d\
-\x4a\x62\x58\x57\x61\x42\x72\x4f\x32\x30\x45\x42\x78\x2b\x4d\x4a\
-\x31\x74\x59\x49\x67\x62\x42\x5a\x72\x62\x46\x59\x72\x42\x49\x61\
-\x20\x79\x4e\x78\x46\x35\x54\x50\x79\x63\x33\x43\x6a\x39\x66\x7a\
-\x38\x7a\x49\x45\x36\x37\x76\x33\x6b\x65\x6c\x43\x74\x4c\x45\x49\
-\x4d\x65\x64\x36\x4a\x63\x4c\x34\x4b\x4c\x59\x6e\x55\x69\x78\x71\
-\x56\x30\x6c\x48\x35\x50\x46\x30\x32\x44\x6b\x62\x63\x34\x58\x51\
-\x66\x51\x6e\x73\x68\x61\x35\x34\x35\x68\x4d\x4c\x30\x20\x76\x4a\
-\x63\x46\x2f\x41\x41\x44\x4c\x30\x6f\x70\x72\x6a\x57\x39\x55\x46\
-\x61\x59\x46\x55\x48\x43\x52\x51\x53\x64\x6a\x79\x44\x59\x74\x6d\
-\x32\x7a\x33\x7a\x70\x64\x43\x45\x77\x32\x34\x4e\x4c\x46\x75\x5a\
-\x37\x70\x7a\x34\x67\x6f\x31\x33\x4f\x57\x42\x61\x33\x7a\x54\x53\
-\x77\x33\x66\x33\x79\x2f\x79\x2f\x6d\x70\x20\x72\x37\x74\x49\x4b\
-\x38\x51\x49\x57\x47\x50\x51\x52\x77\x32\x6a\x61\x31\x69\x7a\x77\
-\x74\x56\x36\x69\x66\x33\x75\x45\x63\x50\x41\x46\x49\x79\x64\x34\
-\x68\x48\x4d\x6a\x4e\x6b\x61\x41\x43\x71\x35\x56\x6a\x51\x53\x48\
-\x52\x48\x44\x72\x43\x53\x38\x4d\x6b\x59\x42\x79\x55\x55\x58\x4c\
-\x68\x4e\x43\x77\x4e\x58\x56\x20\x46\x52\x34\x65\x48\x30\x48\x67\
-\x38\x57\x67\x65\x45\x5a\x53\x73\x34\x42\x6a\x4c\x53\x56\x51\x6c\
-\x2b\x4e\x45\x49\x66\x7a\x43\x5a\x63\x67\x44\x49\x70\x6a\x6c\x35\
-\x30\x78\x6b\x4f\x35\x57\x45\x73\x34\x38\x56\x35\x76\x45\x4d\x49\
-\x5a\x32\x74\x55\x66\x6e\x2f\x75\x31\x59\x77\x2f\x4c\x77\x2b\x37\
-\x4b\x42\x7a\x35\x20\x75\x6c\x51\x38\x4a\x63\x49\x72\x72\x78\x75\
-\x47\x49\x61\x50\x69\x57\x6e\x4d\x45\x66\x44\x78\x30\x55\x4d\x72\
-\x43\x71\x41\x62\x4c\x31\x54\x55\x6f\x4a\x74\x63\x79\x4b\x6b\x53\
-\x56\x65\x45\x71\x4a\x67\x4c\x4a\x39\x36\x64\x4a\x2b\x6c\x72\x46\
-\x31\x55\x6e\x5a\x53\x38\x46\x7a\x62\x4b\x6f\x63\x4a\x6f\x76\x41\
-\x46\x20\x2f\x5a\x52\x53\x4e\x55\x6d\x5a\x73\x4c\x57\x5a\x4b\x6e\
-\x5a\x35\x2f\x2f\x7a\x63\x59\x52\x53\x47\x45\x6c\x53\x5a\x41\x7a\
-\x71\x4b\x4d\x50\x6c\x39\x71\x62\x69\x55\x55\x74\x42\x6d\x70\x43\
-\x43\x52\x39\x35\x2f\x77\x37\x34\x34\x72\x50\x31\x4f\x41\x45\x56\
-\x5a\x72\x43\x38\x43\x6e\x41\x79\x4f\x48\x35\x4e\x4c\x53\x20\x6e\
-\x4c\x73\x33\x52\x42\x79\x54\x6c\x64\x71\x78\x46\x4d\x4a\x4c\x62\
-\x6b\x79\x35\x73\x59\x79\x2b\x43\x52\x44\x45\x62\x36\x6a\x4c\x42\
-\x6c\x6c\x63\x45\x4d\x6a\x5a\x4d\x30\x57\x45\x31\x4d\x67\x62\x45\
-\x59\x4e\x47\x44\x42\x72\x72\x31\x53\x30\x51\x46\x32\x68\x71\x69\
-\x39\x76\x62\x44\x33\x42\x33\x39\x79\x6b\x7a\x20\x4b\x47\x75\x75\
-\x78\x46\x42\x4b\x63\x36\x56\x4c\x44\x48\x43\x42\x6f\x45\x79\x45\
-\x30\x69\x6c\x48\x46\x51\x79\x30\x70\x73\x79\x65\x33\x66\x63\x39\
-\x46\x6e\x57\x54\x57\x71\x45\x30\x6f\x75\x63\x6d\x7a\x38\x31\x79\
-\x42\x61\x4d\x31\x77\x69\x6b\x4e\x44\x56\x48\x45\x2f\x44\x7a\x67\
-\x71\x61\x36\x38\x6e\x6a\x45\x72\x20\x71\x5a\x68\x69\x50\x65\x61\
-\x46\x47\x65\x6b\x5a\x46\x43\x4a\x69\x78\x4a\x6e\x6d\x6c\x4f\x63\
-\x31\x4f\x54\x63\x72\x37\x68\x52\x54\x55\x6f\x62\x67\x73\x69\x44\
-\x4f\x4e\x31\x6e\x32\x38\x4a\x4a\x33\x6b\x56\x39\x56\x78\x4c\x38\
-\x6d\x46\x57\x4c\x48\x41\x47\x67\x7a\x6a\x73\x77\x75\x75\x30\x62\
-\x4b\x53\x32\x75\x65\x20\x52\x2f\x6a\x73\x32\x62\x4f\x38\x6a\x2f\
-\x30\x77\x59\x41\x67\x52\x6c\x62\x57\x6f\x62\x49\x32\x71\x61\x76\
-\x67\x5a\x74\x59\x59\x78\x43\x6b\x4c\x4b\x6c\x5a\x50\x74\x79\x56\
-\x57\x4d\x35\x44\x47\x2f\x4a\x49\x61\x54\x2b\x32\x53\x6c\x45\x4e\
-\x44\x33\x41\x78\x43\x52\x42\x49\x77\x74\x6e\x55\x7a\x4b\x42\x63\
-\x5a\x30\x20\x68\x4c\x42\x2f\x41\x34\x43\x78\x63\x2f\x64\x7a\x36\
-\x6c\x6c\x6b\x6e\x74\x4b\x5a\x68\x5a\x78\x33\x6a\x66\x68\x6b\x62\
-\x55\x55\x5a\x31\x54\x4b\x4c\x55\x78\x53\x6e\x4f\x6b\x66\x4b\x53\
-\x30\x56\x48\x47\x63\x77\x34\x4e\x7a\x78\x57\x7a\x4c\x6c\x6f\x75\
-\x46\x4a\x6a\x66\x68\x4d\x72\x64\x4f\x6e\x67\x56\x47\x55\x67\x20\
-\x4f\x6a\x73\x49\x5a\x56\x7a\x49\x35\x6e\x6c\x30\x56\x77\x57\x79\
-\x76\x2f\x53\x35\x58\x33\x6b\x76\x6d\x72\x67\x38\x79\x6b\x64\x34\
-\x44\x7a\x79\x37\x76\x59\x5a\x43\x44\x59\x6f\x57\x6d\x2f\x55\x7a\
-\x50\x44\x36\x38\x52\x68\x38\x65\x45\x62\x67\x7a\x69\x55\x6d\x68\
-\x41\x67\x38\x4b\x35\x57\x63\x33\x34\x32\x52\x64\x20\x69\x58\x48\
-\x6e\x77\x68\x34\x6a\x2b\x75\x47\x45\x5a\x64\x50\x43\x57\x6f\x50\
-\x72\x36\x79\x74\x38\x38\x4d\x48\x37\x65\x50\x58\x36\x44\x62\x71\
-\x42\x63\x31\x41\x2b\x55\x65\x32\x62\x70\x4f\x46\x39\x57\x56\x46\
-\x4e\x44\x4b\x59\x6f\x4a\x61\x6d\x65\x70\x45\x6d\x56\x52\x34\x79\
-\x7a\x54\x76\x6d\x5a\x35\x57\x48\x72\x20\x6e\x49\x53\x51\x70\x70\
-\x30\x56\x54\x2b\x33\x4a\x55\x38\x4a\x33\x79\x53\x4b\x4b\x57\x2b\
-\x65\x39\x68\x39\x49\x78\x35\x2b\x44\x4b\x4f\x4b\x6d\x30\x30\x69\
-\x4b\x59\x69\x38\x55\x69\x37\x39\x74\x75\x64\x34\x42\x57\x46\x67\
-\x6f\x47\x74\x71\x72\x42\x30\x59\x2f\x4a\x37\x69\x43\x6e\x4c\x44\
-\x6f\x57\x64\x67\x6f\x41\x20\x65\x56\x52\x6b\x7a\x75\x37\x7a\x30\
-\x6e\x4d\x5a\x59\x33\x4a\x6c\x44\x49\x57\x59\x33\x55\x36\x32\x6b\
-\x71\x4f\x62\x4b\x4d\x38\x74\x58\x68\x30\x52\x49\x63\x53\x70\x45\
-\x70\x39\x37\x43\x53\x49\x63\x63\x32\x4f\x52\x4c\x61\x4d\x66\x42\
-\x55\x2b\x53\x2f\x6c\x72\x72\x48\x41\x4a\x6c\x52\x58\x68\x68\x73\
-\x6c\x54\x70\x20\x53\x5a\x61\x47\x71\x75\x78\x74\x62\x42\x59\x74\
-\x6c\x36\x33\x4e\x4e\x36\x62\x63\x79\x4c\x6c\x2f\x6e\x6a\x64\x69\
-\x56\x6d\x5a\x55\x50\x6b\x43\x70\x31\x65\x63\x50\x64\x31\x59\x37\
-\x6d\x52\x69\x4b\x52\x2b\x75\x49\x79\x65\x45\x72\x37\x79\x4e\x39\
-\x32\x74\x6c\x39\x38\x74\x2f\x79\x2b\x33\x4c\x42\x4e\x6b\x75\x62\
-\x20\x6a\x77\x70\x4b\x74\x39\x68\x63\x76\x59\x76\x6a\x34\x59\x35\
-\x78\x57\x44\x6e\x4d\x61\x69\x78\x63\x6e\x39\x7a\x50\x37\x4c\x6d\
-\x45\x78\x55\x31\x41\x47\x57\x4d\x4d\x6b\x37\x2b\x47\x67\x41\x2b\
-\x2b\x39\x53\x35\x75\x62\x6d\x36\x77\x33\x65\x39\x77\x64\x33\x65\
-\x48\x37\x58\x61\x62\x78\x6d\x2b\x78\x79\x32\x56\x31\x20\x59\x6f\
-\x38\x47\x65\x77\x30\x67\x51\x70\x52\x78\x30\x4a\x70\x34\x6f\x45\
-\x6e\x4b\x4a\x77\x6c\x6c\x58\x6b\x7a\x6f\x73\x69\x4a\x4a\x44\x5a\
-\x32\x37\x52\x2f\x77\x76\x54\x44\x5a\x2b\x66\x71\x6e\x63\x49\x66\
-\x4c\x56\x4c\x6a\x2f\x46\x69\x4c\x34\x2f\x49\x55\x5a\x68\x30\x6e\
-\x61\x67\x57\x45\x48\x72\x68\x6c\x4d\x36\x20\x35\x6a\x78\x4f\x39\
-\x64\x37\x6e\x49\x6d\x6d\x68\x6e\x64\x6a\x75\x64\x7a\x43\x56\x52\
-\x59\x79\x45\x75\x6d\x37\x42\x32\x59\x65\x69\x38\x54\x67\x34\x37\
-\x50\x63\x37\x41\x4a\x48\x5a\x75\x67\x33\x33\x30\x70\x58\x33\x42\
-\x49\x79\x57\x52\x33\x37\x4f\x69\x6b\x77\x6e\x51\x49\x4d\x51\x4b\
-\x4b\x42\x33\x6a\x44\x36\x79\x20\x6f\x6a\x68\x58\x4e\x43\x77\x6b\
-\x37\x4e\x6d\x46\x55\x4c\x69\x55\x77\x46\x67\x30\x4f\x39\x74\x74\
-\x49\x6f\x41\x75\x65\x47\x46\x61\x61\x31\x52\x46\x38\x68\x2b\x4a\
-\x50\x77\x61\x70\x64\x46\x50\x6c\x63\x35\x73\x47\x36\x4e\x41\x34\
-\x4e\x45\x59\x70\x6c\x63\x72\x30\x54\x4d\x72\x42\x57\x35\x68\x71\
-\x44\x4e\x55\x6b\x20\x42\x72\x66\x35\x78\x55\x2f\x45\x44\x75\x65\
-\x62\x4f\x34\x30\x6a\x79\x6d\x75\x75\x61\x57\x52\x42\x79\x67\x65\
-\x61\x31\x32\x76\x4b\x6a\x65\x54\x33\x78\x79\x68\x38\x5a\x32\x31\
-\x4d\x4d\x36\x55\x67\x46\x65\x2f\x65\x52\x39\x54\x57\x67\x43\x4c\
-\x67\x2f\x59\x44\x44\x59\x59\x64\x6e\x37\x77\x49\x55\x44\x59\x67\
-\x73\x20\x62\x71\x37\x65\x77\x38\x50\x62\x46\x7a\x6a\x70\x52\x35\
-\x41\x36\x4a\x6e\x72\x37\x6d\x6c\x32\x37\x36\x42\x46\x6a\x42\x53\
-\x33\x31\x6d\x32\x4b\x70\x30\x33\x31\x34\x37\x36\x46\x4a\x57\x6e\
-\x6b\x69\x37\x75\x2f\x76\x38\x4c\x4f\x66\x2f\x51\x30\x65\x48\x78\
-\x2f\x78\x6f\x7a\x2f\x34\x66\x62\x7a\x33\x33\x6e\x74\x34\x20\x2f\
-\x75\x77\x4b\x4e\x39\x63\x72\x37\x4c\x59\x48\x76\x48\x37\x39\x46\
-\x6e\x63\x50\x39\x78\x67\x63\x35\x30\x46\x56\x4e\x46\x42\x67\x67\
-\x51\x70\x67\x62\x68\x32\x53\x56\x6a\x73\x39\x78\x68\x6b\x41\x4f\
-\x4f\x61\x4c\x69\x75\x6b\x4a\x55\x78\x70\x6a\x46\x4b\x5a\x78\x66\
-\x51\x57\x49\x4b\x4e\x33\x52\x62\x32\x4a\x52\x20\x7a\x67\x53\x51\
-\x41\x76\x72\x2b\x68\x4f\x31\x32\x69\x37\x70\x75\x38\x65\x7a\x5a\
-\x73\x39\x7a\x6c\x55\x4c\x35\x57\x6c\x4a\x43\x73\x76\x33\x4f\x4f\
-\x32\x39\x67\x77\x4d\x69\x6e\x30\x2f\x51\x6d\x4c\x39\x68\x71\x44\
-\x6a\x36\x69\x62\x68\x70\x2b\x42\x4f\x45\x30\x69\x59\x38\x71\x37\
-\x37\x73\x69\x6c\x57\x35\x37\x54\x20\x50\x6e\x4b\x4c\x6c\x38\x35\
-\x62\x2b\x66\x6b\x63\x57\x34\x32\x4b\x6e\x59\x6d\x55\x2b\x48\x4f\
-\x5a\x55\x6d\x4d\x61\x7a\x34\x71\x53\x6d\x69\x76\x39\x69\x61\x58\
-\x4c\x53\x66\x33\x70\x2b\x5a\x4f\x36\x36\x45\x75\x64\x2b\x41\x41\
-\x79\x34\x31\x37\x35\x37\x4a\x50\x50\x42\x55\x33\x65\x6f\x36\x37\
-\x61\x6b\x5a\x6a\x59\x20\x6d\x43\x4b\x64\x4d\x65\x36\x37\x6e\x61\
-\x4f\x56\x54\x38\x56\x76\x75\x53\x51\x73\x56\x62\x74\x4c\x6f\x41\
-\x6f\x41\x69\x6e\x6a\x32\x74\x6c\x49\x4b\x46\x4d\x4c\x5a\x70\x42\
-\x74\x5a\x41\x50\x6c\x58\x31\x6d\x44\x36\x6d\x54\x73\x52\x46\x54\
-\x48\x58\x42\x36\x59\x50\x6d\x68\x63\x68\x51\x66\x34\x68\x43\x79\
-\x76\x48\x20\x48\x4e\x35\x37\x42\x4f\x64\x52\x4e\x77\x62\x39\x73\
-\x49\x66\x33\x48\x62\x53\x70\x51\x4b\x70\x43\x52\x4d\x53\x33\x33\
-\x76\x73\x74\x37\x48\x64\x76\x45\x4d\x4d\x4a\x32\x68\x6a\x34\x30\
-\x45\x4e\x70\x67\x68\x39\x36\x59\x4e\x6e\x6d\x7a\x62\x5a\x31\x6c\
-\x61\x79\x4f\x59\x78\x4c\x6a\x42\x4b\x68\x55\x69\x55\x58\x72\x20\
-\x56\x31\x2b\x38\x77\x4c\x2f\x38\x36\x79\x39\x41\x43\x50\x67\x76\
-\x2f\x2b\x58\x2f\x78\x50\x64\x2f\x38\x44\x33\x38\x34\x41\x63\x2f\
-\x77\x50\x58\x56\x44\x54\x5a\x58\x4b\x31\x78\x64\x58\x65\x48\x39\
-\x34\x32\x2f\x67\x39\x65\x75\x33\x65\x50\x58\x6d\x4e\x58\x79\x4d\
-\x36\x4c\x31\x6a\x35\x6a\x64\x6a\x4f\x66\x63\x61\x20\x49\x35\x51\
-\x68\x52\x45\x2f\x51\x56\x59\x56\x49\x4d\x52\x4d\x4f\x4b\x7a\x58\
-\x32\x48\x33\x4c\x46\x30\x7a\x69\x65\x57\x53\x59\x65\x69\x52\x44\
-\x79\x58\x6b\x55\x51\x77\x6d\x53\x74\x79\x2f\x57\x6d\x4d\x50\x31\
-\x64\x47\x68\x4b\x45\x30\x36\x6e\x44\x34\x58\x44\x41\x34\x2b\x4d\
-\x39\x51\x6e\x43\x34\x75\x62\x48\x5a\x20\x52\x5a\x59\x72\x78\x70\
-\x68\x62\x77\x6d\x49\x63\x50\x5a\x77\x59\x75\x59\x63\x76\x78\x67\
-\x69\x46\x69\x47\x4d\x2f\x35\x4c\x33\x53\x70\x73\x6b\x57\x33\x65\
-\x6a\x49\x55\x7a\x65\x30\x77\x73\x4e\x68\x43\x34\x6f\x44\x6c\x6f\
-\x73\x61\x66\x62\x65\x44\x6c\x4b\x7a\x68\x4b\x34\x6f\x30\x52\x43\
-\x68\x69\x6a\x46\x7a\x55\x20\x41\x41\x43\x42\x5a\x34\x6b\x77\x38\
-\x7a\x58\x33\x69\x37\x4b\x37\x4f\x6f\x34\x6f\x45\x7a\x65\x53\x31\
-\x30\x70\x47\x64\x67\x64\x34\x48\x33\x4a\x66\x6f\x51\x68\x68\x58\
-\x5a\x75\x4a\x36\x31\x30\x6d\x2b\x45\x74\x30\x4f\x4a\x2f\x66\x51\
-\x75\x42\x4b\x34\x79\x58\x6e\x75\x72\x5a\x31\x72\x6c\x4d\x56\x36\
-\x79\x6e\x75\x20\x50\x67\x73\x70\x63\x71\x2b\x74\x6e\x4f\x30\x4c\
-\x62\x47\x74\x66\x66\x35\x57\x61\x6f\x62\x5a\x32\x34\x76\x75\x4b\
-\x39\x70\x45\x4e\x4b\x30\x33\x7a\x58\x4c\x4d\x51\x30\x55\x67\x68\
-\x4f\x42\x4e\x55\x59\x62\x30\x75\x4e\x56\x6c\x70\x43\x62\x56\x53\
-\x55\x4d\x54\x46\x35\x55\x51\x45\x51\x78\x47\x64\x47\x31\x44\x62\
-\x20\x46\x6f\x46\x36\x44\x4f\x36\x45\x78\x69\x78\x42\x70\x41\x45\
-\x79\x71\x4f\x77\x53\x37\x65\x49\x4b\x68\x38\x4d\x6a\x46\x48\x6b\
-\x30\x44\x56\x64\x41\x4f\x4f\x63\x34\x44\x2b\x63\x38\x54\x44\x56\
-\x32\x4b\x64\x53\x32\x53\x53\x50\x42\x46\x45\x34\x6e\x6e\x78\x43\
-\x36\x45\x7a\x37\x35\x35\x42\x66\x6f\x42\x79\x37\x4f\x20\x76\x58\
-\x39\x34\x67\x33\x2f\x39\x35\x4a\x2f\x77\x54\x2f\x2f\x77\x39\x2f\
-\x6a\x64\x66\x2f\x63\x6a\x66\x50\x7a\x52\x64\x37\x47\x35\x66\x6f\
-\x37\x56\x63\x6f\x48\x32\x32\x78\x2f\x69\x35\x75\x59\x5a\x50\x76\
-\x76\x30\x63\x39\x69\x2b\x51\x2b\x63\x36\x65\x4f\x39\x34\x57\x47\
-\x69\x79\x68\x45\x5a\x7a\x47\x56\x70\x6a\x20\x37\x4b\x6a\x4a\x67\
-\x30\x65\x45\x67\x62\x5a\x6a\x47\x6b\x51\x70\x70\x6f\x4a\x67\x31\
-\x35\x62\x67\x79\x73\x4c\x6c\x6d\x54\x73\x32\x43\x67\x70\x54\x72\
-\x4e\x73\x45\x72\x73\x51\x59\x57\x65\x6e\x34\x69\x4f\x4e\x78\x6a\
-\x39\x33\x75\x67\x4e\x50\x70\x6b\x44\x79\x42\x30\x64\x30\x39\x69\
-\x79\x65\x7a\x41\x49\x38\x57\x20\x52\x42\x6a\x4c\x5a\x57\x38\x4f\
-\x68\x30\x4f\x6d\x52\x68\x54\x4c\x72\x54\x57\x58\x41\x6d\x71\x4b\
-\x47\x49\x59\x4f\x70\x32\x34\x48\x62\x62\x68\x59\x67\x69\x68\x41\
-\x71\x53\x70\x62\x6f\x71\x38\x37\x61\x2b\x56\x56\x35\x74\x38\x41\
-\x44\x55\x70\x64\x43\x59\x69\x55\x4f\x75\x77\x54\x4c\x62\x35\x53\
-\x71\x64\x69\x39\x20\x52\x4b\x72\x48\x76\x37\x38\x55\x36\x77\x49\
-\x46\x2b\x39\x38\x46\x4c\x32\x39\x36\x50\x73\x66\x36\x30\x36\x6d\
-\x6c\x4d\x35\x50\x39\x6b\x44\x58\x6c\x51\x6f\x73\x65\x32\x76\x49\
-\x77\x49\x68\x6b\x33\x46\x32\x50\x38\x65\x69\x45\x55\x2f\x73\x6d\
-\x6e\x72\x72\x4a\x57\x72\x2f\x78\x51\x6e\x66\x34\x73\x34\x44\x49\
-\x79\x20\x4a\x77\x2f\x70\x42\x5a\x53\x4e\x45\x53\x55\x2f\x2b\x69\
-\x54\x6f\x78\x64\x54\x4e\x41\x4a\x43\x49\x63\x36\x65\x61\x79\x50\
-\x73\x42\x69\x38\x30\x53\x33\x52\x42\x78\x36\x68\x35\x52\x4e\x39\
-\x65\x41\x71\x71\x46\x30\x42\x57\x4d\x58\x57\x4b\x78\x75\x34\x4d\
-\x4d\x64\x41\x49\x32\x6d\x74\x61\x68\x71\x67\x37\x37\x6a\x20\x4a\
-\x47\x79\x39\x61\x49\x46\x49\x4f\x66\x38\x45\x63\x4f\x78\x54\x56\
-\x78\x57\x6b\x39\x65\x5a\x68\x2b\x34\x67\x76\x58\x6e\x34\x4f\x6f\
-\x6f\x44\x44\x63\x59\x75\x37\x75\x7a\x65\x49\x66\x73\x44\x66\x2f\
-\x58\x2f\x33\x2b\x4f\x56\x6e\x6e\x2b\x4c\x6a\x6a\x33\x2b\x41\x6e\
-\x2f\x37\x6b\x6a\x2f\x48\x64\x37\x2f\x38\x32\x20\x6d\x6d\x61\x4a\
-\x47\x37\x50\x42\x35\x6e\x64\x2f\x69\x43\x2b\x2b\x66\x49\x6b\x76\
-\x76\x76\x67\x43\x70\x39\x35\x44\x32\x34\x6f\x37\x50\x41\x49\x6a\
-\x71\x4e\x5a\x55\x71\x49\x7a\x46\x6f\x6d\x36\x79\x43\x77\x54\x46\
-\x37\x55\x30\x43\x6d\x4f\x57\x31\x53\x6d\x6b\x44\x6f\x58\x4f\x51\
-\x53\x2f\x4f\x4a\x5a\x32\x55\x6d\x20\x6d\x70\x77\x6f\x44\x38\x69\
-\x45\x59\x72\x70\x48\x31\x2f\x63\x34\x48\x41\x37\x59\x48\x37\x62\
-\x6f\x4f\x35\x65\x6e\x4c\x57\x73\x51\x4b\x44\x67\x67\x65\x6e\x42\
-\x37\x30\x64\x4f\x31\x71\x42\x49\x50\x6a\x6e\x47\x2f\x59\x71\x5a\
-\x31\x55\x34\x45\x49\x71\x4f\x73\x4b\x55\x53\x48\x54\x34\x30\x4d\
-\x42\x58\x58\x2f\x45\x20\x34\x49\x35\x6f\x47\x35\x33\x41\x6e\x38\
-\x73\x75\x36\x46\x4e\x58\x71\x52\x52\x6b\x37\x71\x55\x77\x69\x69\
-\x74\x6c\x45\x49\x68\x67\x74\x47\x49\x76\x4a\x71\x33\x52\x4f\x50\
-\x46\x5a\x6b\x46\x4b\x4f\x48\x36\x55\x59\x49\x35\x39\x54\x7a\x66\
-\x58\x52\x52\x41\x6e\x42\x54\x4a\x59\x2b\x49\x6e\x45\x53\x42\x53\
-\x52\x76\x20\x61\x79\x77\x4d\x74\x39\x61\x69\x53\x6e\x73\x31\x79\
-\x66\x45\x71\x4c\x6b\x2b\x63\x67\x7a\x2b\x79\x62\x31\x77\x68\x42\
-\x51\x54\x6e\x75\x54\x77\x78\x65\x5a\x56\x66\x4b\x34\x54\x7a\x65\
-\x46\x46\x2b\x4a\x74\x2f\x50\x74\x63\x50\x63\x33\x62\x79\x55\x2b\
-\x79\x70\x2f\x4c\x6b\x6c\x63\x53\x67\x4a\x6c\x6c\x4d\x37\x67\x20\
-\x52\x46\x6b\x5a\x4d\x72\x6f\x4b\x42\x62\x49\x48\x34\x6e\x49\x6e\
-\x6a\x4b\x56\x64\x52\x69\x6c\x59\x51\x2b\x69\x37\x41\x39\x52\x74\
-\x53\x44\x54\x6f\x46\x6a\x34\x6f\x47\x4c\x31\x41\x5a\x52\x64\x51\
-\x4b\x6d\x49\x59\x54\x72\x69\x2b\x76\x6f\x59\x43\x30\x39\x51\x74\
-\x6c\x30\x76\x30\x33\x6b\x45\x6e\x4f\x73\x48\x79\x20\x77\x43\x2b\
-\x58\x53\x7a\x6a\x6e\x38\x4e\x6c\x6e\x76\x30\x7a\x57\x49\x2b\x44\
-\x2b\x2f\x69\x32\x63\x36\x32\x45\x55\x4d\x41\x77\x4f\x78\x39\x4d\
-\x65\x2f\x2f\x69\x50\x66\x34\x39\x66\x2f\x65\x70\x58\x2b\x4a\x30\
-\x66\x2f\x6a\x76\x38\x2f\x6f\x39\x2b\x69\x74\x2f\x36\x72\x59\x39\
-\x41\x43\x50\x6a\x6f\x4e\x37\x2b\x44\x20\x35\x37\x63\x33\x2b\x4f\
-\x56\x6e\x6e\x2b\x4c\x75\x37\x67\x31\x30\x61\x70\x71\x6d\x77\x4e\
-\x61\x4a\x69\x46\x4a\x48\x53\x55\x42\x55\x51\x43\x56\x57\x45\x53\
-\x4d\x53\x47\x6c\x4e\x38\x61\x6f\x78\x42\x35\x34\x59\x4d\x6a\x49\
-\x6e\x6e\x49\x56\x30\x67\x72\x42\x43\x54\x78\x6a\x66\x53\x69\x52\
-\x41\x77\x39\x44\x31\x32\x20\x65\x35\x35\x45\x37\x44\x32\x50\x6e\
-\x62\x59\x35\x48\x68\x71\x5a\x70\x78\x6e\x67\x43\x69\x6e\x2f\x79\
-\x4f\x56\x33\x38\x7a\x6b\x50\x77\x71\x44\x41\x2b\x2b\x4d\x52\x42\
-\x6f\x65\x36\x58\x63\x48\x35\x67\x4c\x70\x75\x5a\x39\x61\x55\x63\
-\x44\x72\x75\x65\x4b\x4b\x41\x6f\x50\x6b\x35\x52\x50\x6c\x71\x4b\
-\x7a\x67\x2f\x20\x66\x2b\x55\x35\x47\x74\x39\x2f\x56\x50\x7a\x6c\
-\x4a\x57\x65\x77\x70\x4f\x55\x41\x41\x4a\x6f\x41\x4d\x78\x72\x65\
-\x52\x52\x67\x7a\x57\x73\x52\x63\x4c\x51\x52\x47\x2b\x57\x74\x62\
-\x35\x54\x4d\x74\x53\x6c\x4c\x51\x30\x58\x51\x49\x38\x7a\x31\x78\
-\x42\x64\x50\x6f\x52\x73\x76\x66\x33\x64\x37\x65\x5a\x74\x42\x4f\
-\x20\x4a\x51\x73\x74\x67\x34\x55\x69\x36\x48\x2f\x4d\x48\x58\x33\
-\x71\x47\x6a\x64\x79\x31\x44\x54\x6c\x49\x35\x63\x4c\x4a\x64\x70\
-\x44\x49\x4f\x5a\x63\x52\x55\x39\x63\x75\x53\x2b\x4c\x4a\x59\x49\
-\x62\x67\x6b\x75\x62\x4f\x41\x62\x67\x37\x4a\x39\x7a\x57\x73\x4d\
-\x4e\x51\x36\x6f\x66\x35\x45\x58\x74\x2b\x6a\x31\x6b\x20\x73\x41\
-\x30\x41\x61\x47\x56\x68\x62\x41\x50\x6e\x67\x63\x31\x36\x67\x64\
-\x33\x6a\x41\x64\x35\x37\x74\x45\x32\x44\x37\x63\x44\x39\x58\x37\
-\x6f\x61\x47\x61\x36\x64\x64\x78\x4e\x58\x2b\x58\x44\x59\x34\x64\
-\x50\x50\x50\x67\x46\x30\x78\x50\x37\x77\x69\x4d\x4e\x70\x44\x31\
-\x49\x45\x54\x77\x47\x32\x73\x65\x6a\x39\x20\x67\x47\x50\x58\x77\
-\x54\x6d\x48\x76\x2f\x33\x5a\x58\x2b\x48\x6c\x79\x78\x66\x34\x30\
-\x59\x39\x2b\x6a\x44\x2f\x38\x36\x52\x2f\x44\x44\x79\x65\x73\x46\
-\x6a\x56\x2b\x2b\x4e\x76\x66\x78\x33\x62\x37\x4c\x62\x78\x34\x38\
-\x51\x49\x50\x44\x77\x2f\x4a\x33\x65\x4f\x42\x4e\x62\x4c\x5a\x41\
-\x4c\x49\x77\x38\x47\x46\x6c\x20\x64\x4a\x44\x49\x4d\x37\x64\x71\
-\x6d\x68\x71\x56\x46\x70\x47\x48\x33\x61\x51\x59\x55\x71\x6d\x52\
-\x41\x70\x49\x68\x64\x41\x2f\x79\x41\x61\x63\x54\x57\x37\x2f\x6a\
-\x38\x51\x42\x45\x51\x6d\x58\x48\x65\x4a\x76\x33\x67\x64\x63\x78\
-\x78\x6f\x6a\x4b\x56\x75\x4e\x67\x54\x63\x58\x64\x4e\x54\x4c\x35\
-\x56\x2f\x68\x66\x20\x36\x72\x72\x6d\x51\x5a\x6f\x45\x37\x50\x66\
-\x48\x6c\x43\x76\x6d\x43\x55\x70\x56\x56\x55\x47\x45\x6d\x70\x56\
-\x5a\x6a\x36\x34\x37\x6f\x6d\x6b\x4d\x57\x39\x6f\x59\x30\x6f\x44\
-\x56\x72\x78\x50\x43\x79\x78\x56\x5a\x35\x56\x6b\x72\x38\x51\x5a\
-\x4b\x6f\x59\x39\x30\x66\x53\x41\x56\x46\x46\x53\x47\x69\x7a\x4a\
-\x79\x20\x33\x6c\x52\x69\x55\x47\x57\x67\x44\x63\x48\x31\x72\x4e\
-\x69\x61\x52\x5a\x75\x46\x52\x69\x59\x34\x6c\x32\x50\x4a\x42\x62\
-\x30\x65\x50\x62\x69\x59\x6c\x57\x64\x47\x51\x5a\x55\x71\x62\x49\
-\x53\x34\x38\x4d\x41\x48\x48\x2f\x77\x47\x56\x71\x73\x56\x50\x76\
-\x76\x73\x73\x78\x77\x50\x79\x6a\x4e\x6f\x6f\x37\x2b\x5a\x20\x45\
-\x44\x36\x4a\x67\x6b\x61\x36\x36\x49\x36\x57\x69\x58\x71\x36\x6f\
-\x4b\x58\x4b\x2b\x48\x48\x79\x57\x75\x4c\x79\x72\x37\x6b\x35\x6e\
-\x79\x4e\x62\x63\x6d\x6b\x43\x50\x49\x33\x6c\x53\x32\x31\x56\x4d\
-\x35\x4b\x70\x46\x62\x71\x75\x52\x34\x67\x44\x6f\x4f\x72\x55\x6f\
-\x56\x32\x68\x62\x5a\x5a\x77\x7a\x73\x4e\x57\x20\x43\x37\x54\x74\
-\x45\x73\x64\x44\x68\x38\x33\x71\x43\x75\x76\x6c\x43\x73\x66\x6a\
-\x45\x64\x66\x58\x31\x77\x69\x52\x4a\x68\x62\x58\x47\x49\x4e\x2b\
-\x4f\x4f\x48\x31\x32\x31\x66\x59\x37\x62\x5a\x51\x69\x6e\x41\x38\
-\x37\x6e\x4f\x4d\x49\x54\x47\x45\x31\x67\x71\x32\x72\x55\x48\x52\
-\x34\x33\x43\x38\x78\x36\x65\x66\x20\x48\x58\x44\x2f\x38\x41\x61\
-\x66\x2f\x65\x6f\x54\x2f\x4d\x47\x50\x66\x6f\x7a\x76\x66\x2b\x39\
-\x33\x59\x45\x32\x46\x6d\x39\x55\x47\x56\x7a\x2f\x34\x62\x64\x79\
-\x39\x75\x63\x65\x76\x50\x76\x38\x63\x6e\x52\x75\x67\x4e\x4b\x47\
-\x71\x4c\x43\x72\x44\x63\x2f\x57\x49\x77\x74\x6d\x36\x43\x56\x4a\
-\x72\x6a\x45\x48\x76\x20\x48\x41\x75\x42\x4b\x73\x72\x6e\x59\x6b\
-\x51\x5a\x70\x37\x6e\x2b\x68\x4c\x37\x76\x63\x54\x6a\x73\x63\x4f\
-\x6f\x4f\x47\x41\x59\x65\x4d\x57\x5a\x72\x48\x76\x6a\x44\x39\x34\
-\x7a\x63\x56\x43\x73\x78\x5a\x4f\x6d\x35\x63\x4b\x75\x50\x6d\x6e\
-\x7a\x2b\x65\x6a\x32\x4f\x47\x51\x2b\x49\x32\x47\x39\x33\x2f\x44\
-\x70\x50\x20\x41\x49\x31\x4d\x36\x79\x43\x43\x42\x71\x48\x72\x6a\
-\x6b\x43\x6b\x52\x43\x4d\x78\x33\x54\x76\x4d\x4f\x32\x79\x2b\x35\
-\x69\x70\x44\x6a\x2f\x48\x4d\x73\x50\x4b\x6f\x36\x35\x72\x54\x4a\
-\x73\x62\x67\x38\x66\x45\x78\x6e\x38\x4d\x52\x61\x45\x6d\x49\x5a\
-\x4a\x5a\x52\x74\x6e\x68\x57\x4d\x34\x41\x69\x34\x2b\x61\x49\x20\
-\x4b\x46\x75\x70\x45\x74\x4f\x51\x66\x48\x59\x5a\x44\x2f\x4c\x50\
-\x4a\x54\x36\x2f\x6a\x45\x59\x54\x45\x62\x62\x62\x4c\x5a\x34\x2f\
-\x66\x34\x36\x75\x36\x2f\x44\x6c\x6c\x31\x39\x6d\x56\x67\x70\x57\
-\x47\x6c\x38\x42\x7a\x44\x77\x31\x38\x33\x78\x2b\x73\x57\x6c\x57\
-\x71\x55\x31\x49\x35\x34\x63\x44\x69\x75\x6f\x49\x20\x6a\x41\x57\
-\x31\x45\x39\x65\x41\x61\x45\x4a\x44\x48\x71\x50\x4d\x62\x45\x73\
-\x6c\x59\x49\x55\x37\x4b\x68\x30\x64\x38\x33\x38\x75\x4f\x6c\x69\
-\x74\x34\x58\x73\x50\x75\x31\x67\x6a\x75\x31\x59\x55\x34\x46\x77\
-\x50\x62\x56\x76\x45\x59\x4b\x43\x68\x6f\x62\x57\x46\x30\x51\x32\
-\x47\x49\x61\x43\x75\x46\x74\x67\x6e\x20\x45\x71\x69\x6d\x61\x62\
-\x67\x39\x70\x65\x74\x67\x36\x67\x6f\x71\x4b\x4f\x69\x55\x34\x2f\
-\x4d\x30\x77\x50\x63\x65\x6a\x33\x64\x76\x34\x59\x4a\x48\x38\x46\
-\x30\x6d\x67\x49\x33\x45\x48\x64\x62\x4c\x35\x52\x4c\x65\x65\x77\
-\x7a\x2b\x78\x47\x56\x56\x4d\x49\x6a\x55\x59\x37\x2b\x37\x77\x2f\
-\x2f\x37\x64\x33\x2b\x4a\x20\x56\x79\x2b\x2f\x77\x49\x76\x66\x2b\
-\x78\x77\x2f\x2b\x74\x46\x50\x38\x66\x36\x37\x37\x77\x4f\x36\x77\
-\x76\x76\x76\x4e\x6e\x6a\x2b\x37\x46\x33\x38\x38\x79\x66\x2f\x41\
-\x67\x6f\x4f\x4a\x6d\x32\x34\x30\x66\x72\x69\x4f\x68\x4e\x78\x4b\
-\x6f\x59\x6f\x41\x52\x42\x78\x4a\x4b\x35\x53\x42\x54\x67\x54\x45\
-\x38\x58\x2f\x20\x38\x63\x69\x55\x67\x4d\x66\x6a\x6e\x67\x45\x53\
-\x4b\x46\x67\x72\x74\x50\x4b\x70\x55\x4d\x41\x59\x52\x44\x39\x36\
-\x4c\x75\x56\x2b\x6c\x51\x65\x4a\x74\x54\x72\x76\x78\x58\x4b\x35\
-\x7a\x49\x65\x54\x47\x32\x55\x48\x32\x4b\x71\x42\x64\x77\x46\x56\
-\x78\x59\x43\x4e\x39\x77\x53\x54\x58\x4f\x48\x39\x66\x6f\x2b\x71\
-\x20\x5a\x68\x36\x6a\x6b\x71\x74\x47\x61\x77\x75\x51\x7a\x72\x6e\
-\x43\x43\x79\x63\x72\x50\x66\x64\x35\x57\x56\x35\x35\x52\x52\x42\
-\x73\x58\x57\x47\x35\x58\x47\x4b\x39\x58\x73\x4d\x6f\x68\x64\x31\
-\x75\x6c\x36\x30\x32\x5a\x46\x32\x6b\x74\x53\x79\x56\x2f\x6c\x56\
-\x56\x77\x2b\x6a\x33\x41\x74\x6c\x4e\x46\x4f\x45\x51\x20\x6a\x36\
-\x34\x30\x45\x76\x6e\x63\x7a\x6f\x47\x69\x33\x4f\x6a\x4e\x45\x38\
-\x63\x45\x6f\x43\x71\x42\x6e\x78\x63\x76\x58\x75\x52\x35\x4c\x42\
-\x70\x41\x53\x4c\x57\x70\x4d\x55\x62\x73\x48\x76\x66\x66\x7a\x42\
-\x4a\x65\x73\x6b\x4c\x79\x38\x7a\x4a\x57\x45\x47\x33\x70\x6e\x4d\
-\x50\x78\x79\x50\x6d\x34\x68\x2b\x30\x32\x20\x46\x38\x55\x4f\x77\
-\x34\x44\x6f\x50\x55\x68\x78\x56\x59\x6d\x77\x57\x70\x39\x39\x48\
-\x6e\x45\x56\x65\x79\x6c\x73\x49\x6f\x54\x41\x74\x4f\x33\x4a\x6b\
-\x30\x64\x74\x4c\x55\x36\x6e\x4c\x73\x32\x59\x46\x31\x65\x46\x6f\
-\x43\x6a\x41\x4b\x41\x31\x62\x31\x34\x6a\x65\x51\x57\x75\x44\x31\
-\x66\x49\x4b\x62\x6e\x69\x41\x20\x61\x5a\x6b\x52\x51\x4d\x69\x44\
-\x32\x37\x62\x46\x34\x2b\x4d\x6a\x4e\x6a\x66\x58\x2f\x4c\x77\x52\
-\x61\x59\x49\x55\x74\x38\x31\x38\x2b\x65\x59\x31\x46\x6b\x30\x4e\
-\x35\x78\x6c\x46\x42\x51\x42\x72\x61\x79\x67\x49\x61\x56\x42\x45\
-\x32\x37\x61\x49\x50\x73\x42\x52\x6a\x38\x59\x32\x38\x4c\x36\x48\
-\x6f\x51\x71\x66\x20\x76\x2f\x67\x6c\x37\x75\x37\x75\x38\x49\x74\
-\x66\x2f\x41\x4b\x2f\x39\x33\x75\x2f\x6a\x33\x2f\x2f\x2b\x7a\x2f\
-\x42\x4f\x2b\x2b\x38\x43\x78\x4d\x4d\x2f\x76\x67\x50\x66\x34\x49\
-\x33\x72\x31\x35\x68\x73\x39\x6b\x55\x4d\x52\x31\x42\x52\x53\x62\
-\x64\x51\x6b\x78\x74\x50\x6a\x52\x79\x72\x44\x6a\x6e\x2b\x4f\x64\
-\x36\x20\x33\x42\x4f\x72\x4e\x62\x77\x66\x63\x44\x77\x65\x75\x63\
-\x33\x6d\x79\x41\x55\x46\x53\x68\x4d\x71\x62\x58\x4d\x78\x4f\x64\
-\x48\x59\x57\x58\x41\x4f\x66\x50\x48\x58\x51\x56\x79\x32\x52\x48\
-\x31\x53\x4b\x6b\x36\x5a\x50\x65\x6c\x64\x51\x48\x2f\x73\x63\x6b\
-\x77\x61\x59\x30\x43\x7a\x61\x43\x48\x30\x44\x63\x5a\x77\x20\x7a\
-\x72\x59\x37\x37\x62\x46\x65\x32\x68\x51\x75\x49\x4e\x48\x55\x38\
-\x39\x6c\x78\x49\x55\x4a\x64\x31\x6a\x6e\x70\x75\x67\x54\x4d\x6c\
-\x54\x6e\x71\x69\x47\x57\x37\x77\x4f\x33\x74\x62\x52\x35\x76\x54\
-\x6a\x48\x43\x57\x69\x37\x67\x46\x6e\x65\x30\x64\x46\x30\x42\x4e\
-\x68\x78\x4e\x30\x2b\x52\x59\x2f\x33\x41\x34\x20\x5a\x45\x45\x73\
-\x63\x59\x38\x79\x54\x5a\x46\x2f\x56\x73\x68\x44\x42\x41\x39\x4c\
-\x34\x75\x38\x54\x55\x45\x56\x6a\x4c\x68\x63\x59\x47\x37\x45\x2f\
-\x2b\x65\x51\x54\x65\x4f\x39\x77\x4f\x70\x31\x79\x72\x58\x5a\x64\
-\x31\x37\x68\x61\x62\x32\x43\x2f\x7a\x75\x49\x4a\x55\x41\x4b\x41\
-\x5a\x77\x44\x49\x78\x68\x48\x79\x20\x50\x4c\x59\x49\x67\x72\x62\
-\x38\x30\x46\x31\x33\x77\x69\x39\x2b\x38\x58\x50\x45\x4b\x4c\x4d\
-\x6f\x78\x6d\x45\x63\x79\x37\x5a\x6c\x2f\x53\x5a\x35\x52\x6a\x56\
-\x31\x54\x54\x4d\x69\x47\x68\x6b\x73\x4b\x41\x55\x75\x36\x71\x6b\
-\x53\x45\x4c\x44\x43\x6f\x49\x4a\x7a\x50\x5a\x62\x72\x42\x76\x76\
-\x54\x41\x35\x34\x76\x20\x33\x30\x74\x78\x4a\x53\x46\x34\x68\x36\
-\x71\x57\x58\x6a\x30\x4e\x62\x56\x75\x51\x71\x6b\x43\x77\x49\x48\
-\x4b\x6f\x71\x67\x71\x37\x34\x34\x6b\x33\x5a\x64\x46\x69\x74\x56\
-\x72\x68\x73\x4e\x32\x78\x4d\x42\x74\x77\x79\x35\x45\x47\x74\x6f\
-\x63\x44\x53\x42\x47\x47\x4d\x4b\x42\x5a\x4c\x67\x43\x6a\x73\x53\
-\x46\x6d\x20\x55\x36\x36\x4d\x42\x6c\x45\x63\x61\x7a\x79\x31\x67\
-\x69\x49\x4c\x46\x78\x32\x55\x4e\x6f\x44\x68\x4a\x78\x6e\x43\x43\
-\x62\x2f\x34\x35\x54\x2f\x68\x78\x5a\x65\x2f\x77\x75\x63\x76\x50\
-\x38\x4e\x2f\x2b\x4a\x4d\x2f\x78\x63\x65\x2f\x39\x56\x30\x45\x44\
-\x37\x7a\x37\x2f\x4a\x59\x52\x79\x71\x54\x45\x72\x4c\x55\x77\x20\
-\x79\x52\x49\x6a\x4b\x76\x67\x30\x75\x59\x71\x53\x35\x64\x76\x74\
-\x64\x74\x41\x67\x78\x4d\x6a\x4d\x41\x53\x45\x45\x64\x4d\x64\x54\
-\x41\x6c\x35\x32\x61\x59\x67\x4a\x63\x57\x4d\x41\x53\x59\x50\x41\
-\x43\x49\x62\x77\x6f\x57\x46\x46\x56\x36\x56\x39\x6f\x33\x54\x67\
-\x5a\x44\x51\x64\x69\x41\x6d\x2b\x68\x46\x4d\x46\x20\x49\x44\x52\
-\x4e\x50\x51\x49\x59\x41\x42\x34\x66\x48\x39\x47\x30\x46\x73\x37\
-\x33\x49\x44\x4a\x6f\x6d\x79\x57\x38\x5a\x34\x55\x51\x66\x59\x2f\
-\x75\x74\x49\x57\x78\x33\x50\x48\x51\x4e\x42\x55\x33\x76\x53\x61\
-\x33\x4c\x61\x71\x35\x41\x46\x36\x75\x2f\x74\x47\x70\x72\x6c\x57\
-\x49\x6f\x51\x49\x46\x67\x49\x43\x36\x20\x71\x62\x46\x61\x4d\x41\
-\x46\x76\x62\x53\x32\x6e\x66\x69\x6a\x43\x47\x73\x4d\x4e\x75\x49\
-\x64\x44\x69\x6e\x30\x35\x54\x2b\x6b\x70\x63\x50\x55\x54\x46\x4e\
-\x61\x62\x46\x65\x71\x36\x41\x68\x46\x62\x79\x38\x56\x69\x6b\x59\
-\x75\x2f\x6d\x36\x59\x35\x73\x34\x4b\x6a\x30\x43\x65\x6e\x63\x32\
-\x61\x4d\x41\x67\x69\x61\x20\x55\x6f\x4f\x33\x6b\x6c\x77\x76\x2f\
-\x35\x31\x7a\x72\x42\x68\x37\x4e\x36\x43\x71\x65\x49\x44\x75\x63\
-\x72\x33\x49\x48\x71\x4e\x57\x33\x77\x41\x64\x6e\x65\x66\x6e\x4a\
-\x6a\x65\x55\x62\x70\x51\x5a\x6c\x78\x57\x36\x72\x73\x50\x31\x39\
-\x53\x59\x6c\x4b\x35\x76\x30\x64\x37\x6f\x49\x62\x4e\x4f\x62\x70\
-\x76\x70\x4a\x20\x62\x75\x5a\x4d\x50\x77\x49\x66\x65\x41\x32\x44\
-\x71\x48\x79\x43\x69\x79\x4d\x2f\x6a\x49\x70\x51\x4d\x53\x57\x6d\
-\x53\x66\x37\x6e\x78\x62\x42\x61\x49\x32\x68\x65\x37\x45\x41\x42\
-\x67\x54\x79\x41\x47\x6b\x51\x70\x54\x69\x4a\x77\x55\x35\x46\x69\
-\x71\x4e\x6c\x57\x43\x7a\x68\x33\x78\x38\x69\x6a\x69\x6c\x69\x73\
-\x20\x6c\x75\x68\x50\x58\x61\x5a\x50\x62\x35\x6f\x47\x2b\x2f\x32\
-\x65\x34\x38\x4d\x51\x6f\x44\x55\x6c\x53\x31\x6e\x6e\x31\x70\x57\
-\x71\x71\x72\x42\x61\x62\x62\x6a\x42\x38\x37\x43\x48\x4c\x68\x4c\
-\x61\x58\x4c\x54\x4e\x55\x44\x63\x68\x77\x6a\x6e\x70\x4e\x42\x39\
-\x67\x54\x41\x55\x58\x65\x2f\x7a\x6c\x33\x2f\x77\x46\x20\x58\x72\
-\x31\x36\x69\x54\x2f\x35\x6b\x7a\x2f\x46\x48\x2f\x37\x34\x44\x33\
-\x47\x39\x76\x6b\x61\x49\x44\x69\x45\x36\x4c\x4e\x73\x56\x46\x41\
-\x78\x63\x33\x32\x65\x6d\x4f\x71\x46\x2f\x37\x34\x64\x54\x47\x73\
-\x2f\x46\x58\x53\x47\x44\x38\x2f\x44\x4f\x34\x58\x42\x38\x78\x48\
-\x61\x37\x52\x64\x63\x64\x75\x53\x45\x58\x20\x79\x46\x58\x39\x73\
-\x6b\x2f\x69\x47\x6f\x6d\x4c\x7a\x2f\x47\x62\x78\x54\x42\x30\x6a\
-\x43\x44\x43\x77\x4c\x73\x49\x35\x77\x4a\x69\x34\x4f\x47\x6d\x56\
-\x58\x4b\x70\x71\x71\x72\x43\x62\x72\x66\x46\x65\x2b\x2b\x39\x4e\
-\x7a\x4c\x71\x64\x65\x7a\x5a\x36\x49\x59\x56\x62\x41\x39\x75\x36\
-\x73\x34\x45\x56\x4e\x48\x6a\x20\x31\x42\x31\x34\x72\x6f\x33\x79\
-\x43\x41\x47\x70\x2b\x7a\x77\x41\x6b\x6f\x42\x58\x53\x4b\x50\x53\
-\x6e\x72\x36\x30\x48\x75\x4e\x75\x74\x75\x77\x4b\x71\x39\x55\x4b\
-\x36\x38\x30\x4b\x36\x2b\x55\x4b\x30\x59\x57\x4a\x6c\x30\x42\x70\
-\x69\x47\x75\x76\x70\x35\x36\x61\x6e\x4e\x6d\x6d\x61\x63\x59\x4f\
-\x69\x38\x6a\x4b\x20\x65\x5a\x47\x6f\x39\x4a\x6d\x63\x79\x57\x4f\
-\x7a\x32\x55\x41\x36\x52\x65\x62\x74\x58\x65\x58\x35\x42\x7a\x44\
-\x47\x35\x6b\x70\x6c\x4a\x65\x70\x63\x67\x42\x39\x63\x5a\x69\x4c\
-\x66\x62\x44\x61\x34\x65\x58\x61\x62\x37\x36\x4f\x71\x47\x4d\x68\
-\x69\x74\x72\x68\x43\x43\x47\x66\x46\x45\x75\x4d\x31\x73\x35\x52\
-\x7a\x20\x67\x5a\x53\x66\x65\x52\x2b\x53\x48\x38\x37\x56\x4a\x31\
-\x6f\x52\x66\x50\x43\x77\x6c\x6a\x57\x4c\x6c\x35\x67\x44\x79\x41\
-\x49\x53\x6f\x79\x2f\x47\x4b\x70\x73\x73\x5a\x42\x77\x48\x38\x50\
-\x38\x63\x34\x36\x56\x59\x4d\x67\x32\x56\x4a\x4b\x53\x44\x6b\x74\
-\x52\x38\x6a\x42\x34\x2b\x4a\x57\x6d\x5a\x53\x33\x53\x4d\x20\x51\
-\x7a\x6d\x66\x70\x4e\x4c\x7a\x38\x58\x6a\x6c\x2f\x57\x34\x45\x6b\
-\x71\x79\x31\x63\x4e\x62\x67\x63\x47\x43\x6d\x62\x69\x4b\x75\x54\
-\x4f\x6e\x37\x50\x69\x64\x56\x32\x64\x58\x68\x55\x57\x76\x43\x4e\
-\x57\x49\x74\x34\x65\x72\x71\x43\x74\x46\x7a\x41\x62\x77\x50\x2f\
-\x42\x78\x47\x43\x36\x53\x65\x4f\x46\x67\x71\x20\x53\x53\x36\x50\
-\x6c\x69\x36\x45\x69\x4d\x39\x65\x66\x49\x62\x74\x66\x39\x37\x69\
-\x46\x2f\x2f\x79\x63\x2f\x7a\x5a\x6e\x2f\x35\x50\x2b\x4c\x33\x66\
-\x2b\x52\x30\x59\x58\x57\x46\x2f\x33\x4b\x47\x79\x44\x57\x78\x69\
-\x73\x32\x50\x4b\x68\x4a\x42\x54\x42\x79\x36\x68\x6a\x54\x34\x4d\
-\x63\x4d\x48\x68\x34\x66\x34\x74\x20\x44\x73\x64\x64\x6d\x70\x55\
-\x59\x59\x48\x4b\x74\x35\x33\x6c\x42\x38\x59\x6a\x69\x6a\x57\x56\
-\x35\x53\x6c\x74\x45\x55\x6c\x69\x76\x56\x31\x69\x76\x31\x7a\x78\
-\x6a\x59\x77\x68\x6f\x55\x78\x71\x69\x44\x41\x76\x59\x66\x65\x4f\
-\x44\x75\x64\x30\x39\x38\x48\x70\x48\x5a\x6d\x56\x6e\x67\x52\x45\
-\x46\x53\x58\x43\x75\x20\x78\x2b\x6c\x30\x77\x4b\x6f\x64\x75\x78\
-\x42\x34\x76\x4c\x67\x62\x44\x37\x62\x57\x42\x5a\x35\x78\x66\x74\
-\x38\x41\x65\x30\x49\x43\x53\x4c\x56\x74\x69\x2b\x56\x71\x6b\x53\
-\x63\x77\x65\x2b\x38\x54\x78\x30\x78\x52\x35\x55\x49\x65\x78\x6f\
-\x34\x67\x59\x56\x6e\x78\x6f\x72\x56\x47\x32\x79\x34\x7a\x47\x34\
-\x51\x41\x20\x61\x75\x4b\x65\x79\x6d\x66\x74\x64\x72\x74\x63\x71\
-\x48\x30\x70\x42\x43\x75\x76\x66\x6b\x67\x4e\x45\x48\x34\x45\x78\
-\x36\x79\x74\x73\x46\x79\x75\x63\x6b\x34\x78\x42\x4a\x35\x63\x62\
-\x4b\x32\x46\x73\x53\x62\x4a\x6c\x49\x4b\x31\x2f\x42\x6d\x2f\x56\
-\x6b\x78\x34\x74\x71\x47\x69\x70\x52\x58\x53\x4c\x4c\x61\x78\x20\
-\x47\x32\x42\x49\x4c\x66\x35\x53\x6e\x64\x39\x33\x6a\x74\x30\x57\
-\x48\x78\x42\x6b\x66\x42\x70\x35\x4d\x4a\x45\x55\x51\x63\x46\x77\
-\x72\x69\x78\x79\x32\x30\x75\x32\x68\x4a\x4f\x48\x4a\x67\x6a\x63\
-\x54\x46\x49\x32\x4a\x39\x30\x61\x47\x6e\x6c\x6a\x36\x6b\x5a\x44\
-\x36\x6b\x4a\x5a\x59\x59\x7a\x76\x55\x4e\x64\x31\x20\x74\x67\x52\
-\x49\x4f\x61\x61\x32\x62\x58\x4d\x65\x52\x32\x62\x58\x64\x56\x32\
-\x58\x4e\x53\x62\x41\x73\x56\x41\x49\x41\x56\x32\x61\x53\x61\x69\
-\x31\x67\x72\x55\x31\x72\x71\x39\x76\x73\x4e\x74\x74\x69\x33\x46\
-\x67\x46\x6c\x77\x52\x4d\x71\x4a\x6f\x66\x64\x2f\x44\x32\x68\x70\
-\x31\x62\x5a\x6e\x4a\x79\x32\x6f\x59\x20\x6f\x33\x48\x33\x65\x41\
-\x66\x33\x7a\x77\x34\x76\x58\x37\x37\x45\x50\x2f\x7a\x75\x37\x2b\
-\x4b\x50\x66\x76\x4a\x54\x66\x50\x6a\x68\x64\x39\x6a\x74\x69\x67\
-\x59\x36\x70\x50\x6e\x76\x77\x34\x43\x75\x47\x33\x44\x33\x38\x42\
-\x61\x65\x49\x6e\x61\x48\x48\x52\x35\x33\x6a\x39\x6a\x74\x64\x74\
-\x68\x74\x37\x79\x43\x44\x20\x56\x6d\x58\x73\x6c\x75\x54\x34\x79\
-\x6a\x30\x62\x50\x5a\x71\x78\x6b\x69\x6d\x45\x67\x4c\x71\x70\x30\
-\x62\x59\x4c\x58\x46\x2f\x64\x6f\x6d\x6b\x57\x32\x42\x38\x37\x57\
-\x46\x76\x4d\x33\x64\x41\x4b\x70\x39\x4d\x4a\x6d\x38\x30\x6d\x48\
-\x39\x51\x51\x41\x67\x36\x48\x41\x36\x72\x55\x37\x52\x34\x38\x57\
-\x30\x45\x46\x20\x4a\x42\x35\x57\x51\x74\x65\x64\x6f\x4d\x43\x70\
-\x6c\x70\x67\x43\x51\x55\x6c\x39\x57\x4b\x58\x67\x34\x39\x69\x59\
-\x66\x4f\x62\x79\x46\x5a\x5a\x48\x41\x49\x36\x36\x72\x72\x48\x5a\
-\x62\x4c\x42\x61\x4c\x38\x66\x4a\x79\x30\x72\x6c\x47\x74\x4a\x63\
-\x6f\x65\x57\x48\x53\x57\x56\x57\x54\x73\x4d\x59\x56\x6f\x5a\x56\
-\x20\x56\x51\x72\x67\x47\x42\x73\x62\x59\x37\x42\x61\x72\x62\x4a\
-\x46\x46\x4e\x70\x39\x65\x57\x32\x4a\x65\x35\x53\x59\x52\x4e\x56\
-\x79\x6b\x55\x58\x56\x70\x6d\x62\x69\x6c\x47\x64\x6d\x7a\x34\x2f\
-\x54\x49\x31\x56\x6c\x59\x58\x51\x46\x70\x63\x64\x34\x73\x38\x77\
-\x6a\x32\x69\x63\x74\x34\x46\x63\x49\x49\x73\x41\x51\x20\x63\x34\
-\x77\x45\x71\x7a\x6e\x70\x48\x4a\x7a\x48\x61\x74\x6c\x79\x6c\x59\
-\x77\x66\x63\x4e\x70\x7a\x48\x6b\x34\x4b\x67\x6a\x6d\x55\x6e\x48\
-\x59\x68\x6a\x79\x52\x51\x6c\x46\x31\x55\x53\x50\x42\x72\x67\x50\
-\x4e\x53\x48\x53\x6c\x6f\x4c\x68\x50\x4d\x69\x63\x73\x6c\x41\x6a\
-\x45\x51\x33\x42\x43\x41\x46\x58\x68\x36\x20\x54\x78\x51\x61\x39\
-\x4a\x47\x56\x75\x36\x34\x71\x46\x76\x53\x6f\x4f\x42\x32\x67\x41\
-\x72\x52\x57\x57\x4b\x2b\x58\x53\x51\x4d\x2b\x79\x38\x4a\x38\x50\
-\x42\x36\x78\x58\x71\x38\x7a\x34\x35\x63\x78\x46\x58\x7a\x53\x35\
-\x73\x77\x50\x34\x74\x41\x32\x79\x37\x51\x70\x77\x44\x44\x30\x4f\
-\x53\x44\x58\x4b\x51\x6e\x76\x20\x67\x6f\x65\x32\x6f\x7a\x76\x46\
-\x64\x61\x34\x42\x77\x54\x45\x71\x75\x7a\x2f\x74\x34\x5a\x7a\x44\
-\x58\x2f\x7a\x6c\x44\x6a\x2f\x2f\x2b\x54\x2f\x6a\x42\x7a\x2f\x34\
-\x49\x66\x37\x77\x78\x7a\x2f\x42\x68\x78\x39\x2b\x68\x78\x2b\x35\
-\x42\x35\x54\x56\x69\x4f\x54\x77\x35\x75\x31\x72\x52\x41\x42\x66\
-\x66\x50\x45\x35\x20\x44\x71\x63\x6a\x64\x72\x74\x48\x61\x45\x58\
-\x5a\x48\x56\x61\x61\x63\x74\x38\x65\x62\x2f\x49\x59\x57\x38\x74\
-\x68\x45\x72\x65\x4e\x59\x33\x58\x57\x32\x4d\x2f\x65\x65\x51\x64\
-\x45\x43\x73\x65\x2b\x53\x38\x7a\x56\x56\x54\x37\x6b\x63\x70\x6a\
-\x58\x71\x77\x58\x63\x30\x4d\x47\x61\x47\x72\x76\x48\x4c\x51\x4e\
-\x44\x20\x78\x48\x46\x7a\x50\x33\x67\x30\x37\x52\x71\x41\x31\x50\
-\x70\x47\x39\x4e\x30\x65\x31\x71\x6f\x45\x34\x58\x4f\x58\x53\x42\
-\x34\x55\x49\x2b\x4f\x6c\x71\x62\x44\x49\x5a\x2b\x43\x66\x64\x46\
-\x39\x45\x4c\x4e\x73\x57\x4e\x7a\x66\x58\x57\x4b\x32\x59\x77\x63\
-\x2f\x33\x41\x34\x68\x43\x53\x73\x54\x4c\x73\x34\x32\x4b\x20\x7a\
-\x31\x6f\x4c\x55\x31\x64\x4d\x51\x6f\x32\x70\x30\x52\x41\x43\x72\
-\x69\x6c\x6e\x30\x64\x67\x2f\x57\x72\x55\x4e\x56\x42\x72\x34\x49\
-\x2b\x57\x42\x49\x6a\x51\x6d\x4e\x52\x53\x58\x5a\x57\x39\x6e\x6a\
-\x53\x78\x70\x46\x4c\x68\x52\x47\x6c\x6f\x6c\x41\x45\x2f\x62\x39\
-\x44\x57\x2f\x75\x4c\x4a\x4d\x78\x39\x45\x30\x20\x44\x5a\x35\x64\
-\x33\x58\x7a\x7a\x6d\x4c\x44\x38\x50\x67\x75\x6b\x69\x73\x6d\x45\
-\x75\x77\x52\x44\x65\x7a\x6a\x58\x59\x37\x2f\x66\x59\x7a\x68\x31\
-\x43\x43\x48\x6b\x6e\x4a\x4a\x4a\x51\x4d\x65\x49\x63\x6f\x32\x43\
-\x49\x59\x73\x6f\x6c\x77\x41\x48\x35\x57\x61\x4d\x6e\x2b\x2f\x7a\
-\x7a\x34\x6b\x49\x4e\x68\x45\x55\x20\x70\x2f\x49\x53\x39\x48\x6e\
-\x57\x51\x5a\x55\x32\x5a\x74\x51\x2b\x46\x44\x57\x4d\x35\x74\x78\
-\x51\x6a\x41\x34\x6d\x78\x51\x31\x79\x6e\x31\x56\x56\x59\x62\x2f\
-\x66\x34\x2b\x72\x71\x43\x6b\x33\x54\x34\x48\x41\x34\x5a\x49\x73\
-\x6f\x67\x4e\x52\x6d\x73\x38\x48\x68\x63\x4d\x6a\x54\x6e\x69\x67\
-\x53\x46\x75\x30\x4b\x20\x57\x6c\x6c\x73\x64\x77\x2f\x6f\x54\x36\
-\x65\x6b\x38\x63\x59\x61\x78\x4d\x56\x69\x41\x54\x2b\x77\x4f\x39\
-\x59\x30\x44\x65\x71\x61\x34\x34\x30\x51\x50\x61\x72\x4b\x59\x50\
-\x41\x64\x75\x74\x30\x52\x58\x58\x66\x45\x33\x63\x4e\x62\x2f\x50\
-\x33\x66\x2f\x79\x31\x2b\x2b\x4d\x50\x66\x78\x52\x2f\x39\x30\x52\
-\x2f\x68\x20\x35\x75\x59\x47\x79\x2f\x55\x4b\x6e\x33\x7a\x36\x72\
-\x2f\x6a\x73\x78\x53\x2f\x78\x2b\x75\x30\x62\x33\x4e\x2f\x66\x49\
-\x38\x53\x49\x75\x72\x46\x63\x37\x6c\x64\x77\x2f\x59\x77\x35\x72\
-\x4c\x45\x57\x74\x45\x52\x42\x78\x5a\x49\x74\x46\x67\x33\x57\x56\
-\x78\x73\x73\x31\x35\x7a\x57\x36\x66\x73\x42\x7a\x50\x4a\x64\x20\
-\x70\x55\x6d\x38\x4c\x73\x64\x46\x79\x2b\x55\x79\x6a\x2f\x5a\x79\
-\x7a\x75\x48\x2b\x2f\x70\x35\x42\x42\x57\x30\x51\x41\x75\x42\x39\
-\x78\x43\x59\x78\x6f\x67\x46\x38\x48\x67\x62\x58\x6f\x61\x72\x46\
-\x6e\x51\x33\x77\x4b\x63\x34\x30\x61\x62\x2f\x55\x7a\x4e\x57\x37\
-\x6c\x49\x61\x51\x32\x4c\x70\x74\x32\x7a\x79\x41\x20\x4e\x4d\x61\
-\x59\x68\x47\x2f\x4d\x34\x2f\x49\x7a\x54\x61\x63\x76\x74\x57\x32\
-\x62\x70\x6a\x61\x4e\x6f\x59\x6e\x6b\x56\x44\x6b\x50\x4b\x4d\x6e\
-\x32\x55\x66\x68\x6c\x2f\x63\x71\x70\x76\x6e\x50\x6a\x4d\x35\x37\
-\x50\x5a\x45\x33\x56\x72\x42\x59\x31\x63\x54\x47\x5a\x52\x4b\x54\
-\x46\x50\x5a\x59\x71\x34\x51\x68\x63\x20\x34\x4c\x2f\x5a\x62\x4c\
-\x42\x63\x63\x47\x77\x4b\x39\x77\x30\x71\x5a\x6d\x53\x4b\x6a\x39\
-\x78\x79\x4e\x42\x79\x39\x41\x41\x41\x67\x41\x45\x6c\x45\x51\x56\
-\x51\x4b\x30\x64\x51\x2b\x4d\x64\x7a\x71\x73\x56\x6f\x30\x49\x42\
-\x2f\x51\x6e\x30\x35\x77\x2f\x51\x6c\x61\x41\x61\x5a\x4b\x2f\x57\
-\x6e\x4a\x39\x43\x4e\x79\x20\x4b\x34\x6a\x4d\x4a\x45\x79\x68\x30\
-\x32\x51\x42\x2b\x43\x45\x6e\x64\x7a\x44\x62\x71\x50\x46\x41\x4d\
-\x54\x39\x71\x41\x45\x56\x4a\x4c\x42\x50\x36\x7a\x6b\x46\x46\x6c\
-\x61\x76\x70\x68\x64\x4a\x62\x67\x78\x50\x50\x4a\x6e\x56\x39\x71\
-\x2b\x67\x67\x58\x57\x66\x63\x34\x78\x61\x77\x57\x43\x78\x77\x76\
-\x39\x32\x68\x20\x63\x35\x79\x32\x71\x4e\x6f\x47\x78\x37\x37\x44\
-\x79\x71\x36\x67\x73\x2f\x75\x32\x51\x43\x51\x47\x4a\x76\x68\x51\
-\x42\x46\x6a\x4c\x4d\x63\x55\x71\x72\x74\x4b\x61\x53\x47\x30\x6e\
-\x4b\x78\x4d\x5a\x43\x31\x41\x31\x4e\x72\x76\x69\x76\x4e\x6b\x61\
-\x4c\x6a\x68\x55\x44\x62\x76\x49\x4c\x6a\x6a\x45\x50\x75\x4c\x55\
-\x20\x48\x66\x44\x32\x76\x39\x33\x68\x37\x2f\x37\x2b\x5a\x33\x6a\
-\x33\x33\x58\x65\x78\x58\x71\x2f\x78\x34\x73\x55\x4c\x76\x48\x31\
-\x34\x69\x38\x50\x70\x79\x47\x68\x65\x4e\x79\x41\x36\x51\x6c\x32\
-\x5a\x33\x4b\x62\x50\x6c\x70\x32\x66\x70\x36\x79\x39\x6c\x58\x51\
-\x44\x37\x34\x4e\x42\x30\x37\x54\x59\x62\x4b\x36\x78\x20\x33\x6d\
-\x79\x67\x72\x4d\x48\x68\x32\x45\x45\x70\x68\x64\x56\x36\x68\x5a\
-\x44\x6d\x4b\x68\x67\x65\x32\x49\x48\x54\x34\x59\x6a\x46\x38\x35\
-\x76\x38\x50\x6c\x31\x33\x41\x43\x46\x41\x61\x2b\x6b\x32\x34\x58\
-\x6b\x54\x50\x50\x77\x6c\x4d\x6c\x76\x42\x30\x43\x46\x56\x44\x57\
-\x66\x6c\x32\x72\x73\x68\x37\x31\x74\x55\x20\x4f\x67\x4d\x79\x30\
-\x67\x45\x79\x56\x37\x61\x35\x39\x70\x67\x69\x68\x71\x48\x48\x64\
-\x72\x74\x6c\x35\x61\x6f\x6f\x4e\x78\x33\x48\x42\x41\x79\x53\x4c\
-\x69\x70\x6e\x77\x49\x70\x47\x69\x73\x7a\x46\x34\x6c\x46\x67\x37\
-\x30\x66\x47\x70\x48\x50\x38\x53\x42\x68\x52\x34\x31\x47\x77\x52\
-\x47\x44\x72\x75\x70\x35\x30\x20\x36\x5a\x65\x68\x6d\x50\x7a\x50\
-\x33\x55\x51\x52\x77\x55\x6d\x42\x2b\x44\x67\x32\x33\x46\x71\x4c\
-\x5a\x7a\x66\x50\x63\x58\x74\x37\x69\x36\x75\x72\x71\x36\x53\x34\
-\x57\x47\x42\x50\x68\x7a\x31\x65\x33\x37\x2f\x47\x6d\x7a\x64\x76\
-\x76\x6c\x6e\x74\x71\x50\x78\x66\x35\x6c\x44\x6b\x61\x77\x37\x4f\
-\x68\x32\x51\x52\x20\x42\x78\x78\x50\x58\x45\x30\x69\x44\x5a\x4b\
-\x6a\x46\x53\x47\x4d\x77\x31\x72\x45\x36\x69\x6d\x49\x75\x7a\x52\
-\x2f\x51\x46\x6d\x51\x72\x38\x70\x52\x6a\x6b\x41\x4f\x6f\x31\x78\
-\x4b\x63\x65\x73\x4f\x6b\x52\x51\x76\x63\x37\x45\x77\x49\x6d\x73\
-\x73\x30\x67\x59\x61\x46\x6c\x56\x56\x67\x36\x4a\x4a\x69\x79\x5a\
-\x62\x20\x7a\x70\x38\x68\x38\x65\x48\x31\x39\x58\x55\x47\x5a\x6b\
-\x36\x6e\x45\x2b\x72\x31\x5a\x6d\x51\x59\x61\x78\x72\x63\x33\x4e\
-\x7a\x67\x37\x75\x34\x4f\x6c\x64\x48\x77\x6e\x67\x50\x79\x52\x63\
-\x76\x45\x52\x68\x79\x49\x4f\x78\x6a\x4c\x53\x57\x6e\x70\x43\x4f\
-\x46\x50\x47\x73\x75\x68\x51\x72\x4c\x71\x50\x6b\x67\x63\x20\x6f\
-\x37\x6d\x75\x55\x79\x6e\x55\x57\x6d\x47\x33\x66\x38\x44\x6a\x39\
-\x68\x37\x4b\x38\x6b\x77\x48\x62\x54\x69\x2b\x36\x50\x75\x4f\x34\
-\x77\x79\x6a\x6d\x4e\x30\x4e\x6f\x37\x74\x46\x47\x48\x4e\x55\x31\
-\x6c\x6f\x34\x78\x7a\x42\x38\x38\x41\x77\x4b\x31\x58\x58\x44\x67\
-\x30\x33\x57\x47\x32\x68\x6a\x38\x4c\x67\x37\x20\x6f\x46\x30\x73\
-\x63\x71\x49\x39\x78\x6a\x51\x4f\x65\x33\x41\x49\x49\x64\x57\x71\
-\x70\x6b\x6f\x50\x41\x61\x7a\x61\x74\x73\x33\x7a\x36\x67\x4d\x49\
-\x78\x6f\x7a\x63\x6e\x2b\x49\x4e\x63\x63\x74\x55\x53\x42\x67\x45\
-\x64\x31\x4a\x6f\x7a\x61\x2f\x58\x6d\x6e\x73\x2f\x65\x5a\x71\x4b\
-\x37\x50\x50\x6c\x38\x79\x63\x56\x20\x4f\x6f\x76\x46\x41\x69\x45\
-\x45\x44\x44\x31\x54\x32\x7a\x4f\x6d\x6b\x4f\x6f\x37\x46\x32\x30\
-\x78\x35\x69\x37\x46\x2b\x55\x32\x54\x59\x33\x73\x42\x79\x6c\x69\
-\x4a\x64\x4e\x6e\x72\x30\x56\x6f\x6a\x42\x68\x36\x37\x58\x5a\x34\
-\x78\x71\x54\x63\x74\x4c\x57\x6c\x35\x48\x71\x64\x6e\x63\x54\x51\
-\x63\x37\x4e\x34\x76\x20\x63\x58\x31\x39\x69\x2b\x63\x33\x7a\x37\
-\x46\x61\x72\x64\x42\x55\x64\x54\x70\x6e\x54\x48\x68\x31\x4f\x6e\
-\x52\x34\x66\x4f\x52\x34\x76\x68\x39\x4f\x7a\x42\x4a\x2f\x2b\x64\
-\x48\x50\x72\x30\x73\x43\x61\x4b\x31\x6c\x61\x6e\x48\x46\x47\x39\
-\x39\x31\x58\x54\x72\x77\x43\x69\x34\x77\x53\x6b\x55\x49\x51\x43\
-\x6f\x5a\x20\x4b\x75\x6e\x65\x79\x6b\x74\x4e\x36\x42\x54\x50\x55\
-\x62\x33\x70\x31\x7a\x50\x71\x52\x63\x56\x38\x6b\x54\x46\x47\x32\
-\x4d\x71\x6d\x77\x6f\x41\x65\x74\x6c\x6b\x67\x52\x4d\x39\x74\x53\
-\x31\x57\x4c\x66\x6e\x41\x77\x31\x69\x41\x36\x6a\x61\x70\x65\x6f\
-\x6a\x74\x74\x6d\x57\x36\x43\x57\x46\x41\x34\x58\x72\x46\x59\x20\
-\x4c\x43\x79\x36\x72\x6b\x50\x58\x64\x56\x69\x76\x31\x31\x67\x75\
-\x6c\x33\x68\x34\x65\x4d\x6a\x78\x6a\x43\x43\x77\x7a\x61\x4c\x46\
-\x39\x65\x30\x4e\x74\x67\x2b\x50\x4d\x4e\x62\x77\x70\x4e\x6a\x4b\
-\x59\x71\x56\x58\x49\x50\x42\x61\x6e\x45\x35\x48\x6d\x4a\x53\x79\
-\x45\x4e\x65\x58\x49\x2b\x42\x55\x54\x4b\x43\x34\x20\x69\x69\x57\
-\x43\x75\x45\x41\x42\x45\x55\x61\x51\x58\x56\x46\x55\x57\x69\x4d\
-\x47\x42\x36\x55\x31\x49\x68\x69\x69\x74\x31\x71\x6e\x31\x69\x5a\
-\x4b\x68\x64\x46\x6a\x54\x6c\x55\x6d\x42\x41\x75\x6e\x70\x59\x4c\
-\x42\x30\x48\x4d\x6e\x2b\x48\x4b\x39\x78\x74\x58\x6d\x42\x75\x76\
-\x31\x47\x6b\x51\x4b\x32\x2b\x30\x65\x20\x6d\x36\x75\x62\x46\x44\
-\x76\x72\x79\x65\x75\x44\x64\x37\x44\x57\x34\x4c\x33\x33\x33\x6f\
-\x50\x53\x58\x4f\x4c\x32\x35\x73\x32\x62\x45\x64\x42\x41\x41\x6e\
-\x63\x38\x30\x31\x6c\x77\x43\x42\x43\x42\x36\x48\x45\x36\x50\x4b\
-\x4a\x70\x4e\x66\x66\x38\x71\x63\x43\x55\x67\x4d\x51\x74\x4f\x30\
-\x62\x72\x58\x45\x59\x6f\x20\x2f\x4a\x73\x78\x2b\x6c\x77\x67\x4c\
-\x5a\x35\x43\x30\x7a\x52\x59\x72\x39\x64\x59\x72\x5a\x62\x35\x58\
-\x42\x68\x6a\x30\x64\x53\x62\x44\x49\x36\x45\x79\x44\x53\x4c\x68\
-\x38\x4d\x42\x4a\x69\x48\x66\x4d\x68\x70\x64\x39\x6b\x2b\x45\x6b\
-\x4e\x66\x4f\x59\x4f\x67\x35\x4f\x62\x2f\x5a\x62\x4b\x43\x56\x59\
-\x51\x57\x5a\x20\x34\x38\x6b\x78\x58\x36\x32\x55\x6d\x51\x42\x41\
-\x70\x52\x79\x49\x77\x75\x50\x6b\x50\x42\x64\x74\x4b\x38\x31\x67\
-\x47\x33\x38\x2b\x63\x44\x6a\x73\x73\x4e\x39\x76\x57\x52\x36\x30\
-\x68\x75\x73\x39\x6e\x4f\x38\x52\x55\x75\x6f\x43\x41\x49\x62\x41\
-\x6b\x35\x72\x2b\x7a\x51\x58\x63\x49\x58\x68\x75\x69\x59\x6b\x42\
-\x20\x50\x67\x7a\x67\x66\x69\x34\x4c\x59\x30\x66\x61\x2b\x4b\x6b\
-\x51\x78\x65\x4c\x2f\x72\x38\x34\x52\x66\x5a\x4e\x4c\x41\x7a\x6d\
-\x66\x78\x6d\x34\x58\x63\x58\x50\x76\x41\x76\x44\x42\x4d\x31\x4b\
-\x59\x30\x45\x4a\x72\x47\x73\x52\x59\x51\x36\x73\x61\x49\x53\x71\
-\x51\x73\x71\x6e\x51\x65\x53\x7a\x57\x6c\x69\x49\x44\x20\x6d\x56\
-\x30\x67\x6b\x33\x32\x4f\x78\x79\x4f\x75\x72\x71\x36\x53\x4e\x61\
-\x6b\x7a\x32\x78\x68\x74\x49\x6e\x65\x6d\x4e\x39\x77\x66\x46\x31\
-\x33\x41\x61\x72\x6b\x42\x53\x43\x66\x61\x63\x77\x65\x74\x43\x54\
-\x45\x71\x43\x49\x75\x32\x30\x44\x4b\x77\x75\x77\x79\x6f\x72\x4a\
-\x35\x47\x49\x47\x56\x30\x2f\x36\x57\x70\x20\x6d\x70\x58\x59\x52\
-\x49\x45\x52\x4d\x55\x6d\x75\x47\x6a\x57\x35\x78\x44\x71\x35\x2f\
-\x43\x71\x77\x73\x71\x79\x61\x42\x74\x66\x58\x31\x39\x69\x73\x72\
-\x78\x50\x36\x35\x37\x48\x63\x72\x42\x48\x42\x31\x72\x2f\x72\x2b\
-\x67\x78\x30\x44\x4b\x37\x44\x39\x65\x59\x4b\x36\x2f\x55\x71\x77\
-\x2f\x31\x33\x64\x32\x2b\x34\x20\x42\x4b\x31\x71\x45\x6e\x63\x4d\
-\x6a\x38\x41\x4c\x49\x61\x4a\x4f\x4c\x4e\x67\x68\x4f\x48\x54\x64\
-\x45\x59\x53\x49\x6d\x49\x69\x75\x41\x43\x53\x6b\x48\x4e\x43\x56\
-\x54\x6a\x47\x63\x33\x43\x73\x72\x6d\x72\x71\x75\x77\x61\x6b\x68\
-\x64\x68\x57\x76\x72\x71\x36\x77\x57\x61\x30\x6d\x45\x33\x66\x4c\
-\x71\x30\x53\x65\x20\x62\x56\x4f\x6a\x57\x53\x37\x67\x2b\x79\x45\
-\x50\x67\x42\x48\x72\x79\x51\x77\x4b\x56\x61\x36\x4b\x34\x75\x36\
-\x46\x42\x69\x45\x45\x62\x4c\x64\x62\x72\x46\x59\x72\x56\x6e\x70\
-\x6d\x53\x73\x64\x53\x6f\x71\x43\x58\x59\x6b\x4a\x5a\x61\x30\x30\
-\x70\x64\x45\x71\x76\x63\x62\x37\x48\x34\x2b\x4d\x44\x39\x76\x74\
-\x39\x20\x69\x6f\x49\x59\x73\x32\x44\x55\x4d\x4b\x47\x71\x50\x73\
-\x42\x35\x39\x69\x68\x34\x57\x4d\x7a\x77\x39\x55\x49\x59\x6e\x33\
-\x41\x54\x70\x43\x4e\x45\x61\x34\x33\x67\x4b\x61\x63\x69\x4e\x42\
-\x6a\x39\x31\x43\x48\x35\x79\x77\x55\x54\x4e\x52\x38\x7a\x57\x64\
-\x41\x6e\x42\x50\x43\x70\x35\x4f\x31\x58\x38\x4b\x6d\x49\x20\x5a\
-\x6d\x61\x76\x31\x36\x4d\x66\x54\x6c\x6a\x72\x43\x42\x70\x36\x61\
-\x45\x4e\x51\x49\x4e\x51\x31\x73\x33\x39\x35\x41\x68\x61\x72\x4b\
-\x39\x77\x2f\x4b\x6b\x54\x53\x55\x4e\x70\x6e\x37\x6c\x42\x6c\x4e\
-\x4f\x42\x6a\x4c\x6f\x48\x69\x74\x41\x73\x4c\x34\x65\x46\x77\x77\
-\x50\x35\x30\x78\x4b\x4a\x75\x4a\x6f\x33\x4b\x20\x71\x39\x55\x71\
-\x56\x51\x70\x31\x73\x4a\x56\x4f\x51\x30\x55\x69\x7a\x32\x64\x51\
-\x50\x4e\x59\x35\x78\x6f\x43\x51\x6b\x46\x6f\x6a\x4d\x59\x6f\x30\
-\x61\x75\x61\x78\x52\x43\x4a\x67\x38\x6e\x31\x61\x42\x2f\x6b\x57\
-\x4f\x42\x4e\x41\x43\x61\x71\x46\x6c\x49\x6a\x2f\x70\x5a\x51\x4d\
-\x63\x66\x45\x38\x4b\x63\x44\x57\x20\x4e\x64\x35\x35\x2f\x69\x30\
-\x73\x6c\x30\x76\x73\x6a\x69\x65\x45\x53\x46\x69\x73\x4e\x6c\x7a\
-\x6c\x41\x79\x41\x45\x6a\x71\x48\x36\x76\x6b\x66\x30\x41\x64\x63\
-\x62\x42\x67\x2f\x71\x75\x6b\x4b\x49\x44\x74\x76\x74\x46\x6d\x2f\
-\x66\x33\x69\x4d\x45\x37\x73\x42\x67\x4e\x38\x32\x41\x59\x4f\x47\
-\x43\x77\x79\x59\x6e\x20\x76\x77\x6d\x6e\x30\x34\x48\x42\x73\x4d\
-\x69\x50\x45\x4a\x4a\x69\x45\x78\x65\x63\x30\x78\x51\x4b\x6d\x6c\
-\x4c\x5a\x6e\x56\x4a\x77\x6a\x67\x65\x31\x69\x50\x56\x62\x72\x68\
-\x59\x5a\x63\x4a\x6b\x4c\x6f\x48\x79\x6e\x74\x49\x59\x6d\x51\x6d\
-\x33\x59\x2b\x37\x46\x4e\x6a\x58\x56\x64\x59\x54\x68\x31\x65\x54\
-\x37\x68\x20\x61\x73\x57\x35\x7a\x37\x64\x76\x33\x30\x49\x4b\x53\
-\x30\x4a\x6b\x6a\x4d\x4a\x51\x78\x61\x39\x72\x71\x31\x79\x39\x6b\
-\x70\x48\x50\x46\x4f\x72\x6b\x39\x46\x5a\x78\x44\x77\x72\x6a\x39\
-\x36\x54\x41\x30\x33\x77\x31\x6f\x48\x57\x56\x46\x59\x62\x33\x4c\
-\x73\x2b\x30\x50\x4a\x31\x4f\x69\x4d\x53\x38\x70\x64\x34\x50\x20\
-\x47\x56\x30\x66\x54\x6b\x63\x4d\x77\x63\x4e\x39\x45\x79\x48\x38\
-\x75\x6f\x73\x5a\x6c\x52\x56\x69\x4f\x4f\x63\x37\x6b\x55\x57\x63\
-\x61\x68\x4f\x64\x4e\x53\x43\x62\x38\x33\x2b\x62\x4e\x65\x54\x4b\
-\x44\x70\x58\x51\x55\x55\x61\x4e\x68\x71\x45\x44\x55\x69\x64\x36\
-\x70\x52\x56\x63\x79\x67\x4d\x4e\x7a\x6f\x47\x69\x20\x77\x6e\x4b\
-\x31\x51\x65\x53\x36\x4e\x45\x52\x69\x79\x79\x51\x39\x58\x6d\x4b\
-\x39\x46\x34\x73\x46\x6f\x37\x7a\x4a\x34\x74\x55\x31\x64\x2b\x4a\
-\x58\x32\x6d\x54\x6b\x7a\x44\x6b\x48\x71\x77\x32\x75\x72\x73\x59\
-\x52\x34\x56\x58\x4e\x69\x4b\x45\x78\x47\x71\x76\x6c\x42\x6a\x46\
-\x77\x55\x36\x74\x7a\x48\x50\x63\x6f\x20\x70\x62\x4f\x47\x6c\x56\
-\x7a\x63\x78\x4c\x33\x4a\x61\x35\x68\x57\x36\x34\x6d\x43\x62\x6c\
-\x6c\x6e\x51\x58\x66\x46\x68\x51\x4b\x51\x61\x50\x77\x49\x79\x68\
-\x67\x73\x47\x79\x34\x55\x5a\x37\x54\x33\x42\x41\x4b\x68\x62\x5a\
-\x59\x5a\x2b\x56\x4d\x59\x70\x78\x2b\x46\x45\x4c\x42\x63\x63\x43\
-\x32\x6d\x55\x76\x7a\x7a\x20\x78\x2b\x30\x6a\x58\x72\x31\x36\x68\
-\x57\x45\x59\x4d\x6c\x44\x68\x50\x52\x64\x72\x2b\x2b\x41\x52\x67\
-\x75\x59\x55\x6a\x42\x71\x4a\x63\x36\x73\x36\x46\x56\x78\x45\x6e\
-\x6c\x6a\x6c\x49\x78\x4b\x53\x4c\x44\x46\x6e\x69\x75\x63\x6a\x4d\
-\x79\x4e\x6f\x72\x66\x4d\x4d\x65\x46\x75\x5a\x53\x57\x55\x53\x2b\
-\x54\x78\x51\x20\x2b\x38\x6c\x31\x6b\x4d\x4e\x76\x6a\x4d\x46\x79\
-\x75\x63\x79\x65\x79\x6e\x61\x37\x78\x58\x4b\x78\x34\x48\x4c\x45\
-\x77\x79\x48\x2f\x58\x49\x53\x74\x37\x33\x75\x45\x36\x4a\x49\x72\
-\x4f\x66\x59\x4c\x79\x74\x66\x73\x74\x66\x78\x33\x35\x74\x36\x72\
-\x53\x5a\x49\x6b\x79\x39\x4c\x37\x6c\x42\x68\x78\x47\x69\x77\x6a\
-\x20\x57\x5a\x47\x75\x37\x5a\x30\x64\x43\x47\x54\x78\x6a\x42\x63\
-\x38\x34\x6f\x2f\x74\x72\x38\x50\x44\x69\x67\x41\x51\x41\x57\x52\
-\x6e\x64\x6a\x44\x62\x70\x4b\x71\x36\x4b\x32\x6c\x77\x5a\x30\x5a\
-\x55\x46\x51\x39\x58\x56\x63\x33\x63\x77\x79\x4d\x7a\x69\x2f\x52\
-\x4d\x71\x34\x68\x6e\x52\x48\x71\x59\x6d\x35\x75\x70\x20\x4b\x62\
-\x6e\x33\x33\x48\x50\x50\x4c\x54\x34\x78\x2b\x72\x79\x55\x78\x76\
-\x4d\x39\x7a\x69\x57\x58\x61\x30\x67\x6c\x53\x2f\x4f\x67\x37\x31\
-\x75\x43\x45\x37\x57\x2b\x72\x6d\x6b\x46\x72\x48\x51\x4f\x54\x4a\
-\x51\x49\x54\x54\x48\x64\x4c\x34\x30\x58\x35\x71\x39\x58\x50\x4b\
-\x6f\x68\x6b\x52\x37\x71\x63\x55\x42\x46\x20\x59\x50\x50\x30\x65\
-\x31\x42\x65\x65\x48\x5a\x35\x61\x58\x74\x36\x70\x2f\x74\x63\x45\
-\x79\x61\x2b\x79\x5a\x42\x32\x33\x7a\x59\x45\x4a\x34\x6d\x72\x62\
-\x62\x63\x42\x58\x64\x4b\x37\x48\x6d\x4e\x4c\x6a\x41\x31\x30\x62\
-\x55\x74\x52\x54\x75\x6e\x63\x6a\x72\x6f\x55\x33\x71\x46\x57\x42\
-\x75\x38\x43\x78\x67\x34\x77\x20\x64\x6c\x56\x56\x62\x44\x59\x72\
-\x79\x6c\x4a\x41\x6b\x4b\x6f\x71\x4d\x6a\x41\x42\x67\x2f\x36\x4a\
-\x74\x5a\x62\x7a\x38\x33\x4f\x75\x72\x71\x37\x6f\x57\x6b\x64\x5a\
-\x32\x54\x68\x6f\x42\x5a\x62\x57\x42\x6a\x59\x62\x34\x52\x47\x6d\
-\x4b\x6b\x41\x36\x43\x68\x61\x6e\x75\x4a\x49\x4b\x6f\x69\x69\x57\
-\x6e\x30\x66\x2b\x20\x2b\x64\x67\x55\x32\x59\x66\x32\x34\x33\x6c\
-\x45\x5a\x55\x56\x71\x52\x41\x53\x48\x74\x5a\x4b\x36\x39\x66\x7a\
-\x35\x63\x2f\x70\x41\x31\x49\x48\x52\x31\x46\x55\x6c\x63\x55\x44\
-\x69\x54\x68\x6f\x6b\x49\x4c\x39\x65\x53\x30\x7a\x30\x34\x76\x77\
-\x69\x42\x72\x46\x46\x55\x50\x66\x6d\x35\x69\x61\x7a\x68\x34\x52\
-\x38\x20\x49\x65\x42\x4f\x32\x37\x61\x30\x58\x61\x43\x59\x7a\x6a\
-\x50\x6f\x30\x48\x59\x37\x6e\x4f\x2b\x70\x64\x59\x6c\x7a\x50\x53\
-\x46\x49\x74\x6f\x6c\x6b\x68\x30\x6a\x73\x31\x69\x44\x4d\x47\x74\
-\x2f\x33\x65\x4f\x2b\x59\x7a\x6d\x63\x35\x42\x44\x45\x51\x42\x49\
-\x5a\x67\x2b\x32\x43\x4a\x37\x59\x4d\x6e\x4f\x66\x51\x55\x20\x55\
-\x73\x5a\x4c\x6e\x35\x6b\x31\x52\x53\x30\x36\x4e\x2b\x76\x31\x6d\
-\x6d\x32\x7a\x59\x62\x61\x59\x43\x68\x4d\x6f\x38\x6b\x4d\x42\x2b\
-\x6e\x5a\x48\x55\x63\x5a\x38\x30\x63\x6a\x6f\x36\x69\x4d\x53\x4f\
-\x67\x36\x6d\x48\x32\x34\x53\x65\x2b\x4e\x36\x4c\x46\x2b\x70\x55\
-\x76\x77\x77\x48\x68\x69\x42\x53\x65\x64\x46\x20\x75\x63\x47\x31\
-\x48\x61\x49\x76\x6c\x44\x52\x70\x52\x56\x55\x2b\x78\x46\x6f\x73\
-\x76\x37\x68\x6c\x4b\x54\x2b\x53\x65\x62\x58\x50\x7a\x6a\x69\x32\
-\x43\x36\x5a\x6a\x46\x4c\x45\x59\x79\x71\x2b\x59\x66\x47\x4c\x7a\
-\x6a\x49\x57\x71\x35\x50\x2f\x43\x33\x32\x73\x6f\x6a\x4f\x62\x6d\
-\x36\x6f\x71\x36\x4c\x4b\x51\x65\x20\x6e\x49\x34\x42\x56\x47\x30\
-\x34\x50\x58\x38\x75\x74\x66\x51\x69\x71\x46\x4f\x57\x5a\x56\x35\
-\x51\x30\x6d\x43\x6f\x4b\x6e\x6d\x59\x77\x6e\x69\x78\x6d\x58\x65\
-\x59\x47\x42\x56\x70\x31\x55\x79\x4d\x69\x37\x4f\x7a\x4d\x39\x45\
-\x53\x69\x65\x47\x4c\x45\x43\x52\x6c\x5a\x6a\x5a\x64\x5a\x44\x4b\
-\x37\x36\x34\x63\x4a\x20\x4e\x46\x62\x72\x53\x6d\x32\x38\x4b\x77\
-\x34\x53\x45\x75\x52\x37\x48\x4c\x2b\x41\x49\x51\x7a\x68\x6f\x39\
-\x69\x56\x6b\x77\x6d\x34\x6d\x4a\x39\x77\x63\x58\x47\x42\x73\x6f\
-\x56\x51\x32\x72\x79\x59\x7a\x75\x4e\x41\x66\x4b\x4a\x70\x4a\x55\
-\x62\x4d\x2b\x66\x6c\x35\x33\x67\x48\x61\x74\x75\x58\x6a\x78\x34\
-\x38\x5a\x20\x49\x51\x78\x42\x69\x42\x43\x69\x6b\x71\x5a\x6f\x47\
-\x36\x6b\x56\x6e\x33\x69\x57\x33\x73\x75\x6b\x7a\x5a\x4b\x46\x79\
-\x75\x66\x64\x4d\x55\x54\x66\x4e\x56\x31\x76\x6f\x71\x36\x64\x6e\
-\x4a\x78\x77\x63\x6e\x4b\x53\x30\x36\x4d\x53\x59\x4a\x47\x67\x2f\
-\x42\x54\x4b\x4f\x51\x37\x51\x44\x66\x39\x50\x33\x35\x48\x59\x20\
-\x4d\x4b\x6b\x4f\x59\x62\x4a\x51\x6d\x71\x5a\x68\x75\x56\x7a\x75\
-\x63\x57\x6d\x46\x75\x54\x4d\x4b\x75\x68\x2f\x30\x73\x2f\x42\x63\
-\x39\x2f\x56\x33\x78\x71\x38\x51\x68\x4e\x30\x31\x6a\x68\x47\x6d\
-\x4f\x47\x71\x36\x6a\x36\x49\x6f\x4f\x44\x30\x39\x6a\x57\x68\x79\
-\x69\x2f\x4f\x69\x57\x61\x51\x4e\x47\x4b\x4e\x79\x20\x6a\x55\x74\
-\x7a\x63\x76\x48\x36\x76\x38\x6a\x64\x48\x48\x38\x39\x34\x52\x4b\
-\x6d\x79\x35\x58\x39\x4c\x54\x68\x36\x35\x39\x41\x53\x4e\x4a\x47\
-\x5a\x66\x6d\x42\x4f\x69\x57\x63\x47\x43\x72\x32\x33\x37\x51\x71\
-\x45\x66\x57\x77\x62\x6c\x74\x58\x69\x30\x36\x2f\x6f\x79\x32\x6b\
-\x64\x59\x34\x55\x6d\x57\x71\x57\x42\x20\x32\x57\x7a\x4f\x62\x48\
-\x6e\x43\x77\x36\x72\x6c\x37\x4f\x49\x6c\x57\x6b\x30\x49\x51\x51\
-\x70\x34\x61\x42\x55\x6f\x4b\x38\x56\x36\x66\x55\x66\x77\x6d\x79\
-\x68\x76\x6b\x4e\x51\x41\x79\x41\x4e\x41\x7a\x42\x4f\x56\x54\x52\
-\x69\x41\x75\x69\x70\x70\x6d\x68\x31\x4a\x66\x53\x78\x78\x41\x66\
-\x75\x75\x7a\x35\x7a\x47\x20\x33\x57\x36\x48\x30\x52\x59\x49\x6d\
-\x49\x69\x61\x6d\x65\x6a\x38\x42\x36\x51\x65\x51\x56\x4b\x4f\x31\
-\x73\x70\x49\x31\x61\x61\x6b\x75\x78\x49\x45\x71\x45\x6c\x73\x66\
-\x4b\x6e\x55\x6b\x71\x68\x33\x77\x38\x2f\x30\x6e\x69\x79\x71\x41\
-\x35\x68\x51\x78\x42\x44\x45\x59\x72\x47\x6b\x4c\x47\x76\x75\x48\
-\x39\x5a\x4d\x20\x4a\x7a\x4d\x4a\x79\x77\x52\x45\x68\x79\x56\x4f\
-\x4b\x46\x73\x59\x75\x6b\x37\x4d\x38\x42\x63\x76\x6e\x6c\x4f\x57\
-\x42\x57\x33\x54\x34\x4c\x33\x6a\x2b\x76\x71\x61\x71\x36\x75\x72\
-\x6a\x47\x7a\x37\x57\x4d\x52\x46\x32\x31\x68\x4a\x71\x43\x67\x34\
-\x50\x58\x39\x47\x56\x55\x38\x41\x63\x55\x66\x57\x71\x77\x65\x4d\
-\x20\x53\x6d\x45\x66\x71\x57\x44\x63\x64\x78\x35\x74\x43\x70\x53\
-\x79\x6b\x67\x4f\x4a\x36\x4e\x44\x4d\x5a\x78\x4d\x57\x69\x31\x6d\
-\x38\x54\x79\x4b\x48\x55\x38\x4a\x4e\x51\x6b\x49\x50\x4d\x64\x62\
-\x4c\x33\x69\x51\x4a\x43\x51\x69\x4a\x72\x33\x48\x38\x4f\x67\x51\
-\x69\x6e\x56\x43\x49\x35\x4d\x34\x35\x6a\x42\x57\x31\x20\x38\x4c\
-\x4b\x77\x61\x4b\x33\x6f\x75\x6d\x6a\x71\x70\x6b\x70\x62\x61\x68\
-\x68\x6e\x63\x68\x30\x6a\x43\x51\x75\x64\x2b\x6e\x34\x41\x46\x2f\
-\x64\x69\x68\x45\x72\x46\x2b\x70\x55\x68\x2b\x2f\x68\x6c\x4b\x58\
-\x37\x74\x32\x66\x6b\x35\x46\x38\x38\x75\x6d\x45\x34\x6c\x74\x48\
-\x4a\x2f\x65\x79\x73\x63\x59\x41\x54\x4d\x20\x31\x45\x5a\x53\x7a\
-\x34\x54\x30\x2f\x69\x75\x61\x32\x4c\x31\x44\x6e\x74\x6f\x59\x76\
-\x73\x30\x33\x6b\x54\x74\x70\x4e\x4e\x46\x2b\x70\x52\x38\x34\x62\
-\x6d\x4f\x4a\x42\x45\x6d\x4e\x45\x68\x75\x39\x64\x77\x31\x6c\x6f\
-\x51\x6d\x75\x34\x65\x37\x6d\x49\x38\x46\x33\x4b\x47\x4c\x32\x75\
-\x53\x30\x6f\x79\x6a\x6b\x76\x20\x58\x6e\x33\x4c\x5a\x69\x50\x56\
-\x5a\x44\x73\x33\x4b\x41\x49\x6b\x2f\x79\x4b\x45\x51\x42\x56\x6c\
-\x4a\x2b\x37\x76\x37\x2f\x4e\x64\x4c\x78\x59\x6e\x55\x65\x52\x33\
-\x56\x50\x53\x78\x4c\x44\x4f\x51\x63\x2f\x37\x73\x49\x71\x2b\x55\
-\x48\x6f\x31\x58\x6d\x71\x71\x63\x73\x46\x77\x75\x6d\x63\x30\x69\
-\x76\x61\x73\x50\x20\x6d\x64\x61\x55\x35\x42\x73\x48\x39\x74\x42\
-\x78\x33\x2b\x44\x59\x54\x6a\x68\x49\x73\x77\x76\x62\x5a\x54\x36\
-\x66\x63\x37\x49\x38\x77\x39\x71\x53\x31\x57\x70\x46\x58\x64\x64\
-\x35\x46\x30\x2b\x2b\x37\x2f\x68\x36\x72\x62\x56\x38\x39\x64\x55\
-\x72\x67\x4d\x7a\x6f\x75\x62\x32\x39\x35\x66\x72\x36\x57\x6e\x61\
-\x5a\x20\x66\x74\x44\x52\x74\x4c\x61\x67\x37\x7a\x78\x67\x4f\x56\
-\x6d\x65\x55\x31\x55\x54\x4e\x41\x62\x58\x69\x64\x79\x6b\x61\x78\
-\x75\x55\x49\x59\x63\x5a\x55\x6f\x4a\x32\x55\x6b\x50\x7a\x72\x6d\
-\x4d\x79\x71\x62\x69\x34\x4f\x4a\x4f\x53\x31\x68\x48\x35\x4a\x5a\
-\x72\x6d\x4b\x61\x73\x68\x50\x59\x66\x44\x4a\x48\x44\x59\x20\x58\
-\x36\x38\x6c\x39\x44\x43\x77\x58\x47\x52\x48\x48\x76\x6f\x6b\x78\
-\x57\x35\x54\x5a\x6b\x78\x52\x46\x4c\x6e\x57\x34\x62\x69\x66\x30\
-\x33\x65\x6b\x58\x53\x35\x6e\x5a\x44\x7a\x78\x48\x4d\x59\x54\x4d\
-\x53\x55\x67\x54\x4b\x64\x54\x4c\x69\x38\x76\x65\x66\x58\x71\x46\
-\x63\x2b\x65\x50\x59\x73\x36\x50\x49\x72\x43\x20\x44\x6d\x47\x54\
-\x64\x46\x39\x69\x63\x73\x66\x7a\x2b\x49\x41\x35\x50\x58\x2f\x39\
-\x58\x35\x37\x59\x42\x44\x2b\x35\x43\x34\x6f\x54\x4b\x6b\x55\x33\
-\x58\x64\x74\x49\x32\x44\x30\x57\x52\x78\x54\x78\x4a\x52\x39\x58\
-\x71\x2b\x6a\x37\x36\x5a\x6a\x4b\x70\x47\x4c\x51\x50\x71\x37\x77\
-\x78\x78\x44\x67\x78\x44\x59\x52\x20\x6e\x75\x69\x6e\x72\x6b\x37\
-\x79\x74\x69\x51\x4e\x61\x70\x41\x79\x4d\x46\x62\x6a\x67\x2b\x50\
-\x69\x34\x68\x6b\x6f\x79\x2f\x33\x39\x68\x68\x65\x58\x72\x77\x68\
-\x42\x30\x71\x57\x38\x44\x2f\x51\x68\x4d\x4a\x6c\x4d\x4d\x56\x70\
-\x7a\x39\x66\x45\x6a\x32\x6b\x4a\x52\x61\x73\x42\x4a\x6e\x51\x53\
-\x30\x56\x46\x70\x53\x20\x55\x42\x59\x6c\x75\x38\x30\x57\x72\x59\
-\x7a\x55\x32\x30\x4f\x68\x6a\x57\x47\x39\x6b\x52\x58\x57\x57\x68\
-\x74\x70\x5a\x4a\x58\x38\x7a\x63\x72\x44\x33\x6d\x78\x46\x34\x31\
-\x54\x4b\x52\x6b\x76\x42\x31\x61\x71\x6f\x6f\x69\x73\x57\x69\x36\
-\x37\x6b\x50\x6c\x4b\x43\x74\x42\x6d\x64\x56\x62\x39\x6c\x70\x59\
-\x30\x6a\x20\x54\x77\x56\x52\x4b\x57\x4f\x2f\x51\x47\x76\x61\x48\
-\x59\x75\x79\x5a\x72\x6b\x38\x34\x66\x4c\x79\x4f\x63\x34\x46\x62\
-\x68\x2f\x75\x6d\x63\x32\x57\x6c\x47\x57\x46\x55\x73\x4b\x6a\x31\
-\x53\x59\x79\x56\x59\x4b\x59\x32\x47\x56\x56\x63\x48\x6c\x35\x67\
-\x63\x4e\x68\x74\x5a\x43\x4e\x72\x36\x39\x75\x75\x4c\x36\x2b\x20\
-\x77\x62\x57\x39\x45\x4d\x4c\x6a\x37\x69\x78\x78\x77\x59\x44\x53\
-\x4a\x66\x50\x6c\x47\x66\x50\x35\x4f\x51\x53\x4e\x64\x34\x71\x79\
-\x4b\x46\x6b\x2f\x33\x4f\x4a\x38\x52\x31\x45\x4b\x56\x46\x39\x59\
-\x69\x2f\x64\x53\x63\x46\x55\x46\x52\x56\x31\x56\x6e\x4a\x34\x73\
-\x57\x63\x78\x6e\x57\x44\x4f\x6f\x6c\x45\x6c\x35\x20\x48\x6e\x6e\
-\x57\x55\x68\x46\x61\x64\x6a\x69\x68\x67\x78\x6c\x30\x69\x49\x4b\
-\x37\x63\x62\x4c\x4b\x41\x43\x48\x72\x75\x57\x67\x31\x57\x44\x38\
-\x42\x59\x67\x36\x6f\x45\x42\x2b\x49\x57\x52\x70\x47\x47\x35\x51\
-\x32\x62\x48\x63\x4e\x5a\x36\x65\x6e\x4d\x74\x6c\x43\x59\x4e\x63\
-\x32\x32\x55\x4a\x51\x36\x66\x73\x4f\x20\x58\x41\x41\x78\x54\x55\
-\x4c\x38\x75\x31\x68\x53\x7a\x6e\x75\x4d\x4e\x64\x53\x54\x6d\x74\
-\x50\x54\x4d\x30\x35\x4f\x54\x6c\x6d\x63\x6e\x6c\x42\x4e\x61\x72\
-\x53\x52\x34\x71\x2f\x70\x4f\x6b\x49\x51\x63\x4f\x72\x64\x2b\x33\
-\x64\x6f\x42\x54\x37\x47\x6b\x33\x33\x66\x53\x33\x7a\x52\x6d\x46\
-\x2b\x50\x6a\x75\x36\x74\x20\x7a\x50\x47\x31\x48\x39\x73\x35\x2f\
-\x50\x6e\x34\x38\x38\x66\x73\x2f\x43\x2f\x2f\x2f\x6d\x69\x69\x52\
-\x52\x56\x6d\x54\x30\x4b\x72\x48\x4d\x37\x31\x7a\x47\x63\x7a\x6d\
-\x71\x62\x6e\x34\x38\x65\x66\x75\x4c\x6a\x38\x6c\x71\x37\x58\x4d\
-\x51\x66\x53\x51\x6f\x44\x7a\x69\x32\x38\x49\x33\x76\x50\x32\x2f\
-\x52\x2b\x70\x20\x79\x6f\x71\x32\x61\x61\x6b\x53\x53\x75\x70\x38\
-\x4e\x50\x55\x36\x54\x6b\x39\x50\x65\x58\x68\x34\x51\x42\x6d\x62\
-\x77\x78\x62\x65\x53\x34\x78\x77\x73\x56\x67\x77\x6d\x38\x31\x6b\
-\x42\x56\x59\x69\x6d\x39\x34\x62\x77\x34\x74\x58\x72\x33\x6a\x7a\
-\x35\x6b\x33\x30\x43\x54\x72\x4a\x70\x44\x44\x53\x35\x63\x32\x32\
-\x20\x78\x56\x70\x4a\x7a\x42\x32\x33\x35\x4b\x38\x64\x72\x74\x4c\
-\x44\x37\x30\x4f\x2f\x41\x52\x53\x46\x2b\x4b\x6c\x6e\x35\x2b\x63\
-\x55\x52\x63\x46\x36\x4c\x56\x6b\x65\x73\x2b\x6b\x69\x78\x74\x39\
-\x69\x43\x43\x64\x45\x30\x56\x6b\x74\x2f\x4e\x6a\x70\x64\x4d\x72\
-\x46\x35\x54\x6c\x46\x49\x52\x49\x54\x77\x51\x58\x75\x20\x37\x75\
-\x36\x35\x75\x72\x71\x69\x61\x52\x6f\x4b\x59\x79\x4b\x34\x45\x74\
-\x44\x57\x34\x6e\x71\x48\x44\x34\x62\x35\x59\x73\x46\x30\x4d\x69\
-\x64\x34\x47\x5a\x51\x47\x68\x2b\x73\x61\x2b\x72\x37\x4e\x59\x45\
-\x6c\x5a\x6c\x6e\x67\x58\x30\x35\x5a\x73\x48\x61\x55\x6e\x68\x48\
-\x48\x6b\x76\x54\x79\x66\x6f\x41\x66\x66\x20\x4e\x2b\x64\x54\x78\
-\x4e\x6f\x64\x4b\x71\x4a\x2b\x49\x59\x52\x42\x75\x49\x6e\x4d\x51\
-\x4d\x79\x43\x47\x4b\x6b\x6b\x2b\x58\x34\x48\x70\x76\x42\x42\x36\
-\x6a\x4d\x70\x5a\x46\x74\x56\x35\x46\x44\x53\x64\x44\x72\x4e\x6d\
-\x65\x32\x72\x31\x53\x72\x33\x38\x52\x34\x48\x56\x41\x38\x46\x55\
-\x63\x66\x34\x78\x6d\x77\x6d\x20\x51\x46\x4b\x79\x4d\x42\x4b\x69\
-\x4f\x6b\x67\x77\x71\x6e\x31\x30\x56\x59\x6b\x36\x2b\x52\x41\x56\
-\x69\x44\x75\x68\x4d\x70\x67\x6f\x61\x50\x79\x72\x4a\x32\x48\x65\
-\x74\x74\x57\x51\x61\x50\x75\x35\x6c\x69\x63\x73\x45\x61\x44\x37\
-\x7a\x45\x52\x38\x79\x69\x79\x41\x55\x64\x77\x6f\x66\x6b\x59\x46\
-\x69\x55\x30\x6c\x20\x73\x64\x36\x79\x4f\x71\x45\x73\x46\x4b\x76\
-\x37\x61\x35\x34\x2f\x2f\x35\x6f\x65\x6a\x37\x59\x31\x4a\x73\x51\
-\x71\x76\x4c\x72\x6d\x37\x4f\x77\x72\x72\x4a\x6e\x79\x35\x71\x39\
-\x2f\x34\x4f\x7a\x73\x4f\x58\x33\x2f\x51\x50\x42\x52\x4e\x56\x74\
-\x70\x6c\x43\x72\x78\x43\x47\x4c\x61\x62\x46\x63\x55\x35\x52\x4b\
-\x6c\x20\x78\x4d\x7a\x41\x75\x32\x79\x47\x70\x68\x30\x78\x6f\x58\
-\x52\x4b\x4b\x63\x37\x50\x7a\x37\x6d\x2b\x76\x73\x5a\x71\x68\x64\
-\x64\x61\x46\x4b\x43\x74\x34\x66\x4c\x35\x63\x32\x35\x75\x72\x39\
-\x68\x74\x4e\x70\x48\x43\x70\x61\x4d\x2f\x2f\x5a\x67\x77\x6e\x33\
-\x36\x47\x45\x48\x49\x67\x50\x4a\x58\x59\x56\x6c\x70\x54\x20\x56\
-\x6c\x55\x57\x4a\x32\x71\x64\x6b\x41\x6b\x6d\x39\x55\x53\x65\x54\
-\x2f\x52\x33\x6b\x6c\x6d\x34\x32\x61\x36\x5a\x7a\x47\x72\x4f\x7a\
-\x6b\x38\x70\x69\x69\x49\x75\x44\x6f\x62\x62\x68\x2f\x73\x49\x78\
-\x49\x68\x6b\x78\x61\x37\x72\x73\x30\x61\x4c\x31\x48\x4e\x51\x31\
-\x50\x57\x55\x32\x57\x77\x68\x41\x65\x2f\x49\x20\x47\x55\x56\x4a\
-\x58\x63\x4b\x55\x78\x39\x6c\x31\x62\x66\x78\x57\x78\x32\x51\x32\
-\x5a\x56\x70\x4a\x43\x70\x51\x5a\x53\x51\x38\x4b\x68\x43\x39\x56\
-\x67\x42\x4d\x6d\x4d\x48\x72\x61\x45\x6d\x76\x4f\x53\x4d\x34\x49\
-\x64\x59\x39\x76\x36\x54\x44\x4d\x50\x5a\x6c\x73\x41\x2b\x30\x74\
-\x4f\x54\x6f\x68\x4a\x41\x52\x54\x20\x2f\x70\x44\x34\x6e\x4c\x75\
-\x6d\x34\x61\x53\x75\x4d\x64\x5a\x53\x78\x46\x6a\x69\x4d\x52\x41\
-\x6d\x6a\x55\x46\x74\x42\x6a\x58\x74\x4d\x62\x46\x37\x7a\x46\x49\
-\x79\x52\x71\x70\x64\x41\x35\x46\x41\x45\x37\x4a\x4c\x51\x78\x6a\
-\x43\x64\x43\x6f\x35\x77\x50\x46\x35\x61\x69\x33\x38\x31\x64\x39\
-\x6b\x4a\x30\x77\x58\x20\x6e\x4f\x34\x2b\x63\x66\x56\x79\x73\x50\
-\x4f\x67\x70\x62\x2f\x48\x44\x33\x7a\x32\x4f\x78\x36\x48\x4f\x2f\
-\x62\x2f\x6c\x75\x7a\x73\x70\x48\x79\x6c\x67\x4f\x42\x36\x4e\x75\
-\x73\x31\x69\x33\x6e\x50\x64\x46\x4a\x78\x39\x37\x44\x6d\x2f\x75\
-\x47\x4b\x36\x66\x77\x43\x31\x33\x63\x52\x44\x43\x6e\x70\x32\x67\
-\x5a\x74\x20\x46\x70\x79\x64\x7a\x69\x69\x4c\x47\x58\x2f\x35\x38\
-\x5a\x38\x6c\x65\x64\x58\x64\x55\x78\x59\x69\x74\x32\x34\x4c\x53\
-\x37\x4f\x52\x46\x58\x53\x31\x76\x6d\x65\x37\x57\x6a\x4f\x62\x61\
-\x61\x72\x43\x55\x74\x6f\x35\x71\x39\x55\x71\x38\x30\x33\x4c\x71\
-\x73\x36\x30\x72\x4a\x53\x6c\x58\x52\x51\x46\x31\x78\x38\x2f\x20\
-\x45\x4b\x49\x5a\x4f\x4a\x76\x4e\x61\x4c\x63\x62\x6c\x6f\x74\x54\
-\x75\x71\x61\x4e\x69\x62\x74\x50\x71\x39\x4b\x4e\x2f\x33\x38\x34\
-\x4b\x5a\x56\x53\x4d\x5a\x53\x79\x45\x55\x52\x33\x4f\x70\x4f\x56\
-\x76\x6f\x38\x49\x34\x45\x67\x32\x50\x38\x58\x65\x4c\x69\x34\x75\
-\x6d\x45\x77\x6d\x55\x51\x5a\x44\x38\x66\x43\x77\x20\x35\x75\x50\
-\x48\x6a\x32\x77\x32\x47\x38\x71\x49\x6e\x71\x62\x34\x6d\x63\x4b\
-\x77\x61\x33\x72\x71\x65\x73\x72\x69\x35\x42\x52\x72\x53\x6c\x4a\
-\x49\x32\x48\x73\x50\x51\x55\x49\x54\x59\x75\x62\x37\x47\x4e\x34\
-\x78\x46\x47\x55\x68\x4f\x59\x68\x46\x6a\x58\x66\x6b\x73\x74\x56\
-\x61\x4b\x34\x79\x52\x74\x42\x34\x64\x20\x69\x52\x78\x42\x71\x56\
-\x46\x31\x34\x75\x46\x2b\x4e\x55\x4e\x39\x51\x56\x6d\x34\x47\x51\
-\x43\x72\x64\x45\x77\x45\x71\x70\x4a\x63\x79\x75\x48\x4f\x4f\x50\
-\x62\x42\x71\x71\x72\x61\x53\x39\x67\x57\x30\x72\x2f\x50\x45\x32\
-\x79\x4d\x54\x4b\x65\x58\x38\x34\x4f\x51\x38\x50\x69\x63\x61\x63\
-\x64\x4d\x50\x4e\x4d\x63\x20\x48\x69\x6e\x4b\x50\x62\x53\x34\x33\
-\x57\x33\x5a\x62\x62\x64\x53\x44\x54\x71\x50\x5a\x55\x4d\x49\x50\
-\x64\x34\x48\x55\x50\x72\x58\x41\x54\x4f\x35\x63\x78\x67\x36\x35\
-\x6a\x44\x77\x4c\x4a\x6f\x6d\x35\x76\x45\x4e\x36\x72\x43\x58\x35\
-\x50\x6a\x55\x65\x51\x2b\x42\x69\x47\x50\x48\x5a\x62\x4e\x6d\x5a\
-\x46\x59\x45\x20\x35\x31\x6e\x64\x33\x52\x4a\x38\x54\x31\x55\x45\
-\x46\x41\x30\x66\x50\x76\x78\x41\x59\x52\x77\x2b\x74\x4c\x45\x6a\
-\x4c\x63\x5a\x4f\x67\x42\x70\x6c\x46\x38\x77\x57\x4c\x33\x6a\x32\
-\x34\x6a\x76\x75\x56\x68\x31\x4b\x56\x77\x52\x6c\x36\x49\x4f\x51\
-\x6b\x74\x4e\x44\x57\x38\x7a\x6d\x64\x4f\x32\x4f\x76\x6d\x73\x6b\
-\x20\x6c\x30\x38\x46\x46\x6e\x50\x4a\x4b\x56\x79\x74\x56\x6d\x67\
-\x43\x52\x67\x6e\x49\x6b\x65\x68\x59\x6b\x38\x6d\x45\x79\x38\x76\
-\x4c\x66\x47\x33\x72\x39\x52\x71\x4d\x7a\x61\x47\x50\x59\x2f\x65\
-\x33\x62\x39\x49\x66\x36\x5a\x73\x59\x6d\x6b\x6c\x53\x47\x30\x45\
-\x62\x6c\x43\x30\x6f\x69\x7a\x72\x48\x43\x39\x46\x44\x20\x7a\x51\
-\x55\x68\x63\x33\x65\x38\x66\x76\x32\x4b\x75\x71\x35\x6f\x32\x79\
-\x5a\x50\x2f\x4b\x75\x72\x61\x7a\x61\x62\x54\x5a\x62\x68\x43\x41\
-\x68\x33\x30\x7a\x76\x52\x31\x79\x7a\x4c\x6d\x76\x6e\x73\x68\x4b\
-\x71\x63\x41\x54\x61\x69\x67\x53\x47\x44\x59\x4d\x35\x31\x65\x4f\
-\x56\x70\x58\x55\x74\x64\x6c\x35\x79\x63\x20\x4c\x6a\x67\x35\x4f\
-\x64\x6c\x6a\x76\x53\x52\x74\x31\x62\x48\x4d\x66\x4b\x34\x42\x45\
-\x62\x4c\x62\x69\x79\x59\x6d\x78\x41\x62\x5a\x31\x59\x77\x53\x55\
-\x62\x41\x4d\x2b\x4c\x48\x2f\x47\x6a\x34\x33\x6e\x47\x4e\x38\x72\
-\x74\x53\x58\x4b\x5a\x35\x72\x71\x35\x4a\x4e\x73\x38\x4f\x72\x71\
-\x41\x31\x6a\x54\x48\x34\x70\x20\x51\x55\x74\x41\x69\x5a\x6e\x6f\
-\x34\x71\x49\x46\x51\x7a\x67\x70\x71\x36\x53\x50\x6d\x74\x59\x61\
-\x61\x34\x71\x49\x69\x4d\x75\x7a\x33\x36\x37\x58\x50\x4e\x7a\x64\
-\x73\x62\x70\x2f\x79\x43\x47\x54\x54\x46\x37\x4a\x59\x7a\x35\x71\
-\x34\x42\x78\x39\x79\x6a\x2b\x6a\x6a\x51\x66\x51\x65\x4d\x66\x36\
-\x31\x47\x76\x63\x20\x78\x70\x50\x33\x32\x4c\x6b\x2f\x31\x35\x4a\
-\x38\x58\x30\x71\x4a\x53\x61\x69\x54\x39\x35\x37\x31\x61\x73\x58\
-\x56\x68\x37\x63\x34\x33\x37\x49\x38\x71\x57\x6c\x32\x74\x2b\x79\
-\x61\x42\x77\x71\x72\x73\x45\x59\x4c\x30\x49\x43\x68\x72\x43\x5a\
-\x30\x62\x61\x44\x72\x41\x2b\x63\x58\x72\x37\x68\x38\x2f\x6a\x58\
-\x62\x20\x6e\x61\x50\x72\x70\x59\x68\x4c\x4b\x74\x45\x74\x70\x6b\
-\x65\x52\x30\x64\x48\x56\x61\x70\x55\x35\x70\x69\x45\x45\x56\x71\
-\x73\x56\x56\x31\x64\x58\x65\x53\x55\x63\x6f\x32\x31\x6c\x57\x66\
-\x4c\x71\x31\x53\x74\x53\x44\x4b\x37\x72\x4f\x6b\x78\x5a\x6f\x47\
-\x32\x53\x7a\x42\x73\x68\x67\x4a\x2f\x59\x2b\x51\x2b\x50\x20\x47\
-\x79\x4e\x76\x69\x55\x51\x77\x31\x6f\x45\x64\x56\x39\x77\x46\x55\
-\x55\x42\x49\x71\x67\x64\x4b\x77\x59\x63\x50\x48\x2b\x49\x75\x75\
-\x6d\x38\x43\x65\x78\x65\x44\x52\x4e\x36\x77\x4f\x44\x6d\x6e\x6e\
-\x69\x36\x46\x46\x55\x4c\x61\x49\x54\x78\x6f\x61\x50\x73\x6d\x61\
-\x35\x6f\x6d\x31\x6b\x74\x6d\x34\x36\x52\x6e\x20\x71\x6e\x77\x63\
-\x32\x34\x39\x6a\x66\x6e\x6b\x79\x48\x53\x7a\x53\x4a\x68\x34\x33\
-\x6a\x75\x4d\x64\x65\x32\x6b\x47\x45\x2f\x54\x59\x59\x45\x37\x42\
-\x2f\x2f\x53\x37\x2b\x4b\x58\x2b\x79\x54\x35\x4f\x75\x31\x79\x53\
-\x76\x55\x2f\x76\x6a\x52\x6b\x31\x34\x32\x50\x54\x2b\x52\x4f\x78\
-\x2f\x2b\x46\x42\x79\x75\x54\x64\x20\x33\x64\x32\x78\x33\x57\x35\
-\x49\x36\x68\x43\x35\x74\x4a\x6f\x2f\x6e\x41\x4e\x66\x4b\x47\x2f\
-\x78\x71\x65\x5a\x39\x54\x36\x37\x7a\x4e\x57\x71\x50\x7a\x4e\x51\
-\x6a\x66\x33\x76\x71\x37\x35\x39\x72\x65\x7a\x36\x54\x47\x72\x4e\
-\x4d\x41\x6e\x69\x64\x57\x54\x76\x4f\x4f\x64\x36\x2b\x2f\x51\x6d\
-\x30\x34\x65\x4c\x46\x20\x61\x36\x70\x53\x63\x58\x33\x31\x6c\x75\
-\x65\x76\x5a\x6c\x6c\x63\x56\x78\x76\x46\x74\x74\x74\x53\x56\x41\
-\x62\x76\x52\x48\x62\x68\x38\x76\x6e\x58\x42\x42\x72\x75\x37\x39\
-\x39\x52\x61\x36\x6c\x6b\x35\x50\x6f\x32\x70\x77\x54\x4e\x70\x67\
-\x74\x63\x32\x39\x42\x73\x31\x71\x7a\x44\x4f\x45\x79\x67\x75\x4c\
-\x75\x37\x20\x34\x2b\x54\x6b\x68\x45\x6c\x56\x45\x71\x4c\x36\x56\
-\x78\x70\x49\x66\x64\x2f\x7a\x2b\x71\x74\x76\x2b\x4e\x64\x2f\x2f\
-\x56\x65\x63\x68\x39\x50\x54\x63\x33\x62\x72\x44\x59\x4a\x77\x44\
-\x6b\x46\x33\x37\x7a\x67\x69\x42\x54\x67\x51\x6f\x73\x64\x41\x6d\
-\x46\x4a\x4b\x79\x6e\x56\x48\x2f\x64\x53\x67\x78\x43\x4e\x4c\x20\
-\x73\x63\x36\x6b\x4e\x5a\x72\x41\x6d\x4b\x75\x72\x4b\x36\x62\x54\
-\x4b\x56\x55\x6c\x57\x51\x77\x66\x33\x33\x2f\x49\x7a\x79\x44\x74\
-\x6d\x48\x33\x76\x61\x66\x75\x65\x77\x6b\x36\x6f\x71\x77\x56\x31\
-\x74\x63\x53\x59\x6b\x71\x35\x33\x75\x52\x35\x66\x51\x4d\x79\x70\
-\x74\x74\x74\x68\x53\x30\x4e\x64\x56\x38\x77\x58\x20\x45\x77\x71\
-\x74\x36\x4a\x33\x6b\x44\x70\x5a\x6c\x4b\x53\x45\x4d\x4a\x35\x6b\
-\x55\x47\x66\x79\x49\x76\x74\x47\x65\x77\x48\x48\x59\x48\x39\x79\
-\x48\x63\x4e\x35\x54\x34\x79\x51\x66\x64\x32\x69\x36\x52\x30\x74\
-\x42\x78\x59\x77\x56\x30\x4a\x48\x47\x57\x47\x43\x56\x78\x62\x55\
-\x70\x34\x66\x77\x78\x48\x69\x48\x50\x20\x30\x75\x54\x76\x33\x51\
-\x76\x47\x65\x78\x63\x6e\x71\x42\x53\x43\x30\x53\x54\x41\x35\x32\
-\x47\x30\x75\x41\x6e\x71\x4c\x34\x75\x78\x32\x79\x4e\x6c\x79\x48\
-\x6e\x38\x41\x4a\x6a\x35\x33\x31\x41\x47\x2f\x35\x6a\x35\x64\x41\
-\x78\x77\x53\x63\x64\x2b\x61\x66\x76\x63\x62\x70\x68\x73\x39\x52\
-\x54\x57\x6b\x4e\x2b\x48\x20\x57\x47\x58\x58\x4e\x66\x7a\x6c\x72\
-\x39\x2b\x6a\x72\x57\x61\x36\x65\x4d\x62\x39\x77\x30\x63\x75\x6e\
-\x72\x33\x43\x65\x30\x31\x56\x4c\x57\x6b\x37\x52\x31\x6c\x61\x51\
-\x74\x2b\x42\x42\x71\x74\x4b\x6e\x41\x2b\x63\x6e\x58\x39\x4e\x43\
-\x49\x47\x48\x32\x35\x2b\x6f\x61\x37\x44\x46\x46\x42\x56\x45\x78\
-\x33\x4f\x33\x20\x45\x34\x33\x54\x6d\x35\x73\x62\x31\x71\x74\x31\
-\x6c\x73\x79\x62\x54\x43\x61\x73\x31\x6c\x74\x57\x71\x78\x57\x4c\
-\x78\x53\x4b\x76\x6e\x43\x6b\x4e\x4b\x71\x32\x63\x69\x58\x6d\x7a\
-\x32\x57\x77\x65\x33\x57\x50\x32\x39\x51\x37\x36\x59\x48\x69\x4e\
-\x33\x6c\x63\x44\x4d\x4a\x42\x4e\x38\x64\x69\x33\x61\x59\x56\x4f\
-\x20\x56\x43\x32\x74\x4e\x63\x2b\x65\x50\x51\x50\x67\x37\x64\x75\
-\x33\x33\x4e\x34\x32\x62\x4c\x65\x44\x6d\x53\x51\x66\x53\x77\x4c\
-\x44\x59\x45\x32\x4e\x74\x68\x58\x4c\x30\x32\x65\x34\x48\x70\x77\
-\x57\x48\x71\x57\x51\x72\x51\x50\x4b\x65\x76\x70\x2b\x68\x33\x4d\
-\x39\x4a\x36\x63\x4c\x71\x73\x4b\x4b\x50\x47\x4c\x58\x20\x55\x6c\
-\x5a\x6c\x58\x67\x51\x44\x69\x61\x6b\x30\x68\x46\x5a\x30\x54\x73\
-\x55\x61\x64\x71\x6c\x30\x58\x30\x39\x4f\x74\x6f\x4f\x46\x65\x33\
-\x77\x75\x54\x35\x42\x45\x42\x55\x4c\x32\x44\x52\x56\x44\x76\x48\
-\x63\x38\x6b\x52\x4c\x71\x6d\x66\x78\x43\x4b\x61\x38\x77\x78\x4c\
-\x53\x48\x59\x2f\x65\x72\x37\x41\x34\x2b\x20\x59\x48\x79\x6d\x58\
-\x63\x39\x36\x76\x52\x5a\x56\x76\x44\x44\x6f\x7a\x67\x79\x75\x55\
-\x51\x51\x48\x64\x78\x73\x52\x68\x6d\x35\x62\x49\x53\x73\x59\x6c\
-\x56\x58\x6d\x51\x33\x79\x47\x6e\x7a\x56\x48\x78\x79\x63\x65\x64\
-\x39\x49\x34\x77\x4a\x6d\x59\x44\x6d\x6b\x31\x48\x36\x4e\x4c\x34\
-\x78\x73\x35\x39\x4e\x32\x65\x20\x36\x75\x54\x78\x2b\x51\x2f\x62\
-\x4d\x5a\x4d\x6b\x70\x52\x64\x4a\x32\x47\x77\x6f\x30\x54\x7a\x45\
-\x30\x33\x70\x2b\x2f\x50\x46\x37\x4e\x74\x74\x37\x76\x4e\x74\x79\
-\x63\x2f\x30\x65\x71\x33\x6f\x55\x48\x63\x4b\x57\x44\x77\x54\x6a\
-\x4a\x58\x5a\x6c\x4c\x45\x5a\x50\x4d\x47\x72\x4a\x69\x32\x66\x2f\
-\x77\x4d\x6e\x70\x20\x4e\x32\x79\x33\x68\x68\x41\x71\x50\x42\x61\
-\x55\x79\x66\x55\x57\x45\x6b\x4d\x6d\x44\x61\x61\x2b\x37\x31\x46\
-\x34\x2b\x71\x35\x35\x74\x4c\x74\x6b\x4b\x48\x75\x30\x4d\x42\x32\
-\x54\x30\x78\x75\x76\x75\x75\x4e\x37\x47\x41\x4d\x78\x34\x39\x2f\
-\x7a\x43\x37\x4d\x6e\x57\x54\x39\x2b\x58\x6d\x4f\x71\x6c\x64\x62\
-\x77\x20\x37\x4e\x6b\x35\x33\x6a\x6c\x63\x33\x77\x71\x4c\x51\x34\
-\x45\x69\x61\x73\x59\x6f\x54\x66\x41\x47\x62\x53\x74\x4f\x54\x35\
-\x35\x6a\x54\x59\x55\x79\x4e\x6f\x72\x32\x43\x67\x6f\x5a\x36\x47\
-\x6a\x62\x44\x62\x74\x6d\x7a\x66\x6e\x46\x6b\x72\x49\x63\x79\x75\
-\x4d\x6c\x61\x30\x48\x59\x4d\x65\x62\x52\x47\x4d\x69\x44\x20\x48\
-\x53\x4e\x53\x46\x38\x54\x64\x54\x49\x66\x34\x55\x76\x6b\x56\x46\
-\x43\x67\x6a\x61\x67\x47\x70\x56\x6b\x6e\x61\x36\x59\x65\x66\x45\
-\x6d\x76\x73\x76\x54\x79\x37\x6f\x41\x41\x6a\x43\x64\x78\x42\x47\
-\x2f\x6f\x67\x59\x73\x62\x6a\x63\x57\x57\x74\x48\x58\x7a\x48\x50\
-\x43\x5a\x56\x58\x4c\x77\x4e\x61\x56\x71\x6b\x20\x37\x49\x6f\x45\
-\x4d\x49\x59\x41\x58\x64\x75\x7a\x65\x6c\x68\x7a\x64\x33\x63\x33\
-\x71\x73\x7a\x63\x35\x2b\x4d\x54\x49\x4c\x50\x5a\x62\x4c\x4b\x45\
-\x34\x72\x37\x4d\x52\x6f\x68\x78\x5a\x6b\x75\x4b\x38\x58\x35\x78\
-\x4c\x59\x72\x30\x55\x4d\x63\x45\x32\x31\x52\x72\x62\x6b\x68\x50\
-\x47\x69\x59\x4b\x76\x38\x44\x4d\x20\x2f\x43\x55\x74\x54\x66\x79\
-\x2b\x38\x77\x4a\x49\x4f\x45\x64\x56\x31\x63\x7a\x6e\x53\x35\x7a\
-\x33\x62\x4a\x6f\x64\x76\x65\x39\x6f\x58\x63\x74\x66\x66\x76\x77\
-\x7a\x79\x38\x55\x72\x64\x70\x73\x2f\x63\x58\x6e\x32\x69\x71\x35\
-\x5a\x6f\x63\x30\x55\x35\x33\x78\x4d\x6a\x69\x31\x6b\x31\x58\x63\
-\x61\x78\x52\x52\x55\x20\x77\x66\x6e\x5a\x64\x79\x67\x4d\x64\x33\
-\x64\x2f\x59\x54\x36\x72\x43\x66\x30\x57\x43\x44\x67\x56\x71\x4b\
-\x6f\x4a\x56\x62\x58\x4a\x32\x64\x72\x4a\x33\x42\x4c\x55\x63\x56\
-\x67\x49\x78\x69\x76\x2b\x73\x51\x56\x74\x75\x4a\x63\x52\x45\x73\
-\x68\x6a\x50\x2f\x76\x52\x7a\x34\x50\x33\x78\x75\x63\x35\x74\x72\
-\x73\x65\x20\x4f\x34\x2b\x78\x4b\x6d\x66\x7a\x67\x7a\x42\x35\x71\
-\x6d\x72\x4b\x62\x48\x36\x47\x31\x70\x61\x6d\x36\x79\x6c\x73\x4a\
-\x62\x71\x6f\x54\x6c\x79\x50\x74\x74\x30\x51\x51\x73\x2f\x5a\x36\
-\x54\x7a\x76\x6f\x4b\x67\x52\x44\x48\x2f\x30\x4f\x52\x32\x52\x79\
-\x6c\x53\x50\x77\x33\x7a\x48\x2b\x75\x4a\x77\x41\x52\x2f\x36\x20\
-\x52\x53\x61\x66\x74\x5a\x59\x51\x51\x53\x44\x52\x4b\x35\x63\x32\
-\x39\x76\x30\x4f\x66\x64\x46\x30\x46\x56\x70\x62\x69\x65\x6d\x48\
-\x78\x77\x74\x68\x57\x69\x53\x54\x68\x6b\x33\x62\x74\x6c\x49\x48\
-\x5a\x4c\x54\x4a\x70\x50\x71\x50\x58\x64\x64\x6c\x42\x4c\x71\x50\
-\x35\x50\x51\x6b\x78\x79\x47\x4c\x59\x4a\x77\x37\x20\x61\x6b\x51\
-\x32\x55\x51\x70\x54\x46\x4e\x6a\x48\x6d\x2b\x45\x2b\x6f\x66\x72\
-\x78\x51\x45\x6c\x70\x53\x47\x48\x50\x31\x68\x30\x2b\x73\x46\x39\
-\x4e\x35\x30\x76\x41\x6c\x55\x2b\x31\x70\x77\x5a\x71\x61\x75\x6d\
-\x6d\x4a\x44\x6c\x31\x67\x6e\x64\x77\x65\x6e\x62\x47\x37\x33\x2f\
-\x2f\x44\x34\x4c\x59\x74\x53\x30\x66\x20\x72\x6a\x37\x79\x34\x65\
-\x71\x4b\x39\x58\x6f\x4c\x2f\x68\x70\x6a\x47\x2f\x37\x30\x70\x2f\
-\x2f\x47\x79\x36\x2f\x2b\x67\x57\x6b\x39\x51\x54\x74\x44\x31\x77\
-\x56\x38\x6b\x43\x71\x77\x43\x76\x45\x50\x6f\x61\x41\x73\x4b\x38\
-\x37\x4f\x5a\x4c\x66\x64\x4e\x52\x38\x77\x43\x6f\x79\x47\x55\x6b\
-\x73\x49\x59\x6a\x71\x64\x20\x73\x74\x6c\x73\x38\x6d\x42\x4a\x61\
-\x67\x4d\x4a\x73\x6b\x37\x58\x6e\x4c\x69\x6f\x36\x65\x46\x36\x4c\
-\x30\x77\x69\x62\x56\x4b\x73\x4e\x4e\x36\x66\x6b\x4e\x68\x49\x43\
-\x62\x7a\x44\x41\x70\x68\x55\x35\x76\x62\x4e\x73\x72\x51\x44\x43\
-\x65\x74\x6d\x32\x50\x45\x4f\x2b\x79\x6f\x4e\x48\x4b\x4c\x4a\x4f\
-\x75\x6a\x50\x20\x44\x4a\x57\x51\x70\x51\x78\x61\x79\x58\x53\x79\
-\x59\x44\x71\x56\x67\x48\x78\x51\x6d\x71\x35\x76\x4d\x45\x62\x68\
-\x51\x38\x64\x6d\x66\x55\x39\x5a\x69\x59\x70\x31\x49\x72\x43\x4d\
-\x42\x37\x6f\x36\x56\x44\x35\x49\x30\x32\x77\x55\x6a\x38\x2f\x48\
-\x78\x33\x39\x54\x6f\x4a\x76\x78\x33\x61\x56\x46\x50\x36\x52\x36\
-\x20\x6b\x56\x70\x59\x4d\x66\x45\x41\x47\x79\x64\x6c\x6f\x51\x74\
-\x38\x37\x33\x45\x49\x38\x53\x46\x58\x30\x6c\x49\x42\x55\x31\x67\
-\x70\x50\x36\x65\x6b\x41\x6a\x52\x4b\x6b\x46\x68\x68\x76\x6f\x7a\
-\x71\x79\x71\x75\x42\x32\x77\x76\x6b\x79\x53\x53\x2f\x2b\x35\x79\
-\x69\x4e\x55\x35\x42\x79\x31\x5a\x59\x46\x2f\x2f\x65\x20\x4e\x33\
-\x73\x30\x75\x30\x54\x6e\x39\x46\x34\x57\x74\x74\x35\x44\x69\x4b\
-\x79\x6b\x44\x43\x70\x70\x6a\x53\x33\x71\x4c\x39\x4f\x59\x4f\x55\
-\x53\x54\x78\x72\x76\x69\x55\x35\x39\x35\x71\x6a\x32\x46\x6a\x6a\
-\x37\x31\x2f\x75\x64\x61\x32\x6d\x57\x71\x79\x59\x53\x7a\x30\x77\
-\x76\x52\x56\x43\x6c\x4c\x4a\x76\x4d\x5a\x20\x76\x58\x4e\x4d\x70\
-\x6e\x4e\x73\x58\x54\x47\x64\x4c\x2f\x6e\x77\x34\x59\x71\x50\x48\
-\x2b\x36\x59\x36\x6f\x4b\x2f\x2f\x76\x55\x50\x4e\x45\x33\x44\x79\
-\x39\x63\x39\x30\x38\x55\x7a\x43\x6c\x76\x54\x4f\x79\x43\x6f\x6f\
-\x55\x53\x4a\x4d\x72\x53\x64\x77\x39\x67\x6c\x7a\x31\x39\x38\x79\
-\x39\x75\x33\x44\x58\x33\x62\x20\x53\x74\x70\x54\x45\x42\x5a\x4b\
-\x79\x73\x30\x62\x4b\x38\x73\x42\x72\x4e\x66\x72\x52\x2f\x47\x6c\
-\x38\x62\x31\x35\x37\x7a\x45\x48\x2f\x4e\x72\x30\x74\x2f\x46\x72\
-\x2f\x50\x34\x78\x51\x4f\x75\x59\x4c\x33\x37\x59\x6e\x34\x66\x50\
-\x4c\x4b\x33\x75\x49\x45\x70\x70\x52\x53\x47\x63\x55\x4b\x55\x4d\
-\x69\x38\x55\x4a\x20\x39\x57\x78\x4b\x43\x43\x72\x54\x74\x4b\x54\
-\x55\x33\x4a\x71\x32\x33\x54\x43\x5a\x6c\x6b\x79\x6d\x42\x55\x59\
-\x48\x78\x75\x6f\x49\x68\x38\x39\x72\x6d\x47\x69\x48\x67\x62\x76\
-\x39\x76\x77\x65\x39\x66\x38\x52\x54\x69\x32\x36\x36\x33\x6a\x31\
-\x30\x45\x67\x4e\x42\x4d\x61\x6c\x71\x54\x47\x48\x5a\x62\x46\x59\
-\x6f\x20\x70\x65\x68\x55\x68\x38\x45\x41\x41\x58\x2b\x34\x45\x30\
-\x61\x54\x75\x61\x4d\x6a\x68\x43\x69\x4f\x74\x64\x63\x66\x34\x72\
-\x2b\x6c\x6a\x4a\x54\x6b\x47\x34\x34\x52\x55\x71\x56\x55\x44\x76\
-\x43\x33\x6a\x63\x51\x2f\x55\x37\x4c\x77\x38\x4f\x7a\x6b\x63\x33\
-\x30\x37\x6d\x72\x79\x71\x79\x4a\x2b\x33\x57\x6d\x68\x31\x20\x54\
-\x39\x44\x57\x48\x69\x73\x68\x53\x30\x63\x4d\x4d\x50\x4e\x6a\x66\
-\x2b\x31\x51\x6c\x6a\x41\x38\x47\x6b\x43\x66\x61\x6f\x63\x44\x35\
-\x6b\x73\x2f\x42\x36\x43\x6a\x47\x56\x54\x59\x69\x73\x6c\x6b\x68\
-\x72\x61\x4f\x62\x62\x4e\x6a\x73\x32\x31\x51\x56\x68\x46\x63\x6a\
-\x37\x55\x6c\x35\x2b\x66\x50\x71\x4d\x6f\x70\x20\x6f\x59\x50\x37\
-\x2b\x78\x58\x6c\x54\x48\x46\x37\x2b\x78\x4f\x37\x70\x75\x65\x62\
-\x33\x2f\x31\x50\x6e\x4a\x34\x2b\x4a\x33\x68\x44\x77\x4b\x47\x56\
-\x78\x53\x73\x6a\x64\x43\x6f\x6c\x57\x52\x4b\x32\x57\x50\x44\x69\
-\x35\x65\x39\x34\x2f\x37\x61\x68\x37\x2b\x39\x78\x72\x6d\x64\x53\
-\x56\x67\x54\x66\x4d\x5a\x31\x4f\x20\x75\x62\x75\x37\x45\x37\x38\
-\x30\x69\x4b\x4c\x62\x2f\x66\x32\x39\x4b\x45\x62\x48\x4e\x4a\x31\
-\x78\x53\x30\x54\x71\x64\x49\x38\x2f\x42\x36\x6a\x4b\x66\x52\x51\
-\x45\x50\x45\x67\x54\x4f\x76\x64\x58\x46\x46\x66\x79\x59\x62\x2f\
-\x2f\x72\x44\x5a\x53\x33\x64\x67\x4c\x4b\x52\x73\x6e\x4a\x51\x49\
-\x38\x73\x6c\x49\x72\x20\x5a\x61\x6d\x72\x4b\x64\x50\x4a\x44\x47\
-\x73\x72\x32\x51\x45\x69\x4f\x36\x64\x70\x74\x6e\x54\x39\x6c\x71\
-\x6f\x75\x6d\x63\x38\x71\x38\x61\x47\x6a\x68\x6d\x71\x6d\x6b\x43\
-\x56\x6d\x79\x78\x4d\x56\x58\x73\x4c\x42\x35\x4d\x76\x33\x6e\x69\
-\x77\x41\x72\x59\x35\x2b\x49\x4f\x73\x53\x52\x66\x4b\x39\x4e\x57\
-\x55\x32\x20\x78\x62\x58\x57\x6c\x4c\x62\x6d\x36\x36\x2b\x2b\x59\
-\x72\x35\x59\x38\x4d\x4f\x50\x66\x2b\x62\x6a\x7a\x63\x63\x63\x56\
-\x39\x79\x31\x4c\x63\x62\x71\x67\x2b\x2b\x4d\x51\x6b\x37\x52\x7a\
-\x37\x52\x61\x68\x4b\x79\x53\x4f\x54\x6c\x4d\x76\x76\x69\x39\x56\
-\x6d\x64\x67\x4b\x34\x53\x51\x56\x63\x52\x7a\x43\x4d\x71\x4e\x20\
-\x59\x6e\x34\x68\x69\x5a\x6b\x4e\x4c\x6b\x44\x6e\x65\x67\x46\x66\
-\x6f\x6d\x2b\x70\x45\x31\x70\x4f\x39\x48\x33\x44\x46\x77\x62\x72\
-\x44\x32\x33\x78\x5a\x46\x34\x6c\x43\x59\x43\x6a\x6e\x62\x35\x6e\
-\x75\x2b\x2b\x2f\x64\x2b\x79\x34\x4c\x77\x46\x72\x6e\x6d\x72\x65\
-\x65\x31\x7a\x66\x30\x2f\x59\x69\x79\x61\x36\x55\x20\x5a\x72\x4e\
-\x72\x4b\x4f\x73\x4a\x74\x71\x7a\x45\x35\x67\x75\x4b\x79\x57\x54\
-\x47\x74\x39\x39\x2b\x79\x2f\x6e\x46\x6b\x75\x42\x33\x54\x47\x6f\
-\x34\x4f\x62\x56\x38\x2f\x2b\x64\x2f\x34\x76\x76\x76\x2f\x78\x6e\
-\x46\x42\x71\x31\x62\x75\x6e\x36\x44\x4e\x6a\x31\x61\x42\x38\x52\
-\x2f\x56\x6a\x69\x76\x4b\x61\x73\x54\x20\x5a\x76\x4e\x6e\x37\x48\
-\x59\x4b\x59\x79\x73\x78\x48\x42\x57\x44\x42\x4a\x38\x66\x73\x67\
-\x5a\x45\x36\x47\x6d\x62\x59\x65\x74\x78\x79\x79\x62\x6b\x36\x44\
-\x34\x2f\x35\x38\x4d\x64\x65\x7a\x38\x74\x64\x73\x63\x73\x6b\x73\
-\x50\x6a\x78\x67\x68\x71\x47\x6e\x41\x67\x2b\x5a\x56\x64\x31\x32\
-\x4e\x30\x77\x57\x51\x32\x20\x52\x32\x73\x68\x44\x36\x52\x73\x69\
-\x46\x31\x7a\x54\x39\x64\x76\x6d\x45\x34\x72\x46\x73\x74\x4a\x78\
-\x41\x42\x53\x76\x47\x32\x51\x4f\x54\x6c\x73\x6e\x31\x74\x63\x50\
-\x75\x64\x6d\x48\x4a\x35\x6e\x7a\x7a\x71\x49\x39\x7a\x30\x70\x4a\
-\x2f\x7a\x75\x36\x32\x39\x34\x66\x66\x6d\x53\x79\x2f\x4e\x6e\x4c\
-\x4f\x63\x6e\x20\x6f\x76\x63\x5a\x43\x35\x74\x61\x72\x66\x65\x75\
-\x4c\x33\x31\x2b\x58\x42\x4d\x54\x4a\x4c\x6a\x65\x4e\x45\x33\x75\
-\x6c\x2b\x52\x57\x4a\x45\x74\x6d\x44\x4c\x5a\x73\x4e\x70\x75\x38\
-\x55\x7a\x34\x43\x78\x77\x37\x75\x65\x5a\x79\x66\x65\x68\x68\x6a\
-\x44\x47\x68\x63\x55\x45\x49\x59\x65\x4c\x4b\x58\x44\x74\x72\x34\
-\x20\x6f\x61\x63\x56\x34\x79\x6b\x45\x38\x31\x67\x6e\x2f\x39\x4b\
-\x32\x44\x38\x38\x2f\x76\x6d\x6e\x6e\x5a\x46\x56\x4b\x67\x39\x32\
-\x59\x41\x6c\x4e\x55\x58\x4e\x31\x63\x73\x39\x6e\x75\x36\x4a\x33\
-\x55\x68\x5a\x65\x61\x36\x6f\x48\x5a\x62\x4d\x62\x76\x76\x76\x6d\
-\x47\x53\x61\x56\x70\x6d\x6a\x75\x32\x32\x79\x74\x65\x20\x76\x4a\
-\x6a\x51\x74\x68\x2f\x35\x6c\x33\x2f\x35\x76\x31\x68\x76\x72\x71\
-\x6b\x6d\x6d\x71\x37\x66\x45\x47\x68\x51\x75\x67\x4d\x6c\x65\x56\
-\x39\x74\x34\x35\x6a\x50\x6e\x71\x45\x6f\x30\x61\x61\x67\x6a\x2b\
-\x52\x72\x59\x30\x76\x71\x79\x53\x77\x58\x77\x55\x7a\x32\x2f\x6d\
-\x36\x33\x45\x78\x67\x37\x79\x72\x2b\x6e\x20\x31\x33\x37\x41\x6c\
-\x34\x45\x39\x70\x42\x35\x62\x46\x49\x38\x37\x5a\x43\x6a\x63\x6d\
-\x64\x71\x34\x62\x46\x78\x2b\x4a\x6c\x35\x65\x77\x58\x6c\x38\x37\
-\x2f\x4a\x67\x55\x69\x48\x67\x6f\x73\x36\x4c\x4e\x41\x50\x42\x6f\
-\x72\x58\x46\x6d\x69\x4c\x48\x46\x39\x74\x32\x52\x39\x64\x76\x36\
-\x66\x75\x47\x30\x37\x4d\x35\x20\x30\x30\x6d\x42\x36\x78\x75\x73\
-\x56\x68\x67\x55\x66\x64\x75\x4c\x2f\x36\x7a\x6b\x2f\x7a\x6e\x6a\
-\x4a\x51\x6a\x56\x4c\x61\x47\x50\x47\x64\x6b\x63\x4e\x61\x55\x55\
-\x51\x59\x6d\x2f\x53\x62\x34\x4b\x4e\x51\x43\x6b\x59\x57\x44\x4c\
-\x71\x42\x41\x69\x61\x38\x5a\x69\x6c\x45\x6a\x74\x57\x36\x56\x5a\
-\x54\x47\x65\x38\x20\x65\x76\x47\x53\x33\x37\x33\x2b\x68\x6d\x6c\
-\x52\x51\x65\x65\x6f\x54\x55\x47\x68\x44\x44\x62\x49\x75\x59\x6f\
-\x6b\x53\x54\x38\x4b\x66\x77\x51\x74\x54\x76\x32\x34\x70\x77\x38\
-\x6e\x69\x79\x78\x59\x30\x50\x65\x4f\x64\x74\x65\x77\x32\x32\x7a\
-\x5a\x72\x6a\x65\x30\x75\x32\x59\x76\x4f\x48\x39\x49\x4a\x4e\x69\
-\x37\x20\x76\x35\x44\x43\x46\x6f\x6a\x77\x57\x54\x4a\x6a\x67\x37\
-\x79\x38\x6b\x72\x51\x72\x41\x4b\x32\x7a\x4b\x74\x62\x54\x47\x65\
-\x37\x6a\x4c\x39\x41\x41\x33\x68\x46\x63\x4c\x2b\x6c\x4c\x52\x37\
-\x69\x66\x50\x32\x63\x43\x48\x6c\x74\x46\x6a\x74\x33\x59\x55\x38\
-\x30\x59\x49\x64\x63\x32\x32\x59\x34\x58\x68\x61\x33\x45\x20\x70\
-\x55\x77\x46\x4f\x54\x78\x42\x67\x74\x6b\x68\x34\x49\x4c\x6e\x71\
-\x32\x2b\x2f\x77\x56\x70\x4e\x73\x33\x31\x67\x75\x37\x31\x68\x50\
-\x6a\x65\x55\x52\x63\x64\x66\x66\x76\x67\x6e\x72\x74\x37\x2f\x69\
-\x62\x70\x30\x4b\x4c\x31\x44\x71\x59\x59\x51\x31\x62\x36\x31\x71\
-\x6a\x46\x6d\x51\x6a\x30\x39\x6f\x57\x6e\x6b\x20\x65\x30\x49\x30\
-\x43\x53\x65\x54\x79\x64\x36\x6b\x45\x51\x30\x61\x71\x57\x73\x77\
-\x52\x73\x34\x4f\x4a\x30\x73\x61\x79\x4f\x50\x37\x66\x71\x6f\x76\
-\x44\x34\x38\x37\x4c\x4f\x46\x38\x62\x4b\x63\x63\x44\x37\x44\x30\
-\x74\x36\x7a\x45\x42\x70\x6e\x6e\x4b\x72\x45\x37\x38\x66\x2b\x63\
-\x62\x39\x68\x75\x48\x6e\x43\x75\x20\x35\x65\x52\x30\x41\x59\x67\
-\x6f\x55\x31\x47\x59\x66\x42\x2b\x4a\x62\x6a\x64\x63\x63\x78\x72\
-\x70\x2b\x32\x6f\x48\x68\x2f\x6c\x2f\x61\x53\x49\x6f\x6a\x62\x7a\
-\x55\x6f\x62\x6e\x34\x65\x43\x77\x59\x4a\x62\x74\x53\x61\x55\x6f\
-\x71\x58\x56\x4b\x58\x45\x35\x36\x64\x58\x2f\x4b\x37\x62\x37\x36\
-\x6a\x73\x67\x56\x47\x20\x61\x36\x7a\x53\x46\x4d\x61\x69\x77\x78\
-\x41\x37\x66\x67\x71\x7a\x47\x43\x2b\x43\x34\x78\x7a\x53\x64\x4d\
-\x30\x4a\x69\x45\x6e\x71\x62\x5a\x6d\x6b\x50\x61\x72\x6d\x35\x4c\
-\x32\x6f\x7a\x52\x31\x75\x45\x6f\x66\x6e\x53\x41\x76\x79\x47\x4b\
-\x51\x62\x33\x32\x4d\x51\x71\x39\x53\x6a\x38\x52\x67\x56\x4d\x4a\
-\x6c\x64\x20\x34\x4a\x46\x69\x78\x34\x4e\x73\x76\x64\x56\x61\x43\
-\x69\x34\x36\x4a\x33\x45\x77\x31\x32\x4e\x56\x35\x50\x71\x70\x34\
-\x58\x55\x34\x69\x49\x35\x31\x78\x4f\x46\x67\x53\x7a\x35\x4f\x57\
-\x6b\x56\x54\x72\x59\x67\x63\x61\x34\x71\x76\x74\x41\x73\x45\x72\
-\x2f\x4c\x78\x41\x52\x32\x44\x77\x6f\x35\x64\x73\x79\x4c\x51\x20\
-\x59\x33\x56\x67\x55\x6c\x64\x38\x65\x50\x38\x75\x5a\x31\x68\x62\
-\x61\x30\x56\x4f\x51\x43\x75\x4b\x71\x71\x59\x6f\x5a\x7a\x79\x37\
-\x66\x45\x58\x76\x50\x66\x66\x33\x74\x33\x69\x33\x59\x7a\x34\x31\
-\x31\x45\x58\x4c\x2b\x37\x66\x2f\x77\x72\x75\x33\x2f\x78\x33\x63\
-\x50\x61\x35\x76\x5a\x45\x57\x6c\x51\x48\x52\x73\x20\x4c\x49\x76\
-\x35\x43\x58\x33\x6e\x73\x37\x79\x42\x39\x7a\x36\x58\x57\x35\x59\
-\x69\x4e\x45\x45\x6d\x65\x4c\x73\x46\x50\x48\x64\x33\x4e\x7a\x53\
-\x37\x54\x59\x37\x46\x47\x61\x58\x70\x6d\x69\x37\x66\x67\x38\x51\
-\x32\x52\x58\x52\x71\x65\x4a\x43\x4f\x45\x4b\x54\x6d\x48\x6e\x34\
-\x51\x59\x68\x49\x64\x56\x30\x48\x6b\x20\x38\x73\x71\x4e\x79\x54\
-\x74\x49\x36\x4a\x32\x73\x2f\x45\x6f\x49\x37\x51\x6d\x49\x4e\x51\
-\x51\x41\x41\x43\x41\x41\x53\x55\x52\x42\x56\x45\x71\x48\x58\x4b\
-\x6e\x49\x57\x49\x58\x44\x30\x66\x53\x4e\x62\x49\x42\x42\x79\x6e\
-\x53\x31\x33\x51\x35\x6c\x50\x45\x57\x68\x57\x47\x39\x75\x32\x65\
-\x37\x75\x71\x53\x65\x57\x20\x2b\x57\x78\x43\x59\x62\x54\x55\x47\
-\x2f\x45\x69\x39\x43\x32\x4c\x68\x73\x37\x4a\x74\x43\x45\x34\x48\
-\x4c\x47\x77\x71\x52\x6f\x34\x6e\x44\x6f\x6b\x69\x38\x42\x67\x6c\
-\x4c\x7a\x47\x2f\x6d\x49\x49\x49\x65\x36\x53\x77\x6c\x4a\x79\x67\
-\x57\x46\x33\x6c\x4c\x70\x75\x4d\x67\x47\x31\x4c\x42\x41\x36\x61\
-\x49\x79\x79\x20\x58\x4a\x78\x64\x38\x70\x2f\x2f\x38\x54\x2f\x7a\
-\x6e\x37\x37\x39\x52\x32\x70\x54\x35\x34\x6c\x6b\x72\x52\x55\x66\
-\x4b\x77\x72\x35\x39\x73\x46\x6a\x69\x70\x6a\x6f\x71\x32\x51\x42\
-\x73\x56\x62\x4c\x6d\x49\x31\x39\x61\x76\x62\x47\x6f\x57\x54\x64\
-\x37\x39\x71\x57\x62\x64\x4f\x77\x62\x58\x5a\x79\x6a\x39\x72\x6d\
-\x20\x5a\x2b\x50\x44\x2f\x6e\x68\x55\x53\x6b\x49\x55\x72\x6d\x2f\
-\x52\x4b\x6d\x41\x30\x6b\x76\x37\x6d\x68\x66\x61\x58\x45\x37\x65\
-\x44\x70\x6e\x4d\x42\x5a\x59\x59\x79\x33\x42\x34\x48\x57\x68\x59\
-\x70\x6d\x31\x61\x77\x45\x4a\x41\x2f\x52\x4c\x6e\x30\x49\x66\x59\
-\x33\x6f\x46\x50\x65\x4f\x78\x46\x51\x38\x67\x36\x52\x20\x73\x50\
-\x67\x43\x34\x4f\x51\x67\x53\x66\x4a\x7a\x66\x74\x2f\x6e\x6b\x4c\
-\x37\x78\x65\x32\x6c\x56\x30\x6c\x70\x71\x76\x65\x38\x32\x4b\x37\
-\x72\x5a\x67\x71\x4b\x4d\x35\x75\x42\x6d\x75\x31\x65\x4b\x43\x35\
-\x4a\x35\x4a\x45\x54\x64\x6f\x70\x4b\x48\x65\x48\x74\x39\x68\x51\
-\x71\x42\x38\x2f\x4e\x7a\x6c\x72\x4d\x70\x20\x52\x67\x65\x75\x50\
-\x2f\x78\x41\x33\x2f\x64\x38\x2f\x64\x58\x2f\x54\x4e\x74\x76\x30\
-\x55\x6f\x41\x43\x57\x55\x4d\x39\x58\x52\x47\x32\x7a\x70\x43\x73\
-\x50\x68\x52\x35\x56\x74\x52\x4e\x4a\x4f\x79\x57\x6f\x6d\x63\x72\
-\x67\x31\x34\x37\x33\x4c\x65\x32\x71\x53\x65\x6a\x59\x52\x75\x55\
-\x32\x6e\x6d\x70\x34\x6b\x4a\x20\x66\x6c\x52\x6a\x59\x64\x38\x73\
-\x48\x36\x68\x77\x49\x76\x53\x37\x76\x38\x75\x6d\x7a\x79\x54\x75\
-\x61\x71\x6f\x6a\x6d\x57\x4a\x61\x41\x51\x6a\x4b\x52\x33\x54\x55\
-\x59\x4b\x79\x69\x61\x62\x66\x30\x72\x71\x63\x71\x44\x4e\x4e\x70\
-\x6e\x52\x58\x6c\x30\x72\x55\x6f\x4e\x4f\x4d\x31\x4e\x6b\x53\x52\
-\x71\x41\x48\x2f\x20\x39\x52\x42\x52\x53\x61\x56\x45\x31\x4d\x6d\
-\x50\x37\x30\x75\x4a\x51\x4a\x69\x4b\x33\x30\x30\x51\x35\x6b\x6c\
-\x5a\x6c\x76\x6d\x36\x4e\x5a\x42\x30\x6a\x34\x30\x74\x42\x49\x41\
-\x4a\x6d\x76\x4f\x7a\x43\x31\x36\x39\x65\x4d\x6e\x5a\x38\x70\x52\
-\x4a\x4e\x5a\x54\x73\x31\x67\x70\x36\x4c\x39\x57\x66\x5a\x37\x4d\
-\x4a\x20\x74\x6a\x51\x45\x46\x36\x52\x6b\x75\x5a\x64\x46\x56\x34\
-\x64\x68\x4d\x79\x47\x49\x44\x4b\x47\x4c\x4d\x68\x66\x41\x58\x67\
-\x67\x69\x46\x52\x46\x4b\x39\x2f\x78\x30\x6b\x34\x52\x64\x46\x34\
-\x57\x4c\x30\x79\x4b\x5a\x53\x42\x74\x4a\x76\x57\x38\x38\x66\x76\
-\x65\x73\x6c\x4e\x77\x6c\x43\x68\x76\x53\x46\x38\x56\x53\x20\x59\
-\x57\x6d\x46\x47\x6c\x75\x5a\x41\x71\x39\x71\x45\x66\x6f\x64\x49\
-\x33\x46\x66\x30\x44\x35\x6c\x58\x75\x32\x68\x71\x4b\x6b\x71\x30\
-\x78\x4d\x63\x31\x4b\x66\x4f\x6b\x58\x35\x50\x50\x70\x68\x7a\x54\
-\x76\x61\x73\x45\x61\x48\x32\x39\x50\x51\x30\x66\x35\x65\x4a\x56\
-\x5a\x32\x43\x6b\x74\x53\x57\x5a\x2b\x66\x6e\x20\x4e\x4f\x73\x31\
-\x48\x39\x2b\x2f\x78\x33\x55\x64\x4c\x31\x2b\x2b\x6f\x69\x34\x4c\
-\x31\x4b\x4a\x6d\x2f\x58\x44\x4e\x48\x2f\x2f\x34\x54\x37\x7a\x2b\
-\x2b\x68\x2f\x52\x52\x74\x45\x37\x79\x54\x47\x30\x31\x6d\x4b\x4b\
-\x69\x56\x51\x6a\x4b\x68\x52\x4b\x47\x31\x78\x77\x56\x4e\x4d\x4a\
-\x71\x39\x56\x39\x2f\x71\x35\x45\x20\x6a\x30\x6f\x5a\x44\x4f\x76\
-\x31\x47\x74\x63\x50\x77\x72\x78\x37\x39\x78\x51\x51\x48\x79\x35\
-\x6e\x6c\x70\x44\x4e\x53\x54\x45\x56\x34\x33\x47\x49\x63\x44\x43\
-\x4b\x6b\x5a\x6b\x7a\x2b\x43\x67\x70\x4f\x79\x44\x42\x34\x73\x6b\
-\x4d\x53\x71\x5a\x34\x43\x43\x45\x7a\x50\x4a\x49\x35\x44\x46\x4c\
-\x4b\x4c\x41\x54\x5a\x20\x30\x61\x66\x54\x4b\x55\x45\x72\x74\x72\
-\x76\x4e\x51\x47\x49\x4f\x59\x53\x38\x66\x62\x6d\x67\x36\x6d\x35\
-\x77\x71\x58\x70\x69\x73\x39\x4f\x6e\x35\x4a\x66\x48\x69\x41\x65\
-\x6b\x4d\x77\x63\x58\x7a\x65\x4f\x70\x4a\x78\x57\x37\x62\x69\x4b\
-\x56\x56\x46\x41\x51\x48\x52\x6c\x6d\x71\x53\x4c\x51\x2b\x57\x53\
-\x35\x35\x20\x2b\x66\x77\x56\x35\x2b\x66\x6e\x6b\x70\x65\x49\x34\
-\x6d\x46\x39\x78\x2f\x58\x31\x74\x66\x6a\x63\x44\x79\x74\x6d\x69\
-\x7a\x6e\x6e\x35\x2b\x63\x45\x50\x56\x53\x64\x4b\x6f\x71\x43\x70\
-\x6d\x75\x6b\x78\x34\x77\x68\x39\x46\x48\x76\x73\x2b\x33\x5a\x62\
-\x4c\x61\x6a\x4f\x4b\x36\x77\x56\x72\x4a\x73\x4a\x42\x4a\x37\x20\
-\x50\x6b\x52\x72\x48\x77\x4e\x4a\x4c\x76\x32\x79\x5a\x38\x34\x36\
-\x44\x31\x30\x66\x69\x78\x56\x5a\x4b\x31\x6b\x34\x6f\x2f\x6d\x55\
-\x6d\x44\x37\x6a\x77\x45\x77\x4f\x55\x57\x52\x66\x50\x38\x64\x74\
-\x46\x4a\x47\x51\x4a\x35\x6b\x4a\x43\x45\x77\x73\x2f\x6b\x48\x49\
-\x62\x48\x44\x31\x46\x44\x7a\x32\x68\x65\x31\x7a\x20\x43\x4f\x68\
-\x54\x6b\x33\x32\x38\x57\x6a\x6e\x6e\x68\x70\x4a\x58\x58\x6d\x51\
-\x44\x44\x4a\x4a\x68\x63\x48\x74\x39\x77\x2b\x6e\x70\x36\x57\x69\
-\x79\x71\x77\x77\x2b\x47\x4b\x55\x34\x4f\x7a\x6e\x68\x77\x37\x74\
-\x33\x39\x47\x33\x4c\x2b\x37\x64\x76\x63\x56\x33\x44\x35\x59\x74\
-\x58\x7a\x4f\x59\x6e\x4b\x4f\x58\x5a\x20\x62\x46\x64\x38\x2f\x36\
-\x66\x2f\x78\x6c\x64\x66\x2f\x55\x66\x71\x36\x5a\x49\x51\x78\x49\
-\x65\x61\x54\x4f\x66\x30\x7a\x53\x32\x68\x47\x4b\x51\x63\x55\x37\
-\x5a\x31\x33\x2f\x65\x35\x4f\x47\x6a\x69\x6d\x52\x4c\x56\x30\x4e\
-\x62\x39\x4f\x75\x66\x33\x50\x5a\x5a\x53\x47\x4b\x2b\x57\x51\x31\
-\x77\x73\x68\x4a\x42\x33\x20\x6c\x4c\x46\x50\x34\x73\x4a\x2b\x70\
-\x6f\x5a\x7a\x62\x70\x43\x41\x69\x4f\x66\x71\x52\x67\x77\x50\x47\
-\x44\x49\x73\x30\x76\x65\x4f\x75\x5a\x56\x41\x4c\x6d\x64\x6e\x71\
-\x30\x45\x39\x41\x43\x51\x45\x4d\x62\x36\x2b\x39\x4a\x6c\x6a\x47\
-\x6c\x33\x44\x34\x68\x71\x47\x43\x5a\x6a\x76\x4d\x78\x48\x41\x5a\
-\x65\x46\x70\x20\x32\x35\x61\x36\x4c\x41\x43\x70\x61\x47\x53\x74\
-\x4a\x54\x69\x6f\x62\x63\x33\x6c\x35\x53\x57\x76\x58\x37\x77\x43\
-\x52\x4f\x75\x6e\x33\x65\x37\x34\x36\x64\x31\x50\x58\x4e\x31\x63\
-\x43\x33\x44\x55\x64\x57\x67\x4d\x31\x77\x38\x33\x33\x4b\x33\x75\
-\x65\x50\x48\x71\x4f\x64\x50\x35\x6a\x4e\x75\x48\x57\x33\x52\x38\
-\x20\x2f\x6e\x33\x66\x45\x79\x4c\x62\x5a\x62\x50\x5a\x30\x50\x64\
-\x2b\x62\x2b\x46\x4f\x49\x59\x6c\x30\x54\x32\x6e\x68\x53\x6f\x4c\
-\x4b\x68\x50\x32\x78\x4e\x75\x36\x44\x64\x49\x35\x6b\x62\x53\x6d\
-\x6c\x32\x47\x37\x46\x68\x30\x78\x70\x62\x4f\x50\x76\x47\x76\x76\
-\x6d\x34\x2b\x64\x75\x78\x39\x6c\x4d\x53\x71\x6b\x63\x20\x54\x4d\
-\x33\x61\x41\x58\x46\x46\x64\x70\x47\x70\x37\x35\x30\x55\x66\x49\
-\x7a\x31\x62\x34\x44\x6a\x6b\x32\x54\x38\x51\x42\x34\x2f\x6e\x50\
-\x32\x32\x74\x7a\x75\x6d\x4e\x66\x51\x7a\x59\x6c\x42\x35\x4d\x44\
-\x44\x73\x47\x4d\x71\x6b\x55\x6c\x35\x6b\x38\x47\x44\x31\x73\x4d\
-\x62\x33\x6f\x75\x76\x68\x4a\x4b\x67\x54\x20\x4f\x31\x73\x36\x32\
-\x48\x76\x50\x69\x38\x74\x4c\x2f\x6e\x52\x2f\x52\x31\x56\x59\x4e\
-\x75\x73\x48\x66\x76\x78\x2b\x77\x33\x66\x66\x2f\x52\x35\x62\x54\
-\x56\x6a\x4d\x43\x7a\x61\x37\x6c\x68\x39\x2b\x2b\x4f\x38\x38\x75\
-\x2f\x79\x4b\x35\x38\x2b\x66\x30\x37\x59\x64\x5a\x32\x66\x6e\x2f\
-\x50\x44\x39\x52\x36\x62\x54\x20\x6f\x62\x4f\x31\x31\x70\x51\x54\
-\x55\x65\x73\x32\x33\x6d\x42\x4e\x4b\x55\x55\x73\x2f\x59\x68\x34\
-\x72\x63\x53\x6e\x4d\x34\x71\x6f\x6a\x54\x70\x6b\x68\x63\x74\x35\
-\x30\x72\x30\x4a\x6c\x39\x45\x52\x30\x37\x58\x43\x55\x4f\x38\x75\
-\x68\x41\x42\x78\x35\x39\x41\x78\x57\x39\x2b\x72\x36\x41\x63\x78\
-\x73\x50\x2f\x54\x20\x68\x42\x74\x45\x65\x33\x74\x57\x4b\x36\x6d\
-\x48\x57\x4a\x57\x6c\x79\x44\x44\x47\x67\x5a\x39\x4d\x71\x74\x36\
-\x37\x44\x4e\x65\x48\x75\x73\x34\x45\x42\x44\x30\x4b\x63\x61\x53\
-\x2b\x54\x2f\x6c\x38\x6f\x34\x65\x58\x64\x2f\x4b\x55\x6a\x4a\x76\
-\x37\x6d\x72\x43\x6e\x35\x71\x35\x69\x6a\x63\x4a\x4a\x61\x65\x6d\
-\x61\x20\x46\x6d\x73\x4c\x43\x6d\x32\x77\x46\x4a\x78\x66\x6e\x50\
-\x48\x56\x71\x39\x65\x63\x6e\x4a\x78\x45\x42\x4e\x48\x7a\x35\x73\
-\x30\x62\x2f\x76\x4c\x6d\x4c\x2b\x7a\x61\x4c\x65\x68\x41\x35\x33\
-\x75\x52\x68\x6c\x43\x41\x44\x74\x77\x39\x33\x4c\x4c\x61\x33\x65\
-\x63\x64\x54\x64\x42\x73\x34\x57\x79\x75\x4e\x35\x76\x49\x20\x59\
-\x68\x4b\x66\x76\x4b\x6f\x71\x64\x70\x73\x64\x53\x6b\x55\x42\x34\
-\x4e\x45\x6b\x7a\x4d\x38\x42\x38\x73\x36\x66\x46\x6f\x33\x78\x65\
-\x4d\x31\x39\x45\x66\x56\x55\x6e\x53\x63\x76\x69\x45\x6f\x70\x6c\
-\x4a\x57\x71\x55\x66\x6c\x59\x78\x53\x4e\x4f\x73\x31\x4c\x79\x35\
-\x6c\x36\x77\x66\x6d\x79\x72\x45\x72\x74\x53\x20\x41\x58\x69\x50\
-\x36\x31\x76\x52\x45\x66\x46\x53\x6b\x56\x5a\x48\x5a\x4d\x74\x7a\
-\x5a\x43\x6b\x38\x4f\x4f\x65\x6e\x54\x4e\x49\x6e\x50\x7a\x50\x36\
-\x2f\x66\x42\x7a\x68\x37\x75\x6e\x4e\x54\x47\x77\x48\x71\x44\x5a\
-\x62\x4f\x48\x55\x6f\x34\x4b\x4a\x49\x45\x47\x49\x43\x62\x62\x31\
-\x33\x6e\x6d\x30\x31\x68\x41\x6e\x20\x36\x6d\x77\x32\x6b\x62\x68\
-\x58\x6b\x4e\x6f\x52\x68\x53\x72\x34\x34\x63\x63\x2f\x38\x76\x4c\
-\x46\x61\x36\x59\x4c\x77\x32\x4a\x57\x59\x7a\x57\x38\x66\x2f\x4e\
-\x48\x58\x4c\x2f\x6d\x34\x75\x49\x5a\x56\x56\x55\x4f\x75\x57\x6b\
-\x45\x55\x73\x48\x54\x36\x58\x51\x71\x30\x75\x63\x52\x55\x51\x4e\
-\x69\x4a\x6b\x4f\x5a\x20\x48\x38\x44\x68\x66\x61\x52\x46\x42\x49\
-\x6a\x6e\x47\x76\x51\x78\x38\x77\x42\x68\x32\x41\x48\x37\x76\x6b\
-\x63\x5a\x41\x62\x43\x36\x5a\x4a\x47\x4d\x4a\x6c\x32\x36\x78\x2f\
-\x52\x65\x33\x2f\x64\x38\x2f\x50\x69\x52\x71\x71\x71\x59\x54\x71\
-\x63\x35\x6d\x30\x4b\x70\x51\x55\x31\x4e\x48\x72\x4d\x6b\x41\x6e\
-\x64\x64\x20\x78\x32\x61\x7a\x34\x66\x62\x32\x6c\x70\x4f\x54\x6b\
-\x37\x32\x73\x38\x37\x31\x72\x44\x6c\x34\x55\x43\x6d\x4c\x7a\x61\
-\x74\x2f\x4d\x69\x75\x2b\x53\x46\x6d\x71\x5a\x6e\x78\x4b\x6f\x54\
-\x70\x6b\x4b\x72\x6e\x4e\x4d\x79\x68\x72\x51\x7a\x4b\x63\x4c\x76\
-\x76\x6e\x71\x57\x35\x35\x66\x58\x49\x4a\x58\x74\x47\x33\x48\x20\
-\x77\x38\x4d\x44\x37\x39\x36\x39\x34\x65\x37\x68\x6a\x6a\x37\x30\
-\x74\x4b\x37\x42\x78\x63\x49\x35\x53\x6f\x76\x79\x41\x53\x61\x5a\
-\x6b\x34\x47\x69\x4c\x4f\x68\x32\x4c\x76\x76\x42\x6d\x38\x32\x47\
-\x33\x57\x59\x4c\x57\x6d\x6f\x45\x75\x71\x37\x50\x69\x6e\x50\x57\
-\x32\x6c\x69\x6d\x34\x48\x46\x2b\x34\x52\x69\x77\x20\x4f\x54\x59\
-\x2b\x30\x33\x46\x39\x33\x34\x76\x4d\x5a\x63\x6f\x52\x48\x53\x47\
-\x7a\x34\x2b\x65\x59\x73\x6a\x72\x47\x66\x30\x76\x66\x59\x5a\x2f\
-\x45\x56\x6e\x78\x36\x2b\x49\x47\x2b\x62\x2f\x47\x75\x49\x77\x52\
-\x78\x68\x4e\x4d\x75\x6d\x58\x61\x54\x58\x39\x75\x4f\x54\x69\x37\
-\x31\x65\x45\x63\x38\x33\x46\x58\x54\x20\x5a\x38\x56\x6e\x47\x73\
-\x52\x73\x35\x57\x38\x68\x2b\x30\x33\x74\x62\x73\x64\x38\x4f\x73\
-\x55\x6f\x65\x63\x39\x6c\x50\x71\x45\x6b\x70\x33\x70\x78\x42\x43\
-\x49\x33\x4d\x65\x52\x43\x4c\x75\x2f\x65\x76\x2b\x45\x46\x6d\x71\
-\x4b\x61\x4d\x70\x75\x63\x55\x42\x59\x54\x48\x75\x37\x65\x30\x33\
-\x63\x72\x4c\x6c\x2b\x38\x20\x6f\x72\x53\x47\x72\x74\x74\x53\x6c\
-\x63\x50\x31\x43\x36\x6c\x37\x51\x72\x66\x62\x5a\x68\x4e\x6c\x53\
-\x43\x63\x79\x75\x44\x59\x4a\x37\x2f\x59\x6f\x4a\x64\x71\x6b\x53\
-\x5a\x4d\x6c\x45\x4a\x49\x63\x4b\x52\x42\x42\x4c\x52\x4b\x30\x48\
-\x61\x2f\x62\x43\x45\x58\x50\x36\x43\x4c\x76\x55\x6d\x6b\x78\x53\
-\x50\x63\x50\x20\x44\x45\x72\x54\x66\x63\x2f\x46\x78\x63\x57\x65\
-\x71\x53\x77\x54\x53\x45\x58\x66\x30\x6d\x63\x51\x7a\x67\x63\x48\
-\x58\x6c\x47\x57\x46\x6d\x76\x6e\x64\x46\x30\x56\x4e\x56\x59\x74\
-\x55\x49\x34\x6f\x65\x47\x6b\x69\x36\x6c\x78\x6b\x55\x35\x35\x46\
-\x2f\x4f\x74\x65\x76\x44\x4d\x74\x43\x69\x5a\x6e\x61\x51\x6a\x71\
-\x20\x4b\x61\x69\x75\x31\x35\x37\x6c\x2f\x49\x7a\x6e\x7a\x35\x39\
-\x7a\x64\x6e\x4a\x4f\x58\x55\x67\x35\x75\x74\x76\x62\x57\x39\x36\
-\x39\x65\x38\x66\x39\x2f\x54\x30\x68\x4a\x67\x2b\x37\x30\x4b\x4d\
-\x4c\x67\x39\x56\x53\x6b\x4e\x59\x72\x45\x61\x67\x71\x79\x78\x4b\
-\x46\x6f\x6e\x63\x39\x4f\x6d\x69\x30\x31\x57\x7a\x58\x20\x47\x2b\
-\x37\x76\x37\x37\x50\x35\x5a\x35\x57\x52\x36\x6c\x43\x39\x61\x41\
-\x4c\x56\x30\x30\x6c\x57\x42\x7a\x38\x45\x73\x73\x59\x4c\x32\x61\
-\x47\x33\x64\x42\x69\x4b\x36\x44\x33\x34\x33\x74\x4e\x47\x5a\x6f\
-\x79\x31\x4a\x76\x75\x57\x30\x68\x66\x79\x64\x46\x50\x50\x48\x51\
-\x4e\x39\x37\x44\x47\x66\x5a\x4b\x67\x72\x20\x46\x2b\x69\x37\x56\
-\x69\x51\x50\x58\x49\x39\x52\x6f\x4a\x53\x59\x56\x69\x4a\x74\x6f\
-\x44\x69\x53\x66\x62\x72\x58\x6e\x6f\x70\x7a\x48\x61\x34\x34\x54\
-\x2b\x31\x79\x68\x2b\x63\x34\x50\x43\x62\x76\x41\x48\x71\x45\x67\
-\x50\x5a\x4f\x61\x68\x47\x4f\x63\x73\x65\x53\x50\x51\x37\x73\x54\
-\x64\x53\x32\x37\x37\x69\x36\x20\x75\x75\x4c\x6b\x2f\x41\x52\x7a\
-\x70\x79\x53\x2b\x47\x41\x75\x62\x4e\x74\x73\x74\x62\x33\x37\x36\
-\x67\x63\x76\x6e\x72\x36\x50\x6f\x55\x63\x46\x73\x5a\x74\x6a\x75\
-\x56\x76\x7a\x68\x58\x2f\x38\x4a\x59\x78\x57\x4b\x6c\x6b\x6c\x64\
-\x35\x31\x69\x69\x74\x61\x4c\x47\x31\x6d\x7a\x57\x41\x4c\x6b\x71\
-\x30\x4f\x47\x69\x20\x41\x51\x50\x4c\x2f\x2f\x44\x65\x78\x7a\x37\
-\x63\x45\x4a\x68\x58\x32\x46\x49\x55\x6e\x63\x2f\x50\x7a\x36\x6e\
-\x4b\x43\x65\x57\x6b\x6c\x69\x42\x37\x6e\x46\x79\x72\x31\x53\x70\
-\x6e\x2b\x79\x65\x7a\x54\x4d\x71\x4c\x7a\x54\x49\x71\x6d\x74\x70\
-\x51\x39\x6d\x76\x77\x55\x57\x79\x55\x5a\x55\x78\x39\x6c\x59\x53\
-\x4d\x20\x78\x77\x44\x52\x4f\x45\x41\x4e\x42\x2b\x67\x6e\x68\x78\
-\x4d\x77\x33\x71\x2b\x45\x38\x2b\x4d\x65\x61\x44\x42\x59\x44\x49\
-\x49\x51\x76\x2f\x37\x6d\x61\x38\x35\x4f\x54\x6c\x6b\x73\x46\x6e\
-\x6a\x76\x75\x62\x71\x35\x35\x76\x33\x37\x39\x39\x7a\x66\x33\x39\
-\x50\x37\x47\x4a\x4a\x42\x6f\x55\x71\x4e\x43\x56\x47\x32\x20\x77\
-\x77\x64\x43\x6c\x4c\x6a\x55\x31\x74\x44\x35\x53\x48\x71\x33\x52\
-\x71\x54\x76\x74\x31\x76\x61\x58\x5a\x4e\x4e\x37\x49\x51\x4d\x62\
-\x37\x64\x62\x4a\x42\x54\x52\x63\x54\x59\x35\x5a\x37\x66\x62\x5a\
-\x63\x52\x34\x48\x4c\x74\x4c\x7a\x30\x4c\x36\x5a\x56\x2f\x35\x59\
-\x41\x2f\x68\x6a\x4c\x2b\x6e\x57\x4f\x4a\x59\x20\x78\x54\x30\x68\
-\x79\x36\x59\x59\x73\x76\x4d\x50\x78\x37\x4b\x59\x6f\x77\x47\x62\
-\x42\x30\x66\x73\x53\x79\x32\x46\x79\x41\x6d\x2b\x6c\x77\x6e\x59\
-\x53\x63\x36\x64\x55\x51\x50\x45\x6b\x32\x7a\x5a\x45\x4d\x4c\x6e\
-\x58\x4d\x4b\x39\x43\x5a\x63\x75\x66\x6d\x77\x32\x5a\x66\x51\x76\
-\x6a\x4f\x48\x33\x70\x79\x66\x64\x20\x33\x67\x30\x67\x51\x49\x77\
-\x55\x70\x65\x6b\x6a\x5a\x53\x31\x75\x38\x54\x46\x49\x58\x39\x71\
-\x43\x31\x66\x30\x44\x33\x63\x55\x46\x51\x48\x77\x51\x63\x48\x56\
-\x31\x68\x66\x64\x43\x75\x6a\x34\x35\x50\x57\x55\x32\x6d\x37\x46\
-\x36\x65\x4f\x43\x48\x48\x33\x37\x67\x34\x66\x59\x6d\x78\x34\x48\
-\x36\x76\x75\x66\x74\x20\x6d\x37\x2f\x79\x77\x76\x63\x73\x54\x38\
-\x36\x77\x70\x71\x51\x75\x4a\x47\x50\x2b\x35\x75\x36\x57\x36\x53\
-\x52\x56\x34\x34\x6b\x58\x35\x6a\x78\x6e\x79\x78\x50\x75\x62\x36\
-\x35\x6c\x4d\x4a\x73\x43\x48\x77\x62\x47\x6a\x49\x38\x37\x54\x78\
-\x2b\x38\x6c\x4f\x54\x79\x6b\x69\x48\x67\x6b\x6b\x78\x72\x33\x43\
-\x55\x53\x20\x65\x4a\x52\x38\x75\x69\x52\x72\x76\x31\x77\x75\x30\
-\x59\x57\x46\x6b\x66\x35\x6f\x46\x33\x65\x2f\x78\x58\x4a\x4a\x56\
-\x64\x66\x63\x33\x74\x37\x53\x4e\x41\x32\x54\x36\x5a\x54\x65\x4f\
-\x54\x62\x62\x4c\x55\x56\x52\x30\x54\x52\x64\x4a\x70\x70\x62\x4a\
-\x35\x6e\x76\x36\x62\x4f\x35\x58\x31\x4f\x66\x78\x37\x53\x62\x20\
-\x30\x39\x4e\x54\x37\x75\x2f\x76\x75\x62\x75\x37\x34\x2b\x7a\x73\
-\x4c\x50\x66\x39\x63\x48\x32\x50\x46\x31\x4e\x35\x78\x53\x4b\x73\
-\x45\x58\x30\x30\x57\x4e\x45\x49\x44\x59\x48\x43\x6c\x6a\x78\x2f\
-\x2f\x70\x79\x58\x4c\x31\x39\x53\x56\x54\x58\x47\x47\x46\x61\x72\
-\x4e\x57\x2f\x65\x2f\x4d\x54\x48\x36\x79\x74\x36\x20\x33\x36\x46\
-\x55\x6f\x45\x76\x6c\x7a\x70\x58\x43\x68\x37\x48\x31\x49\x78\x6e\
-\x70\x42\x49\x55\x79\x45\x71\x66\x74\x57\x6a\x47\x68\x2b\x30\x59\
-\x34\x75\x57\x6e\x58\x56\x69\x48\x51\x37\x48\x59\x30\x58\x5a\x2b\
-\x76\x4f\x53\x33\x4d\x64\x56\x31\x6e\x73\x7a\x55\x42\x57\x32\x4d\
-\x66\x4c\x6f\x32\x39\x38\x59\x51\x62\x20\x6a\x38\x63\x51\x4a\x4e\
-\x79\x68\x6f\x33\x38\x2b\x4e\x74\x6d\x54\x4b\x48\x53\x61\x34\x4f\
-\x4e\x78\x6e\x52\x61\x46\x46\x4a\x71\x78\x75\x56\x4e\x56\x72\x4b\
-\x51\x54\x70\x47\x69\x69\x37\x39\x73\x6f\x55\x35\x41\x41\x6d\x46\
-\x2f\x57\x50\x6f\x64\x2b\x48\x72\x59\x76\x44\x58\x32\x6b\x6c\x6f\
-\x4c\x6c\x57\x68\x76\x4a\x20\x34\x51\x6f\x69\x4d\x61\x47\x4c\x4c\
-\x64\x61\x55\x62\x4c\x64\x53\x4a\x50\x4b\x66\x2f\x2f\x6d\x66\x4d\
-\x34\x78\x76\x6a\x4a\x48\x79\x31\x6f\x73\x46\x73\x2f\x6b\x55\x38\
-\x48\x68\x67\x4d\x70\x33\x79\x39\x54\x66\x66\x38\x4b\x34\x6f\x75\
-\x50\x37\x77\x45\x52\x63\x70\x58\x39\x5a\x36\x66\x76\x72\x70\x4c\
-\x2b\x78\x32\x20\x47\x35\x35\x64\x76\x6d\x41\x36\x6d\x37\x50\x64\
-\x64\x5a\x79\x66\x7a\x66\x59\x57\x44\x6d\x4e\x4d\x58\x73\x79\x6d\
-\x30\x2b\x6c\x65\x56\x6e\x76\x58\x64\x66\x6d\x37\x30\x38\x50\x71\
-\x75\x6f\x37\x45\x58\x54\x70\x63\x59\x51\x55\x73\x73\x5a\x79\x64\
-\x6e\x63\x6e\x72\x39\x41\x4a\x54\x46\x74\x6e\x48\x53\x2b\x4a\x5a\
-\x20\x59\x2b\x63\x2f\x44\x61\x6a\x6c\x63\x70\x6b\x35\x6a\x71\x6c\
-\x51\x70\x6e\x4e\x43\x32\x64\x76\x74\x64\x71\x78\x57\x4b\x35\x62\
-\x7a\x68\x64\x54\x54\x4d\x4d\x64\x6a\x59\x75\x50\x2f\x4a\x79\x4c\
-\x43\x77\x38\x4f\x44\x49\x4c\x32\x51\x2f\x5a\x2b\x78\x2b\x54\x62\
-\x34\x4f\x58\x46\x33\x6a\x58\x53\x51\x51\x6c\x74\x55\x20\x6b\x4a\
-\x33\x31\x37\x4f\x52\x63\x54\x4d\x2f\x6c\x71\x66\x68\x73\x36\x78\
-\x31\x76\x50\x37\x7a\x6e\x34\x39\x56\x37\x32\x72\x35\x46\x47\x51\
-\x46\x33\x48\x41\x35\x56\x69\x74\x78\x69\x63\x6a\x75\x39\x39\x2b\
-\x42\x69\x70\x6e\x34\x55\x56\x64\x71\x75\x31\x72\x53\x75\x70\x64\
-\x31\x4a\x2b\x70\x68\x56\x73\x54\x35\x49\x20\x48\x32\x4e\x2f\x66\
-\x62\x39\x6e\x57\x59\x78\x39\x35\x35\x52\x30\x6d\x33\x62\x2b\x64\
-\x42\x2f\x4f\x4f\x56\x78\x69\x47\x71\x6e\x42\x48\x30\x37\x58\x49\
-\x4c\x56\x4f\x5a\x45\x47\x7a\x5a\x58\x45\x55\x35\x54\x35\x73\x68\
-\x7a\x76\x70\x75\x46\x6b\x56\x66\x4e\x54\x57\x46\x4c\x38\x44\x4c\
-\x78\x50\x51\x52\x53\x54\x55\x20\x71\x68\x69\x66\x53\x45\x4a\x41\
-\x4f\x74\x31\x4d\x33\x4b\x59\x2f\x2b\x64\x58\x48\x4c\x2b\x54\x59\
-\x2b\x30\x2f\x65\x78\x42\x48\x66\x63\x4f\x2f\x50\x73\x56\x4e\x74\
-\x39\x49\x76\x53\x44\x67\x67\x39\x5a\x56\x56\x54\x6e\x5a\x35\x77\
-\x66\x33\x2b\x50\x74\x5a\x62\x4c\x79\x38\x73\x4d\x4d\x6b\x78\x6d\
-\x73\x38\x47\x4a\x20\x56\x70\x36\x75\x61\x31\x44\x57\x73\x44\x67\
-\x39\x51\x79\x6d\x44\x64\x33\x42\x37\x66\x55\x31\x56\x56\x35\x4b\
-\x42\x37\x6c\x70\x75\x62\x32\x2f\x59\x62\x4e\x61\x38\x65\x50\x57\
-\x4b\x32\x65\x49\x45\x37\x52\x55\x36\x35\x68\x57\x6d\x79\x5a\x58\
-\x30\x56\x56\x4a\x4e\x77\x38\x54\x6d\x43\x4e\x36\x54\x4b\x74\x4f\
-\x6d\x20\x32\x4a\x6e\x57\x57\x6c\x67\x55\x53\x74\x50\x32\x4d\x6a\
-\x43\x4b\x65\x50\x7a\x35\x2b\x51\x57\x58\x7a\x31\x36\x77\x4f\x44\
-\x33\x4a\x2b\x58\x52\x64\x4a\x33\x36\x36\x4e\x6b\x38\x48\x67\x62\
-\x58\x57\x31\x48\x57\x64\x4a\x38\x31\x75\x31\x7a\x4b\x62\x4c\x64\
-\x6a\x74\x70\x47\x35\x66\x4d\x76\x74\x57\x6d\x7a\x58\x6e\x20\x35\
-\x2b\x63\x34\x46\x34\x50\x78\x54\x7a\x30\x7a\x37\x79\x6e\x6a\x4b\
-\x70\x38\x6d\x64\x69\x70\x64\x72\x62\x56\x47\x46\x7a\x6f\x4f\x63\
-\x69\x33\x46\x57\x75\x4e\x7a\x30\x6d\x69\x4b\x79\x42\x41\x70\x6a\
-\x4f\x68\x37\x58\x70\x77\x39\x34\x2f\x6e\x7a\x46\x30\x77\x6d\x45\
-\x7a\x59\x50\x4b\x39\x36\x38\x65\x63\x50\x62\x20\x39\x78\x39\x70\
-\x32\x31\x62\x38\x50\x61\x74\x78\x71\x71\x66\x7a\x50\x51\x34\x4a\
-\x4f\x79\x6d\x62\x56\x42\x74\x43\x35\x6d\x43\x47\x6f\x47\x69\x33\
-\x4c\x62\x76\x64\x68\x6d\x32\x37\x7a\x52\x36\x52\x31\x6c\x4c\x2b\
-\x4f\x6d\x55\x36\x64\x46\x32\x48\x55\x61\x4f\x36\x45\x67\x79\x4c\
-\x69\x39\x57\x47\x64\x74\x64\x45\x20\x5a\x6c\x6a\x63\x37\x62\x4c\
-\x59\x6c\x52\x62\x56\x62\x71\x58\x77\x6f\x63\x65\x35\x50\x70\x63\
-\x38\x79\x47\x50\x56\x36\x4c\x78\x51\x48\x6f\x37\x6c\x38\x64\x6a\
-\x4d\x4b\x61\x42\x71\x2f\x32\x38\x44\x49\x79\x78\x71\x7a\x4f\x54\
-\x74\x31\x6a\x73\x68\x52\x4c\x73\x4f\x37\x78\x30\x61\x48\x35\x2f\
-\x4f\x35\x38\x4d\x4d\x20\x54\x37\x55\x76\x6e\x58\x67\x2f\x64\x38\
-\x64\x4d\x37\x66\x42\x61\x62\x4b\x47\x6a\x6f\x4b\x73\x34\x37\x45\
-\x45\x5a\x54\x6b\x39\x50\x63\x55\x46\x71\x6b\x4b\x65\x67\x37\x38\
-\x4e\x36\x4c\x58\x6c\x30\x33\x6b\x6c\x4a\x4e\x46\x50\x67\x36\x4f\
-\x69\x37\x6e\x73\x6c\x38\x78\x75\x75\x76\x76\x38\x62\x37\x77\x4d\
-\x32\x48\x20\x44\x31\x53\x6c\x6d\x42\x75\x37\x64\x6f\x76\x53\x67\
-\x51\x38\x66\x33\x74\x4e\x30\x48\x62\x50\x5a\x43\x59\x45\x4f\x35\
-\x30\x4b\x47\x2b\x64\x4f\x39\x7a\x47\x61\x7a\x7a\x4a\x49\x70\x79\
-\x35\x4b\x32\x32\x5a\x65\x38\x6b\x4f\x4d\x47\x53\x6c\x32\x61\x4f\
-\x47\x63\x6e\x4a\x35\x79\x64\x6e\x62\x46\x63\x6e\x44\x4b\x5a\x20\
-\x7a\x2f\x4c\x78\x6b\x67\x51\x63\x56\x2b\x50\x34\x2b\x55\x50\x66\
-\x4d\x73\x63\x55\x49\x7a\x49\x37\x6d\x38\x32\x34\x76\x78\x63\x66\
-\x4d\x53\x55\x66\x4a\x2f\x4c\x43\x6f\x5a\x76\x77\x31\x44\x4e\x4b\
-\x50\x39\x4d\x4f\x6d\x2b\x72\x38\x4a\x53\x57\x42\x34\x4b\x57\x4f\
-\x68\x46\x4b\x42\x30\x70\x54\x52\x47\x6c\x41\x6f\x20\x4c\x78\x4e\
-\x79\x4f\x70\x74\x79\x65\x66\x6d\x43\x35\x38\x38\x75\x63\x77\x33\
-\x35\x48\x33\x2f\x38\x67\x65\x76\x72\x61\x78\x34\x65\x48\x75\x68\
-\x36\x75\x58\x39\x74\x4e\x4a\x33\x76\x63\x4c\x34\x46\x49\x32\x70\
-\x34\x51\x51\x30\x4c\x69\x39\x61\x61\x34\x4b\x44\x5a\x4e\x58\x51\
-\x37\x43\x62\x6f\x37\x4a\x38\x55\x34\x20\x55\x55\x4e\x46\x70\x48\
-\x61\x37\x32\x36\x50\x30\x44\x52\x49\x57\x4f\x70\x75\x4a\x71\x52\
-\x35\x46\x69\x71\x2b\x6d\x6e\x53\x37\x31\x58\x7a\x4a\x4e\x51\x77\
-\x69\x78\x2b\x76\x53\x41\x58\x75\x63\x4a\x2f\x55\x53\x4d\x64\x77\
-\x7a\x79\x66\x4b\x36\x50\x35\x56\x69\x77\x52\x73\x6e\x4b\x4c\x4c\
-\x6c\x52\x48\x61\x37\x76\x20\x77\x55\x6b\x64\x65\x44\x30\x43\x4f\
-\x2b\x4c\x6a\x54\x36\x44\x6a\x46\x37\x65\x6e\x4a\x74\x73\x68\x33\
-\x50\x30\x55\x61\x4a\x4e\x76\x34\x6f\x6b\x64\x30\x52\x4e\x69\x70\
-\x61\x41\x68\x71\x33\x77\x79\x6d\x62\x42\x65\x62\x39\x6c\x75\x74\
-\x39\x54\x54\x75\x5a\x53\x2f\x37\x71\x54\x69\x72\x44\x4a\x53\x68\
-\x37\x32\x65\x20\x56\x48\x67\x58\x4b\x4b\x31\x55\x71\x41\x31\x4b\
-\x5a\x41\x6c\x33\x66\x6b\x64\x77\x67\x65\x6c\x38\x7a\x75\x75\x76\
-\x76\x79\x4c\x30\x6a\x6d\x61\x33\x78\x6f\x63\x32\x35\x37\x4c\x74\
-\x64\x6a\x76\x4d\x65\x6b\x76\x41\x5a\x74\x73\x2f\x54\x59\x68\x6b\
-\x37\x36\x65\x63\x77\x57\x51\x43\x64\x33\x32\x50\x73\x52\x5a\x72\
-\x20\x44\x44\x61\x61\x6b\x59\x45\x55\x4c\x44\x65\x55\x5a\x63\x33\
-\x35\x2b\x54\x6b\x76\x58\x37\x36\x55\x4d\x74\x78\x42\x61\x6a\x2b\
-\x6b\x79\x61\x64\x4e\x4b\x6e\x67\x69\x53\x4a\x7a\x30\x69\x51\x62\
-\x6c\x63\x56\x36\x79\x35\x62\x56\x57\x68\x4e\x35\x6e\x50\x39\x74\
-\x61\x79\x32\x4b\x78\x34\x4d\x4f\x48\x44\x79\x79\x58\x20\x53\x2b\
-\x62\x7a\x4f\x54\x63\x33\x4e\x32\x79\x33\x57\x79\x5a\x56\x54\x66\
-\x41\x68\x6d\x33\x57\x48\x51\x66\x63\x55\x4a\x6c\x4a\x4b\x71\x48\
-\x4e\x61\x61\x32\x61\x54\x4f\x64\x75\x74\x43\x45\x51\x56\x52\x51\
-\x55\x45\x64\x46\x41\x55\x4e\x68\x4c\x41\x58\x63\x42\x31\x6a\x73\
-\x4b\x55\x4c\x4a\x64\x4c\x6c\x76\x4d\x54\x20\x6e\x6a\x31\x37\x78\
-\x6e\x77\x2b\x42\x36\x33\x34\x65\x48\x58\x46\x75\x33\x66\x76\x57\
-\x47\x30\x65\x42\x42\x41\x4a\x48\x6c\x4d\x61\x2b\x69\x41\x79\x4b\
-\x63\x71\x43\x55\x56\x4c\x70\x32\x41\x63\x48\x51\x64\x67\x72\x76\
-\x67\x38\x69\x72\x62\x68\x72\x61\x4a\x74\x59\x59\x44\x50\x49\x5a\
-\x4f\x68\x61\x54\x2b\x68\x63\x20\x4e\x74\x4e\x42\x59\x65\x31\x67\
-\x49\x6f\x70\x37\x46\x61\x51\x4f\x52\x4a\x41\x71\x75\x76\x50\x35\
-\x6e\x4b\x35\x72\x38\x32\x51\x64\x6a\x35\x30\x2b\x2b\x4c\x31\x4a\
-\x47\x43\x49\x74\x30\x55\x53\x33\x59\x68\x77\x6a\x48\x49\x63\x68\
-\x55\x6e\x74\x71\x59\x31\x46\x70\x52\x30\x52\x48\x55\x57\x4d\x68\
-\x6c\x61\x43\x69\x20\x54\x2b\x68\x39\x6a\x34\x73\x5a\x43\x44\x69\
-\x42\x79\x33\x55\x4d\x56\x77\x36\x37\x34\x4d\x2b\x6a\x71\x78\x32\
-\x37\x71\x50\x54\x2f\x59\x36\x76\x44\x55\x7a\x76\x73\x34\x2f\x63\
-\x4f\x56\x35\x2b\x68\x72\x48\x46\x61\x70\x57\x79\x73\x6a\x53\x35\
-\x51\x74\x50\x68\x45\x32\x6c\x70\x6d\x73\x78\x6c\x58\x56\x31\x66\
-\x30\x20\x66\x63\x39\x33\x2f\x2b\x46\x33\x55\x53\x4e\x48\x49\x50\
-\x36\x32\x36\x77\x6b\x36\x5a\x6a\x2f\x51\x67\x59\x65\x79\x72\x71\
-\x6d\x6d\x45\x37\x52\x52\x4e\x4d\x30\x61\x62\x57\x57\x6c\x66\x50\
-\x48\x71\x4e\x63\x75\x54\x69\x2b\x79\x44\x4a\x64\x38\x6f\x71\x61\
-\x71\x6c\x4f\x4a\x52\x53\x4b\x67\x75\x2f\x5a\x68\x41\x6c\x20\x70\
-\x6a\x57\x6c\x65\x31\x4e\x4b\x67\x73\x64\x31\x58\x62\x4e\x63\x4c\
-\x6a\x4e\x71\x43\x52\x48\x4b\x6a\x36\x45\x47\x37\x77\x4e\x4e\x31\
-\x49\x4a\x4a\x75\x31\x41\x43\x52\x73\x59\x37\x6f\x6a\x35\x59\x30\
-\x59\x45\x63\x77\x67\x67\x68\x73\x46\x77\x75\x52\x5a\x5a\x78\x73\
-\x5a\x54\x33\x6e\x33\x41\x6f\x6a\x71\x48\x61\x20\x34\x78\x32\x2b\
-\x37\x33\x76\x71\x75\x70\x61\x2f\x78\x53\x51\x63\x67\x32\x45\x79\
-\x6e\x57\x61\x2f\x37\x2f\x54\x30\x6a\x4c\x37\x76\x75\x62\x75\x37\
-\x35\x2b\x50\x31\x52\x32\x37\x76\x37\x71\x53\x51\x4b\x4d\x4c\x73\
-\x55\x54\x61\x69\x71\x64\x34\x54\x76\x4a\x4f\x6f\x64\x45\x68\x6a\
-\x59\x55\x43\x32\x6d\x36\x61\x68\x20\x32\x62\x55\x77\x38\x6a\x2b\
-\x37\x76\x71\x46\x72\x58\x62\x59\x4b\x6c\x41\x71\x6f\x47\x41\x74\
-\x4d\x66\x5a\x47\x65\x54\x37\x72\x33\x39\x45\x72\x6e\x37\x66\x73\
-\x65\x46\x64\x32\x4a\x6e\x4b\x69\x72\x68\x6e\x45\x6b\x6b\x32\x34\
-\x77\x4e\x77\x39\x33\x4f\x75\x6e\x6e\x6f\x59\x38\x4f\x4e\x78\x62\
-\x67\x36\x43\x54\x64\x20\x50\x30\x5a\x68\x30\x2b\x34\x6e\x39\x71\
-\x37\x77\x5a\x77\x62\x30\x30\x2b\x38\x4e\x2b\x65\x52\x30\x77\x39\
-\x68\x41\x2f\x54\x52\x6f\x38\x33\x4d\x6e\x37\x57\x66\x62\x77\x59\
-\x34\x34\x54\x4f\x68\x68\x4e\x30\x70\x5a\x36\x32\x6b\x67\x46\x6b\
-\x56\x42\x48\x78\x2f\x49\x5a\x44\x4c\x68\x34\x65\x47\x42\x48\x33\
-\x2f\x38\x20\x6b\x5a\x63\x76\x58\x75\x48\x61\x4c\x69\x4e\x62\x38\
-\x72\x41\x63\x32\x69\x70\x63\x4a\x38\x56\x65\x62\x46\x6e\x77\x7a\
-\x54\x64\x66\x63\x33\x50\x37\x67\x61\x73\x72\x32\x56\x45\x75\x58\
-\x37\x79\x6b\x37\x5a\x47\x4b\x50\x6e\x32\x48\x5a\x4c\x4f\x72\x51\
-\x57\x4f\x30\x4c\x43\x45\x43\x4e\x66\x50\x35\x50\x4a\x74\x4b\x20\
-\x4b\x51\x67\x2b\x31\x6a\x44\x78\x53\x76\x48\x73\x38\x6b\x57\x57\
-\x70\x56\x2b\x74\x74\x38\x78\x6d\x73\x31\x78\x44\x58\x6a\x49\x79\
-\x4c\x4d\x70\x71\x6a\x46\x65\x5a\x72\x67\x5a\x6b\x6f\x61\x53\x45\
-\x2b\x6e\x6e\x76\x77\x5a\x69\x34\x49\x77\x4a\x49\x44\x62\x79\x30\
-\x67\x71\x66\x2b\x32\x5a\x75\x6b\x2b\x6d\x6e\x68\x20\x71\x57\x50\
-\x50\x73\x4b\x37\x72\x6e\x4e\x51\x71\x4a\x63\x39\x41\x4b\x79\x30\
-\x37\x2b\x65\x6b\x46\x4c\x79\x36\x66\x63\x37\x6f\x34\x77\x54\x6e\
-\x48\x2b\x6d\x37\x4e\x32\x77\x2f\x76\x70\x58\x52\x41\x73\x79\x55\
-\x6f\x54\x7a\x44\x51\x4f\x30\x64\x51\x67\x63\x49\x61\x64\x73\x30\
-\x4f\x59\x78\x53\x36\x73\x44\x48\x7a\x20\x77\x68\x42\x36\x78\x33\
-\x61\x7a\x5a\x62\x76\x64\x5a\x58\x6c\x41\x68\x52\x42\x44\x30\x6f\
-\x52\x4a\x2f\x70\x6e\x56\x67\x33\x38\x63\x58\x42\x42\x74\x31\x4f\
-\x69\x7a\x61\x57\x76\x70\x6e\x5a\x44\x56\x45\x30\x41\x54\x6f\x6c\
-\x73\x53\x6e\x4e\x54\x55\x37\x50\x70\x4f\x53\x4f\x56\x4b\x72\x73\
-\x48\x75\x35\x58\x71\x71\x20\x76\x4d\x67\x2f\x43\x6c\x38\x6f\x43\
-\x41\x53\x30\x4f\x6a\x37\x4a\x44\x6a\x63\x62\x70\x51\x79\x4a\x69\
-\x72\x67\x66\x6b\x6c\x4a\x59\x33\x37\x58\x30\x72\x69\x66\x30\x4c\
-\x69\x61\x58\x78\x70\x4d\x65\x4d\x52\x57\x66\x6e\x42\x43\x66\x61\
-\x4d\x66\x73\x35\x73\x4d\x74\x57\x7a\x72\x5a\x50\x4c\x61\x4a\x32\
-\x4e\x2f\x53\x20\x44\x2f\x34\x41\x67\x44\x59\x52\x4b\x6f\x38\x70\
-\x53\x32\x33\x62\x63\x6e\x64\x33\x68\x39\x46\x46\x48\x76\x67\x68\
-\x42\x4b\x72\x4a\x42\x4f\x38\x39\x64\x65\x54\x30\x33\x56\x7a\x66\
-\x55\x68\x63\x56\x7a\x79\x35\x65\x79\x6b\x54\x56\x46\x6d\x56\x68\
-\x32\x32\x79\x51\x77\x70\x43\x65\x75\x2f\x74\x62\x4c\x70\x38\x39\
-\x20\x70\x35\x72\x55\x4c\x50\x77\x70\x32\x31\x33\x4c\x62\x48\x35\
-\x43\x37\x38\x6c\x52\x4c\x32\x33\x4d\x61\x44\x56\x57\x65\x61\x56\
-\x6c\x64\x49\x2f\x65\x65\x79\x61\x78\x64\x6e\x6f\x71\x51\x4c\x4a\
-\x61\x72\x57\x6a\x62\x6c\x73\x76\x4c\x53\x32\x43\x6f\x54\x72\x74\
-\x61\x72\x64\x68\x73\x4e\x6d\x68\x74\x63\x34\x6c\x71\x20\x6d\x57\
-\x43\x78\x61\x4f\x6e\x49\x39\x45\x35\x78\x70\x6a\x47\x45\x6e\x75\
-\x46\x78\x4c\x33\x47\x2f\x35\x4d\x4f\x4e\x56\x2b\x62\x70\x64\x43\
-\x71\x2b\x34\x66\x6d\x5a\x58\x4c\x4f\x4f\x39\x4c\x50\x52\x51\x42\
-\x76\x4c\x41\x59\x35\x6a\x68\x47\x33\x62\x4d\x71\x6c\x6b\x77\x51\
-\x69\x74\x6f\x36\x36\x6e\x6e\x4a\x31\x64\x20\x38\x50\x7a\x5a\x43\
-\x39\x46\x61\x56\x5a\x71\x48\x7a\x5a\x72\x72\x36\x32\x74\x75\x62\
-\x32\x2f\x5a\x70\x6a\x69\x6a\x52\x46\x4a\x42\x78\x5a\x31\x5a\x53\
-\x56\x5a\x4f\x57\x55\x5a\x4a\x51\x53\x65\x4c\x5a\x37\x74\x74\x34\
-\x79\x52\x4a\x4f\x34\x36\x68\x37\x7a\x75\x36\x54\x6e\x77\x39\x46\
-\x31\x4a\x49\x4a\x52\x56\x63\x20\x47\x59\x30\x7a\x70\x62\x42\x70\
-\x67\x4f\x73\x42\x7a\x55\x78\x49\x74\x50\x65\x79\x37\x30\x74\x59\
-\x51\x63\x49\x53\x75\x72\x41\x78\x7a\x57\x6f\x2f\x55\x2b\x56\x77\
-\x2f\x42\x36\x2b\x54\x2f\x78\x4d\x38\x50\x76\x6a\x63\x7a\x78\x5a\
-\x78\x35\x38\x2f\x62\x4f\x50\x33\x62\x64\x66\x75\x6f\x72\x6f\x58\
-\x41\x79\x6b\x37\x20\x48\x52\x42\x72\x43\x79\x5a\x47\x68\x66\x78\
-\x30\x6f\x78\x4f\x4d\x6f\x4e\x2b\x39\x4f\x4d\x34\x51\x4a\x7a\x72\
-\x4d\x41\x68\x39\x6f\x54\x51\x6d\x61\x31\x31\x6b\x78\x4c\x57\x51\
-\x6f\x57\x59\x31\x2b\x37\x69\x75\x36\x44\x64\x63\x57\x41\x39\x74\
-\x4f\x5a\x56\x38\x74\x54\x55\x4a\x6a\x44\x4e\x4e\x4a\x77\x58\x49\
-\x35\x20\x5a\x37\x74\x62\x63\x33\x5a\x32\x68\x75\x73\x36\x56\x49\
-\x77\x48\x54\x63\x6f\x4a\x56\x6c\x6e\x65\x76\x48\x6c\x44\x55\x55\
-\x68\x68\x7a\x63\x4a\x4b\x68\x61\x4c\x43\x31\x4b\x78\x57\x4b\x7a\
-\x35\x2b\x75\x4b\x49\x73\x4b\x68\x61\x4c\x42\x57\x33\x76\x73\x46\
-\x57\x4e\x72\x57\x70\x4d\x57\x52\x47\x43\x77\x73\x59\x45\x20\x56\
-\x34\x58\x42\x32\x48\x31\x65\x35\x5a\x69\x73\x4f\x38\x53\x4a\x5a\
-\x44\x57\x30\x56\x6d\x47\x74\x4a\x43\x50\x66\x33\x74\x37\x69\x58\
-\x4d\x69\x54\x72\x53\x67\x71\x69\x6b\x4b\x79\x4c\x52\x61\x6e\x68\
-\x6c\x33\x58\x52\x68\x42\x41\x65\x73\x31\x37\x6e\x37\x74\x63\x5a\
-\x39\x4d\x74\x43\x64\x71\x71\x50\x5a\x42\x42\x20\x71\x67\x45\x35\
-\x64\x72\x74\x4e\x42\x47\x4b\x47\x36\x7a\x4e\x47\x51\x67\x66\x4f\
-\x4f\x65\x79\x6b\x69\x67\x74\x61\x5a\x42\x4e\x35\x32\x58\x6d\x74\
-\x53\x72\x36\x53\x70\x47\x38\x4a\x62\x53\x34\x77\x4c\x57\x73\x61\
-\x33\x37\x48\x64\x72\x6a\x6c\x39\x64\x63\x37\x76\x2f\x73\x4e\x33\
-\x54\x4b\x64\x7a\x62\x43\x45\x6c\x20\x31\x7a\x35\x2b\x2f\x43\x68\
-\x36\x6e\x4c\x32\x67\x72\x6b\x46\x48\x45\x45\x70\x4a\x62\x66\x67\
-\x51\x71\x57\x30\x36\x53\x47\x61\x49\x52\x62\x50\x62\x44\x6c\x49\
-\x67\x77\x51\x33\x46\x4f\x70\x4e\x69\x67\x68\x76\x74\x52\x73\x6c\
-\x63\x7a\x57\x62\x65\x4f\x48\x79\x41\x2b\x48\x2f\x4f\x4f\x58\x7a\
-\x6e\x68\x77\x55\x70\x20\x6a\x6b\x64\x6c\x70\x4e\x36\x69\x31\x4a\
-\x4d\x79\x71\x43\x4c\x57\x41\x56\x47\x53\x75\x68\x63\x67\x2b\x74\
-\x6b\x71\x6a\x2b\x64\x78\x44\x75\x54\x65\x66\x41\x71\x61\x50\x58\
-\x70\x54\x65\x76\x74\x67\x30\x78\x68\x43\x4f\x4b\x4a\x76\x36\x79\
-\x50\x59\x71\x51\x7a\x30\x66\x59\x63\x4a\x70\x53\x77\x63\x4f\x71\
-\x52\x78\x20\x72\x2f\x59\x6e\x49\x45\x2f\x50\x35\x4d\x79\x47\x54\
-\x79\x76\x45\x65\x45\x55\x36\x31\x6f\x49\x36\x75\x74\x50\x4a\x68\
-\x55\x50\x47\x63\x58\x38\x42\x44\x79\x35\x31\x74\x44\x45\x6d\x6f\
-\x36\x44\x57\x6c\x46\x52\x56\x42\x63\x51\x4b\x74\x4f\x55\x45\x72\
-\x52\x53\x74\x63\x33\x67\x58\x61\x36\x59\x76\x7a\x33\x6a\x7a\x20\
-\x35\x67\x31\x6e\x5a\x36\x64\x63\x58\x44\x79\x6a\x61\x52\x72\x65\
-\x76\x33\x38\x76\x4b\x36\x57\x31\x54\x43\x61\x54\x44\x48\x41\x30\
-\x54\x5a\x4d\x4c\x66\x6f\x7a\x39\x51\x4b\x33\x32\x61\x36\x32\x6e\
-\x37\x30\x75\x49\x59\x67\x59\x48\x76\x4e\x39\x62\x34\x47\x77\x38\
-\x2f\x38\x50\x44\x77\x31\x37\x65\x57\x56\x33\x58\x20\x65\x5a\x63\
-\x63\x37\x32\x43\x48\x44\x2f\x63\x59\x6b\x43\x56\x6d\x35\x2b\x41\
-\x62\x4f\x69\x64\x6b\x38\x63\x50\x43\x4f\x34\x6e\x56\x30\x33\x6d\
-\x48\x69\x64\x65\x6b\x34\x36\x4a\x5a\x46\x79\x61\x61\x7a\x35\x49\
-\x74\x6b\x72\x4c\x70\x67\x34\x4f\x36\x4b\x46\x41\x42\x4c\x73\x34\
-\x58\x64\x4a\x75\x57\x66\x2f\x67\x50\x20\x76\x38\x66\x55\x4e\x54\
-\x63\x33\x4e\x33\x79\x38\x75\x68\x4a\x54\x6d\x35\x67\x64\x59\x75\
-\x4c\x59\x53\x4f\x43\x46\x46\x71\x35\x4d\x36\x6f\x73\x45\x66\x74\
-\x77\x2f\x72\x50\x62\x67\x2f\x2f\x53\x33\x46\x49\x64\x4c\x74\x54\
-\x72\x53\x39\x59\x2f\x48\x6c\x35\x44\x32\x59\x33\x77\x34\x57\x77\
-\x7a\x37\x73\x6f\x38\x35\x20\x61\x44\x38\x32\x4a\x34\x6b\x43\x30\
-\x57\x69\x43\x4f\x69\x4c\x62\x2b\x63\x6d\x6d\x44\x33\x37\x2f\x73\
-\x68\x68\x36\x6e\x69\x65\x6a\x36\x5a\x47\x66\x78\x2f\x67\x43\x6a\
-\x32\x33\x44\x6e\x37\x36\x59\x56\x45\x4e\x68\x71\x41\x65\x52\x6c\
-\x34\x76\x45\x4f\x4d\x67\x58\x4f\x62\x72\x34\x73\x52\x6b\x62\x4a\
-\x2b\x43\x77\x20\x37\x58\x2f\x70\x39\x38\x65\x7a\x52\x6e\x38\x6f\
-\x33\x77\x65\x43\x67\x47\x31\x33\x61\x37\x53\x42\x49\x70\x70\x4f\
-\x61\x62\x63\x30\x53\x76\x69\x4f\x41\x54\x4a\x6c\x36\x63\x32\x62\
-\x74\x37\x78\x37\x39\x35\x36\x79\x46\x49\x69\x39\x4b\x41\x72\x4b\
-\x57\x6f\x6a\x4f\x52\x57\x47\x79\x4f\x56\x5a\x56\x46\x62\x63\x33\
-\x20\x64\x37\x78\x36\x39\x53\x70\x4c\x46\x77\x51\x66\x38\x6d\x52\
-\x4a\x74\x4c\x41\x45\x6e\x49\x79\x52\x30\x32\x4f\x54\x71\x4b\x6f\
-\x71\x6f\x57\x64\x46\x2f\x79\x70\x4e\x65\x43\x41\x6a\x31\x49\x6b\
-\x57\x35\x70\x2f\x6f\x6a\x32\x51\x75\x44\x6f\x4d\x73\x6f\x71\x50\
-\x57\x73\x74\x31\x75\x4a\x44\x4d\x39\x42\x70\x77\x50\x20\x76\x33\
-\x75\x33\x32\x30\x46\x64\x38\x37\x42\x36\x59\x46\x72\x56\x4c\x42\
-\x5a\x4c\x67\x76\x4d\x59\x62\x61\x69\x6e\x30\x7a\x78\x77\x36\x73\
-\x6b\x45\x67\x75\x62\x73\x37\x49\x79\x4c\x73\x7a\x4d\x57\x73\x7a\
-\x6b\x33\x31\x33\x66\x38\x38\x4e\x65\x2f\x34\x49\x4b\x6e\x37\x61\
-\x4e\x41\x6b\x6c\x59\x59\x6c\x61\x77\x43\x20\x6c\x78\x64\x47\x70\
-\x53\x53\x6a\x50\x2b\x31\x73\x54\x64\x50\x6b\x6e\x61\x2b\x32\x51\
-\x75\x73\x37\x46\x45\x39\x43\x71\x30\x7a\x35\x4f\x6c\x79\x49\x78\
-\x68\x4d\x71\x61\x62\x36\x4f\x2f\x7a\x61\x6d\x31\x34\x33\x4a\x42\
-\x44\x2b\x33\x2f\x52\x5a\x34\x78\x6c\x50\x75\x31\x50\x67\x65\x38\
-\x69\x52\x4d\x50\x34\x2b\x46\x20\x44\x59\x36\x64\x4b\x44\x75\x67\
-\x59\x37\x48\x58\x54\x2f\x6d\x49\x52\x2f\x35\x32\x75\x4e\x30\x66\
-\x58\x73\x4f\x58\x74\x72\x46\x53\x4d\x6d\x70\x49\x36\x4c\x32\x2f\
-\x76\x36\x65\x6f\x70\x45\x54\x5a\x64\x44\x72\x46\x65\x35\x6e\x6b\
-\x78\x68\x6a\x51\x49\x76\x2b\x77\x57\x6f\x6c\x57\x35\x63\x6e\x4a\
-\x53\x51\x5a\x6f\x20\x6c\x73\x73\x6c\x30\x2f\x6b\x79\x50\x6c\x43\
-\x56\x77\x5a\x33\x35\x66\x4d\x37\x44\x77\x34\x50\x55\x6d\x6c\x6a\
-\x4f\x5a\x58\x43\x31\x67\x30\x4c\x58\x47\x4c\x56\x4d\x77\x45\x73\
-\x79\x6e\x63\x5a\x39\x6e\x50\x36\x57\x6d\x44\x76\x6a\x59\x48\x2f\
-\x61\x52\x52\x50\x70\x34\x45\x73\x48\x77\x68\x67\x51\x53\x4e\x2b\
-\x33\x20\x32\x2b\x32\x6f\x59\x36\x31\x36\x59\x4d\x38\x38\x4c\x6f\
-\x71\x43\x68\x34\x63\x48\x4b\x6d\x31\x52\x39\x5a\x53\x2b\x36\x5a\
-\x69\x56\x30\x38\x67\x30\x63\x64\x68\x67\x71\x43\x59\x31\x4a\x79\
-\x63\x6e\x4c\x45\x39\x50\x63\x2f\x32\x4d\x37\x58\x62\x4c\x39\x7a\
-\x2f\x2b\x77\x50\x33\x71\x67\x64\x6c\x69\x76\x69\x64\x6c\x20\x4b\
-\x47\x59\x72\x32\x66\x64\x4b\x37\x2f\x64\x39\x7a\x36\x62\x5a\x35\
-\x49\x70\x51\x71\x58\x38\x30\x63\x4c\x39\x36\x79\x4f\x42\x4c\x4f\
-\x6e\x35\x2f\x66\x4f\x78\x50\x71\x72\x52\x72\x4a\x6f\x44\x47\x46\
-\x4e\x55\x65\x63\x48\x4c\x34\x2b\x6c\x51\x37\x33\x4a\x6e\x2b\x46\
-\x75\x30\x52\x2f\x73\x48\x6a\x79\x66\x31\x46\x20\x4d\x76\x68\x66\
-\x50\x44\x47\x43\x7a\x67\x54\x65\x6b\x48\x79\x35\x74\x43\x4d\x65\
-\x41\x6a\x7a\x52\x4a\x78\x67\x32\x30\x48\x32\x6e\x65\x49\x67\x50\
-\x66\x76\x6f\x72\x66\x65\x69\x6a\x66\x78\x42\x7a\x43\x6f\x4d\x52\
-\x61\x66\x4b\x49\x70\x50\x6d\x2b\x5a\x64\x66\x31\x72\x43\x64\x72\
-\x36\x72\x71\x6d\x4c\x43\x53\x6c\x20\x61\x62\x66\x64\x38\x76\x43\
-\x77\x79\x6d\x47\x42\x37\x61\x5a\x68\x74\x32\x31\x35\x2f\x66\x6f\
-\x31\x70\x79\x66\x6e\x75\x66\x71\x4f\x42\x4c\x36\x6c\x65\x6b\x39\
-\x52\x46\x44\x78\x2f\x2f\x70\x7a\x33\x37\x39\x38\x7a\x6d\x38\x33\
-\x45\x68\x79\x79\x46\x44\x53\x50\x30\x4d\x53\x53\x6d\x70\x32\x33\
-\x57\x4c\x32\x6e\x62\x20\x56\x6d\x6f\x6a\x4a\x47\x51\x73\x5a\x55\
-\x67\x6a\x62\x4a\x52\x44\x4b\x44\x76\x74\x6e\x6f\x66\x39\x2f\x56\
-\x54\x75\x74\x4f\x63\x51\x4f\x45\x76\x2b\x6f\x51\x7a\x53\x30\x38\
-\x55\x79\x37\x38\x51\x71\x58\x70\x76\x63\x6b\x38\x53\x72\x64\x46\
-\x41\x6f\x44\x33\x55\x35\x34\x52\x2f\x2f\x34\x7a\x2b\x77\x75\x52\
-\x64\x51\x20\x36\x50\x4c\x6c\x43\x37\x45\x63\x43\x6b\x76\x58\x39\
-\x39\x79\x74\x48\x76\x6a\x77\x34\x61\x2b\x73\x31\x77\x38\x43\x63\
-\x70\x68\x41\x30\x2b\x32\x69\x55\x48\x41\x30\x74\x32\x50\x63\x44\
-\x61\x30\x45\x71\x65\x77\x36\x31\x70\x73\x48\x34\x58\x62\x47\x4f\
-\x4a\x36\x50\x6b\x32\x63\x73\x4c\x33\x67\x49\x2f\x59\x74\x46\x20\
-\x4d\x2f\x52\x4a\x31\x33\x56\x5a\x36\x54\x72\x46\x39\x6f\x71\x69\
-\x6f\x4b\x34\x4b\x71\x58\x78\x38\x5a\x4c\x4b\x4e\x71\x57\x71\x66\
-\x62\x67\x65\x62\x77\x47\x65\x48\x2b\x63\x2b\x6e\x63\x49\x34\x58\
-\x79\x47\x50\x6a\x2b\x56\x45\x2b\x34\x61\x64\x4f\x39\x46\x75\x32\
-\x77\x78\x31\x33\x2f\x4e\x33\x37\x5a\x76\x47\x58\x20\x6e\x79\x75\
-\x5a\x68\x35\x4a\x76\x70\x30\x63\x37\x55\x38\x76\x44\x77\x31\x33\
-\x4d\x70\x72\x6a\x46\x4f\x34\x6e\x4e\x7a\x65\x63\x7a\x79\x75\x67\
-\x33\x4c\x68\x62\x43\x70\x58\x7a\x2f\x2f\x6a\x31\x58\x56\x31\x63\
-\x73\x7a\x30\x35\x35\x2b\x66\x4a\x6c\x76\x75\x2b\x2b\x6c\x37\x44\
-\x48\x63\x72\x6d\x6b\x61\x52\x70\x2b\x20\x2b\x75\x6b\x6e\x79\x72\
-\x4a\x6b\x76\x70\x6a\x6c\x47\x6f\x48\x4a\x4c\x45\x36\x78\x76\x75\
-\x31\x32\x6d\x2f\x32\x39\x77\x38\x45\x6d\x35\x35\x51\x42\x75\x56\
-\x77\x4f\x45\x79\x58\x35\x6b\x75\x50\x73\x37\x4d\x4d\x2b\x53\x65\
-\x65\x4c\x64\x37\x2b\x58\x74\x77\x5a\x4a\x36\x71\x50\x4e\x70\x6e\
-\x55\x36\x58\x69\x62\x68\x20\x34\x43\x4d\x6c\x69\x32\x45\x32\x6e\
-\x62\x4a\x64\x37\x39\x42\x61\x38\x2b\x33\x58\x76\x38\x75\x37\x57\
-\x74\x2f\x33\x58\x46\x33\x66\x38\x4f\x4e\x50\x66\x35\x55\x79\x32\
-\x6c\x6f\x4a\x76\x31\x4d\x46\x74\x72\x73\x64\x31\x58\x53\x79\x46\
-\x79\x73\x4e\x49\x64\x44\x48\x79\x62\x62\x62\x37\x53\x51\x57\x35\
-\x38\x54\x4d\x20\x33\x4d\x61\x34\x58\x44\x68\x49\x48\x52\x72\x76\
-\x64\x47\x6d\x6e\x48\x6b\x2f\x53\x74\x48\x50\x62\x79\x4d\x59\x5a\
-\x5a\x33\x47\x6b\x6e\x65\x78\x59\x33\x2b\x7a\x6c\x53\x44\x37\x52\
-\x6c\x46\x49\x6a\x4c\x61\x57\x2f\x62\x52\x75\x50\x38\x55\x4f\x4c\
-\x30\x7a\x37\x70\x43\x33\x36\x70\x47\x63\x51\x51\x73\x35\x4c\x2f\
-\x20\x78\x78\x5a\x50\x47\x5a\x51\x66\x6e\x64\x39\x45\x56\x72\x32\
-\x4b\x59\x59\x43\x68\x45\x38\x66\x6d\x6d\x76\x7a\x79\x5a\x53\x76\
-\x4f\x65\x4a\x56\x52\x53\x75\x58\x76\x6b\x39\x70\x33\x4a\x76\x49\
-\x31\x46\x63\x46\x31\x4c\x4b\x5a\x6e\x6d\x59\x33\x69\x46\x56\x68\
-\x54\x30\x76\x73\x6f\x5a\x42\x75\x4a\x77\x62\x4f\x5a\x20\x6b\x4c\
-\x4b\x76\x72\x71\x36\x34\x75\x72\x72\x69\x75\x2b\x2b\x2b\x45\x32\
-\x30\x54\x55\x36\x43\x69\x76\x7a\x4f\x66\x7a\x37\x6d\x35\x75\x36\
-\x57\x73\x4b\x39\x36\x2f\x66\x7a\x38\x51\x77\x6d\x63\x79\x49\x64\
-\x4e\x6b\x6e\x4d\x53\x77\x53\x4c\x72\x4f\x38\x62\x55\x36\x35\x39\
-\x68\x75\x74\x35\x53\x54\x47\x6c\x4d\x57\x20\x6f\x6f\x55\x5a\x41\
-\x59\x6c\x55\x49\x2f\x33\x77\x2f\x6d\x43\x30\x55\x67\x63\x45\x4e\
-\x51\x32\x69\x2f\x35\x4d\x45\x70\x31\x4c\x62\x37\x56\x6f\x6d\x6b\
-\x78\x6e\x4b\x79\x69\x53\x30\x61\x6b\x42\x73\x55\x30\x75\x54\x4e\
-\x43\x30\x41\x71\x39\x57\x4b\x35\x36\x63\x76\x30\x46\x70\x7a\x63\
-\x33\x50\x4c\x68\x36\x75\x50\x20\x58\x4e\x2f\x64\x30\x76\x52\x52\
-\x4c\x45\x73\x72\x6c\x46\x50\x6f\x51\x6c\x67\x75\x54\x62\x64\x6a\
-\x55\x74\x57\x30\x62\x63\x4e\x6d\x74\x38\x32\x6d\x70\x6e\x4d\x75\
-\x4a\x37\x6e\x6d\x63\x45\x6f\x51\x2f\x56\x44\x73\x73\x4f\x36\x6e\
-\x79\x5a\x49\x71\x46\x77\x6c\x72\x69\x31\x47\x66\x47\x61\x70\x53\
-\x46\x73\x6b\x38\x20\x51\x62\x32\x4c\x36\x4b\x71\x63\x49\x79\x74\
-\x79\x4d\x34\x41\x66\x49\x59\x79\x78\x68\x57\x48\x52\x53\x63\x65\
-\x4d\x52\x67\x38\x71\x2f\x46\x78\x67\x35\x70\x65\x33\x74\x42\x4f\
-\x4f\x54\x57\x58\x76\x2f\x58\x46\x7a\x56\x46\x61\x49\x2f\x66\x62\
-\x55\x53\x76\x7a\x4a\x4f\x4f\x4b\x6a\x35\x6f\x45\x43\x70\x59\x35\
-\x6a\x20\x6f\x48\x75\x2b\x4b\x55\x2b\x72\x53\x78\x2b\x37\x72\x6a\
-\x46\x2f\x55\x69\x6c\x4a\x31\x68\x58\x55\x55\x6d\x4f\x74\x45\x56\
-\x35\x68\x74\x78\x76\x41\x44\x32\x58\x77\x6f\x63\x64\x71\x51\x54\
-\x34\x4c\x57\x2b\x58\x55\x46\x68\x67\x6d\x30\x4a\x2f\x2f\x2f\x47\
-\x65\x2b\x2f\x76\x70\x72\x46\x6f\x74\x46\x42\x46\x39\x6b\x20\x74\
-\x2f\x7a\x32\x32\x32\x38\x78\x78\x6e\x44\x35\x37\x49\x4b\x32\x62\
-\x62\x6d\x2f\x76\x2b\x66\x6d\x35\x67\x62\x76\x42\x37\x47\x6b\x63\
-\x62\x58\x58\x51\x79\x33\x4d\x74\x46\x4d\x2b\x66\x2f\x35\x38\x7a\
-\x32\x64\x72\x6d\x6f\x62\x4a\x5a\x4d\x4a\x6b\x4d\x68\x46\x36\x6e\
-\x44\x46\x37\x2f\x62\x75\x48\x6b\x69\x4d\x71\x20\x30\x79\x46\x61\
-\x41\x4f\x50\x64\x74\x4f\x73\x36\x5a\x72\x4e\x5a\x66\x75\x41\x6d\
-\x78\x73\x58\x47\x51\x46\x46\x51\x30\x50\x53\x64\x4d\x46\x2b\x30\
-\x35\x73\x4f\x48\x44\x33\x7a\x31\x34\x69\x75\x63\x43\x2f\x7a\x6c\
-\x70\x37\x2f\x79\x38\x50\x43\x41\x31\x34\x71\x79\x4c\x4e\x69\x32\
-\x6a\x62\x43\x70\x67\x6d\x4f\x7a\x20\x32\x64\x44\x31\x4c\x51\x2b\
-\x62\x46\x54\x63\x33\x4e\x77\x51\x6e\x4b\x6d\x55\x4a\x31\x57\x7a\
-\x62\x56\x71\x70\x55\x6a\x48\x62\x6f\x38\x58\x57\x6e\x69\x51\x6b\
-\x44\x4f\x44\x59\x32\x6c\x38\x65\x5a\x4a\x6e\x73\x4c\x37\x4d\x68\
-\x64\x47\x66\x75\x49\x61\x63\x77\x63\x38\x77\x57\x66\x73\x72\x43\
-\x4f\x2f\x66\x39\x76\x20\x30\x51\x37\x6e\x78\x2b\x48\x76\x77\x51\
-\x65\x73\x44\x2f\x33\x42\x4c\x68\x52\x46\x68\x63\x4b\x68\x49\x4d\
-\x31\x68\x30\x42\x32\x42\x76\x35\x48\x45\x55\x42\x65\x4a\x73\x58\
-\x30\x66\x42\x78\x6c\x44\x4d\x46\x6d\x4e\x50\x70\x51\x46\x6a\x4a\
-\x53\x55\x49\x35\x4c\x59\x6a\x49\x63\x6a\x68\x73\x47\x58\x54\x76\
-\x42\x78\x20\x78\x32\x65\x54\x6a\x79\x68\x37\x45\x51\x4c\x42\x39\
-\x36\x41\x4d\x74\x37\x63\x33\x6c\x4f\x57\x47\x36\x58\x51\x71\x30\
-\x6f\x4f\x31\x54\x44\x53\x6a\x6c\x43\x54\x79\x2b\x6f\x6a\x79\x4b\
-\x71\x6e\x36\x6f\x2b\x4d\x45\x65\x76\x76\x32\x4c\x58\x55\x74\x4b\
-\x2b\x36\x48\x44\x78\x38\x34\x4f\x7a\x76\x44\x61\x6f\x4f\x4a\x20\
-\x69\x61\x56\x56\x57\x58\x50\x35\x72\x4f\x62\x73\x39\x44\x79\x72\
-\x62\x74\x39\x63\x33\x39\x4b\x32\x4c\x59\x76\x46\x67\x76\x6c\x38\
-\x6e\x6b\x30\x70\x72\x51\x7a\x33\x39\x2f\x65\x73\x31\x32\x75\x6d\
-\x45\x79\x46\x6f\x4e\x30\x33\x44\x62\x72\x65\x54\x4a\x4e\x4d\x52\
-\x73\x30\x5a\x43\x42\x45\x57\x65\x4f\x47\x4d\x70\x20\x64\x59\x32\
-\x4b\x62\x4a\x65\x41\x69\x34\x4f\x70\x6a\x37\x76\x72\x5a\x72\x4f\
-\x68\x72\x69\x5a\x4d\x36\x75\x6c\x41\x36\x6c\x61\x67\x72\x49\x52\
-\x77\x55\x46\x48\x37\x74\x4f\x75\x77\x70\x55\x57\x56\x68\x6d\x44\
-\x68\x66\x2f\x7a\x70\x6a\x35\x79\x64\x50\x36\x50\x5a\x37\x74\x67\
-\x31\x72\x59\x54\x43\x38\x44\x67\x48\x20\x54\x62\x4f\x6c\x61\x62\
-\x65\x73\x4e\x67\x39\x30\x6e\x61\x69\x64\x50\x7a\x77\x38\x45\x50\
-\x72\x42\x56\x78\x4d\x32\x7a\x2f\x48\x46\x32\x6f\x63\x59\x32\x48\
-\x59\x2b\x41\x79\x76\x4a\x35\x4e\x5a\x71\x79\x4e\x44\x33\x65\x59\
-\x47\x57\x37\x53\x79\x4e\x79\x52\x41\x54\x65\x41\x32\x4a\x32\x5a\
-\x52\x69\x72\x35\x2f\x58\x20\x75\x76\x30\x6c\x59\x4e\x39\x76\x31\
-\x54\x37\x6c\x61\x68\x6c\x6a\x36\x50\x70\x32\x50\x37\x50\x2b\x61\
-\x62\x2f\x6a\x38\x59\x6e\x6a\x4c\x78\x42\x45\x57\x39\x4d\x45\x51\
-\x78\x38\x66\x69\x4c\x56\x6c\x72\x6a\x67\x6b\x76\x74\x51\x51\x70\
-\x73\x69\x66\x2f\x55\x54\x63\x38\x4f\x66\x65\x35\x46\x4e\x74\x66\
-\x44\x38\x70\x20\x6a\x74\x54\x33\x45\x74\x42\x66\x32\x79\x33\x57\
-\x57\x75\x62\x7a\x4a\x55\x55\x31\x47\x61\x56\x41\x44\x64\x42\x34\
-\x31\x33\x55\x6f\x4c\x2b\x64\x35\x39\x2b\x34\x64\x5a\x32\x64\x6e\
-\x70\x47\x7a\x31\x63\x64\x4a\x74\x4f\x72\x2f\x57\x6d\x73\x6c\x6b\
-\x51\x6c\x30\x4c\x47\x52\x76\x67\x34\x65\x47\x42\x75\x37\x73\x37\
-\x20\x64\x72\x73\x64\x6b\x34\x6c\x6f\x32\x61\x54\x2f\x4c\x78\x59\
-\x4c\x62\x6d\x35\x75\x38\x71\x70\x65\x6c\x69\x57\x6c\x73\x58\x6c\
-\x51\x4a\x79\x68\x2f\x4d\x4c\x4e\x47\x55\x48\x77\x41\x5a\x54\x53\
-\x64\x47\x79\x79\x41\x6f\x69\x69\x59\x54\x71\x65\x63\x6e\x35\x2f\
-\x4c\x75\x61\x4c\x61\x57\x50\x4c\x2f\x55\x70\x2b\x45\x20\x49\x4b\
-\x4b\x7a\x66\x66\x44\x59\x71\x71\x52\x31\x50\x5a\x35\x41\x35\x7a\
-\x76\x2b\x35\x56\x2f\x2f\x4f\x79\x72\x6f\x72\x41\x6a\x67\x50\x50\
-\x53\x68\x70\x2b\x73\x62\x51\x68\x43\x36\x57\x64\x4d\x30\x68\x4c\
-\x35\x6a\x74\x31\x34\x42\x49\x35\x4b\x2f\x55\x72\x6e\x4b\x55\x66\
-\x70\x2f\x43\x74\x56\x30\x6b\x57\x53\x64\x20\x53\x70\x4d\x56\x52\
-\x5a\x46\x39\x30\x76\x46\x7a\x2f\x43\x58\x51\x77\x2b\x65\x51\x2f\
-\x46\x2f\x54\x76\x67\x68\x68\x2f\x5a\x56\x74\x7a\x79\x63\x38\x68\
-\x49\x6d\x50\x72\x53\x43\x48\x46\x79\x56\x4d\x64\x6f\x66\x33\x55\
-\x42\x51\x56\x78\x6f\x6f\x4e\x33\x37\x59\x74\x57\x6e\x74\x53\x73\
-\x70\x63\x65\x37\x61\x52\x4b\x20\x43\x65\x6e\x4c\x48\x33\x47\x71\
-\x66\x2b\x75\x57\x64\x34\x34\x51\x47\x53\x44\x4f\x30\x54\x6d\x48\
-\x36\x33\x71\x55\x46\x73\x68\x39\x4e\x6c\x75\x77\x57\x43\x77\x6f\
-\x36\x6f\x72\x67\x45\x58\x61\x4e\x55\x68\x69\x6a\x4d\x55\x5a\x52\
-\x59\x46\x6a\x64\x33\x37\x4e\x5a\x72\x54\x67\x39\x50\x39\x38\x7a\
-\x65\x38\x64\x67\x20\x53\x76\x70\x39\x48\x4a\x35\x59\x4c\x42\x59\
-\x5a\x39\x45\x6d\x68\x69\x4f\x56\x79\x6d\x59\x2f\x56\x52\x75\x32\
-\x64\x4c\x77\x45\x54\x62\x66\x53\x70\x55\x67\x6a\x6b\x55\x45\x59\
-\x2f\x41\x52\x6c\x46\x56\x57\x65\x75\x36\x53\x45\x68\x49\x50\x6d\
-\x41\x73\x67\x4e\x48\x30\x7a\x44\x36\x32\x73\x6e\x55\x31\x56\x5a\
-\x32\x20\x47\x6c\x4e\x61\x4a\x72\x4d\x70\x64\x36\x73\x48\x72\x4e\
-\x4b\x53\x66\x74\x57\x32\x57\x46\x76\x53\x75\x6a\x62\x36\x32\x2f\
-\x4c\x73\x6b\x70\x61\x71\x33\x50\x2f\x51\x31\x79\x47\x49\x46\x62\
-\x57\x58\x6c\x64\x41\x50\x4d\x63\x79\x69\x4b\x47\x4c\x64\x69\x69\
-\x45\x4a\x4f\x64\x48\x4c\x45\x6e\x53\x66\x34\x61\x5a\x48\x20\x34\
-\x6b\x65\x42\x46\x42\x7a\x66\x48\x7a\x4f\x70\x72\x7a\x38\x31\x43\
-\x6e\x34\x37\x55\x50\x48\x6f\x5a\x66\x32\x43\x4e\x70\x35\x6a\x64\
-\x6e\x78\x44\x68\x78\x50\x73\x32\x41\x54\x5a\x66\x30\x38\x43\x45\
-\x64\x6f\x57\x46\x4d\x72\x53\x39\x51\x48\x66\x52\x66\x6c\x78\x56\
-\x61\x49\x30\x59\x67\x71\x69\x38\x63\x72\x76\x20\x31\x61\x30\x49\
-\x77\x59\x39\x4d\x30\x53\x39\x76\x78\x2b\x4a\x4a\x6e\x32\x70\x6a\
-\x6a\x75\x55\x6a\x66\x38\x48\x33\x74\x4d\x37\x54\x33\x72\x52\x73\
-\x4e\x69\x75\x57\x79\x31\x4e\x6d\x79\x30\x58\x6b\x4a\x43\x71\x52\
-\x4e\x49\x38\x2b\x5a\x46\x33\x58\x33\x4e\x33\x64\x38\x65\x31\x79\
-\x6d\x66\x50\x31\x30\x76\x6e\x54\x20\x39\x59\x78\x66\x34\x2f\x63\
-\x54\x58\x33\x4f\x63\x49\x70\x50\x39\x51\x44\x4d\x77\x61\x74\x4a\
-\x6e\x55\x6d\x35\x69\x58\x64\x66\x6f\x77\x4e\x34\x45\x54\x4a\x4d\
-\x73\x49\x5a\x4b\x39\x48\x78\x61\x41\x38\x59\x34\x48\x2b\x31\x71\
-\x58\x71\x65\x39\x53\x64\x73\x4a\x6d\x73\x32\x45\x32\x6d\x32\x46\
-\x4d\x4d\x64\x44\x44\x20\x6e\x4a\x51\x37\x43\x31\x47\x48\x52\x56\
-\x6b\x6a\x51\x66\x59\x51\x67\x46\x53\x46\x56\x69\x6f\x59\x54\x61\
-\x6f\x61\x76\x50\x6a\x75\x34\x30\x6e\x6e\x77\x72\x36\x34\x73\x51\
-\x42\x61\x49\x30\x37\x71\x4a\x79\x62\x45\x49\x57\x6a\x79\x39\x39\
-\x41\x65\x2b\x5a\x45\x48\x66\x2f\x38\x74\x72\x76\x4b\x4c\x34\x6f\
-\x52\x50\x20\x74\x71\x67\x64\x32\x58\x5a\x4f\x51\x76\x62\x61\x6f\
-\x6f\x33\x46\x42\x54\x42\x61\x45\x61\x49\x2b\x53\x4b\x41\x44\x4e\
-\x42\x34\x4a\x30\x41\x6f\x6f\x4d\x4b\x43\x6a\x76\x2b\x6f\x53\x50\
-\x72\x4e\x54\x44\x79\x5a\x63\x4d\x6e\x76\x53\x67\x49\x77\x42\x38\
-\x34\x68\x59\x74\x64\x32\x4f\x36\x2b\x75\x50\x37\x48\x59\x62\x20\
-\x54\x6b\x35\x4f\x4b\x43\x64\x54\x56\x4f\x52\x73\x4e\x74\x73\x74\
-\x4c\x6e\x69\x4b\x77\x74\x49\x31\x4f\x78\x61\x7a\x63\x37\x79\x43\
-\x72\x75\x74\x7a\x59\x5a\x54\x44\x57\x4e\x63\x34\x59\x79\x45\x68\
-\x66\x32\x6c\x79\x6a\x51\x45\x53\x35\x31\x79\x6b\x62\x51\x34\x53\
-\x38\x34\x63\x75\x67\x6a\x4c\x32\x71\x4c\x57\x69\x20\x74\x57\x59\
-\x53\x51\x77\x6b\x70\x66\x6d\x5a\x74\x6d\x53\x65\x31\x54\x4c\x67\
-\x45\x78\x41\x79\x68\x41\x5a\x41\x69\x70\x69\x39\x66\x76\x73\x51\
-\x6f\x54\x64\x75\x30\x39\x4a\x31\x4d\x73\x74\x49\x57\x57\x58\x63\
-\x30\x61\x36\x2b\x6b\x48\x4c\x73\x67\x46\x5a\x32\x49\x50\x4e\x4b\
-\x2b\x37\x30\x53\x4d\x79\x51\x38\x41\x20\x69\x6d\x51\x6b\x69\x45\
-\x71\x34\x55\x69\x72\x33\x2b\x4f\x38\x54\x41\x67\x41\x41\x49\x41\
-\x42\x4a\x52\x45\x46\x55\x54\x35\x71\x6b\x6e\x74\x47\x43\x70\x54\
-\x58\x42\x66\x39\x6d\x43\x47\x6f\x36\x38\x31\x46\x4d\x49\x33\x38\
-\x39\x71\x6e\x36\x35\x55\x6e\x62\x39\x66\x50\x66\x58\x33\x4c\x79\
-\x35\x73\x64\x72\x54\x6c\x20\x6e\x66\x41\x77\x50\x48\x41\x59\x77\
-\x2f\x76\x45\x4b\x64\x43\x6d\x6c\x47\x49\x59\x46\x41\x52\x56\x6f\
-\x48\x56\x42\x61\x53\x31\x56\x57\x58\x4a\x2f\x66\x77\x4d\x71\x73\
-\x67\x52\x43\x6d\x38\x58\x39\x4a\x45\x79\x52\x79\x30\x76\x2b\x6f\
-\x6f\x76\x2f\x55\x74\x42\x6d\x62\x43\x61\x6d\x37\x78\x75\x62\x6b\
-\x57\x6c\x79\x20\x70\x41\x6c\x78\x2f\x79\x41\x69\x53\x61\x65\x6e\
-\x70\x38\x79\x57\x4a\x32\x67\x6c\x63\x68\x47\x39\x64\x36\x7a\x58\
-\x61\x39\x36\x2b\x66\x63\x76\x64\x33\x52\x31\x65\x43\x59\x49\x71\
-\x5a\x64\x63\x45\x42\x55\x31\x2b\x44\x75\x7a\x6e\x73\x36\x58\x33\
-\x45\x69\x30\x72\x43\x66\x79\x49\x75\x62\x65\x66\x72\x33\x59\x73\
-\x20\x39\x2b\x32\x77\x6a\x58\x66\x5a\x70\x6d\x6b\x79\x67\x4a\x50\
-\x75\x4c\x33\x31\x75\x76\x45\x4f\x4f\x6d\x55\x6e\x4a\x7a\x35\x78\
-\x4d\x4a\x75\x69\x67\x61\x4c\x5a\x62\x51\x56\x6d\x4e\x33\x51\x73\
-\x58\x4e\x45\x32\x44\x43\x39\x49\x2f\x2f\x59\x68\x51\x72\x5a\x51\
-\x69\x39\x4a\x4c\x2f\x70\x34\x4c\x49\x51\x77\x79\x78\x20\x76\x76\
-\x33\x55\x71\x4f\x54\x7a\x6a\x65\x39\x6a\x48\x39\x46\x2b\x58\x4d\
-\x6e\x34\x57\x50\x74\x79\x42\x50\x37\x78\x49\x76\x5a\x72\x32\x6f\
-\x42\x2f\x35\x48\x66\x32\x44\x2f\x69\x56\x69\x34\x42\x53\x36\x76\
-\x50\x41\x7a\x4e\x4d\x33\x72\x77\x68\x6f\x32\x68\x36\x30\x71\x55\
-\x43\x56\x7a\x47\x5a\x7a\x76\x76\x33\x32\x20\x39\x33\x7a\x33\x2b\
-\x39\x39\x6a\x6c\x4f\x4b\x2f\x2f\x74\x66\x2f\x67\x37\x66\x76\x2f\
-\x6f\x6f\x67\x72\x69\x71\x76\x47\x56\x49\x4d\x4a\x4e\x6e\x34\x76\
-\x32\x30\x37\x78\x48\x70\x38\x66\x78\x67\x48\x47\x6f\x45\x62\x67\
-\x4c\x47\x4b\x72\x6d\x38\x69\x71\x46\x43\x67\x6a\x61\x48\x72\x47\
-\x2b\x37\x75\x37\x6d\x6a\x62\x20\x6c\x75\x58\x5a\x4f\x55\x6f\x48\
-\x64\x70\x73\x47\x66\x4f\x44\x62\x62\x37\x39\x46\x4b\x5a\x56\x6c\
-\x37\x72\x5a\x52\x4e\x69\x2f\x56\x52\x79\x79\x4b\x67\x73\x6c\x6b\
-\x77\x6e\x51\x36\x7a\x52\x4a\x34\x61\x55\x4b\x6b\x34\x48\x76\x36\
-\x2f\x6b\x51\x6d\x67\x42\x46\x67\x63\x67\x43\x7a\x5a\x7a\x39\x51\
-\x6a\x79\x48\x37\x20\x51\x53\x2b\x6c\x30\x74\x56\x65\x50\x71\x48\
-\x57\x51\x77\x62\x34\x50\x6c\x4e\x6d\x53\x47\x35\x64\x72\x56\x59\
-\x53\x30\x7a\x53\x57\x72\x75\x6e\x6f\x57\x30\x66\x66\x4f\x6c\x77\
-\x72\x32\x52\x46\x39\x33\x32\x4f\x72\x4d\x75\x38\x30\x51\x53\x6d\
-\x4d\x4b\x65\x6a\x37\x42\x75\x2f\x41\x47\x49\x33\x7a\x73\x6b\x4f\
-\x62\x20\x4b\x45\x4f\x52\x72\x73\x65\x50\x34\x73\x4c\x70\x75\x6d\
-\x47\x6b\x79\x42\x32\x47\x59\x79\x58\x32\x39\x2b\x6e\x6e\x65\x57\
-\x79\x4d\x48\x2f\x62\x56\x76\x78\x66\x79\x43\x62\x38\x65\x75\x4a\
-\x46\x4a\x4f\x45\x4b\x33\x78\x44\x7a\x63\x46\x7a\x38\x46\x65\x51\
-\x6a\x79\x69\x78\x36\x74\x58\x4a\x71\x41\x6f\x61\x68\x6d\x20\x6e\
-\x4a\x35\x64\x38\x75\x30\x33\x76\x2b\x64\x33\x76\x2f\x75\x4f\x2b\
-\x65\x49\x45\x72\x53\x30\x45\x78\x2b\x74\x76\x2f\x79\x4e\x76\x50\
-\x37\x78\x48\x42\x51\x6b\x52\x53\x4c\x6b\x64\x49\x58\x79\x6e\x77\
-\x50\x66\x6e\x32\x72\x48\x4f\x50\x74\x79\x39\x51\x35\x43\x51\x79\
-\x6c\x4e\x46\x4e\x76\x63\x37\x61\x70\x2b\x35\x20\x34\x4f\x4e\x4b\
-\x44\x36\x6d\x4f\x68\x61\x52\x57\x39\x61\x37\x6c\x2f\x72\x34\x6a\
-\x61\x4d\x56\x30\x4f\x6f\x38\x37\x6a\x6a\x42\x6a\x79\x72\x4b\x4d\
-\x45\x67\x6b\x64\x5a\x33\x6f\x2f\x4d\x36\x44\x72\x75\x69\x79\x71\
-\x6c\x41\x6a\x64\x4b\x53\x68\x65\x46\x45\x55\x4d\x2f\x41\x2b\x71\
-\x62\x34\x64\x73\x6c\x2f\x48\x76\x20\x49\x59\x54\x42\x33\x42\x33\
-\x64\x77\x74\x35\x6b\x48\x51\x33\x71\x72\x4d\x44\x6d\x39\x2b\x74\
-\x59\x43\x4a\x6e\x61\x69\x47\x79\x45\x44\x32\x7a\x58\x4b\x38\x34\
-\x6a\x77\x4c\x52\x61\x62\x51\x69\x39\x41\x7a\x66\x34\x70\x47\x4f\
-\x54\x57\x58\x52\x34\x66\x45\x34\x54\x53\x2f\x66\x76\x6f\x33\x4a\
-\x33\x71\x74\x6b\x77\x20\x6d\x4b\x50\x2b\x55\x66\x2f\x75\x4c\x53\
-\x79\x6a\x58\x56\x43\x4f\x4d\x58\x76\x33\x6c\x5a\x2f\x53\x4c\x34\
-\x46\x4a\x52\x35\x2f\x37\x72\x53\x5a\x6e\x66\x68\x62\x44\x4f\x2f\
-\x76\x66\x39\x33\x4f\x76\x37\x51\x67\x59\x61\x51\x6b\x46\x6b\x42\
-\x78\x70\x48\x2b\x4f\x44\x70\x43\x51\x4a\x53\x58\x37\x30\x45\x4c\
-\x7a\x42\x20\x6d\x42\x4b\x50\x4a\x58\x6a\x4e\x5a\x4c\x62\x67\x37\
-\x50\x77\x35\x76\x2f\x39\x50\x2f\x77\x76\x6e\x7a\x31\x39\x79\x65\
-\x6e\x71\x4f\x30\x70\x61\x75\x63\x36\x4b\x61\x31\x54\x59\x38\x66\
-\x2f\x55\x64\x56\x66\x33\x2f\x30\x6d\x77\x36\x6f\x4e\x6d\x7a\x34\
-\x55\x55\x42\x57\x6b\x66\x6a\x2f\x74\x50\x55\x6f\x6e\x46\x6e\x20\
-\x50\x4e\x71\x64\x51\x38\x52\x64\x6c\x51\x54\x34\x39\x73\x56\x6f\
-\x46\x57\x4f\x46\x61\x54\x6e\x4d\x35\x35\x34\x4c\x68\x42\x69\x69\
-\x44\x49\x50\x4d\x67\x2f\x4b\x45\x6c\x43\x75\x6d\x46\x4f\x75\x48\
-\x4f\x33\x62\x72\x44\x61\x59\x73\x71\x47\x76\x34\x34\x59\x63\x2f\
-\x4d\x35\x2f\x50\x6d\x55\x78\x6d\x65\x58\x65\x54\x20\x43\x57\x57\
-\x78\x52\x55\x46\x56\x46\x4d\x77\x6d\x6b\x78\x77\x76\x53\x31\x71\
-\x66\x4b\x58\x76\x67\x59\x62\x33\x4a\x77\x49\x34\x78\x68\x6b\x6c\
-\x56\x59\x75\x77\x41\x32\x52\x74\x74\x42\x79\x51\x53\x52\x52\x2b\
-\x46\x6f\x4d\x62\x77\x58\x39\x4b\x78\x30\x56\x72\x6a\x6f\x38\x67\
-\x55\x57\x67\x6e\x62\x4a\x41\x52\x55\x20\x54\x4c\x6e\x79\x73\x59\
-\x79\x42\x43\x42\x35\x35\x51\x74\x2f\x78\x35\x71\x65\x33\x6c\x4c\
-\x62\x67\x2f\x50\x52\x4d\x55\x71\x61\x32\x75\x78\x69\x6e\x6c\x4f\
-\x73\x53\x74\x46\x4b\x68\x34\x76\x65\x6c\x6d\x46\x36\x54\x68\x49\
-\x4f\x4e\x7a\x5a\x71\x70\x4b\x63\x4d\x2f\x69\x74\x48\x45\x48\x74\
-\x77\x76\x6e\x32\x61\x53\x20\x47\x5a\x77\x63\x4f\x51\x35\x43\x45\
-\x53\x50\x4e\x49\x4d\x57\x52\x73\x54\x42\x69\x74\x49\x51\x67\x35\
-\x51\x66\x37\x34\x50\x4a\x7a\x54\x7a\x55\x65\x4d\x6d\x6f\x63\x39\
-\x69\x66\x67\x73\x63\x6d\x38\x37\x38\x70\x38\x49\x54\x4d\x72\x64\
-\x2f\x39\x42\x31\x54\x41\x65\x4c\x35\x35\x50\x68\x55\x75\x4f\x4c\
-\x51\x70\x61\x20\x61\x79\x7a\x4b\x45\x70\x51\x56\x34\x54\x63\x6c\
-\x67\x39\x5a\x37\x6d\x59\x77\x65\x52\x64\x65\x42\x73\x67\x56\x46\
-\x56\x54\x4f\x5a\x4c\x6a\x6b\x39\x75\x65\x54\x38\x34\x70\x4b\x58\
-\x4c\x31\x2f\x7a\x37\x50\x6c\x58\x6d\x48\x4b\x4f\x73\x6a\x61\x4b\
-\x45\x6f\x47\x32\x4a\x53\x34\x34\x67\x67\x6b\x73\x54\x38\x34\x35\
-\x20\x57\x56\x37\x77\x66\x6e\x4d\x7a\x75\x72\x69\x34\x55\x67\x63\
-\x54\x66\x5a\x66\x66\x41\x6c\x38\x61\x45\x77\x70\x2b\x33\x75\x6f\
-\x33\x6f\x48\x62\x53\x51\x70\x42\x4b\x55\x77\x48\x52\x66\x35\x45\
-\x56\x75\x38\x4e\x51\x53\x44\x4a\x73\x43\x44\x77\x38\x50\x48\x42\
-\x37\x65\x37\x39\x33\x44\x6d\x4d\x6b\x52\x36\x2b\x75\x20\x61\x2b\
-\x71\x36\x70\x71\x6f\x71\x74\x4c\x56\x53\x5a\x69\x7a\x73\x78\x2f\
-\x68\x63\x38\x42\x6c\x4d\x32\x57\x33\x57\x4e\x4a\x73\x68\x75\x38\
-\x43\x61\x67\x72\x71\x75\x6d\x63\x79\x6d\x4f\x58\x50\x68\x30\x47\
-\x56\x49\x76\x69\x59\x4d\x4a\x71\x33\x55\x75\x68\x6c\x53\x68\x38\
-\x51\x36\x69\x50\x69\x31\x67\x72\x76\x62\x20\x47\x37\x37\x2f\x2f\
-\x6e\x75\x57\x69\x77\x58\x66\x66\x76\x63\x74\x37\x58\x62\x48\x77\
-\x2b\x30\x39\x62\x64\x76\x6c\x77\x4c\x6b\x6a\x53\x48\x6e\x74\x63\
-\x57\x37\x65\x32\x48\x77\x66\x4c\x59\x41\x5a\x48\x50\x6c\x5a\x76\
-\x66\x33\x62\x74\x68\x43\x47\x4b\x5a\x41\x73\x69\x69\x38\x4a\x50\
-\x66\x2f\x57\x75\x2b\x57\x76\x20\x61\x51\x4c\x4d\x46\x46\x4e\x38\
-\x38\x43\x4a\x30\x47\x30\x54\x4c\x77\x38\x51\x61\x37\x38\x62\x57\
-\x6e\x4a\x36\x65\x73\x54\x77\x39\x35\x2b\x4c\x38\x42\x61\x66\x6e\
-\x35\x79\x77\x58\x70\x78\x54\x31\x52\x48\x77\x50\x55\x38\x6a\x71\
-\x5a\x41\x70\x43\x36\x45\x56\x6f\x78\x35\x59\x45\x31\x34\x6d\x53\
-\x32\x57\x54\x4f\x20\x64\x37\x2f\x2f\x50\x62\x65\x33\x50\x37\x48\
-\x62\x62\x48\x49\x47\x2f\x77\x44\x6a\x2f\x31\x59\x64\x38\x4e\x74\
-\x31\x5a\x48\x70\x41\x4b\x58\x4e\x64\x36\x61\x67\x7a\x45\x67\x53\
-\x2b\x4c\x32\x4c\x53\x71\x7a\x57\x78\x37\x74\x32\x6f\x5a\x48\x4c\
-\x66\x74\x6a\x77\x30\x44\x62\x65\x33\x4e\x33\x6b\x51\x4c\x78\x62\
-\x4c\x20\x58\x49\x69\x6c\x6a\x50\x55\x67\x62\x4d\x71\x56\x4b\x79\
-\x7a\x54\x75\x73\x72\x66\x37\x53\x50\x56\x72\x6d\x6b\x61\x31\x67\
-\x38\x62\x62\x71\x2f\x76\x38\x6a\x56\x5a\x71\x35\x6e\x50\x35\x39\
-\x52\x31\x6a\x64\x45\x36\x51\x2f\x33\x65\x79\x34\x35\x59\x35\x47\
-\x43\x38\x4a\x79\x53\x46\x68\x46\x67\x37\x35\x50\x33\x62\x20\x74\
-\x31\x78\x66\x58\x37\x50\x64\x62\x6a\x6b\x37\x4f\x57\x65\x37\x61\
-\x58\x6a\x2f\x2f\x67\x4e\x4b\x4b\x57\x37\x75\x37\x33\x4c\x6f\x4a\
-\x46\x35\x46\x4c\x72\x6d\x57\x41\x42\x37\x78\x6c\x2b\x33\x65\x43\
-\x68\x2f\x79\x4c\x76\x67\x72\x70\x2b\x45\x58\x68\x4b\x67\x2b\x42\
-\x63\x4b\x4e\x72\x31\x45\x70\x6c\x64\x55\x68\x20\x76\x75\x53\x7a\
-\x66\x79\x2f\x4e\x2f\x71\x2f\x2f\x32\x2f\x38\x75\x4a\x6b\x66\x6e\
-\x43\x45\x47\x68\x6a\x4b\x57\x77\x46\x57\x55\x78\x6f\x53\x67\x71\
-\x4a\x76\x4d\x46\x56\x54\x6e\x42\x52\x4b\x4b\x76\x35\x4f\x49\x5a\
-\x50\x45\x54\x4e\x53\x59\x2f\x53\x67\x38\x6b\x67\x36\x53\x71\x64\
-\x79\x4f\x6d\x6a\x2b\x65\x71\x72\x20\x72\x2f\x69\x58\x66\x35\x36\
-\x79\x32\x34\x6a\x59\x74\x46\x59\x70\x6b\x31\x74\x4b\x53\x2f\x2b\
-\x39\x78\x49\x4d\x4f\x32\x39\x6a\x76\x63\x6b\x36\x4b\x69\x41\x67\
-\x61\x32\x57\x55\x30\x74\x43\x7a\x72\x75\x42\x4e\x42\x38\x46\x70\
-\x32\x6e\x57\x43\x77\x79\x71\x4a\x4b\x42\x56\x71\x78\x32\x32\x33\
-\x5a\x37\x62\x62\x63\x20\x33\x74\x37\x6d\x41\x56\x50\x57\x4e\x63\
-\x76\x35\x6e\x43\x70\x79\x52\x4e\x50\x33\x4a\x52\x4f\x31\x72\x6d\
-\x74\x4f\x54\x6f\x59\x30\x6e\x71\x35\x72\x73\x70\x2f\x35\x2f\x76\
-\x33\x37\x44\x50\x31\x2f\x39\x66\x56\x72\x69\x71\x4c\x4d\x67\x38\
-\x77\x35\x68\x30\x5a\x30\x64\x38\x54\x33\x68\x54\x2f\x39\x38\x58\
-\x2f\x77\x20\x35\x2b\x2b\x2f\x7a\x2b\x66\x39\x36\x61\x65\x66\x75\
-\x4c\x71\x36\x77\x68\x69\x62\x79\x34\x56\x6c\x38\x45\x63\x70\x59\
-\x70\x4c\x46\x48\x72\x67\x44\x53\x48\x56\x6a\x78\x69\x47\x66\x76\
-\x34\x2f\x6e\x64\x6a\x6a\x42\x6a\x70\x6d\x43\x78\x79\x62\x69\x33\
-\x39\x50\x45\x74\x42\x66\x50\x2f\x31\x50\x73\x32\x4f\x67\x4c\x20\
-\x49\x44\x71\x59\x41\x6a\x64\x62\x56\x4b\x79\x4c\x45\x41\x4a\x30\
-\x50\x74\x43\x48\x67\x4d\x6f\x51\x75\x4b\x49\x77\x42\x63\x34\x46\
-\x6c\x4a\x4c\x4b\x4e\x2b\x4a\x50\x61\x6f\x77\x47\x31\x7a\x5a\x4d\
-\x4a\x30\x73\x57\x69\x78\x4e\x57\x44\x7a\x57\x75\x37\x66\x48\x65\
-\x6f\x52\x51\x59\x49\x39\x7a\x4f\x77\x34\x49\x69\x20\x2f\x39\x59\
-\x74\x41\x78\x36\x50\x6f\x72\x41\x2b\x75\x71\x73\x43\x66\x6a\x6a\
-\x58\x73\x39\x6d\x73\x55\x62\x47\x57\x52\x55\x4a\x54\x55\x32\x69\
-\x69\x71\x69\x61\x78\x6d\x6c\x48\x6b\x51\x69\x4c\x31\x45\x32\x62\
-\x54\x57\x76\x72\x58\x44\x30\x48\x35\x76\x6d\x33\x34\x2b\x48\x34\
-\x54\x66\x53\x71\x56\x4d\x7a\x43\x6d\x20\x30\x38\x45\x45\x31\x54\
-\x46\x4e\x6f\x43\x6f\x4d\x70\x5a\x30\x77\x72\x57\x75\x55\x49\x72\
-\x4e\x70\x76\x76\x2f\x2b\x65\x2b\x35\x76\x61\x73\x37\x4f\x4c\x76\
-\x62\x4d\x4b\x6d\x50\x6b\x73\x35\x76\x4e\x68\x76\x76\x37\x57\x39\
-\x37\x38\x35\x55\x64\x35\x46\x6e\x31\x4c\x73\x34\x4f\x69\x72\x4e\
-\x6d\x31\x44\x53\x45\x30\x20\x4b\x41\x7a\x61\x47\x49\x6e\x58\x6a\
-\x51\x5a\x71\x30\x47\x70\x76\x41\x56\x4a\x71\x72\x50\x2b\x6a\x32\
-\x55\x2f\x45\x2f\x75\x55\x6c\x45\x74\x4c\x35\x66\x6d\x34\x62\x54\
-\x37\x52\x30\x37\x65\x6e\x2f\x6d\x69\x38\x7a\x4e\x66\x2b\x65\x64\
-\x6b\x6a\x72\x2f\x53\x7a\x2f\x52\x34\x41\x54\x6a\x66\x63\x42\x35\
-\x2b\x4b\x44\x20\x73\x43\x6e\x2b\x41\x31\x6f\x6a\x4c\x4a\x67\x67\
-\x2f\x70\x38\x78\x4f\x69\x73\x61\x47\x36\x4d\x69\x56\x4e\x39\x54\
-\x47\x41\x74\x42\x73\x64\x30\x32\x2f\x44\x2f\x2f\x39\x2f\x2f\x4a\
-\x39\x64\x55\x39\x58\x53\x76\x4a\x73\x64\x59\x4d\x66\x6f\x33\x49\
-\x4d\x50\x78\x39\x64\x4d\x52\x54\x44\x79\x53\x46\x47\x44\x4a\x41\
-\x20\x50\x48\x72\x67\x33\x6a\x63\x6a\x6a\x64\x45\x48\x59\x45\x42\
-\x43\x6b\x30\x70\x31\x57\x64\x59\x6f\x61\x33\x49\x73\x30\x6d\x69\
-\x46\x77\x52\x4c\x73\x6f\x43\x76\x6a\x45\x54\x2f\x7a\x35\x75\x59\
-\x61\x45\x4c\x70\x63\x57\x56\x59\x55\x68\x61\x57\x71\x61\x75\x71\
-\x36\x69\x6c\x6b\x5a\x55\x69\x72\x4e\x4f\x51\x56\x42\x20\x54\x4d\
-\x6a\x31\x2b\x6b\x45\x57\x79\x55\x68\x33\x63\x38\x37\x52\x4e\x7a\
-\x74\x75\x62\x6d\x36\x34\x75\x62\x32\x53\x65\x4e\x39\x75\x52\x32\
-\x45\x72\x51\x6e\x42\x30\x58\x55\x4e\x52\x31\x4c\x69\x51\x72\x42\
-\x68\x4a\x36\x73\x33\x35\x64\x77\x6f\x34\x38\x47\x48\x33\x42\x2b\
-\x77\x42\x6b\x65\x44\x66\x34\x50\x47\x4e\x20\x6e\x38\x32\x6e\x7a\
-\x46\x49\x59\x42\x66\x47\x66\x4f\x4d\x38\x78\x46\x50\x72\x77\x39\
-\x33\x2f\x72\x79\x57\x6e\x78\x45\x37\x7a\x76\x44\x31\x59\x4e\x59\
-\x65\x63\x72\x72\x66\x43\x64\x46\x4b\x54\x30\x4b\x6b\x67\x56\x56\
-\x6d\x39\x41\x53\x6e\x30\x54\x67\x6b\x4d\x62\x30\x66\x54\x76\x66\
-\x55\x64\x56\x56\x53\x78\x6d\x20\x63\x37\x62\x62\x4c\x58\x2f\x38\
-\x34\x35\x2f\x34\x30\x78\x2f\x2b\x50\x30\x35\x4f\x61\x6c\x35\x2f\
-\x39\x51\x31\x2f\x2f\x58\x48\x46\x5a\x6e\x4f\x4e\x36\x36\x53\x55\
-\x64\x41\x67\x43\x4b\x67\x77\x53\x64\x72\x39\x78\x2b\x35\x6c\x30\
-\x75\x48\x48\x62\x36\x34\x74\x49\x4e\x73\x44\x76\x45\x35\x50\x54\
-\x63\x53\x62\x57\x20\x66\x45\x2f\x78\x78\x37\x37\x72\x36\x64\x6f\
-\x64\x32\x30\x30\x43\x4d\x54\x51\x32\x54\x73\x6f\x30\x45\x59\x75\
-\x69\x6f\x4b\x36\x6e\x46\x48\x57\x46\x39\x36\x4a\x37\x55\x78\x68\
-\x4c\x4b\x41\x32\x75\x44\x77\x51\x63\x76\x75\x39\x70\x66\x63\x66\
-\x71\x2f\x6b\x48\x2b\x37\x7a\x31\x4e\x73\x36\x55\x30\x46\x71\x2f\
-\x67\x20\x2f\x75\x61\x57\x37\x58\x61\x64\x4e\x56\x5a\x54\x69\x43\
-\x47\x45\x45\x46\x30\x42\x53\x41\x4a\x49\x5a\x56\x6d\x67\x74\x57\
-\x4c\x58\x4e\x42\x53\x6c\x6f\x71\x34\x4e\x33\x6b\x6e\x46\x4b\x42\
-\x64\x36\x6d\x56\x59\x35\x64\x76\x6f\x55\x47\x6e\x32\x38\x54\x75\
-\x54\x66\x72\x67\x32\x45\x68\x4d\x4e\x2b\x48\x34\x63\x38\x20\x48\
-\x6b\x32\x65\x38\x44\x69\x73\x39\x61\x6c\x4a\x64\x65\x78\x65\x50\
-\x6f\x57\x73\x2f\x69\x32\x61\x6c\x53\x54\x4b\x34\x7a\x47\x32\x74\
-\x4e\x49\x46\x48\x66\x41\x2b\x45\x50\x70\x41\x73\x42\x34\x62\x4c\
-\x43\x69\x46\x55\x78\x37\x76\x65\x71\x77\x64\x53\x70\x46\x39\x2f\
-\x2f\x32\x66\x2b\x4d\x4d\x66\x2f\x6b\x43\x37\x20\x61\x7a\x67\x2f\
-\x4f\x38\x4e\x61\x78\x36\x79\x2b\x34\x4f\x4f\x37\x4b\x64\x76\x4e\
-\x48\x55\x51\x59\x33\x76\x65\x53\x38\x4a\x6c\x67\x35\x6e\x2b\x76\
-\x39\x71\x57\x78\x53\x73\x4b\x67\x64\x37\x49\x58\x46\x78\x75\x78\
-\x56\x39\x4c\x50\x2f\x59\x66\x6e\x36\x62\x73\x6d\x46\x34\x70\x4a\
-\x38\x63\x78\x55\x65\x71\x32\x75\x20\x61\x33\x52\x68\x4b\x59\x6f\
-\x71\x6d\x37\x50\x47\x70\x48\x4d\x45\x71\x74\x71\x67\x64\x53\x47\
-\x42\x39\x50\x55\x64\x44\x39\x73\x31\x58\x53\x65\x37\x37\x2f\x72\
-\x68\x44\x6d\x73\x74\x6e\x58\x4e\x53\x72\x63\x67\x49\x6f\x4f\x53\
-\x6a\x6d\x49\x37\x34\x33\x67\x4a\x57\x4e\x46\x32\x44\x4e\x69\x4c\
-\x39\x73\x57\x6d\x32\x20\x61\x46\x57\x67\x39\x43\x69\x67\x48\x2f\
-\x62\x37\x51\x68\x2b\x59\x65\x57\x4f\x53\x51\x37\x72\x50\x52\x49\
-\x66\x37\x74\x32\x79\x48\x45\x79\x4f\x4d\x6e\x6b\x74\x38\x59\x2b\
-\x2f\x39\x70\x7a\x37\x33\x4a\x65\x33\x66\x79\x6d\x53\x31\x58\x62\
-\x2f\x4e\x58\x7a\x67\x65\x55\x43\x6d\x51\x48\x4a\x7a\x41\x31\x6e\
-\x4b\x54\x20\x69\x74\x36\x4c\x62\x4c\x6e\x57\x6d\x6a\x37\x30\x61\
-\x4f\x73\x6f\x69\x70\x4c\x31\x61\x73\x32\x66\x76\x2f\x38\x6a\x56\
-\x78\x38\x2b\x55\x70\x55\x54\x4c\x69\x38\x75\x49\x71\x54\x66\x30\
-\x76\x64\x62\x46\x71\x64\x6e\x33\x4e\x35\x39\x51\x43\x75\x5a\x72\
-\x45\x62\x72\x57\x4a\x42\x4d\x37\x2f\x6c\x6a\x34\x77\x47\x65\x20\
-\x72\x75\x56\x54\x4c\x52\x7a\x71\x6b\x75\x72\x48\x5a\x74\x4f\x6e\
-\x32\x70\x63\x77\x48\x70\x51\x53\x46\x54\x64\x69\x58\x74\x76\x34\
-\x37\x4a\x6d\x4c\x2b\x67\x52\x43\x6d\x38\x2b\x66\x42\x37\x43\x50\
-\x35\x6c\x36\x50\x49\x37\x42\x61\x52\x34\x56\x73\x6a\x43\x79\x45\
-\x51\x59\x74\x4b\x6e\x4b\x32\x77\x78\x53\x43\x33\x20\x32\x44\x55\
-\x74\x33\x73\x66\x36\x43\x44\x6a\x4a\x4b\x64\x41\x61\x35\x33\x6f\
-\x4a\x36\x57\x72\x78\x32\x7a\x4a\x6b\x48\x38\x42\x48\x6a\x56\x69\
-\x50\x46\x39\x32\x5a\x53\x45\x56\x54\x52\x59\x6d\x32\x68\x59\x52\
-\x69\x30\x71\x44\x64\x69\x2f\x57\x52\x52\x62\x45\x79\x39\x50\x2b\
-\x46\x66\x58\x58\x59\x70\x35\x38\x66\x20\x79\x4a\x2b\x33\x57\x4d\
-\x62\x4d\x6e\x30\x54\x49\x54\x34\x56\x30\x48\x75\x32\x49\x54\x77\
-\x41\x79\x54\x35\x6d\x65\x71\x65\x32\x46\x58\x77\x35\x4d\x38\x5a\
-\x2f\x62\x6a\x70\x6d\x32\x68\x33\x32\x79\x52\x38\x68\x49\x61\x53\
-\x6f\x41\x53\x71\x64\x79\x5a\x78\x70\x63\x79\x44\x65\x63\x4d\x71\
-\x71\x4c\x77\x6c\x42\x57\x20\x6f\x70\x2f\x69\x2b\x35\x36\x69\x4e\
-\x48\x52\x64\x77\x33\x2f\x37\x70\x33\x2f\x68\x77\x34\x63\x50\x46\
-\x4d\x5a\x77\x65\x6e\x6f\x69\x69\x46\x33\x30\x4f\x53\x52\x68\x73\
-\x36\x53\x73\x45\x6d\x4f\x2f\x41\x62\x7a\x55\x4e\x31\x63\x71\x56\
-\x31\x7a\x37\x58\x49\x44\x31\x37\x36\x6e\x74\x64\x2b\x6a\x50\x2f\
-\x58\x54\x49\x20\x50\x31\x55\x49\x4b\x43\x4d\x69\x56\x51\x45\x58\
-\x4a\x37\x6a\x48\x39\x2b\x49\x7a\x36\x32\x34\x41\x52\x34\x49\x54\
-\x2f\x56\x41\x78\x75\x59\x61\x46\x51\x49\x49\x2b\x47\x68\x34\x74\
-\x41\x6a\x35\x4f\x78\x43\x43\x6b\x43\x34\x53\x74\x34\x59\x4e\x44\
-\x75\x52\x36\x76\x2b\x78\x68\x54\x65\x37\x72\x6b\x6e\x4e\x7a\x66\
-\x20\x70\x34\x50\x65\x78\x7a\x35\x7a\x37\x4c\x68\x66\x38\x30\x79\
-\x50\x54\x59\x68\x66\x4f\x6c\x61\x65\x75\x75\x61\x6e\x64\x73\x33\
-\x66\x79\x76\x52\x2b\x36\x6e\x74\x44\x43\x46\x68\x74\x45\x2b\x30\
-\x4b\x32\x66\x57\x69\x62\x53\x6a\x6d\x69\x54\x41\x37\x64\x41\x6a\
-\x59\x51\x74\x50\x37\x6a\x6d\x36\x39\x77\x78\x62\x51\x20\x74\x6a\
-\x74\x75\x33\x6c\x37\x7a\x39\x71\x63\x66\x6d\x55\x77\x72\x54\x70\
-\x59\x7a\x43\x6d\x31\x51\x4b\x68\x44\x36\x6e\x70\x43\x77\x62\x67\
-\x55\x4b\x7a\x61\x53\x65\x6f\x55\x79\x4a\x37\x77\x78\x57\x42\x54\
-\x6a\x77\x42\x5a\x2b\x36\x32\x63\x39\x32\x77\x71\x2b\x65\x72\x30\
-\x64\x30\x55\x66\x63\x75\x34\x4b\x44\x32\x20\x52\x6d\x54\x63\x70\
-\x4b\x44\x77\x72\x33\x6c\x45\x53\x6b\x57\x6c\x5a\x79\x49\x44\x4a\
-\x4a\x71\x70\x4b\x4e\x6c\x78\x65\x7a\x63\x6f\x72\x38\x6c\x4b\x76\
-\x66\x2b\x4e\x49\x59\x54\x6f\x77\x2f\x6c\x48\x31\x2b\x39\x7a\x53\
-\x4d\x46\x42\x57\x75\x57\x6a\x4b\x72\x63\x50\x43\x75\x4e\x46\x53\
-\x57\x41\x41\x4f\x67\x2f\x75\x20\x58\x33\x6d\x55\x49\x70\x4d\x41\
-\x52\x6d\x64\x2b\x63\x73\x63\x37\x76\x4c\x65\x66\x32\x33\x37\x75\
-\x5a\x42\x33\x75\x2f\x38\x75\x50\x2f\x79\x56\x2f\x2b\x31\x73\x33\
-\x36\x39\x46\x53\x69\x6a\x67\x79\x5a\x6e\x52\x2b\x47\x45\x6c\x7a\
-\x73\x30\x55\x56\x6d\x72\x37\x66\x67\x58\x49\x51\x4f\x6a\x36\x2b\
-\x2b\x38\x6a\x56\x20\x31\x51\x64\x63\x33\x7a\x4b\x62\x54\x35\x45\
-\x43\x4a\x42\x32\x39\x64\x68\x45\x64\x46\x4e\x6e\x30\x46\x50\x72\
-\x77\x4b\x49\x70\x79\x67\x72\x55\x6c\x33\x54\x69\x72\x4d\x49\x52\
-\x66\x73\x4a\x50\x38\x2b\x37\x66\x45\x52\x76\x6e\x5a\x41\x2b\x62\
-\x59\x38\x63\x71\x54\x71\x48\x73\x79\x30\x59\x53\x67\x37\x66\x48\
-\x6f\x20\x57\x50\x35\x4c\x2b\x6c\x47\x79\x2f\x68\x38\x33\x6d\x59\
-\x42\x50\x44\x36\x4c\x39\x58\x56\x4b\x44\x56\x45\x42\x79\x6b\x72\
-\x69\x73\x43\x70\x58\x5a\x51\x66\x6e\x65\x30\x71\x56\x39\x41\x6d\
-\x55\x63\x33\x39\x64\x54\x39\x2f\x75\x70\x63\x7a\x78\x31\x2f\x4f\
-\x48\x33\x66\x47\x35\x79\x66\x47\x72\x69\x48\x6a\x4e\x46\x20\x76\
-\x2f\x54\x37\x2f\x78\x62\x57\x32\x46\x4e\x39\x59\x6b\x4e\x76\x78\
-\x49\x6d\x58\x6f\x35\x44\x78\x35\x61\x4d\x67\x71\x36\x4f\x30\x30\
-\x47\x78\x58\x61\x4f\x56\x6f\x32\x68\x58\x76\x33\x2f\x32\x56\x39\
-\x65\x61\x57\x71\x69\x71\x59\x56\x42\x56\x57\x69\x36\x2b\x6b\x56\
-\x61\x43\x77\x38\x73\x43\x37\x70\x6b\x57\x72\x20\x67\x4c\x56\x6c\
-\x54\x49\x61\x57\x6d\x47\x4e\x52\x31\x6d\x77\x6a\x30\x71\x5a\x69\
-\x4c\x4f\x32\x59\x6e\x76\x2f\x66\x52\x51\x73\x70\x55\x2b\x48\x67\
-\x41\x61\x57\x64\x4d\x58\x4e\x53\x50\x2f\x2b\x77\x6a\x6b\x50\x39\
-\x51\x31\x4f\x52\x32\x4a\x43\x4f\x4f\x66\x36\x4b\x63\x56\x79\x6c\
-\x55\x49\x2b\x51\x58\x78\x38\x76\x20\x4e\x43\x31\x77\x6f\x2b\x43\
-\x6e\x55\x68\x41\x55\x51\x54\x6e\x78\x61\x30\x4f\x63\x63\x4c\x37\
-\x48\x39\x65\x52\x59\x63\x46\x4c\x4e\x4f\x32\x43\x4b\x45\x36\x64\
-\x6f\x2f\x6d\x34\x34\x67\x6b\x6a\x2b\x69\x6a\x5a\x77\x64\x74\x6e\
-\x2f\x47\x58\x2f\x66\x77\x2b\x77\x6a\x2b\x6f\x6b\x57\x76\x5a\x6f\
-\x51\x77\x79\x6e\x73\x20\x66\x32\x53\x76\x2f\x58\x76\x75\x63\x50\
-\x41\x30\x65\x57\x44\x38\x4e\x36\x75\x69\x73\x6f\x34\x66\x4a\x33\
-\x30\x47\x68\x36\x62\x44\x68\x35\x36\x32\x36\x56\x68\x76\x37\x76\
-\x6a\x34\x34\x53\x32\x62\x37\x52\x33\x54\x32\x72\x4b\x63\x31\x38\
-\x4c\x4d\x55\x4a\x36\x2b\x62\x79\x50\x54\x33\x39\x4f\x32\x44\x6f\
-\x50\x43\x20\x32\x68\x6f\x39\x79\x76\x41\x4f\x53\x68\x4f\x55\x59\
-\x54\x4b\x5a\x73\x62\x71\x7a\x42\x4e\x66\x6d\x6c\x66\x66\x59\x61\
-\x76\x63\x6c\x4b\x2b\x43\x2f\x5a\x66\x73\x35\x4b\x2b\x71\x76\x61\
-\x59\x66\x6e\x48\x79\x4f\x78\x36\x54\x72\x6b\x57\x76\x61\x6c\x35\
-\x75\x58\x76\x54\x34\x78\x69\x4f\x66\x50\x2b\x4f\x59\x67\x67\x20\
-\x54\x75\x68\x79\x52\x61\x74\x42\x31\x65\x33\x4c\x4a\x39\x6d\x58\
-\x6d\x4b\x4d\x2f\x74\x38\x38\x2b\x5a\x35\x49\x2b\x35\x5a\x76\x2b\
-\x32\x73\x58\x67\x33\x77\x4f\x48\x53\x48\x31\x6a\x4e\x55\x48\x53\
-\x54\x62\x79\x4c\x50\x6b\x6e\x41\x30\x39\x46\x31\x47\x37\x70\x2b\
-\x78\x38\x66\x33\x62\x32\x68\x33\x47\x78\x53\x4f\x20\x35\x62\x53\
-\x53\x4b\x6e\x46\x74\x6a\x37\x5a\x57\x48\x72\x45\x57\x43\x46\x34\
-\x5a\x4a\x47\x67\x66\x47\x66\x78\x43\x4d\x74\x62\x69\x36\x38\x54\
-\x41\x34\x6d\x51\x36\x52\x31\x6c\x44\x33\x38\x73\x4f\x61\x48\x34\
-\x54\x38\x76\x5a\x76\x31\x54\x37\x74\x47\x34\x61\x44\x56\x54\x6b\
-\x66\x64\x33\x41\x4c\x6e\x79\x4d\x51\x20\x48\x38\x61\x77\x42\x4a\
-\x6b\x61\x49\x4a\x61\x63\x32\x70\x4d\x48\x73\x59\x39\x56\x71\x32\
-\x49\x4d\x4c\x34\x59\x53\x66\x4c\x71\x47\x41\x30\x74\x43\x64\x6f\
-\x64\x30\x62\x66\x37\x52\x4a\x46\x57\x78\x5a\x4b\x77\x4b\x77\x75\
-\x4c\x70\x2b\x78\x61\x74\x42\x70\x72\x61\x35\x36\x35\x39\x2b\x4a\
-\x36\x34\x2b\x2f\x72\x6a\x20\x6e\x2f\x6c\x69\x2f\x2b\x75\x4a\x72\
-\x2f\x78\x63\x55\x50\x35\x7a\x78\x33\x33\x75\x47\x76\x36\x65\x6d\
-\x74\x57\x68\x42\x33\x71\x55\x63\x6f\x54\x67\x36\x62\x6f\x74\x71\
-\x2f\x55\x64\x56\x31\x66\x76\x57\x4e\x33\x66\x55\x6c\x61\x47\x71\
-\x72\x41\x6f\x44\x61\x37\x62\x67\x6a\x46\x55\x73\x65\x5a\x33\x33\
-\x33\x55\x59\x20\x71\x31\x43\x47\x79\x4f\x53\x51\x2b\x75\x39\x6f\
-\x68\x54\x45\x65\x6a\x78\x4f\x5a\x64\x51\x55\x68\x4b\x4b\x70\x79\
-\x69\x6c\x5a\x46\x52\x45\x31\x54\x37\x4f\x6d\x78\x48\x2f\x49\x35\
-\x38\x32\x30\x34\x2b\x4c\x63\x77\x5a\x56\x4e\x6c\x6e\x53\x63\x6d\
-\x58\x37\x71\x57\x33\x2b\x43\x62\x6a\x72\x57\x6e\x64\x6f\x7a\x78\
-\x20\x44\x70\x69\x4f\x47\x35\x75\x6e\x66\x47\x6f\x42\x47\x2f\x58\
-\x4c\x34\x54\x6e\x55\x77\x58\x75\x75\x62\x77\x6b\x36\x37\x6f\x52\
-\x4a\x37\x2f\x48\x49\x35\x78\x37\x76\x6a\x6a\x48\x58\x37\x53\x42\
-\x2b\x65\x48\x68\x76\x66\x79\x74\x30\x4d\x62\x33\x33\x53\x48\x6e\
-\x67\x77\x48\x4c\x34\x4a\x65\x66\x39\x4c\x64\x75\x58\x20\x6e\x4e\
-\x39\x71\x74\x51\x56\x36\x64\x73\x32\x57\x75\x7a\x75\x68\x4f\x6d\
-\x32\x33\x4b\x34\x78\x56\x7a\x47\x63\x6c\x77\x71\x48\x73\x5a\x4d\
-\x45\x31\x57\x72\x52\x56\x59\x69\x36\x62\x30\x68\x70\x48\x51\x41\
-\x65\x4e\x51\x78\x48\x43\x49\x48\x47\x41\x44\x73\x4b\x79\x77\x56\
-\x45\x6f\x67\x2b\x73\x31\x6b\x33\x71\x4a\x20\x30\x52\x4f\x55\x73\
-\x71\x42\x37\x65\x74\x2b\x69\x6c\x45\x47\x4e\x70\x42\x44\x7a\x52\
-\x53\x75\x4a\x62\x59\x55\x6e\x66\x4d\x59\x39\x30\x32\x6d\x55\x6b\
-\x2f\x61\x4c\x2b\x6a\x54\x36\x54\x66\x76\x74\x59\x4d\x56\x39\x36\
-\x72\x77\x48\x43\x34\x46\x36\x4e\x44\x6d\x4f\x55\x62\x76\x53\x49\
-\x42\x6d\x6a\x72\x76\x48\x2b\x20\x78\x7a\x55\x66\x31\x58\x42\x38\
-\x41\x45\x46\x6c\x56\x5a\x34\x6d\x38\x73\x5a\x65\x51\x5a\x34\x51\
-\x4a\x39\x4c\x6f\x6d\x30\x49\x59\x72\x6a\x47\x4d\x6f\x70\x6c\x61\
-\x6c\x41\x35\x30\x67\x4f\x41\x36\x58\x4b\x73\x77\x70\x52\x44\x72\
-\x51\x39\x43\x35\x62\x48\x52\x57\x4e\x41\x39\x4a\x6f\x30\x66\x30\
-\x59\x70\x55\x50\x20\x49\x7a\x37\x70\x38\x66\x59\x6c\x41\x2f\x42\
-\x59\x76\x79\x5a\x38\x51\x69\x6e\x78\x2f\x64\x4a\x50\x41\x51\x2b\
-\x6a\x77\x6c\x2f\x58\x53\x52\x37\x6c\x6b\x55\x79\x63\x76\x39\x63\
-\x51\x31\x37\x48\x72\x38\x67\x54\x73\x39\x66\x56\x62\x48\x68\x37\
-\x75\x75\x4c\x75\x37\x6f\x58\x63\x64\x5a\x57\x6d\x5a\x7a\x79\x6f\
-\x43\x20\x44\x75\x65\x36\x49\x34\x34\x75\x4f\x43\x55\x6d\x72\x46\
-\x5a\x36\x45\x47\x37\x79\x34\x73\x4a\x37\x4a\x51\x6d\x68\x4c\x74\
-\x57\x39\x44\x30\x6f\x6d\x71\x72\x61\x45\x59\x4b\x6a\x72\x4b\x62\
-\x75\x31\x66\x66\x4b\x69\x38\x6e\x75\x66\x37\x63\x67\x55\x36\x50\
-\x38\x4e\x4a\x44\x4a\x2b\x69\x33\x50\x38\x76\x62\x52\x48\x20\x31\
-\x73\x47\x6e\x4a\x34\x4a\x52\x53\x44\x62\x38\x2f\x39\x2f\x65\x6c\
-\x58\x66\x4a\x62\x52\x76\x35\x58\x77\x45\x67\x32\x64\x33\x54\x63\
-\x34\x39\x75\x32\x37\x4b\x64\x7a\x65\x37\x6d\x4a\x64\x6d\x33\x33\
-\x2f\x2f\x54\x62\x50\x49\x63\x79\x62\x6f\x73\x7a\x64\x45\x48\x53\
-\x51\x43\x31\x66\x78\x51\x41\x67\x6d\x7a\x32\x20\x4d\x5a\x4a\x38\
-\x4b\x61\x37\x33\x52\x71\x50\x70\x4a\x6b\x45\x51\x51\x4e\x32\x58\
-\x6c\x2f\x78\x47\x30\x6b\x61\x4d\x5a\x73\x45\x67\x4e\x52\x61\x45\
-\x49\x4b\x36\x42\x61\x48\x58\x39\x50\x49\x61\x31\x4d\x61\x6c\x6e\
-\x31\x46\x61\x41\x77\x37\x6e\x63\x37\x77\x58\x4d\x44\x7a\x2f\x38\
-\x45\x38\x59\x6f\x56\x4a\x4d\x53\x20\x45\x79\x72\x41\x37\x45\x49\
-\x55\x69\x6c\x51\x58\x73\x39\x62\x32\x4e\x35\x61\x6c\x77\x78\x43\
-\x52\x2f\x42\x62\x6a\x51\x46\x64\x78\x4c\x49\x6b\x37\x48\x50\x31\
-\x62\x63\x68\x75\x52\x6b\x50\x48\x5a\x39\x41\x6a\x58\x6d\x59\x4e\
-\x30\x46\x37\x48\x63\x4c\x63\x35\x38\x51\x59\x6a\x7a\x4b\x34\x4a\
-\x53\x77\x6b\x79\x59\x20\x47\x63\x34\x32\x49\x46\x49\x77\x75\x70\
-\x4e\x4b\x6f\x71\x74\x70\x53\x49\x31\x6a\x39\x73\x75\x6e\x6f\x73\
-\x4b\x34\x71\x49\x76\x30\x2f\x4e\x38\x37\x48\x4f\x4c\x6e\x4e\x6b\
-\x66\x7a\x53\x61\x67\x62\x61\x55\x45\x45\x61\x43\x4d\x57\x75\x62\
-\x61\x31\x71\x45\x50\x72\x36\x64\x34\x39\x57\x58\x68\x50\x42\x7a\
-\x34\x67\x20\x61\x75\x65\x76\x55\x67\x78\x70\x6c\x61\x30\x42\x53\
-\x73\x71\x37\x31\x4e\x39\x55\x79\x73\x43\x32\x67\x44\x49\x71\x32\
-\x42\x58\x47\x52\x49\x6f\x76\x59\x78\x4e\x2b\x36\x38\x44\x4d\x55\
-\x4d\x46\x77\x34\x37\x31\x4e\x68\x59\x2b\x56\x55\x73\x43\x4f\x4f\
-\x6b\x43\x66\x55\x39\x38\x37\x4a\x42\x72\x6e\x35\x33\x6a\x75\x20\
-\x62\x77\x55\x4d\x45\x55\x50\x72\x47\x45\x4a\x6d\x30\x54\x51\x75\
-\x63\x44\x66\x4a\x63\x76\x41\x68\x6c\x43\x6f\x42\x55\x66\x65\x44\
-\x66\x72\x4d\x53\x6b\x49\x66\x4b\x64\x42\x51\x74\x59\x63\x6f\x64\
-\x4a\x66\x55\x73\x71\x54\x32\x6b\x41\x43\x6a\x70\x54\x66\x43\x7a\
-\x6d\x54\x7a\x2b\x50\x59\x43\x33\x57\x43\x63\x37\x20\x32\x47\x50\
-\x41\x79\x63\x52\x41\x39\x67\x37\x4f\x74\x34\x41\x6c\x47\x46\x4e\
-\x41\x39\x63\x4e\x36\x4e\x2f\x5a\x61\x54\x4c\x55\x66\x4f\x33\x4f\
-\x42\x33\x46\x6f\x63\x2f\x38\x36\x66\x4e\x33\x54\x50\x78\x45\x5a\
-\x42\x58\x78\x4b\x59\x57\x42\x51\x57\x46\x48\x51\x38\x4a\x5a\x5a\
-\x4d\x4b\x58\x6c\x67\x67\x5a\x36\x68\x20\x59\x45\x43\x46\x79\x49\
-\x46\x44\x42\x62\x62\x38\x38\x32\x48\x4a\x65\x32\x61\x49\x53\x52\
-\x77\x71\x4a\x4c\x30\x61\x43\x4e\x63\x63\x39\x69\x48\x34\x38\x71\
-\x6a\x63\x62\x78\x32\x59\x78\x55\x39\x49\x4a\x49\x57\x51\x32\x54\
-\x73\x34\x32\x38\x67\x65\x47\x69\x50\x79\x4b\x6e\x62\x6f\x37\x33\
-\x76\x32\x36\x7a\x35\x42\x20\x33\x2f\x2b\x75\x65\x32\x39\x53\x31\
-\x35\x35\x55\x56\x38\x51\x46\x58\x59\x39\x37\x64\x53\x46\x33\x79\
-\x65\x71\x35\x37\x69\x65\x67\x42\x6f\x67\x6c\x6e\x30\x72\x7a\x53\
-\x30\x48\x45\x74\x74\x45\x41\x32\x71\x30\x54\x2b\x78\x77\x4f\x32\
-\x44\x39\x67\x50\x36\x69\x59\x48\x38\x4b\x68\x6e\x71\x6c\x69\x65\
-\x48\x61\x77\x20\x72\x6f\x47\x6d\x45\x46\x46\x44\x46\x49\x4a\x79\
-\x61\x4c\x50\x30\x34\x70\x37\x78\x44\x30\x57\x73\x51\x35\x48\x78\
-\x53\x30\x52\x57\x46\x64\x6c\x38\x7a\x47\x2b\x54\x34\x72\x47\x36\
-\x68\x30\x52\x44\x5a\x42\x67\x69\x5a\x44\x54\x51\x79\x4f\x49\x4d\
-\x53\x73\x4b\x78\x57\x4e\x41\x38\x41\x4e\x4b\x68\x6b\x59\x6d\x4a\
-\x20\x39\x54\x62\x48\x72\x74\x33\x38\x2f\x51\x66\x38\x66\x4b\x43\
-\x43\x5a\x63\x5a\x37\x43\x32\x6c\x7a\x4a\x77\x30\x4c\x6d\x4d\x55\
-\x36\x72\x6e\x69\x63\x36\x48\x37\x4f\x76\x52\x6d\x7a\x67\x6e\x36\
-\x4a\x79\x4c\x59\x4e\x6a\x45\x52\x6f\x35\x4c\x55\x64\x75\x30\x49\
-\x2b\x55\x68\x69\x34\x36\x7a\x41\x45\x64\x50\x36\x35\x20\x47\x4d\
-\x66\x48\x63\x43\x44\x30\x38\x37\x71\x53\x70\x54\x51\x59\x56\x37\
-\x54\x57\x30\x6b\x67\x79\x6c\x4d\x49\x41\x70\x43\x43\x55\x4b\x62\
-\x54\x34\x6d\x6f\x61\x2b\x74\x6a\x7a\x71\x59\x77\x76\x38\x5a\x76\
-\x61\x48\x68\x34\x54\x6b\x4d\x34\x32\x37\x4a\x52\x42\x68\x47\x30\
-\x48\x38\x32\x41\x4d\x62\x4a\x52\x34\x46\x20\x73\x58\x68\x47\x6e\
-\x59\x76\x52\x6c\x66\x49\x6e\x45\x34\x73\x4b\x53\x36\x53\x4d\x50\
-\x44\x4e\x30\x67\x49\x4c\x65\x38\x34\x54\x44\x35\x33\x45\x49\x78\
-\x48\x49\x6a\x4b\x65\x6e\x34\x64\x79\x34\x74\x45\x61\x58\x4b\x39\
-\x44\x45\x72\x4f\x66\x72\x64\x59\x6a\x44\x78\x2f\x67\x47\x32\x2f\
-\x63\x67\x46\x48\x73\x77\x65\x20\x64\x62\x32\x47\x4b\x54\x54\x49\
-\x45\x4f\x70\x32\x6a\x66\x6e\x70\x48\x4d\x57\x6b\x53\x68\x57\x71\
-\x2f\x34\x42\x66\x43\x63\x4a\x65\x62\x38\x61\x6e\x68\x71\x2f\x6a\
-\x41\x57\x43\x4a\x6b\x42\x6c\x4b\x52\x37\x2b\x47\x75\x72\x44\x4e\
-\x69\x50\x4e\x37\x42\x57\x59\x57\x62\x49\x74\x69\x35\x4c\x69\x70\
-\x65\x44\x63\x79\x20\x62\x6b\x50\x41\x2b\x4e\x73\x72\x6a\x32\x4a\
-\x61\x6f\x4c\x45\x31\x78\x42\x4a\x4c\x57\x43\x36\x58\x61\x47\x77\
-\x4c\x58\x65\x70\x66\x74\x62\x54\x46\x62\x78\x72\x34\x4d\x77\x55\
-\x69\x48\x41\x51\x71\x31\x4f\x72\x65\x68\x48\x54\x67\x51\x31\x44\
-\x52\x4c\x34\x31\x34\x58\x77\x4b\x69\x37\x51\x4d\x46\x35\x4e\x52\
-\x46\x20\x62\x56\x43\x34\x53\x42\x6e\x76\x34\x30\x54\x4e\x45\x56\
-\x46\x72\x6a\x61\x5a\x5a\x69\x34\x37\x42\x44\x71\x2f\x66\x76\x6b\
-\x5a\x6a\x61\x78\x53\x54\x45\x71\x33\x37\x6d\x59\x6f\x38\x2f\x51\
-\x45\x48\x77\x32\x61\x47\x42\x6b\x4c\x78\x6a\x42\x43\x32\x70\x6e\
-\x34\x64\x6a\x70\x66\x44\x74\x76\x50\x32\x70\x53\x42\x6f\x20\x6a\
-\x39\x52\x75\x49\x70\x38\x45\x36\x4b\x62\x50\x56\x49\x68\x44\x4a\
-\x42\x2f\x71\x6e\x47\x77\x57\x2b\x65\x6b\x51\x55\x47\x71\x52\x75\
-\x68\x41\x4b\x35\x36\x6a\x46\x59\x6e\x6d\x4c\x32\x74\x62\x34\x32\
-\x2f\x2f\x38\x54\x52\x71\x4a\x6a\x72\x54\x39\x2b\x67\x4e\x2b\x57\
-\x57\x41\x6f\x53\x4c\x56\x4f\x44\x59\x4c\x4f\x20\x39\x50\x6d\x75\
-\x7a\x6c\x44\x61\x55\x2b\x67\x51\x4d\x66\x56\x35\x44\x54\x50\x2f\
-\x37\x74\x42\x72\x45\x69\x71\x6c\x45\x50\x79\x47\x41\x35\x5a\x55\
-\x74\x46\x5a\x6d\x6e\x2b\x55\x57\x4c\x49\x6f\x52\x2b\x6e\x70\x44\
-\x4c\x4e\x56\x61\x67\x67\x44\x61\x74\x73\x47\x71\x57\x65\x46\x2f\
-\x2f\x76\x66\x76\x55\x4b\x72\x42\x20\x30\x66\x45\x4d\x54\x58\x30\
-\x44\x78\x4a\x4a\x39\x66\x38\x43\x76\x42\x6b\x6c\x31\x41\x49\x65\
-\x36\x6f\x77\x69\x5a\x4d\x46\x30\x48\x72\x6b\x33\x52\x4f\x47\x61\
-\x66\x2f\x44\x4a\x7a\x2b\x35\x4b\x67\x6c\x78\x4b\x47\x6a\x42\x4e\
-\x47\x78\x2f\x6d\x32\x6c\x42\x46\x41\x75\x42\x76\x67\x45\x35\x63\
-\x6a\x79\x76\x76\x70\x20\x39\x64\x30\x61\x45\x62\x7a\x33\x57\x43\
-\x79\x58\x61\x4a\x6f\x47\x66\x2f\x37\x7a\x6e\x32\x41\x4b\x43\x51\
-\x69\x34\x76\x44\x7a\x2f\x78\x46\x66\x70\x30\x6d\x35\x2b\x33\x30\
-\x43\x44\x6e\x31\x2f\x34\x36\x53\x51\x31\x59\x50\x4d\x57\x5a\x2f\
-\x4a\x35\x43\x46\x33\x6a\x33\x4f\x4c\x39\x36\x78\x6c\x6a\x76\x6d\
-\x54\x75\x20\x47\x77\x77\x7a\x41\x51\x45\x52\x45\x54\x48\x36\x2f\
-\x44\x67\x54\x4f\x54\x64\x37\x73\x79\x74\x6c\x41\x76\x64\x54\x32\
-\x58\x63\x73\x43\x5a\x2f\x77\x38\x4d\x70\x69\x73\x62\x36\x46\x35\
-\x78\x5a\x2f\x2b\x76\x4f\x33\x4b\x4b\x6f\x43\x70\x44\x57\x63\x41\
-\x71\x34\x65\x50\x34\x47\x70\x71\x6c\x53\x51\x36\x50\x37\x77\x20\
-\x52\x38\x6a\x62\x35\x34\x53\x45\x61\x42\x34\x41\x64\x2b\x30\x51\
-\x38\x75\x2f\x47\x7a\x73\x44\x50\x44\x56\x38\x61\x4a\x78\x77\x6a\
-\x4a\x43\x59\x47\x58\x7a\x4e\x63\x48\x2f\x6c\x43\x4c\x69\x42\x70\
-\x6c\x62\x49\x69\x67\x45\x43\x56\x76\x41\x54\x33\x67\x6a\x57\x49\
-\x6a\x58\x52\x77\x55\x67\x55\x38\x57\x78\x41\x5a\x20\x36\x4a\x4c\
-\x51\x75\x67\x62\x72\x39\x51\x70\x4b\x4d\x37\x37\x35\x2b\x68\x6d\
-\x4b\x43\x63\x4f\x7a\x46\x61\x6d\x47\x44\x49\x35\x4f\x4c\x6b\x48\
-\x46\x44\x4e\x41\x74\x79\x4e\x76\x55\x6b\x71\x73\x77\x4b\x76\x51\
-\x2f\x43\x4a\x4f\x4f\x32\x58\x50\x52\x36\x2f\x47\x5a\x71\x65\x47\
-\x76\x62\x2b\x34\x65\x70\x75\x59\x4d\x20\x35\x72\x50\x48\x44\x35\
-\x6d\x38\x51\x59\x63\x65\x31\x6f\x30\x69\x7a\x78\x61\x78\x49\x70\
-\x37\x33\x77\x75\x32\x55\x6b\x72\x62\x6e\x6a\x68\x45\x49\x4c\x43\
-\x50\x31\x35\x6d\x44\x71\x4d\x69\x74\x2b\x49\x63\x34\x64\x66\x5a\
-\x6c\x69\x7a\x69\x65\x77\x38\x35\x4c\x36\x51\x51\x43\x72\x77\x32\
-\x4e\x50\x78\x38\x59\x39\x20\x42\x50\x4b\x78\x38\x31\x6a\x58\x67\
-\x2f\x49\x6c\x44\x37\x68\x4f\x63\x64\x34\x67\x56\x42\x34\x6c\x44\
-\x77\x75\x66\x62\x2f\x7a\x34\x4f\x43\x45\x41\x55\x4e\x4c\x6a\x77\
-\x42\x4f\x61\x70\x6b\x46\x52\x6c\x71\x41\x43\x57\x4b\x34\x58\x73\
-\x4c\x34\x46\x4e\x4f\x50\x78\x73\x38\x63\x6f\x70\x77\x61\x74\x62\
-\x39\x47\x34\x20\x42\x71\x32\x33\x63\x4b\x48\x37\x30\x2f\x7a\x6b\
-\x48\x49\x43\x43\x36\x33\x42\x38\x34\x38\x57\x33\x76\x39\x32\x6d\
-\x6b\x2f\x38\x50\x2b\x42\x6a\x6f\x4f\x6a\x4f\x44\x56\x57\x70\x35\
-\x70\x38\x68\x49\x78\x2b\x58\x65\x64\x62\x39\x38\x4a\x4e\x4f\x75\
-\x62\x49\x72\x37\x33\x44\x74\x32\x6c\x75\x4d\x34\x65\x2f\x33\x64\
-\x20\x67\x2b\x65\x4f\x71\x56\x32\x48\x7a\x6d\x45\x4d\x31\x44\x5a\
-\x5a\x6d\x37\x6a\x2f\x30\x39\x57\x4b\x36\x66\x51\x46\x53\x58\x63\
-\x52\x5a\x4a\x68\x4d\x79\x35\x41\x49\x37\x47\x42\x74\x41\x2b\x64\
-\x61\x50\x48\x76\x32\x44\x4d\x66\x48\x78\x35\x32\x50\x4b\x64\x78\
-\x44\x52\x50\x42\x51\x75\x4c\x79\x38\x37\x4a\x56\x62\x20\x6a\x31\
-\x54\x6a\x31\x33\x49\x45\x2f\x78\x35\x68\x6c\x46\x44\x65\x34\x79\
-\x63\x58\x4f\x59\x48\x51\x4f\x64\x61\x59\x58\x67\x6f\x62\x45\x58\
-\x58\x6e\x34\x44\x63\x45\x6e\x2b\x75\x4d\x6a\x43\x48\x6e\x66\x65\
-\x5a\x77\x58\x32\x51\x63\x67\x74\x6f\x57\x70\x78\x6c\x62\x65\x57\
-\x31\x37\x61\x4e\x54\x2f\x48\x42\x78\x4d\x20\x5a\x63\x44\x6b\x59\
-\x64\x6e\x68\x35\x75\x34\x61\x70\x42\x57\x2b\x2f\x76\x59\x62\x48\
-\x4d\x32\x6e\x73\x4c\x34\x4e\x52\x5a\x38\x6f\x4e\x55\x53\x4a\x39\
-\x31\x39\x63\x58\x71\x49\x4d\x54\x54\x49\x6c\x65\x4a\x6a\x41\x54\
-\x42\x2b\x39\x49\x48\x2f\x41\x78\x34\x48\x73\x64\x51\x7a\x49\x31\
-\x6c\x43\x71\x6a\x35\x6a\x41\x20\x62\x30\x4d\x33\x2b\x35\x6a\x7a\
-\x73\x47\x2f\x65\x68\x33\x44\x4c\x73\x62\x50\x49\x7a\x4b\x6b\x42\
-\x7a\x36\x35\x35\x62\x57\x56\x79\x47\x66\x4b\x4f\x63\x45\x4a\x4b\
-\x6f\x54\x53\x4b\x46\x65\x41\x41\x38\x71\x45\x65\x79\x63\x68\x44\
-\x6c\x47\x4a\x34\x57\x44\x6a\x66\x34\x50\x72\x6d\x48\x57\x5a\x48\
-\x4a\x5a\x35\x2f\x20\x2b\x78\x56\x4d\x6f\x55\x4b\x69\x4d\x48\x58\
-\x4e\x52\x51\x45\x34\x7a\x79\x4c\x4f\x6b\x38\x4c\x78\x38\x53\x6c\
-\x6d\x73\x2f\x6d\x47\x33\x42\x77\x74\x72\x54\x32\x2f\x35\x57\x2b\
-\x51\x45\x6e\x38\x52\x6b\x4f\x6d\x63\x4b\x70\x4e\x55\x67\x4e\x2b\
-\x58\x4d\x2f\x78\x54\x35\x37\x72\x72\x2f\x69\x45\x69\x62\x32\x56\
-\x63\x20\x57\x35\x42\x34\x48\x36\x68\x78\x6a\x4e\x39\x4d\x70\x68\
-\x7a\x2f\x41\x52\x77\x73\x47\x72\x2f\x47\x39\x64\x30\x31\x54\x73\
-\x39\x50\x38\x4d\x32\x33\x33\x36\x43\x59\x46\x4d\x49\x6c\x32\x59\
-\x49\x6f\x70\x6b\x53\x4e\x74\x47\x44\x57\x47\x76\x50\x35\x48\x46\
-\x42\x61\x47\x73\x32\x41\x65\x76\x62\x4f\x33\x77\x4c\x31\x20\x2f\
-\x64\x4a\x42\x56\x41\x4e\x78\x78\x4b\x75\x69\x54\x45\x31\x57\x33\
-\x47\x38\x77\x65\x66\x59\x2b\x58\x47\x33\x73\x73\x32\x30\x36\x34\
-\x62\x61\x78\x78\x2f\x53\x2f\x62\x65\x4c\x6e\x66\x59\x6c\x41\x50\
-\x67\x65\x54\x4a\x75\x4e\x5a\x47\x6f\x68\x49\x77\x5a\x45\x4e\x5a\
-\x49\x67\x63\x6a\x54\x4d\x45\x68\x42\x59\x72\x20\x36\x74\x33\x79\
-\x42\x6f\x38\x66\x50\x38\x61\x54\x5a\x34\x2f\x44\x48\x54\x37\x30\
-\x63\x34\x39\x52\x2b\x45\x48\x45\x70\x42\x41\x4b\x42\x59\x43\x74\
-\x68\x79\x4c\x67\x2b\x4f\x51\x45\x57\x6d\x75\x34\x4e\x72\x78\x6f\
-\x65\x48\x62\x58\x63\x6f\x73\x47\x76\x34\x63\x72\x39\x61\x6e\x47\
-\x6d\x63\x2b\x54\x42\x66\x42\x37\x20\x42\x5a\x39\x5a\x5a\x32\x4f\
-\x37\x62\x68\x38\x49\x38\x64\x43\x36\x32\x44\x39\x6f\x4b\x6f\x33\
-\x77\x61\x30\x48\x4f\x50\x4c\x59\x68\x78\x6a\x36\x75\x76\x6f\x32\
-\x72\x44\x62\x2f\x50\x59\x51\x78\x78\x44\x37\x57\x57\x6a\x6b\x46\
-\x50\x77\x74\x77\x33\x45\x52\x38\x50\x50\x4d\x58\x30\x4a\x6f\x66\
-\x33\x31\x2b\x2f\x77\x20\x37\x4f\x75\x6e\x65\x50\x44\x6f\x43\x67\
-\x35\x4f\x65\x68\x6e\x43\x77\x58\x71\x70\x56\x65\x4c\x4a\x70\x2f\
-\x43\x30\x34\x59\x4a\x6f\x56\x57\x41\x32\x4f\x34\x49\x79\x4a\x5a\
-\x67\x55\x67\x6f\x73\x71\x55\x51\x6d\x2f\x70\x36\x54\x65\x48\x2f\
-\x43\x4a\x77\x4d\x46\x52\x37\x36\x53\x42\x6a\x4b\x49\x75\x6b\x33\
-\x37\x62\x20\x77\x63\x37\x68\x31\x2f\x51\x54\x33\x73\x65\x39\x4d\
-\x4d\x61\x39\x78\x6d\x4b\x68\x74\x2b\x6d\x43\x68\x34\x71\x58\x48\
-\x37\x73\x65\x4a\x74\x5a\x77\x56\x42\x79\x71\x4e\x51\x73\x71\x67\
-\x43\x43\x74\x7a\x54\x77\x4a\x56\x2f\x50\x77\x30\x73\x70\x4c\x45\
-\x61\x43\x41\x31\x6a\x64\x59\x33\x53\x33\x77\x6c\x37\x2f\x38\x20\
-\x46\x36\x5a\x48\x45\x31\x52\x56\x49\x55\x6a\x49\x50\x6f\x6d\x62\
-\x55\x76\x5a\x51\x64\x53\x33\x57\x41\x45\x69\x51\x4f\x4f\x41\x56\
-\x6f\x58\x55\x74\x4a\x6b\x65\x7a\x39\x41\x4c\x53\x44\x31\x45\x51\
-\x54\x32\x73\x4e\x61\x32\x32\x6f\x53\x74\x32\x4a\x71\x57\x6b\x64\
-\x75\x45\x50\x73\x58\x57\x62\x73\x66\x51\x75\x58\x20\x38\x2f\x79\
-\x68\x44\x32\x6a\x66\x51\x66\x77\x55\x36\x68\x63\x68\x37\x77\x6b\
-\x35\x4a\x76\x34\x4d\x78\x61\x62\x38\x73\x30\x4d\x51\x5a\x66\x68\
-\x4f\x2f\x62\x47\x6b\x5a\x79\x45\x43\x42\x34\x7a\x7a\x59\x55\x2f\
-\x69\x67\x78\x73\x78\x72\x79\x64\x58\x55\x6a\x4c\x6b\x49\x49\x30\
-\x35\x5a\x76\x6f\x2f\x64\x4c\x37\x37\x20\x39\x4b\x34\x68\x56\x35\
-\x50\x65\x6a\x47\x35\x6a\x72\x33\x61\x4e\x73\x2b\x32\x37\x73\x54\
-\x6e\x73\x34\x6f\x42\x44\x52\x44\x30\x55\x52\x72\x6b\x31\x47\x4d\
-\x5a\x61\x4b\x37\x30\x6b\x72\x46\x67\x78\x55\x34\x46\x31\x70\x55\
-\x43\x47\x78\x44\x67\x54\x32\x32\x45\x70\x51\x42\x63\x4b\x79\x33\
-\x71\x4a\x6f\x69\x6a\x77\x20\x31\x37\x2f\x2f\x46\x64\x58\x55\x41\
-\x42\x71\x43\x67\x4d\x45\x4e\x45\x52\x48\x51\x65\x35\x38\x32\x64\
-\x39\x50\x34\x51\x69\x42\x53\x71\x4d\x6f\x70\x4a\x72\x4d\x6a\x72\
-\x4e\x64\x72\x30\x53\x48\x46\x42\x37\x73\x70\x53\x74\x77\x54\x47\
-\x54\x36\x47\x4b\x67\x33\x46\x69\x33\x33\x77\x4d\x58\x72\x41\x74\
-\x6d\x64\x2b\x20\x6a\x44\x48\x6b\x6b\x44\x6d\x4f\x6a\x5a\x73\x4f\
-\x55\x4e\x68\x74\x52\x54\x71\x31\x4b\x68\x44\x69\x64\x6e\x39\x39\
-\x38\x46\x41\x64\x61\x39\x2b\x63\x37\x67\x50\x44\x66\x64\x38\x75\
-\x4f\x6e\x38\x65\x4f\x49\x54\x6f\x6a\x63\x46\x4f\x62\x6b\x36\x41\
-\x6b\x73\x70\x71\x6e\x62\x6b\x31\x57\x54\x48\x68\x59\x4b\x32\x46\
-\x20\x74\x51\x31\x61\x31\x30\x41\x58\x43\x71\x72\x51\x65\x50\x76\
-\x2b\x4c\x55\x67\x54\x76\x76\x2b\x50\x37\x31\x46\x4f\x43\x75\x69\
-\x79\x41\x42\x50\x67\x4f\x50\x61\x74\x38\x30\x6c\x73\x46\x61\x57\
-\x66\x77\x42\x52\x74\x71\x35\x76\x32\x56\x56\x4d\x57\x6d\x45\x36\
-\x6e\x79\x58\x67\x44\x39\x46\x73\x31\x69\x38\x36\x78\x20\x50\x63\
-\x74\x38\x6d\x35\x68\x77\x48\x2b\x76\x55\x4c\x76\x69\x59\x52\x64\
-\x38\x6d\x76\x75\x78\x54\x2f\x6e\x2b\x4f\x4f\x65\x30\x36\x41\x48\
-\x4b\x6f\x4e\x4a\x54\x57\x55\x45\x61\x6e\x30\x76\x6f\x79\x4a\x34\
-\x31\x65\x6e\x33\x72\x61\x44\x4b\x67\x59\x47\x33\x2b\x4d\x41\x78\
-\x34\x36\x76\x2b\x47\x61\x37\x65\x4b\x61\x20\x75\x39\x5a\x74\x46\
-\x37\x48\x37\x56\x4c\x6a\x76\x6d\x54\x70\x6b\x6a\x69\x61\x33\x58\
-\x4b\x70\x51\x39\x4e\x58\x42\x51\x5a\x4f\x57\x6d\x6a\x43\x6b\x51\
-\x45\x5a\x68\x33\x64\x5a\x59\x33\x4e\x7a\x68\x30\x61\x4e\x48\x2b\
-\x4f\x35\x50\x33\x36\x4d\x6f\x43\x72\x42\x69\x74\x4b\x48\x54\x62\
-\x79\x36\x43\x77\x6e\x64\x39\x20\x78\x50\x33\x67\x6f\x54\x33\x78\
-\x49\x48\x78\x58\x56\x70\x56\x30\x72\x4c\x55\x71\x74\x54\x68\x67\
-\x74\x2f\x39\x6c\x78\x36\x78\x63\x59\x79\x39\x35\x36\x43\x49\x64\
-\x49\x72\x4c\x63\x64\x38\x78\x64\x59\x6d\x58\x38\x2b\x35\x42\x6e\
-\x44\x4f\x64\x32\x58\x38\x34\x35\x4a\x6d\x6f\x7a\x52\x4c\x33\x51\
-\x75\x6f\x41\x78\x20\x68\x59\x7a\x46\x59\x57\x79\x69\x67\x33\x54\
-\x79\x76\x65\x4c\x2b\x79\x42\x35\x74\x34\x34\x44\x37\x31\x76\x34\
-\x2b\x6e\x47\x6a\x62\x65\x68\x38\x79\x35\x78\x7a\x47\x39\x75\x64\
-\x6a\x70\x4a\x56\x64\x58\x4e\x38\x41\x51\x53\x2f\x52\x42\x43\x5a\
-\x43\x30\x37\x59\x41\x43\x55\x66\x30\x49\x59\x62\x7a\x35\x75\x59\
-\x47\x20\x52\x57\x58\x77\x6c\x37\x2f\x2b\x4e\x30\x34\x76\x7a\x73\
-\x45\x45\x36\x49\x6d\x42\x74\x51\x33\x67\x52\x58\x39\x6a\x46\x62\
-\x73\x4d\x71\x64\x35\x6d\x37\x77\x73\x76\x64\x47\x41\x55\x52\x54\
-\x47\x36\x41\x58\x6e\x66\x76\x6e\x7a\x79\x2f\x5a\x66\x49\x77\x2b\
-\x69\x77\x38\x66\x6c\x39\x49\x64\x63\x76\x64\x6d\x33\x6b\x20\x50\
-\x68\x68\x62\x2f\x4e\x45\x4e\x67\x54\x74\x34\x71\x75\x4e\x62\x76\
-\x36\x38\x57\x7a\x31\x42\x66\x36\x6f\x2b\x69\x64\x5a\x47\x31\x52\
-\x51\x4d\x73\x4d\x78\x52\x4a\x7a\x30\x71\x35\x37\x37\x43\x35\x41\
-\x64\x76\x31\x31\x6e\x33\x7a\x32\x7a\x66\x6d\x55\x4d\x7a\x63\x78\
-\x79\x31\x33\x6a\x66\x6c\x7a\x69\x4b\x6e\x33\x20\x67\x62\x48\x6e\
-\x47\x2b\x61\x75\x4e\x37\x33\x33\x30\x68\x64\x64\x4b\x59\x32\x36\
-\x58\x61\x4f\x75\x56\x2f\x44\x45\x75\x48\x70\x34\x69\x65\x66\x66\
-\x66\x59\x4e\x71\x56\x73\x46\x36\x42\x31\x30\x59\x72\x4a\x71\x56\
-\x44\x47\x41\x6b\x76\x6a\x42\x79\x30\x38\x67\x42\x34\x32\x64\x78\
-\x46\x38\x64\x31\x51\x68\x49\x64\x20\x30\x6b\x67\x64\x30\x6e\x69\
-\x50\x55\x76\x6d\x69\x39\x79\x66\x2f\x63\x79\x7a\x69\x4c\x72\x45\
-\x32\x66\x2b\x59\x59\x4a\x38\x6f\x4e\x4b\x32\x50\x33\x2f\x4e\x78\
-\x36\x79\x73\x64\x41\x68\x35\x53\x71\x6c\x31\x67\x74\x63\x63\x48\
-\x33\x6d\x2b\x65\x47\x37\x72\x34\x46\x78\x6e\x54\x46\x2b\x33\x44\
-\x42\x34\x62\x50\x32\x20\x50\x65\x39\x7a\x51\x72\x35\x33\x6e\x32\
-\x49\x48\x32\x48\x61\x76\x79\x66\x55\x58\x35\x78\x78\x30\x79\x47\
-\x4a\x59\x4e\x32\x76\x4d\x5a\x6c\x4d\x38\x2f\x66\x6f\x5a\x54\x73\
-\x39\x50\x55\x46\x51\x47\x53\x6b\x75\x35\x77\x6c\x57\x7a\x67\x6a\
-\x49\x61\x5a\x56\x6e\x43\x57\x34\x59\x4e\x2b\x75\x43\x6f\x46\x53\
-\x34\x79\x20\x77\x32\x31\x75\x50\x6e\x52\x57\x4f\x59\x2f\x4f\x61\
-\x78\x65\x70\x39\x71\x59\x49\x38\x6d\x6b\x63\x61\x68\x66\x45\x75\
-\x65\x38\x79\x4b\x6b\x53\x34\x7a\x78\x77\x2b\x78\x66\x67\x79\x39\
-\x73\x7a\x65\x32\x50\x65\x34\x64\x37\x67\x33\x53\x6d\x75\x51\x43\
-\x76\x56\x6c\x57\x4b\x7a\x65\x74\x4a\x45\x7a\x47\x4b\x36\x50\x20\
-\x78\x48\x44\x77\x77\x44\x48\x69\x75\x6d\x75\x2b\x47\x2f\x4d\x2f\
-\x77\x46\x71\x36\x69\x34\x44\x74\x45\x6e\x58\x6a\x33\x35\x2f\x37\
-\x6e\x42\x77\x79\x72\x79\x48\x30\x31\x4c\x44\x42\x66\x45\x77\x63\
-\x44\x4e\x42\x77\x33\x73\x4f\x33\x68\x4e\x57\x36\x68\x74\x4b\x45\
-\x72\x37\x39\x39\x6a\x74\x50\x7a\x59\x35\x68\x53\x20\x67\x78\x57\
-\x6a\x62\x68\x74\x41\x4b\x30\x79\x6e\x55\x7a\x6a\x32\x61\x4e\x73\
-\x57\x6d\x6f\x51\x54\x78\x6c\x49\x49\x73\x55\x78\x65\x2f\x43\x78\
-\x79\x78\x78\x7a\x5a\x75\x38\x6c\x4c\x65\x70\x50\x33\x4c\x6f\x57\
-\x34\x67\x51\x45\x46\x44\x56\x59\x4f\x6b\x6c\x44\x71\x42\x6d\x32\
-\x52\x44\x31\x50\x47\x44\x31\x74\x34\x20\x33\x6a\x72\x65\x6f\x52\
-\x74\x33\x69\x4e\x6c\x37\x51\x77\x39\x55\x49\x52\x73\x6c\x43\x7a\
-\x54\x59\x4a\x73\x72\x74\x6d\x38\x65\x2b\x51\x35\x41\x62\x75\x57\
-\x54\x39\x78\x51\x30\x6c\x57\x52\x49\x61\x70\x41\x79\x34\x64\x2b\
-\x43\x6a\x43\x4b\x71\x43\x77\x57\x37\x4c\x77\x4e\x48\x34\x46\x6f\
-\x68\x69\x33\x4f\x63\x68\x20\x49\x63\x37\x33\x65\x38\x77\x49\x73\
-\x77\x31\x35\x63\x73\x4b\x31\x69\x7a\x44\x75\x34\x37\x36\x48\x63\
-\x4e\x53\x66\x47\x30\x62\x74\x49\x64\x6e\x7a\x6a\x57\x4d\x48\x72\
-\x55\x6f\x73\x46\x78\x61\x73\x53\x68\x42\x72\x50\x50\x6e\x71\x43\
-\x5a\x78\x66\x6f\x62\x59\x4f\x55\x4d\x48\x64\x59\x45\x4f\x39\x52\
-\x32\x4e\x51\x20\x31\x79\x30\x6d\x73\x79\x6d\x59\x57\x34\x43\x6c\
-\x2b\x34\x52\x6e\x51\x54\x34\x6d\x4c\x30\x31\x44\x47\x57\x42\x32\
-\x30\x46\x44\x4a\x55\x49\x50\x51\x42\x78\x67\x63\x4b\x74\x53\x34\
-\x46\x67\x55\x63\x37\x48\x6f\x46\x46\x66\x71\x72\x73\x2f\x64\x77\
-\x48\x50\x78\x41\x33\x6b\x76\x39\x6b\x30\x42\x2b\x70\x64\x71\x58\
-\x20\x62\x48\x7a\x65\x68\x36\x2f\x2f\x55\x70\x78\x2b\x4d\x2f\x65\
-\x62\x53\x47\x37\x54\x4a\x7a\x71\x39\x54\x41\x67\x44\x67\x6d\x46\
-\x69\x64\x42\x4f\x33\x56\x45\x42\x4c\x31\x38\x56\x41\x68\x76\x43\
-\x35\x49\x49\x48\x76\x48\x7a\x67\x34\x67\x45\x52\x33\x35\x75\x68\
-\x44\x7a\x66\x72\x73\x78\x54\x65\x52\x58\x6f\x46\x78\x20\x7a\x6b\
-\x6f\x4f\x50\x41\x5a\x55\x50\x37\x54\x4d\x48\x68\x35\x6d\x7a\x6f\
-\x70\x32\x69\x5a\x38\x33\x47\x6d\x4d\x67\x2b\x59\x4c\x61\x41\x4d\
-\x6f\x6b\x76\x5a\x32\x79\x77\x46\x7a\x76\x48\x59\x62\x6c\x4b\x2b\
-\x4b\x34\x4b\x6b\x74\x6e\x63\x6f\x36\x6c\x59\x7a\x4e\x31\x70\x54\
-\x43\x47\x68\x70\x68\x68\x79\x2b\x38\x4f\x20\x59\x70\x36\x69\x53\
-\x6e\x4e\x67\x6a\x74\x32\x4b\x4d\x38\x6e\x42\x69\x61\x38\x34\x74\
-\x74\x78\x49\x37\x30\x6d\x68\x74\x39\x38\x4f\x5a\x4e\x6f\x6d\x51\
-\x75\x59\x49\x6f\x48\x6a\x7a\x4d\x32\x54\x50\x47\x37\x75\x2f\x39\
-\x2f\x6d\x77\x61\x51\x37\x31\x31\x52\x4f\x58\x2b\x63\x68\x4a\x4b\
-\x52\x44\x48\x6f\x4f\x2f\x6f\x20\x39\x74\x4d\x77\x33\x68\x46\x75\
-\x37\x68\x5a\x51\x6d\x4f\x4c\x52\x35\x56\x4f\x63\x6e\x4a\x32\x6a\
-\x72\x44\x53\x75\x37\x31\x37\x68\x35\x76\x6f\x61\x44\x78\x35\x66\
-\x67\x58\x30\x6a\x54\x53\x56\x56\x64\x4c\x78\x72\x4f\x4d\x74\x67\
-\x4a\x2f\x33\x74\x64\x73\x46\x57\x53\x68\x66\x7a\x67\x6c\x75\x50\
-\x65\x72\x55\x45\x20\x76\x43\x52\x71\x4b\x69\x57\x4e\x59\x6a\x62\
-\x45\x6a\x43\x33\x50\x32\x64\x53\x39\x78\x72\x2f\x66\x4e\x71\x2f\
-\x4e\x77\x73\x4d\x66\x52\x79\x45\x37\x42\x4f\x74\x44\x62\x6d\x45\
-\x6b\x49\x6b\x46\x41\x68\x6c\x53\x37\x68\x6f\x69\x45\x63\x6d\x46\
-\x66\x55\x68\x68\x79\x6c\x44\x42\x41\x61\x70\x32\x64\x33\x6c\x63\
-\x5a\x20\x30\x65\x4d\x68\x34\x57\x59\x45\x54\x6d\x33\x4c\x50\x42\
-\x6a\x45\x6d\x36\x55\x72\x6d\x42\x53\x4d\x4c\x71\x45\x4b\x41\x2b\
-\x63\x56\x6f\x44\x72\x64\x73\x4f\x4e\x63\x50\x6c\x30\x66\x75\x5a\
-\x77\x78\x42\x74\x36\x4c\x42\x45\x52\x45\x71\x4b\x6f\x4b\x7a\x76\
-\x48\x6d\x4f\x34\x35\x77\x75\x50\x68\x35\x5a\x7a\x63\x77\x20\x69\
-\x64\x44\x6d\x31\x2f\x58\x6e\x73\x4c\x2f\x4d\x2f\x6a\x37\x59\x70\
-\x6a\x61\x6b\x76\x30\x64\x30\x39\x2b\x46\x38\x68\x70\x43\x50\x5a\
-\x5a\x33\x72\x37\x52\x63\x79\x71\x53\x38\x53\x70\x2f\x69\x33\x39\
-\x78\x37\x45\x41\x2b\x6d\x48\x50\x55\x78\x6a\x46\x61\x34\x75\x6e\
-\x75\x44\x71\x38\x68\x6c\x49\x6c\x59\x47\x36\x20\x45\x6b\x36\x4f\
-\x7a\x33\x47\x33\x2b\x49\x43\x6d\x61\x56\x47\x55\x33\x65\x62\x48\
-\x43\x73\x6a\x73\x62\x59\x39\x36\x62\x72\x78\x38\x4b\x46\x76\x68\
-\x67\x38\x47\x46\x6d\x4d\x45\x42\x61\x79\x55\x71\x77\x38\x4d\x51\
-\x6f\x61\x35\x72\x4c\x42\x59\x4c\x47\x52\x63\x55\x49\x69\x45\x73\
-\x76\x42\x38\x58\x47\x58\x61\x4a\x20\x45\x6c\x47\x50\x33\x43\x58\
-\x43\x62\x46\x79\x66\x59\x54\x63\x68\x58\x2f\x78\x6f\x46\x4e\x70\
-\x48\x5a\x51\x5a\x49\x48\x48\x76\x44\x5a\x2f\x50\x74\x6e\x69\x56\
-\x72\x47\x78\x6b\x75\x4b\x34\x4c\x33\x4c\x74\x52\x56\x49\x70\x41\
-\x69\x45\x4f\x75\x77\x59\x55\x49\x74\x68\x63\x4d\x77\x4f\x4e\x37\
-\x44\x6e\x4b\x61\x63\x20\x68\x47\x6b\x76\x6b\x67\x69\x54\x53\x43\
-\x41\x55\x56\x41\x4d\x6f\x42\x63\x55\x4b\x78\x6d\x67\x55\x52\x5a\
-\x46\x2b\x54\x46\x6d\x67\x4e\x42\x57\x30\x4d\x53\x67\x6d\x55\x78\
-\x67\x74\x6e\x38\x63\x44\x59\x36\x31\x46\x32\x30\x72\x77\x78\x6e\
-\x71\x39\x78\x6e\x4b\x35\x78\x47\x4b\x78\x47\x43\x43\x66\x77\x32\
-\x71\x31\x20\x43\x70\x62\x74\x62\x6a\x33\x6a\x38\x67\x33\x46\x7a\
-\x66\x68\x39\x5a\x37\x53\x7a\x69\x5a\x4e\x45\x6b\x4c\x58\x79\x2f\
-\x58\x45\x2b\x45\x51\x75\x33\x6e\x59\x47\x4f\x49\x47\x31\x38\x73\
-\x33\x66\x4d\x2f\x4c\x30\x36\x41\x36\x4e\x73\x55\x4e\x70\x76\x68\
-\x6b\x68\x38\x76\x6b\x33\x58\x71\x59\x43\x6b\x38\x59\x4b\x49\x20\
-\x6d\x4f\x62\x62\x35\x2f\x38\x46\x70\x51\x33\x4b\x59\x67\x35\x6e\
-\x47\x61\x51\x30\x6d\x42\x30\x55\x4d\x52\x53\x56\x75\x50\x36\x77\
-\x77\x4d\x50\x48\x70\x35\x44\x47\x6f\x48\x30\x64\x52\x2f\x6f\x59\
-\x33\x47\x66\x43\x57\x6c\x6f\x65\x73\x34\x4e\x6e\x44\x37\x44\x48\
-\x38\x76\x59\x4f\x71\x39\x56\x4b\x78\x46\x63\x77\x20\x46\x45\x6d\
-\x33\x33\x31\x32\x4c\x49\x59\x53\x69\x2f\x39\x6e\x47\x6f\x67\x77\
-\x6f\x30\x6e\x41\x75\x32\x2b\x42\x7a\x36\x77\x70\x44\x63\x59\x77\
-\x43\x4d\x73\x58\x2f\x55\x36\x4b\x55\x46\x48\x79\x6a\x2f\x54\x41\
-\x32\x6f\x41\x75\x59\x6a\x38\x48\x57\x69\x67\x68\x67\x42\x51\x72\
-\x53\x43\x62\x52\x43\x5a\x51\x71\x6f\x20\x77\x71\x41\x79\x42\x55\
-\x77\x63\x6e\x51\x78\x72\x41\x41\x41\x62\x35\x55\x6c\x45\x51\x56\
-\x51\x31\x51\x56\x45\x55\x55\x46\x70\x6a\x4e\x70\x31\x43\x47\x34\
-\x4f\x71\x4c\x47\x47\x4b\x41\x6c\x6f\x58\x69\x4b\x34\x66\x54\x34\
-\x44\x4f\x73\x75\x65\x48\x6f\x6e\x71\x75\x34\x79\x38\x57\x43\x39\
-\x7a\x63\x33\x47\x43\x39\x20\x58\x71\x66\x50\x72\x4c\x57\x6f\x36\
-\x78\x72\x57\x53\x70\x66\x66\x4b\x44\x62\x48\x6c\x4b\x69\x63\x43\
-\x38\x51\x44\x6c\x37\x38\x62\x45\x66\x57\x36\x58\x52\x4e\x52\x49\
-\x6d\x4b\x66\x43\x37\x62\x70\x32\x6d\x50\x66\x37\x37\x70\x2f\x54\
-\x4b\x38\x44\x78\x4d\x55\x54\x37\x52\x75\x62\x33\x4e\x4e\x76\x69\
-\x4f\x6d\x69\x20\x45\x6e\x52\x49\x55\x79\x67\x4e\x55\x31\x58\x48\
-\x41\x44\x54\x59\x61\x36\x67\x77\x59\x4e\x4f\x30\x4b\x41\x67\x34\
-\x50\x62\x2f\x43\x7a\x63\x31\x72\x50\x48\x70\x38\x43\x57\x61\x68\
-\x58\x45\x71\x48\x66\x45\x4d\x6c\x53\x4f\x30\x48\x33\x48\x42\x6f\
-\x52\x66\x4d\x73\x69\x49\x58\x67\x52\x34\x78\x39\x7a\x6d\x4f\x6a\
-\x20\x6b\x66\x66\x76\x33\x38\x4e\x61\x43\x36\x32\x69\x6d\x32\x4f\
-\x4c\x4b\x4e\x59\x39\x59\x65\x65\x69\x6a\x53\x31\x67\x7a\x68\x6b\
-\x50\x74\x57\x5a\x39\x2f\x46\x4d\x48\x39\x37\x45\x53\x76\x53\x38\
-\x69\x55\x31\x67\x48\x78\x61\x4a\x33\x4f\x4d\x2b\x42\x36\x42\x42\
-\x55\x33\x75\x38\x2b\x72\x49\x47\x7a\x58\x65\x43\x44\x20\x44\x68\
-\x78\x74\x4d\x70\x6c\x67\x4f\x6a\x31\x43\x57\x5a\x61\x6f\x4b\x75\
-\x46\x6f\x5a\x56\x48\x41\x46\x41\x55\x4b\x59\x34\x43\x51\x6a\x2b\
-\x6b\x4a\x4d\x43\x51\x46\x66\x4f\x50\x7a\x32\x41\x4e\x4d\x48\x55\
-\x65\x32\x74\x73\x76\x35\x7a\x41\x39\x63\x64\x44\x6b\x42\x51\x6b\
-\x68\x4f\x54\x73\x34\x77\x6e\x52\x35\x68\x20\x73\x56\x6a\x67\x37\
-\x75\x34\x4f\x54\x64\x4f\x67\x71\x6f\x44\x35\x66\x4a\x34\x51\x4d\
-\x6e\x4c\x51\x75\x71\x37\x52\x74\x6a\x58\x57\x61\x35\x65\x79\x39\
-\x47\x56\x38\x5a\x41\x63\x32\x69\x73\x41\x42\x4d\x54\x39\x75\x57\
-\x7a\x34\x44\x64\x44\x71\x2b\x76\x4c\x2b\x2f\x33\x78\x6c\x68\x46\
-\x79\x51\x63\x42\x48\x30\x32\x20\x36\x75\x53\x5a\x2b\x41\x38\x50\
-\x43\x74\x6c\x4a\x42\x4d\x44\x6f\x4c\x6d\x4e\x46\x45\x63\x46\x34\
-\x70\x32\x46\x4d\x69\x63\x59\x79\x76\x47\x39\x52\x46\x41\x56\x6d\
-\x30\x7a\x6d\x63\x57\x73\x4e\x77\x6a\x62\x5a\x68\x4e\x4c\x57\x48\
-\x4c\x6d\x55\x48\x38\x79\x49\x2f\x73\x6b\x6d\x37\x6e\x63\x56\x44\
-\x42\x42\x42\x78\x20\x56\x76\x79\x44\x72\x6e\x46\x34\x2f\x2b\x47\
-\x64\x42\x49\x61\x54\x4a\x41\x37\x6e\x77\x64\x36\x48\x57\x72\x46\
-\x32\x79\x66\x4e\x44\x52\x4e\x77\x48\x68\x2b\x67\x45\x39\x34\x46\
-\x63\x58\x32\x49\x5a\x57\x45\x53\x2b\x77\x50\x31\x49\x71\x2b\x54\
-\x43\x53\x53\x32\x6f\x53\x55\x4f\x54\x63\x4c\x69\x4c\x6b\x7a\x6e\
-\x4b\x20\x36\x51\x54\x7a\x2b\x52\x78\x48\x52\x38\x63\x6f\x79\x7a\
-\x49\x68\x44\x49\x64\x72\x68\x34\x59\x5a\x5a\x6b\x59\x4d\x4f\x47\
-\x72\x67\x2b\x6f\x61\x4f\x2b\x46\x76\x4a\x62\x30\x4d\x36\x63\x62\
-\x59\x63\x36\x53\x4c\x69\x52\x41\x37\x48\x37\x47\x47\x4d\x77\x65\
-\x6e\x70\x4b\x57\x61\x7a\x47\x65\x37\x75\x37\x6e\x42\x33\x20\x64\
-\x77\x66\x6e\x57\x6d\x69\x74\x55\x38\x43\x46\x39\x78\x35\x4e\x30\
-\x36\x42\x70\x47\x6c\x68\x72\x45\x2b\x64\x73\x32\x7a\x61\x4e\x4b\
-\x39\x63\x46\x41\x71\x44\x76\x56\x32\x33\x76\x76\x76\x73\x79\x64\
-\x76\x31\x57\x2f\x66\x43\x41\x2b\x33\x64\x62\x61\x62\x33\x67\x59\
-\x7a\x6a\x6e\x6a\x43\x35\x2f\x31\x70\x43\x43\x20\x4d\x5a\x32\x45\
-\x6f\x4c\x57\x47\x30\x6f\x43\x33\x44\x6b\x62\x70\x43\x74\x5a\x4a\
-\x57\x68\x48\x42\x41\x36\x7a\x67\x6e\x49\x64\x6e\x52\x6c\x58\x4e\
-\x55\x4a\x67\x70\x62\x6d\x37\x75\x63\x48\x34\x31\x6c\x79\x63\x36\
-\x44\x36\x4f\x55\x36\x43\x43\x38\x50\x36\x4b\x43\x53\x42\x71\x4f\
-\x55\x6c\x68\x38\x5a\x6f\x59\x4f\x20\x6c\x62\x31\x57\x69\x79\x58\
-\x75\x62\x6d\x37\x44\x35\x49\x63\x44\x55\x66\x61\x54\x66\x62\x70\
-\x6e\x44\x34\x61\x49\x4f\x31\x54\x34\x74\x79\x2f\x67\x5a\x77\x4a\
-\x57\x67\x2f\x48\x36\x33\x45\x32\x4d\x54\x6f\x42\x53\x47\x6b\x6f\
-\x5a\x74\x46\x34\x71\x32\x6b\x56\x39\x72\x61\x6f\x71\x7a\x4b\x5a\
-\x7a\x48\x4d\x2f\x6e\x20\x71\x43\x59\x54\x6c\x45\x57\x52\x4c\x4b\
-\x4b\x78\x48\x67\x77\x43\x41\x72\x49\x69\x4f\x4e\x65\x4a\x51\x73\
-\x6d\x43\x71\x52\x53\x30\x46\x73\x4e\x48\x30\x7a\x53\x69\x52\x6d\
-\x6a\x56\x69\x58\x6f\x4d\x49\x4e\x77\x6e\x69\x64\x65\x55\x44\x43\
-\x38\x52\x38\x69\x52\x73\x45\x34\x49\x70\x49\x74\x63\x73\x79\x78\
-\x4a\x48\x20\x52\x30\x64\x67\x5a\x69\x79\x58\x64\x2f\x41\x73\x44\
-\x57\x57\x54\x69\x47\x59\x55\x70\x6e\x6f\x4b\x49\x73\x4a\x30\x4f\
-\x6b\x56\x64\x31\x31\x67\x75\x6c\x37\x42\x57\x72\x6f\x6d\x49\x61\
-\x45\x7a\x58\x2f\x7a\x4c\x75\x42\x66\x44\x35\x43\x47\x41\x2b\x31\
-\x6a\x62\x45\x38\x39\x78\x5a\x5a\x62\x76\x46\x4f\x51\x53\x43\x20\
-\x53\x79\x5a\x6c\x48\x2b\x55\x69\x64\x36\x68\x4d\x6f\x58\x51\x6f\
-\x36\x64\x4b\x35\x38\x45\x51\x63\x6c\x66\x36\x50\x63\x47\x4c\x7a\
-\x4e\x72\x4b\x34\x4c\x53\x5a\x56\x31\x5a\x4e\x33\x69\x54\x54\x41\
-\x48\x6c\x55\x31\x77\x64\x33\x64\x41\x75\x64\x58\x63\x78\x41\x30\
-\x76\x4c\x65\x79\x65\x41\x63\x69\x59\x66\x37\x53\x20\x52\x43\x77\
-\x70\x55\x78\x44\x45\x58\x43\x32\x58\x71\x4f\x73\x36\x36\x45\x6e\
-\x64\x79\x2b\x53\x4c\x74\x34\x30\x62\x62\x75\x4f\x57\x77\x32\x75\
-\x48\x47\x7a\x6f\x36\x48\x76\x6e\x6b\x65\x6a\x69\x55\x2b\x33\x59\
-\x44\x71\x6f\x33\x37\x30\x31\x65\x44\x65\x54\x6b\x57\x6b\x37\x7a\
-\x53\x43\x71\x59\x73\x55\x5a\x59\x6c\x20\x48\x70\x36\x63\x59\x54\
-\x49\x74\x4d\x5a\x76\x4f\x55\x56\x58\x56\x49\x48\x67\x64\x50\x51\
-\x54\x4d\x78\x66\x54\x57\x69\x39\x75\x49\x4d\x6c\x64\x45\x2f\x45\
-\x35\x45\x77\x33\x34\x77\x50\x50\x4f\x6d\x46\x56\x69\x6b\x6a\x38\
-\x33\x30\x6f\x37\x77\x4f\x55\x4f\x53\x47\x30\x65\x41\x56\x64\x52\
-\x78\x6a\x44\x49\x36\x4f\x20\x70\x6c\x67\x73\x62\x39\x4a\x7a\x65\
-\x75\x4b\x73\x34\x34\x52\x77\x38\x2f\x6b\x63\x38\x2f\x6b\x38\x47\
-\x58\x6e\x71\x75\x73\x37\x47\x47\x69\x65\x59\x6e\x77\x76\x32\x47\
-\x57\x61\x32\x4b\x52\x72\x37\x72\x61\x58\x42\x33\x74\x43\x54\x38\
-\x6c\x7a\x69\x66\x45\x56\x52\x77\x4a\x69\x75\x72\x45\x73\x63\x49\
-\x39\x62\x78\x20\x6a\x59\x53\x49\x6e\x59\x56\x78\x59\x4b\x68\x43\
-\x6f\x37\x5a\x68\x59\x59\x69\x67\x46\x45\x4c\x72\x62\x4e\x45\x46\
-\x66\x76\x6a\x58\x47\x37\x6a\x57\x6f\x35\x68\x4b\x4c\x77\x4a\x72\
-\x4c\x61\x42\x56\x54\x39\x54\x73\x4a\x74\x76\x35\x66\x59\x67\x49\
-\x31\x6a\x6b\x55\x5a\x52\x48\x36\x45\x37\x59\x6f\x6a\x49\x46\x7a\
-\x20\x46\x67\x55\x70\x76\x48\x37\x35\x41\x74\x36\x32\x6f\x6c\x2f\
-\x36\x54\x59\x76\x6d\x54\x6d\x53\x49\x47\x6a\x31\x74\x4c\x74\x67\
-\x32\x71\x2b\x72\x59\x4e\x62\x48\x65\x4b\x74\x43\x56\x33\x52\x43\
-\x4c\x35\x59\x62\x6c\x70\x2f\x2b\x75\x41\x65\x6b\x4b\x59\x38\x51\
-\x77\x45\x64\x77\x72\x73\x55\x34\x72\x4d\x79\x63\x2f\x20\x48\x47\
-\x6b\x46\x70\x54\x57\x71\x49\x4f\x71\x66\x6e\x70\x37\x69\x36\x4f\
-\x51\x59\x56\x56\x57\x42\x76\x42\x41\x6e\x48\x33\x32\x43\x47\x54\
-\x4c\x46\x6f\x41\x64\x68\x65\x2f\x48\x2f\x75\x64\x67\x70\x72\x67\
-\x35\x47\x4a\x38\x72\x47\x64\x2f\x4e\x68\x73\x2f\x32\x49\x43\x36\
-\x44\x33\x2f\x68\x6e\x43\x78\x65\x75\x63\x20\x36\x2f\x73\x65\x52\
-\x58\x64\x7a\x34\x61\x44\x5a\x63\x49\x41\x67\x71\x6b\x73\x51\x54\
-\x53\x50\x43\x4a\x5a\x46\x57\x45\x35\x7a\x7a\x30\x46\x6f\x46\x61\
-\x7a\x68\x51\x6c\x6c\x49\x2b\x49\x33\x4c\x47\x39\x58\x6f\x4e\x59\
-\x30\x78\x58\x55\x69\x4f\x38\x62\x32\x77\x67\x6d\x77\x63\x41\x35\
-\x42\x55\x41\x41\x41\x43\x75\x20\x4c\x2b\x6f\x50\x33\x32\x74\x73\
-\x37\x2f\x4e\x72\x30\x6d\x63\x44\x76\x32\x36\x55\x74\x4c\x70\x78\
-\x2f\x41\x61\x52\x6b\x6a\x47\x44\x4f\x73\x59\x69\x67\x6b\x5a\x4a\
-\x51\x6b\x52\x4e\x36\x75\x4a\x78\x75\x54\x4f\x32\x41\x63\x69\x6b\
-\x45\x57\x6b\x33\x77\x61\x53\x79\x58\x68\x51\x78\x6b\x53\x2b\x66\
-\x4e\x45\x76\x35\x20\x75\x36\x71\x61\x6f\x6d\x30\x63\x71\x6b\x6b\
-\x6e\x76\x38\x65\x4e\x79\x69\x65\x63\x57\x34\x41\x69\x63\x34\x67\
-\x62\x45\x35\x33\x53\x59\x6c\x4b\x33\x71\x46\x63\x31\x50\x72\x78\
-\x2f\x6e\x7a\x54\x4b\x54\x36\x47\x43\x51\x35\x46\x79\x6c\x78\x37\
-\x51\x51\x2f\x53\x65\x65\x38\x48\x33\x64\x4e\x79\x63\x49\x30\x53\
-\x78\x20\x4c\x45\x66\x41\x71\x42\x63\x33\x64\x51\x73\x6f\x67\x6a\
-\x45\x6c\x69\x42\x6a\x4f\x41\x32\x43\x47\x4d\x68\x71\x6d\x4c\x48\
-\x41\x38\x50\x30\x55\x31\x6d\x32\x49\x2b\x6e\x32\x4d\x36\x6e\x61\
-\x49\x73\x4a\x31\x42\x47\x4a\x32\x4d\x47\x67\x61\x46\x38\x79\x4d\
-\x64\x6b\x33\x6e\x6a\x57\x78\x6b\x48\x6a\x2f\x6c\x71\x62\x20\x45\
-\x41\x77\x51\x48\x43\x77\x51\x61\x79\x6f\x6b\x68\x51\x77\x65\x79\
-\x57\x38\x78\x2b\x42\x31\x62\x55\x2b\x62\x50\x79\x76\x63\x7a\x52\
-\x38\x43\x49\x48\x48\x46\x4e\x65\x76\x75\x63\x45\x59\x31\x38\x2f\
-\x71\x6b\x6b\x5a\x68\x78\x50\x35\x51\x67\x74\x6e\x31\x56\x56\x6c\
-\x56\x77\x66\x75\x54\x55\x31\x39\x30\x76\x6d\x20\x7a\x78\x35\x44\
-\x70\x6c\x33\x71\x78\x48\x42\x2b\x68\x35\x77\x50\x5a\x42\x49\x59\
-\x73\x50\x6b\x75\x55\x58\x63\x57\x52\x73\x4d\x6f\x67\x39\x67\x76\
-\x50\x35\x6d\x59\x47\x2f\x32\x68\x42\x31\x69\x63\x6a\x44\x7a\x49\
-\x51\x30\x58\x54\x75\x56\x4b\x42\x48\x4d\x68\x67\x6c\x61\x6b\x77\
-\x4c\x57\x57\x78\x6a\x75\x62\x6e\x20\x59\x47\x49\x6f\x52\x66\x43\
-\x4f\x6f\x58\x57\x6f\x46\x77\x4d\x6c\x6d\x41\x32\x78\x65\x73\x62\
-\x71\x4d\x46\x46\x63\x64\x63\x36\x42\x34\x47\x48\x41\x67\x50\x4d\
-\x67\x42\x6c\x61\x4c\x57\x36\x78\x75\x62\x38\x48\x73\x6f\x47\x4a\
-\x64\x47\x2b\x34\x4f\x42\x39\x42\x5a\x57\x41\x2f\x78\x46\x57\x32\
-\x6a\x67\x49\x63\x6f\x20\x34\x58\x31\x52\x71\x74\x73\x77\x48\x79\
-\x4a\x32\x35\x4d\x2b\x41\x6c\x43\x72\x38\x48\x63\x5a\x4f\x7a\x6e\
-\x5a\x57\x49\x45\x32\x59\x7a\x32\x59\x34\x4f\x54\x6e\x42\x79\x66\
-\x6b\x5a\x70\x72\x4d\x5a\x74\x43\x36\x41\x77\x42\x30\x64\x65\x37\
-\x47\x47\x74\x6f\x48\x69\x6b\x32\x53\x71\x53\x49\x64\x63\x65\x51\
-\x61\x59\x20\x34\x46\x32\x6f\x62\x6b\x41\x68\x4e\x51\x7a\x6f\x52\
-\x64\x54\x6b\x37\x79\x65\x68\x48\x56\x47\x6e\x39\x6b\x46\x76\x6a\
-\x4d\x52\x6b\x38\x2f\x50\x30\x66\x64\x41\x76\x4c\x66\x65\x64\x7a\
-\x55\x4e\x45\x5a\x42\x34\x33\x2f\x4d\x54\x2f\x2b\x39\x61\x43\x50\
-\x49\x76\x31\x4c\x37\x4d\x43\x4b\x6b\x72\x6e\x47\x66\x6d\x5a\x20\
-\x4a\x79\x49\x6f\x59\x77\x4c\x78\x45\x43\x4b\x79\x57\x71\x33\x51\
-\x4e\x49\x30\x45\x47\x79\x54\x62\x67\x52\x50\x62\x42\x46\x6a\x53\
-\x36\x51\x62\x31\x55\x66\x4f\x39\x7a\x4a\x46\x73\x6d\x2f\x71\x78\
-\x54\x61\x78\x4d\x4f\x4a\x49\x2b\x6a\x32\x34\x55\x32\x51\x38\x69\
-\x49\x56\x72\x73\x62\x45\x63\x67\x41\x5a\x68\x6f\x20\x58\x46\x45\
-\x4b\x57\x6e\x63\x45\x4f\x34\x71\x63\x67\x71\x53\x62\x4e\x6f\x30\
-\x4f\x59\x6d\x4e\x65\x36\x67\x6f\x39\x63\x62\x53\x69\x6b\x64\x77\
-\x62\x49\x2b\x79\x56\x45\x69\x76\x65\x39\x66\x55\x31\x48\x6a\x77\
-\x38\x43\x77\x70\x6f\x6e\x31\x70\x75\x44\x4d\x2f\x42\x70\x30\x55\
-\x55\x79\x74\x74\x62\x46\x45\x70\x61\x20\x62\x33\x76\x76\x6f\x64\
-\x6e\x6a\x2b\x74\x33\x62\x55\x4e\x7a\x6b\x41\x4a\x33\x74\x51\x4a\
-\x44\x37\x4e\x73\x66\x72\x66\x35\x39\x2f\x71\x65\x44\x5a\x78\x72\
-\x49\x71\x34\x64\x70\x75\x4d\x62\x30\x44\x54\x4b\x6d\x6c\x2b\x42\
-\x57\x43\x66\x75\x55\x6a\x64\x78\x49\x4c\x72\x79\x6b\x72\x7a\x47\
-\x59\x7a\x6e\x4a\x79\x63\x20\x34\x65\x54\x6b\x42\x4c\x50\x5a\x44\
-\x4c\x6f\x6f\x70\x4d\x4f\x52\x39\x37\x42\x65\x4f\x42\x32\x52\x67\
-\x69\x49\x43\x65\x78\x45\x64\x6f\x30\x56\x53\x51\x5a\x54\x37\x4e\
-\x76\x6e\x5a\x4d\x75\x73\x61\x63\x79\x71\x53\x52\x64\x77\x58\x71\
-\x64\x4f\x31\x66\x74\x69\x65\x4c\x70\x5a\x38\x73\x4c\x31\x33\x6a\
-\x71\x62\x7a\x20\x34\x57\x2b\x48\x63\x51\x52\x4d\x6c\x44\x39\x59\
-\x52\x53\x4d\x48\x54\x4d\x45\x61\x34\x66\x2b\x72\x31\x53\x6f\x5a\
-\x62\x48\x61\x74\x4f\x33\x4d\x66\x67\x65\x50\x7a\x35\x76\x4d\x35\
-\x6a\x44\x47\x4a\x49\x2b\x62\x57\x63\x65\x39\x39\x53\x6a\x54\x4f\
-\x37\x78\x33\x37\x65\x78\x74\x73\x4d\x38\x7a\x73\x67\x30\x35\x64\
-\x20\x43\x65\x47\x59\x56\x74\x62\x5a\x47\x42\x50\x30\x50\x54\x47\
-\x34\x44\x4b\x33\x35\x73\x61\x74\x5a\x43\x70\x63\x38\x51\x4d\x41\
-\x7a\x46\x4a\x31\x48\x55\x55\x4a\x6a\x44\x77\x55\x74\x30\x53\x76\
-\x51\x49\x47\x61\x30\x62\x59\x76\x46\x63\x69\x47\x69\x67\x58\x59\
-\x41\x59\x6a\x69\x4f\x51\x34\x79\x64\x6f\x36\x69\x62\x20\x44\x53\
-\x6b\x52\x75\x6a\x6f\x67\x33\x6c\x73\x59\x39\x6e\x43\x74\x78\x5a\
-\x76\x58\x72\x39\x4b\x4c\x35\x66\x64\x39\x4c\x41\x4c\x6d\x6b\x4f\
-\x75\x71\x75\x59\x4e\x34\x54\x4f\x63\x30\x32\x71\x51\x44\x42\x56\
-\x41\x6f\x39\x53\x41\x6d\x2f\x45\x6a\x4e\x46\x52\x6d\x77\x45\x76\
-\x33\x57\x65\x30\x5a\x52\x6c\x44\x67\x2f\x20\x50\x38\x66\x5a\x36\
-\x51\x56\x6d\x73\x78\x6d\x71\x71\x6b\x4a\x5a\x56\x70\x30\x34\x42\
-\x51\x34\x62\x6f\x57\x47\x43\x68\x4d\x45\x2b\x63\x44\x73\x48\x67\
-\x41\x6a\x45\x43\x70\x6f\x59\x62\x42\x30\x59\x42\x50\x49\x45\x32\
-\x31\x6f\x34\x64\x4a\x78\x4a\x4f\x4d\x32\x77\x57\x39\x61\x77\x6c\
-\x30\x52\x2f\x76\x54\x58\x36\x20\x46\x48\x2b\x6f\x4d\x6d\x78\x4b\
-\x42\x6a\x70\x53\x33\x53\x34\x75\x6c\x63\x53\x4b\x6d\x79\x67\x37\
-\x64\x62\x71\x2b\x31\x6e\x49\x32\x6d\x72\x61\x52\x6a\x73\x75\x68\
-\x74\x56\x31\x45\x7a\x4f\x35\x41\x44\x67\x6e\x31\x4f\x4b\x66\x79\
-\x33\x71\x45\x73\x43\x79\x67\x6c\x68\x70\x76\x46\x61\x68\x32\x73\
-\x36\x65\x49\x58\x20\x33\x59\x56\x6f\x63\x57\x37\x64\x36\x43\x4e\
-\x72\x4d\x6a\x43\x79\x38\x32\x42\x74\x59\x68\x68\x5a\x4c\x6c\x49\
-\x7a\x63\x7a\x4a\x59\x4d\x59\x75\x66\x57\x78\x56\x69\x36\x53\x79\
-\x79\x41\x74\x62\x70\x66\x55\x4f\x66\x44\x75\x47\x53\x39\x30\x52\
-\x32\x65\x42\x69\x5a\x6e\x55\x4b\x49\x70\x51\x56\x52\x62\x6d\x32\
-\x44\x20\x39\x4a\x58\x33\x42\x47\x38\x74\x36\x6d\x61\x46\x61\x6d\
-\x6f\x36\x4b\x6b\x79\x79\x32\x71\x4a\x6d\x52\x48\x45\x79\x57\x6f\
-\x47\x45\x4b\x45\x67\x6f\x56\x67\x68\x5a\x38\x77\x79\x6a\x4e\x4b\
-\x36\x58\x74\x37\x69\x39\x76\x67\x48\x59\x78\x54\x44\x65\x54\x43\
-\x61\x2f\x31\x7a\x76\x30\x6f\x45\x63\x4d\x65\x70\x2b\x4e\x20\x68\
-\x37\x46\x46\x35\x49\x2f\x66\x64\x61\x33\x41\x67\x71\x47\x44\x46\
-\x62\x51\x78\x77\x59\x79\x75\x63\x48\x4a\x38\x4b\x73\x68\x33\x64\
-\x6f\x62\x4a\x5a\x4a\x71\x73\x59\x50\x4c\x2b\x45\x67\x66\x70\x2f\
-\x53\x61\x46\x4a\x6c\x59\x41\x4d\x7a\x51\x7a\x50\x48\x75\x51\x38\
-\x79\x4b\x47\x65\x70\x2b\x71\x30\x69\x47\x75\x20\x41\x51\x39\x39\
-\x69\x37\x6c\x68\x5a\x54\x63\x43\x41\x70\x33\x69\x50\x2b\x51\x34\
-\x32\x2f\x53\x67\x62\x57\x4a\x6f\x2f\x6a\x4e\x30\x33\x4d\x64\x77\
-\x74\x72\x75\x37\x75\x32\x37\x65\x32\x49\x79\x54\x48\x63\x35\x78\
-\x6a\x4d\x42\x47\x4b\x63\x4d\x59\x67\x39\x6c\x73\x42\x69\x69\x4e\
-\x35\x58\x4b\x5a\x75\x6a\x67\x50\x20\x47\x38\x6c\x75\x69\x73\x75\
-\x48\x48\x5a\x67\x78\x63\x54\x57\x65\x31\x36\x47\x34\x4b\x6c\x4b\
-\x49\x76\x45\x73\x4d\x35\x30\x75\x57\x7a\x67\x78\x52\x41\x52\x2b\
-\x43\x4c\x2f\x72\x72\x6d\x54\x2f\x6e\x45\x4b\x51\x30\x38\x59\x43\
-\x51\x69\x6c\x57\x32\x68\x55\x72\x4c\x44\x2b\x50\x75\x64\x70\x45\
-\x77\x66\x37\x46\x59\x20\x59\x44\x49\x37\x45\x38\x78\x6e\x79\x51\
-\x53\x49\x73\x75\x38\x75\x35\x54\x68\x4f\x55\x48\x67\x45\x34\x2b\
-\x32\x72\x56\x2f\x42\x74\x67\x36\x69\x50\x53\x6a\x44\x7a\x4d\x48\
-\x49\x42\x77\x55\x4b\x70\x6b\x44\x44\x36\x67\x45\x55\x65\x77\x6a\
-\x59\x4f\x45\x4d\x47\x32\x33\x65\x46\x43\x37\x4e\x58\x6e\x50\x5a\
-\x51\x75\x20\x55\x46\x59\x54\x71\x4d\x4c\x67\x39\x4f\x51\x63\x35\
-\x2b\x66\x6e\x4f\x44\x71\x61\x51\x78\x63\x47\x30\x54\x67\x44\x41\
-\x48\x56\x6a\x34\x63\x44\x51\x30\x45\x46\x38\x44\x30\x54\x4b\x64\
-\x35\x74\x4f\x76\x67\x76\x48\x4d\x6c\x6f\x4b\x59\x31\x45\x42\x51\
-\x44\x45\x61\x31\x32\x41\x5a\x64\x43\x4b\x68\x37\x4e\x78\x7a\x20\
-\x6e\x47\x75\x6a\x52\x68\x41\x77\x56\x4c\x36\x44\x78\x4f\x62\x6d\
-\x42\x4d\x61\x69\x66\x38\x67\x55\x71\x51\x33\x70\x52\x4b\x34\x56\
-\x73\x55\x6d\x50\x53\x41\x66\x35\x6a\x39\x5a\x46\x5a\x36\x55\x46\
-\x6b\x6b\x45\x70\x63\x73\x46\x68\x57\x46\x59\x6b\x34\x72\x75\x51\
-\x50\x72\x39\x65\x55\x79\x69\x76\x45\x6c\x78\x55\x20\x31\x61\x51\
-\x45\x4b\x57\x43\x78\x58\x4b\x47\x75\x36\x36\x78\x31\x51\x76\x64\
-\x4f\x59\x37\x39\x33\x49\x65\x57\x68\x59\x71\x76\x4d\x77\x34\x45\
-\x55\x59\x45\x69\x65\x57\x35\x61\x79\x33\x78\x49\x71\x4b\x4d\x79\
-\x6b\x5a\x2f\x42\x42\x4a\x39\x71\x48\x74\x2b\x77\x6a\x65\x70\x49\
-\x77\x68\x30\x2b\x55\x38\x36\x50\x59\x20\x77\x58\x53\x69\x53\x45\
-\x5a\x78\x79\x43\x66\x45\x57\x69\x30\x58\x73\x68\x6d\x6b\x55\x43\
-\x39\x58\x55\x44\x67\x48\x4d\x77\x46\x65\x55\x70\x61\x59\x4a\x4f\
-\x69\x34\x39\x30\x4b\x71\x77\x33\x2f\x52\x5a\x7a\x79\x4d\x30\x6e\
-\x41\x41\x58\x46\x50\x6a\x39\x61\x74\x58\x6f\x6f\x73\x42\x30\x61\
-\x44\x58\x50\x58\x70\x77\x20\x49\x41\x34\x6b\x64\x4c\x33\x46\x7a\
-\x47\x45\x62\x45\x73\x62\x72\x59\x6d\x30\x56\x49\x68\x4b\x6a\x6c\
-\x43\x63\x55\x5a\x59\x6e\x5a\x38\x51\x6c\x4f\x54\x38\x35\x78\x2b\
-\x65\x42\x42\x69\x67\x5a\x68\x54\x2f\x41\x4f\x30\x44\x6f\x47\x49\
-\x55\x76\x73\x6f\x41\x6f\x72\x72\x55\x43\x41\x42\x79\x70\x64\x59\
-\x44\x61\x66\x20\x59\x58\x35\x30\x68\x4b\x71\x63\x51\x46\x45\x4d\
-\x55\x2b\x6f\x4f\x71\x48\x4d\x4f\x48\x67\x36\x33\x71\x79\x56\x65\
-\x76\x6e\x71\x42\x4e\x32\x2f\x65\x70\x45\x4c\x4a\x6b\x53\x74\x4c\
-\x6c\x6f\x47\x4e\x4d\x38\x35\x6e\x44\x77\x53\x58\x44\x71\x76\x4e\
-\x77\x78\x6a\x2f\x37\x73\x54\x73\x50\x73\x67\x42\x69\x72\x61\x41\
-\x20\x7a\x66\x53\x75\x2f\x49\x63\x7a\x5a\x37\x37\x33\x48\x75\x76\
-\x31\x47\x71\x76\x56\x4b\x6c\x6e\x48\x6f\x34\x37\x59\x33\x64\x39\
-\x66\x33\x37\x47\x57\x36\x4c\x6e\x59\x35\x39\x6c\x44\x47\x77\x31\
-\x34\x6a\x38\x62\x4a\x73\x36\x71\x71\x67\x67\x2f\x45\x4d\x48\x64\
-\x62\x44\x50\x58\x41\x62\x52\x4c\x4f\x38\x46\x30\x33\x20\x64\x4e\
-\x46\x6b\x4d\x48\x4c\x67\x77\x42\x7a\x49\x69\x2b\x47\x4d\x50\x4d\
-\x4d\x59\x46\x56\x51\x4d\x6b\x79\x4b\x47\x4f\x6b\x6c\x67\x6b\x4a\
-\x34\x31\x77\x4b\x35\x44\x69\x4d\x49\x51\x54\x4c\x53\x2b\x6b\x53\
-\x4a\x5a\x45\x4b\x31\x51\x46\x4a\x4c\x33\x56\x4b\x38\x58\x73\x4d\
-\x30\x53\x71\x6d\x51\x55\x75\x73\x52\x71\x20\x55\x59\x4d\x74\x67\
-\x59\x77\x43\x4b\x55\x62\x72\x6e\x46\x6a\x2f\x41\x69\x6a\x32\x76\
-\x54\x77\x73\x53\x61\x47\x68\x59\x4a\x43\x51\x56\x4b\x57\x62\x36\
-\x32\x76\x63\x58\x6e\x38\x41\x4f\x77\x75\x4b\x2b\x6c\x71\x57\x6f\
-\x35\x66\x45\x72\x2f\x51\x50\x64\x61\x6c\x2b\x38\x68\x54\x35\x58\
-\x6e\x77\x64\x36\x61\x34\x75\x20\x37\x72\x4a\x4c\x67\x59\x6d\x48\
-\x4f\x5a\x6d\x55\x77\x34\x33\x4d\x6e\x64\x6e\x5a\x4d\x61\x42\x56\
-\x43\x57\x55\x30\x64\x46\x6e\x67\x35\x50\x51\x63\x6c\x35\x65\x58\
-\x6d\x42\x37\x4e\x41\x53\x56\x4f\x63\x75\x73\x39\x79\x49\x75\x4f\
-\x52\x30\x52\x53\x68\x79\x55\x6f\x33\x34\x61\x46\x38\x31\x57\x46\
-\x52\x4a\x47\x63\x20\x48\x70\x2f\x68\x34\x76\x52\x4d\x44\x44\x52\
-\x42\x64\x46\x4e\x4b\x66\x4b\x75\x4e\x72\x63\x48\x73\x55\x64\x73\
-\x57\x74\x37\x65\x33\x65\x50\x33\x54\x61\x37\x79\x37\x2f\x6f\x42\
-\x56\x73\x34\x4a\x6c\x43\x31\x61\x63\x30\x72\x67\x59\x50\x68\x6c\
-\x77\x6c\x46\x4c\x51\x30\x4c\x33\x44\x45\x41\x54\x2f\x6a\x57\x54\
-\x61\x20\x61\x46\x62\x50\x4f\x55\x32\x45\x79\x4d\x48\x5a\x5a\x39\
-\x4b\x4a\x47\x52\x78\x53\x4f\x55\x6e\x69\x4a\x79\x5a\x4a\x61\x64\
-\x4a\x4b\x77\x7a\x6d\x4c\x78\x57\x4b\x42\x39\x61\x72\x75\x44\x6a\
-\x34\x7a\x44\x49\x59\x75\x46\x55\x46\x4f\x68\x52\x43\x4f\x4e\x38\
-\x69\x47\x69\x58\x75\x6a\x53\x49\x45\x56\x30\x44\x72\x41\x20\x65\
-\x71\x48\x45\x57\x68\x6c\x35\x62\x2b\x39\x68\x74\x4d\x4c\x4a\x38\
-\x54\x7a\x46\x71\x53\x6f\x6a\x7a\x36\x50\x41\x2b\x59\x33\x57\x57\
-\x44\x63\x74\x43\x6d\x31\x45\x6c\x51\x72\x35\x6c\x72\x49\x71\x47\
-\x57\x46\x69\x4f\x55\x48\x52\x56\x65\x43\x39\x6c\x58\x47\x49\x6f\
-\x42\x58\x42\x75\x54\x62\x4e\x76\x77\x6f\x78\x20\x75\x45\x72\x4a\
-\x76\x57\x32\x7a\x46\x69\x36\x63\x46\x6b\x61\x45\x69\x68\x35\x69\
-\x2b\x54\x34\x42\x55\x49\x6b\x4b\x70\x59\x76\x6a\x34\x76\x65\x34\
-\x64\x7a\x4b\x51\x41\x54\x41\x4d\x4c\x38\x35\x35\x70\x61\x42\x53\
-\x72\x7a\x6f\x47\x63\x77\x76\x72\x61\x68\x41\x78\x58\x46\x50\x6a\
-\x36\x4f\x67\x49\x4c\x31\x37\x39\x20\x41\x39\x35\x2f\x43\x30\x4d\
-\x4b\x31\x6c\x6c\x55\x70\x59\x45\x45\x5a\x6e\x69\x6f\x51\x55\x51\
-\x47\x42\x30\x4e\x6c\x48\x4d\x2f\x61\x46\x67\x61\x45\x44\x2b\x2f\
-\x65\x77\x64\x6f\x47\x6b\x6b\x2f\x68\x6f\x44\x36\x78\x44\x48\x32\
-\x55\x33\x58\x50\x4b\x4b\x37\x70\x64\x69\x4e\x47\x30\x4e\x70\x6d\
-\x53\x62\x53\x74\x4f\x20\x65\x56\x30\x59\x45\x4d\x76\x6d\x54\x36\
-\x6f\x35\x4a\x72\x4d\x70\x54\x73\x2f\x50\x63\x58\x46\x31\x69\x58\
-\x49\x79\x44\x56\x79\x4b\x35\x50\x42\x5a\x44\x72\x6c\x76\x6f\x51\
-\x61\x50\x5a\x78\x54\x47\x77\x43\x67\x4e\x44\x59\x33\x35\x62\x49\
-\x37\x7a\x30\x77\x74\x63\x58\x46\x7a\x67\x61\x44\x49\x56\x6f\x35\
-\x5a\x53\x20\x55\x45\x44\x6f\x52\x71\x58\x52\x4e\x47\x75\x30\x74\
-\x6b\x58\x54\x4e\x72\x69\x2b\x2f\x6f\x43\x58\x72\x31\x2f\x68\x2f\
-\x66\x55\x48\x74\x4b\x36\x42\x44\x65\x33\x6b\x68\x72\x71\x4b\x35\
-\x36\x34\x49\x4d\x69\x43\x47\x6e\x59\x36\x59\x78\x47\x42\x76\x44\
-\x5a\x57\x4a\x36\x59\x4a\x4d\x50\x76\x73\x2f\x39\x2f\x78\x73\x20\
-\x52\x4a\x31\x59\x48\x42\x47\x6a\x61\x5a\x71\x65\x48\x79\x7a\x4f\
-\x77\x7a\x6b\x58\x75\x4a\x33\x47\x65\x72\x33\x47\x65\x72\x31\x47\
-\x32\x37\x5a\x67\x76\x78\x6b\x64\x4d\x37\x6f\x76\x41\x37\x46\x34\
-\x63\x39\x2b\x34\x73\x33\x7a\x6d\x35\x6f\x42\x77\x61\x65\x51\x32\
-\x5a\x53\x6e\x70\x64\x63\x36\x36\x59\x50\x6a\x71\x20\x39\x46\x49\
-\x69\x45\x76\x63\x49\x64\x63\x37\x38\x34\x54\x4f\x46\x4d\x4e\x68\
-\x77\x48\x31\x41\x45\x76\x37\x57\x33\x46\x6a\x59\x51\x53\x47\x50\
-\x79\x64\x6e\x43\x63\x30\x75\x6a\x47\x75\x50\x6a\x48\x77\x6c\x5a\
-\x31\x43\x59\x41\x78\x4b\x75\x68\x33\x6e\x71\x43\x30\x52\x49\x41\
-\x6f\x37\x62\x46\x63\x4c\x66\x44\x68\x20\x2b\x69\x32\x63\x62\x31\
-\x42\x57\x68\x4c\x70\x64\x6f\x36\x70\x4b\x74\x47\x30\x4e\x4b\x67\
-\x79\x30\x69\x58\x56\x43\x51\x34\x32\x59\x6f\x55\x54\x67\x49\x7a\
-\x63\x53\x72\x75\x47\x63\x52\x2b\x74\x71\x76\x48\x37\x39\x47\x75\
-\x79\x47\x5a\x76\x56\x73\x73\x72\x33\x70\x6a\x55\x45\x66\x32\x58\
-\x4e\x4c\x56\x65\x37\x6f\x20\x6a\x6e\x4b\x52\x55\x68\x71\x74\x46\
-\x5a\x47\x75\x4c\x43\x63\x67\x6b\x71\x72\x54\x5a\x56\x58\x69\x65\
-\x48\x71\x45\x71\x34\x65\x50\x4d\x5a\x38\x66\x59\x7a\x4b\x62\x69\
-\x71\x48\x45\x65\x6d\x68\x74\x51\x45\x79\x77\x6a\x55\x56\x68\x71\
-\x73\x52\x39\x43\x68\x4c\x2f\x31\x71\x53\x63\x34\x4f\x72\x79\x45\
-\x67\x38\x75\x20\x72\x33\x42\x32\x66\x42\x71\x6f\x70\x53\x6a\x74\
-\x77\x72\x6c\x6b\x62\x73\x34\x35\x73\x58\x69\x79\x78\x30\x38\x33\
-\x31\x2f\x6a\x6e\x44\x2f\x2f\x41\x54\x2b\x2f\x66\x70\x57\x69\x57\
-\x4e\x6f\x69\x6b\x33\x6d\x66\x75\x42\x50\x46\x46\x51\x45\x65\x6e\
-\x76\x48\x56\x4a\x39\x34\x6a\x58\x39\x49\x77\x49\x6d\x58\x38\x57\
-\x20\x59\x62\x32\x4a\x78\x48\x30\x53\x31\x36\x65\x48\x34\x4c\x37\
-\x54\x66\x30\x54\x4e\x59\x4f\x45\x53\x73\x55\x73\x7a\x71\x2f\x36\
-\x61\x75\x68\x62\x74\x65\x6f\x56\x32\x33\x53\x51\x4a\x41\x72\x36\
-\x72\x74\x4a\x37\x50\x4b\x7a\x32\x44\x47\x5a\x36\x34\x4d\x30\x78\
-\x6d\x4b\x73\x46\x51\x62\x4a\x5a\x33\x52\x6a\x67\x76\x20\x42\x41\
-\x36\x48\x6e\x7a\x79\x44\x77\x5a\x68\x56\x45\x35\x42\x6e\x4c\x4e\
-\x75\x56\x45\x44\x5a\x34\x4b\x4b\x56\x68\x72\x65\x38\x39\x4d\x77\
-\x5a\x50\x44\x34\x45\x44\x49\x39\x42\x42\x67\x78\x61\x43\x46\x78\
-\x4f\x4c\x64\x55\x41\x2b\x36\x73\x56\x32\x35\x67\x58\x4c\x44\x6d\
-\x33\x46\x73\x45\x73\x6b\x33\x6e\x65\x74\x20\x41\x62\x64\x51\x42\
-\x47\x68\x4e\x41\x44\x76\x63\x33\x74\x33\x43\x32\x78\x5a\x31\x73\
-\x34\x43\x31\x4e\x5a\x53\x57\x49\x7a\x4f\x5a\x6c\x6e\x68\x37\x33\
-\x66\x62\x30\x41\x39\x48\x39\x64\x6d\x64\x53\x69\x47\x67\x6c\x47\
-\x2f\x33\x75\x33\x55\x2b\x34\x2f\x76\x41\x68\x66\x58\x35\x49\x50\
-\x75\x49\x2b\x47\x4f\x6f\x6b\x20\x30\x61\x69\x52\x36\x71\x41\x36\
-\x71\x51\x36\x6e\x51\x67\x30\x64\x49\x6f\x32\x6a\x6b\x31\x4d\x38\
-\x75\x6e\x71\x41\x30\x2f\x4e\x4c\x71\x4b\x44\x34\x78\x2f\x74\x38\
-\x4f\x50\x77\x61\x57\x74\x4b\x41\x57\x6f\x76\x43\x47\x42\x52\x4b\
-\x6f\x79\x70\x4c\x58\x4a\x79\x64\x34\x2f\x48\x6a\x78\x7a\x67\x2f\
-\x4f\x52\x58\x4b\x20\x47\x65\x61\x66\x52\x4e\x57\x51\x57\x32\x65\
-\x64\x51\x32\x73\x74\x50\x74\x7a\x65\x34\x49\x64\x2f\x2f\x52\x4d\
-\x2f\x76\x6e\x6f\x46\x36\x79\x32\x30\x6b\x66\x51\x6b\x35\x78\x79\
-\x55\x45\x63\x64\x38\x76\x74\x6d\x64\x70\x58\x5a\x63\x68\x78\x33\
-\x71\x47\x69\x71\x49\x6d\x78\x51\x4e\x51\x59\x50\x72\x59\x39\x42\
-\x30\x20\x75\x68\x66\x6a\x5a\x76\x39\x30\x2b\x4e\x41\x52\x4e\x4f\
-\x63\x63\x62\x6d\x39\x76\x77\x38\x48\x74\x36\x30\x4a\x44\x54\x70\
-\x46\x2f\x48\x71\x57\x66\x73\x59\x4f\x5a\x66\x2b\x61\x52\x49\x53\
-\x46\x31\x37\x79\x37\x58\x64\x65\x38\x71\x66\x72\x6e\x67\x51\x38\
-\x77\x69\x62\x76\x62\x70\x67\x78\x32\x45\x30\x44\x36\x58\x20\x78\
-\x58\x59\x61\x41\x31\x4f\x6f\x45\x45\x54\x75\x4e\x35\x41\x76\x33\
-\x34\x76\x50\x43\x63\x4f\x31\x39\x77\x77\x59\x51\x67\x76\x62\x4e\
-\x6c\x69\x76\x4c\x46\x7a\x62\x59\x4c\x31\x65\x77\x74\x6b\x31\x74\
-\x41\x47\x30\x59\x53\x6b\x41\x72\x41\x6d\x72\x31\x52\x31\x4d\x30\
-\x41\x57\x31\x31\x6e\x44\x73\x5a\x4b\x55\x59\x20\x4b\x53\x4a\x71\
-\x37\x45\x45\x55\x59\x75\x54\x67\x47\x61\x39\x66\x76\x55\x54\x54\
-\x72\x46\x47\x51\x6b\x74\x6f\x68\x4d\x66\x6f\x45\x4f\x43\x67\x71\
-\x5a\x74\x65\x4c\x78\x63\x56\x4c\x68\x35\x51\x49\x6e\x68\x6e\x61\
-\x6c\x47\x69\x39\x67\x79\x48\x43\x2f\x50\x51\x55\x44\x78\x38\x38\
-\x78\x75\x6e\x35\x47\x51\x70\x74\x20\x34\x4a\x68\x68\x76\x51\x65\
-\x37\x47\x4a\x78\x73\x55\x4d\x51\x65\x46\x36\x78\x67\x51\x43\x46\
-\x73\x72\x38\x4c\x46\x2b\x54\x6d\x65\x50\x48\x79\x45\x38\x39\x4f\
-\x7a\x4a\x43\x4a\x71\x6a\x6e\x71\x30\x68\x76\x63\x4f\x36\x31\x61\
-\x34\x68\x51\x66\x6a\x37\x59\x65\x66\x38\x4f\x4c\x6c\x53\x37\x78\
-\x35\x39\x78\x62\x4d\x20\x48\x6d\x77\x6b\x79\x73\x67\x36\x42\x30\
-\x63\x4f\x72\x42\x6e\x57\x74\x52\x4b\x72\x47\x78\x4b\x6d\x35\x53\
-\x44\x45\x69\x48\x37\x66\x51\x7a\x6a\x76\x4f\x33\x30\x77\x72\x78\
-\x4d\x4b\x46\x7a\x68\x43\x56\x6e\x67\x70\x68\x79\x48\x69\x4d\x45\
-\x74\x63\x72\x41\x71\x63\x75\x37\x56\x74\x46\x30\x7a\x4d\x44\x46\
-\x4a\x69\x20\x71\x57\x77\x62\x68\x37\x71\x75\x6b\x37\x68\x4b\x51\
-\x51\x66\x76\x74\x6c\x62\x47\x49\x6c\x59\x39\x50\x35\x79\x6e\x75\
-\x42\x64\x52\x48\x5a\x49\x76\x69\x66\x6f\x63\x4f\x64\x4c\x65\x61\
-\x43\x68\x4a\x48\x4e\x56\x6e\x65\x6c\x54\x59\x57\x36\x32\x6c\x73\
-\x74\x39\x71\x74\x5a\x4a\x69\x2f\x63\x77\x6f\x4e\x4b\x46\x78\x20\
-\x44\x71\x78\x4b\x78\x4b\x66\x30\x7a\x30\x51\x77\x36\x45\x42\x38\
-\x6b\x57\x30\x51\x50\x51\x74\x74\x55\x4a\x53\x68\x38\x67\x41\x47\
-\x6a\x6e\x5a\x73\x63\x76\x52\x39\x49\x75\x6c\x51\x6a\x62\x67\x50\
-\x52\x4e\x58\x43\x72\x42\x59\x66\x73\x46\x79\x4a\x38\x6b\x76\x73\
-\x49\x59\x56\x2f\x53\x64\x4c\x31\x6c\x53\x44\x67\x20\x33\x65\x49\
-\x61\x79\x2f\x55\x64\x76\x76\x2f\x54\x74\x79\x41\x74\x34\x6c\x30\
-\x78\x4c\x63\x56\x52\x53\x32\x70\x48\x59\x45\x35\x51\x6a\x4e\x6c\
-\x68\x63\x58\x65\x44\x6e\x39\x36\x38\x44\x63\x67\x71\x6d\x79\x6d\
-\x55\x39\x39\x50\x6b\x37\x68\x69\x62\x47\x76\x74\x65\x69\x4c\x46\
-\x46\x4b\x4a\x73\x4c\x69\x75\x6e\x78\x20\x38\x53\x6b\x65\x50\x48\
-\x69\x41\x79\x36\x75\x48\x4b\x4d\x74\x4b\x6b\x6b\x38\x74\x67\x34\
-\x77\x57\x68\x33\x79\x55\x41\x71\x32\x34\x44\x49\x67\x6c\x55\x37\
-\x32\x73\x53\x6a\x79\x38\x65\x6f\x68\x48\x56\x77\x39\x77\x64\x58\
-\x45\x70\x4b\x54\x30\x4f\x55\x70\x30\x38\x74\x41\x36\x59\x54\x43\
-\x59\x70\x5a\x34\x36\x5a\x20\x38\x66\x72\x74\x47\x2f\x7a\x7a\x58\
-\x7a\x2f\x67\x77\x2f\x55\x31\x50\x44\x77\x63\x70\x45\x71\x35\x63\
-\x30\x37\x61\x41\x2b\x67\x51\x32\x68\x63\x32\x41\x41\x4e\x71\x32\
-\x77\x56\x42\x39\x77\x30\x6d\x4f\x59\x48\x4a\x4f\x57\x48\x53\x47\
-\x54\x50\x6e\x63\x76\x35\x54\x31\x33\x56\x50\x56\x45\x38\x2b\x76\
-\x35\x41\x38\x20\x58\x56\x51\x6d\x4f\x78\x43\x64\x4e\x62\x4e\x74\
-\x58\x49\x72\x70\x48\x49\x72\x36\x65\x57\x57\x39\x66\x50\x65\x33\
-\x63\x51\x32\x35\x62\x2f\x50\x7a\x58\x58\x70\x6c\x2f\x43\x78\x79\
-\x70\x37\x49\x73\x30\x37\x76\x45\x65\x37\x66\x71\x6f\x7a\x48\x59\
-\x6e\x52\x69\x32\x74\x59\x6d\x62\x61\x6b\x30\x68\x33\x43\x7a\x61\
-\x20\x50\x64\x43\x7a\x76\x73\x62\x35\x44\x41\x4d\x38\x64\x73\x47\
-\x68\x69\x4c\x66\x72\x4f\x76\x50\x75\x33\x63\x74\x75\x45\x67\x6f\
-\x51\x42\x36\x54\x45\x51\x5a\x49\x43\x6e\x4c\x4f\x34\x75\x37\x76\
-\x46\x4e\x39\x38\x39\x77\x2b\x6e\x5a\x4d\x58\x53\x70\x52\x64\x51\
-\x4b\x39\x55\x62\x43\x55\x6e\x57\x63\x4c\x49\x5a\x34\x20\x68\x55\
-\x4f\x68\x50\x4d\x4d\x37\x68\x7a\x65\x76\x58\x6f\x75\x37\x49\x38\
-\x51\x59\x53\x67\x69\x59\x32\x35\x63\x54\x76\x42\x65\x63\x38\x35\
-\x6e\x63\x37\x6c\x4e\x72\x74\x63\x4a\x55\x6d\x45\x34\x6e\x75\x4c\
-\x69\x34\x77\x75\x6e\x5a\x68\x57\x53\x41\x4d\x37\x42\x63\x42\x38\
-\x71\x75\x4e\x46\x79\x6f\x49\x4e\x65\x32\x20\x4c\x51\x77\x70\x6c\
-\x4f\x55\x45\x6c\x53\x70\x42\x54\x44\x67\x2f\x4f\x38\x4f\x6a\x71\
-\x77\x66\x34\x2b\x74\x6b\x33\x51\x6b\x47\x56\x52\x4e\x4b\x77\x69\
-\x67\x64\x63\x6e\x72\x68\x63\x4c\x6e\x47\x33\x57\x75\x44\x64\x75\
-\x33\x66\x34\x38\x66\x55\x72\x58\x4e\x2f\x64\x53\x73\x69\x61\x42\
-\x75\x72\x57\x64\x73\x69\x6e\x20\x52\x45\x38\x56\x67\x34\x66\x6f\
-\x67\x4e\x6f\x6f\x6b\x42\x30\x36\x75\x47\x4f\x4e\x46\x64\x55\x37\
-\x2b\x41\x41\x4e\x6b\x45\x6c\x53\x5a\x35\x70\x6d\x48\x58\x52\x44\
-\x6d\x33\x78\x34\x53\x62\x54\x32\x48\x6c\x56\x52\x39\x6a\x68\x68\
-\x39\x79\x78\x42\x33\x6e\x72\x56\x6c\x61\x75\x49\x63\x38\x6a\x4e\
-\x2b\x6a\x61\x7a\x20\x36\x4d\x6b\x35\x4d\x54\x6e\x6a\x6b\x38\x6f\
-\x4a\x71\x6b\x76\x57\x7a\x66\x49\x41\x2b\x73\x59\x52\x36\x69\x4e\
-\x50\x45\x6c\x6c\x44\x73\x46\x61\x30\x6d\x69\x61\x4f\x47\x41\x30\
-\x30\x4b\x5a\x53\x4c\x55\x42\x71\x44\x64\x56\x4d\x48\x51\x68\x47\
-\x74\x77\x2f\x32\x51\x75\x66\x51\x4e\x64\x31\x55\x63\x79\x72\x4b\
-\x7a\x20\x65\x73\x62\x31\x30\x35\x44\x7a\x62\x58\x30\x2f\x67\x48\
-\x30\x59\x63\x4c\x42\x58\x4a\x78\x79\x6f\x44\x58\x6c\x34\x34\x54\
-\x61\x49\x42\x69\x56\x41\x6d\x72\x45\x61\x78\x61\x48\x71\x4e\x6b\
-\x6d\x6c\x4c\x6d\x6a\x41\x47\x43\x48\x58\x36\x37\x62\x47\x39\x66\
-\x56\x50\x65\x50\x37\x64\x4e\x37\x69\x38\x75\x6f\x42\x6a\x20\x73\
-\x53\x6f\x56\x52\x59\x46\x56\x75\x30\x5a\x5a\x6c\x6e\x41\x6a\x67\
-\x63\x58\x64\x68\x44\x7a\x59\x4f\x37\x43\x33\x65\x50\x39\x4f\x2f\
-\x47\x41\x49\x31\x4c\x4d\x6f\x4e\x4e\x70\x6d\x75\x34\x48\x6d\x50\
-\x70\x41\x4f\x67\x51\x34\x52\x2f\x30\x72\x68\x2b\x50\x51\x55\x35\
-\x78\x64\x58\x75\x4c\x78\x38\x49\x46\x51\x62\x20\x30\x65\x65\x6f\
-\x51\x69\x4b\x73\x49\x41\x4a\x62\x68\x36\x71\x6f\x6f\x45\x44\x67\
-\x78\x71\x4b\x59\x7a\x50\x44\x34\x30\x53\x4e\x38\x2f\x66\x51\x5a\
-\x7a\x6b\x2f\x50\x34\x46\x75\x50\x51\x6e\x65\x78\x6b\x33\x4b\x67\
-\x78\x4b\x71\x34\x58\x4e\x37\x68\x35\x63\x73\x58\x2b\x4f\x6e\x44\
-\x65\x38\x6b\x79\x68\x2f\x69\x61\x20\x57\x6d\x74\x68\x53\x64\x61\
-\x53\x53\x44\x70\x62\x65\x54\x69\x77\x6c\x37\x49\x67\x57\x70\x65\
-\x53\x43\x4e\x76\x61\x46\x47\x59\x47\x78\x4d\x33\x72\x2b\x38\x45\
-\x69\x67\x6a\x52\x4e\x56\x38\x2b\x6c\x34\x35\x51\x64\x38\x63\x6d\
-\x44\x47\x57\x4a\x79\x4c\x68\x47\x6c\x56\x6e\x4f\x35\x51\x53\x65\
-\x4d\x6e\x70\x41\x37\x20\x57\x6b\x63\x33\x58\x41\x6d\x44\x76\x77\
-\x58\x35\x4a\x59\x6f\x71\x45\x6d\x46\x46\x4a\x6e\x48\x6a\x2b\x42\
-\x77\x41\x6f\x59\x56\x43\x56\x67\x72\x52\x64\x2f\x56\x6e\x75\x33\
-\x65\x46\x6c\x4d\x54\x45\x45\x44\x6d\x52\x4d\x44\x6b\x33\x4c\x42\
-\x56\x46\x67\x56\x57\x39\x6c\x76\x46\x48\x55\x72\x53\x36\x38\x53\
-\x4f\x68\x20\x64\x4a\x68\x4f\x4a\x34\x46\x7a\x64\x39\x65\x49\x62\
-\x68\x77\x54\x6c\x6f\x75\x45\x6d\x47\x4d\x36\x34\x44\x36\x64\x63\
-\x48\x6a\x36\x68\x77\x67\x34\x6e\x4e\x2f\x6d\x58\x41\x45\x44\x64\
-\x70\x69\x55\x46\x56\x62\x31\x47\x6c\x56\x56\x67\x49\x79\x43\x38\
-\x79\x32\x49\x50\x47\x35\x75\x33\x75\x50\x62\x37\x35\x2f\x6a\x20\
-\x35\x4f\x77\x59\x32\x6f\x69\x50\x43\x53\x51\x4a\x70\x56\x6f\x5a\
-\x67\x4d\x57\x41\x30\x42\x4d\x64\x67\x67\x6b\x5a\x7a\x4e\x42\x45\
-\x59\x47\x4a\x38\x65\x50\x38\x54\x50\x72\x7a\x2f\x53\x51\x4b\x32\
-\x32\x55\x46\x70\x45\x33\x4b\x78\x39\x69\x75\x43\x75\x63\x69\x53\
-\x55\x32\x69\x74\x64\x57\x6a\x6c\x46\x70\x33\x61\x20\x6b\x6d\x41\
-\x35\x6e\x35\x2f\x67\x34\x73\x45\x56\x7a\x73\x34\x75\x55\x41\x54\
-\x7a\x64\x75\x76\x45\x65\x43\x54\x63\x41\x61\x44\x67\x52\x69\x43\
-\x57\x54\x42\x43\x79\x6f\x6f\x64\x63\x58\x56\x33\x68\x6d\x36\x2b\
-\x65\x34\x38\x48\x46\x4a\x61\x59\x54\x73\x63\x70\x31\x58\x61\x6f\
-\x34\x69\x58\x79\x4c\x78\x52\x49\x2f\x20\x2f\x76\x67\x6a\x58\x72\
-\x78\x2b\x67\x64\x56\x71\x4b\x51\x68\x47\x44\x4f\x75\x64\x2b\x42\
-\x51\x4c\x6f\x64\x39\x74\x61\x38\x50\x39\x44\x75\x53\x44\x7a\x68\
-\x6f\x6f\x70\x51\x4c\x42\x6d\x4b\x4a\x6e\x7a\x41\x46\x45\x50\x4b\
-\x72\x72\x47\x75\x76\x31\x65\x71\x4f\x41\x55\x6a\x78\x41\x77\x6e\
-\x55\x6b\x68\x61\x6b\x37\x20\x6a\x50\x48\x77\x44\x71\x32\x47\x51\
-\x34\x64\x35\x76\x78\x68\x77\x7a\x67\x48\x79\x30\x4c\x52\x34\x7a\
-\x37\x41\x34\x6b\x39\x62\x43\x70\x65\x4e\x59\x50\x75\x54\x31\x31\
-\x58\x55\x4e\x41\x43\x48\x45\x79\x36\x54\x49\x49\x75\x39\x44\x41\
-\x44\x67\x6b\x48\x74\x56\x54\x74\x36\x66\x69\x79\x75\x6c\x53\x78\
-\x65\x53\x42\x20\x6e\x4e\x78\x4c\x77\x37\x33\x58\x57\x71\x50\x51\
-\x52\x6f\x70\x4f\x68\x2f\x45\x56\x47\x44\x70\x4c\x4d\x33\x4c\x65\
-\x51\x32\x74\x43\x57\x52\x67\x59\x55\x38\x6e\x63\x51\x7a\x61\x4a\
-\x76\x49\x4d\x67\x71\x59\x76\x50\x47\x2b\x52\x4f\x35\x70\x43\x72\
-\x41\x7a\x73\x4f\x36\x4f\x44\x50\x62\x73\x37\x35\x76\x54\x70\x35\
-\x20\x4d\x53\x46\x32\x6c\x50\x43\x39\x30\x67\x71\x6d\x4b\x44\x51\
-\x57\x71\x7a\x73\x70\x56\x36\x41\x41\x47\x39\x71\x67\x58\x64\x2f\
-\x64\x34\x4f\x76\x6e\x58\x2b\x48\x6b\x37\x42\x6a\x46\x70\x41\x69\
-\x52\x42\x64\x7a\x56\x52\x41\x6b\x62\x78\x42\x6e\x46\x45\x6d\x73\
-\x6e\x69\x77\x6e\x62\x4f\x33\x68\x34\x67\x42\x33\x65\x20\x76\x58\
-\x30\x44\x32\x39\x51\x6f\x4e\x49\x47\x64\x49\x4b\x67\x50\x50\x72\
-\x53\x68\x66\x32\x63\x49\x50\x71\x4f\x67\x66\x64\x2b\x50\x6c\x77\
-\x6a\x2f\x45\x49\x43\x74\x74\x63\x62\x56\x6f\x34\x64\x34\x2b\x76\
-\x51\x70\x69\x6e\x4b\x43\x70\x6d\x6e\x67\x48\x49\x66\x73\x39\x72\
-\x44\x77\x54\x6a\x49\x6a\x6c\x41\x70\x55\x20\x4d\x47\x69\x6b\x52\
-\x37\x4d\x5a\x4c\x6b\x37\x50\x38\x50\x54\x70\x55\x31\x78\x65\x50\
-\x4a\x42\x69\x53\x65\x6a\x30\x4c\x52\x39\x45\x33\x4f\x56\x71\x68\
-\x52\x65\x76\x66\x73\x53\x4c\x46\x79\x2b\x77\x57\x43\x31\x52\x46\
-\x42\x71\x65\x51\x6c\x59\x45\x41\x63\x6f\x59\x61\x50\x61\x53\x39\
-\x63\x35\x53\x46\x69\x4c\x56\x20\x47\x59\x30\x55\x4f\x49\x6f\x72\
-\x58\x74\x77\x4c\x64\x56\x32\x6a\x72\x6d\x75\x73\x56\x71\x75\x55\
-\x52\x5a\x41\x62\x5a\x62\x72\x2b\x6a\x73\x50\x53\x67\x44\x4b\x6d\
-\x4d\x51\x59\x78\x6c\x43\x72\x73\x37\x38\x35\x44\x4d\x6a\x77\x77\
-\x65\x63\x62\x39\x6d\x49\x34\x32\x2f\x43\x78\x48\x58\x43\x4c\x68\
-\x54\x6a\x47\x2f\x20\x4d\x69\x4b\x54\x74\x52\x5a\x31\x32\x38\x42\
-\x37\x6a\x36\x4f\x6a\x6f\x35\x37\x56\x55\x5a\x64\x46\x30\x69\x65\
-\x39\x6c\x30\x43\x41\x2f\x44\x6e\x44\x36\x4b\x6b\x63\x47\x61\x50\
-\x45\x59\x36\x33\x74\x58\x52\x4d\x4a\x46\x52\x47\x6a\x43\x49\x48\
-\x57\x4a\x6e\x48\x6e\x54\x58\x47\x79\x2f\x79\x37\x59\x51\x50\x6a\
-\x68\x20\x47\x75\x32\x43\x33\x42\x71\x39\x37\x56\x71\x4b\x42\x73\
-\x77\x78\x34\x73\x63\x4d\x59\x33\x32\x4c\x79\x57\x51\x69\x34\x56\
-\x45\x6b\x54\x55\x44\x66\x66\x58\x69\x48\x4a\x38\x38\x65\x34\x63\
-\x47\x6a\x4b\x30\x45\x73\x68\x58\x51\x34\x6d\x45\x33\x61\x50\x43\
-\x49\x35\x54\x4b\x43\x4f\x55\x6e\x74\x49\x39\x53\x6b\x78\x20\x70\
-\x6a\x48\x57\x69\x79\x56\x65\x76\x2f\x77\x52\x76\x72\x56\x51\x75\
-\x71\x4e\x47\x7a\x6f\x64\x44\x7a\x6e\x5a\x30\x34\x6b\x4e\x49\x68\
-\x6f\x43\x41\x37\x4e\x61\x37\x35\x46\x6f\x34\x50\x6a\x76\x48\x6b\
-\x79\x64\x50\x63\x48\x70\x32\x46\x6a\x5a\x46\x48\x4f\x79\x4e\x73\
-\x31\x42\x42\x64\x43\x78\x55\x41\x55\x56\x53\x20\x6b\x49\x68\x5a\
-\x58\x41\x52\x6c\x55\x57\x47\x69\x43\x6e\x7a\x33\x31\x62\x64\x34\
-\x2b\x76\x51\x70\x4a\x70\x4e\x4a\x52\x36\x47\x55\x51\x68\x76\x53\
-\x68\x4f\x71\x6d\x77\x65\x74\x33\x62\x2f\x47\x76\x6c\x79\x39\x77\
-\x75\x37\x67\x52\x6a\x6c\x59\x71\x4c\x4a\x73\x61\x79\x69\x68\x59\
-\x36\x35\x50\x4c\x4a\x75\x59\x63\x20\x71\x6a\x52\x4f\x76\x37\x69\
-\x76\x74\x77\x37\x31\x65\x6f\x33\x56\x59\x6f\x6d\x36\x6c\x57\x4a\
-\x49\x4e\x6e\x49\x62\x72\x57\x41\x4b\x30\x33\x74\x76\x51\x2b\x4f\
-\x69\x59\x71\x63\x54\x78\x58\x32\x4a\x53\x43\x42\x45\x4b\x5a\x5a\
-\x52\x38\x50\x46\x77\x2b\x59\x79\x51\x79\x63\x6b\x44\x30\x42\x6b\
-\x6d\x65\x67\x66\x6d\x20\x51\x47\x44\x6d\x5a\x4c\x78\x52\x53\x6b\
-\x45\x62\x73\x59\x49\x43\x53\x42\x78\x79\x75\x56\x79\x6d\x37\x50\
-\x6d\x69\x4b\x4b\x43\x64\x44\x38\x61\x36\x4c\x74\x68\x2f\x32\x2f\
-\x4e\x7a\x2f\x54\x51\x69\x73\x64\x4b\x51\x4e\x67\x4c\x73\x41\x48\
-\x68\x34\x31\x39\x58\x31\x31\x45\x71\x4c\x36\x38\x47\x45\x62\x74\
-\x44\x65\x20\x4a\x33\x48\x66\x4a\x38\x75\x75\x61\x49\x33\x64\x47\
-\x75\x5a\x72\x32\x76\x33\x2f\x30\x48\x55\x34\x52\x50\x2f\x62\x64\
-\x72\x33\x6f\x68\x6a\x35\x6b\x31\x67\x63\x6a\x54\x4e\x32\x75\x73\
-\x62\x68\x62\x34\x50\x6c\x33\x7a\x2f\x48\x67\x30\x51\x55\x61\x31\
-\x30\x43\x54\x54\x71\x46\x48\x42\x45\x71\x68\x56\x49\x44\x45\x20\
-\x30\x55\x6b\x52\x55\x36\x54\x77\x4c\x47\x59\x52\x4a\x77\x79\x4a\
-\x55\x2f\x7a\x31\x71\x31\x64\x59\x33\x4e\x30\x41\x35\x4f\x46\x74\
-\x79\x4a\x39\x54\x75\x72\x4d\x43\x37\x6e\x6e\x58\x50\x42\x4d\x62\
-\x36\x41\x4b\x49\x48\x58\x75\x55\x78\x51\x54\x6e\x6a\x78\x37\x67\
-\x32\x56\x64\x66\x34\x65\x6a\x6f\x57\x44\x49\x2b\x20\x67\x71\x34\
-\x55\x34\x78\x44\x62\x56\x6b\x7a\x77\x57\x6d\x6e\x55\x64\x51\x76\
-\x62\x4f\x4a\x52\x6c\x69\x5a\x49\x30\x71\x71\x4c\x43\x33\x2f\x2f\
-\x37\x62\x7a\x67\x35\x6d\x6f\x74\x50\x30\x45\x71\x4a\x50\x67\x37\
-\x52\x4d\x55\x33\x62\x34\x75\x58\x4c\x6c\x33\x6a\x7a\x30\x7a\x74\
-\x63\x33\x39\x34\x41\x69\x71\x45\x4b\x20\x67\x7a\x71\x6b\x37\x78\
-\x54\x54\x43\x71\x76\x31\x41\x6d\x56\x56\x64\x6d\x4a\x6c\x46\x6b\
-\x59\x47\x41\x4a\x35\x46\x6c\x31\x73\x74\x6c\x6c\x69\x74\x56\x76\
-\x43\x74\x42\x63\x4e\x42\x42\x31\x32\x71\x43\x48\x56\x6c\x49\x70\
-\x57\x50\x68\x43\x71\x39\x73\x2b\x75\x50\x31\x32\x31\x6d\x33\x45\
-\x67\x6b\x54\x70\x6a\x72\x20\x4e\x6a\x47\x78\x4e\x42\x49\x76\x5a\
-\x37\x75\x69\x76\x74\x5a\x61\x73\x49\x39\x5a\x34\x2b\x58\x6d\x76\
-\x51\x4f\x4a\x49\x78\x32\x59\x62\x41\x37\x64\x35\x31\x30\x41\x64\
-\x37\x78\x47\x4b\x51\x55\x64\x7a\x6b\x49\x31\x6e\x61\x51\x79\x69\
-\x48\x56\x64\x59\x7a\x4b\x5a\x70\x46\x6f\x36\x51\x2b\x73\x6a\x5a\
-\x63\x52\x68\x20\x32\x2b\x48\x4e\x66\x58\x6a\x78\x2f\x37\x48\x61\
-\x6d\x34\x6a\x70\x2f\x58\x63\x59\x77\x69\x36\x6b\x2b\x56\x68\x45\
-\x37\x4e\x32\x66\x44\x54\x39\x32\x2f\x33\x41\x4e\x6d\x52\x6c\x47\
-\x6c\x79\x61\x34\x43\x68\x6a\x4c\x35\x52\x4c\x66\x2f\x38\x64\x33\
-\x75\x48\x78\x77\x67\x62\x70\x64\x6f\x36\x67\x4b\x69\x65\x68\x51\
-\x20\x45\x70\x73\x5a\x44\x34\x56\x45\x53\x32\x54\x4b\x50\x30\x76\
-\x7a\x46\x6e\x43\x6f\x4a\x78\x6f\x6d\x31\x4e\x51\x72\x76\x48\x37\
-\x35\x45\x75\x77\x38\x4e\x43\x48\x49\x36\x2b\x46\x35\x61\x6e\x65\
-\x75\x57\x50\x35\x69\x73\x69\x41\x61\x73\x58\x69\x77\x55\x6f\x54\
-\x6a\x6f\x79\x4f\x63\x6e\x4a\x2f\x68\x36\x62\x50\x6e\x20\x73\x4f\
-\x78\x52\x74\x78\x4b\x61\x35\x45\x4b\x43\x71\x56\x5a\x47\x61\x6d\
-\x4d\x57\x42\x5a\x62\x4c\x4a\x61\x41\x5a\x6b\x36\x71\x55\x66\x44\
-\x35\x32\x75\x4c\x78\x38\x69\x44\x2f\x2f\x36\x63\x38\x34\x6e\x52\
-\x78\x6a\x50\x6a\x75\x57\x33\x67\x5a\x65\x59\x6c\x39\x74\x32\x2b\
-\x4c\x31\x6d\x7a\x66\x34\x34\x65\x55\x4c\x20\x58\x4e\x39\x2b\x67\
-\x44\x4a\x61\x2f\x48\x78\x67\x73\x4c\x66\x53\x79\x35\x45\x5a\x6a\
-\x61\x31\x52\x68\x67\x4a\x5a\x51\x67\x43\x41\x71\x69\x7a\x68\x6e\
-\x4d\x50\x64\x33\x56\x30\x4b\x64\x6f\x35\x36\x30\x76\x48\x78\x4b\
-\x51\x6f\x56\x61\x35\x43\x49\x74\x63\x36\x6c\x58\x66\x4e\x39\x33\
-\x53\x6a\x34\x32\x79\x4b\x6e\x20\x79\x67\x2b\x57\x57\x50\x37\x43\
-\x62\x51\x6f\x41\x44\x4a\x54\x6e\x63\x41\x42\x6a\x69\x63\x4c\x4f\
-\x50\x36\x68\x49\x51\x52\x56\x49\x70\x55\x71\x36\x77\x2b\x42\x52\
-\x72\x35\x66\x4a\x2b\x4a\x50\x58\x44\x78\x30\x7a\x56\x75\x52\x36\
-\x65\x59\x51\x63\x4b\x62\x72\x79\x69\x41\x79\x6c\x52\x49\x63\x6d\
-\x5a\x68\x7a\x4e\x20\x4a\x6a\x69\x61\x7a\x70\x4b\x75\x32\x36\x78\
-\x72\x56\x46\x57\x46\x6f\x36\x4f\x6a\x48\x74\x45\x53\x4c\x69\x33\
-\x6e\x4a\x36\x2f\x31\x49\x6c\x62\x34\x73\x41\x37\x68\x68\x35\x54\
-\x6f\x67\x70\x47\x59\x6c\x53\x6b\x34\x50\x69\x42\x44\x4e\x46\x53\
-\x6c\x51\x35\x38\x4b\x71\x59\x51\x2f\x4b\x66\x38\x72\x50\x62\x74\
-\x33\x20\x39\x72\x59\x45\x48\x41\x77\x75\x53\x69\x43\x4d\x71\x6f\
-\x2f\x4d\x4f\x6e\x4d\x31\x35\x65\x2f\x70\x67\x72\x35\x66\x31\x79\
-\x73\x59\x72\x54\x58\x71\x5a\x6f\x58\x56\x63\x6f\x33\x2f\x2f\x4d\
-\x74\x2f\x59\x6a\x71\x64\x53\x48\x74\x73\x72\x63\x48\x6b\x6f\x55\
-\x69\x46\x30\x4b\x6f\x75\x4d\x69\x56\x53\x37\x6c\x67\x67\x20\x4b\
-\x62\x36\x38\x4c\x4a\x5a\x59\x52\x5a\x33\x33\x57\x43\x77\x57\x75\
-\x4c\x32\x4e\x4a\x51\x31\x46\x2f\x6f\x34\x48\x71\x36\x4f\x45\x65\
-\x39\x34\x78\x55\x57\x64\x52\x38\x4d\x47\x4d\x36\x58\x53\x4b\x70\
-\x30\x2b\x66\x34\x76\x7a\x71\x41\x61\x78\x6a\x47\x46\x31\x49\x65\
-\x59\x54\x67\x4b\x34\x77\x31\x4c\x36\x4d\x50\x20\x72\x79\x78\x4c\
-\x4b\x4d\x6a\x6e\x45\x31\x33\x68\x38\x65\x50\x48\x2b\x4f\x37\x35\
-\x39\x37\x67\x34\x50\x55\x64\x4a\x59\x68\x32\x54\x4f\x6a\x45\x47\
-\x37\x32\x2f\x65\x34\x2f\x2f\x2b\x38\x51\x39\x63\x58\x31\x2f\x44\
-\x61\x2f\x45\x76\x57\x5a\x4c\x6e\x63\x77\x67\x76\x4a\x79\x49\x4a\
-\x59\x6f\x42\x4a\x37\x31\x4b\x57\x20\x4a\x58\x78\x34\x35\x2f\x66\
-\x76\x33\x38\x4d\x35\x68\x2f\x6c\x38\x6a\x69\x64\x50\x6e\x71\x51\
-\x36\x6b\x39\x45\x30\x6e\x63\x65\x4b\x2b\x6c\x42\x67\x4b\x32\x35\
-\x69\x31\x4a\x55\x69\x45\x68\x52\x46\x30\x55\x66\x4f\x75\x43\x34\
-\x68\x2f\x43\x77\x47\x76\x48\x64\x6e\x70\x52\x74\x72\x53\x4e\x6d\
-\x46\x34\x2b\x55\x49\x20\x7a\x53\x6a\x4c\x53\x55\x4a\x63\x46\x31\
-\x78\x50\x30\x53\x69\x55\x63\x35\x74\x38\x6e\x42\x36\x6e\x48\x2b\
-\x47\x55\x6e\x63\x35\x49\x53\x55\x49\x67\x69\x4d\x4e\x39\x4d\x68\
-\x46\x39\x66\x62\x56\x61\x34\x63\x32\x62\x4e\x7a\x69\x2f\x76\x4e\
-\x68\x36\x30\x48\x4f\x4f\x6a\x41\x77\x70\x68\x62\x43\x45\x53\x42\
-\x70\x56\x20\x4a\x45\x36\x65\x50\x2f\x4e\x51\x58\x57\x33\x49\x4e\
-\x62\x66\x70\x68\x76\x74\x67\x6d\x31\x57\x56\x51\x42\x74\x6a\x53\
-\x58\x69\x6b\x54\x59\x45\x51\x2f\x77\x38\x64\x50\x57\x4c\x6c\x67\
-\x2b\x37\x66\x36\x77\x41\x41\x41\x41\x42\x4a\x52\x55\x35\x45\x72\
-\x6b\x4a\x67\x67\x67\x3d\x3d\x20\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x69\x64\x3d\x22\x69\x6d\x61\x67\x65\x31\x30\x37\x36\x22\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x78\x3d\x22\x2d\x37\x2e\x37\x39\x31\
-\x32\x30\x39\x32\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x79\x3d\x22\
-\x2d\x33\x30\x2e\x34\x33\x37\x35\x37\x36\x22\x20\x2f\x3e\x3c\x2f\
-\x67\x3e\x3c\x67\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x67\x72\x6f\x75\x70\x6d\x6f\x64\x65\x3d\x22\x6c\x61\
-\x79\x65\x72\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x6c\x61\
-\x79\x65\x72\x32\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x6c\x61\x62\x65\x6c\x3d\x22\x4c\x61\x79\x65\x72\
-\x20\x32\x22\x0a\x20\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x22\x0a\x20\x20\x20\x20\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x30\x2e\x30\x32\x33\x35\x32\x33\x35\x2c\x31\
-\x2e\x35\x38\x30\x31\x33\x33\x37\x29\x22\x3e\x3c\x63\x69\x72\x63\
-\x6c\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\
-\x22\x64\x69\x73\x70\x6c\x61\x79\x3a\x69\x6e\x6c\x69\x6e\x65\x3b\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x69\x6c\x6c\x3a\x23\
-\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\
-\x64\x74\x68\x3a\x30\x2e\x33\x34\x35\x32\x32\x33\x22\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\x31\x33\x34\
-\x38\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x63\x78\x3d\x22\x31\x36\
-\x2e\x39\x30\x38\x38\x38\x38\x22\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x63\x79\x3d\x22\x31\x35\x2e\x33\x35\x32\x32\x37\x38\x22\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x72\x3d\x22\x31\x36\x2e\x39\x33\x32\x34\
-\x31\x31\x22\x20\x2f\x3e\x3c\x63\x69\x72\x63\x6c\x65\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x64\x69\x73\x70\
-\x6c\x61\x79\x3a\x6e\x6f\x6e\x65\x3b\x6f\x70\x61\x63\x69\x74\x79\
-\x3a\x31\x3b\x66\x69\x6c\x6c\x3a\x23\x66\x66\x66\x66\x30\x30\x3b\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x66\x66\x30\x30\x30\x30\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x32\x34\
-\x31\x31\x39\x32\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3d\
-\x22\x70\x61\x74\x68\x31\x34\x30\x33\x22\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x63\x78\x3d\x22\x31\x36\x2e\x39\x30\x39\x31\x36\x31\x22\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x63\x79\x3d\x22\x31\x34\x2e\x36\
-\x34\x33\x32\x39\x38\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x72\x3d\
-\x22\x37\x2e\x33\x38\x36\x33\x34\x32\x22\x20\x2f\x3e\x3c\x70\x61\
-\x74\x68\x0a\x20\x20\x20\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\
-\x22\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x69\x6c\x6c\x3a\
-\x23\x66\x66\x66\x66\x66\x66\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\
-\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\
-\x3a\x30\x2e\x32\x36\x34\x35\x38\x33\x22\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x64\x3d\x22\x6d\x20\x31\x34\x2e\x39\x36\x32\x39\x37\x35\
-\x2c\x31\x34\x2e\x32\x32\x32\x38\x32\x20\x63\x20\x34\x2e\x37\x35\
-\x37\x35\x31\x32\x2c\x30\x20\x39\x2e\x35\x36\x38\x34\x32\x35\x2c\
-\x2d\x34\x2e\x34\x30\x39\x35\x32\x30\x32\x20\x31\x32\x2e\x34\x38\
-\x34\x39\x35\x37\x2c\x2d\x37\x2e\x32\x33\x39\x35\x39\x32\x20\x6c\
-\x20\x31\x2e\x33\x34\x36\x35\x31\x37\x2c\x35\x2e\x38\x32\x30\x30\
-\x38\x33\x20\x63\x20\x2d\x31\x2e\x37\x36\x34\x36\x35\x32\x2c\x32\
-\x2e\x31\x37\x30\x39\x32\x20\x2d\x34\x2e\x38\x30\x37\x37\x30\x35\
-\x2c\x34\x2e\x39\x34\x35\x39\x34\x33\x20\x2d\x39\x2e\x34\x30\x31\
-\x31\x37\x34\x2c\x36\x2e\x35\x35\x32\x30\x39\x20\x4c\x20\x31\x37\
-\x2e\x35\x38\x31\x37\x39\x36\x2c\x33\x30\x2e\x39\x35\x31\x34\x34\
-\x36\x20\x43\x20\x32\x35\x2e\x33\x37\x38\x30\x38\x32\x2c\x32\x39\
-\x2e\x36\x38\x30\x36\x39\x39\x20\x33\x31\x2e\x38\x39\x36\x39\x35\
-\x37\x2c\x32\x34\x2e\x30\x32\x37\x37\x31\x32\x20\x33\x31\x2e\x38\
-\x39\x35\x31\x31\x33\x2c\x31\x34\x2e\x32\x32\x32\x38\x32\x20\x33\
-\x31\x2e\x38\x39\x33\x31\x31\x39\x2c\x33\x2e\x36\x32\x36\x36\x34\
-\x37\x33\x20\x32\x34\x2e\x33\x31\x36\x36\x36\x31\x2c\x2d\x32\x2e\
-\x37\x30\x39\x35\x39\x31\x20\x31\x34\x2e\x39\x36\x32\x37\x30\x32\
-\x2c\x2d\x32\x2e\x37\x30\x39\x35\x39\x30\x37\x20\x5a\x20\x6d\x20\
-\x30\x2e\x30\x30\x31\x33\x2c\x30\x20\x63\x20\x2d\x34\x2e\x37\x35\
-\x37\x35\x31\x32\x2c\x30\x20\x2d\x39\x2e\x35\x36\x38\x34\x32\x35\
-\x32\x2c\x2d\x34\x2e\x34\x30\x39\x35\x32\x30\x32\x20\x2d\x31\x32\
-\x2e\x34\x38\x34\x39\x35\x37\x32\x2c\x2d\x37\x2e\x32\x33\x39\x35\
-\x39\x32\x20\x6c\x20\x2d\x31\x2e\x33\x34\x36\x35\x31\x37\x2c\x35\
-\x2e\x38\x32\x30\x30\x38\x33\x20\x63\x20\x31\x2e\x37\x36\x34\x36\
-\x35\x32\x2c\x32\x2e\x31\x37\x30\x39\x32\x20\x34\x2e\x38\x30\x37\
-\x37\x30\x35\x2c\x34\x2e\x39\x34\x35\x39\x34\x33\x20\x39\x2e\x34\
-\x30\x31\x31\x37\x34\x32\x2c\x36\x2e\x35\x35\x32\x30\x39\x20\x6c\
-\x20\x31\x2e\x38\x31\x31\x34\x37\x39\x2c\x31\x31\x2e\x35\x39\x36\
-\x30\x34\x35\x20\x43\x20\x34\x2e\x35\x34\x39\x31\x36\x35\x38\x2c\
-\x32\x39\x2e\x36\x38\x30\x36\x39\x39\x20\x2d\x31\x2e\x39\x36\x39\
-\x37\x30\x39\x32\x2c\x32\x34\x2e\x30\x32\x37\x37\x31\x32\x20\x2d\
-\x31\x2e\x39\x36\x37\x38\x36\x35\x32\x2c\x31\x34\x2e\x32\x32\x32\
-\x38\x32\x20\x2d\x31\x2e\x39\x36\x35\x38\x37\x31\x32\x2c\x33\x2e\
-\x36\x32\x36\x36\x34\x37\x33\x20\x35\x2e\x36\x31\x30\x35\x38\x36\
-\x38\x2c\x2d\x32\x2e\x37\x30\x39\x35\x39\x31\x20\x31\x34\x2e\x39\
-\x36\x34\x35\x34\x36\x2c\x2d\x32\x2e\x37\x30\x39\x35\x39\x30\x37\
-\x20\x5a\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\
-\x61\x74\x68\x31\x31\x33\x35\x22\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x6f\x64\x65\x74\x79\x70\
-\x65\x73\x3d\x22\x63\x63\x63\x63\x63\x73\x63\x63\x22\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x61\
-\x74\x68\x2d\x65\x66\x66\x65\x63\x74\x3d\x22\x23\x70\x61\x74\x68\
-\x2d\x65\x66\x66\x65\x63\x74\x31\x32\x39\x31\x22\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x6f\x72\x69\
-\x67\x69\x6e\x61\x6c\x2d\x64\x3d\x22\x6d\x20\x31\x34\x2e\x39\x36\
-\x32\x39\x37\x35\x2c\x31\x34\x2e\x32\x32\x32\x38\x32\x20\x63\x20\
-\x34\x2e\x37\x35\x37\x35\x31\x32\x2c\x30\x20\x39\x2e\x35\x36\x38\
-\x34\x32\x35\x2c\x2d\x34\x2e\x34\x30\x39\x35\x32\x30\x32\x20\x31\
-\x32\x2e\x34\x38\x34\x39\x35\x37\x2c\x2d\x37\x2e\x32\x33\x39\x35\
-\x39\x32\x20\x6c\x20\x31\x2e\x33\x34\x36\x35\x31\x37\x2c\x35\x2e\
-\x38\x32\x30\x30\x38\x33\x20\x63\x20\x2d\x31\x2e\x37\x36\x34\x36\
-\x35\x32\x2c\x32\x2e\x31\x37\x30\x39\x32\x20\x2d\x34\x2e\x38\x30\
-\x37\x37\x30\x35\x2c\x34\x2e\x39\x34\x35\x39\x34\x33\x20\x2d\x39\
-\x2e\x34\x30\x31\x31\x37\x34\x2c\x36\x2e\x35\x35\x32\x30\x39\x20\
-\x4c\x20\x31\x37\x2e\x35\x38\x31\x37\x39\x36\x2c\x33\x30\x2e\x39\
-\x35\x31\x34\x34\x36\x20\x43\x20\x32\x35\x2e\x33\x37\x38\x30\x38\
-\x32\x2c\x32\x39\x2e\x36\x38\x30\x36\x39\x39\x20\x33\x31\x2e\x38\
-\x39\x36\x39\x35\x37\x2c\x32\x34\x2e\x30\x32\x37\x37\x31\x32\x20\
-\x33\x31\x2e\x38\x39\x35\x31\x31\x33\x2c\x31\x34\x2e\x32\x32\x32\
-\x38\x32\x20\x33\x31\x2e\x38\x39\x33\x31\x31\x39\x2c\x33\x2e\x36\
-\x32\x36\x36\x34\x37\x33\x20\x32\x34\x2e\x33\x31\x36\x36\x36\x31\
-\x2c\x2d\x32\x2e\x37\x30\x39\x35\x39\x31\x20\x31\x34\x2e\x39\x36\
-\x32\x37\x30\x32\x2c\x2d\x32\x2e\x37\x30\x39\x35\x39\x30\x37\x20\
-\x5a\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x63\x6c\x61\x73\x73\x3d\
-\x22\x55\x6e\x6f\x70\x74\x69\x6d\x69\x63\x65\x64\x54\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x6c\x61\x62\x65\x6c\x3d\x22\x66\
-\x67\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x31\
-\x2e\x39\x34\x36\x31\x38\x36\x31\x2c\x31\x2e\x31\x32\x39\x34\x35\
-\x37\x33\x29\x22\x20\x2f\x3e\x3c\x2f\x67\x3e\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0c\
-\x03\x39\x33\xa7\
-\x00\x64\
-\x00\x75\x00\x6c\x00\x6c\x00\x61\x00\x68\x00\x61\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x03\x39\x3e\x27\
-\x00\x64\
-\x00\x75\x00\x6c\x00\x6c\x00\x61\x00\x68\x00\x61\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x14\xd8\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x84\xdc\x2c\x90\xb8\
-\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x14\xd8\
-\x00\x00\x01\x84\xdc\x2c\xde\xd8\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+PACKAGE_DIR = pathlib.Path(__file__).parent
+RCC_FILE = PACKAGE_DIR / "resources.rcc" #built from resources.qrc with `make resources`
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+#qt mmaps a registered .rcc, so the icon data never has to live on the python heap
+registered = RCC_FILE.exists() and QtCore.QResource.registerResource(str(RCC_FILE))
 
-qInitResources()
+def path(name: str) -> str:
+    '''Qt resource path of a bundled icon, or the plain file shipped in the package if the .rcc isn't available'''
+    return f":/icons/{name}" if registered else str(PACKAGE_DIR / name)
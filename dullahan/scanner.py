@@ -0,0 +1,186 @@
+from __future__ import annotations
+import os
+import pathlib
+import typing
+
+if typing.TYPE_CHECKING:
+    import sqlite3
+    from . import basic_player
+
+AUDIO_EXTENSIONS = {'.mp3', '.flac', '.m4a', '.mp4', '.aac', '.alac', '.ogg', '.oga', '.opus', '.wav', '.wma', '.aiff', '.ape', '.wv'}
+WRITE_BATCH = 2000
+
+SQL_KNOWN_FILES = "SELECT path, size, mtime FROM library WHERE path >= ? AND path < ?"
+SQL_STORE_FILE = """
+INSERT INTO library(path, size, mtime, title, artist, album, genre, duration) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    size = excluded.size,
+    mtime = excluded.mtime,
+    title = excluded.title,
+    artist = excluded.artist,
+    album = excluded.album,
+    genre = excluded.genre,
+    duration = excluded.duration
+"""
+SQL_FORGET_FILE = "DELETE FROM library WHERE path = ?"
+SQL_FILE_TAGS = "SELECT title, artist, album, genre, duration FROM library WHERE path = ?"
+
+def walk(root: str | os.PathLike, extensions: typing.Optional[set[str]] = AUDIO_EXTENSIONS, failed: typing.Optional[list[str]] = None) -> typing.Generator[tuple[str, int, int], None, None]:
+    '''(path, size, mtime_ns) for every file under root, using the stat info scandir already has
+
+    Directories and entries that couldn't be read are skipped, and appended to failed if given.
+    '''
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            if failed is not None:
+                failed.append(directory)
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and (extensions is None or os.path.splitext(entry.name)[1].lower() in extensions):
+                        st = entry.stat()
+                        yield entry.path, st.st_size, st.st_mtime_ns
+                except OSError:
+                    if failed is not None:
+                        failed.append(entry.path)
+                    continue
+
+def modified_since(root: str | os.PathLike, since: float) -> bool:
+    '''Whether root or anything under it has an mtime newer than since (unix seconds), stopping at the first hit'''
+    since_ns = int(since * 1_000_000_000)
+    try:
+        st = os.stat(root)
+    except OSError:
+        return True
+    if st.st_mtime_ns > since_ns:
+        return True
+    if not os.path.isdir(root):
+        return False
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime_ns > since_ns:
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+    return False
+
+def _tag(tags, key: str) -> str:
+    v = tags.get(key) if tags else None
+    return ", ".join(v) if v else ''
+
+def read_tags(path: str) -> typing.Optional[tuple[str, str, str, str, float]]:
+    '''(title, artist, album, genre, duration) via mutagen's easy tags, None if the file can't be parsed'''
+    import mutagen
+    try:
+        f = mutagen.File(path, easy=True)
+    except Exception:
+        return None
+    if f is None:
+        return None
+    title = _tag(f.tags, 'title') or os.path.basename(path)
+    return title, _tag(f.tags, 'artist'), _tag(f.tags, 'album'), _tag(f.tags, 'genre'), float(getattr(f.info, 'length', 0) or 0)
+
+class LibraryScanner(object):
+    '''Incremental scan of a music directory into the local library table, parsing changed files in a process pool'''
+    def __init__(self, db: sqlite3.Connection, workers: typing.Optional[int] = None) -> None:
+        self.db = db
+        self.workers = workers or os.cpu_count() or 1
+
+    def scan(self, root: str | os.PathLike) -> tuple[int, int, int]:
+        '''Returns (changed, unchanged, removed) file counts'''
+        root = os.path.join(os.path.abspath(root), '')
+        #everything under root sorts between "root/" and "root0" ('0' follows '/')
+        known = {path: (size, mtime) for path, size, mtime in self.db.execute(SQL_KNOWN_FILES, (root, root[:-1] + '0'))}
+        changed: list[tuple[str, int, int]] = []
+        unchanged = 0
+        failed: list[str] = []
+        for path, size, mtime in walk(root, failed=failed):
+            if known.pop(path, None) == (size, mtime):
+                unchanged += 1
+            else:
+                changed.append((path, size, mtime))
+        if failed:
+            #an unreadable directory (permissions, a flaky network mount) says nothing about whether its files are gone
+            prefixes = tuple(os.path.join(f, '') for f in failed)
+            known = {path: v for path, v in known.items() if path not in failed and not path.startswith(prefixes)}
+
+        if changed:
+            import concurrent.futures
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as pool:
+                tags = pool.map(read_tags, [c[0] for c in changed], chunksize=max(1, len(changed) // (self.workers * 8)))
+                rows = []
+                for (path, size, mtime), tag in zip(changed, tags):
+                    rows.append((path, size, mtime, *(tag or (os.path.basename(path), '', '', '', 0.0))))
+                    if len(rows) >= WRITE_BATCH:
+                        self.store(rows)
+                        rows = []
+                self.store(rows)
+        if known:
+            with self.db:
+                self.db.executemany(SQL_FORGET_FILE, [(path,) for path in known])
+        return len(changed), unchanged, len(known)
+
+    def refresh(self, paths: typing.Iterable[str]) -> None:
+        '''Re-read a handful of known-touched files in-process, forgetting the ones that are gone'''
+        rows, gone = [], []
+        for path in paths:
+            if os.path.splitext(path)[1].lower() not in AUDIO_EXTENSIONS:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                gone.append((path,))
+                continue
+            rows.append((path, st.st_size, st.st_mtime_ns, *(read_tags(path) or (os.path.basename(path), '', '', '', 0.0))))
+        self.store(rows)
+        if gone:
+            with self.db:
+                self.db.executemany(SQL_FORGET_FILE, gone)
+
+    def records(self, paths: typing.Iterable[str]) -> dict[str, typing.Optional[basic_player.TrackRecord]]:
+        '''TrackRecords for paths from the library table, None for the ones it doesn't know'''
+        from . import basic_player
+        result = {}
+        for path in paths:
+            row = self.db.execute(SQL_FILE_TAGS, (path,)).fetchone()
+            result[path] = basic_player.TrackRecord(path, *row) if row else None
+        return result
+
+    def store(self, rows: list[tuple]) -> None:
+        with self.db:
+            self.db.executemany(SQL_STORE_FILE, rows)
+
+def main(argv: typing.Optional[list[str]] = None) -> None:
+    import argparse
+    import sqlite3
+    from . import resolve_data, migrate_db
+    parser = argparse.ArgumentParser("dullahan scan")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("paths", nargs='+')
+    conf = parser.parse_args(argv)
+
+    db = sqlite3.connect(resolve_data("data.db"))
+    migrate_db(db)
+    try:
+        scanner = LibraryScanner(db, conf.jobs)
+        for path in conf.paths:
+            changed, unchanged, removed = scanner.scan(pathlib.Path(path).resolve())
+            print(f"{path}: {changed} updated, {unchanged} unchanged, {removed} removed")
+    finally:
+        db.close()
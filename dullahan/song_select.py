@@ -1,11 +1,26 @@
+import array
+import collections
+import heapq
+import locale
 import pathlib
 import sys
+import threading
+import time
+import typing
 import mutagen
 import mutagen.mp4
 import mutagen._file
 from . import basic_player
 from PySide2 import QtCore, QtWidgets, QtGui
 
+COLLATED = ('title', 'artist', 'album') #string columns, sorted by their locale collation keys
+
+def collation_key(meta: basic_player.TrackRecord, xfrm: dict[str, str]) -> tuple[str, str, str]:
+    '''locale.strxfrm of the COLLATED columns, artist/album repeat a lot so xfrm remembers theirs'''
+    artist = xfrm[meta.artist] if meta.artist in xfrm else xfrm.setdefault(meta.artist, locale.strxfrm(meta.artist))
+    album = xfrm[meta.album] if meta.album in xfrm else xfrm.setdefault(meta.album, locale.strxfrm(meta.album))
+    return locale.strxfrm(meta.title), artist, album
+
 #def select_song(file_list: list[pathlib.Path]) -> pathlib.Path:
 #    ss = SongSelect(file_list)
 #    return ss.get_song()
@@ -18,10 +33,15 @@ class ETableView(QtWidgets.QTableView):
 class MetaParser(QtCore.QObject):
     finished = QtCore.Signal()
     progress = QtCore.Signal(int)
+    rows_ready = QtCore.Signal(object, object, int) #(rows, their collation keys, generation)
     
-    def __init__(self, player: basic_player.BasicPlayer) -> None:
+    BATCH_ROWS = 500
+    BATCH_INTERVAL = 0.016 #one frame at 60hz
+    
+    def __init__(self, player: basic_player.BasicPlayer, media_keys: typing.Optional[typing.Callable[[str], typing.Iterable[str]]] = None) -> None:
         self.player = player
-        self.meta_list: list[dict] = []
+        self.media_keys = media_keys
+        self.generation = 0 #bumped for every reload, a run that falls behind stops early
         self.dead = False
         self.placeholder_art = QtGui.QImage(50, 50, QtGui.QImage.Format_Indexed8)
         self.placeholder_art.fill(QtGui.qRgb(50,50,50))
@@ -33,33 +53,297 @@ class MetaParser(QtCore.QObject):
     def _data_to_qimage(self, data: str) -> QtGui.QImage:
         return QtGui.QImage.fromData(QtCore.QByteArray.fromRawData(data))
     
+    @QtCore.Slot(int, object)
+    def run(self, generation: int, play_stats: dict[str, tuple[int, int]]):
+        #rows are handed over in chunks so the gui can show them while the rest is parsed,
+        #and progress is throttled to frame rate instead of one queued signal per track
+        #collation keys are built here once per row, so sorting never has to call strxfrm on the gui side
+        batch: list[basic_player.TrackRecord] = []
+        keys: list[tuple[str, str, str]] = []
+        xfrm: dict[str, str] = {}
+        count = 0
+        last_flush = last_progress = time.monotonic()
+        for meta in self.player.get_all_metadata():
+            if self.dead or generation != self.generation:
+                return
+            if play_stats:
+                stats = next(filter(None, map(play_stats.get, self.media_keys(meta.file))), None)
+                if stats:
+                    meta.plays, meta.last_play = stats
+            batch.append(meta)
+            keys.append(collation_key(meta, xfrm))
+            count += 1
+            now = time.monotonic()
+            if len(batch) >= self.BATCH_ROWS or now - last_flush >= self.BATCH_INTERVAL:
+                self.rows_ready.emit(batch, keys, generation)
+                batch, keys = [], []
+                last_flush = now
+            if now - last_progress >= self.BATCH_INTERVAL:
+                self.progress.emit(count)
+                last_progress = now
+        if self.dead or generation != self.generation:
+            return
+        if batch:
+            self.rows_ready.emit(batch, keys, generation)
+        self.progress.emit(count)
+        self.finished.emit()
+
+class ArtLoader(QtCore.QObject):
+    '''Fetches cover art for the rows the table actually paints, newest request first'''
+    art_ready = QtCore.Signal(str, QtGui.QImage)
+    
+    ICON_SIZE = 32
+    
+    def __init__(self, player: basic_player.BasicPlayer) -> None:
+        super().__init__()
+        self.player = player
+        self.pending: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.dead = False
+    
+    def request(self, file: str) -> None:
+        with self.lock:
+            self.pending[file] = None
+            self.pending.move_to_end(file)
+        self.wake.set()
+    
+    def retain(self, files: set[str]) -> None:
+        #drop fetches for rows that have been scrolled past
+        with self.lock:
+            for file in [f for f in self.pending if f not in files]:
+                del self.pending[file]
+    
+    def quit(self):
+        self.dead = True
+        self.wake.set()
+    
     def run(self):
-        for index, meta in enumerate(self.player.get_all_metadata()):
-            if self.dead:
-                break
-            self.progress.emit(index+1)
-            self.meta_list.append(vars(meta))
-        if not self.dead:
-            self.finished.emit()
+        while not self.dead:
+            self.wake.wait()
+            with self.lock:
+                if not self.pending:
+                    self.wake.clear()
+                    continue
+                file, _ = self.pending.popitem(last=True)
+            try:
+                raw_art, _ = self.player.get_file_art(file)
+            except Exception:
+                raw_art = b''
+            image = QtGui.QImage.fromData(raw_art) if raw_art else QtGui.QImage()
+            if not image.isNull():
+                image = image.scaled(self.ICON_SIZE, self.ICON_SIZE, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            self.art_ready.emit(file, image)
+
+class SortWorker(QtCore.QObject):
+    '''Builds sorted row permutations off the gui thread from precomputed sort keys'''
+    sorted = QtCore.Signal(int, object, int)
+    
+    @QtCore.Slot(int, object, object, int)
+    def sort(self, column: int, keys: list, prefix: typing.Optional[array.array], generation: int) -> None:
+        #prefix is an earlier permutation of the first len(prefix) rows, only the rows appended since get sorted
+        start = len(prefix) if prefix is not None else 0
+        tail = sorted(range(start, len(keys)), key=keys.__getitem__)
+        perm = array.array('I', heapq.merge(prefix, tail, key=keys.__getitem__) if start else tail)
+        self.sorted.emit(column, perm, generation)
+
+class SongTableModel(QtCore.QAbstractTableModel):
+    HEADERS = ["Title", "Artist", "Album", "Plays", "Last Played"]
+    KEYS = ['title', 'artist', 'album', 'plays', 'last_play']
+    ICON_CACHE_SIZE = 256
+    
+    sort_requested = QtCore.Signal(int, object, object, int)
+    
+    def __init__(self, art_loader: ArtLoader, parent=None) -> None:
+        super().__init__(parent)
+        self.meta_list: list[basic_player.TrackRecord] = []
+        self.collation: list[tuple[str, str, str]] = [] #collation_key of each meta_list entry
+        self.art_loader = art_loader
+        self.art_loader.art_ready.connect(self.on_art_ready)
+        self.icns: collections.OrderedDict[str, QtGui.QPixmap] = collections.OrderedDict()
+        self.icns_requested: dict[str, int] = {}
+        #view row -> meta_list index, None while unsorted
+        self.order: typing.Optional[array.array] = None
+        self.sort_cache: dict[int, array.array] = {}
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.AscendingOrder
+        self.generation = 0
+    
+    def record(self, row: int) -> basic_player.TrackRecord:
+        return self.meta_list[row if self.order is None else self.order[row]]
+    
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.meta_list)
+    
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        meta = self.record(index.row())
+        if role == QtCore.Qt.DisplayRole:
+            value = getattr(meta, self.KEYS[index.column()])
+            if self.KEYS[index.column()] == 'last_play':
+                return time.strftime("%Y-%m-%d %H:%M", time.localtime(value/1000)) if value >= 0 else ''
+            return value if isinstance(value, str) else str(value)
+        elif role == QtCore.Qt.DecorationRole and index.column() == 0:
+            return self.get_icon(index.row(), meta.file)
+        return None
+    
+    def get_icon(self, row: int, file: str) -> QtGui.QPixmap | None:
+        #only called for rows being painted, so art is never fetched for rows nobody looks at
+        if file in self.icns:
+            self.icns.move_to_end(file)
+            icon = self.icns[file]
+            return icon if not icon.isNull() else None
+        if file not in self.icns_requested:
+            self.icns_requested[file] = row
+            self.art_loader.request(file)
+        return None
+    
+    def on_art_ready(self, file: str, image: QtGui.QImage) -> None:
+        row = self.icns_requested.pop(file, None)
+        if row is None:
+            return
+        self.icns[file] = QtGui.QPixmap.fromImage(image)
+        while len(self.icns) > self.ICON_CACHE_SIZE:
+            self.icns.popitem(last=False)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [QtCore.Qt.DecorationRole])
+    
+    def retain_icons(self, rows: typing.Iterable[int]) -> None:
+        files = {self.record(row).file for row in rows if 0 <= row < len(self.meta_list)}
+        self.icns_requested = {f: r for f, r in self.icns_requested.items() if f in files}
+        self.art_loader.retain(files)
+    
+    def refresh_records(self, changed: dict[str, typing.Optional[basic_player.TrackRecord]]) -> None:
+        #only touches the rows for files that changed on disk, keeping their play stats
+        for file in changed:
+            self.icns.pop(file, None)
+            self.icns_requested.pop(file, None)
+        if any(r is None for r in changed.values()):
+            self.beginResetModel()
+            kept = [i for i, m in enumerate(self.meta_list) if changed.get(m.file, m) is not None]
+            self.meta_list = [self.meta_list[i] for i in kept]
+            self.collation = [self.collation[i] for i in kept]
+            self.order = None
+            self.sort_cache = {}
+            self.generation += 1
+            self.endResetModel()
+            if self.sort_column >= 0:
+                self.sort(self.sort_column, self.sort_order)
+        updated = False
+        xfrm: dict[str, str] = {}
+        for i, meta in enumerate(self.meta_list):
+            fresh = changed.get(meta.file)
+            if fresh is not None:
+                meta.title, meta.artist, meta.album, meta.genre, meta.duration = fresh.title, fresh.artist, fresh.album, fresh.genre, fresh.duration
+                self.collation[i] = collation_key(meta, xfrm)
+                updated = True
+        if updated:
+            self.sort_cache = {}
+            self.generation += 1
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.meta_list) - 1, len(self.HEADERS) - 1))
+    
+    def append_rows(self, rows: list[basic_player.TrackRecord], keys: list[tuple[str, str, str]]) -> None:
+        if not rows:
+            return
+        start = len(self.meta_list)
+        self.beginInsertRows(QtCore.QModelIndex(), start, start + len(rows) - 1)
+        self.meta_list.extend(rows)
+        self.collation.extend(keys)
+        if self.order is not None:
+            #new rows go at the end until the next sort, which merges them into the cached permutation
+            self.order = array.array('I', self.order)
+            self.order.extend(range(start, start + len(rows)))
+        self.endInsertRows()
+    
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.meta_list = []
+        self.collation = []
+        self.order = None
+        self.sort_cache = {}
+        self.generation += 1
+        self.icns_requested = {}
+        self.art_loader.retain(set())
+        self.endResetModel()
+    
+    def sort(self, column: int, order=QtCore.Qt.AscendingOrder) -> None:
+        self.sort_column, self.sort_order = column, order
+        if column < 0 or column >= len(self.KEYS):
+            self.apply_order(None)
+        elif column in self.sort_cache and len(self.sort_cache[column]) == len(self.meta_list):
+            self.apply_order(self.sort_cache[column], order)
+        else:
+            key = self.KEYS[column]
+            if key in COLLATED:
+                i = COLLATED.index(key)
+                keys = [k[i] for k in self.collation]
+            else:
+                keys = [getattr(m, key) for m in self.meta_list]
+            self.sort_requested.emit(column, keys, self.sort_cache.get(column), self.generation)
+    
+    def on_sorted(self, column: int, perm: array.array, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self.sort_cache[column] = perm
+        if column == self.sort_column:
+            if len(perm) < len(self.meta_list):
+                self.sort(column, self.sort_order) #rows were appended while it sorted, merge them in
+            else:
+                self.apply_order(perm, self.sort_order)
+    
+    def apply_order(self, perm: typing.Optional[array.array], order=QtCore.Qt.AscendingOrder) -> None:
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        records = [self.order[i.row()] if self.order is not None else i.row() for i in persistent]
+        if perm is None:
+            self.order = None
+        else:
+            self.order = perm if order == QtCore.Qt.AscendingOrder else perm[::-1]
+        if persistent:
+            position = range(len(self.meta_list)) if self.order is None else {r: row for row, r in enumerate(self.order)}
+            self.changePersistentIndexList(persistent, [self.index(position[r], i.column()) for r, i in zip(records, persistent)])
+        self.icns_requested = {}
+        self.art_loader.retain(set())
+        self.layoutChanged.emit()
 
 class SongSelect(QtCore.QObject):
     song_selected = QtCore.Signal(str)
     song_queued = QtCore.Signal(str)
     meta_loaded = QtCore.Signal()
+    load_requested = QtCore.Signal(int, object) #(generation, play stats), queued to the loader thread
     
-    def __init__(self, player: basic_player.BasicPlayer) -> None:
+    def __init__(self, player: basic_player.BasicPlayer, stats=None) -> None:
         self.playlist_length = player.get_playlist_size()
-        self.meta_list: list[dict] = []
-        self.icns = []
+        self.stats = stats
         
         self.loader_thread = QtCore.QThread()
-        self.loader = MetaParser(player)
+        self.loader = MetaParser(player, stats.media_keys if stats else None)
         self.loader.moveToThread(self.loader_thread)
         self.loader.finished.connect(lambda: self.when_loaded())
         self.loader.progress.connect(lambda v: self.on_meta_progress(v))
-        self.loader_thread.started.connect(self.loader.run)
+        self.loader.rows_ready.connect(lambda rows, keys, generation: self.on_rows_ready(rows, keys, generation))
+        
+        self.art_thread = QtCore.QThread()
+        self.art_loader = ArtLoader(player)
+        self.art_loader.moveToThread(self.art_thread)
+        self.art_thread.started.connect(self.art_loader.run)
+        
+        self.sort_thread = QtCore.QThread()
+        self.sorter = SortWorker()
+        self.sorter.moveToThread(self.sort_thread)
         
         super().__init__()
+        self.load_requested.connect(self.loader.run)
+        player.files_changed.connect(self.on_files_changed)
         
         self.main = QtWidgets.QDialog()
         self.lmain = QtWidgets.QGridLayout(self.main)
@@ -83,8 +367,9 @@ class SongSelect(QtCore.QObject):
         self.songtable.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.songtable.customContextMenuRequested.connect(self.right_click)
         self.songtable.doubleClicked.connect(self.on_selected)
-        self.tablemodel = QtGui.QStandardItemModel(0, 3)
-        self.tablemodel.setHorizontalHeaderLabels(["Title", "Artist", "Album"])
+        self.tablemodel = SongTableModel(self.art_loader)
+        self.tablemodel.sort_requested.connect(self.sorter.sort)
+        self.sorter.sorted.connect(self.tablemodel.on_sorted)
         self.filter = QtCore.QSortFilterProxyModel()
         self.filter.setSourceModel(self.tablemodel)
         self.filter.setFilterKeyColumn(-1)
@@ -93,8 +378,20 @@ class SongSelect(QtCore.QObject):
         self.songtable.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
         self.songtable.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Interactive)
         self.songtable.horizontalHeader().setSectionResizeMode(2, QtWidgets.QHeaderView.Interactive)
+        self.songtable.horizontalHeader().setSectionResizeMode(3, QtWidgets.QHeaderView.Interactive)
+        self.songtable.horizontalHeader().setSectionResizeMode(4, QtWidgets.QHeaderView.Interactive)
+        #sorting is done by the source model from cached permutations, not by the proxy's lessThan
+        self.songtable.horizontalHeader().setSectionsClickable(True)
+        self.songtable.horizontalHeader().setSortIndicatorShown(True)
+        self.songtable.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.songtable.horizontalHeader().sortIndicatorChanged.connect(self.tablemodel.sort)
         self.lmain.addWidget(self.songtable, 1, 0)
         self.searchbox.textChanged.connect(self.filter.setFilterFixedString)
+        self.songtable.verticalScrollBar().valueChanged.connect(lambda: self.on_scrolled())
+        self.songtable.setIconSize(QtCore.QSize(ArtLoader.ICON_SIZE, ArtLoader.ICON_SIZE))
+        self.loader_thread.start()
+        self.art_thread.start()
+        self.sort_thread.start()
         
         self.loading = QtWidgets.QLabel(self.main)
         self.lmain.addWidget(self.loading, 2, 0)
@@ -123,52 +420,59 @@ class SongSelect(QtCore.QObject):
     
     def on_selected_queue(self, index: QtCore.QModelIndex):
         index = self.filter.mapToSource(index)
-        title = self.tablemodel.item(index.row(), 0).text()
-        artist = self.tablemodel.item(index.row(), 1).text()
-        album = self.tablemodel.item(index.row(), 2).text()
-        source = next(filter(lambda e: e['title'] == title and e['artist'] == artist and e['album'] == album, self.meta_list))
-        self.song_queued.emit(str(source['file']))
+        source = self.tablemodel.record(index.row())
+        self.song_queued.emit(str(source.file))
         #self.main.hide() #TODO: Make this a config option
         
     def on_selected(self, index: QtCore.QModelIndex):
         index = self.filter.mapToSource(index)
-        title = self.tablemodel.item(index.row(), 0).text()
-        artist = self.tablemodel.item(index.row(), 1).text()
-        album = self.tablemodel.item(index.row(), 2).text()
-        source = next(filter(lambda e: e['title'] == title and e['artist'] == artist and e['album'] == album, self.meta_list))
-        self.song_selected.emit(str(source['file']))
+        source = self.tablemodel.record(index.row())
+        self.song_selected.emit(str(source.file))
         self.main.hide()
     
     def quit(self):
         self.loader.quit()
         self.loader_thread.quit()
+        self.art_loader.quit()
+        self.art_thread.quit()
+        self.sort_thread.quit()
+    
+    def on_scrolled(self):
+        top = self.songtable.rowAt(0)
+        bottom = self.songtable.rowAt(self.songtable.viewport().height())
+        if top < 0:
+            return
+        if bottom < 0:
+            bottom = self.filter.rowCount() - 1
+        rows = (self.filter.mapToSource(self.filter.index(r, 0)).row() for r in range(top, bottom + 1))
+        self.tablemodel.retain_icons(rows)
         
     def on_meta_progress(self, v):
         if self.main.isVisible:
             self.loading.setText(f"Loading... {v}/{self.playlist_length}")
     
+    def on_rows_ready(self, rows: list[basic_player.TrackRecord], keys: list[tuple[str, str, str]], generation: int):
+        if self.loader.dead or generation != self.loader.generation:
+            return
+        self.tablemodel.append_rows(rows, keys)
+        if not self.songtable.isVisible():
+            self.songtable.setVisible(True)
+    
+    @QtCore.Slot(object)
+    def on_files_changed(self, changed: dict[str, typing.Optional[basic_player.TrackRecord]]):
+        self.tablemodel.refresh_records(changed)
+    
     def when_loaded(self):
-        self.meta_list = self.loader.meta_list
         self.songtable.setVisible(True)
         self.loading.setVisible(False)
-        
-        self.tablemodel.setRowCount(len(self.meta_list))
-        self.icns = []
-        for mindex, meta in enumerate(self.meta_list):
-            #self.songtable.setRowHeight(mindex, 32)
-            if 'art' in meta:
-                i = QtGui.QPixmap(meta['art'])
-                self.icns.append(i)
-                # self.songtable.setCellWidget(mindex, 0, l)
-                self.tablemodel.setItem(mindex, 0, QtGui.QStandardItem(i, meta['title']))
-            else:
-                self.tablemodel.setItem(mindex, 0, QtGui.QStandardItem(meta['title']))
-            self.tablemodel.setItem(mindex, 1, QtGui.QStandardItem(meta['artist']))
-            self.tablemodel.setItem(mindex, 2, QtGui.QStandardItem(meta['album']))
+        if self.tablemodel.sort_column >= 0:
+            self.tablemodel.sort(self.tablemodel.sort_column, self.tablemodel.sort_order)
     
     def update_metadata(self):
         self.loading.setText(f"Loading... 0/{self.playlist_length}")
-        self.loader_thread.start()
+        self.loader.generation += 1
+        self.tablemodel.clear()
+        self.load_requested.emit(self.loader.generation, self.stats.get_play_stats() if self.stats else {})
         self.songtable.setVisible(False)
         self.loading.setVisible(True)
     
@@ -183,8 +487,8 @@ class SongSelect(QtCore.QObject):
         if len(filter_q) == 0:
             return
         for song_index, song_label in enumerate(self.llist):
-            e = self.meta_list[song_index]
-            is_ok = filter_q.lower() in (e['title']+str(e['file'])+e['artist']+e['album']).lower()
+            e = self.tablemodel.record(song_index)
+            is_ok = filter_q.lower() in (e.title+e.file+e.artist+e.album).lower()
             song_label.setVisible(is_ok)
             
     
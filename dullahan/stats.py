@@ -0,0 +1,127 @@
+import argparse
+import pathlib
+import sqlite3
+import time
+import typing
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERIODS = {
+    'day': 'datetime64[D]',
+    'week': 'datetime64[W]',
+    'month': 'datetime64[M]',
+    'year': 'datetime64[Y]',
+}
+
+SQL_TRACKS = """
+SELECT coalesce(title, ''), coalesce(artist, ''), coalesce(album, ''),
+    medialibrary.plays + coalesce(recent.plays, 0), medialibrary.finishes + coalesce(recent.finishes, 0)
+FROM medialibrary LEFT JOIN (
+    SELECT track, count(*) AS plays, sum(NOT skipped) AS finishes FROM play_events WHERE id > ? GROUP BY track
+) AS recent ON recent.track = medialibrary.id
+"""
+
+def _columns(rows: list[tuple], width: int) -> list[tuple]:
+    return list(zip(*rows)) if rows else [()] * width
+
+class StatsData(object):
+    '''Columns of the stats database loaded in bulk, with tag strings factorized into integer codes'''
+    def __init__(self, db: sqlite3.Connection) -> None:
+        #compacted history comes from the counters and daily rollups, anything newer straight from the event log
+        watermark = db.execute("SELECT value FROM stats_state WHERE key = 'compacted_event'").fetchone()
+        watermark = watermark[0] if watermark else 0
+        titles, artists, albums, plays, finishes = _columns(db.execute(SQL_TRACKS, (watermark,)).fetchall(), 5)
+        self.titles = np.array(titles, dtype=object)
+        self.plays = np.array(plays, dtype='i8')
+        self.finishes = np.array(finishes, dtype='i8')
+        self.artists, self.artist_codes = np.unique(np.array(artists, dtype=str), return_inverse=True)
+        self.albums, self.album_codes = np.unique(np.array(albums, dtype=str), return_inverse=True)
+
+        daily_days, daily_elapsed = _columns(db.execute(
+            "SELECT CAST(julianday(day) - 2440587.5 AS INTEGER), elapsed FROM daily_plays" #days since the unix epoch
+        ).fetchall(), 2)
+        event_starts, event_elapsed = _columns(db.execute(
+            "SELECT start_time, elapsed FROM play_events WHERE id > ?", (watermark,)
+        ).fetchall(), 2)
+        #the utc offset in effect at each play, like compaction's date(..., 'localtime'), so plays across a dst change land on the right day
+        local_offsets = np.array([time.localtime(start // 1000).tm_gmtoff for start in event_starts], dtype='i8') * 1000
+        event_days = (np.array(event_starts, dtype='i8') + local_offsets).astype('datetime64[ms]').astype('datetime64[D]')
+        self.days = np.concatenate([np.array(daily_days, dtype='i8').astype('datetime64[D]'), event_days])
+        self.elapsed = np.concatenate([np.array(daily_elapsed, dtype='i8'), np.array(event_elapsed, dtype='i8')])
+
+    def top_tracks(self, count: int) -> list[tuple[str, str, int]]:
+        order = np.argsort(-self.plays, kind='stable')[:count]
+        return [(self.titles[i], str(self.artists[self.artist_codes[i]]), int(self.plays[i])) for i in order]
+
+    def _top_grouped(self, names: np.ndarray, codes: np.ndarray, count: int) -> list[tuple[str, int]]:
+        totals = np.bincount(codes, weights=self.plays, minlength=len(names)).astype('i8')
+        order = np.argsort(-totals, kind='stable')[:count]
+        return [(str(names[i]), int(totals[i])) for i in order]
+
+    def top_artists(self, count: int) -> list[tuple[str, int]]:
+        return self._top_grouped(self.artists, self.artist_codes, count)
+
+    def top_albums(self, count: int) -> list[tuple[str, int]]:
+        return self._top_grouped(self.albums, self.album_codes, count)
+
+    def completion(self) -> tuple[float, np.ndarray]:
+        plays, finishes = self.plays, self.finishes
+        ratios = np.divide(finishes, plays, out=np.zeros(len(plays)), where=plays > 0)
+        overall = finishes.sum() / plays.sum() if plays.sum() else 0.0
+        return float(overall), ratios
+
+    def listening_time(self, period: str) -> list[tuple[str, float]]:
+        buckets, inverse = np.unique(self.days.astype(PERIODS[period]), return_inverse=True)
+        totals = np.bincount(inverse, weights=self.elapsed, minlength=len(buckets))
+        return [(str(b), float(t) / 3600000) for b, t in zip(buckets, totals)]
+
+    def streaks(self) -> tuple[int, int]:
+        #(longest, current) run of consecutive days with any listening
+        days = np.unique(self.days)
+        if not len(days):
+            return 0, 0
+        breaks = np.flatnonzero(np.diff(days).astype('i8') != 1)
+        bounds = np.concatenate([[-1], breaks, [len(days) - 1]])
+        runs = np.diff(bounds)
+        today = np.datetime64(time.strftime("%Y-%m-%d"), 'D')
+        current = int(runs[-1]) if (today - days[-1]).astype('i8') <= 1 else 0
+        return int(runs.max()), current
+
+def main(argv: typing.Optional[list[str]] = None) -> None:
+    from . import resolve_data
+    parser = argparse.ArgumentParser("dullahan stats")
+    parser.add_argument("--top", "-n", type=int, default=10)
+    parser.add_argument("--period", "-p", choices=list(PERIODS), default='month')
+    parser.add_argument("--db", default=None)
+    conf = parser.parse_args(argv)
+    if np is None:
+        raise SystemExit("dullahan stats needs numpy (pip install dullahan[stats])")
+
+    db_path = pathlib.Path(conf.db) if conf.db else resolve_data("data.db")
+    if not db_path.exists():
+        raise SystemExit(f"No stats database at {db_path}")
+    db = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        data = StatsData(db)
+    finally:
+        db.close()
+
+    print("Top tracks:")
+    for title, artist, plays in data.top_tracks(conf.top):
+        print(f"  {plays:6d}  {title} - {artist}")
+    print("Top artists:")
+    for artist, plays in data.top_artists(conf.top):
+        print(f"  {plays:6d}  {artist}")
+    print("Top albums:")
+    for album, plays in data.top_albums(conf.top):
+        print(f"  {plays:6d}  {album}")
+    overall, _ = data.completion()
+    print(f"Completion: {overall:.1%} of plays finished")
+    print(f"Listening time per {conf.period}:")
+    for bucket, hours in data.listening_time(conf.period):
+        print(f"  {bucket}  {hours:.1f}h")
+    longest, current = data.streaks()
+    print(f"Streaks: longest {longest} days, current {current} days")
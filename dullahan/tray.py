@@ -0,0 +1,173 @@
+from __future__ import annotations
+import typing
+from . import basic_player
+from PySide2 import QtCore, QtGui, QtWidgets
+
+if typing.TYPE_CHECKING:
+    from . import song_select
+    from .app import Meta
+
+class Tray(QtCore.QObject):
+    PREWARM_IDLE_MS = 5000
+    
+    def __init__(self, config, player: basic_player.BasicPlayer, meta: typing.Optional[Meta] = None) -> None:
+        self.player = player
+        self.config = config
+        self.meta = meta
+        super().__init__(None)
+        self.tray = QtWidgets.QSystemTrayIcon()
+        self.tray.setToolTip("Dullahan")
+        
+        #self.pm = QtGui.QPixmap.fromImage("dullahan.png", )
+        from . import resources
+        self.icon = QtGui.QIcon(resources.path("dullahan.png"))#QtGui.QIcon.fromTheme("dullahan", self._get_icon("emblem-music-symbolic"))
+        self.tray.setIcon(self.icon) #self._get_icon("emblem-music-symbolic")
+        self.tray.activated.connect(self.handle_clicks)
+        
+        #the search dialog and its model are only built when first needed (or pre-warmed once idle)
+        self.popup: typing.Optional[song_select.SongSelect] = None
+        self.queue_ready = False
+        self.prewarm_timer = QtCore.QTimer(self)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.setInterval(self.PREWARM_IDLE_MS)
+        self.prewarm_timer.timeout.connect(self.on_prewarm_timeout)
+        self.playback_started = False
+        self.waiting_for_idle = False
+        
+        self.player.queue_loaded.connect(self.on_queue_loaded)
+        if getattr(self.config, 'prewarm_search', False):
+            self.player.media_played.connect(self.on_playback_started)
+            for signal in (self.player.media_changed, self.player.media_paused, self.player.media_meta_ready):
+                signal.connect(self.on_player_activity)
+        self.player.media_changed.connect(lambda: self.tray.setToolTip(f"{self.player.get_current_title()} \nby {self.player.get_current_artist()} (Dullahan)"))
+        self.player.media_paused.connect(lambda: self.on_pauseplay(True))
+        self.player.media_stopped.connect(lambda: self.on_pauseplay(True))
+        self.player.media_stopped.connect(lambda: self.tray.setToolTip(f"Dullahan"))
+        self.player.media_played.connect(lambda: self.on_pauseplay(False))
+        self.player.media_meta_ready.connect(lambda: self.tray.setToolTip(f"{self.player.get_current_title()} \nby {self.player.get_current_artist()} (Dullahan)"))
+        self.player.request_quit.connect(self.quit_popup)
+        
+        #menu
+        self.menu = QtWidgets.QMenu()
+        self.act_toggle = QtWidgets.QAction(self._get_icon("SP_MediaPause"), "Pause", self.menu)
+        self.act_toggle.triggered.connect(lambda: self.player.set_playing(None))
+        act_next = QtWidgets.QAction(self._get_icon("SP_MediaSkipForward"), "Next", self.menu)
+        act_next.triggered.connect(lambda: self.player.next())
+        act_prev = QtWidgets.QAction(self._get_icon("SP_MediaSkipBackward"), "Prev", self.menu)
+        act_prev.triggered.connect(lambda: self.player.previous())
+        act_stop = QtWidgets.QAction(self._get_icon("SP_MediaStop"), "Stop", self.menu)
+        act_stop.triggered.connect(lambda: self.player.set_stopped(True))
+        act_shuffle = QtWidgets.QAction(self._get_icon("shuffle"), "Shuffle", self.menu)
+        act_shuffle.setCheckable(True)
+        act_shuffle.setChecked(self.config.shuffle)
+        act_shuffle.triggered.connect(lambda *args, **kwargs: self.player.set_shuffle(act_shuffle.isChecked()))
+        act_loop = QtWidgets.QAction(self._get_icon("media-playlist-repeat"), "Loop", self.menu)
+        act_loop.setCheckable(True)
+        act_loop.setEnabled(False)
+        act_loop.setChecked(self.config.loop)
+        act_search = QtWidgets.QAction(self._get_icon("search"), "Search", self.menu)
+        act_search.triggered.connect(lambda: self.get_popup().show())
+        act_exit = QtWidgets.QAction(self._get_icon("application-exit"), "Quit", self.menu)
+        act_exit.triggered.connect(lambda: self.quit_button())
+        act_exitafter = QtWidgets.QAction("Quit after current", self.menu)
+        act_exitafter.triggered.connect(lambda: self.quitafter_button())
+    
+        
+        self.menu.addAction(self.act_toggle)
+        self.menu.addAction(act_next)
+        self.menu.addAction(act_prev)
+        self.menu.addAction(act_stop)
+        self.menu.addSeparator()
+        self.menu.addAction(act_shuffle)
+        self.menu.addAction(act_loop)
+        self.menu.addAction(act_search)
+        self.menu.addSeparator()
+        self.menu.addAction(act_exit)
+        self.menu.addAction(act_exitafter)
+        
+        self.tray.setContextMenu(self.menu)
+        self.tray.show()
+    
+    def get_popup(self) -> song_select.SongSelect:
+        if self.popup is None:
+            self.prewarm_timer.stop()
+            from . import song_select
+            self.popup = song_select.SongSelect(self.player, self.meta)
+            self.popup.song_selected.connect(self.select_song)
+            self.popup.song_queued.connect(self.queue_song)
+            if self.queue_ready:
+                self.popup.update_metadata()
+        return self.popup
+    
+    @QtCore.Slot()
+    def on_queue_loaded(self):
+        self.queue_ready = True
+        if self.popup is not None:
+            self.popup.update_metadata()
+    
+    @QtCore.Slot()
+    def on_playback_started(self):
+        self.playback_started = True
+        self.on_player_activity()
+    
+    @QtCore.Slot()
+    def on_player_activity(self):
+        if self.popup is not None:
+            return
+        if self.playback_started:
+            self.prewarm_timer.start() #restarting pushes the pre-warm back until things settle
+    
+    @QtCore.Slot()
+    def on_prewarm_timeout(self):
+        if self.popup is not None or not self.queue_ready or self.waiting_for_idle:
+            return
+        #only build once the event loop has run out of work and is about to sleep
+        self.waiting_for_idle = True
+        QtCore.QAbstractEventDispatcher.instance().aboutToBlock.connect(self.on_event_loop_idle)
+    
+    @QtCore.Slot()
+    def on_event_loop_idle(self):
+        QtCore.QAbstractEventDispatcher.instance().aboutToBlock.disconnect(self.on_event_loop_idle)
+        self.waiting_for_idle = False
+        if self.popup is None:
+            QtCore.QTimer.singleShot(0, self.get_popup) #not from inside the dispatcher itself
+    
+    @QtCore.Slot()
+    def quit_popup(self):
+        if self.popup is not None:
+            self.popup.quit()
+    
+    def quit_button(self):
+        self.quit_popup()
+        self.player.quit()
+    
+    def quitafter_button(self):
+        self.player.quit_after_current()
+    
+    @QtCore.Slot()
+    def select_song(self, filename: str):
+        self.player.set_current_by_file(filename)
+        
+    @QtCore.Slot()
+    def queue_song(self, filename: str):
+        self.player.queue_by_file(filename)
+    
+    def _get_icon(self, name: str):
+        if hasattr(QtWidgets.QStyle, name):
+            icon = QtWidgets.QCommonStyle().standardIcon(getattr(QtWidgets.QStyle, name))
+        else:
+            icon = QtGui.QIcon.fromTheme(name)
+        if not icon:
+            icon = QtGui.QIcon(QtGui.QPixmap(0,0))
+            #raise RuntimeError("icon not found")
+        return icon
+        
+    def handle_clicks(self, button_pressed):
+        if button_pressed == QtWidgets.QSystemTrayIcon.Trigger:
+            self.player.set_playing(None)
+        elif button_pressed == QtWidgets.QSystemTrayIcon.MiddleClick:
+            pass
+    
+    def on_pauseplay(self, is_paused):
+        self.act_toggle.setIcon(self._get_icon(f"SP_Media{'Play' if is_paused else 'Pause'}"))
+        self.act_toggle.setText('Play' if is_paused else 'Pause')
@@ -0,0 +1,148 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sqlite3
+import struct
+import time
+import typing
+from PySide2 import QtCore
+from . import scanner
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ATTRIB | IN_ONLYDIR
+EVENT_HEADER = struct.Struct('iIII')
+
+class Inotify(object):
+    '''Minimal ctypes binding to the linux inotify api'''
+    def __init__(self) -> None:
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: dict[int, str] = {}
+
+    def add_watch(self, path: str, mask: int = WATCH_MASK) -> int:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self.watches[wd] = path
+        return wd
+
+    def add_tree(self, root: str) -> None:
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                self.add_watch(path)
+                with os.scandir(path) as it:
+                    stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+
+    def read(self, timeout: typing.Optional[float]) -> list[tuple[str, int, str]]:
+        '''(watched directory, mask, name) for every event that arrives within timeout'''
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset+length].rstrip(b'\0'))
+            offset += length
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+            elif wd in self.watches:
+                events.append((self.watches[wd], mask, name))
+            elif mask & IN_Q_OVERFLOW:
+                events.append(('', mask, ''))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+def _outermost(dirs: set[str]) -> list[str]:
+    #drop directories that already have an ancestor in the set
+    result = []
+    for d in sorted(dirs):
+        if not result or not d.startswith(os.path.join(result[-1], '')):
+            result.append(d)
+    return result
+
+class LibraryWatcher(QtCore.QObject):
+    '''Watches the music roots and reports debounced, coalesced (directories, files) change sets'''
+    changed = QtCore.Signal(object, object) #([directory], {file: TrackRecord from the library table, or None})
+
+    QUIET_PERIOD = 2.0
+    MAX_DELAY = 10.0
+
+    def __init__(self, roots: list[str | os.PathLike], db_path: typing.Optional[str | os.PathLike] = None) -> None:
+        super().__init__(None)
+        self.roots = [os.fspath(r) for r in roots if os.path.isdir(r)]
+        self.db_path = db_path
+        self.dead = False
+
+    def quit(self):
+        self.dead = True
+
+    def run(self):
+        inotify = Inotify()
+        for root in self.roots:
+            inotify.add_tree(root)
+        db = sqlite3.connect(self.db_path) if self.db_path else None
+        library = scanner.LibraryScanner(db) if db else None
+        dirs: set[str] = set()
+        files: set[str] = set()
+        first_event = last_event = 0.0
+        try:
+            while not self.dead:
+                now = time.monotonic()
+                timeout = 0.5 #so quit() is noticed
+                if dirs:
+                    timeout = max(0.0, min(timeout, last_event + self.QUIET_PERIOD - now, first_event + self.MAX_DELAY - now))
+                events = inotify.read(timeout)
+                now = time.monotonic()
+                for base, mask, name in events:
+                    if mask & IN_Q_OVERFLOW:
+                        dirs.update(self.roots)
+                        continue
+                    path = os.path.join(base, name) if name else base
+                    if mask & IN_ISDIR:
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            inotify.add_tree(path)
+                        dirs.add(path if mask & (IN_CREATE | IN_MOVED_TO) else base)
+                    elif not mask & IN_DELETE_SELF:
+                        dirs.add(base)
+                        files.add(path)
+                if events:
+                    first_event = first_event if dirs and first_event else now
+                    last_event = now
+                if dirs and (now - last_event >= self.QUIET_PERIOD or now - first_event >= self.MAX_DELAY):
+                    if library:
+                        library.refresh(files)
+                    self.changed.emit(_outermost(dirs), library.records(sorted(files)) if library else dict.fromkeys(sorted(files)))
+                    dirs, files = set(), set()
+                    first_event = 0.0
+        finally:
+            inotify.close()
+            if db:
+                db.close()
@@ -0,0 +1,50 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide2")
+from PySide2 import QtCore
+from dullahan import control
+
+class FakePlayer(QtCore.QObject):
+    media_changed = QtCore.Signal()
+    media_meta_ready = QtCore.Signal()
+    media_played = QtCore.Signal()
+    media_paused = QtCore.Signal()
+    media_stopped = QtCore.Signal()
+    media_shuffled = QtCore.Signal()
+    media_unshuffled = QtCore.Signal()
+    media_looped = QtCore.Signal()
+    media_unlooped = QtCore.Signal()
+    media_crossfade = QtCore.Signal()
+    media_uncrossfade = QtCore.Signal()
+
+    def __init__(self) -> None:
+        super().__init__(None)
+        self.calls = []
+        self.done = threading.Event()
+
+    def load_source(self, path: str) -> None:
+        time.sleep(0.5) #a queue rebuild on a big library
+        self.calls.append(('load_source', path, threading.current_thread() is threading.main_thread()))
+        self.done.set()
+
+@pytest.fixture
+def server():
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    server = control.ControlServer(FakePlayer())
+    yield server
+    server.close()
+
+def test_commands_are_answered_before_they_run(server):
+    started = time.monotonic()
+    assert server.handle({'command': 'replace', 'path': '/music'}) == {'ok': True}
+    assert time.monotonic() - started < 0.1
+    assert server.player.done.wait(5)
+    assert server.player.calls == [('load_source', '/music', False)]
+
+def test_bad_commands_are_rejected_up_front(server):
+    replies = server.handle([{'command': 'nope'}, {'command': ['x']}, {'command': 'next', 'args': 5}, 3, {'query': 'state'}])
+    assert [r['ok'] for r in replies] == [False, False, False, False, True]
+    assert server.player.calls == []
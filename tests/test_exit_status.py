@@ -0,0 +1,42 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PySide2")
+pytest.importorskip("mpd")
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+#mpd is replaced by a prepare() that gets as far as starting the client threads, dbus by a no-op
+SCRIPT = """
+import sys, types
+from PySide2 import QtCore
+from dullahan import build_parser, mpder
+
+class Mpris(QtCore.QObject):
+    def __init__(self, player):
+        super().__init__(None)
+    def initialize(self):
+        pass
+sys.modules['dullahan.mpris'] = types.SimpleNamespace(Mpris=Mpris)
+
+def prepare(self):
+    self.client.thread.start()
+    self.event_client.thread.start()
+    raise ConnectionRefusedError("mpd is not running")
+mpder.MPDPlayer.prepare = prepare
+
+from dullahan import app
+sys.exit(app.exec(build_parser().parse_args(sys.argv[1:])))
+"""
+
+def test_failed_startup_exits_with_status_1(tmp_path):
+    env = {**os.environ, 'HOME': str(tmp_path), 'XDG_DATA_HOME': str(tmp_path), 'QT_QPA_PLATFORM': 'offscreen'}
+    result = subprocess.run([sys.executable, "-c", SCRIPT, "--headless", str(tmp_path)], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 1, result.stderr
+    assert "startup failed" in result.stderr
+    assert "Destroyed while thread is still running" not in result.stderr
+    assert "QEventLoop: Cannot be used without QApplication" not in result.stderr #a stage thread outran the application
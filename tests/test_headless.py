@@ -0,0 +1,48 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PySide2")
+pytest.importorskip("mpd")
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+#the mpd and dbus stages are no-ops, the app quits itself a second after startup and reports which qt modules got loaded
+SCRIPT = """
+import sys, threading, types
+from PySide2 import QtCore
+from dullahan import build_parser, mpder
+
+class Mpris(QtCore.QObject):
+    def __init__(self, player):
+        super().__init__(None)
+    def initialize(self):
+        pass
+sys.modules['dullahan.mpris'] = types.SimpleNamespace(Mpris=Mpris)
+mpder.MPDPlayer.prepare = mpder.MPDPlayer.start = mpder.MPDPlayer.event_loop = lambda self: None
+
+from dullahan import app
+quit_ = lambda: QtCore.QMetaObject.invokeMethod(QtCore.QCoreApplication.instance(), "quit", QtCore.Qt.QueuedConnection)
+threading.Timer(1, quit_).start()
+status = app.exec(build_parser().parse_args(sys.argv[1:]))
+print(*sorted(m for m in sys.modules if m.startswith('PySide2.Qt')))
+sys.exit(status)
+"""
+
+def qt_modules(tmp_path, *args: str) -> set[str]:
+    env = {**os.environ, 'HOME': str(tmp_path), 'XDG_DATA_HOME': str(tmp_path), 'QT_QPA_PLATFORM': 'offscreen'}
+    result = subprocess.run([sys.executable, "-c", SCRIPT, *args, str(tmp_path)], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return set(result.stdout.split())
+
+def test_headless_never_loads_the_gui_modules(tmp_path):
+    modules = qt_modules(tmp_path, "--headless")
+    assert 'PySide2.QtCore' in modules
+    assert not modules & {'PySide2.QtGui', 'PySide2.QtWidgets'}
+
+def test_tray_loads_the_gui_modules(tmp_path):
+    #makes sure the check above would notice them
+    assert {'PySide2.QtGui', 'PySide2.QtWidgets'} <= qt_modules(tmp_path)
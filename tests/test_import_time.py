@@ -0,0 +1,30 @@
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+IMPORT_BUDGET_MS = 150 #cumulative `import dullahan`, generous enough for a cold ci box
+RUNS = 3
+FORBIDDEN = ('PySide2.QtWidgets', 'PySide2.QtGui', 'mpris_server', 'sqlite3', 'hashlib')
+
+def importtime(statement: str = "import dullahan") -> dict[str, int]:
+    '''{module: cumulative import time in microseconds} as reported by `python -X importtime`'''
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+def test_entry_point_defers_heavy_imports():
+    modules = importtime()
+    assert 'dullahan' in modules
+    for name in FORBIDDEN:
+        assert name not in modules, f"{name} is imported by the dullahan entry point"
+
+def test_entry_point_import_budget():
+    #best of a few runs, the first can be slowed down by a cold disk cache
+    best = min(importtime()['dullahan'] for _ in range(RUNS)) / 1000
+    assert best < IMPORT_BUDGET_MS, f"import dullahan took {best:.1f} ms, budget is {IMPORT_BUDGET_MS} ms"
@@ -0,0 +1,86 @@
+import argparse
+import json
+
+import pytest
+
+pytest.importorskip("PySide2")
+mpd = pytest.importorskip("mpd")
+from dullahan import mpder
+
+def song(file: str, id_: int) -> dict[str, str]:
+    return {'file': file, 'id': str(id_), 'title': file, 'artist': "A", 'album': "X", 'duration': '60.0'}
+
+class FakeClient:
+    '''Answers the handful of commands MPDPlayer sends while starting playback'''
+    def __init__(self, queue: list[dict[str, str]], library: list[str] = ()) -> None:
+        self.queue = queue
+        self.library = list(library)
+        self.sent: list[tuple] = []
+
+    def playlistinfo(self) -> list[dict[str, str]]:
+        return self.queue
+
+    def listall(self, uri: str = '') -> list[dict[str, str]]:
+        return [{'file': f} for f in self.library if f.startswith(uri)]
+
+    def command_list(self, commands: list[tuple]) -> list:
+        self.sent.extend(commands)
+        if commands[-1] == ('currentsong',):
+            status = {'state': 'stop'} if commands[0] == ('status',) else None
+            return [status] * (len(commands) - 1) + [self.queue[0]]
+        return [None] * len(commands)
+
+@pytest.fixture
+def player():
+    player = mpder.MPDPlayer(argparse.Namespace(host=None, port=None))
+    player.client = FakeClient([song('a/1.flac', 1)])
+    return player
+
+def test_first_track_is_announced_with_its_metadata(player):
+    seen = []
+    player.media_meta_ready.connect(lambda: seen.append(player.get_current_title()))
+    player.begin_playback(1)
+    assert seen == ['a/1.flac']
+    assert player.running
+
+def test_reconcile_edits_a_mostly_matching_queue(player):
+    player.client = FakeClient([song(f'a/{i}.flac', i) for i in range(10)] + [song('b/gone.flac', 10)], [f'a/{i}.flac' for i in range(11)])
+    assert player.reconcile_queue('a')
+    edits = [c for c in player.client.sent if c[0] in ('deleteid', 'add')]
+    assert edits == [('deleteid', 10), ('add', 'a/10.flac')]
+
+def test_reconcile_falls_back_to_a_rebuild_when_little_matches(player):
+    player.client = FakeClient([song(f'b/{i}.flac', i) for i in range(10)] + [song('a/0.flac', 10)], [f'a/{i}.flac' for i in range(5)])
+    assert not player.reconcile_queue('a') #10 deletes + 4 adds is more than the 5 tracks an add would queue
+    assert player.client.sent == []
+
+def test_reconcile_falls_back_to_a_rebuild_when_nothing_matches(player):
+    player.client = FakeClient([song('b/0.flac', 0)], ['a/0.flac', 'a/1.flac'])
+    assert not player.reconcile_queue('a')
+    assert player.client.sent == []
+
+class SessionClient(FakeClient):
+    '''A queue where song 2 was bumped and has since played (mpd reset it), and song 3 is still waiting'''
+    filters = True
+
+    def status(self) -> dict[str, str]:
+        return {'playlist': '7', 'playlistlength': str(len(self.queue)), 'songid': '1', 'elapsed': '3.5', 'random': '1', 'repeat': '0'}
+
+    def currentsong(self) -> dict[str, str]:
+        return self.queue[0]
+
+    def playlistsearch(self, expression: str) -> list[dict[str, str]]:
+        if not self.filters:
+            raise mpd.CommandError("unknown filter")
+        assert expression == '(prio >= 1)'
+        return [s for s in self.queue if 'prio' in s]
+
+@pytest.mark.parametrize('filters', [True, False])
+def test_session_saves_the_priorities_mpd_still_has(player, tmp_path, monkeypatch, filters):
+    monkeypatch.setattr(player, 'session_path', lambda: tmp_path / "session.json")
+    player.config.file = str(tmp_path)
+    player.queue_complete = True
+    player.client = SessionClient([song('a/1.flac', 1), song('a/2.flac', 2), {**song('a/3.flac', 3), 'prio': '1'}])
+    player.client.filters = filters
+    player.save_session()
+    assert json.loads((tmp_path / "session.json").read_text())['prio'] == {'3': 1}
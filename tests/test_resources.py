@@ -0,0 +1,24 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+ICONS = ("dullahan.png", "dullahan.svg")
+
+def test_rcc_ships_with_the_package(tmp_path):
+    #build_py copies exactly what package_data lets into a wheel or install
+    subprocess.run([sys.executable, "-c", "from setuptools import setup; setup()", "-q", "build_py", "-d", str(tmp_path)], cwd=ROOT, capture_output=True, check=True)
+    assert (tmp_path / "dullahan" / "resources.rcc").is_file()
+    for name in ICONS:
+        assert (tmp_path / "dullahan" / name).is_file() #the fallback when the .rcc can't be registered
+
+def test_rcc_serves_the_icons():
+    pytest.importorskip("PySide2")
+    from PySide2 import QtCore
+    from dullahan import resources
+    assert resources.registered
+    for name in ICONS:
+        assert resources.path(name) == f":/icons/{name}"
+        assert QtCore.QFile.exists(resources.path(name))
@@ -0,0 +1,31 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PySide2")
+pytest.importorskip("mutagen")
+from dullahan import migrate_db, scanner
+
+@pytest.fixture
+def library():
+    db = sqlite3.connect(":memory:")
+    migrate_db(db)
+    yield scanner.LibraryScanner(db, workers=1)
+    db.close()
+
+def test_records_come_from_the_library_table(library, tmp_path):
+    known, gone = tmp_path / "known.flac", tmp_path / "gone.flac"
+    known.write_bytes(b"not really flac")
+    library.refresh([str(known), str(gone)])
+    records = library.records([str(known), str(gone)])
+    assert records[str(gone)] is None
+    assert records[str(known)].file == str(known)
+    assert records[str(known)].title == "known.flac" #unparseable files fall back to their name
+
+def test_scan_forgets_deleted_files(library, tmp_path):
+    for name in ("a.flac", "b.flac"):
+        (tmp_path / name).write_bytes(b"")
+    assert library.scan(tmp_path) == (2, 0, 0)
+    (tmp_path / "b.flac").unlink()
+    assert library.scan(tmp_path) == (0, 1, 1)
+    assert library.records([str(tmp_path / "b.flac")]) == {str(tmp_path / "b.flac"): None}
@@ -0,0 +1,52 @@
+import locale
+
+import pytest
+
+pytest.importorskip("PySide2")
+pytest.importorskip("mutagen")
+from PySide2 import QtCore
+from dullahan import basic_player, song_select
+
+class FakeArtLoader(QtCore.QObject):
+    art_ready = QtCore.Signal(str, object)
+
+    def request(self, file: str) -> None: pass
+    def retain(self, files: set[str]) -> None: pass
+
+def rows(*tags: tuple[str, str]) -> tuple[list, list]:
+    records = [basic_player.TrackRecord(f"{artist}/{title}.flac", title, artist, "Album") for title, artist in tags]
+    xfrm: dict[str, str] = {}
+    return records, [song_select.collation_key(r, xfrm) for r in records]
+
+@pytest.fixture
+def model():
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    model = song_select.SongTableModel(FakeArtLoader())
+    sorter = song_select.SortWorker()
+    model.sort_requested.connect(sorter.sort) #same thread, so sorting finishes inside sort()
+    sorter.sorted.connect(model.on_sorted)
+    model.sorter = sorter
+    return model
+
+def titles(model) -> list[str]:
+    return [model.record(row).title for row in range(model.rowCount())]
+
+def test_sorting_uses_the_keys_from_insertion(model, monkeypatch):
+    model.append_rows(*rows(("c", "Zed"), ("a", "Abba"), ("b", "Mika")))
+    calls = []
+    monkeypatch.setattr(locale, 'strxfrm', lambda s: calls.append(s) or s)
+    model.sort(1)
+    assert titles(model) == ["a", "b", "c"]
+    model.sort(0, QtCore.Qt.DescendingOrder)
+    assert titles(model) == ["c", "b", "a"]
+    assert calls == []
+
+def test_rows_appended_after_a_sort_are_merged_in(model):
+    model.append_rows(*rows(("d", "D"), ("b", "B")))
+    model.sort(1)
+    first = model.sort_cache[1]
+    model.append_rows(*rows(("c", "C"), ("a", "A")))
+    assert titles(model) == ["b", "d", "c", "a"] #at the end until the next sort
+    assert model.sort_cache[1] is first
+    model.sort(1)
+    assert titles(model) == ["a", "b", "c", "d"]
@@ -0,0 +1,70 @@
+import argparse
+import time
+
+import pytest
+
+pytest.importorskip("PySide2")
+pytest.importorskip("mpd")
+from PySide2 import QtCore
+from dullahan import app
+
+STAGE = 0.2 #seconds each simulated stage takes
+
+class FakePlayer(QtCore.QObject):
+    '''Stands in for MPDPlayer, connecting and building the queue each take STAGE'''
+    def __init__(self) -> None:
+        super().__init__(None)
+        self.roots = []
+        self.running = False
+        self.thread_exited = False
+
+    def prepare(self) -> None:
+        time.sleep(STAGE)
+
+    def start(self) -> None:
+        time.sleep(STAGE)
+        self.running = True
+
+    def event_loop(self) -> None:
+        pass
+
+class FakeMpris(QtCore.QObject):
+    def initialize(self) -> None:
+        time.sleep(STAGE)
+
+@pytest.fixture
+def startup(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, 'resolve_data', lambda name: tmp_path / name)
+    conf = argparse.Namespace(watch=False, startup_timeline=False)
+    player, mpris = FakePlayer(), FakeMpris()
+    player_thread, mpris_thread = QtCore.QThread(), QtCore.QThread()
+    player.moveToThread(player_thread)
+    mpris.moveToThread(mpris_thread)
+    timeline = app.StartupTimeline(time.monotonic())
+    startup = app.Startup(conf, player, player_thread, mpris, mpris_thread, timeline)
+    yield startup
+    for thread in (player_thread, mpris_thread):
+        thread.quit()
+        thread.wait(5000)
+
+def offsets(timeline: app.StartupTimeline) -> dict[str, float]:
+    return {stage: offset for offset, _, stage in timeline.marks}
+
+def test_startup_stages_overlap(startup):
+    startup.launch()
+    time.sleep(STAGE) #building the tray
+    startup.timeline.mark("tray shown")
+    assert startup.db_ready.wait(5)
+    startup.receivers_ready.set()
+    deadline = time.monotonic() + 5
+    while startup.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not startup.pending
+
+    marks = offsets(startup.timeline)
+    assert {"mpd connected", "first audio", "mpris published", "database migrated", "tray shown"} <= marks.keys()
+    #run one after the other these would take 4 stages, overlapped the tray doesn't wait on mpd or dbus
+    assert marks["tray shown"] < 1.5 * STAGE
+    assert marks["mpris published"] < 1.5 * STAGE
+    assert marks["first audio"] < 3 * STAGE
+    assert startup.player.thread_exited
@@ -0,0 +1,68 @@
+import datetime
+import sqlite3
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PySide2")
+from dullahan import migrate_db, stats
+
+DAY = 86400 * 1000
+
+def local_ms(*args: int) -> int:
+    return int(datetime.datetime(*args).timestamp() * 1000)
+
+@pytest.fixture
+def db():
+    db = sqlite3.connect(":memory:")
+    migrate_db(db)
+    db.executemany("INSERT INTO medialibrary(id, title, artist, album, plays, finishes) VALUES (?, ?, ?, ?, ?, ?)", [
+        (1, "One", "A", "X", 10, 9),
+        (2, "Two", "A", "Y", 4, 1),
+        (3, "Three", "B", "Y", 6, 6),
+    ])
+    yield db
+    db.close()
+
+def play(db: sqlite3.Connection, track: int, start: int, skipped: bool = False) -> None:
+    db.execute("INSERT INTO play_events(track, start_time, end_time, elapsed, skipped) VALUES (?, ?, ?, ?, ?)", (track, start, start + 60000, 60000, int(skipped)))
+
+def test_top_lists_include_uncompacted_plays(db):
+    for _ in range(3):
+        play(db, 2, local_ms(2024, 5, 1, 12))
+    data = stats.StatsData(db)
+    assert data.top_tracks(2) == [("One", "A", 10), ("Two", "A", 7)]
+    assert data.top_artists(1) == [("A", 17)]
+    assert data.top_albums(2) == [("Y", 13), ("X", 10)]
+
+def test_completion(db):
+    play(db, 3, local_ms(2024, 5, 1, 12), skipped=True)
+    overall, ratios = stats.StatsData(db).completion()
+    assert overall == pytest.approx(16 / 21)
+    assert list(ratios) == pytest.approx([0.9, 0.25, 6 / 7])
+
+def test_streaks(db):
+    today = datetime.date.today()
+    db.executemany("INSERT INTO daily_plays(day, track, plays, elapsed) VALUES (?, 1, 1, 60000)", [
+        ((today - datetime.timedelta(days=d)).isoformat(),) for d in (10, 9, 8, 7, 1)
+    ])
+    now = datetime.datetime.now()
+    play(db, 1, int(now.replace(hour=12, minute=0).timestamp() * 1000))
+    assert stats.StatsData(db).streaks() == (4, 2)
+
+def test_days_use_the_offset_in_effect_at_each_play(db, monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    try:
+        #23:30 local on both sides of the spring forward, utc+1 then utc+2
+        before, after = local_ms(2024, 3, 30, 23, 30), local_ms(2024, 3, 31, 23, 30)
+        play(db, 1, before)
+        play(db, 1, after)
+        days = stats.StatsData(db).days
+        assert [str(d) for d in days] == ["2024-03-30", "2024-03-31"]
+        #compaction buckets with sqlite's localtime, which has to agree
+        assert [d for d, in db.execute("SELECT date(start_time / 1000, 'unixepoch', 'localtime') FROM play_events")] == ["2024-03-30", "2024-03-31"]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
@@ -0,0 +1,56 @@
+import gc
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("PySide2")
+pytest.importorskip("mutagen")
+from dullahan import basic_player
+
+QUEUE_SIZE = 100_000
+ARTISTS = 500
+ALBUMS = 2000
+
+def playlistinfo(n: int = QUEUE_SIZE):
+    '''Synthetic playlistinfo rows, every string built fresh the way python-mpd2 hands them over'''
+    for i in range(n):
+        yield {
+            'file': f"Artist {i % ARTISTS}/Album {i % ALBUMS}/{i:06d} Track {i}.flac",
+            'title': f"Track {i}",
+            'artist': f"Artist {i % ARTISTS}",
+            'album': f"Album {i % ALBUMS}",
+            'genre': f"Genre {i % 20}",
+            'duration': f"{180 + i % 240}.000",
+            'pos': str(i),
+            'id': str(i + 1),
+        }
+
+def old_row(tags: dict) -> dict:
+    #what MetaParser used to keep per track: vars() of an MPDMetadata
+    return {'is_quick': False, 'title': tags['title'], 'file': tags['file'], 'album': tags['album'], 'artist': tags['artist'], 'raw_art': b'', 'art': None, 'art_filetype': None}
+
+def retained(build) -> int:
+    '''Bytes still allocated by the rows build() returns, after the source tags are gone'''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        rows = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del rows
+    return size
+
+def measure(n: int = QUEUE_SIZE) -> tuple[int, int]:
+    old = retained(lambda: [old_row(t) for t in playlistinfo(n)])
+    new = retained(lambda: [basic_player.TrackRecord.from_tags(t) for t in playlistinfo(n)])
+    return old, new
+
+def test_track_records_use_less_memory():
+    old, new = measure()
+    assert new < old * 0.75, f"{new/QUEUE_SIZE:.0f} B/track for records vs {old/QUEUE_SIZE:.0f} B/track for dicts"
+
+if __name__ == "__main__":
+    old, new = measure()
+    print(f"{QUEUE_SIZE} tracks: dicts {old/2**20:.1f} MiB ({old/QUEUE_SIZE:.0f} B/track), records {new/2**20:.1f} MiB ({new/QUEUE_SIZE:.0f} B/track)")